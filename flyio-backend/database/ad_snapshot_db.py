@@ -20,6 +20,7 @@
 쌓으면 연 3,600만 행이 된다. 그래서 상태는 **현재값 1행 + 변경분만 append**
 구조로 두고, 성과는 노출이 발생한 엔티티만 저장한다.
 """
+import hashlib
 import json
 import logging
 from datetime import datetime, timedelta
@@ -97,11 +98,16 @@ def init_ad_snapshot_tables() -> None:
             inspect_status TEXT,
             landing_url    TEXT,
             extra          TEXT,
+            state_hash     TEXT,
             first_seen     TEXT DEFAULT CURRENT_TIMESTAMP,
             last_seen      TEXT DEFAULT CURRENT_TIMESTAMP,
             PRIMARY KEY (customer_id, entity_type, entity_id)
         )
     """)
+    # state_hash — 저장 값 지문(sync_entity_states). 예전 테이블엔 없어서 붙인다.
+    cols = {r[1] for r in cur.execute("PRAGMA table_info(ad_entity_state)").fetchall()}
+    if "state_hash" not in cols:
+        cur.execute("ALTER TABLE ad_entity_state ADD COLUMN state_hash TEXT")
     cur.execute("CREATE INDEX IF NOT EXISTS idx_aes_parent "
                 "ON ad_entity_state(customer_id, parent_id)")
     cur.execute("CREATE INDEX IF NOT EXISTS idx_aes_status "
@@ -230,6 +236,48 @@ def get_daily_totals(customer_id: str, since: str, until: str,
     return out
 
 
+def get_entity_totals(customer_id: str, entity_type: str, since: str,
+                      until: str) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
+    """엔티티별 구간 합계 — /stats 응답과 같은 필드 이름으로. 쿼리 한 번.
+
+    입찰 일괄 최적화(services/bid_apply)가 키워드 수만 개의 /stats 를 하나씩 부르는
+    대신 이걸 읽는다(/stats 는 다중 ID 가 11001 이라 ID 당 1콜이다).
+    avgRnk 는 노출 가중 평균. 두 번째 값은 구간 안 가장 최근 stat_date(없으면 None) —
+    리포트 수집이 밀렸는지 호출부가 판단한다.
+    """
+    conn = get_connection()
+    try:
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT entity_id,
+                   SUM(impressions) AS imp, SUM(clicks) AS clk, SUM(cost) AS cost,
+                   SUM(avg_rank * impressions) AS rank_w,
+                   SUM(conversions) AS conv, SUM(conv_amount) AS conv_amt,
+                   MAX(stat_date) AS last_date
+              FROM ad_daily_stats
+             WHERE customer_id = ? AND entity_type = ? AND stat_date BETWEEN ? AND ?
+             GROUP BY entity_id
+        """, (customer_id, entity_type, since, until))
+        out: Dict[str, Dict[str, Any]] = {}
+        latest: Optional[str] = None
+        for r in cur.fetchall():
+            imp = int(r["imp"] or 0)
+            out[r["entity_id"]] = {
+                "id": r["entity_id"],
+                "impCnt": imp,
+                "clkCnt": int(r["clk"] or 0),
+                "salesAmt": r["cost"] or 0,
+                "avgRnk": round((r["rank_w"] or 0) / imp, 2) if imp else 0,
+                "ccnt": r["conv"] or 0,
+                "convAmt": r["conv_amt"] or 0,
+            }
+            if latest is None or r["last_date"] > latest:
+                latest = r["last_date"]
+    finally:
+        conn.close()
+    return out, latest
+
+
 def get_entity_series(customer_id: str, entity_type: str, entity_id: str,
                       since: str, until: str) -> List[Dict[str, Any]]:
     conn = get_connection()
@@ -308,6 +356,31 @@ def _norm(v: Any) -> Optional[str]:
     return str(v)
 
 
+def _state_row(e: Dict[str, Any]) -> tuple:
+    """ad_entity_state 에 쓰는 값(parent_id … extra). 지문도 이 값으로 만든다."""
+    return (
+        e.get("parent_id"), e.get("name"), e.get("status"), e.get("status_reason"),
+        None if e.get("enabled") is None else int(bool(e.get("enabled"))),
+        e.get("daily_budget"), e.get("bid_amt"),
+        None if e.get("use_group_bid") is None else int(bool(e.get("use_group_bid"))),
+        e.get("inspect_status"), e.get("landing_url"),
+        json.dumps(e.get("extra"), ensure_ascii=False) if e.get("extra") else None,
+    )
+
+
+def _fingerprint(row: tuple) -> str:
+    """저장 값 전체의 16자 지문. repr 이라 None·빈 문자열·1·"1" 이 서로 다르다
+    (다르다고 잘못 나와도 필드 diff 를 한 번 더 할 뿐, 이력은 _norm 비교로 낸다)."""
+    return hashlib.blake2b(repr(row).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _stage_ids(cur, ids: Iterable[str]) -> None:
+    """임시 테이블 entity_sync_ids 를 ids 로 채운다 (풀 연결이라 매번 비우고 쓴다)."""
+    cur.execute("CREATE TEMP TABLE IF NOT EXISTS entity_sync_ids (entity_id TEXT PRIMARY KEY)")
+    cur.execute("DELETE FROM entity_sync_ids")
+    cur.executemany("INSERT OR IGNORE INTO entity_sync_ids VALUES (?)", ((i,) for i in ids))
+
+
 def sync_entity_states(customer_id: str, entities: Iterable[Dict[str, Any]],
                        entity_type: str,
                        detect_removed: bool = True) -> Dict[str, int]:
@@ -315,47 +388,93 @@ def sync_entity_states(customer_id: str, entities: Iterable[Dict[str, Any]],
 
     detect_removed 는 이번 수집이 해당 타입의 전수일 때만 켠다.
     부분 수집에 켜면 안 넘어온 엔티티가 전부 '삭제됨'으로 기록된다.
+
+    엔티티마다 저장 값의 지문(state_hash)을 같이 둔다. 이전 지문만 읽어 메모리에서
+    비교하고, 지문이 다른(추가·변경) 엔티티만 옛 행을 읽어 필드 diff 를 낸 뒤
+    executemany 로 쓴다. 그대로인 엔티티는 last_seen 만 한 문장으로 갱신한다 —
+    10만 키워드 계정에서 매번 10만 번 upsert 하던 것을 바뀐 수만큼으로 줄인다.
+    지문이 없는 옛 행(마이그레이션 직후)은 "다름" 으로 보고 한 번 다시 쓴다.
     """
     conn = get_connection()
     cur = conn.cursor()
 
-    cur.execute("""
-        SELECT entity_id, name, status, status_reason, enabled, daily_budget,
-               bid_amt, use_group_bid, inspect_status, landing_url
-        FROM ad_entity_state WHERE customer_id = ? AND entity_type = ?
-    """, (customer_id, entity_type))
-    prev = {r["entity_id"]: dict(r) for r in cur.fetchall()}
+    cur.execute("SELECT entity_id, state_hash FROM ad_entity_state "
+                "WHERE customer_id = ? AND entity_type = ?", (customer_id, entity_type))
+    prev_hash = {r[0]: r[1] for r in cur.fetchall()}
 
     seen = set()
-    added = changed = 0
-    change_rows: List[tuple] = []
-
+    pending: List[Tuple[str, Dict[str, Any], tuple, str]] = []
     for e in entities:
         eid = e.get("entity_id")
         if not eid:
             continue
         seen.add(eid)
-        cur_vals = {f: e.get(f) for f in TRACKED_FIELDS}
-        old = prev.get(eid)
+        row = _state_row(e)
+        fp = _fingerprint(row)
+        if eid not in prev_hash or prev_hash[eid] != fp:
+            pending.append((eid, e, row, fp))
+
+    gone = [eid for eid in prev_hash if eid not in seen] if detect_removed else []
+
+    # 필드 diff·삭제 이력에 필요한 옛 행만 읽는다.
+    prev: Dict[str, Dict[str, Any]] = {}
+    need = [eid for eid, *_ in pending if eid in prev_hash] + gone
+    if need:
+        _stage_ids(cur, need)
+        cur.execute("""
+            SELECT s.entity_id, s.name, s.status, s.status_reason, s.enabled,
+                   s.daily_budget, s.bid_amt, s.use_group_bid, s.inspect_status,
+                   s.landing_url
+            FROM ad_entity_state s JOIN entity_sync_ids i ON i.entity_id = s.entity_id
+            WHERE s.customer_id = ? AND s.entity_type = ?
+        """, (customer_id, entity_type))
+        prev = {r["entity_id"]: dict(r) for r in cur.fetchall()}
 
+    added = changed = 0
+    change_rows: List[tuple] = []
+    for eid, e, _, _ in pending:
+        old = prev.get(eid)
         if old is None:
             added += 1
             change_rows.append((customer_id, entity_type, eid, e.get("name"),
                                 "__entity__", None, "created", "created"))
-        else:
-            for f in TRACKED_FIELDS:
-                a, b = _norm(old.get(f)), _norm(cur_vals.get(f))
-                if a != b:
-                    changed += 1
-                    change_rows.append((customer_id, entity_type, eid,
-                                        e.get("name"), f, a, b, "updated"))
+            continue
+        for f in TRACKED_FIELDS:
+            a, b = _norm(old.get(f)), _norm(e.get(f))
+            if a != b:
+                changed += 1
+                change_rows.append((customer_id, entity_type, eid,
+                                    e.get("name"), f, a, b, "updated"))
 
-        cur.execute("""
+    removed = 0
+    for eid in gone:
+        removed += 1
+        change_rows.append((customer_id, entity_type, eid,
+                            prev[eid].get("name"), "__entity__",
+                            "present", "removed", "removed"))
+    if gone:
+        cur.executemany(
+            "DELETE FROM ad_entity_state WHERE customer_id=? AND entity_type=? AND entity_id=?",
+            [(customer_id, entity_type, eid) for eid in gone])
+
+    # 그대로인 엔티티는 last_seen 만. 전수 수집이면 남은 행이 곧 이번에 본 행이다.
+    if detect_removed:
+        cur.execute("UPDATE ad_entity_state SET last_seen = CURRENT_TIMESTAMP "
+                    "WHERE customer_id = ? AND entity_type = ?", (customer_id, entity_type))
+    elif seen:
+        _stage_ids(cur, seen)
+        cur.execute("UPDATE ad_entity_state SET last_seen = CURRENT_TIMESTAMP "
+                    "WHERE customer_id = ? AND entity_type = ? "
+                    "AND entity_id IN (SELECT entity_id FROM entity_sync_ids)",
+                    (customer_id, entity_type))
+
+    if pending:
+        cur.executemany("""
             INSERT INTO ad_entity_state (
                 customer_id, entity_type, entity_id, parent_id, name, status,
                 status_reason, enabled, daily_budget, bid_amt, use_group_bid,
-                inspect_status, landing_url, extra, first_seen, last_seen
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,CURRENT_TIMESTAMP,CURRENT_TIMESTAMP)
+                inspect_status, landing_url, extra, state_hash, first_seen, last_seen
+            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,CURRENT_TIMESTAMP,CURRENT_TIMESTAMP)
             ON CONFLICT(customer_id, entity_type, entity_id) DO UPDATE SET
                 parent_id      = excluded.parent_id,
                 name           = excluded.name,
@@ -368,29 +487,11 @@ def sync_entity_states(customer_id: str, entities: Iterable[Dict[str, Any]],
                 inspect_status = excluded.inspect_status,
                 landing_url    = excluded.landing_url,
                 extra          = excluded.extra,
+                state_hash     = excluded.state_hash,
                 last_seen      = CURRENT_TIMESTAMP
-        """, (
-            customer_id, entity_type, eid, e.get("parent_id"), e.get("name"),
-            e.get("status"), e.get("status_reason"),
-            None if e.get("enabled") is None else int(bool(e.get("enabled"))),
-            e.get("daily_budget"), e.get("bid_amt"),
-            None if e.get("use_group_bid") is None else int(bool(e.get("use_group_bid"))),
-            e.get("inspect_status"), e.get("landing_url"),
-            json.dumps(e.get("extra"), ensure_ascii=False) if e.get("extra") else None,
-        ))
-
-    removed = 0
-    if detect_removed:
-        gone = [eid for eid in prev if eid not in seen]
-        for eid in gone:
-            removed += 1
-            change_rows.append((customer_id, entity_type, eid,
-                                prev[eid].get("name"), "__entity__",
-                                "present", "removed", "removed"))
-        if gone:
-            cur.executemany(
-                "DELETE FROM ad_entity_state WHERE customer_id=? AND entity_type=? AND entity_id=?",
-                [(customer_id, entity_type, eid) for eid in gone])
+        """, [(customer_id, entity_type, eid, *row, fp) for eid, _, row, fp in pending])
+    if need or (seen and not detect_removed):
+        cur.execute("DELETE FROM entity_sync_ids")
 
     if change_rows:
         cur.executemany("""
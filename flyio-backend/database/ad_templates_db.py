@@ -23,6 +23,7 @@ import json as _json
 from contextlib import contextmanager
 from typing import Iterable, List, Optional, Dict
 import logging
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +41,7 @@ class AdTemplatesDB:
 
     @contextmanager
     def _conn(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = pooled_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         try:
             yield conn
@@ -10,6 +10,7 @@ import json
 import logging
 import os
 import sys
+from database.connection_pool import pooled_connect
 
 # Windows 로컬 개발환경에서는 ./data 사용
 if sys.platform == "win32":
@@ -23,7 +24,7 @@ logger = logging.getLogger(__name__)
 @contextmanager
 def get_db():
     """Database connection context manager"""
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = pooled_connect(DATABASE_PATH)
     conn.row_factory = sqlite3.Row
     try:
         yield conn
@@ -0,0 +1,271 @@
+"""
+비동기 DB 파사드 — SQLite 호출을 이벤트 루프 밖(DB 파일별 스레드 풀)에서 돌린다
+
+async 라우트·스케줄러 tick 대부분이 database/*_db.py 의 동기 메서드를 루프 위에서
+그대로 불렀다. KeywordPoolDB.add_candidates 가 1만 키워드 배치를 쓰는 몇 초 동안,
+또는 다른 writer 가 WAL 락을 쥐어 busy_timeout 을 기다리는 동안 /health·로그인까지
+같이 멈췄다.
+
+    from database.async_db import adb
+    added = await adb(pool).add_candidates(uid, cid, items)
+    stats = await adb(pool).stats(cid)
+    rows  = await run_db(reg.db_path, _fetch_rows)          # 임의 함수
+
+  - DB 파일마다 읽기 풀(DB_READ_THREADS, 기본 4)과 쓰기 풀(스레드 1개)을 둔다.
+    같은 파일에 대한 쓰기는 이 프로세스 안에서 줄 서서 하나씩 돈다 — WAL writer 끼리
+    busy_timeout 으로 서로 기다리던 경합이 큐 대기로 바뀐다(루프는 막히지 않는다).
+  - 읽기/쓰기 구분은 메서드 이름으로 한다(get_/list_/…_stats → 읽기). 읽기 접두사에 안 걸리는
+    이름은 전부 **쓰기**로 본다 — 모르는 writer 가 읽기 풀에서 동시에 돌아 직렬화가 깨지는 것보다
+    모르는 reader 가 줄 서는 편이 낫다. 읽기인데 이름이 규칙 밖이면 adb(x).read.method(...)
+    (반대로 강제 쓰기는 adb(x).write.method(...)).
+  - 스레드마다 connection_pool 의 연결이 살아 있으므로 연결 비용도 없다.
+  - 호출별 큐 대기·실행 시간을 (DB, 메서드) 히스토그램으로 남기고 async_db_stats() 로 본다.
+
+await 하던 쪽이 취소돼도 이미 시작한 DB 호출은 스레드에서 끝까지 돈다(쓰기가 반쯤
+끊기지 않는다). 결과만 버려진다.
+"""
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DB_READ_THREADS = int(os.environ.get("DB_READ_THREADS", "4"))
+# 히스토그램 버킷 상한(ms). 마지막은 그 이상 전부.
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_READ_PREFIXES = ("get_", "list_", "count_", "find_", "search_", "fetch_", "load_",
+                  "read_", "is_", "has_", "detect_", "select_", "export_")
+
+
+def is_write_method(name: str) -> bool:
+    """읽기 접두사·…stats 만 읽기. 나머지(모르는 이름 포함)는 쓰기 풀에서 하나씩."""
+    return not (name.startswith(_READ_PREFIXES) or name.endswith("stats"))
+
+
+class _Histogram:
+    __slots__ = ("counts", "n", "total_s", "max_s")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.n = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS_MS, seconds * 1000)] += 1
+        self.n += 1
+        self.total_s += seconds
+        if seconds > self.max_s:
+            self.max_s = seconds
+
+    def quantile_ms(self, q: float) -> Optional[float]:
+        """버킷 상한으로 근사한 분위수(관측 최댓값을 넘지 않게 자른다)."""
+        if not self.n:
+            return None
+        max_ms = round(self.max_s * 1000, 1)
+        target = q * self.n
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return min(float(BUCKETS_MS[i]), max_ms) if i < len(BUCKETS_MS) else max_ms
+        return max_ms
+
+    def as_dict(self) -> Dict:
+        labels = [f"<={b}ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        return {
+            "n": self.n,
+            "avg_ms": round(self.total_s / self.n * 1000, 2) if self.n else None,
+            "p50_ms": self.quantile_ms(0.50),
+            "p95_ms": self.quantile_ms(0.95),
+            "p99_ms": self.quantile_ms(0.99),
+            "max_ms": round(self.max_s * 1000, 2),
+            "buckets": {lab: c for lab, c in zip(labels, self.counts) if c},
+        }
+
+
+class _CallStats:
+    __slots__ = ("queue", "run", "errors", "kind")
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.queue = _Histogram()
+        self.run = _Histogram()
+        self.errors = 0
+
+
+class _DBExecutors:
+    """DB 파일 하나의 읽기/쓰기 스레드 풀과 호출 통계."""
+
+    def __init__(self, path: str):
+        self.path = path
+        base = os.path.basename(path) or "db"
+        self.reader = ThreadPoolExecutor(max_workers=DB_READ_THREADS,
+                                         thread_name_prefix=f"db-r-{base}")
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"db-w-{base}")
+        self.lock = threading.Lock()
+        self.calls: Dict[str, _CallStats] = {}
+        self.pending_reads = 0
+        self.pending_writes = 0
+
+    def _stats(self, label: str, kind: str) -> _CallStats:
+        st = self.calls.get(label)
+        if st is None:
+            st = self.calls.setdefault(label, _CallStats(kind))
+        return st
+
+    def snapshot(self) -> Dict:
+        with self.lock:
+            calls = {label: {"kind": st.kind, "errors": st.errors,
+                             "queue": st.queue.as_dict(), "run": st.run.as_dict()}
+                     for label, st in self.calls.items()}
+            return {"path": self.path, "pending_reads": self.pending_reads,
+                    "pending_writes": self.pending_writes, "calls": calls}
+
+    def shutdown(self) -> None:
+        self.reader.shutdown(wait=False)
+        self.writer.shutdown(wait=False)
+
+
+_EXECUTORS: Dict[Tuple[int, str], _DBExecutors] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def _executors(path) -> _DBExecutors:
+    key = (os.getpid(), os.path.abspath(str(path)))
+    ex = _EXECUTORS.get(key)
+    if ex is None:
+        with _EXECUTORS_LOCK:
+            ex = _EXECUTORS.get(key)
+            if ex is None:
+                ex = _EXECUTORS[key] = _DBExecutors(key[1])
+    return ex
+
+
+async def run_db(path, func: Callable, *args, write: bool = False,
+                 label: Optional[str] = None, **kwargs) -> Any:
+    """func(*args, **kwargs) 를 path 의 읽기(또는 쓰기) 스레드에서 돌리고 결과를 기다린다."""
+    ex = _executors(path)
+    label = label or getattr(func, "__qualname__", None) or getattr(func, "__name__", "call")
+    kind = "write" if write else "read"
+    submitted = time.perf_counter()
+    with ex.lock:
+        st = ex._stats(label, kind)
+        if write:
+            ex.pending_writes += 1
+        else:
+            ex.pending_reads += 1
+
+    def _call():
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            done = time.perf_counter()
+            with ex.lock:
+                if write:
+                    ex.pending_writes -= 1
+                else:
+                    ex.pending_reads -= 1
+                st.queue.add(started - submitted)
+                st.run.add(done - started)
+                if failed:
+                    st.errors += 1
+
+    ctx = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(ex.writer if write else ex.reader,
+                                      functools.partial(ctx.run, _call))
+
+
+def _resolve_path(target) -> str:
+    for attr in ("db_path", "DB_PATH", "DATABASE_PATH"):
+        path = getattr(target, attr, None)
+        if path:
+            return str(path)
+    raise ValueError(f"DB 경로를 알 수 없음: {target!r} — adb(target, path=...) 로 지정")
+
+
+class _Bound:
+    """adb(x).write / adb(x).read — 이름 규칙을 무시하고 종류를 고정한 뷰."""
+
+    def __init__(self, facade: "AsyncDB", write: bool):
+        self._facade = facade
+        self._write = write
+
+    def __getattr__(self, name: str):
+        return self._facade._wrap(name, self._write)
+
+
+class AsyncDB:
+    """DB 객체(또는 모듈)의 메서드를 awaitable 로 감싼 파사드."""
+
+    def __init__(self, target, path: Optional[str] = None, prefix: Optional[str] = None):
+        self._target = target
+        self._path = str(path) if path else _resolve_path(target)
+        self._prefix = prefix or getattr(target, "__name__", None) or type(target).__name__
+        self.read = _Bound(self, False)
+        self.write = _Bound(self, True)
+
+    def _wrap(self, name: str, write: bool):
+        func = getattr(self._target, name)
+        label = f"{self._prefix.rsplit('.', 1)[-1]}.{name}"
+
+        async def call(*args, **kwargs):
+            return await run_db(self._path, func, *args, write=write, label=label, **kwargs)
+
+        call.__name__ = name
+        return call
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._wrap(name, is_write_method(name))
+
+
+# target → 풀어 둔 (DB 경로, 라벨 접두사). 약한 키라 target 이 사라지면 항목도 사라진다.
+# 파사드 자체는 target 을 강하게 쥐므로(임시 객체로 adb(X()).m() 해도 살아 있게) 여기 담지 않는다 —
+# 값이 키를 붙잡으면 약한 키가 소용없다. 파사드는 매번 새로 만드는 얇은 껍데기다.
+_RESOLVED: "weakref.WeakKeyDictionary[Any, Tuple[str, str]]" = weakref.WeakKeyDictionary()
+_RESOLVED_LOCK = threading.Lock()
+
+
+def adb(target, path: Optional[str] = None) -> AsyncDB:
+    """target 의 비동기 파사드. DB 경로 해석은 target 별로 한 번만."""
+    if path is not None:
+        return AsyncDB(target, path)
+    try:
+        with _RESOLVED_LOCK:
+            resolved = _RESOLVED.get(target)
+    except TypeError:       # 약한 참조가 안 되는 객체 — 캐시 없이
+        return AsyncDB(target)
+    if resolved is None:
+        facade = AsyncDB(target)
+        with _RESOLVED_LOCK:
+            _RESOLVED[target] = (facade._path, facade._prefix)
+        return facade
+    return AsyncDB(target, resolved[0], resolved[1])
+
+
+def async_db_stats() -> List[Dict]:
+    """DB 파일별 대기 중 호출 수와 (메서드별) 큐 대기·실행 시간 히스토그램."""
+    return [ex.snapshot() for (pid, _), ex in list(_EXECUTORS.items()) if pid == os.getpid()]
+
+
+def shutdown_executors() -> None:
+    with _EXECUTORS_LOCK:
+        for ex in _EXECUTORS.values():
+            ex.shutdown()
+        _EXECUTORS.clear()
@@ -20,6 +20,7 @@ import uuid
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +45,7 @@ TERMINAL_JOB_STATUSES = ('succeeded', 'failed', 'uncertain')
 
 def get_connection() -> sqlite3.Connection:
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn = pooled_connect(DB_PATH)
     conn.row_factory = sqlite3.Row
     conn.execute('PRAGMA foreign_keys = ON')
     return conn
@@ -14,9 +14,7 @@ from typing import Any, Dict, Optional
 logger = logging.getLogger(__name__)
 
 
-def _conn():
-    from database.blog_index_history_db import _connect
-    conn = _connect()
+def _create_table(conn) -> None:
     conn.execute("""
         CREATE TABLE IF NOT EXISTS search_health_result (
             blog_id       TEXT PRIMARY KEY,
@@ -28,7 +26,13 @@ def _conn():
             measured_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     """)
-    conn.commit()
+
+
+def _conn():
+    from database.blog_index_history_db import INDEX_HISTORY_DB_PATH, _connect
+    from database.connection_pool import ensure_schema
+    conn = _connect()
+    ensure_schema(INDEX_HISTORY_DB_PATH, "search_health_result", _create_table, timeout=10)
     return conn
 
 
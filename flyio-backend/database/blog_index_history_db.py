@@ -19,6 +19,7 @@ import sqlite3
 import sys
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +48,7 @@ def _connect() -> sqlite3.Connection:
     db_dir = os.path.dirname(INDEX_HISTORY_DB_PATH)
     if db_dir and not os.path.exists(db_dir):
         os.makedirs(db_dir, exist_ok=True)
-    conn = sqlite3.connect(INDEX_HISTORY_DB_PATH, timeout=10)
+    conn = pooled_connect(INDEX_HISTORY_DB_PATH, timeout=10)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -340,7 +341,7 @@ def backfill_from_saved_history(blog_id: str) -> int:
     path = _user_blogs_db_path()
     if os.path.exists(path):
         try:
-            src = sqlite3.connect(path, timeout=10)
+            src = pooled_connect(path, timeout=10)
             src.row_factory = sqlite3.Row
             rows = src.execute("""
                 SELECT total_score, level, grade, total_posts, total_visitors,
@@ -8,6 +8,7 @@ from typing import Optional, Dict, List, Tuple
 import logging
 import os
 import random
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +60,7 @@ class BlogPercentileDB:
 
     def _get_connection(self):
         """DB 연결"""
-        conn = sqlite3.connect(self.db_path)
+        conn = pooled_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
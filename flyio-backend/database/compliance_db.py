@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from enum import Enum
 from pathlib import Path
+from database.connection_pool import pooled_connect
 
 # Database path
 DATA_DIR = Path("/data") if Path("/data").exists() else Path("./data")
@@ -227,7 +228,7 @@ FEATURE_RISKS: Dict[str, Dict[str, Any]] = {
 
 def init_compliance_tables():
     """Initialize compliance tracking tables"""
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = pooled_connect(str(DB_PATH))
     cursor = conn.cursor()
 
     # Feature usage log table
@@ -309,7 +310,7 @@ def log_feature_usage(
     risk_info = FEATURE_RISKS.get(feature_name, {})
     risk_level = risk_info.get("risk_level", RiskLevel.LOW).value if risk_info else "low"
 
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = pooled_connect(str(DB_PATH))
     cursor = conn.cursor()
 
     cursor.execute('''
@@ -341,7 +342,7 @@ def log_feature_usage(
 
 def _check_and_generate_alert(user_id: Optional[int], feature_name: str, action: str):
     """Check usage patterns and generate alerts if needed"""
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = pooled_connect(str(DB_PATH))
     cursor = conn.cursor()
 
     # Check recent usage count
@@ -379,7 +380,7 @@ def log_user_consent(
     ip_address: Optional[str] = None
 ):
     """Log user consent for risky features"""
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = pooled_connect(str(DB_PATH))
     cursor = conn.cursor()
 
     cursor.execute('''
@@ -401,7 +402,7 @@ def get_usage_logs(
     limit: int = 100
 ) -> List[Dict]:
     """Get feature usage logs with filters"""
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = pooled_connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -444,7 +445,7 @@ def get_risk_alerts(
     limit: int = 50
 ) -> List[Dict]:
     """Get risk alerts"""
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = pooled_connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -471,7 +472,7 @@ def get_risk_alerts(
 
 def resolve_alert(alert_id: int, admin_id: int) -> bool:
     """Mark an alert as resolved"""
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = pooled_connect(str(DB_PATH))
     cursor = conn.cursor()
 
     cursor.execute('''
@@ -489,7 +490,7 @@ def resolve_alert(alert_id: int, admin_id: int) -> bool:
 
 def get_compliance_stats() -> Dict:
     """Get compliance statistics for dashboard"""
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = pooled_connect(str(DB_PATH))
     cursor = conn.cursor()
 
     stats = {}
@@ -544,7 +545,7 @@ def get_feature_risks() -> Dict[str, Dict]:
 
 def check_user_consent(user_id: int, feature_name: str) -> bool:
     """Check if user has given consent for a feature"""
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = pooled_connect(str(DB_PATH))
     cursor = conn.cursor()
 
     cursor.execute('''
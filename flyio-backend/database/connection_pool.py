@@ -0,0 +1,368 @@
+"""
+SQLite 연결 풀 — DB 경로별로 스레드마다 연결을 살려 두고 재사용한다
+
+database/*_db.py 대부분이 호출마다 sqlite3.connect → (PRAGMA journal_mode=WAL,
+busy_timeout …) → 쿼리 → close 를 반복했다. /usage 같은 hot 엔드포인트와 키워드 풀
+tick 은 분당 수천 번 연결을 새로 열었고, post_analysis_cache 는 매번
+CREATE TABLE IF NOT EXISTS 까지 다시 돌렸다.
+
+pooled_connect(path) 는 sqlite3.Connection 의 하위 클래스(PooledConnection)를 돌려준다.
+  - close() 는 진짜로 닫지 않고 **현재 스레드의 유휴 목록**으로 돌려보낸다.
+    끝나지 않은 트랜잭션은 rollback 하고 row_factory 등은 기본값으로 되돌린다
+    (예전 close 와 같은 결과). 그래서 기존 `conn = ...; try: ... finally: conn.close()`
+    코드는 연결 줄만 바꾸면 된다.
+  - 한 체크아웃이 연결 하나를 독점한다. 같은 스레드에서 중첩해 열면 다른 연결이 나온다
+    (예전처럼 서로 다른 연결 → 트랜잭션이 섞이지 않는다).
+  - PRAGMA(WAL, synchronous=NORMAL, mmap_size, cache_size, temp_store=MEMORY)는
+    연결을 처음 만들 때 한 번만.
+  - `with pooled(path) as conn:` — 성공 시 commit, 예외 시 rollback, 끝나면 반납.
+    `with sqlite3.connect(...) as conn:` 자리에 쓴다(그건 commit 만 하고 닫지 않았다).
+
+ensure_schema(path, key, fn) 은 CREATE TABLE 류 초기화를 프로세스당 한 번만 돌린다.
+
+DB 경로별 연결 생성 시간·쿼리 지연(최근 표본의 p50/p95)·재사용률을 pool_stats() 로
+모으고 /api/admin/db-pool 에서 본다.
+
+':memory:' 는 연결마다 다른 DB 라 풀을 거치지 않는다. fork 된 자식은 부모의 연결을
+물려쓰지 않는다(pid 가 바뀌면 유휴 목록을 새로 만든다).
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+SQLITE_MMAP_SIZE = int(os.environ.get("SQLITE_MMAP_SIZE", str(128 * 1024 * 1024)))
+SQLITE_CACHE_KB = int(os.environ.get("SQLITE_CACHE_KB", "8192"))
+# 스레드·DB 하나당 살려 둘 유휴 연결 수. 중첩 체크아웃이 아니면 1개로 충분하다.
+SQLITE_POOL_IDLE_PER_THREAD = int(os.environ.get("SQLITE_POOL_IDLE_PER_THREAD", "2"))
+# 이보다 오래 안 쓴 유휴 연결은 다음 체크아웃 때 닫는다.
+SQLITE_POOL_IDLE_SECONDS = float(os.environ.get("SQLITE_POOL_IDLE_SECONDS", "600"))
+SLOW_QUERY_MS = float(os.environ.get("SQLITE_SLOW_QUERY_MS", "500"))
+DEFAULT_TIMEOUT = 5.0
+_SAMPLES = 2048
+
+
+class _DBStats:
+    """DB 경로 하나의 연결·쿼리 지연 집계."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connects = 0
+        self.connect_s = 0.0
+        self.checkouts = 0
+        self.reused = 0
+        self.closed_idle = 0
+        self.queries = 0
+        self.query_s = 0.0
+        self.max_query_s = 0.0
+        self.slow_queries = 0
+        self.errors = 0
+        self.samples: Deque[float] = deque(maxlen=_SAMPLES)
+
+    def record_query(self, elapsed: float, sql: str, failed: bool) -> None:
+        with self.lock:
+            self.queries += 1
+            self.query_s += elapsed
+            self.samples.append(elapsed)
+            if elapsed > self.max_query_s:
+                self.max_query_s = elapsed
+            if failed:
+                self.errors += 1
+            if elapsed * 1000 >= SLOW_QUERY_MS:
+                self.slow_queries += 1
+                slow = True
+            else:
+                slow = False
+        if slow:
+            logger.info(f"[db-pool] slow query {elapsed * 1000:.0f}ms on "
+                        f"{os.path.basename(self.path)}: {' '.join(sql.split())[:160]}")
+
+    def snapshot(self) -> Dict:
+        with self.lock:
+            samples = sorted(self.samples)
+            out = {
+                "path": self.path,
+                "connects": self.connects,
+                "avg_connect_ms": round(self.connect_s / self.connects * 1000, 3) if self.connects else None,
+                "checkouts": self.checkouts,
+                "reuse_rate": round(self.reused / self.checkouts, 4) if self.checkouts else None,
+                "closed_idle": self.closed_idle,
+                "queries": self.queries,
+                "avg_query_ms": round(self.query_s / self.queries * 1000, 3) if self.queries else None,
+                "max_query_ms": round(self.max_query_s * 1000, 3),
+                "slow_queries": self.slow_queries,
+                "errors": self.errors,
+            }
+        for label, q in (("p50_query_ms", 0.50), ("p95_query_ms", 0.95), ("p99_query_ms", 0.99)):
+            out[label] = round(samples[min(len(samples) - 1, int(q * len(samples)))] * 1000, 3) if samples else None
+        return out
+
+
+_STATS: Dict[str, _DBStats] = {}
+_STATS_LOCK = threading.Lock()
+
+
+def _stats_for(path: str) -> _DBStats:
+    st = _STATS.get(path)
+    if st is None:
+        with _STATS_LOCK:
+            st = _STATS.setdefault(path, _DBStats(path))
+    return st
+
+
+class TimedCursor(sqlite3.Cursor):
+    """execute 계열 지연을 DB 통계에 남기는 커서."""
+
+    def execute(self, sql, parameters=()):
+        t0 = time.perf_counter()
+        failed = True
+        try:
+            res = super().execute(sql, parameters)
+            failed = False
+            return res
+        finally:
+            self.connection._stats.record_query(time.perf_counter() - t0, sql, failed)
+
+    def executemany(self, sql, seq_of_parameters):
+        t0 = time.perf_counter()
+        failed = True
+        try:
+            res = super().executemany(sql, seq_of_parameters)
+            failed = False
+            return res
+        finally:
+            self.connection._stats.record_query(time.perf_counter() - t0, sql, failed)
+
+    def executescript(self, sql_script):
+        t0 = time.perf_counter()
+        failed = True
+        try:
+            res = super().executescript(sql_script)
+            failed = False
+            return res
+        finally:
+            self.connection._stats.record_query(time.perf_counter() - t0, sql_script, failed)
+
+
+class PooledConnection(sqlite3.Connection):
+    """close() 가 풀로 반납되는 sqlite3.Connection.
+
+    Connection.execute 는 내부에서 self.cursor() 를 부르므로 cursor 와 execute 둘 다
+    시간을 잰다(중복 집계는 없다 — 내부 경로는 TimedCursor.execute 를 거치지 않는다).
+    """
+
+    _pool_key: Tuple[int, str]
+    _stats: _DBStats
+    _busy_ms: int
+    _leased = False
+    _idle_since = 0.0
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        t0 = time.perf_counter()
+        failed = True
+        try:
+            res = super().execute(sql, parameters)
+            failed = False
+            return res
+        finally:
+            self._stats.record_query(time.perf_counter() - t0, sql, failed)
+
+    def executemany(self, sql, seq_of_parameters):
+        t0 = time.perf_counter()
+        failed = True
+        try:
+            res = super().executemany(sql, seq_of_parameters)
+            failed = False
+            return res
+        finally:
+            self._stats.record_query(time.perf_counter() - t0, sql, failed)
+
+    def executescript(self, sql_script):
+        t0 = time.perf_counter()
+        failed = True
+        try:
+            res = super().executescript(sql_script)
+            failed = False
+            return res
+        finally:
+            self._stats.record_query(time.perf_counter() - t0, sql_script, failed)
+
+    def close(self):
+        """풀로 반납. 이미 반납한 연결을 다시 close 해도 아무 일도 없다."""
+        if not self._leased:
+            return
+        self._leased = False
+        _release(self)
+
+    def close_physical(self):
+        sqlite3.Connection.close(self)
+
+
+class _ThreadIdle(threading.local):
+    def __init__(self):
+        self.pid = os.getpid()
+        self.idle: Dict[str, List[PooledConnection]] = {}
+
+
+_LOCAL = _ThreadIdle()
+
+
+def _idle_list(path: str) -> List[PooledConnection]:
+    if _LOCAL.pid != os.getpid():
+        # fork 된 자식 — 부모 연결은 버린다(닫지도 않는다. 부모가 쓰고 있을 수 있다).
+        _LOCAL.pid = os.getpid()
+        _LOCAL.idle = {}
+    lst = _LOCAL.idle.get(path)
+    if lst is None:
+        lst = _LOCAL.idle[path] = []
+    return lst
+
+
+def _normalize(path) -> str:
+    path = str(path)
+    if path == ":memory:" or path.startswith("file:"):
+        return path
+    return os.path.abspath(path)
+
+
+def _open(path: str, timeout: float) -> PooledConnection:
+    st = _stats_for(path)
+    t0 = time.perf_counter()
+    conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False,
+                           factory=PooledConnection)
+    conn._stats = st
+    conn._busy_ms = int(timeout * 1000)
+    try:
+        sqlite3.Connection.execute(conn, "PRAGMA journal_mode=WAL")
+        sqlite3.Connection.execute(conn, "PRAGMA synchronous=NORMAL")
+        sqlite3.Connection.execute(conn, f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        sqlite3.Connection.execute(conn, f"PRAGMA cache_size=-{SQLITE_CACHE_KB}")
+        sqlite3.Connection.execute(conn, "PRAGMA temp_store=MEMORY")
+    except sqlite3.Error as e:
+        # 읽기 전용 볼륨·다른 프로세스의 잠금 등 — PRAGMA 없이도 동작은 한다.
+        logger.debug(f"[db-pool] pragma failed on {path}: {e}")
+    with st.lock:
+        st.connects += 1
+        st.connect_s += time.perf_counter() - t0
+    return conn
+
+
+def pooled_connect(path, timeout: float = DEFAULT_TIMEOUT,
+                   row_factory=None) -> sqlite3.Connection:
+    """path 의 연결을 하나 빌린다. 다 쓰면 close() 로 반납(닫지 않는다)."""
+    key = _normalize(path)
+    if key == ":memory:" or key.startswith("file:"):
+        conn = sqlite3.connect(str(path), timeout=timeout)
+        conn.row_factory = row_factory
+        return conn
+    st = _stats_for(key)
+    idle = _idle_list(key)
+    conn = None
+    now = time.monotonic()
+    while idle:
+        cand = idle.pop()
+        if now - cand._idle_since > SQLITE_POOL_IDLE_SECONDS:
+            cand.close_physical()
+            with st.lock:
+                st.closed_idle += 1
+            continue
+        conn = cand
+        break
+    reused = conn is not None
+    if conn is None:
+        conn = _open(key, timeout)
+    busy_ms = int(timeout * 1000)
+    if conn._busy_ms != busy_ms:
+        sqlite3.Connection.execute(conn, f"PRAGMA busy_timeout={busy_ms}")
+        conn._busy_ms = busy_ms
+    conn.row_factory = row_factory
+    conn._pool_key = (os.getpid(), key)
+    conn._leased = True
+    with st.lock:
+        st.checkouts += 1
+        if reused:
+            st.reused += 1
+    return conn
+
+
+def _release(conn: PooledConnection) -> None:
+    pid, key = conn._pool_key
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+        conn.row_factory = None
+        conn.text_factory = str
+        if conn.isolation_level != "":
+            conn.isolation_level = ""
+    except sqlite3.Error:
+        conn.close_physical()
+        return
+    if pid != os.getpid():
+        conn.close_physical()
+        return
+    idle = _idle_list(key)
+    if len(idle) >= SQLITE_POOL_IDLE_PER_THREAD:
+        conn.close_physical()
+        return
+    conn._idle_since = time.monotonic()
+    idle.append(conn)
+
+
+@contextmanager
+def pooled(path, timeout: float = DEFAULT_TIMEOUT,
+           row_factory=None) -> Iterator[sqlite3.Connection]:
+    """성공 시 commit, 예외 시 rollback, 끝나면 반납."""
+    conn = pooled_connect(path, timeout=timeout, row_factory=row_factory)
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+_SCHEMA_DONE = set()
+_SCHEMA_LOCK = threading.Lock()
+
+
+def ensure_schema(path, key: str, init: Callable[[sqlite3.Connection], None],
+                  timeout: float = DEFAULT_TIMEOUT) -> None:
+    """init(conn) 을 (path, key) 마다 프로세스당 한 번만 돌린다. 실패하면 다음에 다시 시도."""
+    token = (os.getpid(), _normalize(path), key)
+    if token in _SCHEMA_DONE:
+        return
+    with _SCHEMA_LOCK:
+        if token in _SCHEMA_DONE:
+            return
+        with pooled(path, timeout=timeout) as conn:
+            init(conn)
+        _SCHEMA_DONE.add(token)
+
+
+def pool_stats() -> List[Dict]:
+    """DB 경로별 연결·쿼리 지연 통계(이 프로세스 기준)."""
+    return [st.snapshot() for st in list(_STATS.values())]
+
+
+def close_idle() -> int:
+    """현재 스레드의 유휴 연결을 닫는다(테스트·종료용)."""
+    n = 0
+    if _LOCAL.pid != os.getpid():
+        return 0
+    for lst in _LOCAL.idle.values():
+        while lst:
+            lst.pop().close_physical()
+            n += 1
+    return n
@@ -0,0 +1,395 @@
+"""
+작업 큐 저장소 — app·worker 가 같이 보는 job 테이블 하나
+
+keyword_verdict_queue(job 파일 하나씩), seed_explode_queue(JSON 배열 파일),
+ceiling_backtest(요청 파일 하나)가 각자 디렉터리를 훑고 파일을 통째로 다시 써서
+큐를 흉내 냈다. claim·has_pending 이 2초마다 job 수만큼 디스크를 읽었다.
+여기서는 한 테이블에 큐 이름으로 나눠 담고, 인덱스로 다음 job 을 고른다.
+
+한 행 = job 하나.
+  status   queued → running → done | error | dead
+           dead = 재시도를 다 쓰고도 끝나지 못한 job(리스 만료 포함). 따로 본다.
+  lease_until  running 인 job 의 리스. 워커가 heartbeat 로 늘린다. 지나면 다음
+               claim 이 queued 로 되돌리거나(재시도 여력이 있으면) dead 로 보낸다.
+  run_after    재시도 백오프 — 이 시각 전에는 claim 하지 않는다.
+  wait_s       첫 claim 까지 걸린 시간(적재→시작 지연). 지표용.
+  payload  적재할 때의 인자(JSON). state 는 실행 중 갱신하는 값(단계·진척 등, JSON).
+
+정책(동시 실행 상한·리스 길이·백오프)은 services/job_queue.py 가 들고 있다. 여기는 SQL 만.
+"""
+import json
+import logging
+import os
+import sqlite3
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from database.connection_pool import ensure_schema, pooled_connect
+
+logger = logging.getLogger(__name__)
+
+if sys.platform == "win32":
+    DATA_DIR = os.environ.get("DATA_DIR", os.path.join(os.path.dirname(__file__), "..", "data"))
+else:
+    DATA_DIR = os.environ.get("DATA_DIR", "/data")
+DB_PATH = os.environ.get("JOB_QUEUE_DB_PATH", os.path.join(DATA_DIR, "job_queue.db"))
+
+LIVE = ("queued", "running")
+FINISHED = ("done", "error", "dead")
+
+
+def _create_tables(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id           TEXT PRIMARY KEY,
+            queue        TEXT    NOT NULL,
+            status       TEXT    NOT NULL,
+            priority     INTEGER NOT NULL DEFAULT 0,
+            dedupe_key   TEXT,
+            payload      TEXT    NOT NULL,
+            state        TEXT,
+            result       TEXT,
+            error        TEXT,
+            attempts     INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL,
+            enqueued_at  REAL    NOT NULL,
+            run_after    REAL    NOT NULL,
+            claimed_at   REAL,
+            lease_until  REAL,
+            worker       TEXT,
+            wait_s       REAL,
+            done_at      REAL
+        )
+    """)
+    # claim: 큐별 queued 중 우선순위 높은 것 → 오래된 것
+    conn.execute("""CREATE INDEX IF NOT EXISTS idx_jobs_ready
+                    ON jobs(queue, status, priority DESC, enqueued_at)""")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs(queue, status, lease_until)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_dedupe ON jobs(queue, dedupe_key, status)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_done ON jobs(queue, done_at)")
+    # 워커 생존 신호 — 큐·워커마다 한 행. 워커 루프가 막혔는지(틱이 늙었는지) 본다.
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS queue_workers (
+            queue  TEXT NOT NULL,
+            worker TEXT NOT NULL,
+            pid    INTEGER,
+            state  TEXT,
+            ts     REAL NOT NULL,
+            PRIMARY KEY (queue, worker)
+        )
+    """)
+    conn.commit()
+
+
+def _connect() -> sqlite3.Connection:
+    d = os.path.dirname(DB_PATH)
+    if d and not os.path.exists(d):
+        os.makedirs(d, exist_ok=True)
+    ensure_schema(DB_PATH, "job_queue", _create_tables, timeout=10)
+    conn = pooled_connect(DB_PATH, timeout=10)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _row(r: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+    if r is None:
+        return None
+    d = dict(r)
+    d["payload"] = json.loads(d["payload"]) if d.get("payload") else {}
+    d["state"] = json.loads(d["state"]) if d.get("state") else {}
+    d["result"] = json.loads(d["result"]) if d.get("result") else None
+    return d
+
+
+def _dumps(v: Any) -> str:
+    return json.dumps(v, ensure_ascii=False, default=str)
+
+
+class _Immediate:
+    """BEGIN IMMEDIATE … COMMIT. 쓰기 잠금을 먼저 잡아 두 프로세스가 같은 job 을 집지 않게."""
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn = _connect()
+        self.conn.isolation_level = None
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.conn.close()
+
+
+def insert(job_id: str, queue: str, payload: Dict[str, Any], *, priority: int = 0,
+           dedupe_key: Optional[str] = None, dedupe_window: float = 0.0,
+           max_live: Optional[int] = None, max_attempts: int = 1,
+           run_after: Optional[float] = None) -> Dict[str, Any]:
+    """job 한 건 적재.
+
+    dedupe_key 가 같은 live job 이 dedupe_window 초 안에 적재돼 있으면 새로 넣지 않고
+    그것을 돌려준다({"reused": True}). live job 이 max_live 이상이면 {"full": True}.
+    """
+    now = time.time()
+    with _Immediate() as conn:
+        if dedupe_key is not None:
+            r = conn.execute(
+                """SELECT * FROM jobs WHERE queue=? AND dedupe_key=? AND status IN ('queued','running')
+                   AND enqueued_at > ? ORDER BY enqueued_at DESC LIMIT 1""",
+                (queue, dedupe_key, now - dedupe_window)).fetchone()
+            if r is not None:
+                return {"job": _row(r), "reused": True, "full": False}
+        live = conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE queue=? AND status IN ('queued','running')",
+            (queue,)).fetchone()[0]
+        if max_live is not None and live >= max_live:
+            return {"job": None, "reused": False, "full": True, "live": live}
+        conn.execute(
+            """INSERT INTO jobs (id, queue, status, priority, dedupe_key, payload, attempts,
+                                 max_attempts, enqueued_at, run_after)
+               VALUES (?, ?, 'queued', ?, ?, ?, 0, ?, ?, ?)""",
+            (job_id, queue, int(priority), dedupe_key, _dumps(payload), int(max_attempts),
+             now, now if run_after is None else run_after))
+        r = conn.execute("SELECT * FROM jobs WHERE id=?", (job_id,)).fetchone()
+    return {"job": _row(r), "reused": False, "full": False, "live": live + 1}
+
+
+def claim(queue: str, worker: str, lease: float, concurrency: Optional[int]) -> Optional[Dict[str, Any]]:
+    """리스 만료분을 정리하고, 상한 안이면 다음 job 하나를 running 으로. 없으면 None."""
+    now = time.time()
+    with _Immediate() as conn:
+        _reap_expired(conn, queue, now)
+        if concurrency is not None:
+            running = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE queue=? AND status='running'",
+                (queue,)).fetchone()[0]
+            if running >= concurrency:
+                return None
+        r = conn.execute(
+            """SELECT id, enqueued_at, attempts FROM jobs
+               WHERE queue=? AND status='queued' AND run_after <= ?
+               ORDER BY priority DESC, enqueued_at LIMIT 1""",
+            (queue, now)).fetchone()
+        if r is None:
+            return None
+        conn.execute(
+            """UPDATE jobs SET status='running', attempts=attempts+1, claimed_at=?,
+                      lease_until=?, worker=?, wait_s=COALESCE(wait_s, ?)
+               WHERE id=?""",
+            (now, now + lease, worker, now - r["enqueued_at"], r["id"]))
+        return _row(conn.execute("SELECT * FROM jobs WHERE id=?", (r["id"],)).fetchone())
+
+
+def _reap_expired(conn: sqlite3.Connection, queue: str, now: float) -> int:
+    """리스가 지난 running → 재시도 여력이 있으면 queued, 없으면 dead."""
+    cur = conn.execute(
+        """UPDATE jobs SET status='dead', error='lease_expired', done_at=?, lease_until=NULL
+           WHERE queue=? AND status='running' AND lease_until < ? AND attempts >= max_attempts""",
+        (now, queue, now))
+    n = cur.rowcount
+    cur = conn.execute(
+        """UPDATE jobs SET status='queued', lease_until=NULL, worker=NULL, run_after=?
+           WHERE queue=? AND status='running' AND lease_until < ?""",
+        (now, queue, now))
+    return n + cur.rowcount
+
+
+def reap_expired(queue: str) -> int:
+    with _Immediate() as conn:
+        return _reap_expired(conn, queue, time.time())
+
+
+def heartbeat(job_id: str, lease: float, state: Optional[Dict[str, Any]] = None) -> bool:
+    """리스 연장(+ state 병합). 이미 끝났거나 리스를 잃은 job 이면 False."""
+    conn = _connect()
+    try:
+        now = time.time()
+        if state:
+            r = conn.execute("SELECT state FROM jobs WHERE id=? AND status='running'",
+                             (job_id,)).fetchone()
+            if r is None:
+                return False
+            merged = {**(json.loads(r["state"]) if r["state"] else {}), **state}
+            cur = conn.execute(
+                "UPDATE jobs SET lease_until=?, state=? WHERE id=? AND status='running'",
+                (now + lease, _dumps(merged), job_id))
+        else:
+            cur = conn.execute("UPDATE jobs SET lease_until=? WHERE id=? AND status='running'",
+                               (now + lease, job_id))
+        conn.commit()
+        return cur.rowcount > 0
+    finally:
+        conn.close()
+
+
+def finish(job_id: str, status: str, *, result: Any = None, error: Optional[str] = None,
+           state: Optional[Dict[str, Any]] = None) -> bool:
+    """running(또는 queued) job 을 done/error/dead 로 확정. 이미 끝난 job 이면 False."""
+    conn = _connect()
+    try:
+        r = conn.execute("SELECT state FROM jobs WHERE id=? AND status IN ('queued','running')",
+                         (job_id,)).fetchone()
+        if r is None:
+            return False
+        merged = {**(json.loads(r["state"]) if r["state"] else {}), **(state or {})}
+        cur = conn.execute(
+            """UPDATE jobs SET status=?, result=?, error=?, state=?, done_at=?, lease_until=NULL
+               WHERE id=? AND status IN ('queued','running')""",
+            (status, None if result is None else _dumps(result),
+             None if error is None else str(error)[:500], _dumps(merged), time.time(), job_id))
+        conn.commit()
+        return cur.rowcount > 0
+    finally:
+        conn.close()
+
+
+def retry(job_id: str, delay: float, error: Optional[str] = None) -> bool:
+    """running → queued (run_after = 지금 + delay)."""
+    conn = _connect()
+    try:
+        cur = conn.execute(
+            """UPDATE jobs SET status='queued', run_after=?, lease_until=NULL, worker=NULL, error=?
+               WHERE id=? AND status='running'""",
+            (time.time() + delay, None if error is None else str(error)[:500], job_id))
+        conn.commit()
+        return cur.rowcount > 0
+    finally:
+        conn.close()
+
+
+def get(job_id: str) -> Optional[Dict[str, Any]]:
+    conn = _connect()
+    try:
+        return _row(conn.execute("SELECT * FROM jobs WHERE id=?", (job_id,)).fetchone())
+    finally:
+        conn.close()
+
+
+def list_jobs(queue: str, statuses=LIVE + FINISHED, limit: int = 100,
+              newest_first: bool = False) -> List[Dict[str, Any]]:
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            f"""SELECT * FROM jobs WHERE queue=? AND status IN ({','.join('?' * len(statuses))})
+                ORDER BY enqueued_at {'DESC' if newest_first else 'ASC'} LIMIT ?""",
+            (queue, *statuses, limit)).fetchall()
+        return [_row(r) for r in rows]
+    finally:
+        conn.close()
+
+
+def count_live(queue: str, fresh_after: Optional[float] = None) -> int:
+    """queued + running. fresh_after 를 주면 그 시각 이후 적재·claim 된 것만(좀비 제외)."""
+    conn = _connect()
+    try:
+        if fresh_after is None:
+            return conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE queue=? AND status IN ('queued','running')",
+                (queue,)).fetchone()[0]
+        return conn.execute(
+            """SELECT COUNT(*) FROM jobs WHERE queue=? AND status IN ('queued','running')
+               AND COALESCE(claimed_at, enqueued_at) > ?""",
+            (queue, fresh_after)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def next_ready_at(queue: str) -> Optional[float]:
+    """가장 이른 queued job 의 run_after (없으면 None). 워커 대기 시간 계산용."""
+    conn = _connect()
+    try:
+        r = conn.execute("SELECT MIN(run_after) FROM jobs WHERE queue=? AND status='queued'",
+                         (queue,)).fetchone()
+        return r[0] if r else None
+    finally:
+        conn.close()
+
+
+def cancel_queued(queue: str, error: str = "superseded") -> int:
+    conn = _connect()
+    try:
+        cur = conn.execute(
+            """UPDATE jobs SET status='error', error=?, done_at=? WHERE queue=? AND status='queued'""",
+            (error, time.time(), queue))
+        conn.commit()
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
+def purge(queue: str, older_than: Optional[float] = None) -> int:
+    """끝난 job 중 done_at 이 older_than 초보다 오래된 것 삭제. None 이면 큐 전체 삭제."""
+    conn = _connect()
+    try:
+        if older_than is None:
+            cur = conn.execute("DELETE FROM jobs WHERE queue=?", (queue,))
+        else:
+            cur = conn.execute(
+                """DELETE FROM jobs WHERE queue=? AND status IN ('done','error','dead')
+                   AND done_at < ?""", (queue, time.time() - older_than))
+        conn.commit()
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
+def stats(queue: str, window: float) -> Dict[str, Any]:
+    """상태별 개수·가장 오래 기다린 queued 나이·최근 window 초 적재→시작 지연."""
+    now = time.time()
+    conn = _connect()
+    try:
+        counts = {s: 0 for s in LIVE + FINISHED}
+        for r in conn.execute("SELECT status, COUNT(*) AS n FROM jobs WHERE queue=? GROUP BY status",
+                              (queue,)):
+            counts[r["status"]] = r["n"]
+        oldest = conn.execute(
+            "SELECT MIN(enqueued_at) FROM jobs WHERE queue=? AND status='queued'",
+            (queue,)).fetchone()[0]
+        expired = conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE queue=? AND status='running' AND lease_until < ?",
+            (queue, now)).fetchone()[0]
+        waits = [r[0] for r in conn.execute(
+            "SELECT wait_s FROM jobs WHERE queue=? AND wait_s IS NOT NULL AND claimed_at > ?",
+            (queue, now - window))]
+    finally:
+        conn.close()
+    waits.sort()
+
+    def pct(p: float) -> Optional[float]:
+        return round(waits[min(len(waits) - 1, int(p * len(waits)))], 3) if waits else None
+
+    return {
+        "counts": counts,
+        "depth": counts["queued"],
+        "lease_expired": expired,
+        "oldest_queued_age": round(now - oldest, 1) if oldest else 0.0,
+        "wait_samples": len(waits),
+        "wait_p50": pct(0.5),
+        "wait_p95": pct(0.95),
+        "wait_max": round(waits[-1], 3) if waits else None,
+    }
+
+
+def beat(queue: str, worker: str, state: str) -> None:
+    conn = _connect()
+    try:
+        conn.execute(
+            """INSERT INTO queue_workers (queue, worker, pid, state, ts) VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(queue, worker) DO UPDATE SET pid=excluded.pid, state=excluded.state,
+                                                        ts=excluded.ts""",
+            (queue, worker, os.getpid(), state, time.time()))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def last_beat(queue: str) -> Optional[Dict[str, Any]]:
+    """그 큐에서 가장 최근에 틱을 남긴 워커."""
+    conn = _connect()
+    try:
+        r = conn.execute("SELECT * FROM queue_workers WHERE queue=? ORDER BY ts DESC LIMIT 1",
+                         (queue,)).fetchone()
+        return dict(r) if r else None
+    finally:
+        conn.close()
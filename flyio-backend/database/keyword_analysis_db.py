@@ -9,6 +9,9 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from contextlib import contextmanager
 
+from services.memory_cache import get_cache
+from database.connection_pool import pooled_connect
+
 logger = logging.getLogger(__name__)
 
 # 데이터베이스 파일 경로
@@ -24,7 +27,7 @@ if os.path.exists(FLYIO_DATA_DIR):
 def get_connection() -> sqlite3.Connection:
     """데이터베이스 연결 반환"""
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn = pooled_connect(DB_PATH)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -205,23 +208,37 @@ def clear_expired_cache():
 
 # ========== 연관 키워드 캐시 ==========
 
-def get_cached_related_keywords(keyword: str) -> Optional[Dict[str, Any]]:
-    """캐시된 연관 키워드 결과 조회"""
+# related_keywords_cache 테이블 앞단의 프로세스 내 LRU. 적중 시 SQLite 연결·JSON 파싱을
+# 건너뛴다. 항목 TTL 은 테이블의 expires_at 까지 남은 시간이다(테이블이 원본).
+_RELATED_MEMORY = get_cache("related_keywords", max_entries=500,
+                            max_bytes=16 * 1024 * 1024, ttl=3600)
+
+
+def _read_related_row(key: str) -> Optional[Dict[str, Any]]:
+    cached = _RELATED_MEMORY.get(key)
+    if cached is not None:
+        return cached
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute("""
-            SELECT response_data FROM related_keywords_cache
+            SELECT response_data, expires_at FROM related_keywords_cache
             WHERE keyword = ? AND expires_at > datetime('now')
-        """, (keyword,))
+        """, (key,))
 
         row = cursor.fetchone()
-        if row:
-            return json.loads(row['response_data'])
+    if not row:
         return None
+    data = json.loads(row['response_data'])
+    try:
+        remaining = (datetime.fromisoformat(row['expires_at']) - datetime.now()).total_seconds()
+    except (TypeError, ValueError):
+        remaining = 0
+    if remaining > 0:
+        _RELATED_MEMORY.set(key, data, ttl=remaining)
+    return data
 
 
-def cache_related_keywords(keyword: str, data: Dict[str, Any], ttl_hours: int = 24):
-    """연관 키워드 결과 캐싱 (24시간 기본)"""
+def _write_related_row(key: str, data: Dict[str, Any], ttl_hours: int):
     with get_db() as conn:
         cursor = conn.cursor()
         expires_at = datetime.now() + timedelta(hours=ttl_hours)
@@ -231,44 +248,33 @@ def cache_related_keywords(keyword: str, data: Dict[str, Any], ttl_hours: int =
             (keyword, response_data, expires_at)
             VALUES (?, ?, ?)
         """, (
-            keyword,
+            key,
             json.dumps(data, ensure_ascii=False),
             expires_at.isoformat()
         ))
+    _RELATED_MEMORY.set(key, data, ttl=ttl_hours * 3600)
+
+
+def get_cached_related_keywords(keyword: str) -> Optional[Dict[str, Any]]:
+    """캐시된 연관 키워드 결과 조회"""
+    return _read_related_row(keyword)
+
+
+def cache_related_keywords(keyword: str, data: Dict[str, Any], ttl_hours: int = 24):
+    """연관 키워드 결과 캐싱 (24시간 기본)"""
+    _write_related_row(keyword, data, ttl_hours)
 
 
 # ========== 키워드 트리 캐시 ==========
 
 def get_cached_keyword_tree(cache_key: str) -> Optional[Dict[str, Any]]:
     """캐시된 키워드 트리 결과 조회"""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT response_data FROM related_keywords_cache
-            WHERE keyword = ? AND expires_at > datetime('now')
-        """, (cache_key,))
-
-        row = cursor.fetchone()
-        if row:
-            return json.loads(row['response_data'])
-        return None
+    return _read_related_row(cache_key)
 
 
 def cache_keyword_tree(cache_key: str, data: Dict[str, Any], ttl_hours: int = 12):
     """키워드 트리 결과 캐싱 (12시간 기본)"""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        expires_at = datetime.now() + timedelta(hours=ttl_hours)
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO related_keywords_cache
-            (keyword, response_data, expires_at)
-            VALUES (?, ?, ?)
-        """, (
-            cache_key,
-            json.dumps(data, ensure_ascii=False),
-            expires_at.isoformat()
-        ))
+    _write_related_row(cache_key, data, ttl_hours)
 
 
 # ========== 키워드 유형 학습 ==========
@@ -18,8 +18,9 @@ import os
 import sqlite3
 import sys
 from contextlib import contextmanager
-from typing import Iterable, List, Optional, Dict, Set
+from typing import Iterable, List, Optional, Dict, Set, Tuple
 import logging
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -99,11 +100,8 @@ class KeywordPoolDB:
 
     @contextmanager
     def _conn(self):
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn = pooled_connect(self.db_path, timeout=30.0)
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA busy_timeout=30000")
-        conn.execute("PRAGMA synchronous=NORMAL")
         try:
             yield conn
             conn.commit()
@@ -931,10 +929,12 @@ class KeywordPoolDB:
         """수집 워커가 호출 — pending 상태로 INSERT + mt 업그레이드.
 
         흐름 (batch):
-          1) 입력 KW 의 기존 row 조회 (status, mt 확인)
+          1) 입력 KW 를 임시 테이블에 적재 (executemany)
           2) 신규 KW → INSERT
           3) status='pending' AND 기존 mt < 새 mt → UPDATE (mt/source/seed 갱신)
           4) status='registered'/'failed' 행은 보존 (이미 처리됨)
+          2~4 는 INSERT … ON CONFLICT DO UPDATE WHERE 한 문장 (_add_candidates_bulk).
+          그 문장이 실패하면 행 단위 경로(_add_candidates_rowwise)로 재시도한다.
 
         과거: INSERT OR IGNORE → mt=0 user_seed 가 먼저 들어가면 keywordstool 이
               mt=1000 으로 발견해도 영구 차단 → 11k+ pending 등록 락.
@@ -958,6 +958,31 @@ class KeywordPoolDB:
         if not by_kw:
             return 0
 
+        kws = list(by_kw.keys())
+        try:
+            added, upgraded = self._add_candidates_bulk(user_id, account_customer_id, by_kw)
+        except sqlite3.Error as e:
+            # 한 행이 set 기반 경로 전체를 실패시키면 행 단위 경로로 — 실패 행만 건너뛴다.
+            logger.warning(f"[add_candidates] bulk 경로 실패 → 행 단위 재시도: {e}")
+            added, upgraded = self._add_candidates_rowwise(user_id, account_customer_id, by_kw)
+
+        if upgraded:
+            logger.warning(
+                f"[add_candidates] cid={account_customer_id} +{added} 신규 / "
+                f"{upgraded} mt 업그레이드 (입력 {len(items)} 중 dedup {len(items) - len(kws)})"
+            )
+        return added
+
+    def _add_candidates_rowwise(
+        self,
+        user_id: int,
+        account_customer_id: int,
+        by_kw: Dict[str, Dict],
+    ) -> Tuple[int, int]:
+        """행 단위 경로 — 기존 row 조회 후 KW 마다 INSERT/UPDATE. (added, upgraded).
+
+        bulk 경로가 실패했을 때의 폴백이자 벤치마크 기준선.
+        """
         kws = list(by_kw.keys())
         added = 0
         upgraded = 0
@@ -1036,12 +1061,80 @@ class KeywordPoolDB:
                 except sqlite3.Error as e:
                     logger.warning(f"add_candidates row 실패 {kw}: {e}")
 
-        if upgraded:
-            logger.warning(
-                f"[add_candidates] cid={account_customer_id} +{added} 신규 / "
-                f"{upgraded} mt 업그레이드 (입력 {len(items)} 중 dedup {len(items) - len(kws)})"
+        return added, upgraded
+
+    def _add_candidates_bulk(
+        self,
+        user_id: int,
+        account_customer_id: int,
+        by_kw: Dict[str, Dict],
+    ) -> Tuple[int, int]:
+        """set 기반 경로 — 임시 테이블에 executemany 로 적재 후 UPSERT 한 문장. (added, upgraded).
+
+        seed-explode / autocomplete 가 수만 KW 배치를 넣을 때 KW 마다 INSERT/UPDATE 를
+        파이썬 루프로 돌던 비용을 없앤다. 판정 규칙은 행 단위 경로와 같다:
+          신규 → INSERT (pending)
+          기존 pending AND 새 mt > 기존 mt → mt/pc/mobile 갱신, comp_idx/source/seed 는 COALESCE
+          그 외(registered/failed/… 또는 mt 가 크지 않음) → 보존
+        """
+        rows = [
+            (
+                kw,
+                int(it.get("monthly_total") or 0),
+                int(it.get("monthly_pc") or 0),
+                int(it.get("monthly_mobile") or 0),
+                it.get("comp_idx"),
+                it.get("source") or "keywordstool",
+                it.get("seed"),
             )
-        return added
+            for kw, it in by_kw.items()
+        ]
+        with self._conn() as conn:
+            cur = conn.cursor()
+            # 쓰기 락을 먼저 잡는다 — 집계(SELECT)와 UPSERT 사이에 다른 writer 가 끼면
+            # WAL 스냅샷이 어긋나 SQLITE_BUSY_SNAPSHOT 이 난다.
+            if not conn.in_transaction:
+                cur.execute("BEGIN IMMEDIATE")
+            cur.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS pool_candidate_stage (
+                    keyword TEXT PRIMARY KEY,
+                    monthly_total, monthly_pc, monthly_mobile,
+                    comp_idx, source, seed
+                )
+            """)
+            cur.execute("DELETE FROM pool_candidate_stage")
+            cur.executemany(
+                "INSERT INTO pool_candidate_stage VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            added, upgraded = cur.execute(
+                """SELECT COALESCE(SUM(p.keyword IS NULL), 0),
+                          COALESCE(SUM(p.status = 'pending' AND s.monthly_total > COALESCE(p.monthly_total, 0)), 0)
+                   FROM pool_candidate_stage s
+                   LEFT JOIN naverad_keyword_pool p
+                     ON p.account_customer_id = ? AND p.keyword = s.keyword""",
+                (account_customer_id,),
+            ).fetchone()
+            # WHERE true — INSERT … SELECT 뒤 ON CONFLICT 파싱 모호성 회피 (SQLite 문서 권고).
+            cur.execute(
+                """INSERT INTO naverad_keyword_pool
+                   (user_id, account_customer_id, keyword, monthly_total,
+                    monthly_pc, monthly_mobile, comp_idx, source, seed, status)
+                   SELECT ?, ?, keyword, monthly_total, monthly_pc, monthly_mobile,
+                          comp_idx, source, seed, 'pending'
+                   FROM pool_candidate_stage WHERE true
+                   ON CONFLICT(account_customer_id, keyword) DO UPDATE SET
+                       monthly_total = excluded.monthly_total,
+                       monthly_pc = excluded.monthly_pc,
+                       monthly_mobile = excluded.monthly_mobile,
+                       comp_idx = COALESCE(excluded.comp_idx, comp_idx),
+                       source = COALESCE(excluded.source, source),
+                       seed = COALESCE(excluded.seed, seed)
+                   WHERE status = 'pending'
+                     AND excluded.monthly_total > COALESCE(monthly_total, 0)""",
+                (user_id, account_customer_id),
+            )
+            cur.execute("DELETE FROM pool_candidate_stage")
+        return int(added), int(upgraded)
 
     def claim_pending(
         self,
@@ -0,0 +1,162 @@
+"""
+키워드 월 검색량 캐시 — /keywordstool 응답을 키워드 단위로 영속 저장.
+
+왜 필요한가:
+검색량은 우리 API 예산 중 가장 빡빡한 자원이다(계정마다 keywordstool 쿼터를
+seed explode·풀 검증·SEO 큐·천장 측정이 나눠 쓴다). 그런데 호출부마다 따로
+배치를 짜고 결과를 버려서, 같은 키워드를 하루에도 몇 번씩 다시 물었다.
+검색량은 월 단위 지표라 며칠 재사용해도 된다.
+
+한 행 = 정규화 키워드(공백 제거 + 대문자) 하나.
+  found=1  응답에 실린 키워드(힌트든 딸려 온 relKeyword 든) — 검색량 그대로
+  found=0  힌트로 물었는데 응답에 없었다 = 네이버 기준 검색량 없음(음수 캐시).
+           TTL 을 짧게 둔다. 없다고 답한 키워드를 매번 다시 묻는 게 가장 큰 낭비였다.
+
+API 호출·배치·합치기는 services/keyword_volume.py 가 한다. 여기는 저장만.
+"""
+import logging
+import os
+import sqlite3
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from database.connection_pool import ensure_schema, pooled_connect
+
+logger = logging.getLogger(__name__)
+
+if sys.platform == "win32":
+    DATA_DIR = os.environ.get("DATA_DIR", os.path.join(os.path.dirname(__file__), "..", "data"))
+else:
+    DATA_DIR = os.environ.get("DATA_DIR", "/data")
+DB_PATH = os.environ.get("KEYWORD_VOLUME_DB_PATH", os.path.join(DATA_DIR, "keyword_volume.db"))
+
+# IN (...) 한 번에 묶는 키 수 (SQLite 변수 한도 999 아래).
+_IN_CHUNK = 500
+
+
+def _create_tables(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS keyword_volume (
+            norm           TEXT PRIMARY KEY,
+            keyword        TEXT,
+            monthly_pc     INTEGER DEFAULT 0,
+            monthly_mobile INTEGER DEFAULT 0,
+            monthly_total  INTEGER DEFAULT 0,
+            comp_idx       TEXT,
+            found          INTEGER NOT NULL,
+            fetched_at     REAL    NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_kv_fetched ON keyword_volume(fetched_at)")
+    conn.commit()
+
+
+def _connect() -> sqlite3.Connection:
+    d = os.path.dirname(DB_PATH)
+    if d and not os.path.exists(d):
+        os.makedirs(d, exist_ok=True)
+    ensure_schema(DB_PATH, "keyword_volume", _create_tables, timeout=10)
+    conn = pooled_connect(DB_PATH, timeout=10)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def get_many(norms: Iterable[str], ttl: float, negative_ttl: float) -> Dict[str, Dict[str, Any]]:
+    """TTL 안의 행만 {norm: row}. 음수 캐시는 found=0 으로 나온다."""
+    keys = list(dict.fromkeys(norms))
+    if not keys:
+        return {}
+    now = time.time()
+    out: Dict[str, Dict[str, Any]] = {}
+    conn = _connect()
+    try:
+        for i in range(0, len(keys), _IN_CHUNK):
+            part = keys[i:i + _IN_CHUNK]
+            rows = conn.execute(
+                f"SELECT * FROM keyword_volume WHERE norm IN ({','.join('?' * len(part))})",
+                part,
+            ).fetchall()
+            for r in rows:
+                age = now - r["fetched_at"]
+                if age <= (ttl if r["found"] else negative_ttl):
+                    out[r["norm"]] = dict(r)
+    finally:
+        conn.close()
+    return out
+
+
+def save_rows(rows: List[Dict[str, Any]], missing: Iterable[str] = (),
+              asked_at: Optional[float] = None) -> int:
+    """응답 한 번의 결과를 저장한다.
+
+    rows     : [{norm, keyword, monthly_pc, monthly_mobile, monthly_total, comp_idx}]
+    missing  : 힌트로 물었는데 응답에 없던 norm — 음수 캐시.
+    asked_at : 요청을 보낸 시각. 그 뒤에 다른 응답이 검색량을 실어 준 키워드(found=1)는
+               음수로 덮지 않는다 (그 전의 found=1 은 만료돼서 다시 물은 것이다).
+    """
+    now = time.time()
+    asked_at = now if asked_at is None else asked_at
+    missing = [m for m in dict.fromkeys(missing) if m]
+    conn = _connect()
+    try:
+        if rows:
+            conn.executemany("""
+                INSERT INTO keyword_volume (norm, keyword, monthly_pc, monthly_mobile,
+                                            monthly_total, comp_idx, found, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, 1, ?)
+                ON CONFLICT(norm) DO UPDATE SET
+                    keyword = excluded.keyword,
+                    monthly_pc = excluded.monthly_pc,
+                    monthly_mobile = excluded.monthly_mobile,
+                    monthly_total = excluded.monthly_total,
+                    comp_idx = excluded.comp_idx,
+                    found = 1,
+                    fetched_at = excluded.fetched_at
+            """, [(r["norm"], r.get("keyword"), r.get("monthly_pc", 0), r.get("monthly_mobile", 0),
+                   r.get("monthly_total", 0), r.get("comp_idx"), now) for r in rows])
+        if missing:
+            conn.executemany("""
+                INSERT INTO keyword_volume (norm, keyword, found, fetched_at)
+                VALUES (?, NULL, 0, ?)
+                ON CONFLICT(norm) DO UPDATE SET
+                    keyword = NULL, monthly_pc = 0, monthly_mobile = 0, monthly_total = 0,
+                    comp_idx = NULL, found = 0, fetched_at = excluded.fetched_at
+                WHERE keyword_volume.found = 0 OR keyword_volume.fetched_at < ?
+            """, [(m, now, asked_at) for m in missing])
+        conn.commit()
+    finally:
+        conn.close()
+    return len(rows) + len(missing)
+
+
+def purge_expired(max_age: float) -> int:
+    """max_age 초보다 오래된 행 삭제."""
+    conn = _connect()
+    try:
+        cur = conn.execute("DELETE FROM keyword_volume WHERE fetched_at < ?",
+                           (time.time() - max_age,))
+        conn.commit()
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
+def clear_volumes() -> None:
+    """전부 비운다 (테스트·강제 재조회용)."""
+    conn = _connect()
+    try:
+        conn.execute("DELETE FROM keyword_volume")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_stats() -> Dict[str, int]:
+    conn = _connect()
+    try:
+        r = conn.execute("SELECT COUNT(*) AS n, COALESCE(SUM(found), 0) AS found "
+                         "FROM keyword_volume").fetchone()
+        return {"rows": r["n"], "found": r["found"], "negative": r["n"] - r["found"]}
+    finally:
+        conn.close()
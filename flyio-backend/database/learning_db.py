@@ -8,6 +8,8 @@ from typing import Dict, List, Optional
 import json
 import os
 
+from database.connection_pool import pooled_connect
+
 # Use persistent volume path for database
 # Windows 로컬 개발환경에서는 ./data 사용
 import sys
@@ -19,7 +21,7 @@ else:
 @contextmanager
 def get_db():
     """Database connection context manager"""
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = pooled_connect(DATABASE_PATH)
     conn.row_factory = sqlite3.Row
     try:
         yield conn
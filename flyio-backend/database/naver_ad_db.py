@@ -8,6 +8,7 @@ import os
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 from pathlib import Path
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +28,10 @@ def get_connection() -> sqlite3.Connection:
 
     WAL + busy_timeout — 50k 일괄 삭제 + cron 5종이 동시 write 중일 때
     /accounts /stats hot read 가 SQLITE_BUSY 로 5s 안에 죽던 사고 차단.
+    WAL 등 PRAGMA 는 connection_pool 이 연결을 처음 만들 때 한 번 건다.
     """
-    conn = sqlite3.connect(str(DB_PATH), timeout=30.0)
+    conn = pooled_connect(str(DB_PATH), timeout=30.0)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA busy_timeout=30000")
-    conn.execute("PRAGMA synchronous=NORMAL")
     return conn
 
 
@@ -754,6 +753,28 @@ def save_bid_change(
     conn.close()
 
 
+def save_bid_changes(user_id: int, changes: List[Any], strategy: str = "balanced") -> int:
+    """입찰 변경 기록 여러 건 저장 — executemany 한 번. changes 는 BidChange 목록."""
+    if not changes:
+        return 0
+    rows = [(
+        user_id, c.keyword_id, c.keyword, c.old_bid, c.new_bid,
+        c.new_bid - c.old_bid,
+        (c.new_bid - c.old_bid) / c.old_bid if c.old_bid > 0 else 0,
+        c.reason, strategy,
+    ) for c in changes]
+    conn = get_connection()
+    conn.executemany("""
+        INSERT INTO bid_history (
+            user_id, keyword_id, keyword_text, old_bid, new_bid,
+            change_amount, change_ratio, reason, strategy
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+    conn.commit()
+    conn.close()
+    return len(rows)
+
+
 def get_bid_history(user_id: int, limit: int = 100, keyword_id: str = None) -> List[dict]:
     """입찰 변경 이력 조회"""
     conn = get_connection()
@@ -9,6 +9,7 @@ import logging
 import os
 import json
 from enum import Enum
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +56,7 @@ class NotificationDB:
                 logger.warning(f"Could not create db directory: {e}")
 
     def _get_connection(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = pooled_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
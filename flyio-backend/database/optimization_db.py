@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from database.connection_pool import pooled_connect
+
 # 데이터 경로 - Windows/Linux 호환
 import sys
 import os
@@ -23,7 +25,7 @@ DB_PATH = DATA_DIR / "optimization_history.db"
 
 def get_db_connection():
     """DB 연결"""
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = pooled_connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -232,6 +234,39 @@ def log_optimization_action(
     return action_id
 
 
+def _action_value(v: Any) -> Optional[str]:
+    return json.dumps(v) if isinstance(v, dict) else str(v) if v else None
+
+
+def log_optimization_actions(actions: List[Dict[str, Any]]) -> int:
+    """최적화 액션 여러 건을 한 번에 기록 (executemany 한 번 + commit 한 번).
+
+    actions: log_optimization_action 의 인자와 같은 키를 가진 dict 목록.
+    입찰 일괄 적용(services/bid_apply)이 bulk PUT 한 콜(최대 100건)마다 부른다.
+    """
+    if not actions:
+        return 0
+    rows = [(
+        a.get("session_id"), a["user_id"], a["platform"], a["action_type"],
+        a.get("target_type"), a.get("target_id"), a.get("target_name"),
+        _action_value(a.get("old_value")), _action_value(a.get("new_value")),
+        a.get("reason"),
+        json.dumps(a["impact_estimate"]) if a.get("impact_estimate") else None,
+    ) for a in actions]
+    conn = get_db_connection()
+    try:
+        conn.executemany("""
+            INSERT INTO optimization_actions
+            (session_id, user_id, platform, action_type, target_type, target_id,
+             target_name, old_value, new_value, reason, impact_estimate)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        conn.commit()
+    finally:
+        conn.close()
+    return len(rows)
+
+
 def get_optimization_actions(
     user_id: int,
     platform: str = None,
@@ -31,9 +31,7 @@ logger = logging.getLogger(__name__)
 STRUCT_TTL_DAYS = 180
 
 
-def _conn():
-    from database.blog_index_history_db import _connect
-    conn = _connect()
+def _create_table(conn) -> None:
     conn.execute("""
         CREATE TABLE IF NOT EXISTS post_analysis_cache (
             url         TEXT PRIMARY KEY,
@@ -45,7 +43,14 @@ def _conn():
     conn.execute(
         "CREATE INDEX IF NOT EXISTS idx_pac_blog ON post_analysis_cache(blog_id)"
     )
-    conn.commit()
+
+
+def _conn():
+    from database.blog_index_history_db import INDEX_HISTORY_DB_PATH, _connect
+    from database.connection_pool import ensure_schema
+    conn = _connect()
+    # 테이블 생성은 프로세스당 한 번. 예전엔 읽기·쓰기마다 DDL 을 다시 돌렸다.
+    ensure_schema(INDEX_HISTORY_DB_PATH, "post_analysis_cache", _create_table, timeout=10)
     return conn
 
 
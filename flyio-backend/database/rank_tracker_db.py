@@ -9,6 +9,7 @@ from datetime import datetime, date, timedelta
 from typing import Optional, Dict, List, Any
 from contextlib import contextmanager
 import logging
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +75,7 @@ class RankTrackerDB:
     @contextmanager
     def get_connection(self):
         """데이터베이스 연결 컨텍스트 매니저"""
-        conn = sqlite3.connect(self.db_path)
+        conn = pooled_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         try:
             yield conn
@@ -450,6 +451,18 @@ class RankTrackerDB:
                 "rank_view_tab": rank_view_tab
             }
 
+    def add_rank_history_bulk(self, rows: List[tuple]) -> int:
+        """순위 히스토리 일괄 추가 — rows: (post_keyword_id, rank_blog_tab, rank_view_tab)"""
+        if not rows:
+            return 0
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO rank_history (post_keyword_id, rank_blog_tab, rank_view_tab)
+                VALUES (?, ?, ?)
+            """, rows)
+            return len(rows)
+
     # ============ 키워드 예측 원장 (정답지 축적 루프) ============
 
     def add_keyword_prediction(self, blog_id: str, keyword: str, target_volume: int,
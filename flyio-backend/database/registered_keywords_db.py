@@ -21,6 +21,7 @@ from contextlib import contextmanager
 from datetime import datetime
 from typing import Iterable, List, Set, Optional, Dict
 import logging
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -47,11 +48,8 @@ class RegisteredKeywordsDB:
 
     @contextmanager
     def _conn(self):
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn = pooled_connect(self.db_path, timeout=30.0)
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA busy_timeout=30000")
-        conn.execute("PRAGMA synchronous=NORMAL")
         try:
             yield conn
             conn.commit()
@@ -26,6 +26,7 @@ import sqlite3
 import sys
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +66,7 @@ def _connect() -> sqlite3.Connection:
     d = os.path.dirname(SEO_PAGES_DB_PATH)
     if d and not os.path.exists(d):
         os.makedirs(d, exist_ok=True)
-    conn = sqlite3.connect(SEO_PAGES_DB_PATH, timeout=10)
+    conn = pooled_connect(SEO_PAGES_DB_PATH, timeout=10)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -22,6 +22,7 @@ import sys
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +50,7 @@ def _connect() -> sqlite3.Connection:
     d = os.path.dirname(ANALYTICS_DB_PATH)
     if d and not os.path.exists(d):
         os.makedirs(d, exist_ok=True)
-    conn = sqlite3.connect(ANALYTICS_DB_PATH, timeout=10)
+    conn = pooled_connect(ANALYTICS_DB_PATH, timeout=10)
     conn.row_factory = sqlite3.Row
     return conn
 
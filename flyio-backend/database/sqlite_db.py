@@ -6,6 +6,7 @@ from contextlib import contextmanager
 from typing import List, Dict, Optional, Any
 import logging
 import os
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,7 @@ class SQLiteClient:
     @contextmanager
     def get_connection(self):
         """Get database connection context manager"""
-        conn = sqlite3.connect(self.db_path)
+        conn = pooled_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         try:
             yield conn
@@ -91,7 +92,7 @@ def get_sqlite_client() -> SQLiteClient:
 def get_connection():
     """Get a raw sqlite3 connection (for platform_store etc.)"""
     client = get_sqlite_client()
-    conn = sqlite3.connect(client.db_path)
+    conn = pooled_connect(client.db_path)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -148,7 +149,7 @@ async def get_blog_by_id(blog_id: str) -> Optional[Dict]:
         user_blogs_db_path = "/data/user_blogs.db"
 
     try:
-        conn = sqlite3.connect(user_blogs_db_path)
+        conn = pooled_connect(user_blogs_db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
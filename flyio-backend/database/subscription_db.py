@@ -15,6 +15,7 @@ from typing import Optional, Dict, List, Any
 from enum import Enum
 import logging
 import sys
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -190,7 +191,7 @@ def get_connection():
         conn = psycopg2.connect(DATABASE_URL)
         return conn
     else:
-        conn = sqlite3.connect(DB_PATH)
+        conn = pooled_connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -7,6 +7,7 @@ import os
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 import logging
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,7 @@ def get_connection():
     if db_dir and not os.path.exists(db_dir):
         os.makedirs(db_dir, exist_ok=True)
 
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = pooled_connect(DATABASE_PATH)
     conn.row_factory = sqlite3.Row
     return conn
 
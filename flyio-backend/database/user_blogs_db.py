@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Optional, Dict, List, Any
 import logging
 import json
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,7 @@ DB_PATH = os.path.join(DATA_DIR, "user_blogs.db")
 
 def get_connection():
     """SQLite 연결"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = pooled_connect(DB_PATH)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -7,6 +7,7 @@ from typing import Optional, Dict, List
 from datetime import datetime
 import logging
 import os
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +41,7 @@ class UserDB:
     @contextmanager
     def get_connection(self):
         """Get database connection context manager"""
-        conn = sqlite3.connect(self.db_path)
+        conn = pooled_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         try:
             yield conn
@@ -19,6 +19,7 @@ import sqlite3
 import sys
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
+from database.connection_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +46,7 @@ def _connect() -> sqlite3.Connection:
     d = os.path.dirname(WINNER_CACHE_DB_PATH)
     if d and not os.path.exists(d):
         os.makedirs(d, exist_ok=True)
-    conn = sqlite3.connect(WINNER_CACHE_DB_PATH, timeout=10)
+    conn = pooled_connect(WINNER_CACHE_DB_PATH, timeout=10)
     conn.row_factory = sqlite3.Row
     return conn
 
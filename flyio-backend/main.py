@@ -61,6 +61,15 @@ async def lifespan(app: FastAPI):
     logger.info(f"Debug mode: {settings.DEBUG}")
     logger.warning(f"🎭 Process group: {PROCESS_GROUP} (schedulers={RUN_SCHEDULERS})")
 
+    # 이벤트 루프 감시 — 모든 프로세스. 루프가 막히면 감시 스레드가 막은 호출 지점의 스택을
+    # 떠 둔다(/api/admin/loop-health). 맨 먼저 붙여 아래 초기화가 막는 것도 잡는다.
+    # 이름은 ROLE 우선 — 단일 머신에선 app·worker 둘 다 FLY_PROCESS_GROUP=app 이다.
+    try:
+        from services.loop_monitor import start_loop_monitor
+        start_loop_monitor(os.getenv("ROLE") or PROCESS_GROUP)
+    except Exception as e:
+        logger.warning(f"⚠️ Loop monitor failed to start (optional): {e}")
+
     # 데이터베이스 연결 초기화
     try:
         from database.sqlite_db import initialize_db
@@ -189,6 +198,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Keyword analysis tables initialization failed: {e}")
 
+    # 여기서부터 띄우는 스케줄러·워치독은 네이버 API 를 BULK 우선순위로 부른다.
+    # contextvar 라 이 lifespan 태스크에서 파생된 cron 태스크에만 상속되고, HTTP 요청
+    # 태스크(기본 INTERACTIVE)는 그대로다 → 사용자 호출이 cron 대기열을 앞지른다.
+    from services.naver_rate_governor import BULK, NORMAL, api_priority, set_default_priority
+    set_default_priority(BULK)
+
     # 자동 백업 스케줄러 시작 (2시간마다 - 리소스 절약)
     if RUN_SCHEDULERS:
         try:
@@ -261,13 +276,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Notification tables initialization failed: {e}")
 
-    # Redis 연결 초기화 (선택적)
-    if settings.REDIS_URL:
-        try:
-            # Redis 연결 코드 (필요 시 구현)
-            logger.info("⚠️ Redis not configured (optional)")
-        except Exception as e:
-            logger.warning(f"⚠️ Redis connection failed (optional): {e}")
+    # 프로세스 간 공유 캐시 (REDIS_URL 이 있으면 Redis, 없으면 /data SQLite-WAL)
+    try:
+        from services.shared_cache import get_backend
+        backend = get_backend()
+        logger.info(f"✅ Shared cache backend: {backend.name if backend else 'off'}")
+    except Exception as e:
+        logger.warning(f"⚠️ Shared cache init failed (optional): {e}")
 
     # Sentry 초기화 (선택적)
     if settings.SENTRY_DSN:
@@ -303,18 +318,31 @@ async def lifespan(app: FastAPI):
 
         # 키워드 판정 STAGE2 워치독 — 사용자 대기형이라 2초 틱(seed-explode 20초와 다름).
         # 기본은 **전용 프로세스**(verdict_worker.py, nice 5)가 돌린다. 여기서 또 돌리면
-        # 두 프로세스가 같은 job 을 다투므로(claim 은 단일 워커 전제) 켜지 않는다.
+        # claim 은 원자적이라 겹쳐도 한 번만 집히지만, 판정 브라우저를 두 프로세스가 띄울
+        # 이유가 없으므로 켜지 않는다.
         # KWV_DEDICATED 가 없으면(로컬·구버전 배포) 예전처럼 이 프로세스가 맡는다.
         if os.environ.get("KWV_DEDICATED") == "1":
             logger.info("↪️ Keyword-verdict watchdog: 전용 프로세스가 담당 (여기선 skip)")
         else:
             try:
                 from services.keyword_verdict_queue import watchdog_loop as kwv_watchdog
-                asyncio.create_task(kwv_watchdog())
+                # 사용자가 결과를 기다리는 작업이라 cron 보다 앞에 선다.
+                with api_priority(NORMAL):
+                    asyncio.create_task(kwv_watchdog())
                 logger.info("✅ Keyword-verdict queue watchdog started (every 2s)")
             except Exception as e:
                 logger.warning(f"⚠️ Keyword-verdict watchdog failed to start: {e}")
 
+    # 스크래핑 브라우저 풀 예열 — 첫 VIEW/BLOG 탭·블로그 통계 요청이 chromium 콜드 기동
+    # (실측 30초대)을 기다리지 않게. 브라우저 1개 + 컨텍스트 1개만 띄우고, 안 쓰이면
+    # 풀의 idle_close 가 닫는다. SCRAPER_POOL_PREWARM=0 이면 첫 요청 때 띄운다.
+    if os.environ.get("SCRAPER_POOL_PREWARM", "1") != "0":
+        try:
+            from services.browser_pool import prewarm
+            asyncio.create_task(prewarm("scraper"))
+        except Exception as e:
+            logger.warning(f"⚠️ Browser pool prewarm failed to start: {e}")
+
     yield
 
     # Shutdown - 빠른 종료 (타임아웃 방지)
@@ -339,6 +367,36 @@ async def lifespan(app: FastAPI):
 
     logger.info("✅ All schedulers stopped")
 
+    try:
+        from services.parse_pool import shutdown_parse_pool
+        shutdown_parse_pool()
+    except Exception as e:
+        logger.warning(f"⚠️ parse pool shutdown issue: {e}")
+
+    try:
+        from services.browser_pool import close_all_pools
+        await close_all_pools()
+    except Exception as e:
+        logger.warning(f"⚠️ browser pool shutdown issue: {e}")
+
+    try:
+        from services.http_clients import close_all
+        await close_all()
+    except Exception as e:
+        logger.warning(f"⚠️ http client shutdown issue: {e}")
+
+    try:
+        from database.async_db import shutdown_executors
+        shutdown_executors()
+    except Exception as e:
+        logger.warning(f"⚠️ async db executor shutdown issue: {e}")
+
+    try:
+        from services.loop_monitor import stop_loop_monitor
+        stop_loop_monitor()
+    except Exception as e:
+        logger.warning(f"⚠️ loop monitor shutdown issue: {e}")
+
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -527,7 +585,7 @@ app.add_middleware(SecurityHeadersMiddleware)
 # 해결: ROLE==app 프로세스는 아래 HEAVY 경로의 POST 를 내부 worker(:8001)로 그대로
 # 프록시하고 worker 의 응답을 즉시 반환. worker(ROLE=worker)는 이 미들웨어가 비활성이라
 # 자기 루프에서 BackgroundTask 실행 → API 루프는 절대 마이닝에 안 막힘. 별도 프로세스라
-# asyncio 루프/세마포어(NAVER_API_GLOBAL_SEMAPHORE) affinity 문제도 없음. 필러 fill 은
+# asyncio 루프 affinity 문제도 없음. 필러 fill 은
 # 그대로 작동(요청은 200 ack 즉시 수신, 무거운 작업은 worker 가 수행).
 #
 # 읽기(GET stats/accounts)·가벼운 저장(seeds/domain-profile)은 목록에서 제외 — API 가
@@ -549,11 +607,11 @@ _WORKER_OFFLOAD_PATHS = frozenset({
     # pool 불변·seed_explode run 0건. 워커는 살아있었다(register 크론 45~90초마다 정상).
     # 핸들러는 add_task 후 즉시 return 이라 정상이면 0.3s 다 → 원인은 워커 uvicorn 루프의
     # 장시간 블로킹(자동완성 마이닝 틱이 계정당 3~4분 점유). restart 로도 안 고쳐진다.
-    # → app 은 services/seed_explode_queue 에 큐 파일만 쓰고 worker 워치독이 집어 실행한다.
+    # → app 은 services/seed_explode_queue 에 적재만 하고 worker 워치독이 집어 실행한다.
     # NOTE: blogs/debug/ceiling-backtest 는 **오프로드 안 함** — 프록시가 8s ReadTimeout 후
     # httpx 를 닫으면 worker 요청이 끊겨 핸들러가 아예 안 돌았다(2026-07-27 실측, 202 만 받고
-    # 무실행). 대신 app 핸들러는 /data 에 요청파일만 쓰고(가벼움) worker 워치독이 claim 해
-    # 실행한다 — 제어는 HTTP, 실행 트리거는 공유 볼륨.
+    # 무실행). 대신 app 핸들러는 /data 의 작업 큐(services/job_queue)에 요청만 쓰고(가벼움)
+    # worker 워치독이 claim 해 실행한다 — 제어는 HTTP, 실행 트리거는 공유 볼륨.
     # NOTE: extension/image-backfill 도 offload 에서 제외 — 워커(nice 19)가 cron 으로 포화되면
     # 이미지 백필(그룹당 조회+생성 2콜)이 CPU 굶음 + cron 과 네이버 API 경쟁으로 breaker 반복
     # OPEN → 후반 그룹 이미지 대량 누락. backfill-creative 와 동일하게 app 프로세스(scheduler
@@ -567,7 +625,7 @@ _WORKER_OFFLOAD_PATHS = frozenset({
     # 패턴(add_task 후 즉시 return)이라 프록시하면 8s ack 만 받고 무실행이 될 수 있다.
     # 대신 배치 크기를 제한하고(limit, 기본 10) 키워드 사이에 2초씩 양보해
     # 이벤트루프를 굶기지 않는다. 상시 대량 생성으로 키우려면 이 방식이 아니라
-    # keyword_verdict_queue 처럼 큐 파일 + worker 워치독으로 옮겨야 한다.
+    # keyword_verdict_queue 처럼 services/job_queue + worker 워치독으로 옮겨야 한다.
 })
 _WORKER_INTERNAL_URL = os.getenv("WORKER_INTERNAL_URL", "http://127.0.0.1:8001")
 _OFFLOAD_ROLE = os.getenv("ROLE", "all")
@@ -719,9 +777,11 @@ async def health_check():
     # 기본 상태 체크
     is_healthy = True
     try:
+        from database.async_db import adb
         from database.sqlite_db import get_sqlite_client
         client = get_sqlite_client()
-        client.execute_query("SELECT 1")
+        # 읽기 스레드에서 — 스케줄러가 같은 DB 에 쓰는 중이어도 루프를 붙잡지 않는다.
+        await adb(client).read.execute_query("SELECT 1")
     except Exception:
         is_healthy = False
 
@@ -254,6 +254,7 @@ async def collect_reports_endpoint(
     ad_detail: bool = Query(True),
     expkeyword: bool = Query(True),
     search_term_top_n: int = Query(3000, ge=100, le=50000),
+    days: int = Query(1, ge=1, le=31, description="date 까지 거슬러 올라가 백필할 일수"),
 ):
     """대량 리포트 수집 — 키워드 10만 계정을 호출 몇 번으로.
 
@@ -283,7 +284,8 @@ async def collect_reports_endpoint(
                 include_keyword_master=keyword_master,
                 include_ad_detail=ad_detail,
                 include_expkeyword=expkeyword,
-                search_term_top_n=search_term_top_n)
+                search_term_top_n=search_term_top_n,
+                days=days)
             r["name"] = a.get("name")
             results.append(r)
         except Exception as e:
@@ -1299,3 +1299,107 @@ async def get_cron_health(admin: dict = Depends(require_admin)):
         "recent_cron_tasks": recent_cron,
         "active_tracked_blogs": active_blogs,
     }
+
+
+@router.get("/caches")
+async def get_cache_stats(admin: dict = Depends(require_admin)):
+    """프로세스 내 캐시(services/memory_cache) 적중/축출 통계 + 공유 백엔드 통계.
+
+    로컬 LRU 는 프로세스(app / worker)마다 따로라서 이 응답은 요청을 받은 app 프로세스
+    기준이다. shared_hits 는 다른 프로세스가 계산해 둔 값을 공유 백엔드에서 받은 횟수.
+    """
+    from services.memory_cache import cache_stats, shared_backend_stats
+    return {"caches": cache_stats(), "shared_backend": shared_backend_stats()}
+
+
+@router.get("/db-pool")
+async def get_db_pool_stats(admin: dict = Depends(require_admin)):
+    """SQLite 연결 풀(database/connection_pool) — DB 파일별 연결 생성·재사용·쿼리 지연.
+
+    요청을 받은 app 프로세스 기준. p50/p95/p99 는 최근 쿼리 표본에서 계산한다.
+    async 는 database/async_db 스레드 풀의 (메서드별) 큐 대기·실행 시간 히스토그램.
+    """
+    from database.async_db import async_db_stats
+    from database.connection_pool import pool_stats
+    return {"databases": pool_stats(), "async": async_db_stats()}
+
+
+@router.get("/naver-rate")
+async def get_naver_rate_stats(admin: dict = Depends(require_admin)):
+    """네이버 검색광고 API 속도 조절기(services/naver_rate_governor) — 계정×묶음 버킷별
+    현재 속도·최근 60초 사용률·우선순위별 처리/대기 수·429 횟수.
+
+    요청을 받은 프로세스 기준. rate < base_rate 면 429 를 받아 늦춰 놓은 상태다.
+    """
+    from services.naver_rate_governor import governor_stats
+    return {"buckets": governor_stats()}
+
+
+@router.get("/keyword-volume")
+async def get_keyword_volume_stats(admin: dict = Depends(require_admin)):
+    """키워드 검색량 창구(services/keyword_volume) — 조회 수·캐시/음수 캐시 적중·
+    /keywordstool 콜 수와 보낸 힌트 수·진행 중 합치기·계정별 레인 대기열.
+
+    요청을 받은 프로세스 기준. hints_sent / calls 가 5 에 가까울수록 배치가 잘 차고 있다.
+    """
+    from services.keyword_volume import volume_stats
+    return volume_stats()
+
+
+@router.get("/http-clients")
+async def get_http_client_stats(admin: dict = Depends(require_admin)):
+    """업스트림별 공용 HTTP 클라이언트(services/http_clients) — 요청 수·새 TCP 연결·TLS
+    핸드셰이크·연결 재사용률.
+
+    요청을 받은 프로세스 기준. reuse_ratio 가 낮으면 keep-alive 가 안 먹고 있는 것이다.
+    """
+    from services.http_clients import client_stats
+    return {"upstreams": client_stats()}
+
+
+@router.get("/serp-readiness")
+async def get_serp_readiness_stats(limit: int = 50, admin: dict = Depends(require_admin)):
+    """VIEW/BLOG 탭 SERP 준비 판정(services/serp_readiness) — 탭별 평균 이동·대기·추출
+    시간과 스크롤 라운드, 최근 키워드별 기록(멈춘 이유·더보기 클릭·결과 수).
+
+    요청을 받은 프로세스 기준(최근 500건). stop_reason 이 empty/stalled 로 몰리면
+    limit 에 못 미친 채 멈추고 있는 것이다.
+    """
+    from services.serp_readiness import recent_stats, summary
+    return {"summary": summary(), "recent": recent_stats(limit)}
+
+
+@router.get("/browser-pools")
+async def get_browser_pool_stats(admin: dict = Depends(require_admin)):
+    """Playwright 브라우저 풀(services/browser_pool) — 풀별 대여·대기·타임아웃·기동·교체 수,
+    살아 있는 브라우저별 컨텍스트·대여 중·처리 페이지·RSS.
+
+    this 는 요청을 받은 프로세스, processes 는 각 프로세스(app·worker·verdict)의 풀이
+    공유 캐시에 30초마다 올린 통계다. 판정 풀은 verdict 프로세스에만 있다.
+    """
+    from services.browser_pool import pool_stats, published_pool_stats
+    return {"this": pool_stats(), "processes": published_pool_stats()}
+
+
+@router.get("/job-queues")
+async def get_job_queue_stats(admin: dict = Depends(require_admin)):
+    """작업 큐(services/job_queue) — 큐별 상태 개수·깊이·가장 오래 기다린 job·
+    적재→시작 지연(p50/p95, 최근 1시간)·리스 만료(좀비)·워커 마지막 틱.
+
+    큐 테이블은 app·worker 가 공유하므로 어느 프로세스가 받아도 같은 값이다.
+    """
+    from services import ceiling_backtest, keyword_verdict_queue, seed_explode_queue  # noqa: F401 — 큐 등록
+    from services.job_queue import queue_stats
+    return {"queues": queue_stats()}
+
+
+@router.get("/loop-health")
+async def get_loop_health(top: int = 20, admin: dict = Depends(require_admin)):
+    """이벤트 루프 건강(services/loop_monitor) — 루프 지연 p50/p90/p99·정체 횟수,
+    막은 호출 지점 상위(막힌 시간 순, 예시 스택 포함)·APScheduler job 별 정체·최근 정체.
+
+    this 는 요청을 받은 프로세스, processes 는 각 프로세스(app·worker·verdict)가 공유
+    캐시에 15초마다 올린 요약이다. worker 루프가 막혀 있어도 감시 스레드가 올린다.
+    """
+    from services.loop_monitor import loop_stats, process_snapshots
+    return {"this": loop_stats(top=top), "processes": process_snapshots()}
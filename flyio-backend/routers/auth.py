@@ -8,8 +8,10 @@ from typing import Optional
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+import asyncio
 import logging
 
+from database.async_db import adb
 from database.user_db import get_user_db
 from config import get_settings
 
@@ -94,7 +96,7 @@ async def get_current_user_optional(token: Optional[str] = Depends(oauth2_scheme
         return None
 
     user_db = get_user_db()
-    user = user_db.get_user_by_id(int(user_id))
+    user = await adb(user_db).get_user_by_id(int(user_id))
     if user is None or not user.get("is_active"):
         return None
 
@@ -125,7 +127,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
         raise credentials_exception
 
     user_db = get_user_db()
-    user = user_db.get_user_by_id(int(user_id))
+    user = await adb(user_db).get_user_by_id(int(user_id))
     if user is None:
         logger.warning(f"User not found for id: {user_id}")
         raise credentials_exception
@@ -225,7 +227,7 @@ async def login(request: LoginRequest):
     email = request.email.lower().strip()
 
     # Get user
-    user = user_db.get_user_by_email(email)
+    user = await adb(user_db).get_user_by_email(email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -234,7 +236,8 @@ async def login(request: LoginRequest):
         )
 
     # Verify password
-    if not verify_password(request.password, user["hashed_password"]):
+    # bcrypt 검증은 수십~수백 ms CPU — 루프 밖에서 돌려 다른 요청을 막지 않는다.
+    if not await asyncio.to_thread(verify_password, request.password, user["hashed_password"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="비밀번호가 올바르지 않습니다. 다시 확인해주세요.",
@@ -328,7 +331,7 @@ async def make_first_admin(email: str):
             )
 
     # 사용자 찾기
-    user = user_db.get_user_by_email(email)
+    user = await adb(user_db).get_user_by_email(email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
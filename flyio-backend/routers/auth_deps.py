@@ -8,6 +8,7 @@ from typing import Optional
 from jose import JWTError, jwt
 import logging
 
+from database.async_db import adb
 from database.user_db import get_user_db
 from config import get_settings
 
@@ -40,7 +41,7 @@ async def get_current_user(token: Optional[str] = Depends(oauth2_scheme)) -> dic
         raise credentials_exception
 
     user_db = get_user_db()
-    user = user_db.get_user_by_id(int(user_id))
+    user = await adb(user_db).get_user_by_id(int(user_id))
     if user is None:
         raise credentials_exception
     if not user.get("is_active"):
@@ -66,7 +67,7 @@ async def get_current_user_optional(token: Optional[str] = Depends(oauth2_scheme
         return None
 
     user_db = get_user_db()
-    user = user_db.get_user_by_id(int(user_id))
+    user = await adb(user_db).get_user_by_id(int(user_id))
     if user is None or not user.get("is_active"):
         return None
 
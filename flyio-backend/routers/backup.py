@@ -2,9 +2,11 @@
 Backup management API endpoints
 백업 관리 API 엔드포인트
 """
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import logging
 
 from services.backup_service import (
@@ -27,6 +29,9 @@ class BackupInfo(BaseModel):
     path: str
     size_mb: float
     created_at: str
+    kind: str = "full"                      # incremental | full(예전 backup_*.db)
+    databases: Optional[List[str]] = None   # 증분 스냅샷에 든 DB (DATA_ROOT 기준)
+    logical_mb: Optional[float] = None      # 증분 스냅샷이 복원할 DB 합계 크기
 
 
 class BackupStatusResponse(BaseModel):
@@ -38,6 +43,7 @@ class BackupStatusResponse(BaseModel):
     interval_hours: float
     disk_free_mb: Optional[float] = None
     json_backup_count: Optional[int] = None
+    incremental: Optional[Dict[str, Any]] = None
 
 
 class BackupResponse(BaseModel):
@@ -83,10 +89,11 @@ async def list_backups():
 async def create_manual_backup():
     """
     수동 백업 생성
-    - 즉시 백업 생성
+    - 즉시 증분 스냅샷 생성 (path 는 스냅샷 id)
     """
     try:
-        path = create_backup()
+        # 증분 스냅샷은 단계마다 쉬어 가며 읽는다 — 이벤트 루프 밖에서
+        path = await asyncio.to_thread(create_backup)
         if path:
             return BackupResponse(
                 success=True,
@@ -132,11 +139,11 @@ async def export_json_backup():
 async def restore_backup(filename: str):
     """
     백업에서 복원
-    - 지정된 백업 파일에서 데이터베이스 복원
+    - 증분 스냅샷 id 또는 예전 backup_*.db 파일명
     - 복원 전 현재 상태 백업
     """
     try:
-        success = restore_from_backup(filename)
+        success = await asyncio.to_thread(restore_from_backup, filename)
         if success:
             return BackupResponse(
                 success=True,
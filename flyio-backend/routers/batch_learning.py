@@ -441,8 +441,8 @@ async def expand_keywords_with_related(base_keywords: List[str], target_count: i
     - 키워드 조합으로 추가 확장 (예: "강남" + "맛집" → "강남역맛집", "강남점심맛집" 등)
     - 이미 분석한 키워드 제외
     """
-    import httpx
     import urllib.parse
+    from services.http_clients import get_client
     global analyzed_keywords_history
 
     expanded = set(base_keywords)
@@ -473,44 +473,44 @@ async def expand_keywords_with_related(base_keywords: List[str], target_count: i
 
     # 2단계: 네이버 자동완성 API로 추가 확장
     if len(expanded) < target_count:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            keywords_to_expand = list(base_keywords)[:200]
-            round_num = 1
-
-            while len(expanded) < target_count and keywords_to_expand and round_num <= 10:
-                logger.info(f"API expansion round {round_num}: {len(expanded)} keywords")
-                new_keywords = []
-
-                for keyword in keywords_to_expand:
-                    if keyword in processed:
-                        continue
-                    if len(expanded) >= target_count:
-                        break
-
-                    processed.add(keyword)
-
-                    try:
-                        encoded_kw = urllib.parse.quote(keyword)
-                        url = f"https://ac.search.naver.com/nx/ac?q={encoded_kw}&con=1&frm=nv&ans=2&r_format=json&r_enc=UTF-8&r_unicode=0&t_koreng=1&run=2&rev=4&q_enc=UTF-8"
-                        resp = await client.get(url)
-                        if resp.status_code == 200:
-                            data = resp.json()
-                            items = data.get("items", [[]])
-                            if items and len(items) > 0:
-                                for item in items[0][:10]:
-                                    if isinstance(item, list) and len(item) > 0:
-                                        new_kw = item[0]
-                                        if new_kw not in expanded and new_kw not in processed:
-                                            expanded.add(new_kw)
-                                            new_keywords.append(new_kw)
-
-                        await asyncio.sleep(0.02)  # 20ms 딜레이
-
-                    except Exception as e:
-                        logger.warning(f"API error for {keyword}: {e}")
-
-                keywords_to_expand = new_keywords[:300]
-                round_num += 1
+        client = get_client("ac")
+        keywords_to_expand = list(base_keywords)[:200]
+        round_num = 1
+
+        while len(expanded) < target_count and keywords_to_expand and round_num <= 10:
+            logger.info(f"API expansion round {round_num}: {len(expanded)} keywords")
+            new_keywords = []
+
+            for keyword in keywords_to_expand:
+                if keyword in processed:
+                    continue
+                if len(expanded) >= target_count:
+                    break
+
+                processed.add(keyword)
+
+                try:
+                    encoded_kw = urllib.parse.quote(keyword)
+                    url = f"https://ac.search.naver.com/nx/ac?q={encoded_kw}&con=1&frm=nv&ans=2&r_format=json&r_enc=UTF-8&r_unicode=0&t_koreng=1&run=2&rev=4&q_enc=UTF-8"
+                    resp = await client.get(url)
+                    if resp.status_code == 200:
+                        data = resp.json()
+                        items = data.get("items", [[]])
+                        if items and len(items) > 0:
+                            for item in items[0][:10]:
+                                if isinstance(item, list) and len(item) > 0:
+                                    new_kw = item[0]
+                                    if new_kw not in expanded and new_kw not in processed:
+                                        expanded.add(new_kw)
+                                        new_keywords.append(new_kw)
+
+                    await asyncio.sleep(0.02)  # 20ms 딜레이
+
+                except Exception as e:
+                    logger.warning(f"API error for {keyword}: {e}")
+
+            keywords_to_expand = new_keywords[:300]
+            round_num += 1
 
     logger.info(f"After API expansion: {len(expanded)} keywords")
 
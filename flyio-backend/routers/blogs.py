@@ -17,12 +17,21 @@ import asyncio
 from bs4 import BeautifulSoup
 
 from config import settings
+from database.async_db import adb, run_db
+from database.learning_db import DATABASE_PATH as LEARNING_DB_PATH
 from database.learning_db import add_learning_sample, get_current_weights, save_current_weights, get_learning_samples
 from services.category_weights import detect_keyword_category, get_category_weights, merge_weights_with_category, get_category_optimization_tips, resolve_scoring_weights
+from database.keyword_analysis_db import DB_PATH as KEYWORD_ANALYSIS_DB_PATH
 from database.keyword_analysis_db import get_cached_related_keywords, cache_related_keywords
 from services.learning_engine import train_model, calculate_blog_score
 from database.blog_percentile_db import get_blog_percentile_db
 from services.blog_analyzer import get_blog_level_from_score
+from services.memory_cache import get_cache
+from services.html_select import parse_html, select, select_one, text_of
+from services.http_clients import get_client
+from services.parse_pool import run_parse
+from services import post_features as PF
+from services import rss_feed
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -37,29 +46,32 @@ class _LevelJudgementSkipped(Exception):
 GLOBAL_SEMAPHORE = asyncio.Semaphore(80)  # 전체 동시 요청 최대 80개 (50 → 80 성능 개선)
 
 # ===== 전역 HTTP 클라이언트 (연결 풀링으로 성능 개선) =====
-# 매 요청마다 새 연결 대신 재사용하여 TCP 핸드셰이크 오버헤드 제거
-_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+# 매 요청마다 새 연결 대신 재사용하여 TCP 핸드셰이크 오버헤드 제거.
+# 업스트림별 풀(blog / search / searchad / ac …)은 services/http_clients 가 들고 있다.
 
 async def get_http_client() -> httpx.AsyncClient:
-    """전역 HTTP 클라이언트 반환 (싱글톤 패턴)"""
-    global _HTTP_CLIENT
-    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
-        _HTTP_CLIENT = httpx.AsyncClient(
-            timeout=httpx.Timeout(15.0, connect=5.0),  # 연결 5초, 전체 15초
-            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
-            follow_redirects=True,
-            http2=True  # HTTP/2 지원으로 멀티플렉싱 활용
-        )
-    return _HTTP_CLIENT
+    """전역 HTTP 클라이언트 반환 — services/http_clients 의 "default" 업스트림."""
+    return get_client("default")
+
+# ===== 프로세스 내 캐시 (services/memory_cache: O(1) LRU + TTL + 바이트 상한) =====
+# 예전 dict 캐시는 100/200개를 넘으면 전 키를 정렬해 절반을 지웠다(요청 경로 O(n log n),
+# 버스트 때 적중률 붕괴). 이제 가장 오래 안 쓴 항목부터 하나씩 밀어낸다.
+# shared= 가 붙은 캐시는 services/shared_cache 백엔드(/data SQLite-WAL 또는 Redis)에도
+# 기록돼 app·worker·verdict_worker 프로세스가 서로 계산한 결과를 재사용한다.
+# 통계는 /api/admin/caches.
 
 # ===== 검색 결과 캐시 (키워드별) =====
-SEARCH_RESULTS_CACHE: Dict[str, Dict] = {}
 SEARCH_CACHE_TTL = 300  # 5분 (검색 결과는 짧게 캐싱)
+SEARCH_RESULTS_CACHE = get_cache("search_results", max_entries=200,
+                                 max_bytes=8 * 1024 * 1024, ttl=SEARCH_CACHE_TTL,
+                                 shared="search_results")
 
 # ===== 블로그 분석 캐시 (성능 개선) =====
 # TTL: 1시간 (메모리 사용량 감소)
-BLOG_ANALYSIS_CACHE: Dict[str, Dict] = {}
 BLOG_CACHE_TTL = 3600  # 1시간 (4시간 → 1시간 메모리 절약)
+BLOG_ANALYSIS_CACHE = get_cache("blog_analysis", max_entries=200,
+                                max_bytes=16 * 1024 * 1024, ttl=BLOG_CACHE_TTL,
+                                shared="blog_analysis")
 
 # 콘텐츠 지표(총점 가중치 50%)를 재는 표본 크기.
 # 글 단위 캐시가 생겨 "성능 제약" 이 사라졌으므로 3 → 15 로 올린다.
@@ -67,86 +79,48 @@ BLOG_CACHE_TTL = 3600  # 1시간 (4시간 → 1시간 메모리 절약)
 FULLPARSE_SAMPLE_SIZE = 15
 
 
-def get_cached_blog_analysis(blog_id: str) -> Optional[Dict]:
+async def get_cached_blog_analysis(blog_id: str) -> Optional[Dict]:
     """캐시된 블로그 분석 결과 조회"""
-    if blog_id in BLOG_ANALYSIS_CACHE:
-        cached = BLOG_ANALYSIS_CACHE[blog_id]
-        if time.time() - cached["timestamp"] < BLOG_CACHE_TTL:
-            return cached["data"]
-        else:
-            del BLOG_ANALYSIS_CACHE[blog_id]
-    return None
+    return await BLOG_ANALYSIS_CACHE.aget(blog_id)
 
-def set_blog_analysis_cache(blog_id: str, data: Dict):
+async def set_blog_analysis_cache(blog_id: str, data: Dict):
     """블로그 분석 결과 캐시 저장"""
-    # 캐시 크기 제한 (100개) - 메모리 사용량 감소
-    if len(BLOG_ANALYSIS_CACHE) > 100:
-        # 가장 오래된 항목들 삭제
-        sorted_keys = sorted(BLOG_ANALYSIS_CACHE.keys(),
-                            key=lambda k: BLOG_ANALYSIS_CACHE[k]["timestamp"])
-        for key in sorted_keys[:50]:
-            del BLOG_ANALYSIS_CACHE[key]
-
-    BLOG_ANALYSIS_CACHE[blog_id] = {
-        "data": data,
-        "timestamp": time.time()
-    }
+    await BLOG_ANALYSIS_CACHE.aset(blog_id, data)
 
-def get_cached_search_results(keyword: str) -> Optional[Dict]:
+async def get_cached_search_results(keyword: str) -> Optional[Dict]:
     """캐시된 검색 결과 조회"""
-    cache_key = keyword.lower().strip()
-    if cache_key in SEARCH_RESULTS_CACHE:
-        cached = SEARCH_RESULTS_CACHE[cache_key]
-        if time.time() - cached["timestamp"] < SEARCH_CACHE_TTL:
-            logger.debug(f"Search cache hit for: {keyword}")
-            return cached["data"]
-        else:
-            del SEARCH_RESULTS_CACHE[cache_key]
-    return None
+    cached = await SEARCH_RESULTS_CACHE.aget(keyword.lower().strip())
+    if cached is not None:
+        logger.debug(f"Search cache hit for: {keyword}")
+    return cached
 
-def set_search_results_cache(keyword: str, data: Dict):
+async def set_search_results_cache(keyword: str, data: Dict):
     """검색 결과 캐시 저장"""
-    cache_key = keyword.lower().strip()
-    # 캐시 크기 제한 (100개) - 메모리 사용량 감소
-    if len(SEARCH_RESULTS_CACHE) > 100:
-        sorted_keys = sorted(SEARCH_RESULTS_CACHE.keys(),
-                            key=lambda k: SEARCH_RESULTS_CACHE[k]["timestamp"])
-        for key in sorted_keys[:50]:
-            del SEARCH_RESULTS_CACHE[key]
-
-    SEARCH_RESULTS_CACHE[cache_key] = {
-        "data": data,
-        "timestamp": time.time()
-    }
+    await SEARCH_RESULTS_CACHE.aset(keyword.lower().strip(), data)
 
 
 # ===== 인덱스 검증 결과 캐시 =====
 # 실제 검색 호출이 포함되므로 24h TTL — 같은 블로그 반복 검증 방지
-VERIFY_INDEX_CACHE: Dict[str, Dict] = {}
 VERIFY_INDEX_CACHE_TTL = 86400  # 24시간
+VERIFY_INDEX_CACHE = get_cache("verify_index", max_entries=400,
+                               max_bytes=8 * 1024 * 1024, ttl=VERIFY_INDEX_CACHE_TTL,
+                               shared="verify_index")
 
 
-def get_cached_verify_index(blog_id: str) -> Optional[Dict]:
-    cached = VERIFY_INDEX_CACHE.get(blog_id)
-    if cached and time.time() - cached["timestamp"] < VERIFY_INDEX_CACHE_TTL:
-        return cached["data"]
-    if cached:
-        del VERIFY_INDEX_CACHE[blog_id]
-    return None
+async def get_cached_verify_index(blog_id: str) -> Optional[Dict]:
+    return await VERIFY_INDEX_CACHE.aget(blog_id)
 
 
-def set_verify_index_cache(blog_id: str, data: Dict):
-    if len(VERIFY_INDEX_CACHE) > 200:
-        sorted_keys = sorted(VERIFY_INDEX_CACHE.keys(),
-                             key=lambda k: VERIFY_INDEX_CACHE[k]["timestamp"])
-        for key in sorted_keys[:100]:
-            del VERIFY_INDEX_CACHE[key]
-    VERIFY_INDEX_CACHE[blog_id] = {"data": data, "timestamp": time.time()}
+async def set_verify_index_cache(blog_id: str, data: Dict):
+    await VERIFY_INDEX_CACHE.aset(blog_id, data)
 
 
 # ===== 크롬 확장 프로그램 결과 저장소 (메모리 캐시) =====
-EXTENSION_RESULTS_CACHE: Dict[str, Dict] = {}
+# 값: {"data": {...}, "source": "..."}
 EXTENSION_CACHE_TTL = 600  # 10분
+EXTENSION_RESULTS_CACHE = get_cache("extension_results", max_entries=200,
+                                    max_bytes=4 * 1024 * 1024, ttl=EXTENSION_CACHE_TTL,
+                                    shared="extension_results")
 
 
 class ExtensionResultsRequest(BaseModel):
@@ -201,17 +175,16 @@ async def receive_extension_results(request: ExtensionResultsRequest):
             })
 
         # 캐시에 저장
-        EXTENSION_RESULTS_CACHE[keyword] = {
+        await EXTENSION_RESULTS_CACHE.aset(keyword, {
             "data": {
                 "view_results": normalized_blogs,
                 "blog_results": normalized_blogs
             },
-            "timestamp": time.time(),
             "source": request.source
-        }
+        })
 
         # 메인 검색 캐시에도 저장 (다른 요청에서 활용)
-        set_search_results_cache(request.keyword, {
+        await set_search_results_cache(request.keyword, {
             "view_results": normalized_blogs,
             "blog_results": normalized_blogs
         })
@@ -241,16 +214,15 @@ async def get_extension_results(keyword: str):
     """크롬 확장 프로그램으로 수집된 결과 조회"""
     cache_key = keyword.strip().lower()
 
-    if cache_key in EXTENSION_RESULTS_CACHE:
-        cached = EXTENSION_RESULTS_CACHE[cache_key]
-        if time.time() - cached["timestamp"] < EXTENSION_CACHE_TTL:
-            return {
-                "success": True,
-                "keyword": keyword,
-                "data": cached["data"],
-                "source": cached.get("source", "extension"),
-                "cached": True
-            }
+    cached = await EXTENSION_RESULTS_CACHE.aget(cache_key)
+    if cached is not None:
+        return {
+            "success": True,
+            "keyword": keyword,
+            "data": cached["data"],
+            "source": cached.get("source", "extension"),
+            "cached": True
+        }
 
     return {
         "success": False,
@@ -821,16 +793,15 @@ async def fetch_naver_search_results_both_tabs(keyword: str, limit: int = 10) ->
     """
     # 0단계: 크롬 확장 프로그램 결과 확인 (가장 정확)
     cache_key = keyword.strip().lower()
-    if cache_key in EXTENSION_RESULTS_CACHE:
-        ext_cached = EXTENSION_RESULTS_CACHE[cache_key]
-        if time.time() - ext_cached["timestamp"] < EXTENSION_CACHE_TTL:
-            ext_data = ext_cached["data"]
-            if len(ext_data.get("blog_results", [])) >= limit:
-                logger.info(f"[EXTENSION] Using extension results for '{keyword}': {len(ext_data['blog_results'])} blogs (순위 정확도: 100%)")
-                return ext_data
+    ext_cached = await EXTENSION_RESULTS_CACHE.aget(cache_key)
+    if ext_cached is not None:
+        ext_data = ext_cached["data"]
+        if len(ext_data.get("blog_results", [])) >= limit:
+            logger.info(f"[EXTENSION] Using extension results for '{keyword}': {len(ext_data['blog_results'])} blogs (순위 정확도: 100%)")
+            return ext_data
 
     # 캐시 확인 (성능 개선 - 5분 TTL)
-    cached = get_cached_search_results(keyword)
+    cached = await get_cached_search_results(keyword)
     if cached:
         return cached
 
@@ -923,7 +894,7 @@ async def fetch_naver_search_results_both_tabs(keyword: str, limit: int = 10) ->
 
         # 결과가 있으면 캐시에 저장 (성능 개선)
         if view_results or blog_results:
-            set_search_results_cache(keyword, result)
+            await set_search_results_cache(keyword, result)
 
         return result
 
@@ -1134,11 +1105,11 @@ async def fetch_via_http_only(keyword: str, limit: int) -> List[Dict]:
 
                 if response.status_code == 200:
                     html_text = response.text
-                    soup = BeautifulSoup(html_text, 'html.parser')
+                    doc = parse_html(html_text)
 
                     # DOM 기반 순서대로 추출 (정규식보다 정확)
                     # 검색 결과 컨테이너 선택
-                    result_containers = soup.select('#main_pack .api_subject_bx, #main_pack .sp_blog .bx, .total_wrap .total_area')
+                    result_containers = select(doc, '#main_pack .api_subject_bx, #main_pack .sp_blog .bx, .total_wrap .total_area')
 
                     page_added = 0
                     for container in result_containers:
@@ -1146,7 +1117,7 @@ async def fetch_via_http_only(keyword: str, limit: int) -> List[Dict]:
                             break
 
                         # 컨테이너 내 블로그 링크 찾기
-                        links = container.select('a[href*="blog.naver.com"]')
+                        links = select(container, 'a[href*="blog.naver.com"]')
                         for link in links:
                             href = link.get('href', '')
                             match = re.search(r'blog\.naver\.com/([\w-]+)/(\d+)', href)
@@ -1163,17 +1134,17 @@ async def fetch_via_http_only(keyword: str, limit: int) -> List[Dict]:
 
                             # 제목 추출
                             title = ""
-                            title_el = container.select_one('.api_txt_lines.total_tit, .title_link, .title, strong.tit')
-                            if title_el:
-                                title = title_el.get_text(strip=True)
+                            title_el = select_one(container, '.api_txt_lines.total_tit, .title_link, .title, strong.tit')
+                            if title_el is not None:
+                                title = text_of(title_el)
                             if not title:
-                                title = link.get_text(strip=True) or f"포스팅 #{post_id}"
+                                title = text_of(link) or f"포스팅 #{post_id}"
 
                             # 블로그 이름 추출
                             blog_name = blog_id
-                            name_el = container.select_one('.sub_txt.sub_name, .name, .blog_name')
-                            if name_el:
-                                blog_name = name_el.get_text(strip=True) or blog_id
+                            name_el = select_one(container, '.sub_txt.sub_name, .name, .blog_name')
+                            if name_el is not None:
+                                blog_name = text_of(name_el) or blog_id
 
                             # 순위: 페이지 기반 계산
                             source_rank = start_index + page_added
@@ -1260,139 +1231,139 @@ async def fetch_via_view_tab_scraping_http(keyword: str, limit: int) -> List[Dic
         encoded_keyword = quote(keyword)
         search_url = f"https://search.naver.com/search.naver?where=view&query={encoded_keyword}"
 
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.get(search_url, headers=headers)
+        client = get_client("search")
+        response = await client.get(search_url, headers=headers)
 
-            if response.status_code == 200:
-                html_text = response.text
-                # 단순 패턴으로 더 많은 URL 찾기
-                post_url_pattern = re.compile(r'blog\.naver\.com/(\w+)/(\d+)')
-                matches = post_url_pattern.findall(html_text)
+        if response.status_code == 200:
+            html_text = response.text
+            # 단순 패턴으로 더 많은 URL 찾기
+            post_url_pattern = re.compile(r'blog\.naver\.com/(\w+)/(\d+)')
+            matches = post_url_pattern.findall(html_text)
 
-                seen_urls = set()
-                rank = 0
+            seen_urls = set()
+            rank = 0
 
-                for match in matches:
-                    if rank >= limit:
-                        break
+            for match in matches:
+                if rank >= limit:
+                    break
 
-                    blog_id = match[0]
-                    post_id = match[1]
-                    post_url = f"https://blog.naver.com/{blog_id}/{post_id}"
+                blog_id = match[0]
+                post_id = match[1]
+                post_url = f"https://blog.naver.com/{blog_id}/{post_id}"
 
-                    if post_url in seen_urls:
-                        continue
-                    seen_urls.add(post_url)
+                if post_url in seen_urls:
+                    continue
+                seen_urls.add(post_url)
 
-                    rank += 1
-                    results.append({
-                        "rank": rank,
-                        "blog_id": blog_id,
-                        "blog_name": blog_id,
-                        "blog_url": f"https://blog.naver.com/{blog_id}",
-                        "post_title": f"포스팅 #{post_id}",
-                        "post_url": post_url,
-                        "post_date": None,
-                        "thumbnail": None,
-                        "tab_type": "VIEW",
-                        "smart_block_keyword": keyword,
-                    })
+                rank += 1
+                results.append({
+                    "rank": rank,
+                    "blog_id": blog_id,
+                    "blog_name": blog_id,
+                    "blog_url": f"https://blog.naver.com/{blog_id}",
+                    "post_title": f"포스팅 #{post_id}",
+                    "post_url": post_url,
+                    "post_date": None,
+                    "thumbnail": None,
+                    "tab_type": "VIEW",
+                    "smart_block_keyword": keyword,
+                })
 
-                return results
+            return results
 
-                soup = BeautifulSoup(html_text, 'html.parser')
+            soup = BeautifulSoup(html_text, 'html.parser')
 
-                # VIEW 탭 검색 결과 파싱
-                # 방법 1: view_wrap 또는 total_wrap 클래스
-                blog_items = soup.select('.view_wrap') or soup.select('.total_wrap')
+            # VIEW 탭 검색 결과 파싱
+            # 방법 1: view_wrap 또는 total_wrap 클래스
+            blog_items = soup.select('.view_wrap') or soup.select('.total_wrap')
 
-                if not blog_items:
-                    # 방법 2: api_txt_lines 클래스 (블로그 링크 포함)
-                    blog_items = soup.select('.api_txt_lines.total_tit')
+            if not blog_items:
+                # 방법 2: api_txt_lines 클래스 (블로그 링크 포함)
+                blog_items = soup.select('.api_txt_lines.total_tit')
 
-                if not blog_items:
-                    # 방법 3: 직접 블로그 링크 찾기
-                    blog_items = soup.select('a[href*="blog.naver.com"]')
+            if not blog_items:
+                # 방법 3: 직접 블로그 링크 찾기
+                blog_items = soup.select('a[href*="blog.naver.com"]')
 
-                logger.info(f"VIEW tab scraping found {len(blog_items)} items for: {keyword}")
+            logger.info(f"VIEW tab scraping found {len(blog_items)} items for: {keyword}")
 
-                rank = 0
-                seen_urls = set()
+            rank = 0
+            seen_urls = set()
 
-                for item in blog_items:
-                    if rank >= limit:
-                        break
+            for item in blog_items:
+                if rank >= limit:
+                    break
 
-                    try:
-                        # 포스트 URL 추출
-                        post_link = None
-                        if item.name == 'a':
-                            post_link = item
-                        else:
-                            # title_link 또는 다른 링크 찾기
-                            post_link = item.select_one('a.title_link') or item.select_one('a.api_txt_lines') or item.select_one('a[href*="blog.naver.com"]')
+                try:
+                    # 포스트 URL 추출
+                    post_link = None
+                    if item.name == 'a':
+                        post_link = item
+                    else:
+                        # title_link 또는 다른 링크 찾기
+                        post_link = item.select_one('a.title_link') or item.select_one('a.api_txt_lines') or item.select_one('a[href*="blog.naver.com"]')
 
-                        if not post_link:
-                            continue
+                    if not post_link:
+                        continue
 
-                        post_url = post_link.get('href', '')
-                        if not post_url or 'blog.naver.com' not in post_url:
-                            continue
+                    post_url = post_link.get('href', '')
+                    if not post_url or 'blog.naver.com' not in post_url:
+                        continue
 
-                        # 중복 제거
-                        if post_url in seen_urls:
-                            continue
-                        seen_urls.add(post_url)
+                    # 중복 제거
+                    if post_url in seen_urls:
+                        continue
+                    seen_urls.add(post_url)
 
-                        # 블로그 ID 추출
-                        blog_id = extract_blog_id(post_url)
-                        if not blog_id:
-                            continue
+                    # 블로그 ID 추출
+                    blog_id = extract_blog_id(post_url)
+                    if not blog_id:
+                        continue
 
-                        # 제목 추출
-                        title = post_link.get_text(strip=True)
-                        if not title:
-                            title_elem = item.select_one('.title_link') or item.select_one('.api_txt_lines')
-                            if title_elem:
-                                title = title_elem.get_text(strip=True)
+                    # 제목 추출
+                    title = post_link.get_text(strip=True)
+                    if not title:
+                        title_elem = item.select_one('.title_link') or item.select_one('.api_txt_lines')
+                        if title_elem:
+                            title = title_elem.get_text(strip=True)
+
+                    # HTML 태그 제거
+                    title = re.sub(r'<[^>]+>', '', title) if title else ""
+                    title = title.replace("&quot;", '"').replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">")
+
+                    # 블로거 이름 추출
+                    blog_name = blog_id
+                    name_elem = item.select_one('.name') or item.select_one('.sub_txt') or item.select_one('.user_info')
+                    if name_elem:
+                        blog_name = name_elem.get_text(strip=True).split('·')[0].strip()
+                        if not blog_name:
+                            blog_name = blog_id
 
-                        # HTML 태그 제거
-                        title = re.sub(r'<[^>]+>', '', title) if title else ""
-                        title = title.replace("&quot;", '"').replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">")
+                    # 날짜 추출
+                    post_date = None
+                    date_elem = item.select_one('.sub_time') or item.select_one('.date')
+                    if date_elem:
+                        post_date = date_elem.get_text(strip=True)
 
-                        # 블로거 이름 추출
-                        blog_name = blog_id
-                        name_elem = item.select_one('.name') or item.select_one('.sub_txt') or item.select_one('.user_info')
-                        if name_elem:
-                            blog_name = name_elem.get_text(strip=True).split('·')[0].strip()
-                            if not blog_name:
-                                blog_name = blog_id
-
-                        # 날짜 추출
-                        post_date = None
-                        date_elem = item.select_one('.sub_time') or item.select_one('.date')
-                        if date_elem:
-                            post_date = date_elem.get_text(strip=True)
-
-                        rank += 1
-                        results.append({
-                            "rank": rank,
-                            "blog_id": blog_id,
-                            "blog_name": blog_name,
-                            "blog_url": f"https://blog.naver.com/{blog_id}",
-                            "post_title": title if title else f"Post by {blog_name}",
-                            "post_url": post_url,
-                            "post_date": post_date,
-                            "thumbnail": None,
-                            "tab_type": "VIEW",  # VIEW 탭으로 표시
-                            "smart_block_keyword": keyword,
-                        })
+                    rank += 1
+                    results.append({
+                        "rank": rank,
+                        "blog_id": blog_id,
+                        "blog_name": blog_name,
+                        "blog_url": f"https://blog.naver.com/{blog_id}",
+                        "post_title": title if title else f"Post by {blog_name}",
+                        "post_url": post_url,
+                        "post_date": post_date,
+                        "thumbnail": None,
+                        "tab_type": "VIEW",  # VIEW 탭으로 표시
+                        "smart_block_keyword": keyword,
+                    })
 
-                    except Exception as e:
-                        logger.debug(f"Error parsing VIEW item: {e}")
-                        continue
+                except Exception as e:
+                    logger.debug(f"Error parsing VIEW item: {e}")
+                    continue
 
-                logger.info(f"VIEW tab scraping returned {len(results)} results for: {keyword}")
+            logger.info(f"VIEW tab scraping returned {len(results)} results for: {keyword}")
 
     except Exception as e:
         logger.error(f"Error with VIEW tab scraping: {e}")
@@ -1727,76 +1698,76 @@ async def fetch_display_ranks(keyword: str, blog_results: List[Dict]) -> Dict[st
         encoded_keyword = keyword.replace(' ', '+')
         search_url = f"https://search.naver.com/search.naver?where=blog&query={encoded_keyword}"
 
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-            response = await client.get(search_url, headers=headers)
+        client = get_client("search")
+        response = await client.get(search_url, headers=headers)
 
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+        if response.status_code == 200:
+            soup = BeautifulSoup(response.text, 'html.parser')
 
-                # 검색 결과 컨테이너에서 모든 콘텐츠 블록 찾기
-                # 네이버 블로그 검색 결과는 .api_txt_lines (블로그 포스트) 및 기타 섹션으로 구성
+            # 검색 결과 컨테이너에서 모든 콘텐츠 블록 찾기
+            # 네이버 블로그 검색 결과는 .api_txt_lines (블로그 포스트) 및 기타 섹션으로 구성
 
-                display_rank = 0
-                multimedia_count = 0
-                found_posts = {}  # post_url -> display_rank
+            display_rank = 0
+            multimedia_count = 0
+            found_posts = {}  # post_url -> display_rank
 
-                # 검색 결과 영역 찾기 (다양한 셀렉터 시도)
-                result_area = soup.find('div', {'id': 'main_pack'}) or soup.find('div', {'class': 'content_root'})
+            # 검색 결과 영역 찾기 (다양한 셀렉터 시도)
+            result_area = soup.find('div', {'id': 'main_pack'}) or soup.find('div', {'class': 'content_root'})
 
-                if result_area:
-                    # 모든 검색 결과 항목을 순서대로 순회
-                    # 블로그 포스트 링크들
-                    all_items = result_area.find_all(['li', 'div'], recursive=True)
+            if result_area:
+                # 모든 검색 결과 항목을 순서대로 순회
+                # 블로그 포스트 링크들
+                all_items = result_area.find_all(['li', 'div'], recursive=True)
 
-                    seen_urls = set()
+                seen_urls = set()
 
-                    for item in all_items:
-                        # 이미지/동영상 섹션 감지
-                        item_class = ' '.join(item.get('class', []))
+                for item in all_items:
+                    # 이미지/동영상 섹션 감지
+                    item_class = ' '.join(item.get('class', []))
 
-                        # 멀티미디어 섹션 감지 (이미지 영역, 동영상 영역 등)
-                        if any(cls in item_class for cls in ['image_area', 'video_area', 'photo_bx', 'movie_bx']):
-                            multimedia_count += 1
-                            continue
+                    # 멀티미디어 섹션 감지 (이미지 영역, 동영상 영역 등)
+                    if any(cls in item_class for cls in ['image_area', 'video_area', 'photo_bx', 'movie_bx']):
+                        multimedia_count += 1
+                        continue
 
-                        # 블로그 포스트 링크 찾기
-                        blog_links = item.find_all('a', href=re.compile(r'blog\.naver\.com/[^/]+/\d+'))
+                    # 블로그 포스트 링크 찾기
+                    blog_links = item.find_all('a', href=re.compile(r'blog\.naver\.com/[^/]+/\d+'))
 
-                        for link in blog_links:
-                            post_url = link.get('href', '')
+                    for link in blog_links:
+                        post_url = link.get('href', '')
 
-                            # URL 정규화
-                            if post_url.startswith('//'):
-                                post_url = 'https:' + post_url
-                            elif not post_url.startswith('http'):
-                                post_url = 'https://' + post_url
+                        # URL 정규화
+                        if post_url.startswith('//'):
+                            post_url = 'https:' + post_url
+                        elif not post_url.startswith('http'):
+                            post_url = 'https://' + post_url
 
-                            # 중복 제거
-                            if post_url in seen_urls:
-                                continue
-                            seen_urls.add(post_url)
+                        # 중복 제거
+                        if post_url in seen_urls:
+                            continue
+                        seen_urls.add(post_url)
 
-                            display_rank += 1
-                            found_posts[post_url] = {
-                                "display_rank": display_rank + multimedia_count,  # 멀티미디어 슬롯 고려
-                                "has_multimedia_above": multimedia_count > 0
-                            }
+                        display_rank += 1
+                        found_posts[post_url] = {
+                            "display_rank": display_rank + multimedia_count,  # 멀티미디어 슬롯 고려
+                            "has_multimedia_above": multimedia_count > 0
+                        }
 
-                # blog_results의 post_url과 매칭
-                for blog in blog_results:
-                    post_url = blog.get('post_url', '')
+            # blog_results의 post_url과 매칭
+            for blog in blog_results:
+                post_url = blog.get('post_url', '')
 
-                    # 정확히 일치하는 URL 찾기
-                    if post_url in found_posts:
-                        display_info[post_url] = found_posts[post_url]
-                    else:
-                        # URL 변형 시도 (http/https, www 등)
-                        for found_url, info in found_posts.items():
-                            if found_url.replace('https://', '').replace('http://', '') == post_url.replace('https://', '').replace('http://', ''):
-                                display_info[post_url] = info
-                                break
+                # 정확히 일치하는 URL 찾기
+                if post_url in found_posts:
+                    display_info[post_url] = found_posts[post_url]
+                else:
+                    # URL 변형 시도 (http/https, www 등)
+                    for found_url, info in found_posts.items():
+                        if found_url.replace('https://', '').replace('http://', '') == post_url.replace('https://', '').replace('http://', ''):
+                            display_info[post_url] = info
+                            break
 
-                logger.info(f"Display ranks fetched: {len(display_info)} matched out of {len(blog_results)} blogs, multimedia_count={multimedia_count}")
+            logger.info(f"Display ranks fetched: {len(display_info)} matched out of {len(blog_results)} blogs, multimedia_count={multimedia_count}")
 
     except Exception as e:
         logger.error(f"Error fetching display ranks: {e}")
@@ -1862,345 +1833,72 @@ async def analyze_post(post_url: str, keyword: str) -> Dict:
 
         # 타임아웃 공격적 설정: 연결 3초, 읽기 6초 (빠른 실패 → 재시도)
         timeout = httpx.Timeout(6.0, connect=3.0)
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True, limits=httpx.Limits(max_connections=30)) as client:
-            content_text = ""
-            title_text = ""
-
-            # ===== 방법 1: PostView API로 직접 접근 =====
-            try:
-                postview_url = f"https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={post_no}&redirect=Dlog"
-                headers1 = {
-                    "User-Agent": user_agents[0],
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-                    "Referer": "https://search.naver.com/",
-                }
-                resp = await client.get(postview_url, headers=headers1)
-
-                if resp.status_code == 200:
-                    html = resp.text
-
-                    # JSON 데이터 추출 시도 (네이버 블로그 내부 데이터)
-                    json_match = re.search(r'__PRELOADED_STATE__\s*=\s*(\{.+?\});?\s*</script>', html, re.DOTALL)
-                    if json_match:
-                        try:
-                            import json
-                            json_data = json.loads(json_match.group(1))
-                            post_data = json_data.get('post', {}).get('post', {})
-
-                            if post_data:
-                                title_text = post_data.get('title', '')
-                                raw_content = post_data.get('content', '') or post_data.get('text', '')
-
-                                # 콘텐츠에서 피처 추출 (태그 제거 전)
-                                if raw_content:
-                                    # 소제목 개수 (h2, h3, h4 태그 또는 se-section-title)
-                                    heading_matches = re.findall(r'<(h[2-4]|strong|b)[^>]*class="[^"]*se-[^"]*"[^>]*>', raw_content, re.IGNORECASE)
-                                    heading_matches += re.findall(r'<(h[2-4])[^>]*>', raw_content, re.IGNORECASE)
-                                    post_analysis["heading_count"] = len(heading_matches)
-
-                                    # 문단 개수 (<p> 또는 <div class="se-text-paragraph">)
-                                    paragraph_matches = re.findall(r'<(p|div)[^>]*class="[^"]*se-text-paragraph[^"]*"[^>]*>', raw_content, re.IGNORECASE)
-                                    paragraph_matches += re.findall(r'<p[^>]*>', raw_content, re.IGNORECASE)
-                                    post_analysis["paragraph_count"] = len(paragraph_matches)
-
-                                    # 지도 포함 여부
-                                    post_analysis["has_map"] = bool(re.search(r'se-map|class="map|map\.naver|place_thumb', raw_content, re.IGNORECASE))
-
-                                    # 외부 링크 포함 여부
-                                    links = re.findall(r'href="(https?://[^"]+)"', raw_content)
-                                    external_links = [l for l in links if 'naver.com' not in l and 'naver.net' not in l]
-                                    post_analysis["has_link"] = len(external_links) > 0
-
-                                    # 이미지 개수 (태그에서 직접 추출)
-                                    img_count = len(re.findall(r'<img[^>]+>', raw_content))
-                                    if img_count > 0:
-                                        post_analysis["image_count"] = img_count
-
-                                    # HTML 태그 제거
-                                    content_text = re.sub(r'<[^>]+>', ' ', raw_content)
-                                    content_text = re.sub(r'\s+', ' ', content_text).strip()
-
-                                # 이미지/동영상 카운트 (JSON 필드 우선)
-                                if post_data.get('imageCount', 0) > 0:
-                                    post_analysis["image_count"] = post_data.get('imageCount', 0)
-                                post_analysis["video_count"] = post_data.get('videoCount', 0)
-                                post_analysis["like_count"] = post_data.get('sympathyCount', 0)
-                                post_analysis["comment_count"] = post_data.get('commentCount', 0)
-
-                                # 작성일에서 post_age_days 계산
-                                add_date = post_data.get('addDate', '') or post_data.get('logDate', '')
-                                if add_date:
-                                    try:
-                                        from datetime import datetime
-                                        # 다양한 날짜 형식 처리
-                                        date_match = re.search(r'(\d{4})[.\-/]?(\d{2})[.\-/]?(\d{2})', str(add_date))
-                                        if date_match:
-                                            y, m, d = map(int, date_match.groups())
-                                            post_date = datetime(y, m, d)
-                                            post_analysis["post_age_days"] = (datetime.now() - post_date).days
-                                    except:
-                                        pass
-
-                                post_analysis["fetch_method"] = "json_preload"
-                                logger.info(f"Post data from JSON: {blog_id}/{post_no} - headings={post_analysis['heading_count']}, paragraphs={post_analysis['paragraph_count']}, age={post_analysis['post_age_days']}days")
-                        except Exception as je:
-                            logger.debug(f"JSON parse failed: {je}")
-
-            except Exception as e1:
-                logger.debug(f"PostView method failed: {e1}")
-
-            # ===== 방법 2: 모바일 버전 (기존 방식 개선) =====
-            if not content_text or len(content_text) < 100:
-                mobile_url = f"https://m.blog.naver.com/{blog_id}/{post_no}"
-                headers = {
-                    "User-Agent": user_agents[1],
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "ko-KR,ko;q=0.9",
-                    "Referer": "https://m.search.naver.com/",
-                }
-                resp = await client.get(mobile_url, headers=headers)
+        # blog.naver.com 공용 클라이언트(services/http_clients) — 글마다 TLS 핸드셰이크를 하지 않는다.
+        client = get_client("blog")
+        # 파싱(정규식·JSON·HTML 트리)은 전부 services/post_features 의 순수 함수이고
+        # parse 워커 프로세스에서 돈다. 여기서는 받기만 한다 — 판정 하나가 글 수십 개를
+        # 읽는 동안 이벤트 루프가 멈추지 않게.
+        state = {"analysis": post_analysis, "content_text": "", "title_text": ""}
+        resp = None
+
+        # ===== 방법 1: PostView API로 직접 접근 =====
+        try:
+            postview_url = f"https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={post_no}&redirect=Dlog"
+            headers1 = {
+                "User-Agent": user_agents[0],
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+                "Referer": "https://search.naver.com/",
+            }
+            resp = await client.get(postview_url, headers=headers1, timeout=timeout)
 
             if resp.status_code == 200:
-                html = resp.text
-                soup = BeautifulSoup(html, 'html.parser')
-
-                # 모바일 버전 셀렉터들
-                # 제목 (JSON에서 이미 추출한 경우 스킵)
-                if not title_text:
-                    title_elem = soup.select_one('.se-title-text, .tit_h3, ._postTitleText, .post_tit, h3.se_textarea, .tit_view')
-                    if title_elem:
-                        title_text = title_elem.get_text(strip=True)
-                    else:
-                        # og:title에서 추출
-                        og_title = soup.select_one('meta[property="og:title"]')
-                        if og_title:
-                            title_text = og_title.get('content', '')
-
-                if title_text:
-                    keyword_lower = keyword.lower().replace(" ", "")
-                    title_lower = title_text.lower().replace(" ", "")
-
-                    if keyword_lower in title_lower:
-                        post_analysis["title_has_keyword"] = True
-                        pos = title_lower.find(keyword_lower)
-                        title_len = len(title_lower)
-                        if pos == 0:
-                            post_analysis["title_keyword_position"] = 0
-                        elif pos > title_len * 0.7:
-                            post_analysis["title_keyword_position"] = 2
-                        else:
-                            post_analysis["title_keyword_position"] = 1
-
-                # 본문 - 모바일 버전 셀렉터들 (JSON에서 이미 추출한 경우 스킵)
-                if not content_text or len(content_text) < 100:
-                    content_elem = soup.select_one('.se-main-container, ._postView, .post_ct, #postViewArea, .se_component_wrap, .__viewer_container')
-                    if not content_elem:
-                        # 전체 article 영역에서 시도
-                        content_elem = soup.select_one('article, .post_article, .blog_view_content')
-
-                    if content_elem:
-                        content_text = content_elem.get_text(strip=True)
-                        if not post_analysis["fetch_method"]:
-                            post_analysis["fetch_method"] = "mobile_html"
-                    else:
-                        # 본문을 못 찾았으면 og:description에서 길이 추정
-                        og_desc = soup.select_one('meta[property="og:description"]')
-                        if og_desc:
-                            desc = og_desc.get('content', '')
-                            if len(desc) > len(content_text):
-                                # 보통 설명은 200자 정도, 실제 본문은 5~10배 추정
-                                content_text = desc
-                                post_analysis["content_length"] = len(desc) * 8
-                                post_analysis["fetch_method"] = "og_fallback"
-                                post_analysis["data_fetched"] = True
-
-                # 콘텐츠 분석 (content_text가 있으면)
-                if content_text:
-                    if post_analysis["content_length"] == 0:
-                        post_analysis["content_length"] = len(content_text)
-                    post_analysis["data_fetched"] = True
-
-                    # 키워드 등장 횟수
-                    keyword_lower = keyword.lower().replace(" ", "")
-                    content_lower = content_text.lower().replace(" ", "")
-                    post_analysis["keyword_count"] = content_lower.count(keyword_lower)
-
-                    # 키워드 밀도 (1000자당 등장 횟수)
-                    if post_analysis["content_length"] > 0:
-                        post_analysis["keyword_density"] = round(
-                            (post_analysis["keyword_count"] * 1000) / post_analysis["content_length"], 2
-                        )
+                state = await run_parse(PF.parse_postview, resp.content, resp.encoding, keyword, post_analysis)
+                post_analysis = state["analysis"]
+                if post_analysis["fetch_method"] == "json_preload":
+                    logger.info(f"Post data from JSON: {blog_id}/{post_no} - headings={post_analysis['heading_count']}, paragraphs={post_analysis['paragraph_count']}, age={post_analysis['post_age_days']}days")
 
-                # 이미지 개수 - 다양한 셀렉터 (JSON에서 이미 추출된 경우 스킵)
-                if post_analysis["image_count"] == 0:
-                    images = soup.select('.se-image-resource, img.se_mediaImage, ._postView img, .post_ct img, img[src*="blogfiles"], img[src*="postfiles"]')
-                    post_analysis["image_count"] = len(images)
-
-                    # og:image 카운트 폴백
-                    if post_analysis["image_count"] == 0:
-                        og_images = soup.select('meta[property="og:image"]')
-                        if og_images:
-                            post_analysis["image_count"] = len(og_images)
-
-                # 동영상 개수 (JSON에서 이미 추출된 경우 스킵)
-                if post_analysis["video_count"] == 0:
-                    videos = soup.select('.se-video, iframe[src*="video"], iframe[src*="youtube"], iframe[src*="tv.naver"], .video_player')
-                    post_analysis["video_count"] = len(videos)
-
-                # 소제목 개수 (JSON에서 이미 추출된 경우 스킵)
-                if post_analysis["heading_count"] == 0:
-                    headings = soup.select('.se-section-title, .se-text-paragraph-align-center, h2, h3, h4, .se-title, strong.se-text-paragraph')
-                    post_analysis["heading_count"] = len(headings)
-
-                # 문단 개수 (JSON에서 이미 추출된 경우 스킵)
-                if post_analysis["paragraph_count"] == 0:
-                    paragraphs = soup.select('.se-text-paragraph, p, .se-module-text')
-                    # 빈 문단 제외
-                    valid_paragraphs = [p for p in paragraphs if len(p.get_text(strip=True)) > 10]
-                    post_analysis["paragraph_count"] = len(valid_paragraphs)
-
-                # 지도 포함 여부 (JSON에서 이미 추출된 경우 스킵)
-                if not post_analysis["has_map"]:
-                    maps = soup.select('.se-map, iframe[src*="map"], .map_area, .place_thumb, .se-place')
-                    post_analysis["has_map"] = len(maps) > 0
-
-                # 외부 링크 포함 여부 (JSON에서 이미 추출된 경우 스킵)
-                if not post_analysis["has_link"]:
-                    links = soup.select('a[href*="http"]:not([href*="naver.com"]):not([href*="naver.net"])')
-                    post_analysis["has_link"] = len(links) > 0
-
-                # 공감 수 (모바일) — 셀렉터 + 인라인 attribute regex
-                if not post_analysis["like_count"]:
-                    like_elem = soup.select_one('.u_cnt, .sympathy_count, ._sympathyCount, .like_count, .btn_like_count')
-                    if like_elem:
-                        try:
-                            nums = re.findall(r'\d+', like_elem.get_text(strip=True))
-                            if nums:
-                                post_analysis["like_count"] = int(nums[0])
-                        except:
-                            pass
-                    # 인라인 HTML의 sympathyCnt="N" / sympathyCount="N" attribute
-                    if not post_analysis["like_count"]:
-                        m = re.search(r'(?:sympathyCnt|sympathyCount|likeCount)\s*=\s*["\']?(\d+)["\']?', html)
-                        if m:
-                            post_analysis["like_count"] = int(m.group(1))
-
-                # 댓글 수 — 셀렉터 + 인라인 attribute regex
-                if not post_analysis["comment_count"]:
-                    comment_elem = soup.select_one('.comment_count, ._commentCount, .cmt_count, .btn_comment_count')
-                    if comment_elem:
-                        try:
-                            nums = re.findall(r'\d+', comment_elem.get_text(strip=True))
-                            if nums:
-                                post_analysis["comment_count"] = int(nums[0])
-                        except:
-                            pass
-                    # 모바일 HTML 인라인 attribute: commentCount="N"
-                    if not post_analysis["comment_count"]:
-                        m = re.search(r'commentCount\s*=\s*["\']?(\d+)["\']?', html)
-                        if m:
-                            post_analysis["comment_count"] = int(m.group(1))
-
-                # 작성일 추출 (여러 방법 시도)
-                from datetime import datetime
-
-                # 방법 1: HTML 요소에서 찾기
-                date_elem = soup.select_one('.se_publishDate, .se-date, ._postAddDate, .post_date, .date, .blog_date, time')
-                if date_elem:
-                    try:
-                        date_text = date_elem.get_text(strip=True)
-                        # YYYY.MM.DD 또는 YYYY-MM-DD 형식
-                        date_match = re.search(r'(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})', date_text)
-                        if date_match:
-                            y, m, d = map(int, date_match.groups())
-                            post_date = datetime(y, m, d)
-                            post_analysis["post_age_days"] = (datetime.now() - post_date).days
-                    except:
-                        pass
+        except Exception as e1:
+            logger.debug(f"PostView method failed: {e1}")
 
-                # 방법 2: HTML에서 14자리 타임스탬프 찾기 (YYYYMMDDHHMMSS)
-                if post_analysis["post_age_days"] is None:
-                    try:
-                        raw_html = str(resp.content)
-                        # addDate 또는 logDate 관련 타임스탬프
-                        timestamp_match = re.search(r'(?:addDate|logDate|publishDate|date)["\'\s:=]+["\']?(\d{14})', raw_html, re.IGNORECASE)
-                        if timestamp_match:
-                            ts = timestamp_match.group(1)
-                            y, m, d = int(ts[:4]), int(ts[4:6]), int(ts[6:8])
-                            post_date = datetime(y, m, d)
-                            post_analysis["post_age_days"] = (datetime.now() - post_date).days
-                    except:
-                        pass
+        # ===== 방법 2: 모바일 버전 (기존 방식 개선) =====
+        if PF.need_page(state):
+            mobile_url = f"https://m.blog.naver.com/{blog_id}/{post_no}"
+            headers = {
+                "User-Agent": user_agents[1],
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "ko-KR,ko;q=0.9",
+                "Referer": "https://m.search.naver.com/",
+            }
+            resp = await client.get(mobile_url, headers=headers)
 
-                # 방법 3: 메타 태그에서 찾기
-                if post_analysis["post_age_days"] is None:
-                    try:
-                        meta_date = soup.select_one('meta[property="article:published_time"], meta[name="date"]')
-                        if meta_date and meta_date.get('content'):
-                            date_str = meta_date.get('content')
-                            date_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', date_str)
-                            if date_match:
-                                y, m, d = map(int, date_match.groups())
-                                post_date = datetime(y, m, d)
-                                post_analysis["post_age_days"] = (datetime.now() - post_date).days
-                    except:
-                        pass
+        if resp.status_code == 200:
+            # 모바일 페이지(또는 JSON 이 충분했으면 PostView 페이지) 셀렉터 + 작성일 방법 1~4
+            state = await run_parse(PF.parse_post_page, resp.content, resp.encoding, keyword, state)
+            post_analysis = state["analysis"]
 
-                # 방법 4: HTML 전체에서 YYYY.MM.DD 패턴 찾기 (가장 공격적)
-                if post_analysis["post_age_days"] is None:
-                    try:
-                        html_text = str(resp.text)
-                        # YYYY.MM.DD, YYYY-MM-DD, YYYY/MM/DD 형식
-                        date_match = re.search(r'(20[12][0-9])[\.\-/]([01]?[0-9])[\.\-/]([0-3]?[0-9])', html_text)
-                        if date_match:
-                            y, m, d = int(date_match.group(1)), int(date_match.group(2)), int(date_match.group(3))
-                            if 1 <= m <= 12 and 1 <= d <= 31:
-                                post_date = datetime(y, m, d)
-                                post_analysis["post_age_days"] = (datetime.now() - post_date).days
-                    except:
-                        pass
+            from datetime import datetime
 
-                # 방법 5: RSS 피드에서 날짜 가져오기 (가장 확실)
-                if post_analysis["post_age_days"] is None and blog_id and post_no:
-                    try:
-                        rss_url = f"https://rss.blog.naver.com/{blog_id}.xml"
-                        rss_resp = await client.get(rss_url, timeout=5.0)
-                        if rss_resp.status_code == 200:
-                            rss_xml = rss_resp.text
-                            # RSS에서 해당 포스트의 pubDate 찾기
-                            # 패턴: <link>.../{post_no}</link> 다음에 오는 <pubDate>
-                            items = re.findall(
-                                r'<item>.*?<link>[^<]*/' + post_no + r'</link>.*?<pubDate>([^<]+)</pubDate>',
-                                rss_xml,
-                                re.DOTALL
-                            )
-                            if items:
-                                pub_date_str = items[0].strip()
-                                # "Wed, 31 Dec 2025 16:46:05 +0900" 형식 파싱
-                                from email.utils import parsedate_to_datetime
-                                try:
-                                    pub_date = parsedate_to_datetime(pub_date_str)
-                                    post_analysis["post_age_days"] = (datetime.now(pub_date.tzinfo) - pub_date).days
-                                    logger.debug(f"Got date from RSS: {blog_id}/{post_no} - {post_analysis['post_age_days']} days old")
-                                except:
-                                    # 대체 파싱: "31 Dec 2025" 추출
-                                    date_match = re.search(r'(\d{1,2})\s+(\w+)\s+(\d{4})', pub_date_str)
-                                    if date_match:
-                                        day = int(date_match.group(1))
-                                        month_str = date_match.group(2)
-                                        year = int(date_match.group(3))
-                                        months = {'Jan':1,'Feb':2,'Mar':3,'Apr':4,'May':5,'Jun':6,
-                                                  'Jul':7,'Aug':8,'Sep':9,'Oct':10,'Nov':11,'Dec':12}
-                                        month = months.get(month_str, 1)
-                                        post_date = datetime(year, month, day)
-                                        post_analysis["post_age_days"] = (datetime.now() - post_date).days
-                    except Exception as rss_err:
-                        logger.debug(f"RSS date extraction failed: {rss_err}")
-
-                logger.info(f"Post analyzed [{post_analysis.get('fetch_method', 'unknown')}]: {blog_id}/{post_no} - {post_analysis['content_length']} chars, {post_analysis['image_count']} imgs, kw={post_analysis['keyword_count']}, age={post_analysis['post_age_days']}days")
-            else:
-                logger.warning(f"Failed to fetch post: {blog_id}/{post_no} - status {resp.status_code}")
+            # 방법 5: RSS 피드에서 날짜 가져오기 (가장 확실)
+            # 피드는 services/rss_feed 캐시 — analyze_blog 가 방금 받은 것을 그대로 본다.
+            if post_analysis["post_age_days"] is None and blog_id and post_no:
+                try:
+                    feed = await rss_feed.get_feed(blog_id)
+                    for item in (feed or {}).get("items", []):
+                        # 링크: https://blog.naver.com/{id}/{no}?fromRss=true&... 또는 logNo={no}
+                        link = item["link"].split("?")[0].rstrip("/")
+                        if link.endswith("/" + post_no) or f"logNo={post_no}" in item["link"]:
+                            pub_date = rss_feed.published_at(item)
+                            if pub_date is not None:
+                                post_analysis["post_age_days"] = (datetime.now(pub_date.tzinfo) - pub_date).days
+                                logger.debug(f"Got date from RSS: {blog_id}/{post_no} - {post_analysis['post_age_days']} days old")
+                            break
+                except Exception as rss_err:
+                    logger.debug(f"RSS date extraction failed: {rss_err}")
+
+            logger.info(f"Post analyzed [{post_analysis.get('fetch_method', 'unknown')}]: {blog_id}/{post_no} - {post_analysis['content_length']} chars, {post_analysis['image_count']} imgs, kw={post_analysis['keyword_count']}, age={post_analysis['post_age_days']}days")
+        else:
+            logger.warning(f"Failed to fetch post: {blog_id}/{post_no} - status {resp.status_code}")
 
     except Exception as e:
         logger.error(f"Error analyzing post {post_url}: {e}")
@@ -2663,63 +2361,63 @@ async def scrape_blog_stats(blog_id: str) -> Dict:
         }
 
         timeout = httpx.Timeout(8.0, connect=3.0)
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-            # 모바일 블로그 메인 페이지 접근
-            blog_url = f"https://m.blog.naver.com/{blog_id}"
-            resp = await client.get(blog_url, headers=headers)
+        client = get_client("blog")
+        # 모바일 블로그 메인 페이지 접근
+        blog_url = f"https://m.blog.naver.com/{blog_id}"
+        resp = await client.get(blog_url, headers=headers, timeout=timeout)
 
-            if resp.status_code == 200:
-                html = resp.text
-
-                # 1. 총 글 수 추출 (여러 패턴 시도)
-                # 패턴: "게시글 1,234" 또는 "포스트 1234" 또는 data-count="1234"
-                post_patterns = [
-                    r'게시글\s*(\d[\d,]*)',
-                    r'포스트\s*(\d[\d,]*)',
-                    r'전체글\s*\((\d[\d,]*)\)',
-                    r'"postCnt":\s*(\d+)',
-                    r'data-post-count="(\d+)"',
-                    r'글\s*(\d[\d,]*)\s*개',
-                ]
-                for pattern in post_patterns:
-                    match = re.search(pattern, html)
-                    if match:
-                        stats["total_posts"] = int(match.group(1).replace(',', ''))
-                        break
+        if resp.status_code == 200:
+            html = resp.text
 
-                # 2. 이웃 수 추출
-                neighbor_patterns = [
-                    r'이웃\s*(\d[\d,]*)',
-                    r'"buddyCnt":\s*(\d+)',
-                    r'서로이웃\s*(\d[\d,]*)',
-                    r'data-buddy-count="(\d+)"',
-                ]
-                for pattern in neighbor_patterns:
-                    match = re.search(pattern, html)
-                    if match:
-                        stats["neighbor_count"] = int(match.group(1).replace(',', ''))
-                        break
+            # 1. 총 글 수 추출 (여러 패턴 시도)
+            # 패턴: "게시글 1,234" 또는 "포스트 1234" 또는 data-count="1234"
+            post_patterns = [
+                r'게시글\s*(\d[\d,]*)',
+                r'포스트\s*(\d[\d,]*)',
+                r'전체글\s*\((\d[\d,]*)\)',
+                r'"postCnt":\s*(\d+)',
+                r'data-post-count="(\d+)"',
+                r'글\s*(\d[\d,]*)\s*개',
+            ]
+            for pattern in post_patterns:
+                match = re.search(pattern, html)
+                if match:
+                    stats["total_posts"] = int(match.group(1).replace(',', ''))
+                    break
 
-                # 3. 방문자 수 추출
-                visitor_patterns = [
-                    r'방문자\s*(\d[\d,]*)',
-                    r'"visitorcnt":\s*"?(\d+)"?',
-                    r'전체방문\s*(\d[\d,]*)',
-                    r'data-visitor="(\d+)"',
-                    r'총\s*방문\s*(\d[\d,]*)',
-                ]
-                for pattern in visitor_patterns:
-                    match = re.search(pattern, html, re.IGNORECASE)
-                    if match:
-                        stats["total_visitors"] = int(match.group(1).replace(',', ''))
-                        break
+            # 2. 이웃 수 추출
+            neighbor_patterns = [
+                r'이웃\s*(\d[\d,]*)',
+                r'"buddyCnt":\s*(\d+)',
+                r'서로이웃\s*(\d[\d,]*)',
+                r'data-buddy-count="(\d+)"',
+            ]
+            for pattern in neighbor_patterns:
+                match = re.search(pattern, html)
+                if match:
+                    stats["neighbor_count"] = int(match.group(1).replace(',', ''))
+                    break
 
-                # 성공 여부 판단 (최소 1개 이상 추출)
-                if stats["total_posts"] or stats["neighbor_count"] or stats["total_visitors"]:
-                    stats["success"] = True
-                    logger.info(f"Blog scrape success: {blog_id} - posts={stats['total_posts']}, neighbors={stats['neighbor_count']}, visitors={stats['total_visitors']}")
-                else:
-                    logger.warning(f"Blog scrape: no stats found for {blog_id}")
+            # 3. 방문자 수 추출
+            visitor_patterns = [
+                r'방문자\s*(\d[\d,]*)',
+                r'"visitorcnt":\s*"?(\d+)"?',
+                r'전체방문\s*(\d[\d,]*)',
+                r'data-visitor="(\d+)"',
+                r'총\s*방문\s*(\d[\d,]*)',
+            ]
+            for pattern in visitor_patterns:
+                match = re.search(pattern, html, re.IGNORECASE)
+                if match:
+                    stats["total_visitors"] = int(match.group(1).replace(',', ''))
+                    break
+
+            # 성공 여부 판단 (최소 1개 이상 추출)
+            if stats["total_posts"] or stats["neighbor_count"] or stats["total_visitors"]:
+                stats["success"] = True
+                logger.info(f"Blog scrape success: {blog_id} - posts={stats['total_posts']}, neighbors={stats['neighbor_count']}, visitors={stats['total_visitors']}")
+            else:
+                logger.warning(f"Blog scrape: no stats found for {blog_id}")
 
     except httpx.TimeoutException:
         logger.warning(f"Blog scrape timeout: {blog_id}")
@@ -2730,12 +2428,22 @@ async def scrape_blog_stats(blog_id: str) -> Dict:
 
 
 async def analyze_blog(blog_id: str, keyword: str = None, verify_index: bool = False) -> Dict:
-    """Analyze a single blog - FAST version using API only (no Playwright)"""
-    # 캐시 확인 (성능 개선)
-    cached = get_cached_blog_analysis(blog_id)
-    if cached:
-        logger.debug(f"Cache hit for blog: {blog_id}")
-        return cached
+    """Analyze a single blog - FAST version using API only (no Playwright)
+
+    캐시(1시간) 적중이면 바로 반환하고, 같은 blog_id 의 동시 요청은 분석 1회를 나눠 받는다
+    (single-flight — 판정 경쟁자 채점·배치 분석이 같은 블로그를 동시에 20번 부르던 문제).
+    verify_index 요청은 SERP 검증이 붙으므로 일반 요청과 합치지 않는다.
+    """
+    return await BLOG_ANALYSIS_CACHE.get_or_load(
+        blog_id,
+        lambda: _analyze_blog_uncached(blog_id, keyword, verify_index),
+        store=False,  # 성공 경로에서 _analyze_blog_uncached 가 직접 저장한다
+        flight_key=(blog_id, bool(verify_index)),
+    )
+
+
+async def _analyze_blog_uncached(blog_id: str, keyword: str = None,
+                                 verify_index: bool = False) -> Dict:
 
     stats = {
         "total_posts": None,
@@ -2839,32 +2547,21 @@ async def analyze_blog(blog_id: str, keyword: str = None, verify_index: bool = F
             logger.info(f"Using scraped data for {blog_id}")
 
         # ===== 2단계: RSS 기반 데이터 수집 (보완/폴백) =====
-        headers = {
-            "User-Agent": random.choice(USER_AGENTS),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.9",
-        }
-
         # 전역 HTTP 클라이언트 사용 (성능 개선) + 개별 요청 타임아웃
         client = await get_http_client()
         # RSS에서 블로그 정보 추출 (스크래핑 실패 시 폴백)
         try:
-            rss_url = f"https://rss.blog.naver.com/{blog_id}.xml"
-            resp = await client.get(rss_url, headers=headers, timeout=5.0)
+            # services/rss_feed: 파싱 결과 캐시 + 조건부 GET — 판정·경쟁분석이 같은 피드를 또 본다
+            feed = await rss_feed.get_feed(blog_id, client)
 
-            if resp.status_code == 200 and '<item>' in resp.text:
-                soup = BeautifulSoup(resp.text, 'xml')
-                items = soup.find_all('item')
+            if feed and feed["items"]:
+                items = feed["items"]
 
                 # RSS channel에서 블로그명 추출
-                channel = soup.find('channel')
-                if channel:
-                    title_elem = channel.find('title')
-                    if title_elem and title_elem.get_text(strip=True):
-                        blog_title = title_elem.get_text(strip=True)
-                        # 블로그 제목이 blog_id와 다를 경우에만 저장
-                        if blog_title and blog_title != blog_id:
-                            analysis_data["blog_name"] = blog_title
+                blog_title = feed["channel_title"]
+                # 블로그 제목이 blog_id와 다를 경우에만 저장
+                if blog_title and blog_title != blog_id:
+                    analysis_data["blog_name"] = blog_title
 
                 if items:
                     if "rss" not in analysis_data["data_sources"]:
@@ -2890,17 +2587,11 @@ async def analyze_blog(blog_id: str, keyword: str = None, verify_index: bool = F
                     total_words = 0
                     valid_items = 0
                     for item in items[:10]:
-                        desc = item.find('description')
-                        if desc:
-                            raw = desc.get_text(strip=True)
-                            total_len += len(raw)
-                            # 이미지 개수: description에서 <img> 출현 카운트
-                            total_images += raw.lower().count('<img') if raw else 0
-                            # 단어 수: 한국어 공백 분리 + 한자/한글 어절
-                            text_only = re.sub(r'<[^>]+>', ' ', raw)
-                            words = [w for w in text_only.split() if len(w) >= 2]
-                            total_words += len(words)
-                            valid_items += 1
+                        # 원문 description 길이 / <img> 출현 수 / 2자 이상 어절 수 (rss_feed 가 미리 셈)
+                        total_len += item["raw_length"]
+                        total_images += item["image_count"]
+                        total_words += item["word_count"]
+                        valid_items += 1
 
                     if valid_items > 0:
                         analysis_data["avg_post_length"] = total_len // valid_items
@@ -2910,11 +2601,9 @@ async def analyze_blog(blog_id: str, keyword: str = None, verify_index: bool = F
                     # 카테고리 수 + 분포 엔트로피
                     cat_freq: Dict[str, int] = {}
                     for item in items:
-                        cat = item.find('category')
-                        if cat:
-                            name = cat.get_text(strip=True)
-                            if name:
-                                cat_freq[name] = cat_freq.get(name, 0) + 1
+                        name = item["category"]
+                        if name:
+                            cat_freq[name] = cat_freq.get(name, 0) + 1
                     analysis_data["category_count"] = len(cat_freq) if cat_freq else 3
                     if cat_freq:
                         import math
@@ -2931,18 +2620,10 @@ async def analyze_blog(blog_id: str, keyword: str = None, verify_index: bool = F
                     # 보이므로 "최근 N일 발행량"을 그대로 쓰면 활발한 블로그가 오히려 손해를
                     # 본다. rss_truncated 로 잘림을 표시하고 하위 로직에서 보정한다.
                     try:
-                        from email.utils import parsedate_to_datetime
                         from datetime import datetime, timezone
 
                         now_utc = datetime.now(timezone.utc)
-                        all_dates = []
-                        for item in items:
-                            p = item.find('pubDate')
-                            if p:
-                                try:
-                                    all_dates.append(parsedate_to_datetime(p.get_text()))
-                                except Exception:
-                                    pass
+                        all_dates = [d for d in map(rss_feed.published_at, items) if d is not None]
 
                         if all_dates:
                             all_dates.sort(reverse=True)
@@ -3004,9 +2685,8 @@ async def analyze_blog(blog_id: str, keyword: str = None, verify_index: bool = F
                         #   첫 분석만 비용이 들고, 그 뒤로는 새 글만 읽으면 된다.
                         post_links: List[str] = []
                         for item in items[:FULLPARSE_SAMPLE_SIZE]:
-                            link_elem = item.find('link')
-                            if link_elem and link_elem.get_text(strip=True):
-                                post_links.append(link_elem.get_text(strip=True))
+                            if item["link"]:
+                                post_links.append(item["link"])
 
                         if post_links:
                             post_keyword = keyword or ""
@@ -3100,7 +2780,7 @@ async def analyze_blog(blog_id: str, keyword: str = None, verify_index: bool = F
                     ["total_posts", "neighbor_count", "total_visitors",
                      "category_count", "avg_post_length", "recent_activity"]
                 )
-                logger.warning(f"RSS failed for {blog_id} (status={resp.status_code}) — 추정값 생성 안 함")
+                logger.warning(f"RSS failed for {blog_id} (no feed or no items) — 추정값 생성 안 함")
 
         except Exception as e:
             logger.warning(f"RSS fetch error for {blog_id}: {e}")
@@ -3116,7 +2796,7 @@ async def analyze_blog(blog_id: str, keyword: str = None, verify_index: bool = F
 
         # Get learned weights from database
         try:
-            learned_weights = get_current_weights()
+            learned_weights = await run_db(LEARNING_DB_PATH, get_current_weights)
         except Exception:
             learned_weights = None
 
@@ -3637,10 +3317,10 @@ async def analyze_blog(blog_id: str, keyword: str = None, verify_index: bool = F
             percentile_db = get_blog_percentile_db()
 
             # 점수 저장 (실제 분석된 블로그로 기록)
-            percentile_db.add_blog_score(blog_id, index["total_score"])
+            await adb(percentile_db).add_blog_score(blog_id, index["total_score"])
 
             # 모집단이 부족하면 None을 돌려준다 (지어낸 50%가 아니라)
-            percentile = percentile_db.get_percentile(index["total_score"])
+            percentile = await adb(percentile_db).get_percentile(index["total_score"])
 
             if percentile is not None:
                 level, grade = percentile_db.get_level_from_percentile(percentile)
@@ -3680,7 +3360,7 @@ async def analyze_blog(blog_id: str, keyword: str = None, verify_index: bool = F
 
                     # 24h 캐시 (raw: 네임스페이스 — 전용 엔드포인트의 응답 형태와 구분)
                     cache_key = f"raw:{blog_id}"
-                    verified = get_cached_verify_index(cache_key)
+                    verified = await get_cached_verify_index(cache_key)
                     if verified is None:
                         verified = await verify_blog_index_level(
                             blog_id,
@@ -3691,7 +3371,7 @@ async def analyze_blog(blog_id: str, keyword: str = None, verify_index: bool = F
                             },
                         )
                         if verified.get("ok"):
-                            set_verify_index_cache(cache_key, verified)
+                            await set_verify_index_cache(cache_key, verified)
                     index["index_verification"] = verified
 
                     if verified.get("ok") and verified.get("detailed_level"):
@@ -3828,7 +3508,7 @@ async def analyze_blog(blog_id: str, keyword: str = None, verify_index: bool = F
         "unmeasured": unmeasured,
         "rss_empty": analysis_data.get("rss_empty", False),
     }
-    set_blog_analysis_cache(blog_id, result)
+    await set_blog_analysis_cache(blog_id, result)
     return result
 
 
@@ -3884,105 +3564,106 @@ async def get_related_keywords_from_searchad(keyword: str, retry_count: int = 0)
 
         logger.info(f"[SearchAd] Requesting keywords for: {keyword} (attempt {retry_count + 1})")
 
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            response = await client.get(
-                "https://api.searchad.naver.com/keywordstool",
-                headers=headers,
-                params=params,
-                timeout=10.0  # 30초 → 10초로 단축
-            )
-
-            logger.info(f"[SearchAd] Response status: {response.status_code} for: {keyword}")
-
-            if response.status_code == 200:
-                data = response.json()
-                keywords_data = data.get("keywordList", [])
-
-                logger.info(f"[SearchAd] Got {len(keywords_data)} keywords for: {keyword}")
-
-                related_keywords = []
-                for kw in keywords_data[:100]:  # Limit to 100 keywords
-                    pc_search = kw.get("monthlyPcQcCnt", 0)
-                    mobile_search = kw.get("monthlyMobileQcCnt", 0)
+        client = get_client("searchad")
+        response = await client.get(
+            "https://api.searchad.naver.com/keywordstool",
+            headers=headers,
+            params=params,
+            timeout=10.0  # 30초 → 10초로 단축
+        )
 
-                    # Handle "< 10" values (네이버 API는 10 미만일 때 "< 10" 문자열 반환)
-                    if isinstance(pc_search, str) and "<" in pc_search:
-                        pc_search = 5
-                    if isinstance(mobile_search, str) and "<" in mobile_search:
-                        mobile_search = 5
+        logger.info(f"[SearchAd] Response status: {response.status_code} for: {keyword}")
 
-                    try:
-                        pc_search = int(pc_search) if pc_search else 0
-                        mobile_search = int(mobile_search) if mobile_search else 0
-                    except (ValueError, TypeError):
-                        pc_search = 0
-                        mobile_search = 0
-
-                    total_search = pc_search + mobile_search
-
-                    # Determine competition level
-                    comp_idx = kw.get("compIdx", "")
-                    if comp_idx == "높음":
-                        competition = "높음"
-                    elif comp_idx == "중간":
-                        competition = "중간"
-                    else:
-                        competition = "낮음"
+        if response.status_code == 200:
+            data = response.json()
+            keywords_data = data.get("keywordList", [])
 
-                    related_keywords.append(RelatedKeyword(
-                        keyword=kw.get("relKeyword", ""),
-                        monthly_pc_search=pc_search,
-                        monthly_mobile_search=mobile_search,
-                        monthly_total_search=total_search,
-                        competition=competition
-                    ))
+            logger.info(f"[SearchAd] Got {len(keywords_data)} keywords for: {keyword}")
 
-                # Sort by total search volume
-                related_keywords.sort(key=lambda x: x.monthly_total_search or 0, reverse=True)
+            related_keywords = []
+            for kw in keywords_data[:100]:  # Limit to 100 keywords
+                pc_search = kw.get("monthlyPcQcCnt", 0)
+                mobile_search = kw.get("monthlyMobileQcCnt", 0)
 
-                result = RelatedKeywordsResponse(
-                    success=True,
-                    keyword=keyword,
-                    source="searchad",
-                    total_count=len(related_keywords),
-                    keywords=related_keywords
-                )
+                # Handle "< 10" values (네이버 API는 10 미만일 때 "< 10" 문자열 반환)
+                if isinstance(pc_search, str) and "<" in pc_search:
+                    pc_search = 5
+                if isinstance(mobile_search, str) and "<" in mobile_search:
+                    mobile_search = 5
 
-                # 캐시에 저장 (24시간)
                 try:
-                    cache_related_keywords(keyword, result.model_dump())
-                    logger.info(f"[SearchAd] Cached {len(related_keywords)} keywords for: {keyword}")
-                except Exception as cache_error:
-                    logger.warning(f"[SearchAd] Cache failed: {cache_error}")
-
-                return result
-
-            elif response.status_code == 429:
-                # Rate limit - 재시도
-                logger.warning(f"[SearchAd] Rate limited (429) for: {keyword}")
-                if retry_count < MAX_RETRIES:
-                    await asyncio.sleep(1.0 * (retry_count + 1))  # 지수 백오프
-                    return await get_related_keywords_from_searchad(keyword, retry_count + 1)
-
-            elif response.status_code in [500, 502, 503, 504]:
-                # 서버 오류 - 재시도
-                logger.warning(f"[SearchAd] Server error ({response.status_code}) for: {keyword}")
-                if retry_count < MAX_RETRIES:
-                    await asyncio.sleep(0.5 * (retry_count + 1))
-                    return await get_related_keywords_from_searchad(keyword, retry_count + 1)
+                    pc_search = int(pc_search) if pc_search else 0
+                    mobile_search = int(mobile_search) if mobile_search else 0
+                except (ValueError, TypeError):
+                    pc_search = 0
+                    mobile_search = 0
+
+                total_search = pc_search + mobile_search
+
+                # Determine competition level
+                comp_idx = kw.get("compIdx", "")
+                if comp_idx == "높음":
+                    competition = "높음"
+                elif comp_idx == "중간":
+                    competition = "중간"
+                else:
+                    competition = "낮음"
 
-            else:
-                logger.error(f"[SearchAd] API error {response.status_code}: {response.text[:200]}")
+                related_keywords.append(RelatedKeyword(
+                    keyword=kw.get("relKeyword", ""),
+                    monthly_pc_search=pc_search,
+                    monthly_mobile_search=mobile_search,
+                    monthly_total_search=total_search,
+                    competition=competition
+                ))
+
+            # Sort by total search volume
+            related_keywords.sort(key=lambda x: x.monthly_total_search or 0, reverse=True)
 
-            return RelatedKeywordsResponse(
-                success=False,
+            result = RelatedKeywordsResponse(
+                success=True,
                 keyword=keyword,
                 source="searchad",
-                total_count=0,
-                keywords=[],
-                message=f"API 오류: {response.status_code}"
+                total_count=len(related_keywords),
+                keywords=related_keywords
             )
 
+            # 캐시에 저장 (24시간)
+            try:
+                await run_db(KEYWORD_ANALYSIS_DB_PATH, cache_related_keywords,
+                             keyword, result.model_dump(), write=True)
+                logger.info(f"[SearchAd] Cached {len(related_keywords)} keywords for: {keyword}")
+            except Exception as cache_error:
+                logger.warning(f"[SearchAd] Cache failed: {cache_error}")
+
+            return result
+
+        elif response.status_code == 429:
+            # Rate limit - 재시도
+            logger.warning(f"[SearchAd] Rate limited (429) for: {keyword}")
+            if retry_count < MAX_RETRIES:
+                await asyncio.sleep(1.0 * (retry_count + 1))  # 지수 백오프
+                return await get_related_keywords_from_searchad(keyword, retry_count + 1)
+
+        elif response.status_code in [500, 502, 503, 504]:
+            # 서버 오류 - 재시도
+            logger.warning(f"[SearchAd] Server error ({response.status_code}) for: {keyword}")
+            if retry_count < MAX_RETRIES:
+                await asyncio.sleep(0.5 * (retry_count + 1))
+                return await get_related_keywords_from_searchad(keyword, retry_count + 1)
+
+        else:
+            logger.error(f"[SearchAd] API error {response.status_code}: {response.text[:200]}")
+
+        return RelatedKeywordsResponse(
+            success=False,
+            keyword=keyword,
+            source="searchad",
+            total_count=0,
+            keywords=[],
+            message=f"API 오류: {response.status_code}"
+        )
+
     except httpx.TimeoutException:
         logger.warning(f"[SearchAd] Timeout for: {keyword} (attempt {retry_count + 1})")
         if retry_count < MAX_RETRIES:
@@ -4028,127 +3709,127 @@ async def get_related_keywords_from_autocomplete(keyword: str) -> RelatedKeyword
             ))
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Accept-Language": "ko-KR,ko;q=0.9",
-                "Referer": "https://search.naver.com/"
-            }
-
-            # ===== Method 1: 네이버 검색 자동완성 (기본) =====
-            async def fetch_naver_ac(query: str):
-                try:
-                    resp = await client.get(
-                        "https://ac.search.naver.com/nx/ac",
-                        params={
-                            "q": query, "con": "1", "frm": "nv", "ans": "2",
-                            "r_format": "json", "r_enc": "UTF-8", "r_unicode": "0",
-                            "t_koreng": "1", "run": "2", "rev": "4", "q_enc": "UTF-8"
-                        },
-                        headers=headers
-                    )
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        items = data.get("items", [[]])
-                        if items and len(items) > 0:
-                            for item in items[0][:20]:
-                                if isinstance(item, list) and len(item) > 0:
-                                    add_keyword(item[0])
-                except Exception as e:
-                    logger.debug(f"Naver AC failed for '{query}': {e}")
-
-            # 기본 키워드로 자동완성
-            await fetch_naver_ac(keyword)
+        client = get_client("ac")
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36",
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "Accept-Language": "ko-KR,ko;q=0.9",
+            "Referer": "https://search.naver.com/"
+        }
 
-            # ===== Method 2: 네이버 쇼핑 자동완성 =====
+        # ===== Method 1: 네이버 검색 자동완성 (기본) =====
+        async def fetch_naver_ac(query: str):
             try:
-                shop_response = await client.get(
-                    "https://ac.shopping.naver.com/ac",
-                    params={"q": keyword, "q_enc": "UTF-8", "st": "111111", "r_format": "json", "r_enc": "UTF-8", "frm": "shopping"},
+                resp = await client.get(
+                    "https://ac.search.naver.com/nx/ac",
+                    params={
+                        "q": query, "con": "1", "frm": "nv", "ans": "2",
+                        "r_format": "json", "r_enc": "UTF-8", "r_unicode": "0",
+                        "t_koreng": "1", "run": "2", "rev": "4", "q_enc": "UTF-8"
+                    },
                     headers=headers
                 )
-                if shop_response.status_code == 200:
-                    data = shop_response.json()
+                if resp.status_code == 200:
+                    data = resp.json()
                     items = data.get("items", [[]])
                     if items and len(items) > 0:
-                        for item in items[0][:30]:
+                        for item in items[0][:20]:
                             if isinstance(item, list) and len(item) > 0:
                                 add_keyword(item[0])
             except Exception as e:
-                logger.debug(f"Shopping suggest failed: {e}")
+                logger.debug(f"Naver AC failed for '{query}': {e}")
 
-            # ===== Method 3: 다양한 접미사 조합으로 자동완성 확장 =====
-            common_suffixes = [
-                "추천", "가격", "비용", "후기", "리뷰", "순위", "비교", "종류", "방법", "효과",
-                "장점", "단점", "차이", "선택", "구매", "사용법", "팁", "정보", "브랜드", "인기"
-            ]
+        # 기본 키워드로 자동완성
+        await fetch_naver_ac(keyword)
 
-            # 접미사 변형 키워드 추가
-            for suffix in common_suffixes:
-                add_keyword(f"{keyword} {suffix}")
+        # ===== Method 2: 네이버 쇼핑 자동완성 =====
+        try:
+            shop_response = await client.get(
+                "https://ac.shopping.naver.com/ac",
+                params={"q": keyword, "q_enc": "UTF-8", "st": "111111", "r_format": "json", "r_enc": "UTF-8", "frm": "shopping"},
+                headers=headers
+            )
+            if shop_response.status_code == 200:
+                data = shop_response.json()
+                items = data.get("items", [[]])
+                if items and len(items) > 0:
+                    for item in items[0][:30]:
+                        if isinstance(item, list) and len(item) > 0:
+                            add_keyword(item[0])
+        except Exception as e:
+            logger.debug(f"Shopping suggest failed: {e}")
 
-            # 접미사로 추가 자동완성 검색 (병렬)
-            suffix_queries = [f"{keyword} {s}" for s in common_suffixes[:5]]  # 상위 5개만
-            import asyncio
-            await asyncio.gather(*[fetch_naver_ac(q) for q in suffix_queries], return_exceptions=True)
+        # ===== Method 3: 다양한 접미사 조합으로 자동완성 확장 =====
+        common_suffixes = [
+            "추천", "가격", "비용", "후기", "리뷰", "순위", "비교", "종류", "방법", "효과",
+            "장점", "단점", "차이", "선택", "구매", "사용법", "팁", "정보", "브랜드", "인기"
+        ]
 
-            # ===== Method 4: 초성/글자 추가 자동완성 =====
-            korean_chars = ['ㄱ', 'ㄴ', 'ㄷ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅅ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
-            char_queries = [f"{keyword} {c}" for c in korean_chars[:7]]  # 상위 7개만
-            await asyncio.gather(*[fetch_naver_ac(q) for q in char_queries], return_exceptions=True)
+        # 접미사 변형 키워드 추가
+        for suffix in common_suffixes:
+            add_keyword(f"{keyword} {suffix}")
 
-            # ===== Method 5: 네이버 블로그 자동완성 =====
-            try:
-                blog_response = await client.get(
-                    "https://ac.search.naver.com/nx/ac",
-                    params={
-                        "q": keyword, "con": "1", "frm": "blog", "ans": "2",
-                        "r_format": "json", "r_enc": "UTF-8", "q_enc": "UTF-8"
-                    },
-                    headers=headers
-                )
-                if blog_response.status_code == 200:
-                    data = blog_response.json()
-                    items = data.get("items", [[]])
-                    if items and len(items) > 0:
-                        for item in items[0][:20]:
-                            if isinstance(item, list) and len(item) > 0:
-                                add_keyword(item[0])
-            except Exception as e:
-                logger.debug(f"Blog AC failed: {e}")
+        # 접미사로 추가 자동완성 검색 (병렬)
+        suffix_queries = [f"{keyword} {s}" for s in common_suffixes[:5]]  # 상위 5개만
+        import asyncio
+        await asyncio.gather(*[fetch_naver_ac(q) for q in suffix_queries], return_exceptions=True)
 
-            # ===== Method 6: 네이버 뉴스 자동완성 =====
-            try:
-                news_response = await client.get(
-                    "https://ac.search.naver.com/nx/ac",
-                    params={
-                        "q": keyword, "con": "1", "frm": "news", "ans": "2",
-                        "r_format": "json", "r_enc": "UTF-8", "q_enc": "UTF-8"
-                    },
-                    headers=headers
-                )
-                if news_response.status_code == 200:
-                    data = news_response.json()
-                    items = data.get("items", [[]])
-                    if items and len(items) > 0:
-                        for item in items[0][:20]:
-                            if isinstance(item, list) and len(item) > 0:
-                                add_keyword(item[0])
-            except Exception as e:
-                logger.debug(f"News AC failed: {e}")
-
-            # ===== Method 7: 추가 접미사 변형 (목표 100개 미달 시) =====
-            if len(related_keywords) < 100:
-                extra_suffixes = [
-                    "best", "top", "1위", "맛집", "병원", "의원", "샵", "센터",
-                    "2025", "2026", "최신", "신제품", "할인", "이벤트", "무료",
-                    "전문", "업체", "서비스", "온라인", "오프라인"
-                ]
-                for suffix in extra_suffixes:
-                    if len(related_keywords) >= 100:
-                        break
-                    add_keyword(f"{keyword} {suffix}")
+        # ===== Method 4: 초성/글자 추가 자동완성 =====
+        korean_chars = ['ㄱ', 'ㄴ', 'ㄷ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅅ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+        char_queries = [f"{keyword} {c}" for c in korean_chars[:7]]  # 상위 7개만
+        await asyncio.gather(*[fetch_naver_ac(q) for q in char_queries], return_exceptions=True)
+
+        # ===== Method 5: 네이버 블로그 자동완성 =====
+        try:
+            blog_response = await client.get(
+                "https://ac.search.naver.com/nx/ac",
+                params={
+                    "q": keyword, "con": "1", "frm": "blog", "ans": "2",
+                    "r_format": "json", "r_enc": "UTF-8", "q_enc": "UTF-8"
+                },
+                headers=headers
+            )
+            if blog_response.status_code == 200:
+                data = blog_response.json()
+                items = data.get("items", [[]])
+                if items and len(items) > 0:
+                    for item in items[0][:20]:
+                        if isinstance(item, list) and len(item) > 0:
+                            add_keyword(item[0])
+        except Exception as e:
+            logger.debug(f"Blog AC failed: {e}")
+
+        # ===== Method 6: 네이버 뉴스 자동완성 =====
+        try:
+            news_response = await client.get(
+                "https://ac.search.naver.com/nx/ac",
+                params={
+                    "q": keyword, "con": "1", "frm": "news", "ans": "2",
+                    "r_format": "json", "r_enc": "UTF-8", "q_enc": "UTF-8"
+                },
+                headers=headers
+            )
+            if news_response.status_code == 200:
+                data = news_response.json()
+                items = data.get("items", [[]])
+                if items and len(items) > 0:
+                    for item in items[0][:20]:
+                        if isinstance(item, list) and len(item) > 0:
+                            add_keyword(item[0])
+        except Exception as e:
+            logger.debug(f"News AC failed: {e}")
+
+        # ===== Method 7: 추가 접미사 변형 (목표 100개 미달 시) =====
+        if len(related_keywords) < 100:
+            extra_suffixes = [
+                "best", "top", "1위", "맛집", "병원", "의원", "샵", "센터",
+                "2025", "2026", "최신", "신제품", "할인", "이벤트", "무료",
+                "전문", "업체", "서비스", "온라인", "오프라인"
+            ]
+            for suffix in extra_suffixes:
+                if len(related_keywords) >= 100:
+                    break
+                add_keyword(f"{keyword} {suffix}")
 
         # 100개로 제한
         related_keywords = related_keywords[:100]
@@ -4697,7 +4378,8 @@ async def get_related_keywords_tree(
         }
 
         # 7. 캐시 저장 (6시간)
-        cache_keyword_tree(cache_key, response_data, ttl_hours=6)
+        await run_db(KEYWORD_ANALYSIS_DB_PATH, cache_keyword_tree,
+                     cache_key, response_data, ttl_hours=6, write=True)
 
         return KeywordTreeResponse(**response_data)
 
@@ -4738,7 +4420,7 @@ async def search_keyword_with_tabs(
     # 사용자 검색 키워드를 학습 풀에 자동 추가 (높은 우선순위)
     try:
         from database.learning_db import add_user_search_keyword
-        add_user_search_keyword(keyword)
+        await run_db(LEARNING_DB_PATH, add_user_search_keyword, keyword, write=True)
     except Exception as e:
         logger.debug(f"Could not add user search keyword: {e}")
 
@@ -4990,7 +4672,8 @@ async def search_keyword_with_tabs(
                 c_rank_detail = breakdown.get("c_rank_detail", {})
                 dia_detail = breakdown.get("dia_detail", {})
 
-                add_learning_sample(
+                await run_db(
+                    LEARNING_DB_PATH, add_learning_sample, write=True,
                     keyword=keyword,
                     blog_id=r.blog_id,
                     actual_rank=r.rank,  # 실제 네이버 검색 순위!
@@ -5023,18 +4706,20 @@ async def search_keyword_with_tabs(
     # ===== AUTO-LEARNING: 백그라운드에서 학습 (응답 속도에 영향 없음) =====
     async def background_learning():
         try:
-            all_samples = get_learning_samples(limit=200)  # 샘플 수 제한
+            all_samples = await run_db(LEARNING_DB_PATH, get_learning_samples, limit=200)  # 샘플 수 제한
             if len(all_samples) >= 10:
-                current_weights = get_current_weights()
+                current_weights = await run_db(LEARNING_DB_PATH, get_current_weights)
                 if current_weights:
-                    new_weights, training_info = train_model(
+                    # 학습은 CPU 작업 — 루프 밖에서.
+                    new_weights, training_info = await asyncio.to_thread(
+                        train_model,
                         samples=all_samples,
                         initial_weights=current_weights,
                         learning_rate=0.01,
                         epochs=15,  # 에폭 수 줄임
                         min_samples=10
                     )
-                    save_current_weights(new_weights)
+                    await run_db(LEARNING_DB_PATH, save_current_weights, new_weights, write=True)
                     logger.info(f"Background learning: {training_info.get('initial_accuracy', 0):.1f}% -> {training_info.get('final_accuracy', 0):.1f}%")
         except Exception as e:
             logger.warning(f"Background learning failed: {e}")
@@ -5626,27 +5311,27 @@ async def debug_searchad_status():
                 "showDetail": "1"
             }
 
-            async with httpx.AsyncClient(follow_redirects=True) as client:
-                response = await client.get(
-                    "https://api.searchad.naver.com/keywordstool",
-                    headers=headers,
-                    params=params,
-                    timeout=10.0
-                )
+            client = get_client("searchad")
+            response = await client.get(
+                "https://api.searchad.naver.com/keywordstool",
+                headers=headers,
+                params=params,
+                timeout=10.0
+            )
 
-                status["test_result"] = {
-                    "status_code": response.status_code,
-                    "success": response.status_code == 200
-                }
+            status["test_result"] = {
+                "status_code": response.status_code,
+                "success": response.status_code == 200
+            }
 
-                if response.status_code == 200:
-                    data = response.json()
-                    keyword_count = len(data.get("keywordList", []))
-                    status["test_result"]["keyword_count"] = keyword_count
-                    status["test_result"]["message"] = f"API 정상 작동 ({keyword_count}개 키워드 반환)"
-                else:
-                    status["test_result"]["response_text"] = response.text[:500]
-                    status["test_result"]["message"] = f"API 오류: {response.status_code}"
+            if response.status_code == 200:
+                data = response.json()
+                keyword_count = len(data.get("keywordList", []))
+                status["test_result"]["keyword_count"] = keyword_count
+                status["test_result"]["message"] = f"API 정상 작동 ({keyword_count}개 키워드 반환)"
+            else:
+                status["test_result"]["response_text"] = response.text[:500]
+                status["test_result"]["message"] = f"API 오류: {response.status_code}"
 
         except httpx.TimeoutException:
             status["error"] = "API 타임아웃 (10초 초과)"
@@ -5735,7 +5420,7 @@ async def search_health(request: SearchHealthRequest, refresh: bool = Query(Fals
     sample = max(5, min(int(request.sample_size or 10), 20))
 
     blog_stats = None
-    cached_analysis = get_cached_blog_analysis(blog_id)
+    cached_analysis = await get_cached_blog_analysis(blog_id)
     if cached_analysis:
         blog_stats = cached_analysis.get("stats")
 
@@ -5751,7 +5436,8 @@ async def search_health(request: SearchHealthRequest, refresh: bool = Query(Fals
     # 것만 읽는다 — 남은 게 없으면 '아직 확인 안 함' 이지 '정상' 이 아니다.
     try:
         from database.blog_diagnosis_db import write_search_health
-        write_search_health(blog_id, health)
+        from database.blog_index_history_db import INDEX_HISTORY_DB_PATH
+        await run_db(INDEX_HISTORY_DB_PATH, write_search_health, blog_id, health, write=True)
     except Exception as e:
         logger.debug(f"search health cache write skipped for {blog_id}: {e}")
 
@@ -5793,13 +5479,13 @@ async def verify_blog_index_endpoint(
         raise HTTPException(status_code=400, detail="blog_id is required")
 
     if not refresh:
-        cached = get_cached_verify_index(blog_id)
+        cached = await get_cached_verify_index(blog_id)
         if cached:
             return VerifyIndexResponse(**{**cached, "cached": True})
 
     # 가능하면 기존 분석 캐시에서 stats 가져와 Signal F (체인) 활성화
     blog_stats = None
-    cached_analysis = get_cached_blog_analysis(blog_id)
+    cached_analysis = await get_cached_blog_analysis(blog_id)
     if cached_analysis:
         blog_stats = cached_analysis.get("stats")
 
@@ -5831,7 +5517,7 @@ async def verify_blog_index_endpoint(
     }
 
     if response_data["ok"]:
-        set_verify_index_cache(blog_id, response_data)
+        await set_verify_index_cache(blog_id, response_data)
 
     return VerifyIndexResponse(**response_data)
 
@@ -5904,9 +5590,8 @@ async def judge_keyword_endpoint(request: KeywordJudgeRequest):
     3) (선택) 1페이지 경쟁자 체력 측정   — 경쟁
     4) 셋을 결합해 가능/경합/불가 + 확신도 판정
     """
-    from services.exposure_ceiling import (
-        measure_exposure_ceiling, judge_keyword, _fetch_volumes,
-    )
+    from services.exposure_ceiling import measure_exposure_ceiling, judge_keyword
+    from services import keyword_volume
 
     blog_id = (request.blog_id or "").strip()
     keyword = (request.keyword or "").strip()
@@ -5915,7 +5600,7 @@ async def judge_keyword_endpoint(request: KeywordJudgeRequest):
 
     # 천장 + 검색량 병렬
     ceiling_task = measure_exposure_ceiling(blog_id, use_cache=True)
-    vols_task = _fetch_volumes([keyword])
+    vols_task = keyword_volume.lookup([keyword])
 
     serp = None
     if request.include_serp:
@@ -5926,7 +5611,8 @@ async def judge_keyword_endpoint(request: KeywordJudgeRequest):
     else:
         ceiling, vols = await asyncio.gather(ceiling_task, vols_task)
 
-    target_volume = vols.get(keyword.replace(" ", ""), 0)
+    hit = vols.get(keyword)
+    target_volume = hit["monthly_total"] if hit else 0
     verdict = judge_keyword(ceiling, target_volume, serp=serp)
 
     # 정답지 축적: 판정을 원장에 기록(나중에 실측 순위로 검증 → calibration)
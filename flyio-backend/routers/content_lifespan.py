@@ -9,7 +9,9 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-import httpx
+
+from services import rss_feed
+from services.http_clients import get_client
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -155,77 +157,27 @@ def estimate_lifespan(content_type: str, title: str, days_since_publish: int) ->
 
 
 async def fetch_blog_posts_via_rss(blog_id: str) -> List[Dict]:
-    """RSS 피드를 통해 블로그 글 목록 가져오기"""
+    """RSS 피드를 통해 블로그 글 목록 가져오기 (services/rss_feed 캐시 경유)"""
     posts = []
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            # RSS 피드 요청
-            rss_url = f"https://rss.blog.naver.com/{blog_id}.xml"
-            response = await client.get(rss_url, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        feed = await rss_feed.get_feed(blog_id)
+        if not feed:
+            logger.error(f"RSS fetch failed: {blog_id}")
+            return posts
+
+        for item in feed["items"]:
+            if not item["title"]:
+                continue
+            posts.append({
+                'title': item["title"],
+                'link': item["link"],
+                'pubDate': rss_feed.published_at(item),
+                'content_length': item["text_length"],
+                'description_text': item["text"],  # 본문 요약(태그 제거) — 키워드 시드 확장용
             })
 
-            if response.status_code != 200:
-                logger.error(f"RSS fetch failed: {response.status_code}")
-                return posts
-
-            content = response.text
-
-            # XML 파싱
-            import xml.etree.ElementTree as ET
-
-            # RSS XML 추출
-            xml_start = content.find('<?xml')
-            if xml_start == -1:
-                xml_start = content.find('<rss')
-
-            if xml_start == -1:
-                logger.error("No RSS content found")
-                return posts
-
-            xml_content = content[xml_start:]
-            xml_end = xml_content.rfind('</rss>')
-            if xml_end != -1:
-                xml_content = xml_content[:xml_end + 6]
-
-            root = ET.fromstring(xml_content)
-            items = root.findall('.//item')
-
-            for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-                pub_date_elem = item.find('pubDate')
-                desc_elem = item.find('description')
-
-                if title_elem is None or title_elem.text is None:
-                    continue
-
-                post = {
-                    'title': title_elem.text,
-                    'link': link_elem.text if link_elem is not None else '',
-                    'pubDate': None,
-                    'content_length': 0,
-                    'description_text': ''  # 본문 요약(태그 제거) — 키워드 시드 확장용
-                }
-
-                # 발행일 파싱
-                if pub_date_elem is not None and pub_date_elem.text:
-                    try:
-                        from email.utils import parsedate_to_datetime
-                        post['pubDate'] = parsedate_to_datetime(pub_date_elem.text)
-                    except:
-                        pass
-
-                # 콘텐츠 길이 + 본문 텍스트(키워드 시드 확장용)
-                if desc_elem is not None and desc_elem.text:
-                    text = re.sub(r'<[^>]+>', '', desc_elem.text)
-                    post['content_length'] = len(text)
-                    post['description_text'] = text[:2000]  # 시드 추출용 상한
-
-                posts.append(post)
-
-            logger.info(f"Fetched {len(posts)} posts from RSS for {blog_id}")
+        logger.info(f"Fetched {len(posts)} posts from RSS for {blog_id}")
 
     except Exception as e:
         logger.error(f"Error fetching RSS for {blog_id}: {e}")
@@ -249,37 +201,37 @@ async def fetch_post_views(blog_id: str, post_link: str) -> tuple[int, int]:
 
         log_no = log_no_match.group(1)
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # 모바일 버전에서 조회수 가져오기 시도
-            mobile_url = f"https://m.blog.naver.com/{blog_id}/{log_no}"
-            response = await client.get(mobile_url, headers={
-                'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X)'
-            })
+        client = get_client("blog")
+        # 모바일 버전에서 조회수 가져오기 시도
+        mobile_url = f"https://m.blog.naver.com/{blog_id}/{log_no}"
+        response = await client.get(mobile_url, headers={
+            'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X)'
+        })
+
+        if response.status_code == 200:
+            content = response.text
 
-            if response.status_code == 200:
-                content = response.text
-
-                # 조회수 패턴 검색
-                view_patterns = [
-                    r'"sympathyCount"\s*:\s*(\d+)',
-                    r'"readCount"\s*:\s*(\d+)',
-                    r'조회\s*(\d{1,3}(?:,\d{3})*)',
-                    r'공감\s*(\d{1,3}(?:,\d{3})*)',
-                ]
-
-                views = 0
-                for pattern in view_patterns:
-                    match = re.search(pattern, content)
-                    if match:
-                        views = int(match.group(1).replace(',', ''))
-                        if views > 0:
-                            break
-
-                # peak_views는 현재로서는 추정
-                # 실제로는 히스토리 데이터가 필요
-                peak_views = int(views * 1.5) if views > 0 else 0
-
-                return (views, peak_views)
+            # 조회수 패턴 검색
+            view_patterns = [
+                r'"sympathyCount"\s*:\s*(\d+)',
+                r'"readCount"\s*:\s*(\d+)',
+                r'조회\s*(\d{1,3}(?:,\d{3})*)',
+                r'공감\s*(\d{1,3}(?:,\d{3})*)',
+            ]
+
+            views = 0
+            for pattern in view_patterns:
+                match = re.search(pattern, content)
+                if match:
+                    views = int(match.group(1).replace(',', ''))
+                    if views > 0:
+                        break
+
+            # peak_views는 현재로서는 추정
+            # 실제로는 히스토리 데이터가 필요
+            peak_views = int(views * 1.5) if views > 0 else 0
+
+            return (views, peak_views)
 
     except Exception as e:
         logger.debug(f"Error fetching views for {post_link}: {e}")
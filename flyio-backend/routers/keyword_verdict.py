@@ -71,10 +71,10 @@ async def keyword_deep(request: VerdictRequest):
     # 프로덕션(app: SCHEDULERS_DISABLED=1)은 worker 워치독이 2초 내 집어간다.
     if os.getenv("SCHEDULERS_DISABLED") != "1" and not q.get("reused"):
         import asyncio
-        from services.keyword_verdict_queue import claim, run_job
+        from services.keyword_verdict_queue import aclaim, run_job
 
         async def _inline():
-            job = claim()
+            job = await aclaim()
             if job:
                 await run_job(job)
 
@@ -113,14 +113,14 @@ async def keyword_deep_result(job_id: str):
 @router.get("/debug/queue")
 async def debug_queue():
     """큐/워치독 상태. 워치독 하트비트가 늙어 있으면 워커 루프가 막힌 것이다."""
-    from services.keyword_verdict_queue import _all_jobs, read_heartbeat, _JOB_DIR
+    from services.keyword_verdict_queue import QUEUE, list_jobs, read_heartbeat
 
-    jobs = _all_jobs()
+    jobs = list_jobs(limit=200)
     hb = read_heartbeat()
+    st = QUEUE.stats()
     return {
-        "job_dir": _JOB_DIR,
-        "counts": {s: sum(1 for j in jobs if j.get("status") == s)
-                   for s in ("queued", "running", "done", "error")},
+        "queue": QUEUE.name,
+        "counts": st["counts"],
         "running": [{"job_id": j["job_id"], "phase": j.get("phase"),
                      "keyword": j.get("keyword"), "attempts": j.get("attempts"),
                      "age": round(time.time() - float(j.get("claimed_at") or 0), 1)}
@@ -128,9 +128,9 @@ async def debug_queue():
         "recent_errors": [{"job_id": j["job_id"], "keyword": j.get("keyword"),
                            "error": j.get("error"), "phase": j.get("phase")}
                           for j in jobs if j.get("status") == "error"][:5],
-        "oldest_queued_age": round(time.time() - min(
-            [float(j.get("requested_at") or 0) for j in jobs
-             if j.get("status") == "queued"] or [time.time()]), 1),
+        "oldest_queued_age": st["oldest_queued_age"],
+        "wait_p50": st["wait_p50"],
+        "wait_p95": st["wait_p95"],
         "heartbeat": hb,
         "heartbeat_age": round(time.time() - float(hb["ts"]), 1) if hb else None,
     }
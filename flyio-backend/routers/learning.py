@@ -294,9 +294,9 @@ async def get_deviation_analysis():
         - keyword_analysis: 키워드별 분석 결과
     """
     try:
-        from scipy.stats import spearmanr, rankdata
+        from scipy.stats import spearmanr
         import numpy as np
-        from collections import defaultdict
+        from services.grouped_ranking import build_group_index, grouped_metrics
 
         samples = get_learning_samples(limit=1000)
         current_weights = get_current_weights()
@@ -313,74 +313,56 @@ async def get_deviation_analysis():
         # 그러면 예측 순위는 1..60 인데 actual_rank 는 1..10 뿐이라 편차가 폭발하고,
         # 정확도가 무작위보다 낮게 나온다(실측: 4.5%, spearman 0.022).
         # blog_id 로 중복 제거하고 최신 수집분만 남긴다(samples 는 collected_at DESC).
-        keyword_groups = defaultdict(list)
-        _seen = set()
-        for s in samples:
-            keyword = s.get('keyword', '')
-            _k = (keyword, s.get('blog_id'))
-            if _k in _seen:
-                continue
-            if keyword and s.get('actual_rank') and s.get('predicted_score'):
-                _seen.add(_k)
-                keyword_groups[keyword].append({
-                    'keyword': keyword,
-                    'blog_id': s.get('blog_id', ''),
-                    'actual_rank': s.get('actual_rank'),
-                    'predicted_score': s.get('predicted_score'),
-                    'c_rank_score': s.get('c_rank_score', 0),
-                    'dia_score': s.get('dia_score', 0),
-                    'post_count': s.get('post_count', 0),
-                    'neighbor_count': s.get('neighbor_count', 0)
-                })
+        # 그룹 구성·그룹 안 순위는 grouped_ranking 이 전 키워드를 한 번에 계산한다.
+        eligible = np.array([
+            bool(s.get('keyword', '') and s.get('actual_rank') and s.get('predicted_score'))
+            for s in samples
+        ], dtype=bool)
+        keywords_found = len({s.get('keyword') for s, ok in zip(samples, eligible) if ok})
 
         # 최소 10개 블로그가 있는 키워드만 분석
-        valid_keywords = {k: v for k, v in keyword_groups.items() if len(v) >= 10}
+        groups = build_group_index(samples, eligible=eligible, drop_unparsed=False, min_size=10)
 
-        if not valid_keywords:
+        if groups.n_groups == 0:
             return {
                 "message": "유효한 키워드 그룹이 없습니다. 최소 10개 블로그가 있는 키워드가 필요합니다.",
                 "total_samples": len(samples),
-                "keywords_found": len(keyword_groups),
+                "keywords_found": keywords_found,
                 "overall_deviation": None
             }
 
-        # ===== 키워드별로 순위 계산 =====
-        all_deviations = []
-        keyword_results = []
-        all_sample_details = []
+        # ===== 키워드별로 순위 계산 (해당 키워드 내에서만!) =====
+        scores = np.array([s.get('predicted_score') or 0 for s in samples], dtype=np.float64)
+        gm = grouped_metrics(groups, scores)
 
-        for keyword, group in valid_keywords.items():
-            # 해당 키워드 내에서만 순위 계산
-            actual_ranks = np.array([s['actual_rank'] for s in group])
-            predicted_scores = np.array([s['predicted_score'] for s in group])
-
-            # 예측 점수를 순위로 변환 (해당 키워드 내에서만!)
-            predicted_ranks = rankdata(-predicted_scores, method='ordinal')
-
-            # 순위 차이 계산
-            rank_diffs = np.abs(predicted_ranks - actual_ranks)
-            all_deviations.extend(rank_diffs.tolist())
-
-            # 키워드별 결과 저장
-            keyword_results.append({
-                'keyword': keyword,
-                'sample_count': len(group),
-                'avg_deviation': round(float(np.mean(rank_diffs)), 2),
-                'exact_match': round(float(np.mean(rank_diffs == 0) * 100), 1),
-                'within_3': round(float(np.mean(rank_diffs <= 3) * 100), 1),
-                'correlation': round(float(spearmanr(actual_ranks, predicted_ranks)[0]), 3) if len(group) > 2 else 0
-            })
+        keyword_results = [{
+            'keyword': keyword,
+            'sample_count': int(groups.sizes[g]),
+            'avg_deviation': round(float(gm.avg_deviation[g]), 2),
+            'exact_match': round(float(gm.exact_match[g]), 1),
+            'within_3': round(float(gm.within_3[g]), 1),
+            'correlation': round(float(gm.spearman[g]), 3) if groups.sizes[g] > 2 else 0
+        } for g, keyword in enumerate(groups.keywords)]
 
-            # 개별 샘플 정보 저장
-            for i, s in enumerate(group):
-                all_sample_details.append({
-                    **s,
-                    'predicted_rank': int(predicted_ranks[i]),
-                    'deviation': int(rank_diffs[i])
-                })
+        # 개별 샘플 정보 저장
+        all_sample_details = []
+        for t, i in enumerate(groups.rows):
+            s = samples[i]
+            all_sample_details.append({
+                'keyword': s.get('keyword', ''),
+                'blog_id': s.get('blog_id', ''),
+                'actual_rank': s.get('actual_rank'),
+                'predicted_score': s.get('predicted_score'),
+                'c_rank_score': s.get('c_rank_score', 0),
+                'dia_score': s.get('dia_score', 0),
+                'post_count': s.get('post_count', 0),
+                'neighbor_count': s.get('neighbor_count', 0),
+                'predicted_rank': int(gm.predicted_rank[t]),
+                'deviation': int(gm.deviation[t])
+            })
+        all_deviations = gm.deviation
 
         # ===== 전체 통계 계산 =====
-        all_deviations = np.array(all_deviations)
         overall_deviation = float(np.mean(all_deviations))
 
         # 전체 상관관계 계산
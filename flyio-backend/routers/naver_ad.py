@@ -20,6 +20,10 @@ from services.naver_ad_service import (
     BidStrategy,
     get_optimizer
 )
+from database.async_db import adb
+from database.connection_pool import pooled
+from services import keyword_volume
+from services.keyword_relevance import compile_relevance
 from database.naver_ad_db import (
     init_naver_ad_tables,
     get_optimization_settings,
@@ -36,6 +40,7 @@ from database.naver_ad_db import (
     get_optimization_logs,
     get_dashboard_stats,
     save_bid_change,
+    save_bid_changes,
     save_excluded_keyword,
     save_discovered_keywords,
     save_optimization_log,
@@ -324,22 +329,21 @@ async def run_optimization_once(
         # 최적화 실행
         changes = await optimizer.bid_optimizer.optimize_all_keywords(ad_group_ids)
 
-        # 변경 내역 저장
-        for change in changes:
-            save_bid_change(
-                user_id=user_id,
-                keyword_id=change.keyword_id,
-                keyword_text=change.keyword,
-                old_bid=change.old_bid,
-                new_bid=change.new_bid,
-                reason=change.reason,
-                strategy=settings.get("strategy", "balanced") if settings else "balanced"
-            )
+        report = optimizer.bid_optimizer.last_report or {}
+        failed = report.get("failed", [])
+
+        # 변경 내역 저장 (executemany 한 번)
+        save_bid_changes(
+            user_id, changes,
+            strategy=settings.get("strategy", "balanced") if settings else "balanced"
+        )
 
         save_optimization_log(
             user_id, "optimization_run",
-            f"입찰 최적화 완료: {len(changes)}개 키워드 변경",
-            {"changes_count": len(changes)}
+            f"입찰 최적화 완료: {len(changes)}개 키워드 변경"
+            + (f", {len(failed)}개 실패" if failed else ""),
+            {"changes_count": len(changes), "failed_count": len(failed),
+             "put_calls": report.get("put_calls", 0), "stats_source": report.get("stats_source")}
         )
 
         return {
@@ -354,7 +358,8 @@ async def run_optimization_once(
                     "reason": c.reason
                 }
                 for c in changes
-            ]
+            ],
+            "failed": failed,
         }
     except Exception as e:
         logger.error(f"Run optimization error: {e}")
@@ -2332,35 +2337,12 @@ def _compute_relevance_score(
       "오피스텔분양"   → ~80  (3+ atom "오피스텔")
       "포켓몬카드"     → ~8   (2-gram "카드" + POOL "카드" — 약함)
       "도박중독"       → 0    (어떤 매칭도 없음)
+
+    알고리즘은 services/keyword_relevance.relevance_score 와 같다. 시드 원자를 부를 때마다
+    다시 만들지 않도록 (시드, POOL) 별로 캐시된 컴파일 매처에 위임한다. 키워드 여러 개를
+    한 번에 채점할 때는 compile_relevance(...).score_many 를 쓴다.
     """
-    if not kw:
-        return 0
-    # 1) user_seed 전체 매칭 — 가장 강한 신호
-    for s in user_seeds:
-        if not s or len(s) < 2:
-            continue
-        if s in kw:
-            return 100
-        if kw in s:
-            return 95
-    # 2) atom 분리
-    atoms_3plus: set = set()
-    atoms_2: set = set()
-    for s in user_seeds:
-        if not s or len(s) < 2:
-            continue
-        if len(s) >= 4:
-            atoms_3plus.add(s)
-        for n in (2, 3):
-            for i in range(len(s) - n + 1):
-                a = s[i:i + n]
-                (atoms_2 if len(a) == 2 else atoms_3plus).add(a)
-    # 3) 매칭 카운트 (집합 차이로 중복 제외)
-    n_3 = sum(1 for a in atoms_3plus if a in kw)
-    n_2 = sum(1 for a in atoms_2 if a in kw)
-    n_pool = sum(1 for t in pool_tokens if t in kw)
-    score = min(80, n_3 * 20) + min(30, n_2 * 5) + min(15, n_pool * 3)
-    return min(95, score)  # 95 cap — 100 은 full seed match 전용
+    return compile_relevance(user_seeds, pool_tokens).score(kw)
 
 
 def _resolve_account(user_id: int, customer_id: Optional[str] = None) -> Optional[Dict]:
@@ -2416,7 +2398,6 @@ async def _cap_triggered_self_heal(
     """
     from services.naver_ad_service import NaverAdApiClient
     from database.naver_ad_db import record_auto_cleanup_run
-    import sqlite3 as _sqlite3
 
     if not saved_relevance or len([s for s in saved_relevance if s and len(s) >= 2]) < 3:
         logger.warning(
@@ -2428,7 +2409,7 @@ async def _cap_triggered_self_heal(
     reg = get_registered_keywords_db()
     pool = get_keyword_pool_db()
 
-    with _sqlite3.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         rows = conn.execute(
             "SELECT keyword, ncc_keyword_id FROM registered_keywords "
             "WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL",
@@ -2502,7 +2483,7 @@ async def _cap_triggered_self_heal(
         return False
 
     def _drop_db_row(kid_: str) -> None:
-        with _sqlite3.connect(reg.db_path) as c:
+        with pooled(reg.db_path) as c:
             c.execute(
                 "DELETE FROM registered_keywords "
                 "WHERE account_customer_id=? AND ncc_keyword_id=?",
@@ -2538,7 +2519,7 @@ async def _cap_triggered_self_heal(
 
     if affected:
         try:
-            pool.mark_rejected_by_naver(
+            await adb(pool).mark_rejected_by_naver(
                 customer_id,
                 [{"keyword": kw, "reason": f"cap_self_heal(≤{threshold})"} for kw in affected],
             )
@@ -2594,7 +2575,7 @@ async def _cap_triggered_rolling_heal(
 
     # JOIN — 같은 blog_analyzer.db 내. naverad_keyword_pool 에서 mt 최하위 + 24h 정착 +
     # registered_keywords 의 ncc_keyword_id 확보된 KW 만.
-    with _sqlite3.connect(pool.db_path) as conn:
+    with pooled(pool.db_path) as conn:
         conn.row_factory = _sqlite3.Row
         rows = conn.execute(
             f"""SELECT rk.keyword AS keyword,
@@ -2640,7 +2621,7 @@ async def _cap_triggered_rolling_heal(
         return False
 
     def _drop_db_row(kid_: str) -> None:
-        with _sqlite3.connect(reg.db_path) as c:
+        with pooled(reg.db_path) as c:
             c.execute(
                 "DELETE FROM registered_keywords "
                 "WHERE account_customer_id=? AND ncc_keyword_id=?",
@@ -2678,7 +2659,7 @@ async def _cap_triggered_rolling_heal(
 
     if affected:
         try:
-            pool.mark_rejected_by_naver(
+            await adb(pool).mark_rejected_by_naver(
                 customer_id,
                 [{"keyword": kw, "reason": f"rolling_heal(mt<{mt_ceiling})"} for kw in affected],
             )
@@ -2721,7 +2702,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
     else:
         account = get_ad_account(uid)
     if not account or not account.get("is_connected"):
-        pool.record_run(uid, customer_id, "collect", "no_account",
+        await adb(pool).record_run(uid, customer_id, "collect", "no_account",
                         error_message="광고 계정 미연결",
                         duration_ms=int((_time.monotonic()-t0)*1000))
         return
@@ -2733,7 +2714,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
     # 내려가면 collect ADD gate 와 cap self-heal DELETE gate 를 함께 낮춰(대칭) thrash 없이
     # 관련성 낮은 롱테일까지 순서대로 흡수 → 10만 채우기. level≥2 면 조합 시드 주입 발동.
     try:
-        _esc = pool.get_escalation(customer_id)
+        _esc = await adb(pool).get_escalation(customer_id)
         _esc_floor = int(_esc.get("relevance_floor") or 50)
         _esc_level = int(_esc.get("level") or 0)
     except Exception:
@@ -2748,8 +2729,8 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
         min_volume = max(min_volume, 10)
 
     reg = get_registered_keywords_db()
-    pool_pending = (pool.stats(customer_id).get("by_status") or {}).get("pending", 0)
-    active_reg = int((reg.stats(customer_id) or {}).get("active") or 0)
+    pool_pending = ((await adb(pool).stats(customer_id)).get("by_status") or {}).get("pending", 0)
+    active_reg = int((await adb(reg).stats(customer_id) or {}).get("active") or 0)
     headroom = 100_000 - active_reg - pool_pending
     # saturation 가드 — ≥95% (headroom ≤ 5000) 부터 self_heal 발동.
     # cleanup 으로 슬롯 회수되면 같은 tick 에서 곧바로 collect 이어 진행 (early return X) →
@@ -2791,7 +2772,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
         # 진행 → 물갈이 속도 ↑ (다음 5분 tick 대기 제거).
         if cleaned_total > 0:
             try:
-                pool.record_run(
+                await adb(pool).record_run(
                     uid, customer_id, "collect", "self_heal_cleanup",
                     pending_after=pool_pending,
                     error_message=(
@@ -2812,7 +2793,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
         elif headroom <= 0:
             # 100% 도달 + cleanup 0 → 진행 불가. 다음 tick 대기.
             logger.warning(f"[pool/collect] user={uid} 한도 도달 — skip (active={active_reg}, pending={pool_pending})")
-            pool.record_run(uid, customer_id, "collect", "cap_reached",
+            await adb(pool).record_run(uid, customer_id, "collect", "cap_reached",
                             pending_after=pool_pending,
                             error_message=f"active={active_reg}+pending={pool_pending}≥100000",
                             duration_ms=int((_time.monotonic()-t0)*1000))
@@ -2827,8 +2808,8 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
     #      collect 게이트를 좁게 유지 → 풀에 잡음 시드 있어도 drift 차단.
     from database.naver_ad_db import get_ad_account_relevance_keywords as _get_rel
     saved_relevance = _get_rel(uid, str(customer_id))
-    initial_seeds = pool.list_seed_whitelist(customer_id)
-    initial_user_seeds_only = pool.list_user_seeds(customer_id)
+    initial_seeds = await adb(pool).list_seed_whitelist(customer_id)
+    initial_user_seeds_only = await adb(pool).list_user_seeds(customer_id)
     cold_start = not initial_user_seeds_only
 
     if saved_relevance and len(saved_relevance) >= 1:
@@ -2944,7 +2925,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
 
     # 자동 승격 시드 중 자식 0 + 30분 경과 자력 삭제 (user_seed는 면제)
     try:
-        childless = pool.cleanup_childless_auto_seeds(customer_id, min_age_minutes=30)
+        childless = await adb(pool).cleanup_childless_auto_seeds(customer_id, min_age_minutes=30)
         if childless > 0:
             logger.warning(f"[pool/cleanup] 자식 0 자동 시드 자력 삭제 {childless}개")
     except Exception as e:
@@ -2955,7 +2936,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
     # 합류 → 다음 라운드 그 niche cascade drift 발생을 차단. 그 niche 는 bridge 가
     # 매 라운드 재호출하므로 promote 없어도 새 KW 발굴 계속됨.
     try:
-        promoted = pool.promote_seeds(
+        promoted = await adb(pool).promote_seeds(
             customer_id, limit=50, min_volume=30, max_total_seeds=500,
             domain_tokens=list(anchor_set),
         )
@@ -2970,10 +2951,10 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
                 pass
             elif cold_start:
                 domain_token_set = _build_domain_token_set(
-                    pool.list_seed_whitelist(customer_id)
+                    await adb(pool).list_seed_whitelist(customer_id)
                 )
             else:
-                fresh_user_seeds = pool.list_user_seeds(customer_id) or initial_user_seeds_only
+                fresh_user_seeds = await adb(pool).list_user_seeds(customer_id) or initial_user_seeds_only
                 domain_token_set = _derive_seed_tokens(fresh_user_seeds) | _build_seed_atoms(fresh_user_seeds)
     except Exception as e:
         logger.warning(f"[pool/collect] promote_seeds 실패: {e}")
@@ -2983,12 +2964,12 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
     # bridge 시드 ("대출/렌탈/배달/미용" 등) 가 풀 row 자식으로 살아있는 한 매 라운드
     # keywordstool 호출에 사용 → API quota 낭비 + 잔재 재활성화 risk. list_seed_whitelist
     # 는 source IN ('user_seed', 'auto_promoted_seed') 만 반환해 legacy POOL bridge 차단.
-    seeds = pool.list_seed_whitelist(customer_id)
+    seeds = await adb(pool).list_seed_whitelist(customer_id)
     if not seeds:
         # 자가치유 (a): 등록 키워드 중 검색량 상위 10개를 user_seed 로 자동 reseed.
         # 시드가 비면 collection 영구 정지 → 등록 키워드에서 핵심어 자동 추출.
         try:
-            top_kw = pool.list_top_registered(customer_id, limit=10, min_volume=100)
+            top_kw = await adb(pool).list_top_registered(customer_id, limit=10, min_volume=100)
         except Exception as e:
             logger.warning(f"[pool/collect] auto-reseed 후보 조회 실패: {e}")
             top_kw = []
@@ -2997,7 +2978,8 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
         # 재주입되는 catastrophic loop 차단.
         if top_kw and saved_relevance and len([s for s in saved_relevance if s and len(s) >= 2]) >= 3:
             before = len(top_kw)
-            top_kw = [k for k in top_kw if _compute_relevance_score(k, saved_relevance) > 30]
+            _scores = compile_relevance(saved_relevance).score_many(top_kw)
+            top_kw = [k for k, sc in zip(top_kw, _scores) if sc > 30]
             if before != len(top_kw):
                 logger.warning(
                     f"[pool/collect] auto-reseed 도메인 게이트 — {before} → {len(top_kw)}"
@@ -3005,7 +2987,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
         if top_kw:
             items = [{"keyword": k, "seed": k, "source": "user_seed", "monthly_total": 0} for k in top_kw]
             try:
-                pool.add_candidates(uid, customer_id, items)
+                await adb(pool).add_candidates(uid, customer_id, items)
                 logger.warning(
                     f"[pool/collect] user={uid} 시드 자동 복구 {len(top_kw)}개: "
                     + ", ".join(top_kw[:5]) + (" ..." if len(top_kw) > 5 else "")
@@ -3015,7 +2997,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
                 logger.warning(f"[pool/collect] auto-reseed insert 실패: {e}")
         if not seeds:
             logger.warning(f"[pool/collect] user={uid} 시드 없음 + 등록 키워드 없음 — UI에서 초기 시드 제공 필요")
-            pool.record_run(uid, customer_id, "collect", "no_seed",
+            await adb(pool).record_run(uid, customer_id, "collect", "no_seed",
                             pending_after=pool_pending,
                             error_message="UI에서 초기 시드 추가 필요",
                             duration_ms=int((_time.monotonic()-t0)*1000))
@@ -3023,11 +3005,11 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
 
     # 화이트리스트 (keywordstool 호출용): user_seed + auto_promoted_seed.
     # 발굴 다양성은 유지하되, 게이트 atom 은 user_seed 만으로 좁힘 (cascade drift 차단).
-    whitelist = pool.list_seed_whitelist(customer_id)
+    whitelist = await adb(pool).list_seed_whitelist(customer_id)
     if not whitelist:
         whitelist = seeds  # 폴백
     # 게이트 seed_atoms 는 user_seed 만 — promoted 가 발굴해온 KW 도 user_seed atom 매치 필수.
-    user_seed_now = pool.list_user_seeds(customer_id) or initial_user_seeds_only
+    user_seed_now = await adb(pool).list_user_seeds(customer_id) or initial_user_seeds_only
     seed_atoms = _build_seed_atoms(user_seed_now) if user_seed_now else _build_seed_atoms(whitelist)
 
     # 통합 게이트 — domain_token_set ∪ seed_atoms ∪ registered_atoms.
@@ -3043,7 +3025,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
     loose_mode = False
     if cold_start:
         try:
-            recent = pool.recent_runs(customer_id, limit=5)
+            recent = await adb(pool).read.recent_runs(customer_id, limit=5)
             collects = [r for r in recent if r.get("kind") == "collect"]
             if len(collects) >= 3:
                 high_reject = sum(
@@ -3115,11 +3097,11 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
     classified_reject_set: Set[str] = set()
     pool_kw_set: Set[str] = set()
     try:
-        classified_reject_set = set(pool.list_classified_reject_keywords(customer_id))
+        classified_reject_set = set(await adb(pool).list_classified_reject_keywords(customer_id))
     except Exception as e:
         logger.warning(f"[pool/collect] classified set 로드 실패: {e}")
     try:
-        pool_kw_set = pool.list_pool_keyword_set(customer_id)
+        pool_kw_set = await adb(pool).list_pool_keyword_set(customer_id)
     except Exception as e:
         logger.warning(f"[pool/collect] pool_kw_set 로드 실패: {e}")
     api_errors: List[str] = []
@@ -3130,7 +3112,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
     # keywordstool 결과가 모두 중복이라 같은 시드로는 새 발굴 불가능. 시드 확장 주입.
     saturated = False
     try:
-        sat = pool.detect_saturation(customer_id, n_recent=5)
+        sat = await adb(pool).detect_saturation(customer_id, n_recent=5)
         saturated = bool(sat.get("is_saturated"))
     except Exception:
         pass
@@ -3199,7 +3181,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
     registered_round: List[str] = []
     if not cold_start:
         try:
-            registered_round = pool.list_registered_random_seeds(
+            registered_round = await adb(pool).list_registered_random_seeds(
                 customer_id, limit=120, min_volume=10,
             )
         except Exception as e:
@@ -3346,7 +3328,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
         candidates: List[Dict] = []
         bfs_pool: List[tuple] = []
         _process_keyword_items(items, seed_label, candidates, bfs_pool)
-        added += pool.add_candidates(uid, customer_id, candidates)
+        added += await adb(pool).add_candidates(uid, customer_id, candidates)
         await asyncio.sleep(0.3)
 
         # BFS 2nd-level — 배치당 검색량 상위 4개 (발굴 면적 2배, 비용 0 — keywordstool 무료).
@@ -3360,7 +3342,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
                 items2 = related2.get("keywordList", []) if isinstance(related2, dict) else []
                 sub_candidates: List[Dict] = []
                 _process_keyword_items(items2, seed_label, sub_candidates, [])
-                added += pool.add_candidates(uid, customer_id, sub_candidates)
+                added += await adb(pool).add_candidates(uid, customer_id, sub_candidates)
                 await asyncio.sleep(0.3)
             except Exception as e:
                 logger.warning(f"[pool/collect/BFS] {bfs_kw} 실패: {e}")
@@ -3377,7 +3359,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
     # 백업 cron (_ai_classify_tick) 의 입력 풀 + UI 카운터 표시용.
     if reject_for_ai:
         try:
-            saved = pool.add_rejects(customer_id, reject_for_ai[:1000])
+            saved = await adb(pool).add_rejects(customer_id, reject_for_ai[:1000])
             if saved:
                 logger.warning(
                     f"[pool/collect] AI 분류 후보 reject {saved}개 누적 (검색량≥100)"
@@ -3413,7 +3395,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
             top_rejects = sorted(
                 reject_for_ai, key=lambda r: -int(r.get("monthly_total") or 0)
             )[:2000]
-            ai_seeds_input = pool.list_user_seeds(customer_id) or whitelist
+            ai_seeds_input = await adb(pool).list_user_seeds(customer_id) or whitelist
             if ai_seeds_input and top_rejects:
                 ai_t0 = _time.monotonic()
                 BATCH = 200
@@ -3476,7 +3458,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
                     _inline_thr = int(_thr_cfg_inline.get("threshold") or 50)
                     _rel_basis = _get_rel_inline(uid, str(customer_id)) or []
                     if not _rel_basis:
-                        _rel_basis = [s for s in (pool.list_user_seeds(customer_id) or []) if s and len(s) >= 2]
+                        _rel_basis = [s for s in (await adb(pool).list_user_seeds(customer_id) or []) if s and len(s) >= 2]
                     ai_inline_fallback = True
                     existing = set(approved)
                     # 검색량 상위 중 점수 ≥ threshold 만 보충 — drift 차단
@@ -3515,19 +3497,19 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
                         for k in approved
                     ]
                     try:
-                        inline_ai_added = pool.add_candidates(
+                        inline_ai_added = await adb(pool).add_candidates(
                             uid, customer_id, inline_items
                         )
                         added += inline_ai_added  # 헤드룸 카운트 정확화
                     except Exception as e:
                         logger.warning(f"[pool/collect/ai-inline] add 실패: {e}")
                     try:
-                        pool.mark_rejects_classified(customer_id, approved, "promoted")
+                        await adb(pool).mark_rejects_classified(customer_id, approved, "promoted")
                     except Exception:
                         pass
                 if discarded:
                     try:
-                        pool.mark_rejects_classified(customer_id, discarded, "discarded")
+                        await adb(pool).mark_rejects_classified(customer_id, discarded, "discarded")
                     except Exception:
                         pass
                 logger.warning(
@@ -3543,7 +3525,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
     except Exception as e:
         logger.warning(f"[pool/collect/ai-inline] 예외: {type(e).__name__}: {e}", exc_info=True)
     # ===========================================================================
-    pending_after = (pool.stats(customer_id).get("by_status") or {}).get("pending", 0)
+    pending_after = ((await adb(pool).stats(customer_id)).get("by_status") or {}).get("pending", 0)
     err_parts = list(api_errors)
     if circuit_aborted:
         err_parts.append(
@@ -3561,7 +3543,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
         )
     if direct_added > 0:
         err_parts.append(f"reject-direct 자식 +{direct_added} (mt 30~99, GPT 우회)")
-    pool.record_run(
+    await adb(pool).record_run(
         uid, customer_id, "collect",
         "success" if not api_errors else ("partial" if added > 0 else "failed"),
         added=added, skipped=rejected, seeds_count=seeds_processed,
@@ -3573,7 +3555,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
     # 데드락 감지 — 최근 5회 collect 가 전부 added=0 + reject ≥ 500 이면 alert.
     # 사용자가 며칠 동안 0건인 걸 모르고 지나치는 사고 방지.
     try:
-        deadlock = pool.detect_collect_deadlock(customer_id, n_recent=5, min_rejected=500)
+        deadlock = await adb(pool).detect_collect_deadlock(customer_id, n_recent=5, min_rejected=500)
         if deadlock.get("is_deadlock"):
             logger.error(
                 f"[pool/collect] DEADLOCK user={uid} customer={customer_id} "
@@ -3581,7 +3563,7 @@ async def _run_pool_collect(uid: int, customer_id: Optional[int] = None, max_new
                 f"누적 reject {deadlock['total_rejected']}. "
                 f"시드/도메인 토큰 점검 필요."
             )
-            pool.record_run(
+            await adb(pool).record_run(
                 uid, customer_id, "collect", "alert",
                 error_message=(
                     f"[DEADLOCK] {deadlock['consecutive_zero_runs']}회 연속 0건. "
@@ -3623,7 +3605,7 @@ async def _run_pool_ai_classify(
 
     # 쿨다운 — 매번 GPT 호출 비용/품질 안정 위해 광고주별 30분 간격 강제
     if not force:
-        last = pool.get_classify_cooldown(customer_id)
+        last = await adb(pool).get_classify_cooldown(customer_id)
         if last:
             try:
                 last_dt = datetime.fromisoformat(str(last).replace("T", " ").split(".")[0])
@@ -3640,12 +3622,12 @@ async def _run_pool_ai_classify(
             except Exception:
                 pass  # 파싱 실패 시 그냥 진행
 
-    user_seeds = pool.list_user_seeds(customer_id)
+    user_seeds = await adb(pool).list_user_seeds(customer_id)
     if not user_seeds:
         logger.warning(f"[pool/ai-classify] user={uid} cid={customer_id} user_seed 없음 — skip")
         return {"success": False, "reason": "no_user_seed"}
 
-    rejects = pool.list_unclassified_rejects(
+    rejects = await adb(pool).list_unclassified_rejects(
         customer_id, limit=candidates_limit, min_volume=min_volume
     )
     if not rejects:
@@ -3671,7 +3653,7 @@ async def _run_pool_ai_classify(
     if not result.get("success"):
         msg = result.get("message", "unknown")
         logger.warning(f"[pool/ai-classify] user={uid} 분류 실패: {msg}")
-        pool.record_run(
+        await adb(pool).record_run(
             uid, customer_id, "ai_classify", "failed",
             error_message=msg[:300],
             duration_ms=int((_time.monotonic() - t0) * 1000),
@@ -3695,19 +3677,19 @@ async def _run_pool_ai_classify(
             for k in approved
         ]
         try:
-            promoted = pool.add_candidates(uid, customer_id, items)
+            promoted = await adb(pool).add_candidates(uid, customer_id, items)
         except Exception as e:
             logger.warning(f"[pool/ai-classify] promote 실패: {e}")
 
     try:
         if approved:
-            pool.mark_rejects_classified(customer_id, approved, "promoted")
+            await adb(pool).mark_rejects_classified(customer_id, approved, "promoted")
         if discarded:
-            pool.mark_rejects_classified(customer_id, discarded, "discarded")
+            await adb(pool).mark_rejects_classified(customer_id, discarded, "discarded")
     except Exception as e:
         logger.warning(f"[pool/ai-classify] mark 실패: {e}")
 
-    pool.stamp_classify_cooldown(customer_id)
+    await adb(pool).stamp_classify_cooldown(customer_id)
 
     duration_ms = int((_time.monotonic() - t0) * 1000)
     logger.warning(
@@ -3715,7 +3697,7 @@ async def _run_pool_ai_classify(
         f"approved={len(approved)} promoted={promoted} discarded={len(discarded)} "
         f"({duration_ms}ms) rationale={(result.get('rationale') or '')[:100]}"
     )
-    pool.record_run(
+    await adb(pool).record_run(
         uid, customer_id, "ai_classify",
         "success" if approved else "no_match",
         added=promoted, skipped=len(discarded),
@@ -3766,7 +3748,6 @@ async def _run_pool_ai_cleanup_registered(
     from database.naver_ad_db import get_ad_account_by_customer
     from config import settings
     import time as _time
-    import sqlite3 as _sql
 
     pool = get_keyword_pool_db()
     reg = get_registered_keywords_db()
@@ -3779,12 +3760,12 @@ async def _run_pool_ai_cleanup_registered(
     if not account or not account.get("is_connected"):
         return {"success": False, "reason": "no_account"}
 
-    user_seeds = pool.list_user_seeds(customer_id)
+    user_seeds = await adb(pool).list_user_seeds(customer_id)
     if not user_seeds:
         return {"success": False, "reason": "no_user_seed"}
 
     # 1) 등록 KW 조회
-    with _sql.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         if incremental_minutes:
             rows = conn.execute(
                 "SELECT keyword, ncc_keyword_id FROM registered_keywords "
@@ -3802,7 +3783,7 @@ async def _run_pool_ai_cleanup_registered(
             ).fetchall()
 
     if not rows:
-        pool.record_run(
+        await adb(pool).record_run(
             uid, customer_id, "ai_cleanup", "no_new",
             error_message="audit 대상 0",
             duration_ms=int((_time.monotonic() - t0) * 1000),
@@ -3874,13 +3855,13 @@ async def _run_pool_ai_cleanup_registered(
                 continue
             try:
                 await client.delete_keyword(kid)
-                with _sql.connect(reg.db_path) as conn:
+                with pooled(reg.db_path) as conn:
                     conn.execute(
                         "DELETE FROM registered_keywords "
                         "WHERE account_customer_id=? AND ncc_keyword_id=?",
                         (customer_id, kid),
                     )
-                with _sql.connect(pool.db_path) as conn:
+                with pooled(pool.db_path) as conn:
                     conn.execute(
                         "UPDATE naverad_keyword_pool SET status='deleted' "
                         "WHERE account_customer_id=? AND keyword=?",
@@ -3897,7 +3878,7 @@ async def _run_pool_ai_cleanup_registered(
     duration_ms = int((_time.monotonic() - t0) * 1000)
     result["duration_ms"] = duration_ms
 
-    pool.record_run(
+    await adb(pool).record_run(
         uid, customer_id, "ai_cleanup",
         "success" if (dry_run or result["deleted"] > 0) else "no_match",
         added=0, skipped=result["deleted"], seeds_count=len(rows),
@@ -3955,7 +3936,7 @@ async def _run_pool_seed_amplify(
     if not account or not account.get("is_connected"):
         return {"success": False, "reason": "no_account"}
 
-    user_seeds = pool.list_user_seeds(customer_id)
+    user_seeds = await adb(pool).list_user_seeds(customer_id)
     if not user_seeds:
         return {"success": False, "reason": "no_user_seed"}
 
@@ -3980,7 +3961,7 @@ async def _run_pool_seed_amplify(
 
     if not am_result.get("success"):
         msg = am_result.get("message", "unknown")
-        pool.record_run(
+        await adb(pool).record_run(
             uid, customer_id, "seed_amplify", "failed",
             seeds_count=len(seed_sample),
             error_message=f"amplify 실패: {msg[:200]}",
@@ -3994,11 +3975,11 @@ async def _run_pool_seed_amplify(
     new_seeds = [s for s in raw_seeds if isinstance(s, str) and s.strip() and s not in user_seed_set]
 
     # 2) 풀 dedup (이미 어떤 status 로든 풀에 있는 KW 제외)
-    pool_set = pool.list_pool_keyword_set(customer_id)
+    pool_set = await adb(pool).list_pool_keyword_set(customer_id)
     fresh_seeds = [s for s in new_seeds if s not in pool_set]
 
     if not fresh_seeds:
-        pool.record_run(
+        await adb(pool).record_run(
             uid, customer_id, "seed_amplify", "no_new",
             seeds_count=len(seed_sample),
             error_message=f"amplify {len(raw_seeds)} → fresh 0 (전부 dedup)",
@@ -4024,7 +4005,7 @@ async def _run_pool_seed_amplify(
         domain_filtered_count = before - len(kept)
         fresh_seeds = kept
         if not fresh_seeds:
-            pool.record_run(
+            await adb(pool).record_run(
                 uid, customer_id, "seed_amplify", "no_new",
                 seeds_count=len(seed_sample),
                 error_message=(
@@ -4048,22 +4029,15 @@ async def _run_pool_seed_amplify(
     client.secret_key = account["secret_key"]
 
     vol_t0 = _time.monotonic()
-    vol_map: Dict[str, dict] = {}
     CHUNK = 5
-    chunks = [fresh_seeds[i:i + CHUNK] for i in range(0, len(fresh_seeds), CHUNK)][:chunks_cap]
-    for chunk in chunks:
-        try:
-            r = await client.get_keywords_volume_batch(chunk)
-            vol_map.update(r)
-        except Exception as e:
-            logger.debug(f"[pool/amplify] volume batch 실패: {e}")
-        await asyncio.sleep(0.1)
+    # 5개씩 배치·콜 간격·캐시는 keyword_volume 이 한다. 실패한 배치는 결과에서 빠진다.
+    vol_map = await keyword_volume.lookup(fresh_seeds[:chunks_cap * CHUNK], client=client)
     vol_ms = int((_time.monotonic() - vol_t0) * 1000)
 
     # 4) ≥ min_volume 만 user_seed 합류
     qualified_items = []
     for s in fresh_seeds:
-        v = vol_map.get(s) or vol_map.get(s.replace(" ", ""))
+        v = vol_map.get(s)
         if not v:
             continue
         mt = int(v.get("monthly_total") or 0)
@@ -4082,7 +4056,7 @@ async def _run_pool_seed_amplify(
     promoted = 0
     if qualified_items:
         try:
-            promoted = pool.add_candidates(uid, customer_id, qualified_items)
+            promoted = await adb(pool).add_candidates(uid, customer_id, qualified_items)
         except Exception as e:
             logger.warning(f"[pool/amplify] add 실패: {e}")
 
@@ -4093,7 +4067,7 @@ async def _run_pool_seed_amplify(
         f"검색량≥{min_volume} {len(qualified_items)} → user_seed +{promoted} "
         f"(GPT {am_ms}ms, vol {vol_ms}ms, pattern={am_result.get('detected_pattern', '')[:60]})"
     )
-    pool.record_run(
+    await adb(pool).record_run(
         uid, customer_id, "seed_amplify",
         "success" if promoted > 0 else "no_match",
         added=promoted,
@@ -4164,7 +4138,7 @@ async def _run_pool_autocomplete_mining(
     if not account or not account.get("is_connected"):
         return {"success": False, "reason": "no_account"}
 
-    user_seeds = pool.list_user_seeds(customer_id)
+    user_seeds = await adb(pool).list_user_seeds(customer_id)
     if not user_seeds:
         return {"success": False, "reason": "no_user_seed"}
 
@@ -4173,14 +4147,14 @@ async def _run_pool_autocomplete_mining(
     # autocomplete 가 95~98% 구간에서도 새 KW 발굴 지속 → 물갈이 사이클 자연 가동.
     # 98% 도달 시엔 skip — niche 도메인은 mt=0 long-tail 만 토하므로 API 비용 낭비.
     reg_db = get_registered_keywords_db()
-    pool_pending = (pool.stats(customer_id).get("by_status") or {}).get("pending", 0)
+    pool_pending = ((await adb(pool).stats(customer_id)).get("by_status") or {}).get("pending", 0)
     active_reg = int((reg_db.stats(customer_id) or {}).get("active") or 0)
     used = active_reg + pool_pending
     # 98% → 99.5% 로 완화. 옛 가드는 cleanup ≈ register 평형 시 영구 skip 사고 발생.
     # autocomplete 는 발굴 자체에 비용 작음 (Naver autocomplete API 만 호출, GPT 불사용).
     # 발굴된 후보가 풀에 들어갈 슬롯 없으면 pool.add_keywords 가 알아서 skip 처리.
     if used >= 99_500:
-        pool.record_run(
+        await adb(pool).record_run(
             uid, customer_id, "autocomplete", "no_new",
             seeds_count=0,
             error_message=(
@@ -4220,7 +4194,7 @@ async def _run_pool_autocomplete_mining(
         )
     except Exception as e:
         logger.error(f"[pool/autocomplete] 자동완성 호출 실패: {e}", exc_info=True)
-        pool.record_run(
+        await adb(pool).record_run(
             uid, customer_id, "autocomplete", "failed",
             seeds_count=len(seed_sample),
             error_message=f"자동완성 호출 실패: {type(e).__name__}",
@@ -4251,7 +4225,7 @@ async def _run_pool_autocomplete_mining(
         logger.warning(f"[pool/autocomplete] 네이버 표면 수확 {naver_only}개 (Bing OFF)")
 
     if not all_kws:
-        pool.record_run(
+        await adb(pool).record_run(
             uid, customer_id, "autocomplete", "no_new",
             seeds_count=len(seed_sample),
             error_message="자동완성 결과 0개",
@@ -4264,11 +4238,11 @@ async def _run_pool_autocomplete_mining(
     )
 
     # 2) 분류 이력 dedup (풀 중복은 add_candidates 가 INSERT OR IGNORE 처리)
-    classified_set = set(pool.list_classified_reject_keywords(customer_id))
+    classified_set = set(await adb(pool).list_classified_reject_keywords(customer_id))
     fresh_kws: List[str] = [kw for kw in all_kws if kw not in classified_set]
 
     if not fresh_kws:
-        pool.record_run(
+        await adb(pool).record_run(
             uid, customer_id, "autocomplete", "no_new",
             seeds_count=len(seed_sample),
             error_message=f"자동완성 {len(all_kws)}개 모두 dedup",
@@ -4283,29 +4257,21 @@ async def _run_pool_autocomplete_mining(
     client.secret_key = account["secret_key"]
 
     vol_t0 = _time.monotonic()
-    vol_map: Dict[str, dict] = {}
     CHUNK = 5
-    # chunks_cap 50 × CHUNK 5 = 최대 250 KW 검증. sleep 0.3 — keywordstool 429 rate 회피.
+    # chunks_cap 50 × CHUNK 5 = 최대 250 KW 검증. 콜 간격 0.3s 는 keyword_volume 레인이 지킨다.
     # 실측 (cid 1858907): chunks 250 × sleep 0.1 = 90~230초 + 429 retry → 4분 소요 + 결과 0.
-    # chunks 50 × sleep 0.3 = 15초, 429 회피 + 정상 결과.
+    # chunks 50 × sleep 0.3 = 15초, 429 회피 + 정상 결과. (캐시 적중분은 콜 없이 끝난다.)
     # 후보가 cap 을 넘으면 앞에서부터 자른다. 순서를 고정하면 뒤쪽 후보는 매 라운드
     # 똑같이 잘려 영영 검증되지 않는다(검색량 미달 KW 는 기록되지 않아 다음 라운드에도
     # 다시 앞자리를 차지한다). 섞어서 라운드마다 다른 표본이 뽑히게 한다.
     if len(fresh_kws) > chunks_cap * CHUNK:
         random.shuffle(fresh_kws)
-    chunks = [fresh_kws[i:i + CHUNK] for i in range(0, len(fresh_kws), CHUNK)][:chunks_cap]
-    for chunk in chunks:
-        try:
-            r = await client.get_keywords_volume_batch(chunk)
-            vol_map.update(r)
-        except Exception as e:
-            logger.debug(f"[pool/autocomplete] volume batch 실패 {chunk[:1]}: {e}")
-        await asyncio.sleep(0.3)
+    vol_map = await keyword_volume.lookup(fresh_kws[:chunks_cap * CHUNK], client=client)
     vol_ms = int((_time.monotonic() - vol_t0) * 1000)
 
     qualified: List[Dict] = []
     for kw in fresh_kws:
-        v = vol_map.get(kw) or vol_map.get(kw.replace(" ", ""))
+        v = vol_map.get(kw)
         if not v:
             continue
         mt = int(v.get("monthly_total") or 0)
@@ -4337,7 +4303,7 @@ async def _run_pool_autocomplete_mining(
             f"자동완성 {len(all_kws)} → 검색량≥{min_volume} 통과 0 → mt=0 fallback 차단 "
             f"({duration_ms}ms)"
         )
-        pool.record_run(
+        await adb(pool).record_run(
             uid, customer_id, "autocomplete", "no_new",
             added=0, seeds_count=len(seed_sample),
             error_message=(
@@ -4387,7 +4353,7 @@ async def _run_pool_autocomplete_mining(
 
     if batch_ok == 0:
         msg = "all batches failed"
-        pool.record_run(
+        await adb(pool).record_run(
             uid, customer_id, "autocomplete", "failed",
             seeds_count=len(seed_sample),
             error_message=f"GPT 분류 실패: {msg}",
@@ -4407,7 +4373,7 @@ async def _run_pool_autocomplete_mining(
     _ac_thr = int(_thr_cfg_ac.get("threshold") or 50)
     _ac_rel = _get_rel_ac(uid, str(customer_id)) or []
     if not _ac_rel:
-        _ac_rel = [s for s in (pool.list_user_seeds(customer_id) or []) if s and len(s) >= 2]
+        _ac_rel = [s for s in (await adb(pool).list_user_seeds(customer_id) or []) if s and len(s) >= 2]
 
     ai_fallback = False
     if not approved and classify_input:
@@ -4442,7 +4408,7 @@ async def _run_pool_autocomplete_mining(
             and (not _ac_rel or _compute_relevance_score(q["keyword"], _ac_rel) >= _ac_thr)
         ]
         try:
-            promoted = pool.add_candidates(uid, customer_id, items)
+            promoted = await adb(pool).add_candidates(uid, customer_id, items)
         except Exception as e:
             logger.warning(f"[pool/autocomplete] add 실패: {e}")
 
@@ -4452,11 +4418,11 @@ async def _run_pool_autocomplete_mining(
             {"keyword": q["keyword"], "monthly_total": q["monthly_total"]}
             for q in classify_input
         ]
-        pool.add_rejects(customer_id, all_classified_items)
+        await adb(pool).add_rejects(customer_id, all_classified_items)
         if approved:
-            pool.mark_rejects_classified(customer_id, approved, "promoted")
+            await adb(pool).mark_rejects_classified(customer_id, approved, "promoted")
         if discarded:
-            pool.mark_rejects_classified(customer_id, discarded, "discarded")
+            await adb(pool).mark_rejects_classified(customer_id, discarded, "discarded")
     except Exception as e:
         logger.debug(f"[pool/autocomplete] reject mark: {e}")
 
@@ -4469,7 +4435,7 @@ async def _run_pool_autocomplete_mining(
         f"통과 {len(approved)} (자식 +{promoted}) / 컷 {len(discarded)} "
         f"(GPT {ai_ms}ms)"
     )
-    pool.record_run(
+    await adb(pool).record_run(
         uid, customer_id, "autocomplete",
         "success" if promoted > 0 else "no_match",
         added=promoted, skipped=len(discarded),
@@ -4726,7 +4692,7 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
     else:
         account = get_ad_account(uid)
     if not account or not account.get("is_connected"):
-        pool.record_run(uid, customer_id, "register", "no_account",
+        await adb(pool).record_run(uid, customer_id, "register", "no_account",
                         error_message="광고 계정 미연결",
                         duration_ms=int((_time.monotonic()-t0)*1000))
         return
@@ -4738,9 +4704,9 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
     else:
         bid = max(70, int(bid))
 
-    pending = pool.claim_pending(customer_id, limit=batch, min_volume=10)  # 검색량 10 미만 등록 절대 차단
+    pending = await adb(pool).claim_pending(customer_id, limit=batch, min_volume=10)  # 검색량 10 미만 등록 절대 차단
     if not pending:
-        s = pool.stats(customer_id)
+        s = await adb(pool).stats(customer_id)
         pending_total = (s.get("by_status") or {}).get("pending", 0)
         pending_registerable = int(s.get("pending_registerable") or 0)
         seed_rows = max(0, pending_total - pending_registerable)
@@ -4748,7 +4714,7 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
             f"[pool/register] user={uid} pending 없음 "
             f"(등록가능={pending_registerable} / 시드={seed_rows} / 전체pending={pending_total})"
         )
-        pool.record_run(
+        await adb(pool).record_run(
             uid, customer_id, "register", "no_pending",
             pending_after=pending_registerable,
             error_message=(
@@ -4831,14 +4797,14 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
                 else:
                     _off_ids.append(_p["id"])
             if _off_ids:
-                pool.mark_status(_off_ids, "domain_skipped")
+                await adb(pool).mark_status(_off_ids, "domain_skipped")
             logger.warning(
                 f"[pool/register] 도메인게이트: {len(pending)} → 통과 {len(_on)} / 컷 {len(_off_ids)} (정크 {_junk_n} / 상업컷 {_neg_n})"
             )
             pending = _on
             keywords = [p["keyword"] for p in pending]
             if not pending:
-                pool.record_run(
+                await adb(pool).record_run(
                     uid, customer_id, "register", "no_pending",
                     error_message="도메인게이트 통과 0 — claim 된 pending 전부 off-domain",
                     duration_ms=int((_time.monotonic() - t0) * 1000),
@@ -4854,7 +4820,7 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
 
     # 호출 전 등록 set 캐시 — 호출 후 차집합으로 진짜 신규만 success 판정.
     reg = get_registered_keywords_db()
-    existing_before = set(reg.get_existing_set(customer_id, keywords) or set())
+    existing_before = set(await adb(reg).get_existing_set(customer_id, keywords) or set())
 
     # 900 (네이버 캠페인당 그룹 한도 1000 아래 마진). 기존 50 은 조기 캠페인 분할을 유발:
     # register tick 마다 테마 버킷당 새 그룹을 만들어(부분 그룹 이어채우기 미지원) 그룹이 희소해지고
@@ -4896,7 +4862,7 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
             _label = _labels[_key]
             _campname = f"[피부]{_label}"
             _new_grp = (len(_kws) + 999) // 1000
-            _st = pool.get_active_pool_campaign_cat(customer_id, _key)
+            _st = await adb(pool).get_active_pool_campaign_cat(customer_id, _key)
             _reuse = None; _sidx = 0
             if _st and _st.get("ad_groups_count", 0) + _new_grp <= AD_GROUPS_PER_POOL_CAMPAIGN:
                 _reuse = _st["campaign_id"]; _sidx = _st["ad_groups_count"]
@@ -4923,9 +4889,9 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
                 result["success"] = False; result["error"] = _r.get("error")
             try:
                 if _reuse:
-                    pool.set_active_pool_campaign_cat(customer_id, _key, _reuse, _sidx + _new_grp)
+                    await adb(pool).set_active_pool_campaign_cat(customer_id, _key, _reuse, _sidx + _new_grp)
                 elif _cids:
-                    pool.set_active_pool_campaign_cat(customer_id, _key, _cids[0], _new_grp)
+                    await adb(pool).set_active_pool_campaign_cat(customer_id, _key, _cids[0], _new_grp)
             except Exception as e:
                 logger.warning(f"[pool/register-skin] {_campname} cat-state 갱신 실패: {e}")
             logger.warning(f"[pool/register-skin] {_campname} {len(_kws)}개 (budget {_skin_budget}, reuse={bool(_reuse)})")
@@ -4947,7 +4913,7 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
             _campname = f"[두비전] {_mb['label']}"
             # 이 틱에서 만들 그룹 수 = 소분류별 ceil(n/1000) 합
             _new_grp = sum((len(_v) + 999) // 1000 for _v in _mb["subs"].values())
-            _st = pool.get_active_pool_campaign_cat(customer_id, _mk)
+            _st = await adb(pool).get_active_pool_campaign_cat(customer_id, _mk)
             _reuse = None; _sidx = 0
             if _st and _st.get("ad_groups_count", 0) + _new_grp <= AD_GROUPS_PER_POOL_CAMPAIGN:
                 _reuse = _st["campaign_id"]; _sidx = _st["ad_groups_count"]
@@ -4989,7 +4955,7 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
                     break
             try:
                 if _created_cid:
-                    pool.set_active_pool_campaign_cat(customer_id, _mk, _created_cid, _grp_cursor)
+                    await adb(pool).set_active_pool_campaign_cat(customer_id, _mk, _created_cid, _grp_cursor)
             except Exception as e:
                 logger.warning(f"[pool/register-dovi] {_campname} cat-state 갱신 실패: {e}")
     elif category_mode:
@@ -5004,7 +4970,7 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
             if not _kws:
                 continue
             _new_grp = (len(_kws) + 999) // 1000
-            _st = pool.get_active_pool_campaign_cat(customer_id, _cat)
+            _st = await adb(pool).get_active_pool_campaign_cat(customer_id, _cat)
             _reuse = None; _sidx = 0
             if _st and _st.get("ad_groups_count", 0) + _new_grp <= AD_GROUPS_PER_POOL_CAMPAIGN:
                 _reuse = _st["campaign_id"]; _sidx = _st["ad_groups_count"]
@@ -5030,15 +4996,15 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
                 result["success"] = False; result["error"] = _r.get("error")
             try:
                 if _reuse:
-                    pool.set_active_pool_campaign_cat(customer_id, _cat, _reuse, _sidx + _new_grp)
+                    await adb(pool).set_active_pool_campaign_cat(customer_id, _cat, _reuse, _sidx + _new_grp)
                 elif _cids:
-                    pool.set_active_pool_campaign_cat(customer_id, _cat, _cids[0], _new_grp)
+                    await adb(pool).set_active_pool_campaign_cat(customer_id, _cat, _cids[0], _new_grp)
             except Exception as e:
                 logger.warning(f"[pool/register-cat] {_label} cat-state 갱신 실패: {e}")
             logger.warning(f"[pool/register-cat] {_label} {len(_kws)}개 (budget {_bud}, reuse={bool(_reuse)})")
     else:
         # ── 기존 경로 (auto_ 단일 캠페인, 예산 1만) — 변경 없음 ──
-        pool_state = pool.get_active_pool_campaign(customer_id)
+        pool_state = await adb(pool).get_active_pool_campaign(customer_id)
         start_idx = 0
         new_groups_in_round = (len(keywords) + 999) // 1000  # 1000개당 광고그룹 1개
         if pool_state and pool_state.get("ad_groups_count", 0) + new_groups_in_round <= AD_GROUPS_PER_POOL_CAMPAIGN:
@@ -5068,15 +5034,15 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
             result = await orchestrator.run(cfg, keywords)
         except Exception as e:
             logger.error(f"[pool/register] orchestrator 실패: {e}", exc_info=True)
-            pool.mark_status([p["id"] for p in pending], "failed",
+            await adb(pool).mark_status([p["id"] for p in pending], "failed",
                              error_message=f"{type(e).__name__}: {str(e)[:200]}")
-            pool.record_run(uid, customer_id, "register", "failed",
+            await adb(pool).record_run(uid, customer_id, "register", "failed",
                             failed=len(pending),
                             error_message=f"{type(e).__name__}: {str(e)[:300]}",
                             duration_ms=int((_time.monotonic()-t0)*1000))
             return
 
-    existing_after = set(reg.get_existing_set(customer_id, keywords) or set())
+    existing_after = set(await adb(reg).get_existing_set(customer_id, keywords) or set())
     new_in_naver = existing_after - existing_before  # 진짜 신규 등록
 
     # 풀 state 업데이트 — 캠페인 재사용 또는 새 캠페인 등록
@@ -5087,10 +5053,10 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
             ad_groups_in_round = (len(keywords) + 999) // 1000
             if reuse_id:
                 # 같은 캠페인에 광고그룹 추가됨
-                pool.increment_pool_ad_groups(customer_id, ad_groups_in_round)
+                await adb(pool).increment_pool_ad_groups(customer_id, ad_groups_in_round)
             elif result_campaign_ids:
                 # 새 캠페인 → state 갱신
-                pool.set_active_pool_campaign(customer_id, result_campaign_ids[0], ad_groups_in_round)
+                await adb(pool).set_active_pool_campaign(customer_id, result_campaign_ids[0], ad_groups_in_round)
         except Exception as e:
             logger.warning(f"[pool/register] state 갱신 실패: {e}")
 
@@ -5100,8 +5066,8 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
         p["id"] for p in pending
         if p["keyword"] not in new_in_naver and p["keyword"] not in existing_before
     ]
-    pool.mark_status(succeeded_ids, "registered")
-    pool.mark_status(skipped_ids, "skipped_existing",
+    await adb(pool).mark_status(succeeded_ids, "registered")
+    await adb(pool).mark_status(skipped_ids, "skipped_existing",
                      error_message="이미 네이버 광고에 등록된 키워드 — orchestrator dedup")
     err_msg = str(result.get("error", "did not register"))[:300] if not result.get("success") else None
 
@@ -5121,14 +5087,14 @@ async def _run_pool_register(uid: int, customer_id: Optional[int] = None, batch:
         )
         # mark_status skip — pending 그대로 둠. 다음 register tick 이 다시 claim.
     else:
-        pool.mark_status(failed_ids, "failed",
+        await adb(pool).mark_status(failed_ids, "failed",
                          error_message=err_msg or "orchestrator did not register")
     logger.warning(
         f"[pool/register] user={uid} 신규={len(succeeded_ids)} "
         f"이미있음={len(skipped_ids)} fail={len(failed_ids)}"
     )
-    pending_after = (pool.stats(customer_id).get("by_status") or {}).get("pending", 0)
-    pool.record_run(
+    pending_after = ((await adb(pool).stats(customer_id)).get("by_status") or {}).get("pending", 0)
+    await adb(pool).record_run(
         uid, customer_id, "register",
         "success" if len(succeeded_ids) > 0 and len(failed_ids) == 0
             else ("partial" if len(succeeded_ids) > 0 else ("failed" if len(failed_ids) > 0 else "no_new")),
@@ -5276,7 +5242,7 @@ async def _inspect_ad_groups(
         # 거부 KW 첫 5개 sample logging — 어떤 토큰이 매치됐는지 검증용
         sample_reasons = [f"{it['keyword']}:{it['reason'][:80]}" for it in rejected_items[:5]]
         logger.warning(f"[pool/inspect] rejected samples: {' | '.join(sample_reasons)}")
-    n_mark = pool.mark_rejected_by_naver(customer_id, rejected_items)
+    n_mark = await adb(pool).mark_rejected_by_naver(customer_id, rejected_items)
 
     # 네이버에서 실제 DELETE — 실패 시 PUT pause로 fallback (광고 노출만 차단)
     n_deleted = 0
@@ -5314,7 +5280,7 @@ async def _inspect_ad_groups(
         )
     # 실행 이력 기록 — 화면에 보이게
     try:
-        pool.record_run(
+        await adb(pool).record_run(
             uid, customer_id, "inspect",
             "success" if n_deleted > 0 or n_mark > 0 else "no_new",
             registered=0, failed=0, skipped=n_deleted,  # skipped 컬럼에 삭제 카운트
@@ -5333,13 +5299,12 @@ async def _run_pool_inspect_only(uid: int, customer_id: int) -> None:
     """
     from services.naver_ad_service import NaverAdApiClient, _naver_api_breaker
     from database.naver_ad_db import get_ad_account_by_customer
-    import sqlite3 as _sqlite3
     pool = get_keyword_pool_db()
     reg = get_registered_keywords_db()
 
     if _naver_api_breaker.is_open():
         # circuit OPEN 인 동안은 inspect 도 skip — 다음 tick 에 재시도
-        pool.record_run(uid, customer_id, "inspect", "no_new",
+        await adb(pool).record_run(uid, customer_id, "inspect", "no_new",
                         error_message="circuit OPEN — inspect skip, 다음 tick 재시도")
         return
 
@@ -5347,7 +5312,7 @@ async def _run_pool_inspect_only(uid: int, customer_id: int) -> None:
     if not account or not account.get("is_connected"):
         return  # 비연결 광고주 — record 도 노이즈 방지로 안 함
 
-    with _sqlite3.connect(reg.db_path) as _conn:
+    with pooled(reg.db_path) as _conn:
         ag_ids = [r[0] for r in _conn.execute(
             "SELECT DISTINCT ad_group_id FROM registered_keywords "
             "WHERE account_customer_id=? AND ad_group_id IS NOT NULL",
@@ -5378,7 +5343,6 @@ async def _run_pool_ai_seed_topup(uid: int, customer_id: int) -> Dict[str, Any]:
         get_ad_account_relevance_keywords,
     )
     import time as _time
-    import sqlite3 as _sqlite3
 
     pool = get_keyword_pool_db()
     t0 = _time.monotonic()
@@ -5393,7 +5357,7 @@ async def _run_pool_ai_seed_topup(uid: int, customer_id: int) -> Dict[str, Any]:
     saved = get_ad_account_relevance_keywords(uid, str(customer_id)) or []
     if len(saved) < 3:
         # 폴백 — user_seed 풀 Top 60 (오염 가능하므로 saved_relevance 가 진짜 의도).
-        seeds_fb = pool.list_user_seeds(customer_id) or []
+        seeds_fb = await adb(pool).list_user_seeds(customer_id) or []
         if len(seeds_fb) < 3:
             return {"skipped": "insufficient_base_seeds"}
         base = seeds_fb[:60]
@@ -5406,7 +5370,7 @@ async def _run_pool_ai_seed_topup(uid: int, customer_id: int) -> Dict[str, Any]:
     AI_TOPUP_COOLDOWN_S = 25 * 60
     AI_TOPUP_DAILY_CAP = 6
     try:
-        with _sqlite3.connect(pool.db_path) as conn:
+        with pooled(pool.db_path) as conn:
             row = conn.execute(
                 """SELECT started_at, COUNT(*) FROM naverad_pool_runs
                    WHERE account_customer_id=? AND kind='ai_topup'
@@ -5482,7 +5446,7 @@ async def _run_pool_ai_seed_topup(uid: int, customer_id: int) -> Dict[str, Any]:
                         seen.add(kw)
                         candidates.append(kw)
     except Exception as e:
-        pool.record_run(uid, customer_id, "ai_topup", "failed",
+        await adb(pool).record_run(uid, customer_id, "ai_topup", "failed",
                         error_message=f"LLM 실패: {type(e).__name__}: {str(e)[:200]}",
                         duration_ms=int((_time.monotonic()-t0)*1000))
         logger.warning(f"[pool/ai-topup] LLM 실패 uid={uid} cid={customer_id}: {e}")
@@ -5554,10 +5518,10 @@ async def _run_pool_ai_seed_topup(uid: int, customer_id: int) -> Dict[str, Any]:
 
     # 4) user_seed 로 INSERT
     seed_items = [{**v, "source": "user_seed"} for v in validated]
-    added = pool.add_candidates(uid, customer_id, seed_items)
+    added = await adb(pool).add_candidates(uid, customer_id, seed_items)
 
     duration_ms = int((_time.monotonic() - t0) * 1000)
-    pool.record_run(
+    await adb(pool).record_run(
         uid, customer_id, "ai_topup",
         "success" if added > 0 else "no_new",
         added=added, seeds_count=len(base),
@@ -5607,15 +5571,15 @@ async def _fill_escalation_decide(uid: int, cid: int) -> Dict[str, Any]:
     pool = get_keyword_pool_db()
     try:
         reg = get_registered_keywords_db()
-        active_reg = int((reg.stats(cid) or {}).get("active") or 0)
-        pool_pending = int((pool.stats(cid).get("by_status") or {}).get("pending", 0) or 0)
+        active_reg = int((await adb(reg).stats(cid) or {}).get("active") or 0)
+        pool_pending = int(((await adb(pool).stats(cid)).get("by_status") or {}).get("pending", 0) or 0)
         headroom = _FILL_CAP - active_reg - pool_pending
 
-        recent = pool.recent_runs(cid, limit=6) or []
+        recent = await adb(pool).read.recent_runs(cid, limit=6) or []
         last_collect = next((r for r in recent if r.get("kind") == "collect"), None)
         last_added = int(last_collect.get("added") or 0) if last_collect else 0
 
-        st = pool.get_escalation(cid)
+        st = await adb(pool).get_escalation(cid)
         level = int(st.get("level") or 0)
         dry_streak = int(st.get("dry_streak") or 0)
         floor = int(st.get("relevance_floor") or _FILL_FLOOR_START)
@@ -5624,7 +5588,7 @@ async def _fill_escalation_decide(uid: int, cid: int) -> Dict[str, Any]:
             # 이미 10만 도달 — floor 유지, 물갈이는 collect 내부 self-heal 담당.
             note = f"cap_reached active={active_reg} pending={pool_pending}"
             level = (_FILL_FLOOR_START - floor) // 5
-            pool.set_escalation(cid, level, dry_streak, floor, last_added, note)
+            await adb(pool).set_escalation(cid, level, dry_streak, floor, last_added, note)
             return {"level": level, "dry_streak": dry_streak, "relevance_floor": floor,
                     "headroom": headroom, "run_topup": False, "note": note,
                     "next_lever": _fill_next_lever(level)}
@@ -5649,7 +5613,7 @@ async def _fill_escalation_decide(uid: int, cid: int) -> Dict[str, Any]:
                 note = f"dry added={last_added} streak={dry_streak} floor={floor}"
 
         level = (_FILL_FLOOR_START - floor) // 5   # 0(floor50)..5(floor25) 표시용
-        pool.set_escalation(cid, level, dry_streak, floor, last_added, note)
+        await adb(pool).set_escalation(cid, level, dry_streak, floor, last_added, note)
         # 마르기 시작하면(또는 floor 하강 중) LLM 앵글 topup 발동.
         run_topup = (dry_streak >= 1) or (floor < _FILL_FLOOR_START)
         return {"level": level, "dry_streak": dry_streak, "relevance_floor": floor,
@@ -5674,7 +5638,7 @@ async def _run_pool_workers_for_accounts(pairs: List[Tuple[int, int]]):
         except Exception as e:
             logger.error(f"[pool/run] collect 실패 user={uid} cid={cid}: {e}", exc_info=True)
             try:
-                pool.record_run(uid, cid, "collect", "failed",
+                await adb(pool).record_run(uid, cid, "collect", "failed",
                                 error_message=f"{type(e).__name__}: {str(e)[:300]}")
             except Exception:
                 pass
@@ -5686,7 +5650,7 @@ async def _run_pool_workers_for_accounts(pairs: List[Tuple[int, int]]):
         do_topup = decision.get("run_topup")
         if do_topup is None:
             try:
-                recent = pool.recent_runs(cid, limit=3) or []
+                recent = await adb(pool).read.recent_runs(cid, limit=3) or []
                 lc = next((r for r in recent if r.get("kind") == "collect"), None)
                 do_topup = (int(lc.get("added") or 0) if lc else 0) < AI_TOPUP_TRIGGER_THRESHOLD
             except Exception:
@@ -5707,7 +5671,7 @@ async def _run_pool_workers_for_accounts(pairs: List[Tuple[int, int]]):
         except Exception as e:
             logger.error(f"[pool/run] register 실패 user={uid} cid={cid}: {e}", exc_info=True)
             try:
-                pool.record_run(uid, cid, "register", "failed",
+                await adb(pool).record_run(uid, cid, "register", "failed",
                                 error_message=f"{type(e).__name__}: {str(e)[:300]}")
             except Exception:
                 pass
@@ -5718,7 +5682,7 @@ async def _run_pool_workers_for_accounts(pairs: List[Tuple[int, int]]):
         except Exception as e:
             logger.error(f"[pool/run] inspect 실패 user={uid} cid={cid}: {e}", exc_info=True)
             try:
-                pool.record_run(uid, cid, "inspect", "failed",
+                await adb(pool).record_run(uid, cid, "inspect", "failed",
                                 error_message=f"{type(e).__name__}: {str(e)[:300]}")
             except Exception:
                 pass
@@ -5773,7 +5737,6 @@ async def keyword_pool_off_domain_audit(
 ):
     """소잠 등 피부/한방 광고주의 off-domain(무관) 키워드 감지 (인증 없음, 진단).
     판정: 피부/한방/의료 on-domain 토큰이 하나도 없거나, 명백한 off-domain 토큰 포함 → off-domain."""
-    import sqlite3 as _sq
     from database.registered_keywords_db import get_registered_keywords_db
     ON = ["피부","여드름","아토피","건선","탈모","습진","두드러기","한포진","지루","모공","각질","색소",
         "홍조","기미","주근깨","사마귀","무좀","비듬","두피","손톱","발톱","비립종","쥐젖","흉터","튼살",
@@ -5786,7 +5749,7 @@ async def keyword_pool_off_domain_audit(
         "레시피","게임","영화","드라마","웹툰","경락대출","사업자대출","법인","제조","공장","프랜차이즈",
         "상담센터","심리상담","언어치료","마음상담","분양","오피스텔","상가주택","채용","알바","자격증","명함"]
     reg = get_registered_keywords_db()
-    with _sq.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         rows = conn.execute(
             "SELECT keyword FROM registered_keywords WHERE account_customer_id=? AND removed_at IS NULL",
             (customer_id,),
@@ -5849,7 +5812,6 @@ async def keyword_pool_off_domain_cleanup(
 ):
     """off-domain(무관) 키워드 일괄 삭제 — on-domain 토큰 없거나 off 토큰 포함 키워드를 네이버에서 삭제.
     dry_run=true: 대상 개수. false: 백그라운드 bulk delete (DELETE /ncc/keywords?ids=)."""
-    import sqlite3 as _sq
     from services.naver_ad_service import NaverAdApiClient
     from database.registered_keywords_db import get_registered_keywords_db
     account = _resolve_account(user_id, customer_id)
@@ -5862,7 +5824,7 @@ async def keyword_pool_off_domain_cleanup(
     OFF = (list(request.extra_off or []) if request.strict_off
            else _SOJAM_OFF_TOKENS + (request.extra_off or []))
     reg = get_registered_keywords_db()
-    with _sq.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         rows = conn.execute(
             "SELECT keyword, ncc_keyword_id FROM registered_keywords "
             "WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL AND removed_at IS NULL",
@@ -5906,7 +5868,7 @@ async def keyword_pool_off_domain_cleanup(
                 logger.warning(f"[off-domain-cleanup] 진행 — 삭제 {done}/{len(ids)} (실패 {failed})")
             await asyncio.sleep(0.1)
         try:
-            reg.mark_removed(cid, [kw for kw, _ in targets])
+            await adb(reg).mark_removed(cid, [kw for kw, _ in targets])
         except Exception:
             pass
         logger.warning(f"[off-domain-cleanup] 완료 — 삭제 {done} / 실패 {failed}")
@@ -5936,7 +5898,6 @@ async def keyword_pool_bulk_pause_offdomain(
     """도메인 밖 키워드 **bulk 일시정지(off)** — keep=(loan_tokens 중 1+ AND domain_tokens 중 1+).
     keep 아닌 키워드를 userLock=true 로 일괄 off (삭제 아님, 되돌릴 수 있음). bulk PUT 100개/콜.
     activate=true 면 반대로 keep 을 userLock=false 로 재개(복구). dry_run 으로 대상 미리보기."""
-    import sqlite3 as _sq
     from services.naver_ad_service import NaverAdApiClient
     from database.registered_keywords_db import get_registered_keywords_db
     account = _resolve_account(user_id, customer_id)
@@ -5949,7 +5910,7 @@ async def keyword_pool_bulk_pause_offdomain(
     if not loan or not dom:
         raise HTTPException(status_code=400, detail="loan_tokens 와 domain_tokens 둘 다 필요")
     reg = get_registered_keywords_db()
-    with _sq.connect(reg.db_path, timeout=30.0) as conn:
+    with pooled(reg.db_path, timeout=30.0) as conn:
         rows = conn.execute(
             "SELECT keyword, ncc_keyword_id, ad_group_id, campaign_id FROM registered_keywords "
             "WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL AND ad_group_id IS NOT NULL "
@@ -6220,7 +6181,6 @@ async def keyword_pool_keep_volume_audit(
 ):
     """keep(loan AND domain) 키워드 중 **실검색량 보유 + 현재 ON** 개수 집계.
     검색량=naverad_keyword_pool.monthly_total, ON=네이버 userLock=false(실측, check_live)."""
-    import sqlite3 as _sq
     from services.naver_ad_service import NaverAdApiClient
     from database.registered_keywords_db import get_registered_keywords_db
     from database.keyword_pool_db import get_keyword_pool_db
@@ -6235,7 +6195,7 @@ async def keyword_pool_keep_volume_audit(
         raise HTTPException(status_code=400, detail="loan_tokens 와 domain_tokens 둘 다 필요")
 
     reg = get_registered_keywords_db()
-    with _sq.connect(reg.db_path, timeout=30.0) as conn:
+    with pooled(reg.db_path, timeout=30.0) as conn:
         rows = conn.execute(
             "SELECT keyword, ncc_keyword_id, ad_group_id FROM registered_keywords "
             "WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL AND ad_group_id IS NOT NULL "
@@ -6255,7 +6215,7 @@ async def keyword_pool_keep_volume_audit(
     pool = get_keyword_pool_db()
     vol = {}
     keep_kws = list({kw for kw, _, _ in keep})
-    with _sq.connect(pool.db_path, timeout=30.0) as conn:
+    with pooled(pool.db_path, timeout=30.0) as conn:
         for i in range(0, len(keep_kws), 500):
             chunk = keep_kws[i:i + 500]
             ph = ",".join("?" * len(chunk))
@@ -6347,7 +6307,6 @@ async def keyword_pool_live_offdomain_scan(
     후보 선정: off_tokens 포함(기본) 또는 no_ondomain_mode=true 면 keep_tokens 하나도 없음.
     keep_tokens 는 오탐 방지 보호. 후보가 든 adgroup만 네이버 라이브 조회 → userLock 실측 → ON 만 반환.
     검색량(pool monthly_total) 조인해 큰 것부터 정렬."""
-    import sqlite3 as _sq
     from services.naver_ad_service import NaverAdApiClient
     from database.registered_keywords_db import get_registered_keywords_db
     from database.keyword_pool_db import get_keyword_pool_db
@@ -6364,7 +6323,7 @@ async def keyword_pool_live_offdomain_scan(
         raise HTTPException(status_code=400, detail="off_tokens 필요 (또는 no_ondomain_mode=true)")
 
     reg = get_registered_keywords_db()
-    with _sq.connect(reg.db_path, timeout=30.0) as conn:
+    with pooled(reg.db_path, timeout=30.0) as conn:
         rows = conn.execute(
             "SELECT keyword, ncc_keyword_id, ad_group_id FROM registered_keywords "
             "WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL AND ad_group_id IS NOT NULL "
@@ -6386,7 +6345,7 @@ async def keyword_pool_live_offdomain_scan(
     pool = get_keyword_pool_db()
     vol = {}
     cand_kws = list({kw for kw, _, _ in cand})
-    with _sq.connect(pool.db_path, timeout=30.0) as conn:
+    with pooled(pool.db_path, timeout=30.0) as conn:
         for i in range(0, len(cand_kws), 500):
             chunk = cand_kws[i:i + 500]
             ph = ",".join("?" * len(chunk))
@@ -6467,7 +6426,6 @@ async def keyword_pool_bulk_rank_bid(
     점수 = 지역(강남+40/인접+25/타지역-25) + 의도(예약/상담+30, 비용/가격+25, 추천/후기/명의+20,
     한의원/병원+15, 치료/한약+8, 정보성-25) + 질환+10 + 브랜드+50.
     점수→순위: ≥75→1, 60→2, 48→3, 38→5, 28→7, 18→10, 미만→floor(미적용). dry_run=점수/순위 분포."""
-    import sqlite3 as _sq
     from services.naver_ad_service import NaverAdApiClient
     from database.registered_keywords_db import get_registered_keywords_db
     account = _resolve_account(user_id, customer_id)
@@ -6526,7 +6484,7 @@ async def keyword_pool_bulk_rank_bid(
         return None  # floor 유지
 
     reg = get_registered_keywords_db()
-    with _sq.connect(reg.db_path, timeout=30.0) as conn:
+    with pooled(reg.db_path, timeout=30.0) as conn:
         rows = conn.execute(
             "SELECT keyword, ncc_keyword_id, ad_group_id FROM registered_keywords "
             "WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL AND ad_group_id IS NOT NULL AND removed_at IS NULL",
@@ -6625,7 +6583,6 @@ async def keyword_pool_bulk_bid_by_tokens(
 ):
     """토큰 매칭(domain AND intent, NOT exclude) 키워드의 입찰가를 flat 일괄 설정 — 중요도 티어링용.
     estimate 무관하게 전체 매칭분에 확실히 적용. bulk PUT(update_keywords_bid_bulk) 100/콜. dry_run 미리보기."""
-    import sqlite3 as _sq
     from services.naver_ad_service import NaverAdApiClient
     from database.registered_keywords_db import get_registered_keywords_db
     account = _resolve_account(user_id, customer_id)
@@ -6639,7 +6596,7 @@ async def keyword_pool_bulk_bid_by_tokens(
         raise HTTPException(status_code=400, detail="domain_tokens 필요")
     new_bid = max(70, min(100000, round(int(request.bid) / 10) * 10))
     reg = get_registered_keywords_db()
-    with _sq.connect(reg.db_path, timeout=30.0) as conn:
+    with pooled(reg.db_path, timeout=30.0) as conn:
         rows = conn.execute(
             "SELECT keyword, ncc_keyword_id, ad_group_id FROM registered_keywords "
             "WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL AND ad_group_id IS NOT NULL "
@@ -6704,14 +6661,13 @@ async def keyword_pool_admin_prune_pool_backlog(
     """비-라이브 풀 backlog(failed/rejected/deleted/skipped) 일괄 삭제 — 디스크 확보용.
     naverad_keyword_pool 의 발굴이력만 삭제(라이브 광고=registered_keywords/네이버는 안 건드림).
     배치 5000 + commit 으로 디스크풀에서도 점진 진행. dry_run 으로 status별 행수 먼저 확인."""
-    import sqlite3 as _sq
     pool = get_keyword_pool_db()
     allowed = {"failed", "rejected_by_naver", "deleted", "domain_skipped", "skipped_existing", "pending"}
     statuses = [s for s in (request.statuses or []) if s in allowed]
     if not statuses:
         raise HTTPException(status_code=400, detail=f"유효 status 없음. 허용: {sorted(allowed)}")
     ph = ",".join("?" * len(statuses))
-    with _sq.connect(pool.db_path, timeout=60.0) as conn:
+    with pooled(pool.db_path, timeout=60.0) as conn:
         by_status = {}
         for s in statuses:
             by_status[s] = conn.execute(
@@ -6724,10 +6680,9 @@ async def keyword_pool_admin_prune_pool_backlog(
                 "by_status": by_status, "total_to_delete": total}
 
     async def _run():
-        import sqlite3 as _sq2
         deleted = 0
         try:
-            with _sq2.connect(pool.db_path, timeout=120.0) as c:
+            with pooled(pool.db_path, timeout=120.0) as c:
                 while deleted < request.max_rows:
                     cur = c.execute(
                         f"""DELETE FROM naverad_keyword_pool WHERE rowid IN (
@@ -6745,7 +6700,7 @@ async def keyword_pool_admin_prune_pool_backlog(
             logger.warning(f"[prune-pool-backlog] cid={customer_id} 완료 — 삭제 {deleted}")
             if request.vacuum:
                 try:
-                    with _sq2.connect(pool.db_path, timeout=600.0) as cv:
+                    with pooled(pool.db_path, timeout=600.0) as cv:
                         cv.execute("VACUUM")
                     logger.warning("[prune-pool-backlog] VACUUM 완료 — 파일 축소")
                 except Exception as ve:
@@ -6776,7 +6731,6 @@ async def keyword_pool_low_volume_cleanup(
 ):
     """저검색량(monthly_total ≤ max_volume) 등록 키워드 삭제 — '< 10'(실검색 없음) 쓰레기 정리.
     registered_keywords(ncc_id) ⋈ keyword_pool(monthly_total) 조인으로 대상 선별."""
-    import sqlite3 as _sq
     from services.naver_ad_service import NaverAdApiClient
     from database.registered_keywords_db import get_registered_keywords_db
     from database.keyword_pool_db import get_keyword_pool_db
@@ -6786,7 +6740,7 @@ async def keyword_pool_low_volume_cleanup(
     cid = int(account.get("customer_id"))
     reg = get_registered_keywords_db()
     pool = get_keyword_pool_db()
-    with _sq.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         regrows = conn.execute(
             "SELECT keyword, ncc_keyword_id, ad_group_id FROM registered_keywords "
             "WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL AND removed_at IS NULL",
@@ -6794,7 +6748,7 @@ async def keyword_pool_low_volume_cleanup(
         ).fetchall()
     # off_only 는 userLock bulk 에 nccAdgroupId 필요 → (nid, gid) 보관.
     regmap = {kw: (nid, gid) for kw, nid, gid in regrows}
-    with _sq.connect(pool.db_path) as conn:
+    with pooled(pool.db_path) as conn:
         # 정확한 쓰레기 정의: PC AND 모바일 둘 다 < 10 (한쪽이라도 실제 ≥10이면 보존).
         # '< 10'은 5로 저장되므로 monthly_pc<10 AND monthly_mobile<10 = 양쪽 다 '< 10' 플레이스홀더.
         lowrows = conn.execute(
@@ -6845,7 +6799,7 @@ async def keyword_pool_low_volume_cleanup(
         if not request.off_only:
             # 삭제 모드만 DB 에서 제거 표시. off 는 DB 유지.
             try:
-                reg.mark_removed(cid, [kw for kw, _, _, _ in targets])
+                await adb(reg).mark_removed(cid, [kw for kw, _, _, _ in targets])
             except Exception:
                 pass
         logger.warning(f"[lowvol-cleanup] 완료 — {verb} {done} / 실패 {failed}")
@@ -7054,11 +7008,11 @@ async def keyword_pool_diagnostics_accounts_list():
         if not cid:
             continue
         try:
-            seeds = pool.list_user_seeds(cid)
+            seeds = await adb(pool).list_user_seeds(cid)
         except Exception:
             seeds = []
         try:
-            stats = pool.stats(cid) or {}
+            stats = await adb(pool).stats(cid) or {}
             by_status = stats.get("by_status") or {}
         except Exception:
             by_status = {}
@@ -7170,7 +7124,7 @@ async def keyword_pool_diagnostics_recent_registered(
         "mt_desc": "COALESCE(monthly_total, 0) DESC, registered_at DESC",
     }[order]
 
-    with _sqlite3.connect(pool.db_path) as conn:
+    with pooled(pool.db_path) as conn:
         conn.row_factory = _sqlite3.Row
         rows = conn.execute(
             f"""SELECT keyword, seed, monthly_total, monthly_pc, monthly_mobile,
@@ -7246,14 +7200,13 @@ async def keyword_pool_diagnostics_seed_audit(
         basis_source = "saved"
 
     pool = get_keyword_pool_db()
-    user_seeds = pool.list_user_seeds(customer_id) or []
+    user_seeds = await adb(pool).list_user_seeds(customer_id) or []
 
     # 점수 매김
     dist: Dict[int, int] = {}
     contaminated: List[Tuple[str, int]] = []
     clean: List[Tuple[str, int]] = []
-    for s in user_seeds:
-        sc = _compute_relevance_score(s, score_basis)
+    for s, sc in zip(user_seeds, compile_relevance(score_basis).score_many(user_seeds)):
         bucket = (sc // 10) * 10
         dist[bucket] = dist.get(bucket, 0) + 1
         if sc < score_threshold:  # Option B: boundary 보존 — score == threshold 는 clean
@@ -7353,13 +7306,13 @@ async def keyword_pool_fill_progress(
             continue
         cid = int(a.get("customer_id"))
         try:
-            active = int((reg.stats(cid) or {}).get("active") or 0)
+            active = int((await adb(reg).stats(cid) or {}).get("active") or 0)
         except Exception:
             active = 0
-        by_status = (pool.stats(cid) or {}).get("by_status") or {}
+        by_status = (await adb(pool).stats(cid) or {}).get("by_status") or {}
         pending = int(by_status.get("pending") or 0)
-        st = pool.get_escalation(cid)
-        recent = pool.recent_runs(cid, limit=12) or []
+        st = await adb(pool).get_escalation(cid)
+        recent = await adb(pool).read.recent_runs(cid, limit=12) or []
         collect_added = [int(r.get("added") or 0) for r in recent if r.get("kind") == "collect"][:5]
         level = int(st.get("level") or 0)
         headroom = _FILL_CAP - active - pending
@@ -7409,9 +7362,8 @@ def keyword_pool_scheduler_diagnostics():
         # 프록시 실패 (worker 가 무거운 cron 으로 바빠 :8001 응답 지연) — DB 최근 실행
         # 기록으로 판단. cross-process 안정 (worker API 응답성에 의존 안 함).
         try:
-            import sqlite3 as _sq
             pool = get_keyword_pool_db()
-            with _sq.connect(pool.db_path) as _c:
+            with pooled(pool.db_path) as _c:
                 row = _c.execute("SELECT MAX(started_at) FROM naverad_pool_runs").fetchone()
             last = row[0] if row else None
             if last:
@@ -7464,7 +7416,7 @@ async def keyword_pool_cleanup_audit(
     sample_n = max(1, min(int(sample_ad_groups), 10))
 
     pool = get_keyword_pool_db()
-    runs = pool.recent_runs(cid, limit=200)
+    runs = await adb(pool).read.recent_runs(cid, limit=200)
 
     # cron 종류별 마지막 + 최근 24개 합산
     from collections import defaultdict
@@ -7476,7 +7428,7 @@ async def keyword_pool_cleanup_audit(
     # 종류별 '마지막 실행'은 최근 200행 창이 아니라 kind 별 MAX(id) 로 뽑는다.
     # register 가 30초마다 행을 써서 200행이 몇 분치밖에 안 되고, 45분 주기인
     # autocomplete 는 창 밖으로 밀려 조회할 때마다 나타났다 사라졌다 한다.
-    last_by_kind = pool.last_run_by_kind(cid)
+    last_by_kind = await adb(pool).read.last_run_by_kind(cid)
 
     summary: Dict[str, Dict[str, Any]] = {}
     for kind in set(list(by_kind.keys()) + list(last_by_kind.keys())):
@@ -7506,7 +7458,6 @@ async def keyword_pool_cleanup_audit(
         from database.naver_ad_db import get_ad_account_by_customer
         from database.registered_keywords_db import get_registered_keywords_db
         from services.naver_ad_service import NaverAdApiClient
-        import sqlite3
 
         account = get_ad_account_by_customer(user_id, str(cid))
         if not account or not account.get("is_connected"):
@@ -7518,7 +7469,7 @@ async def keyword_pool_cleanup_audit(
             client.secret_key = account["secret_key"]
 
             reg = get_registered_keywords_db()
-            with sqlite3.connect(reg.db_path) as conn:
+            with pooled(reg.db_path) as conn:
                 ag_ids = [r[0] for r in conn.execute(
                     "SELECT DISTINCT ad_group_id FROM registered_keywords "
                     "WHERE account_customer_id=? AND ad_group_id IS NOT NULL "
@@ -7870,7 +7821,7 @@ async def keyword_pool_admin_add_seeds(
             {"keyword": s.strip(), "seed": s.strip(), "source": "user_seed", "monthly_total": 0}
             for s in request.seeds if s and s.strip()
         ]
-        added = pool.add_candidates(request.user_id, customer_id, items)
+        added = await adb(pool).add_candidates(request.user_id, customer_id, items)
         return {"success": True, "added": added, "total_input": len(items),
                 "user_id": request.user_id, "customer_id": customer_id}
     except HTTPException:
@@ -7910,7 +7861,7 @@ async def _run_seed_explode(
     # 연관성 점수 기준 — 자동삭제 크론과 동일: saved relevance_keywords → user_seed 폴백.
     score_basis = get_ad_account_relevance_keywords(user_id, str(customer_id))
     if not score_basis:
-        score_basis = [s for s in (pool.list_user_seeds(customer_id) or []) if s and len(s) >= 2]
+        score_basis = [s for s in (await adb(pool).list_user_seeds(customer_id) or []) if s and len(s) >= 2]
     # negative_keywords (drift 차단) + required_tokens (핵심의도 앵커) — 프로파일에서 로드.
     negatives = []
     required_tokens = []
@@ -7991,7 +7942,7 @@ async def _run_seed_explode(
                 break
         await asyncio.sleep(0.3)  # keywordstool 429 rate 회피
 
-    added = pool.add_candidates(user_id, customer_id, items) if items else 0
+    added = await adb(pool).add_candidates(user_id, customer_id, items) if items else 0
     dur_ms = int((_time.monotonic() - t0) * 1000)
     logger.warning(
         f"[pool/explode] user={user_id} cid={customer_id} 시드 {len(seeds)} → "
@@ -7999,7 +7950,7 @@ async def _run_seed_explode(
         f"(점수컷 {n_score_cut}, neg컷 {n_neg_cut}) → pending +{added} ({dur_ms}ms)"
     )
     try:
-        pool.record_run(
+        await adb(pool).record_run(
             user_id, customer_id, "seed_explode", "success" if added else "no_new",
             added=added, seeds_count=len(seeds),
             error_message=(
@@ -8133,14 +8084,13 @@ async def keyword_pool_admin_inspect_all(
     if request.user_id < 0:
         from services.naver_ad_service import NaverAdApiClient
         from datetime import datetime, timedelta
-        import sqlite3 as _sq
         target_uid = abs(request.user_id)
         account = get_ad_account(target_uid)
         if not account or not account.get("is_connected"):
             return {"debug": True, "error": "광고 계정 미연결"}
         customer_id_dbg = int(account.get("customer_id"))
         reg_dbg = get_registered_keywords_db()
-        with _sq.connect(reg_dbg.db_path) as conn:
+        with pooled(reg_dbg.db_path) as conn:
             row = conn.execute(
                 "SELECT ncc_keyword_id FROM registered_keywords WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL LIMIT 1",
                 (customer_id_dbg,),
@@ -8222,7 +8172,7 @@ async def dovision_migrate_hierarchy(
         raise HTTPException(status_code=400, detail=f"두비전 전용 엔드포인트 (cid {cid} 대상 아님)")
 
     pool = get_keyword_pool_db()
-    rows = pool.list_registered_rows(cid)
+    rows = await adb(pool).list_registered_rows(cid)
     buckets: Dict[str, Dict[str, Any]] = {}
     for _r in rows:
         _mk, _clabel, _slabel = _classify_dovision_category(_r["keyword"])
@@ -8253,7 +8203,7 @@ async def dovision_migrate_hierarchy(
     ids = [_r["id"] for _r in batch]
 
     reg = get_registered_keywords_db()
-    ncc_rows = reg.get_ncc_ids(cid, kws)
+    ncc_rows = await adb(reg).get_ncc_ids(cid, kws)
     ncc_ids = [x["ncc_keyword_id"] for x in ncc_rows if x.get("ncc_keyword_id")]
 
     client = NaverAdApiClient()
@@ -8276,8 +8226,8 @@ async def dovision_migrate_hierarchy(
     if ncc_ids and deleted == 0:
         raise HTTPException(status_code=502, detail=f"네이버 삭제 전량 실패 ({del_fail}개) — 상태 미변경")
 
-    removed = reg.mark_removed(cid, kws)
-    requeued = pool.mark_status(ids, "pending")
+    removed = await adb(reg).mark_removed(cid, kws)
+    requeued = await adb(pool).mark_status(ids, "pending")
     logger.warning(
         f"[dovi-migrate] cid={cid} {request.mid_key} 배치 {len(batch)} → "
         f"naver삭제 {deleted}(실패 {del_fail}) / reg-removed {removed} / pool→pending {requeued}"
@@ -8305,7 +8255,7 @@ async def keyword_pool_admin_delete_keywords(
             raise HTTPException(status_code=400, detail=f"user_id={request.user_id} 광고 계정 없음")
         customer_id = int(account.get("customer_id"))
         pool = get_keyword_pool_db()
-        deleted = pool.delete_keywords(customer_id, request.keywords)
+        deleted = await adb(pool).delete_keywords(customer_id, request.keywords)
         return {"success": True, "deleted": deleted, "user_id": request.user_id}
     except HTTPException:
         raise
@@ -8324,7 +8274,6 @@ async def keyword_pool_clicked_keywords(
     """클릭 발생한 키워드 list — 사용자 검수용. 시드 매칭 여부 표시."""
     from services.naver_ad_service import NaverAdApiClient
     from datetime import datetime, timedelta
-    import sqlite3 as _sqlite3
 
     try:
         account = _resolve_account(user_id, customer_id)
@@ -8333,7 +8282,7 @@ async def keyword_pool_clicked_keywords(
         customer_id = int(account.get("customer_id"))
 
         reg = get_registered_keywords_db()
-        with _sqlite3.connect(reg.db_path) as conn:
+        with pooled(reg.db_path) as conn:
             rows = conn.execute(
                 "SELECT keyword, ncc_keyword_id FROM registered_keywords WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL",
                 (customer_id,),
@@ -8382,7 +8331,7 @@ async def keyword_pool_clicked_keywords(
         all_stats: List[dict] = [s for batch in results for s in batch]
 
         pool = get_keyword_pool_db()
-        user_seeds = [s for s in (pool.list_user_seeds(customer_id) or []) if s and len(s) >= 2]
+        user_seeds = [s for s in (await adb(pool).list_user_seeds(customer_id) or []) if s and len(s) >= 2]
 
         items = []
         for stat in all_stats:
@@ -9517,7 +9466,6 @@ async def keyword_pool_bulk_delete_clicked(
 ):
     """선택된 키워드 일괄 네이버 삭제 (실패 시 PAUSE) + 풀 mark + reg DB 제거."""
     from services.naver_ad_service import NaverAdApiClient
-    import sqlite3 as _sqlite3
 
     try:
         account = _resolve_account(user_id, customer_id)
@@ -9539,7 +9487,7 @@ async def keyword_pool_bulk_delete_clicked(
         affected_keywords: List[str] = []
 
         for kid in request.keyword_ids:
-            with _sqlite3.connect(reg.db_path) as conn:
+            with pooled(reg.db_path) as conn:
                 row = conn.execute(
                     "SELECT keyword FROM registered_keywords WHERE account_customer_id=? AND ncc_keyword_id=?",
                     (customer_id, kid),
@@ -9547,7 +9495,7 @@ async def keyword_pool_bulk_delete_clicked(
             kw_text = row[0] if row else None
             try:
                 await client.delete_keyword(kid)
-                with _sqlite3.connect(reg.db_path) as conn:
+                with pooled(reg.db_path) as conn:
                     conn.execute(
                         "DELETE FROM registered_keywords WHERE account_customer_id=? AND ncc_keyword_id=?",
                         (customer_id, kid),
@@ -9564,7 +9512,7 @@ async def keyword_pool_bulk_delete_clicked(
             await asyncio.sleep(0.15)
 
         if affected_keywords:
-            pool.mark_rejected_by_naver(
+            await adb(pool).mark_rejected_by_naver(
                 customer_id,
                 [{"keyword": kw, "reason": "사용자 일괄 삭제 (클릭 검수)"} for kw in affected_keywords],
             )
@@ -9701,7 +9649,6 @@ async def _run_auto_cleanup_for_account(
     from services.naver_ad_service import NaverAdApiClient, _stats_breaker
     from database.naver_ad_db import get_ad_account_by_customer, record_auto_cleanup_run
     from datetime import datetime, timedelta
-    import sqlite3 as _sqlite3
 
     # Naver stats circuit OPEN 이면 click_cleanup 은 어차피 효과 0 — fly CPU 낭비 차단.
     # domain_cleanup (별도 cron) 이 circuit 무관하게 score 기반 정리하므로 누락 없음.
@@ -9714,7 +9661,7 @@ async def _run_auto_cleanup_for_account(
 
     reg = get_registered_keywords_db()
     pool = get_keyword_pool_db()
-    with _sqlite3.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         rows = conn.execute(
             "SELECT keyword, ncc_keyword_id FROM registered_keywords WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL",
             (customer_id,),
@@ -9785,7 +9732,7 @@ async def _run_auto_cleanup_for_account(
     if saved_basis:
         user_seeds = saved_basis
     else:
-        user_seeds = [s for s in (pool.list_user_seeds(customer_id) or []) if s and len(s) >= 2]
+        user_seeds = [s for s in (await adb(pool).list_user_seeds(customer_id) or []) if s and len(s) >= 2]
     targets: List[Tuple[str, str, int]] = []  # (kid, kw, score)
     for stat in all_stats:
         kid = stat.get("id")
@@ -9814,7 +9761,7 @@ async def _run_auto_cleanup_for_account(
     for kid, kw_text, _score in targets:
         try:
             await client.delete_keyword(kid)
-            with _sqlite3.connect(reg.db_path) as conn:
+            with pooled(reg.db_path) as conn:
                 conn.execute(
                     "DELETE FROM registered_keywords WHERE account_customer_id=? AND ncc_keyword_id=?",
                     (customer_id, kid),
@@ -9826,7 +9773,7 @@ async def _run_auto_cleanup_for_account(
             # 옛 코드는 fail 카운트해서 DB row 영구 보존 → 한도 stale, register 가 cap 거부됨.
             # 이제 DB row 도 같이 제거 → 실제 한도 회수.
             if getattr(e, "response", None) is not None and e.response.status_code == 404:
-                with _sqlite3.connect(reg.db_path) as conn:
+                with pooled(reg.db_path) as conn:
                     conn.execute(
                         "DELETE FROM registered_keywords WHERE account_customer_id=? AND ncc_keyword_id=?",
                         (customer_id, kid),
@@ -9850,14 +9797,14 @@ async def _run_auto_cleanup_for_account(
         await asyncio.sleep(0.15)
 
     if affected:
-        pool.mark_rejected_by_naver(
+        await adb(pool).mark_rejected_by_naver(
             customer_id,
             [{"keyword": kw, "reason": f"자동 cleanup (점수≤{threshold})"} for kw in affected],
         )
     # 실행 이력 — 화면 '최근 실행 이력' 표에 노출
     total_purged = n_deleted + n_stale_purged
     try:
-        pool.record_run(
+        await adb(pool).record_run(
             user_id, customer_id, "inspect",
             "success" if total_purged > 0 else "no_new",
             registered=0, failed=n_failed, skipped=total_purged,
@@ -9923,7 +9870,6 @@ async def _maybe_promote_auto_cleanup_threshold(
     from database.naver_ad_db import (
         get_ad_account_relevance_keywords, update_ad_account_auto_cleanup,
     )
-    import sqlite3 as _sqlite3
     import random as _random
 
     if current_threshold >= max_threshold:
@@ -9936,7 +9882,7 @@ async def _maybe_promote_auto_cleanup_threshold(
     reg = get_registered_keywords_db()
     pool = get_keyword_pool_db()
 
-    with _sqlite3.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         rows = conn.execute(
             "SELECT keyword FROM registered_keywords "
             "WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL "
@@ -9953,7 +9899,7 @@ async def _maybe_promote_auto_cleanup_threshold(
         score_basis = saved
     else:
         score_basis = [
-            s for s in (pool.list_user_seeds(customer_id) or []) if s and len(s) >= 2
+            s for s in (await adb(pool).list_user_seeds(customer_id) or []) if s and len(s) >= 2
         ]
     if not score_basis:
         return None  # 점수 계산 불가
@@ -9962,10 +9908,9 @@ async def _maybe_promote_auto_cleanup_threshold(
         _random.sample(keywords, sample_size) if len(keywords) > sample_size
         else keywords
     )
-    pass_count = 0
-    for kw in sample:
-        if _compute_relevance_score(kw, score_basis) >= next_threshold:
-            pass_count += 1
+    pass_count = sum(
+        1 for sc in compile_relevance(score_basis).score_many(sample) if sc >= next_threshold
+    )
     ratio = pass_count / len(sample)
     if ratio < promote_ratio:
         return None
@@ -9977,7 +9922,7 @@ async def _maybe_promote_auto_cleanup_threshold(
         return None
     # 진행 이력 — 화면 '최근 실행 이력' 표에 노출
     try:
-        pool.record_run(
+        await adb(pool).record_run(
             user_id, customer_id, "inspect", "success",
             error_message=(
                 f"threshold auto-promote {current_threshold} → {next_threshold} "
@@ -10005,7 +9950,6 @@ async def _run_domain_cleanup_for_account(
         get_ad_account_relevance_keywords,
         record_auto_cleanup_run,
     )
-    import sqlite3 as _sqlite3
     import time as _t
 
     t0 = _t.monotonic()
@@ -10022,7 +9966,7 @@ async def _run_domain_cleanup_for_account(
         score_basis = saved
         basis = "saved_relevance"
     else:
-        score_basis = [s for s in (pool.list_user_seeds(customer_id) or []) if s and len(s) >= 2]
+        score_basis = [s for s in (await adb(pool).list_user_seeds(customer_id) or []) if s and len(s) >= 2]
         basis = "user_seed"
     if not score_basis:
         return {"customer_id": customer_id, "deleted": 0, "reason": "no_score_basis"}
@@ -10039,7 +9983,7 @@ async def _run_domain_cleanup_for_account(
         pass
 
     reg = get_registered_keywords_db()
-    with _sqlite3.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         rows = conn.execute(
             "SELECT keyword, ncc_keyword_id FROM registered_keywords "
             "WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL",
@@ -10115,14 +10059,14 @@ async def _run_domain_cleanup_for_account(
     affected_kws: List[str] = []
     import httpx as _httpx
     def _purge_db(kid_: str, kw_: str):
-        with _sqlite3.connect(reg.db_path) as c:
+        with pooled(reg.db_path) as c:
             c.execute(
                 "DELETE FROM registered_keywords "
                 "WHERE account_customer_id=? AND ncc_keyword_id=?",
                 (customer_id, kid_),
             )
         if kw_:
-            with _sqlite3.connect(pool.db_path) as c:
+            with pooled(pool.db_path) as c:
                 c.execute(
                     "UPDATE naverad_keyword_pool SET status='deleted' "
                     "WHERE account_customer_id=? AND keyword=?",
@@ -10160,7 +10104,7 @@ async def _run_domain_cleanup_for_account(
         # 의미있는 결과만 stamp — 0 stamp 가 이전 cleanup 결과 overwrite 방지.
         if total_purged + n_pause > 0:
             record_auto_cleanup_run(user_id, str(customer_id), total_purged + n_pause)
-        pool.record_run(
+        await adb(pool).record_run(
             user_id, customer_id, "inspect",
             "success" if total_purged > 0 else "no_new",
             registered=0, failed=n_fail, skipped=total_purged,
@@ -10275,7 +10219,7 @@ async def keyword_pool_cron_seed_amplify_burst(
             return
 
         pool = get_keyword_pool_db()
-        user_seeds = pool.list_user_seeds(customer_id) or []
+        user_seeds = await adb(pool).list_user_seeds(customer_id) or []
         if not user_seeds:
             logger.warning(f"[seed-amplify-burst] cid={customer_id} user_seed 0 — abort")
             return
@@ -10305,7 +10249,7 @@ async def keyword_pool_cron_seed_amplify_burst(
 
         # 누적 fresh seeds — 원본 + 풀 dedup
         user_seed_set = set(user_seeds)
-        pool_set = pool.list_pool_keyword_set(customer_id)
+        pool_set = await adb(pool).list_pool_keyword_set(customer_id)
         seen: Set[str] = set()
         fresh_seeds: List[str] = []
         for batch in results:
@@ -10342,17 +10286,9 @@ async def keyword_pool_cron_seed_amplify_burst(
         client.secret_key = account["secret_key"]
 
         vol_t0 = _t.monotonic()
-        vol_map: Dict[str, dict] = {}
         CHUNK = 5
         CHUNKS_CAP = 200  # 1,000 seed 검증 (burst 모드)
-        chunks = [fresh_seeds[i:i + CHUNK] for i in range(0, len(fresh_seeds), CHUNK)][:CHUNKS_CAP]
-        for chunk in chunks:
-            try:
-                r = await client.get_keywords_volume_batch(chunk)
-                vol_map.update(r)
-            except Exception as e:
-                logger.debug(f"[seed-amplify-burst] volume batch 실패: {e}")
-            await asyncio.sleep(0.3)
+        vol_map = await keyword_volume.lookup(fresh_seeds[:CHUNKS_CAP * CHUNK], client=client)
         vol_ms = int((_t.monotonic() - vol_t0) * 1000)
 
         # mt≥1 만 user_seed 합류 — mt=0 zerovol 시드는 등록 락 사고로 제거 (2026-05-12).
@@ -10361,7 +10297,7 @@ async def keyword_pool_cron_seed_amplify_burst(
         items_with_vol: List[Dict] = []
         zerovol_count = 0
         for s in fresh_seeds:
-            v = vol_map.get(s) or vol_map.get(s.replace(" ", ""))
+            v = vol_map.get(s)
             mt = int((v or {}).get("monthly_total") or 0)
             if v and mt >= 1:
                 items_with_vol.append({
@@ -10381,7 +10317,7 @@ async def keyword_pool_cron_seed_amplify_burst(
         promoted = 0
         if merged:
             try:
-                promoted = pool.add_candidates(user_id, customer_id, merged)
+                promoted = await adb(pool).add_candidates(user_id, customer_id, merged)
             except Exception as e:
                 logger.warning(f"[seed-amplify-burst] add 실패: {e}")
 
@@ -10392,7 +10328,7 @@ async def keyword_pool_cron_seed_amplify_burst(
             f"fresh {len(fresh_seeds)} → mt≥1 {len(items_with_vol)} (zerovol 컷 {zerovol_count}) "
             f"→ user_seed +{promoted} (GPT {am_ms}ms, vol {vol_ms}ms)"
         )
-        pool.record_run(
+        await adb(pool).record_run(
             user_id, customer_id, "seed_amplify_burst",
             "success" if promoted > 0 else "no_match",
             added=promoted, seeds_count=len(user_seeds),
@@ -10448,7 +10384,7 @@ async def keyword_pool_cron_cleanup_zerovol_seeds(
     results = []
     for uid, cid in targets:
         try:
-            r = pool.cleanup_zerovol_user_seeds(cid)
+            r = await adb(pool).cleanup_zerovol_user_seeds(cid)
             results.append({"user_id": uid, "customer_id": cid, **r})
             by_src = r.get("by_source") or {}
             src_summary = ", ".join(f"{k or '<null>'}={v}" for k, v in list(by_src.items())[:6])
@@ -10545,7 +10481,6 @@ async def keyword_pool_registered_cleanup_by_score(
     """
     from services.naver_ad_service import NaverAdApiClient
     from database.naver_ad_db import record_auto_cleanup_run
-    import sqlite3 as _sqlite3
     import time as _t
     _t0 = _t.monotonic()
 
@@ -10576,7 +10511,7 @@ async def keyword_pool_registered_cleanup_by_score(
             score_basis = saved
             basis_source = "saved"
         else:
-            score_basis = [s for s in (pool.list_user_seeds(cid) or []) if s and len(s) >= 2]
+            score_basis = [s for s in (await adb(pool).list_user_seeds(cid) or []) if s and len(s) >= 2]
             basis_source = "user_seed_fallback"
 
     if not score_basis:
@@ -10589,7 +10524,7 @@ async def keyword_pool_registered_cleanup_by_score(
         )
     user_seeds = score_basis  # 이하 코드와 호환 (변수명 유지)
 
-    with _sqlite3.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         rows = conn.execute(
             "SELECT keyword, ncc_keyword_id FROM registered_keywords "
             "WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL",
@@ -10722,7 +10657,7 @@ async def keyword_pool_registered_cleanup_by_score(
             for kid, kw_text, _s in targets_capped:
                 try:
                     await client.delete_keyword(kid)
-                    with _sqlite3.connect(reg.db_path) as c:
+                    with pooled(reg.db_path) as c:
                         c.execute(
                             "DELETE FROM registered_keywords "
                             "WHERE account_customer_id=? AND ncc_keyword_id=?",
@@ -10739,12 +10674,12 @@ async def keyword_pool_registered_cleanup_by_score(
                         n_fail += 1
                 await asyncio.sleep(0.15)
             if affected:
-                pool.mark_rejected_by_naver(
+                await adb(pool).mark_rejected_by_naver(
                     cid,
                     [{"keyword": kw, "reason": f"수동 점수 정리(≤{threshold})"} for kw in affected],
                 )
             try:
-                pool.record_run(
+                await adb(pool).record_run(
                     user_id, cid, "inspect",
                     "success" if n_del > 0 else "no_new",
                     registered=0, failed=n_fail, skipped=n_del,
@@ -10805,7 +10740,6 @@ async def keyword_pool_reactivate_failed(
     드리프트 방지: relevance 게이트 통과분만. deleted 는 기본 제외 (과거 off-domain 퍼지 부활 차단).
     dry_run=true: 점수 분포 + 대상 미리보기. false: status='pending' UPDATE → register cron(30s) 소진.
     """
-    import sqlite3 as _sqlite3
     import time as _t
     _t0 = _t.monotonic()
 
@@ -10834,7 +10768,7 @@ async def keyword_pool_reactivate_failed(
         if saved:
             score_basis = saved; basis_source = "saved"
         else:
-            score_basis = [s for s in (pool.list_user_seeds(cid) or []) if s and len(s) >= 2]
+            score_basis = [s for s in (await adb(pool).list_user_seeds(cid) or []) if s and len(s) >= 2]
             basis_source = "user_seed_fallback"
     if not score_basis:
         raise HTTPException(status_code=400, detail="점수 기준 키워드 없음 — relevance_keywords 저장 또는 override 필요")
@@ -10845,7 +10779,7 @@ async def keyword_pool_reactivate_failed(
         if request.phantom_registered:
             # phantom = pool.status='registered' 인데 registered_keywords(별도 DB)에 ncc_id 없음.
             reg = get_registered_keywords_db()
-            with _sqlite3.connect(reg.db_path, timeout=30.0) as rc:
+            with pooled(reg.db_path, timeout=30.0) as rc:
                 live_set = {
                     k for (k,) in rc.execute(
                         "SELECT keyword FROM registered_keywords "
@@ -10853,7 +10787,7 @@ async def keyword_pool_reactivate_failed(
                         (cid,),
                     ).fetchall()
                 }
-            with _sqlite3.connect(pool.db_path, timeout=30.0) as conn:
+            with pooled(pool.db_path, timeout=30.0) as conn:
                 all_reg = conn.execute(
                     """SELECT id, keyword, COALESCE(monthly_total,0)
                        FROM naverad_keyword_pool
@@ -10863,7 +10797,7 @@ async def keyword_pool_reactivate_failed(
                 ).fetchall()
             return [(rid, kw, mt) for rid, kw, mt in all_reg if kw not in live_set], ["registered(phantom)"]
         placeholders = ",".join("?" * len(statuses))
-        with _sqlite3.connect(pool.db_path, timeout=30.0) as conn:
+        with pooled(pool.db_path, timeout=30.0) as conn:
             rows = conn.execute(
                 f"""SELECT id, keyword, COALESCE(monthly_total,0)
                     FROM naverad_keyword_pool
@@ -10915,7 +10849,7 @@ async def keyword_pool_reactivate_failed(
     def _apply_update(capped):
         ids = [rid for rid, _, _, _ in capped]
         n = 0
-        with _sqlite3.connect(pool.db_path, timeout=30.0) as conn:
+        with pooled(pool.db_path, timeout=30.0) as conn:
             for i in range(0, len(ids), 900):
                 chunk = ids[i:i + 900]
                 ph = ",".join("?" * len(chunk))
@@ -11050,7 +10984,7 @@ async def keyword_pool_admin_purge_drift(
     sample_user_seed: List[str] = []
     sample_pending: List[str] = []
 
-    with _sqlite3.connect(pool.db_path) as conn:
+    with pooled(pool.db_path) as conn:
         conn.row_factory = _sqlite3.Row
 
         # user_seed 정리
@@ -11060,12 +10994,12 @@ async def keyword_pool_admin_purge_drift(
                  AND status NOT IN ('registered', 'failed')""",
             (customer_id,),
         ).fetchall()
-        user_seed_to_delete: List[str] = []
-        for r in user_seed_rows:
-            kw = r["keyword"]
-            sc = _compute_relevance_score(kw, score_basis)
-            if sc < threshold:  # Option B: boundary 보존
-                user_seed_to_delete.append(kw)
+        matcher = compile_relevance(score_basis)
+        user_seed_kws = [r["keyword"] for r in user_seed_rows]
+        user_seed_to_delete: List[str] = [
+            kw for kw, sc in zip(user_seed_kws, matcher.score_many(user_seed_kws))
+            if sc < threshold  # Option B: boundary 보존
+        ]
 
         # pending 정리
         pending_rows = conn.execute(
@@ -11073,12 +11007,11 @@ async def keyword_pool_admin_purge_drift(
                WHERE account_customer_id=? AND status='pending'""",
             (customer_id,),
         ).fetchall()
-        pending_to_delete: List[str] = []
-        for r in pending_rows:
-            kw = r["keyword"]
-            sc = _compute_relevance_score(kw, score_basis)
-            if sc < threshold:  # Option B: boundary 보존
-                pending_to_delete.append(kw)
+        pending_kws = [r["keyword"] for r in pending_rows]
+        pending_to_delete: List[str] = [
+            kw for kw, sc in zip(pending_kws, matcher.score_many(pending_kws))
+            if sc < threshold  # Option B: boundary 보존
+        ]
 
         sample_user_seed = user_seed_to_delete[:10]
         sample_pending = pending_to_delete[:10]
@@ -11111,7 +11044,7 @@ async def keyword_pool_admin_purge_drift(
                 pending_deleted += cur.rowcount
 
     # ===== Stage 2: registered Naver DELETE (background) =====
-    with _sqlite3.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         conn.row_factory = _sqlite3.Row
         reg_rows = conn.execute(
             "SELECT keyword, ncc_keyword_id FROM registered_keywords "
@@ -11194,7 +11127,7 @@ async def keyword_pool_admin_purge_drift(
         for kid, kw_text, _s in reg_capped:
             try:
                 await client.delete_keyword(kid)
-                with _sqlite3.connect(reg.db_path) as c:
+                with pooled(reg.db_path) as c:
                     c.execute(
                         "DELETE FROM registered_keywords "
                         "WHERE account_customer_id=? AND ncc_keyword_id=?",
@@ -11211,7 +11144,7 @@ async def keyword_pool_admin_purge_drift(
                     n_fail += 1
             await asyncio.sleep(0.15)
         if affected:
-            pool.mark_rejected_by_naver(
+            await adb(pool).mark_rejected_by_naver(
                 customer_id,
                 [{"keyword": kw, "reason": f"purge-drift(score≤{threshold})"} for kw in affected],
             )
@@ -11301,7 +11234,7 @@ async def cleanup_non_domain_seeds(
             domain_kws = saved
             basis_source = "saved_relevance"
         else:
-            domain_kws = [s for s in (pool.list_user_seeds(cid) or []) if s and len(s) >= 2]
+            domain_kws = [s for s in (await adb(pool).list_user_seeds(cid) or []) if s and len(s) >= 2]
             basis_source = "user_seed_fallback"
     if not domain_kws:
         raise HTTPException(
@@ -11317,7 +11250,7 @@ async def cleanup_non_domain_seeds(
         return any(t in s for t in domain_tokens)
 
     # 2) 시드별 등록 KW 수 집계 (status=registered)
-    with _sqlite3.connect(pool.db_path) as conn:
+    with pooled(pool.db_path) as conn:
         seed_rows = conn.execute(
             """SELECT coalesce(seed,''), COUNT(*) AS n
                FROM naverad_keyword_pool
@@ -11347,7 +11280,7 @@ async def cleanup_non_domain_seeds(
 
     non_domain_seed_set = {s for s, _ in non_domain_seeds}
     placeholders = ",".join("?" * len(non_domain_seed_set))
-    with _sqlite3.connect(pool.db_path) as conn:
+    with pooled(pool.db_path) as conn:
         conn.row_factory = _sqlite3.Row
         kw_rows = conn.execute(
             f"""SELECT p.keyword, p.seed, r.ncc_keyword_id
@@ -11404,13 +11337,13 @@ async def cleanup_non_domain_seeds(
         for kid, kw_text, _seed in targets_capped:
             try:
                 await client.delete_keyword(kid)
-                with _sqlite3.connect(reg.db_path) as c:
+                with pooled(reg.db_path) as c:
                     c.execute(
                         "DELETE FROM registered_keywords "
                         "WHERE account_customer_id=? AND ncc_keyword_id=?",
                         (cid, kid),
                     )
-                with _sqlite3.connect(pool.db_path) as c:
+                with pooled(pool.db_path) as c:
                     c.execute(
                         "UPDATE naverad_keyword_pool SET status='deleted' "
                         "WHERE account_customer_id=? AND keyword=?",
@@ -11427,7 +11360,7 @@ async def cleanup_non_domain_seeds(
                     n_fail += 1
             await asyncio.sleep(0.15)
         try:
-            pool.record_run(
+            await adb(pool).record_run(
                 user_id, cid, "inspect",
                 "success" if n_del > 0 else "no_new",
                 registered=0, failed=n_fail, skipped=n_del,
@@ -11470,7 +11403,6 @@ async def keyword_pool_reconcile_naver(
 ):
     """네이버 광고 콘솔에서 직접 삭제한 캠페인 — 우리 DB 정리. 한도 사용량 정확화."""
     from services.naver_ad_service import NaverAdApiClient
-    import sqlite3 as _sqlite3
     from asyncio import sleep as _sleep
 
     account = _resolve_account(user_id, customer_id)
@@ -11498,7 +11430,7 @@ async def keyword_pool_reconcile_naver(
 
     reg = get_registered_keywords_db()
     # 2) 우리 DB 의 distinct campaign_id
-    with _sqlite3.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         rows = conn.execute(
             "SELECT DISTINCT campaign_id FROM registered_keywords "
             "WHERE account_customer_id=? AND campaign_id IS NOT NULL",
@@ -11522,7 +11454,7 @@ async def keyword_pool_reconcile_naver(
     # 3) DB 에 있지만 네이버에 없는 캠페인 → 그 캠페인의 모든 row 삭제
     deleted_campaigns = db_campaign_ids - live_campaign_ids
     n_rows_deleted = 0
-    with _sqlite3.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         for cid_to_delete in deleted_campaigns:
             cur = conn.execute(
                 "DELETE FROM registered_keywords WHERE account_customer_id=? AND campaign_id=?",
@@ -11560,7 +11492,7 @@ async def keyword_pool_reconcile_naver(
             live_ad_group_ids = set()  # 부분 결과로 잘못 삭제하지 않도록 비움
 
         if live_ad_group_ids:
-            with _sqlite3.connect(reg.db_path) as conn:
+            with pooled(reg.db_path) as conn:
                 rows2 = conn.execute(
                     "SELECT DISTINCT ad_group_id FROM registered_keywords "
                     "WHERE account_customer_id=? AND ad_group_id IS NOT NULL",
@@ -11579,7 +11511,7 @@ async def keyword_pool_reconcile_naver(
         logger.warning(f"[reconcile] 광고그룹 cross-check 실패: {e}")
 
     # 5) 한도 재계산
-    new_active = int((reg.stats(cid) or {}).get("active") or 0)
+    new_active = int((await adb(reg).stats(cid) or {}).get("active") or 0)
     logger.warning(
         f"[reconcile] uid={user_id} cid={cid} "
         f"live_campaigns={len(live_campaign_ids)} db_campaigns={len(db_campaign_ids)} "
@@ -11614,7 +11546,6 @@ async def keyword_pool_wipe_customer_db(
         raise HTTPException(status_code=400, detail="confirm=WIPE 명시 필요 (안전장치)")
     if not customer_id:
         raise HTTPException(status_code=400, detail="customer_id 필수")
-    import sqlite3 as _sqlite3
     account = _resolve_account(user_id, customer_id)
     if not account:
         raise HTTPException(status_code=400, detail="광고 계정 미연결")
@@ -11625,14 +11556,14 @@ async def keyword_pool_wipe_customer_db(
 
     n_reg = 0
     n_pool = 0
-    with _sqlite3.connect(reg.db_path) as conn:
+    with pooled(reg.db_path) as conn:
         cur = conn.execute(
             "DELETE FROM registered_keywords WHERE account_customer_id=?",
             (cid,),
         )
         n_reg = cur.rowcount or 0
         conn.commit()
-    with _sqlite3.connect(pool.db_path) as conn:
+    with pooled(pool.db_path) as conn:
         cur = conn.execute(
             "DELETE FROM naverad_keyword_pool WHERE account_customer_id=?",
             (cid,),
@@ -11760,7 +11691,7 @@ async def keyword_pool_rebuild_from_naver(
             except _sqlite3.Error as e:
                 logger.warning(f"[rebuild] upsert 실패 {r['keyword']}: {e}")
 
-    new_active = int((reg.stats(cid) or {}).get("active") or 0)
+    new_active = int((await adb(reg).stats(cid) or {}).get("active") or 0)
     logger.warning(
         f"[rebuild] uid={user_id} cid={cid} campaigns={len(live_campaigns)} "
         f"ad_groups={len(ag_to_camp)} pulled={len(rows)} new_active={new_active}"
@@ -11867,7 +11798,7 @@ async def keyword_pool_rebuild_from_naver_bg(
                         )
                     except _sqlite3.Error:
                         pass
-            st["new_active"] = int((reg.stats(cid) or {}).get("active") or 0)
+            st["new_active"] = int((await adb(reg).stats(cid) or {}).get("active") or 0)
             st["state"] = "done"
             logger.warning(
                 f"[rebuild-bg] cid={cid} campaigns={st['campaigns']} "
@@ -11909,7 +11840,7 @@ async def keyword_pool_delete_keyword(
             raise HTTPException(status_code=400, detail="광고 계정 미연결")
         customer_id = int(account.get("customer_id"))
         pool = get_keyword_pool_db()
-        n = pool.delete_keywords(customer_id, [keyword])
+        n = await adb(pool).delete_keywords(customer_id, [keyword])
         return {"success": True, "deleted": n, "keyword": keyword}
     except HTTPException:
         raise
@@ -11932,7 +11863,7 @@ async def keyword_pool_delete_seed(
             raise HTTPException(status_code=400, detail="광고 계정 미연결")
         customer_id = int(account.get("customer_id"))
         pool = get_keyword_pool_db()
-        n = pool.delete_seed_with_children(customer_id, seed)
+        n = await adb(pool).delete_seed_with_children(customer_id, seed)
         return {"success": True, "deleted": n, "seed": seed}
     except HTTPException:
         raise
@@ -11959,7 +11890,7 @@ async def keyword_pool_add_seeds(
             {"keyword": s.strip(), "seed": s.strip(), "source": "user_seed", "monthly_total": 0}
             for s in request.seeds if s and s.strip()
         ]
-        added = pool.add_candidates(user_id, customer_id, items)
+        added = await adb(pool).add_candidates(user_id, customer_id, items)
         return {"success": True, "added": added, "total_input": len(items)}
     except HTTPException:
         raise
@@ -12099,37 +12030,29 @@ async def keyword_pool_ai_expand_seeds(
         validated: List[Dict] = []
         validated_seen: Set[str] = set()
 
-        def _norm(s: str) -> str:
-            return (s or "").replace(" ", "").upper()
-
-        for i in range(0, len(domain_pass), 5):
-            chunk = domain_pass[i:i + 5]
-            try:
-                vol_map = await client.get_keywords_volume_batch(chunk)
-            except Exception as e:
-                logger.warning(f"[ai-expand] volume batch 실패 {chunk}: {e}")
+        # 공백·대소문자 무관 매칭, 5개씩 배치, 콜 간격은 keyword_volume 이 한다.
+        vol_map = await keyword_volume.lookup(domain_pass, client=client)
+        failed = sum(1 for kw in domain_pass if kw not in vol_map)
+        if failed:
+            logger.warning(f"[ai-expand] volume 조회 실패 {failed}/{len(domain_pass)}개")
+        for kw in domain_pass:
+            vinfo = vol_map.get(kw)
+            if not vinfo:
                 continue
-            # vol_map key 정규화 — Naver 응답 키는 공백 제거된 형태로 옴
-            norm_vol_map: Dict[str, Dict] = {_norm(k): v for k, v in vol_map.items()}
-            for kw in chunk:
-                vinfo = norm_vol_map.get(_norm(kw))
-                if not vinfo:
-                    continue
-                mt = int(vinfo.get("monthly_total") or 0)
-                if mt < request.min_volume:
-                    continue
-                if kw in validated_seen:
-                    continue
-                validated_seen.add(kw)
-                validated.append({
-                    "keyword": kw,
-                    "monthly_total": mt,
-                    "monthly_pc": int(vinfo.get("monthly_pc") or 0),
-                    "monthly_mobile": int(vinfo.get("monthly_mobile") or 0),
-                    "comp_idx": vinfo.get("comp_idx"),
-                    "seed": f"ai_cycle{cycle_idx+1}",
-                })
-            await asyncio.sleep(0.3)
+            mt = int(vinfo.get("monthly_total") or 0)
+            if mt < request.min_volume:
+                continue
+            if kw in validated_seen:
+                continue
+            validated_seen.add(kw)
+            validated.append({
+                "keyword": kw,
+                "monthly_total": mt,
+                "monthly_pc": int(vinfo.get("monthly_pc") or 0),
+                "monthly_mobile": int(vinfo.get("monthly_mobile") or 0),
+                "comp_idx": vinfo.get("comp_idx"),
+                "seed": f"ai_cycle{cycle_idx+1}",
+            })
 
         # 4) user_seed 로 INSERT — 다음 cycle 의 시드로 활용
         # add_candidates 는 source=user_seed 가 아니어도 INSERT 함. 시드 효과 위해
@@ -12138,7 +12061,7 @@ async def keyword_pool_ai_expand_seeds(
             {**v, "source": "user_seed", "monthly_total": v["monthly_total"]}
             for v in validated
         ]
-        added = pool.add_candidates(user_id, customer_id, seed_items)
+        added = await adb(pool).add_candidates(user_id, customer_id, seed_items)
 
         cycle_results.append({
             "cycle": cycle_idx + 1,
@@ -12488,7 +12411,6 @@ async def keyword_pool_bid_core_min_exposure(
         # DB(registered_keywords)에서 대상 키워드 추출. 두 모드:
         #  (A) domain_tokens+intent_tokens 지정 시: (질환 AND 의향) AND NOT 제외 — '병원오기직전' 정밀 필터
         #  (B) 그 외: core 토큰 OR (기존 동작)
-        import sqlite3 as _sq
         from database.registered_keywords_db import get_registered_keywords_db
         reg = get_registered_keywords_db()
         base = ("SELECT keyword, ad_group_id, ncc_keyword_id, bid_amt FROM registered_keywords "
@@ -12498,7 +12420,7 @@ async def keyword_pool_bid_core_min_exposure(
         if request.keywords:
             # 명시적 키워드 리스트 모드 — 전체 actionable 행을 가져와 파이썬에서 정확 매칭(SQL IN 한계 회피)
             kset = {k.strip() for k in request.keywords if k and k.strip()}
-            with _sq.connect(reg.db_path) as conn:
+            with pooled(reg.db_path) as conn:
                 allrows = conn.execute(base, params).fetchall()
             rows = [r for r in allrows if (r[0] or "").strip() in kset]
             return [{"id": r[2], "gid": r[1], "text": r[0], "bid": r[3]} for r in rows]
@@ -12523,7 +12445,7 @@ async def keyword_pool_bid_core_min_exposure(
             params += [f"%{t}%" for t in core]
         base += " LIMIT ?"
         params += [request.max_keywords]
-        with _sq.connect(reg.db_path) as conn:
+        with pooled(reg.db_path) as conn:
             rows = conn.execute(base, params).fetchall()
         return [{"id": r[2], "gid": r[1], "text": r[0], "bid": r[3]} for r in rows]
 
@@ -12735,7 +12657,6 @@ async def keyword_pool_bid_inspect_by_name(
         cid = int(account.get("customer_id"))
 
         # DB(registered_keywords)에서 대상 키워드의 ad_group_id 를 찾아 그 그룹만 네이버 조회(전체 스캔 회피).
-        import sqlite3 as _sq
         from database.registered_keywords_db import get_registered_keywords_db
         reg = get_registered_keywords_db()
         names_list = sorted(target_set)
@@ -12747,7 +12668,7 @@ async def keyword_pool_bid_inspect_by_name(
         else:
             base += "AND keyword IN (" + ",".join(["?"] * len(names_list)) + ")"
             params = [cid] + names_list
-        with _sq.connect(reg.db_path) as conn:
+        with pooled(reg.db_path) as conn:
             rows = conn.execute(base, params).fetchall()
         # DB 에 매칭된 키워드 텍스트 집합 + 그 그룹들. 네이버 응답과의 공백차 매칭 위해 strip 키로 정규화.
         db_match = {(r[0] or "").strip(): {"gid": r[1], "db_bid": r[2], "raw": r[0]} for r in rows}
@@ -15420,7 +15341,6 @@ async def keyword_pool_promote_core(
 ):
     """중요도 상위(score>=score_min) 핵심 키워드를 풀에서 전용 고예산 캠페인으로 이동 + 의료심의 소재 부착.
     스코어링은 bulk-rank-bid 와 동일(지역/의도/질환/브랜드). dry_run: 승격 대상 분포/샘플/구조 미리보기."""
-    import sqlite3 as _sq
     from services.naver_ad_service import NaverAdApiClient
     from database.registered_keywords_db import get_registered_keywords_db
     account = _resolve_account(user_id, customer_id)
@@ -15475,10 +15395,10 @@ async def keyword_pool_promote_core(
                 seen_kw.add(kk)
                 uniq.append(kk)
         if request.skip_existing:
-            uniq = reg.filter_new(cid, uniq)
+            uniq = await adb(reg).read.filter_new(cid, uniq)
         core = [(kw, None, None, _score(kw)) for kw in uniq][: request.max_keywords]
     else:
-        with _sq.connect(reg.db_path, timeout=30.0) as conn:
+        with pooled(reg.db_path, timeout=30.0) as conn:
             rows = conn.execute(
                 "SELECT keyword, ncc_keyword_id, ad_group_id FROM registered_keywords "
                 "WHERE account_customer_id=? AND ncc_keyword_id IS NOT NULL AND ad_group_id IS NOT NULL AND removed_at IS NULL",
@@ -15612,13 +15532,13 @@ async def keyword_pool_promote_core(
         _bm = request.bids or {}
         try:
             if explicit_mode:
-                reg.insert_batch(user_id, cid, [
+                await adb(reg).insert_batch(user_id, cid, [
                     {"keyword": kt, "ad_group_id": gid, "campaign_id": new_cid,
                      "bid_amt": max(70, int(_bm.get(kt, request.init_bid))),
                      "ncc_keyword_id": knid}
                     for kt, knid, gid in moved])
             else:
-                with _sq.connect(reg.db_path, timeout=30.0) as conn:
+                with pooled(reg.db_path, timeout=30.0) as conn:
                     for kt, knid, gid in moved:
                         conn.execute(
                             "UPDATE registered_keywords SET campaign_id=?, ad_group_id=?, ncc_keyword_id=?, bid_amt=? "
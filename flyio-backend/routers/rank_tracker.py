@@ -13,9 +13,9 @@ import os
 import json
 import uuid
 import logging
-import asyncio
 import io
 
+from database.async_db import adb
 from database.rank_tracker_db import get_rank_tracker_db
 from database.subscription_db import get_user_subscription, PLAN_LIMITS, PlanType
 from routers.auth import get_current_user_optional
@@ -475,8 +475,9 @@ async def admin_measure_all(
     if not blogs:
         return {"success": True, "queued": 0, "message": "측정할 활성 블로그가 없습니다."}
 
-    # 백그라운드로 각 블로그 측정 작업 큐
-    queued = 0
+    # 블로그마다 작업(진행 상태)은 따로 만들되, 측정은 백그라운드 한 번으로 —
+    # 여러 블로그가 공유하는 키워드의 SERP 를 한 번만 받는다(services/rank_measurement).
+    jobs = []
     for b in blogs:
         # 동일 사용자 진행 중 작업 있으면 스킵
         if db.get_user_running_task(b["user_id"]):
@@ -484,15 +485,10 @@ async def admin_measure_all(
             continue
         task_id = f"cron-{uuid.uuid4().hex[:12]}"
         db.create_check_task(task_id, b["user_id"], b["id"])
-        background_tasks.add_task(
-            run_rank_check,
-            task_id=task_id,
-            tracked_blog_id=b["id"],
-            blog_id=b["blog_id"],
-            max_posts=50,
-            force_refresh=True,
-        )
-        queued += 1
+        jobs.append({"task_id": task_id, "tracked_blog_id": b["id"], "blog_id": b["blog_id"]})
+    queued = len(jobs)
+    if jobs:
+        background_tasks.add_task(run_measure_all, jobs, max_posts=50, force_refresh=True)
 
     logger.info(f"[CRON] queued {queued}/{len(blogs)} blog measurements")
     return {
@@ -682,108 +678,146 @@ async def export_to_excel(
 async def run_rank_check(task_id: str, tracked_blog_id: int, blog_id: str,
                         max_posts: int = 50, force_refresh: bool = False):
     """백그라운드에서 순위 확인 실행"""
+    await run_measure_all([{
+        "task_id": task_id,
+        "tracked_blog_id": tracked_blog_id,
+        "blog_id": blog_id,
+    }], max_posts=max_posts, force_refresh=force_refresh)
+
+
+async def run_measure_all(jobs: List[dict], max_posts: int = 50, force_refresh: bool = False):
+    """블로그 여러 개를 키워드 중심으로 한 번에 측정.
+
+    jobs: [{"task_id", "tracked_blog_id", "blog_id"}] — 작업(rank_check_tasks)은 호출부가 만든다.
+      1) 블로그마다 포스팅 수집 + 키워드 추출 (_sync_blog_keywords)
+      2) 전 블로그 키워드 합집합을 SERP 한 번씩으로 측정 (services/rank_measurement)
+      3) rank_history 일괄 INSERT → 블로그별 완료 처리 + lifecycle 알림
+    """
+    from services.rank_measurement import measure_keywords
+
     db = get_rank_tracker_db()
+    targets = []
+    ready = []
+    for job in jobs:
+        try:
+            keywords = await _sync_blog_keywords(db, job["task_id"], job["tracked_blog_id"],
+                                                 job["blog_id"], max_posts, force_refresh)
+        except Exception as e:
+            logger.error(f"Rank check failed for blog {job['blog_id']}: {e}")
+            db.complete_task(job["task_id"], str(e))
+            continue
+        if keywords is None:
+            continue
+        ready.append(job)
+        for kw in keywords:
+            targets.append({
+                "keyword_id": kw["id"],
+                "keyword": kw["keyword"],
+                "blog_id": job["blog_id"],
+                "post_url": kw["post_url"],
+                "task_id": job["task_id"],
+            })
 
-    try:
-        logger.info(f"Starting rank check for blog {blog_id}, task {task_id}")
+    if not ready:
+        return
 
-        # 1. 포스팅 수집
-        from services.blog_scraper import BlogScraper
-        scraper = BlogScraper()
+    completed = {job["task_id"]: 0 for job in ready}
 
-        posts = await scraper.get_blog_posts(blog_id, max_posts)
-        if not posts:
-            db.complete_task(task_id, "포스팅을 찾을 수 없습니다.")
-            return
+    async def progress(keyword: str, group: List[dict]):
+        for task_id in {t["task_id"] for t in group}:
+            completed[task_id] += sum(1 for t in group if t["task_id"] == task_id)
+            await adb(db).update_task_progress(task_id, completed[task_id], keyword)
 
-        logger.info(f"Found {len(posts)} posts for blog {blog_id}")
-
-        # 2. 포스팅 저장 및 키워드 추출
-        from services.keyword_extractor import KeywordExtractor
-        extractor = KeywordExtractor()
-
-        all_keywords = []
-        for post in posts:
-            # 포스팅 저장
-            saved_post = db.add_tracked_post(
-                tracked_blog_id,
-                post.get('post_id', ''),
-                post.get('title', ''),
-                post.get('url', ''),
-                post.get('published_date')
-            )
+    try:
+        rows = await measure_keywords(targets, on_keyword=progress)
+        await adb(db).add_rank_history_bulk(rows)
+    except Exception as e:
+        logger.error(f"Rank measurement failed ({len(ready)} blogs): {e}")
+        for job in ready:
+            db.complete_task(job["task_id"], str(e))
+        return
 
-            # 키워드 추출 (force_refresh면 기존 키워드 삭제)
-            if force_refresh:
-                db.delete_post_keywords(saved_post['id'])
-
-            existing_keywords = db.get_post_keywords(saved_post['id'])
-            if not existing_keywords or force_refresh:
-                keywords = extractor.extract(post.get('title', ''))
-                for i, kw in enumerate(keywords[:2]):  # 최대 2개
-                    keyword_data = db.add_post_keyword(saved_post['id'], kw, priority=i+1)
-                    all_keywords.append({
-                        **keyword_data,
-                        'post_url': saved_post['url']
-                    })
-            else:
-                for kw in existing_keywords:
-                    all_keywords.append({
-                        **kw,
-                        'post_url': saved_post['url']
-                    })
-
-        # 총 키워드 수 업데이트
-        total_keywords = len(all_keywords)
-        with db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "UPDATE rank_check_tasks SET total_keywords = ? WHERE task_id = ?",
-                (total_keywords, task_id)
-            )
+    for job in ready:
+        await _finish_rank_check(db, job["task_id"], job["tracked_blog_id"], job["blog_id"])
 
-        logger.info(f"Total {total_keywords} keywords to check")
 
-        # 3. 순위 조회
-        from services.rank_checker import RankChecker
-        checker = RankChecker()
+async def _sync_blog_keywords(db, task_id: str, tracked_blog_id: int, blog_id: str,
+                              max_posts: int, force_refresh: bool) -> Optional[List[dict]]:
+    """포스팅 수집·저장 + 키워드 추출. 측정할 키워드 목록(포스팅 없으면 작업 종료 후 None)."""
+    logger.info(f"Starting rank check for blog {blog_id}, task {task_id}")
 
-        for i, kw_data in enumerate(all_keywords):
-            db.update_task_progress(task_id, i, kw_data['keyword'])
+    # 1. 포스팅 수집
+    from services.blog_scraper import BlogScraper
+    scraper = BlogScraper()
 
-            try:
-                # 블로그탭 순위
-                blog_rank = await checker.check_blog_tab_rank(kw_data['keyword'], blog_id)
+    posts = await scraper.get_blog_posts(blog_id, max_posts)
+    if not posts:
+        db.complete_task(task_id, "포스팅을 찾을 수 없습니다.")
+        return None
 
-                # VIEW탭 순위
-                view_rank = await checker.check_view_tab_rank(kw_data['keyword'], kw_data['post_url'])
+    logger.info(f"Found {len(posts)} posts for blog {blog_id}")
 
-                # 히스토리 저장
-                db.add_rank_history(kw_data['id'], blog_rank, view_rank)
+    # 2. 포스팅 저장 및 키워드 추출
+    from services.keyword_extractor import KeywordExtractor
+    extractor = KeywordExtractor()
 
-                logger.debug(f"Keyword '{kw_data['keyword']}': blog={blog_rank}, view={view_rank}")
+    all_keywords = []
+    for post in posts:
+        # 포스팅 저장
+        saved_post = db.add_tracked_post(
+            tracked_blog_id,
+            post.get('post_id', ''),
+            post.get('title', ''),
+            post.get('url', ''),
+            post.get('published_date')
+        )
 
-            except Exception as e:
-                logger.warning(f"Error checking rank for keyword '{kw_data['keyword']}': {e}")
+        # 키워드 추출 (force_refresh면 기존 키워드 삭제)
+        if force_refresh:
+            db.delete_post_keywords(saved_post['id'])
+
+        existing_keywords = db.get_post_keywords(saved_post['id'])
+        if not existing_keywords or force_refresh:
+            keywords = extractor.extract(post.get('title', ''))
+            for i, kw in enumerate(keywords[:2]):  # 최대 2개
+                keyword_data = db.add_post_keyword(saved_post['id'], kw, priority=i+1)
+                all_keywords.append({
+                    **keyword_data,
+                    'post_url': saved_post['url']
+                })
+        else:
+            for kw in existing_keywords:
+                all_keywords.append({
+                    **kw,
+                    'post_url': saved_post['url']
+                })
+
+    # 총 키워드 수 업데이트
+    total_keywords = len(all_keywords)
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "UPDATE rank_check_tasks SET total_keywords = ? WHERE task_id = ?",
+            (total_keywords, task_id)
+        )
 
-            # Rate limiting
-            await asyncio.sleep(0.5)
+    logger.info(f"Total {total_keywords} keywords to check")
+    return all_keywords
 
-        # 4. 완료 처리
-        db.update_tracked_blog(tracked_blog_id, last_checked_at=datetime.now().isoformat())
-        db.complete_task(task_id)
 
-        logger.info(f"Rank check completed for blog {blog_id}")
+async def _finish_rank_check(db, task_id: str, tracked_blog_id: int, blog_id: str):
+    """측정 끝난 블로그 완료 처리 + lifecycle 알림"""
+    # 4. 완료 처리
+    db.update_tracked_blog(tracked_blog_id, last_checked_at=datetime.now().isoformat())
+    db.complete_task(task_id)
 
-        # 5. B-2 lifecycle 이상 감지 → 사용자 알림
-        try:
-            await _trigger_lifecycle_alerts(db, tracked_blog_id, blog_id)
-        except Exception as alert_err:
-            logger.warning(f"Alert trigger failed for {blog_id}: {alert_err}")
+    logger.info(f"Rank check completed for blog {blog_id}")
 
-    except Exception as e:
-        logger.error(f"Rank check failed for blog {blog_id}: {e}")
-        db.complete_task(task_id, str(e))
+    # 5. B-2 lifecycle 이상 감지 → 사용자 알림
+    try:
+        await _trigger_lifecycle_alerts(db, tracked_blog_id, blog_id)
+    except Exception as alert_err:
+        logger.warning(f"Alert trigger failed for {blog_id}: {alert_err}")
 
 
 async def _trigger_lifecycle_alerts(db, tracked_blog_id: int, blog_id: str):
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+백업 벤치마크 — 전체 복사(예전 create_backup) vs 증분 스냅샷(services/incremental_backup)
+
+임시 디렉터리에 --mb 크기의 WAL DB 를 만들고, 옆에서 쓰기 스레드가 계속 커밋하는 동안
+  1. 전체 복사: Connection.backup 한 번에 통째로 (예전 create_backup)
+  2. 증분 첫 스냅샷
+  3. 행 --change-pct % 를 바꾼 뒤(--pattern) 전체 복사 / 증분 두 번째 스냅샷
+을 돌려 쓴 바이트, 벽시계 시간, I/O 시간, 쉰 시간, 그리고 그동안 쓰기 커밋 지연(p50/p99/max)을 잰다.
+마지막에 증분 두 번째 스냅샷을 복원해 원본과 같은지 확인한다.
+
+사용:
+  python scripts/bench_backup.py
+  python scripts/bench_backup.py --mb 300 --change-pct 2
+  python scripts/bench_backup.py --pattern uniform      # 변경이 전 페이지에 흩어진 최악
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import incremental_backup as ib  # noqa: E402
+
+ROW_BYTES = 400
+
+
+def build_db(path: str, mb: int) -> int:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+    rows = mb * 1024 * 1024 // ROW_BYTES
+    batch = 5000
+    for start in range(0, rows, batch):
+        conn.executemany("INSERT INTO t (v) VALUES (?)",
+                         [(os.urandom(ROW_BYTES // 4).hex() + "x" * (ROW_BYTES // 2),)
+                          for _ in range(min(batch, rows - start))])
+        conn.commit()
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+    return rows
+
+
+class Writer:
+    """5ms 마다 한 건씩 커밋하며 커밋 지연을 잰다."""
+
+    def __init__(self, path: str, rows: int):
+        self.path, self.rows = path, rows
+        self.stop = threading.Event()
+        self.lat = []
+
+    def __enter__(self):
+        self.th = threading.Thread(target=self._run, daemon=True)
+        self.th.start()
+        return self
+
+    def _run(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        n = 0
+        while not self.stop.is_set():
+            n += 1
+            t = time.perf_counter()
+            conn.execute("UPDATE t SET v = ? WHERE id = ?", (f"w{n}", n * 7919 % self.rows + 1))
+            conn.commit()
+            self.lat.append(time.perf_counter() - t)
+            time.sleep(0.005)
+        conn.close()
+
+    def __exit__(self, *exc):
+        self.stop.set()
+        self.th.join()
+
+    def summary(self) -> str:
+        if not self.lat:
+            return "-"
+        s = sorted(self.lat)
+        q = lambda p: s[min(len(s) - 1, int(p * len(s)))] * 1000  # noqa: E731
+        return f"{len(s):>5} | {q(0.5):>6.1f} | {q(0.99):>6.1f} | {s[-1] * 1000:>7.1f}"
+
+
+def full_copy(src: str, dest: str):
+    t0 = time.perf_counter()
+    conn = sqlite3.connect(src)
+    out = sqlite3.connect(dest)
+    conn.backup(out)
+    out.close()
+    conn.close()
+    return os.path.getsize(dest), time.perf_counter() - t0
+
+
+def change_rows(path: str, rows: int, pct: float, pattern: str) -> int:
+    """pct % 행 수정. recent: 최근 행 수정 + 같은 수만큼 추가(로그·수집 테이블 모양),
+    uniform: 전체에 고르게 흩어 수정(청크 중복 제거에 가장 불리한 경우)."""
+    n = max(1, int(rows * pct / 100))
+    conn = sqlite3.connect(path)
+    if pattern == "uniform":
+        step = max(1, rows // n)
+        ids = list(range(1, rows + 1, step))[:n]
+    else:
+        ids = list(range(rows - n + 1, rows + 1))
+        conn.executemany("INSERT INTO t (v) VALUES (?)",
+                         [(os.urandom(ROW_BYTES // 4).hex(),) for _ in range(n)])
+    conn.executemany("UPDATE t SET v = ? WHERE id = ?",
+                     [(os.urandom(ROW_BYTES // 4).hex(), i) for i in ids])
+    conn.commit()
+    conn.close()
+    return n
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mb", type=int, default=100)
+    ap.add_argument("--change-pct", type=float, default=1.0)
+    ap.add_argument("--pattern", choices=("recent", "uniform"), default="recent")
+    args = ap.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_backup_")
+    root = os.path.join(tmp, "data")
+    os.makedirs(root)
+    db = os.path.join(root, "blog_analyzer.db")
+    rows = build_db(db, args.mb)
+    store = ib.BackupStore(os.path.join(tmp, "store"))
+    print(f"DB {os.path.getsize(db) / 1e6:.0f}MB ({rows:,}행) · codec {ib.CODEC} · "
+          f"step {ib.STEP_PAGES}p · chunk {ib.CHUNK_PAGES}p · duty {ib.IO_DUTY}")
+    print(f"{'':>14} | {'씀(MB)':>8} | {'wall(s)':>7} | {'I/O(s)':>6} | {'쉼(s)':>6} | "
+          f"{'커밋':>5} | {'p50ms':>6} | {'p99ms':>6} | {'max ms':>7}")
+    print("-" * 96)
+
+    def row(label, written, wall, io, slept, w):
+        io_s = f"{io:>6.2f}" if io is not None else f"{'-':>6}"
+        sl_s = f"{slept:>6.2f}" if slept is not None else f"{'-':>6}"
+        print(f"{label:>14} | {written / 1e6:>8.2f} | {wall:>7.2f} | {io_s} | {sl_s} | {w.summary()}")
+
+    with Writer(db, rows) as w:
+        written, wall = full_copy(db, os.path.join(tmp, "full1.db"))
+    row("전체 #1", written, wall, None, None, w)
+    with Writer(db, rows) as w:
+        r1 = store.snapshot(root)
+    row("증분 #1", r1["bytes_written"], r1["wall_s"], r1["io_s"], r1["sleep_s"], w)
+
+    n = change_rows(db, rows, args.change_pct, args.pattern)
+    print(f"— {n:,}행({args.change_pct}%) 변경, {args.pattern} —")
+    with Writer(db, rows) as w:
+        written, wall = full_copy(db, os.path.join(tmp, "full2.db"))
+    row("전체 #2", written, wall, None, None, w)
+    with Writer(db, rows) as w:
+        r2 = store.snapshot(root)
+    row("증분 #2", r2["bytes_written"], r2["wall_s"], r2["io_s"], r2["sleep_s"], w)
+    print(f"증분 #2: 새 청크 {r2['chunks_new']:,} / 재사용 {r2['chunks_reused']:,}, "
+          f"저장소 합계 {store.size_bytes() / 1e6:.1f}MB (전체 복사 2개면 {2 * written / 1e6:.1f}MB)")
+
+    res = store.restore(r2["id"], target_dir=os.path.join(tmp, "restored"))
+    conn = sqlite3.connect(os.path.join(tmp, "restored", "blog_analyzer.db"))
+    expect = rows + (n if args.pattern == "recent" else 0)
+    ok = res["dbs"]["blog_analyzer.db"]["ok"] and conn.execute("SELECT count(*) FROM t").fetchone()[0] == expect
+    conn.close()
+    print(f"복원 {res['seconds']}s · 검증 {'OK' if ok else 'FAIL'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
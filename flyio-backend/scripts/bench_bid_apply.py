@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+입찰 최적화 벤치마크 — 키워드별 순차 적용(예전) vs services/bid_apply(일괄)
+
+로컬 가짜 검색광고 서버(응답마다 --latency-ms 지연)에 키워드 --keywords 개(광고그룹 --groups 개)를
+올리고 두 방식으로 한 바퀴씩 돌려 API 호출 수와 벽시계 시간을 잰다.
+    per-keyword : 예전 optimize_all_keywords — 광고그룹 순차 조회, /stats ID 당 1콜 순차,
+                  바꿀 키워드마다 GET(nccAdgroupId) + PUT, 감사 행 INSERT 1건씩
+    batched     : run_bid_pass — 광고그룹 병렬 조회, 성과는 리포트 테이블(--stats api 면 /stats
+                  병렬), bulk PUT 100개 × APPLY_CONCURRENCY, 감사 행은 묶음당 executemany 1번
+벤치 동안은 속도 조절기(NAVER_RATE_*)를 풀어 둔다 — 실제 한도에서의 시간은 호출 수로 환산해
+따로 찍는다. 두 방식이 같은 (키워드, 새 입찰가) 를 적용했는지도 확인한다.
+
+사용:
+  python scripts/bench_bid_apply.py
+  python scripts/bench_bid_apply.py --keywords 5000 --groups 50 --latency-ms 20 --stats api
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_TMP = tempfile.mkdtemp(prefix='bench_bid_')
+os.environ['DATA_DIR'] = _TMP
+os.environ['SHARED_CACHE_BACKEND'] = 'memory'
+os.environ.setdefault('NAVER_AD_CUSTOMER_ID', '1001')
+os.environ.setdefault('NAVER_AD_API_KEY', 'bench')
+os.environ.setdefault('NAVER_AD_SECRET_KEY', 'bench')
+for _fam in ('NCC_WRITE', 'NCC_READ', 'STATS'):
+    os.environ[f'NAVER_RATE_{_fam}'] = '100000,100000'
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+from aiohttp import web  # noqa: E402
+
+from database import optimization_db  # noqa: E402
+optimization_db.DB_PATH = Path(_TMP) / 'optimization_history.db'
+from database.ad_snapshot_db import init_ad_snapshot_tables, save_daily_stats  # noqa: E402
+from database.naver_ad_db import init_naver_ad_tables  # noqa: E402
+from services import bid_apply  # noqa: E402
+from services.naver_ad_service import BidOptimizationEngine, NaverAdApiClient, _conv  # noqa: E402
+
+# 프로덕션 버킷(초당) — services/naver_rate_governor 기본값
+PROD_RATE = {'ncc_read': 10, 'stats': 10, 'ncc_write': 5}
+
+
+def make_keywords(n: int, groups: int):
+    return [{'nccKeywordId': f'nkw-{i}', 'nccAdgroupId': f'grp-{i % groups}',
+             'keyword': f'키워드{i}', 'bidAmt': 500 + (i % 7) * 100, 'useGroupBidAmt': False}
+            for i in range(n)]
+
+
+def make_stat(i: int):
+    kind = i % 4
+    if kind == 0:   # 전환·고ROAS → 올림
+        return {'id': f'nkw-{i}', 'impCnt': 2000, 'clkCnt': 60, 'salesAmt': 30000,
+                'ccnt': 4, 'convAmt': 240000, 'avgRnk': 4.0}
+    if kind == 1:   # 전환 없이 지출 → 내림
+        return {'id': f'nkw-{i}', 'impCnt': 1500, 'clkCnt': 45, 'salesAmt': 45000,
+                'ccnt': 0, 'convAmt': 0, 'avgRnk': 2.5}
+    if kind == 2:   # 노출 적음 → 대개 그대로
+        return {'id': f'nkw-{i}', 'impCnt': 30, 'clkCnt': 0, 'salesAmt': 0,
+                'ccnt': 0, 'convAmt': 0, 'avgRnk': 6.0}
+    return {'id': f'nkw-{i}', 'impCnt': 800, 'clkCnt': 20, 'salesAmt': 16000,
+            'ccnt': 1, 'convAmt': 40000, 'avgRnk': 3.0}
+
+
+def make_app(keywords, stats, latency: float, counts):
+    by_id = {k['nccKeywordId']: k for k in keywords}
+
+    async def list_keywords(request):
+        counts['GET /ncc/keywords'] += 1
+        await asyncio.sleep(latency)
+        gid = request.query.get('nccAdgroupId')
+        return web.json_response([k for k in keywords if gid is None or k['nccAdgroupId'] == gid])
+
+    async def get_keyword(request):
+        counts['GET /ncc/keywords/{id}'] += 1
+        await asyncio.sleep(latency)
+        return web.json_response(by_id[request.match_info['kid']])
+
+    async def get_stats(request):
+        counts['GET /stats'] += 1
+        await asyncio.sleep(latency)
+        kid = request.query.get('ids')
+        return web.json_response({'data': [stats[kid]] if kid in stats else []})
+
+    async def put_keyword(request):
+        counts['PUT /ncc/keywords/{id}'] += 1
+        await asyncio.sleep(latency)
+        return web.json_response(await request.json())
+
+    async def put_keywords(request):
+        counts['PUT /ncc/keywords'] += 1
+        await asyncio.sleep(latency)
+        return web.json_response(await request.json())
+
+    app = web.Application()
+    app.router.add_get('/ncc/keywords', list_keywords)
+    app.router.add_get('/ncc/keywords/{kid}', get_keyword)
+    app.router.add_get('/stats', get_stats)
+    app.router.add_put('/ncc/keywords/{kid}', put_keyword)
+    app.router.add_put('/ncc/keywords', put_keywords)
+    return app
+
+
+def make_engine(base: str) -> BidOptimizationEngine:
+    api = NaverAdApiClient()
+    api.BASE_URL = base
+    api.client = httpx.AsyncClient(timeout=30, limits=httpx.Limits(max_connections=10))
+    engine = BidOptimizationEngine(api)
+    engine.user_id = 1
+    return engine
+
+
+async def per_keyword(engine, ad_group_ids):
+    """예전 optimize_all_keywords 의 흐름 그대로."""
+    from database.optimization_db import log_optimization_action
+    api = engine.api
+    keywords = []
+    for gid in ad_group_ids:
+        keywords.extend(await api.get_keywords(gid))
+    ids = [k['nccKeywordId'] for k in keywords]
+    end = datetime.now().strftime('%Y-%m-%d')
+    start = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+    stats_map = {s.get('id'): s for s in await api.get_stats('KEYWORD', ids, start, end)}
+    applied = []
+    for kw in keywords:
+        current = kw.get('bidAmt', 0)
+        if current == 0 or kw.get('useGroupBidAmt', True):
+            continue
+        stat = stats_map.get(kw['nccKeywordId'], {})
+        new_bid, reason = engine._calculate_optimal_bid(
+            current_bid=current, impressions=stat.get('impCnt', 0), clicks=stat.get('clkCnt', 0),
+            cost=stat.get('salesAmt', 0), conversions=_conv(stat), revenue=stat.get('convAmt', 0),
+            avg_position=stat.get('avgRnk', 0))
+        if new_bid != current:
+            await api.update_keyword_bid(kw['nccKeywordId'], new_bid)
+            log_optimization_action(user_id=1, platform='naver_searchad', action_type='bid_change',
+                                    target_type='keyword', target_id=kw['nccKeywordId'],
+                                    target_name=kw['keyword'], old_value=current, new_value=new_bid,
+                                    reason=reason)
+            rounded = max(70, round(new_bid / 10) * 10)
+            if rounded != current:   # 보정 후 그대로인 PUT 은 호출만 하고 바뀐 건 없다
+                applied.append((kw['nccKeywordId'], rounded))
+    return applied
+
+
+async def batched(engine, ad_group_ids):
+    rep = await bid_apply.run_bid_pass(engine, ad_group_ids)
+    return [(c.keyword_id, c.new_bid) for c in rep['applied']], rep
+
+
+def prod_seconds(counts) -> float:
+    """호출 수를 프로덕션 버킷 속도로 환산 — 조회 → 성과 → 적용이 차례로 돌므로 묶음별 시간을 더한다."""
+    read = counts['GET /ncc/keywords'] + counts['GET /ncc/keywords/{id}']
+    write = counts['PUT /ncc/keywords/{id}'] + counts['PUT /ncc/keywords']
+    return (read / PROD_RATE['ncc_read'] + counts['GET /stats'] / PROD_RATE['stats']
+            + write / PROD_RATE['ncc_write'])
+
+
+async def main_async(args):
+    keywords = make_keywords(args.keywords, args.groups)
+    stats = {k['nccKeywordId']: make_stat(i) for i, k in enumerate(keywords)}
+    ad_group_ids = [f'grp-{g}' for g in range(args.groups)]
+
+    optimization_db.init_optimization_tables()
+    init_naver_ad_tables()
+    init_ad_snapshot_tables()
+    if args.stats == 'report':
+        day = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        save_daily_stats(os.environ['NAVER_AD_CUSTOMER_ID'], [
+            {'entity_type': 'KEYWORD', 'entity_id': s['id'], 'stat_date': day,
+             'impressions': s['impCnt'], 'clicks': s['clkCnt'], 'cost': s['salesAmt'],
+             'avg_rank': s['avgRnk'], 'conversions': s['ccnt'], 'conv_amount': s['convAmt']}
+            for s in stats.values()])
+
+    results = {}
+    for name, fn in (('per-keyword', per_keyword), ('batched', batched)):
+        counts = {k: 0 for k in ('GET /ncc/keywords', 'GET /ncc/keywords/{id}', 'GET /stats',
+                                 'PUT /ncc/keywords/{id}', 'PUT /ncc/keywords')}
+        runner = web.AppRunner(make_app(keywords, stats, args.latency_ms / 1000, counts))
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        engine = make_engine(f'http://127.0.0.1:{port}')
+        try:
+            t0 = time.perf_counter()
+            out = await fn(engine, ad_group_ids)
+            wall = time.perf_counter() - t0
+        finally:
+            await engine.api.client.aclose()
+            await runner.cleanup()
+        applied = out[0] if isinstance(out, tuple) else out
+        results[name] = (applied, counts, wall, out[1] if isinstance(out, tuple) else None)
+
+    print(f'키워드 {args.keywords:,} / 광고그룹 {args.groups} / 지연 {args.latency_ms}ms / '
+          f'성과 출처(batched) {args.stats}')
+    print(f"{'':>12} | {'적용':>6} | {'호출':>7} | {'/stats':>7} | {'PUT':>6} | {'wall(s)':>8} | {'실한도(s)':>9}")
+    print('-' * 76)
+    for name, (applied, counts, wall, _) in results.items():
+        calls = sum(counts.values())
+        puts = counts['PUT /ncc/keywords/{id}'] + counts['PUT /ncc/keywords']
+        print(f'{name:>12} | {len(applied):>6,} | {calls:>7,} | {counts["GET /stats"]:>7,} | '
+              f'{puts:>6,} | {wall:>8.2f} | {prod_seconds(counts):>9.0f}')
+    a, b = results['per-keyword'], results['batched']
+    same = sorted(a[0]) == sorted(b[0])
+    print(f'적용 결과 일치: {"예" if same else "아니오"}  '
+          f'호출 {sum(a[1].values()) / max(1, sum(b[1].values())):.0f}x 감소, '
+          f'{a[2] / b[2]:.1f}x 빠름  (batched 단계별 {b[3]["timings"]})')
+    return 0 if same else 1
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--keywords', type=int, default=2000)
+    ap.add_argument('--groups', type=int, default=20)
+    ap.add_argument('--latency-ms', type=float, default=10)
+    ap.add_argument('--stats', choices=('report', 'api'), default='report')
+    args = ap.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+엔티티 상태 동기화 벤치마크 — 엔티티마다 upsert(예전) vs 지문 비교 후 바뀐 것만 쓰기
+
+--entities 개 키워드를 가진 계정을 흉내 낸다. 빈 DB 두 개에 각 경로로
+    1) 첫 적재        — 전부 추가
+    2) 그대로 재수집  — 아무것도 안 바뀜 (매일 대부분이 이 경우다)
+    3) 일부 변경      — --change-pct % 필드 변경 + 일부 삭제·신규
+를 차례로 돌리고 단계별 벽시계 시간과 반환 카운트, 최종 상태·변경 이력이 같은지 본다.
+새 경로의 첫 단계는 지문이 없던 예전 DB 에서 처음 돌 때와 같은 비용이다.
+
+사용:
+  python scripts/bench_entity_sync.py
+  python scripts/bench_entity_sync.py --entities 96000 --change-pct 1
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+_TMP = tempfile.mkdtemp(prefix='bench_entity_sync_')
+os.environ['DATA_DIR'] = _TMP
+
+from database import ad_snapshot_db as S  # noqa: E402
+from database import naver_ad_db as NA  # noqa: E402
+
+CID = '1858907'
+
+
+def rowwise_sync(customer_id, entities, entity_type, detect_removed=True):
+    """예전 sync_entity_states — 전 행 로드 + 엔티티마다 upsert."""
+    conn = NA.get_connection()
+    cur = conn.cursor()
+    cur.execute("""
+        SELECT entity_id, name, status, status_reason, enabled, daily_budget,
+               bid_amt, use_group_bid, inspect_status, landing_url
+        FROM ad_entity_state WHERE customer_id = ? AND entity_type = ?
+    """, (customer_id, entity_type))
+    prev = {r['entity_id']: dict(r) for r in cur.fetchall()}
+    seen = set()
+    added = changed = 0
+    change_rows = []
+    for e in entities:
+        eid = e.get('entity_id')
+        if not eid:
+            continue
+        seen.add(eid)
+        old = prev.get(eid)
+        if old is None:
+            added += 1
+            change_rows.append((customer_id, entity_type, eid, e.get('name'),
+                                '__entity__', None, 'created', 'created'))
+        else:
+            for f in S.TRACKED_FIELDS:
+                a, b = S._norm(old.get(f)), S._norm(e.get(f))
+                if a != b:
+                    changed += 1
+                    change_rows.append((customer_id, entity_type, eid,
+                                        e.get('name'), f, a, b, 'updated'))
+        cur.execute("""
+            INSERT INTO ad_entity_state (
+                customer_id, entity_type, entity_id, parent_id, name, status,
+                status_reason, enabled, daily_budget, bid_amt, use_group_bid,
+                inspect_status, landing_url, extra, first_seen, last_seen
+            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,CURRENT_TIMESTAMP,CURRENT_TIMESTAMP)
+            ON CONFLICT(customer_id, entity_type, entity_id) DO UPDATE SET
+                parent_id = excluded.parent_id, name = excluded.name,
+                status = excluded.status, status_reason = excluded.status_reason,
+                enabled = excluded.enabled, daily_budget = excluded.daily_budget,
+                bid_amt = excluded.bid_amt, use_group_bid = excluded.use_group_bid,
+                inspect_status = excluded.inspect_status,
+                landing_url = excluded.landing_url, extra = excluded.extra,
+                last_seen = CURRENT_TIMESTAMP
+        """, (customer_id, entity_type, eid, *S._state_row(e)))
+    removed = 0
+    if detect_removed:
+        gone = [eid for eid in prev if eid not in seen]
+        for eid in gone:
+            removed += 1
+            change_rows.append((customer_id, entity_type, eid, prev[eid].get('name'),
+                                '__entity__', 'present', 'removed', 'removed'))
+        cur.executemany(
+            'DELETE FROM ad_entity_state WHERE customer_id=? AND entity_type=? AND entity_id=?',
+            [(customer_id, entity_type, eid) for eid in gone])
+    cur.executemany("""
+        INSERT INTO ad_entity_changes (
+            customer_id, entity_type, entity_id, entity_name,
+            field, old_value, new_value, change_kind
+        ) VALUES (?,?,?,?,?,?,?,?)
+    """, change_rows)
+    conn.commit()
+    conn.close()
+    return {'seen': len(seen), 'added': added, 'changed': changed, 'removed': removed}
+
+
+def make_entities(n: int, rng: random.Random):
+    return [{
+        'entity_id': f'nkw-{i}', 'parent_id': f'grp-{i // 100}', 'name': f'키워드{i}',
+        'status': 'ELIGIBLE', 'status_reason': rng.choice([None, 'ELIGIBLE']),
+        'enabled': 1, 'bid_amt': rng.randrange(70, 3000, 10),
+        'use_group_bid': rng.choice([0, 1]),
+    } for i in range(n)]
+
+
+def mutate(ents, pct: float, rng: random.Random):
+    out = [dict(e) for e in ents]
+    for e in rng.sample(out, int(len(out) * pct / 100)):
+        e['bid_amt'] += 10
+        if rng.random() < 0.3:
+            e['status'], e['enabled'] = 'PAUSED', 0
+    drop = set(rng.sample(range(len(out)), int(len(out) * pct / 200)))
+    out = [e for i, e in enumerate(out) if i not in drop]
+    n = len(ents)
+    out += [{'entity_id': f'nkw-new-{i}', 'parent_id': 'grp-new', 'name': f'신규{i}',
+             'status': 'ELIGIBLE', 'enabled': 1, 'bid_amt': 70, 'use_group_bid': 1}
+            for i in range(int(n * pct / 200))]
+    return out
+
+
+def dump(path):
+    NA.DB_PATH = Path(path)
+    conn = NA.get_connection()
+    state = conn.execute(
+        'SELECT entity_id, parent_id, name, status, status_reason, enabled, daily_budget, '
+        'bid_amt, use_group_bid, inspect_status, landing_url, extra '
+        'FROM ad_entity_state ORDER BY entity_id').fetchall()
+    changes = conn.execute(
+        'SELECT entity_id, entity_name, field, old_value, new_value, change_kind '
+        'FROM ad_entity_changes ORDER BY entity_id, field, change_kind').fetchall()
+    conn.close()
+    return [tuple(r) for r in state], [tuple(r) for r in changes]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--entities', type=int, default=96000)
+    ap.add_argument('--change-pct', type=float, default=1.0)
+    args = ap.parse_args()
+
+    rng = random.Random(7)
+    base = make_entities(args.entities, rng)
+    stages = [('첫 적재', base), ('그대로', [dict(e) for e in base]),
+              ('일부 변경', mutate(base, args.change_pct, rng))]
+    paths = {name: os.path.join(_TMP, f'{name}.db') for name in ('rowwise', 'hashed')}
+    fns = {'rowwise': rowwise_sync, 'hashed': S.sync_entity_states}
+
+    print(f'키워드 {args.entities:,}개 / 변경 {args.change_pct}%  (DB: {_TMP})')
+    print(f"{'':>10} | {'rowwise(s)':>10} | {'hashed(s)':>9} | {'배':>5} | 카운트")
+    print('-' * 78)
+    ok = True
+    for label, ents in stages:
+        times, counts = {}, {}
+        for name, fn in fns.items():
+            NA.DB_PATH = Path(paths[name])
+            S.init_ad_snapshot_tables()
+            t0 = time.perf_counter()
+            counts[name] = fn(CID, ents, 'KEYWORD', detect_removed=True)
+            times[name] = time.perf_counter() - t0
+        ok &= counts['rowwise'] == counts['hashed']
+        print(f"{label:>10} | {times['rowwise']:>10.2f} | {times['hashed']:>9.2f} | "
+              f"{times['rowwise'] / times['hashed']:>5.1f} | {json.dumps(counts['hashed'])}")
+
+    same = dump(paths['rowwise']) == dump(paths['hashed'])
+    print(f'카운트 일치: {"예" if ok else "아니오"} / 최종 상태·이력 일치: {"예" if same else "아니오"}')
+    if not (ok and same):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
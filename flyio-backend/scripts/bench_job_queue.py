@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+작업 큐 벤치마크 — JSON 파일 큐(예전) vs services/job_queue(SQLite 한 테이블)
+
+생산자 프로세스 P개가 각자 N건을 동시에 적재하고, 이어서 소비자 프로세스 C개가 큐가 빌
+때까지 claim → complete 한다. 적재/s·claim/s 와 중복 claim 수(0 이어야 한다)를 잰다.
+예전 경로는 옛 keyword_verdict_queue 처럼 job 하나당 파일(os.replace), claim 은 디렉터리
+전부를 읽어 가장 오래된 queued 를 고르는 방식을 그대로 흉내 낸다(잠금 없음 → 중복 가능).
+
+사용:
+  python scripts/bench_job_queue.py
+  python scripts/bench_job_queue.py --producers 16 --per-producer 200 --consumers 4
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, ROOT)
+
+
+# ── 예전: job 파일 큐 ────────────────────────────────────
+
+def _file_enqueue(d: str, n: int) -> None:
+    for i in range(n):
+        jid = f"{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}"
+        tmp = os.path.join(d, f".{jid}.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"job_id": jid, "status": "queued", "requested_at": time.time(), "i": i}, f)
+        os.replace(tmp, os.path.join(d, f"{jid}.json"))
+
+
+def _file_consume(d: str, out) -> None:
+    got = []
+    while True:
+        jobs = []
+        for name in os.listdir(d):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(d, name)) as f:
+                    jobs.append(json.load(f))
+            except Exception:
+                continue
+        queued = sorted((j for j in jobs if j["status"] == "queued"), key=lambda j: j["requested_at"])
+        if not queued:
+            break
+        job = queued[0]
+        job["status"] = "done"
+        path = os.path.join(d, f"{job['job_id']}.json")
+        tmp = path + f".{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(job, f)
+        os.replace(tmp, path)
+        got.append(job["job_id"])
+    out.put(got)
+
+
+# ── 지금: SQLite 작업 큐 ─────────────────────────────────
+
+def _sql_enqueue(db_path: str, n: int) -> None:
+    os.environ["JOB_QUEUE_DB_PATH"] = db_path
+    from services.job_queue import JobQueue
+    q = JobQueue("bench", concurrency=None)
+    for i in range(n):
+        q.enqueue({"i": i})
+
+
+def _sql_consume(db_path: str, out) -> None:
+    os.environ["JOB_QUEUE_DB_PATH"] = db_path
+    from services.job_queue import JobQueue
+    q = JobQueue("bench", concurrency=None)
+    got = []
+    while True:
+        job = q.claim()
+        if job is None:
+            break
+        q.complete(job["id"])
+        got.append(job["id"])
+    out.put(got)
+
+
+def _run(enq, consume, target: str, producers: int, per: int, consumers: int):
+    ctx = mp.get_context("spawn")
+    ps = [ctx.Process(target=enq, args=(target, per)) for _ in range(producers)]
+    t0 = time.perf_counter()
+    for p in ps:
+        p.start()
+    for p in ps:
+        p.join()
+    t_enq = time.perf_counter() - t0
+
+    out = ctx.Queue()
+    cs = [ctx.Process(target=consume, args=(target, out)) for _ in range(consumers)]
+    t0 = time.perf_counter()
+    for c in cs:
+        c.start()
+    got = [jid for _ in cs for jid in out.get()]
+    for c in cs:
+        c.join()
+    t_claim = time.perf_counter() - t0
+    return t_enq, t_claim, len(got), len(got) - len(set(got))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--producers", type=int, default=8)
+    ap.add_argument("--per-producer", type=int, default=250)
+    ap.add_argument("--consumers", type=int, default=2)
+    args = ap.parse_args()
+    total = args.producers * args.per_producer
+
+    tmp = tempfile.mkdtemp(prefix="bench_jobq_")
+    jobs_dir = os.path.join(tmp, "jobs")
+    os.makedirs(jobs_dir)
+    db_path = os.path.join(tmp, "job_queue.db")
+
+    print(f"생산자 {args.producers} × {args.per_producer}건 = {total:,}건 · 소비자 {args.consumers}")
+    print(f"{'경로':>8} | {'적재(s)':>8} | {'적재/s':>8} | {'claim(s)':>8} | {'claim/s':>8} | {'처리':>6} | {'중복':>4}")
+    print("-" * 72)
+    for label, enq, consume, target in (("파일", _file_enqueue, _file_consume, jobs_dir),
+                                        ("SQLite", _sql_enqueue, _sql_consume, db_path)):
+        t_enq, t_claim, n, dup = _run(enq, consume, target, args.producers,
+                                      args.per_producer, args.consumers)
+        print(f"{label:>8} | {t_enq:>8.2f} | {total / t_enq:>8.0f} | {t_claim:>8.2f} | "
+              f"{n / t_claim:>8.0f} | {n:>6,} | {dup:>4}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+학습 기울기 1스텝 벤치마크 — calculate_all_gradients vs calculate_batched_gradients
+
+합성 learning_samples(키워드당 10블로그)로 기울기 한 스텝의 벽시계 시간을 잰다.
+    numeric : 파라미터마다 JSON 딥카피 + 전 샘플 재채점 + 전체 풀 spearman/kendall
+    batched : 섭동 행렬 한 번 채점 + 키워드 그룹별 손실 (행렬·그룹 구성 시간 포함)
+    warm    : batched 와 같되 피처 행렬·그룹을 미리 만들어 둔 상태
+              (instant_adjust_weights 반복 2회차부터의 실제 비용)
+
+사용:
+  python scripts/bench_learning_gradients.py
+  python scripts/bench_learning_gradients.py --sizes 1000 10000 100000 --skip-numeric-above 10000
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.grouped_ranking import build_group_index  # noqa: E402
+from services.learning_engine import (  # noqa: E402
+    DEFAULT_WEIGHTS,
+    calculate_all_gradients,
+    calculate_batched_gradients,
+)
+from services.learning_matrix import build_feature_matrix  # noqa: E402
+
+
+def synth_samples(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        out.append({
+            'keyword': f'kw{i // 10}',
+            'blog_id': f'blog{i % 10}',
+            'actual_rank': i % 10 + 1,
+            'c_rank_score': rng.uniform(20, 90),
+            'dia_score': rng.uniform(20, 90),
+            'context_score': rng.choice([None, rng.uniform(0, 100)]),
+            'content_score': rng.uniform(0, 100),
+            'chain_score': rng.uniform(0, 100),
+            'depth_score': rng.choice([None, rng.uniform(0, 100)]),
+            'information_score': rng.uniform(0, 100),
+            'accuracy_score': rng.uniform(0, 100),
+            'content_length': rng.randint(300, 6000),
+            'heading_count': rng.randint(0, 15),
+            'paragraph_count': rng.randint(3, 40),
+            'image_count': rng.randint(0, 25),
+            'keyword_count': rng.randint(0, 15),
+            'keyword_density': rng.uniform(0, 3),
+            'post_age_days': rng.randint(0, 400),
+            'title_has_keyword': rng.random() < 0.7,
+            'has_map': rng.random() < 0.2,
+            'has_link': rng.random() < 0.3,
+            'video_count': rng.randint(0, 3),
+            'like_count': rng.randint(0, 60),
+            'comment_count': rng.randint(0, 30),
+            'content_parsed': 1,
+        })
+    return out
+
+
+def timed(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    ap.add_argument('--repeat', type=int, default=3)
+    ap.add_argument('--skip-numeric-above', type=int, default=10000,
+                    help='이보다 큰 n 에선 numeric 경로를 건너뛴다(너무 오래 걸림)')
+    args = ap.parse_args()
+
+    print(f"{'n':>8} | {'numeric(s)':>11} | {'batched(s)':>11} | {'warm(s)':>9} | {'speedup':>8}")
+    print('-' * 60)
+    for n in args.sizes:
+        samples = synth_samples(n)
+        t_batch = timed(lambda: calculate_batched_gradients(samples, DEFAULT_WEIGHTS), args.repeat)
+        matrix = build_feature_matrix(samples)
+        groups = build_group_index(samples)
+        t_warm = timed(lambda: calculate_batched_gradients(samples, DEFAULT_WEIGHTS,
+                                                           matrix=matrix, groups=groups), args.repeat)
+        if n <= args.skip_numeric_above:
+            t_num = timed(lambda: calculate_all_gradients(samples, DEFAULT_WEIGHTS), 1)
+            print(f'{n:>8} | {t_num:>11.3f} | {t_batch:>11.3f} | {t_warm:>9.3f} | {t_num / t_warm:>7.1f}x')
+        else:
+            print(f"{n:>8} | {'skipped':>11} | {t_batch:>11.3f} | {t_warm:>9.3f} | {'-':>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 풀 적재 벤치마크 — add_candidates 행 단위 경로 vs set 기반 UPSERT 경로
+
+이미 --existing 행이 있는 풀(일부는 registered/failed)에 --ingest 후보를 넣는다.
+후보의 절반은 기존 KW(그중 일부는 mt 가 커서 업그레이드 대상), 절반은 신규.
+같은 초기 DB 사본 두 개에 각 경로를 돌리고 (added, upgraded) 와 최종 테이블 내용이
+같은지 확인한 뒤 벽시계 시간을 비교한다.
+
+사용:
+  python scripts/bench_pool_ingest.py
+  python scripts/bench_pool_ingest.py --existing 100000 --ingest 100000
+"""
+import argparse
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database.keyword_pool_db import KeywordPoolDB  # noqa: E402
+
+UID, CID = 1, 1234567
+
+
+def seed_pool(path: str, n: int, rng: random.Random) -> None:
+    db = KeywordPoolDB(path)
+    statuses = ['pending'] * 7 + ['registered', 'failed', 'rejected']
+    with db._conn() as conn:
+        conn.executemany(
+            """INSERT INTO naverad_keyword_pool
+               (user_id, account_customer_id, keyword, monthly_total, monthly_pc,
+                monthly_mobile, comp_idx, source, seed, status)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [(UID, CID, f'기존키워드{i}', mt, mt // 3, mt - mt // 3,
+              rng.choice(['낮음', '중간', '높음']), 'keywordstool', f'시드{i % 500}',
+              rng.choice(statuses))
+             for i in range(n) for mt in (rng.randint(0, 5000),)],
+        )
+
+
+def make_items(n_existing: int, n: int, rng: random.Random):
+    items = []
+    for i in range(n):
+        if i % 2 == 0 and n_existing:
+            kw = f'기존키워드{rng.randrange(n_existing)}'
+        else:
+            kw = f'신규키워드{i}'
+        mt = rng.randint(0, 10000)
+        items.append({
+            'keyword': kw, 'monthly_total': mt, 'monthly_pc': mt // 4,
+            'monthly_mobile': mt - mt // 4,
+            'comp_idx': rng.choice([None, '낮음', '높음']),
+            'source': rng.choice([None, 'autocomplete', 'seed_explode']),
+            'seed': rng.choice([None, f'시드{i % 300}']),
+        })
+    return items
+
+
+def dedup(items):
+    by_kw = {}
+    for it in items:
+        kw = it['keyword']
+        prev = by_kw.get(kw)
+        if prev is None or it['monthly_total'] > prev['monthly_total']:
+            by_kw[kw] = it
+    return by_kw
+
+
+def table_rows(path: str):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(
+            """SELECT keyword, monthly_total, monthly_pc, monthly_mobile, comp_idx,
+                      source, seed, status
+               FROM naverad_keyword_pool ORDER BY keyword""").fetchall()
+    finally:
+        conn.close()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--existing', type=int, default=100000)
+    ap.add_argument('--ingest', type=int, default=100000)
+    ap.add_argument('--seed', type=int, default=7)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        base = f'{tmp}/base.db'
+        t0 = time.perf_counter()
+        seed_pool(base, args.existing, rng)
+        print(f'초기 풀 {args.existing:,}행 적재 {time.perf_counter() - t0:.2f}s')
+        by_kw = dedup(make_items(args.existing, args.ingest, rng))
+
+        results = {}
+        for name in ('rowwise', 'bulk'):
+            path = f'{tmp}/{name}.db'
+            shutil.copy(base, path)
+            db = KeywordPoolDB(path)
+            fn = getattr(db, f'_add_candidates_{name}')
+            t0 = time.perf_counter()
+            counts = fn(UID, CID, by_kw)
+            elapsed = time.perf_counter() - t0
+            results[name] = (counts, elapsed, table_rows(path))
+            print(f'{name:>8}: {elapsed:7.3f}s  added={counts[0]:,} upgraded={counts[1]:,}')
+
+        (c_row, t_row, rows_row), (c_bulk, t_bulk, rows_bulk) = results['rowwise'], results['bulk']
+        same = c_row == c_bulk and rows_row == rows_bulk
+        print(f'결과 일치: {"예" if same else "아니오"}  speedup {t_row / t_bulk:.1f}x')
+        if not same:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
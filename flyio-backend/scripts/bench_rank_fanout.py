@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+순위 측정 벤치마크 — 블로그별 순차 조회 vs 키워드 중심 fan-out (services/rank_measurement)
+
+로컬 가짜 SERP 서버(블로그탭 JSON + VIEW탭 HTML, 응답마다 --latency-ms 지연)를 띄우고
+추적 블로그 --blogs 개가 키워드 풀 --vocab 개에서 --keywords 개씩 골라 추적하게 한 뒤
+(블로그끼리 키워드가 겹친다) 두 방식의 SERP 요청 수와 벽시계 시간을 잰다.
+    per-blog : 예전 run_rank_check — 블로그마다 키워드를 하나씩, 블로그탭 → VIEW탭 순서
+    fan-out  : 키워드 합집합을 한 번씩, --concurrency 만큼 병렬(운영 기본은 1 — 예전과 같은 요청 속도)
+두 방식 모두 rate limit 대기(0.5초)는 빼고 잰다. 두 결과의 (키워드ID, 순위) 가 같은지도 확인한다.
+
+사용:
+  python scripts/bench_rank_fanout.py
+  python scripts/bench_rank_fanout.py --blogs 50 --keywords 40 --vocab 600 --latency-ms 30
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiohttp import web  # noqa: E402
+
+from services.rank_checker import RankChecker  # noqa: E402
+from services.rank_measurement import measure_keywords  # noqa: E402
+
+
+def serp_blogs(keyword: str, n_blogs: int):
+    """키워드별 결정적 상위 10개 블로그(가짜)."""
+    h = int(hashlib.md5(keyword.encode()).hexdigest(), 16)
+    rng = random.Random(h)
+    return [(f'blog{rng.randrange(n_blogs * 2)}', 220000000000 + rng.randrange(10 ** 6))
+            for _ in range(10)]
+
+
+def make_app(n_blogs: int, latency: float):
+    async def blog_json(request):
+        await asyncio.sleep(latency)
+        items = [{'title': kw, 'link': f'https://blog.naver.com/{b}/{p}',
+                  'bloggerlink': f'blog.naver.com/{b}'}
+                 for kw in [request.query['query']]
+                 for b, p in serp_blogs(kw, n_blogs)]
+        return web.json_response({'items': items})
+
+    async def view_html(request):
+        await asyncio.sleep(latency)
+        kw = request.query['query']
+        body = ''.join(f'<li><a href="https://blog.naver.com/{b}/{p}">{kw}</a></li>'
+                       for b, p in serp_blogs(kw, n_blogs))
+        return web.Response(text=f'<html><ul>{body}</ul></html>', content_type='text/html')
+
+    app = web.Application()
+    app.router.add_get('/v1/search/blog.json', blog_json)
+    app.router.add_get('/search.naver', view_html)
+    return app
+
+
+def make_targets(n_blogs: int, per_blog: int, vocab: int, seed: int = 7):
+    rng = random.Random(seed)
+    words = [f'키워드{i}' for i in range(vocab)]
+    targets, kid = [], 0
+    for b in range(n_blogs):
+        for kw in rng.sample(words, min(per_blog, vocab)):
+            # 절반쯤은 SERP 에 실제로 걸리는 포스팅으로 만든다
+            hits = [x for x in serp_blogs(kw, n_blogs) if x[0] == f'blog{b}']
+            post = hits[0][1] if hits and rng.random() < 0.5 else 229000000000 + kid
+            kid += 1
+            targets.append({'keyword_id': kid, 'keyword': kw, 'blog_id': f'blog{b}',
+                            'post_url': f'https://blog.naver.com/blog{b}/{post}'})
+    return targets
+
+
+def make_checker(base: str) -> RankChecker:
+    c = RankChecker()
+    c.NAVER_CLIENT_ID, c.NAVER_CLIENT_SECRET = 'bench', 'bench'
+    c.BLOG_SEARCH_URL = f'{base}/v1/search/blog.json'
+    c.VIEW_SEARCH_URL = f'{base}/search.naver'
+    return c
+
+
+async def per_blog(targets, base):
+    """예전 방식 — 블로그별 작업이 차례로, 키워드도 하나씩."""
+    checker = make_checker(base)
+    rows = []
+    try:
+        for t in targets:  # targets 는 블로그 순으로 나열돼 있다
+            blog_rank = await checker.check_blog_tab_rank(t['keyword'], t['blog_id'])
+            view_rank = await checker.check_view_tab_rank(t['keyword'], t['post_url'])
+            rows.append((t['keyword_id'], blog_rank, view_rank))
+    finally:
+        await checker.close()
+    return rows, checker.fetches
+
+
+async def fan_out(targets, base, concurrency):
+    checker = make_checker(base)
+    try:
+        rows = await measure_keywords(targets, checker=checker, concurrency=concurrency, delay=0)
+    finally:
+        await checker.close()
+    return rows, checker.fetches
+
+
+async def main_async(args):
+    runner = web.AppRunner(make_app(args.blogs, args.latency_ms / 1000))
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    base = f'http://127.0.0.1:{port}'
+    try:
+        targets = make_targets(args.blogs, args.keywords, args.vocab)
+        uniq = len({t['keyword'] for t in targets})
+        print(f'추적 키워드 {len(targets):,} (고유 {uniq:,}) / 블로그 {args.blogs} / '
+              f'지연 {args.latency_ms}ms')
+        per_k = 1000 / len(targets)
+
+        t0 = time.perf_counter()
+        rows_a, fetch_a = await per_blog(targets, base)
+        t_a = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        rows_b, fetch_b = await fan_out(targets, base, args.concurrency)
+        t_b = time.perf_counter() - t0
+
+        print(f"{'':>9} | {'fetches':>8} | {'wall(s)':>8} | {'fetches/1k':>10} | {'s/1k':>7}")
+        print('-' * 56)
+        for name, f, t in (('per-blog', fetch_a, t_a), ('fan-out', fetch_b, t_b)):
+            print(f'{name:>9} | {f:>8,} | {t:>8.2f} | {f * per_k:>10.0f} | {t * per_k:>7.2f}')
+        same = sorted(rows_a) == sorted(rows_b)
+        found = sum(1 for r in rows_b if r[1] or r[2])
+        print(f'순위 일치: {"예" if same else "아니오"} (노출 {found:,}건)  '
+              f'fetch {fetch_a / fetch_b:.1f}x 감소, {t_a / t_b:.1f}x 빠름')
+        return 0 if same else 1
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--blogs', type=int, default=25)
+    ap.add_argument('--keywords', type=int, default=40, help='블로그당 추적 키워드 수')
+    ap.add_argument('--vocab', type=int, default=400, help='키워드 풀 크기(작을수록 겹침이 많다)')
+    ap.add_argument('--latency-ms', type=float, default=20)
+    ap.add_argument('--concurrency', type=int, default=4)
+    args = ap.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+연관도 채점 벤치마크 — relevance_score 반복(예전) vs compile_relevance(...).score_many
+
+시드 30개·풀 토큰 10개로, 시드 조각·무관 단어를 섞어 만든 키워드 풀(10k / 100k / 1M)을
+채점하고 키워드당 µs 와 전체 초를 잰다. 두 경로의 점수가 같은지도 본다.
+예전 경로는 --baseline-max 개까지만 실제로 돌리고, 그보다 큰 풀은 그 표본으로 환산(~)한다.
+
+사용:
+  python scripts/bench_relevance.py
+  python scripts/bench_relevance.py --sizes 10000,100000 --seeds 50
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import keyword_relevance as KR  # noqa: E402
+
+STEMS = ['오피스텔', '매매', '전세', '월세', '원룸', '투룸', '아파트', '분양', '부동산', '중개',
+         '대출', '이자', '강남', '서초', '송파', '역삼', '신축', '급매', '시세', '전망']
+NOISE = ['맛집', '카페', '포켓몬', '카드', '여행', '후기', '추천', '가격', '할인', '이벤트',
+         '주차', '근처', '영업시간', '예약', '메뉴', '리뷰', '방법', '비교', '순위', '정리']
+
+
+def make_seeds(n: int, rng: random.Random):
+    return [''.join(rng.sample(STEMS, rng.randint(1, 3))) for _ in range(n)]
+
+
+def make_keywords(n: int, rng: random.Random):
+    words = STEMS + NOISE
+    return [''.join(rng.choice(words) for _ in range(rng.randint(1, 4))) for _ in range(n)]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--sizes', default='10000,100000,1000000')
+    ap.add_argument('--seeds', type=int, default=30)
+    ap.add_argument('--pool', type=int, default=10)
+    ap.add_argument('--baseline-max', type=int, default=100000)
+    args = ap.parse_args()
+
+    rng = random.Random(7)
+    seeds = make_seeds(args.seeds, rng)
+    pool = tuple(rng.sample(STEMS + NOISE, args.pool))
+    sizes = [int(x) for x in args.sizes.split(',')]
+    keywords = make_keywords(max(sizes), rng)
+
+    t0 = time.perf_counter()
+    KR._compiled.cache_clear()
+    matcher = KR.compile_relevance(seeds, pool)
+    print(f'시드 {len(seeds)}개 · 풀 토큰 {len(pool)}개 · 컴파일 {(time.perf_counter() - t0) * 1000:.1f}ms')
+    print(f"{'키워드':>10} | {'예전(s)':>9} | {'µs/건':>7} | {'매처(s)':>9} | {'µs/건':>7} | {'배':>5}")
+    print('-' * 64)
+
+    ok = True
+    for n in sizes:
+        batch = keywords[:n]
+        base = batch[:args.baseline_max]
+        t0 = time.perf_counter()
+        old = [KR.relevance_score(kw, seeds, pool) for kw in base]
+        t_old = (time.perf_counter() - t0) * n / len(base)
+        approx = '~' if len(base) < n else ' '
+
+        t0 = time.perf_counter()
+        new = matcher.score_many(batch)
+        t_new = time.perf_counter() - t0
+
+        ok = ok and old == new[:len(base)]
+        print(f'{n:>10,} | {approx}{t_old:>8.2f} | {t_old / n * 1e6:>7.1f} | {t_new:>9.2f} | '
+              f'{t_new / n * 1e6:>7.1f} | {t_old / t_new:>5.1f}')
+
+    print(f'점수 일치: {"예" if ok else "아니오"}')
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+리포트 집계 벤치마크 — 행마다 dict 누적(예전) vs 열 기반 NumPy 집계(AdDetailRollup)
+
+bench_report_stream 의 합성 AD_DETAIL 행을 미리 쪼개 두고(파싱·네트워크 제외)
+집계만 잰다. 예전 경로는 RS.metrics + defaultdict 네 벌, 새 경로는
+services/report_rollup.ColumnarRollup (청크 단위 코드화 + np.add.at 누적).
+두 결과가 같은지도 확인한다.
+
+사용:
+  python scripts/bench_report_rollup.py
+  python scripts/bench_report_rollup.py --rows 500000 --groups 300 --keywords-per-group 100
+"""
+import argparse
+import collections
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.bench_report_stream import DAY, synth_lines  # noqa: E402
+from services import naver_report_schema as RS  # noqa: E402
+from services.ad_report_collector import AdDetailRollup  # noqa: E402
+
+
+def dict_rollup(rows):
+    """예전 collect_ad_detail 의 누적 루프 (저장 행 생성 제외)."""
+    spec = RS.AD_DETAIL
+    mk = lambda: collections.defaultdict(lambda: collections.defaultdict(float))  # noqa: E731
+    kw, grp, camp, unattr = mk(), mk(), mk(), mk()
+    kw_parent, grp_parent = {}, {}
+    total, anon = collections.defaultdict(float), collections.defaultdict(float)
+    for r in rows:
+        if RS.row_date(r, spec) != DAY:
+            continue
+        m = RS.metrics(r, spec)
+        cid_, gid, kid = r[spec['campaign_id']], r[spec['adgroup_id']], r[spec['keyword_id']]
+        grp_parent[gid] = cid_
+        for k, v in m.items():
+            grp[gid][k] += v
+            camp[cid_][k] += v
+            total[k] += v
+        if kid == RS.UNATTRIBUTED:
+            for k, v in m.items():
+                unattr[gid][k] += v
+                anon[k] += v
+        else:
+            kw_parent[kid] = gid
+            for k, v in m.items():
+                kw[kid][k] += v
+    return kw, grp, camp, unattr, dict(total)
+
+
+def columnar(rows):
+    r = AdDetailRollup(DAY)
+    for row in rows:
+        r.add(row)
+    out = r.daily_rows()
+    return r, out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--rows', type=int, default=500000)
+    ap.add_argument('--groups', type=int, default=300)
+    ap.add_argument('--keywords-per-group', type=int, default=100)
+    args = ap.parse_args()
+
+    rows = [line.rstrip('\n').split('\t')
+            for line in synth_lines(args.rows, args.groups, args.keywords_per_group)]
+    print(f'AD_DETAIL 합성 {len(rows):,}행 (파싱 끝난 행으로 집계만 측정)')
+
+    t0 = time.perf_counter()
+    kw, grp, camp, unattr, total = dict_rollup(rows)
+    t_dict = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    rollup, out = columnar(rows)
+    t_col = time.perf_counter() - t0
+
+    print(f"{'':>9} | {'wall(s)':>8} | {'rows/s':>11}")
+    print('-' * 36)
+    print(f"{'dict':>9} | {t_dict:>8.2f} | {len(rows) / t_dict:>11,.0f}")
+    print(f"{'columnar':>9} | {t_col:>8.2f} | {len(rows) / t_col:>11,.0f}   (저장 행 생성 포함)")
+    same = (len(out['KEYWORD']) == len(kw) and len(out['ADGROUP']) == len(grp)
+            and len(out['CAMPAIGN']) == len(camp) and len(out['UNATTRIBUTED']) == len(unattr)
+            and rollup.total == total
+            and all(r['cost'] == kw[r['entity_id']]['cost'] for r in out['KEYWORD']))
+    print(f'집계 일치: {"예" if same else "아니오"}  {t_dict / t_col:.1f}x')
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+대량 리포트 수집 벤치마크 — 본문 통째 수신 + parse_rows vs 줄 단위 스트리밍 집계
+
+합성 AD_DETAIL TSV(--rows 행, 그룹 --groups 개 × 그룹당 키워드 --keywords-per-group 개,
+약 절반은 귀속 불가 "-")를 httpx MockTransport 로 64KB 청크씩 흘려 준다.
+    buffered : 예전 경로 — resp.text → RS.parse_rows → 행마다 AdDetailRollup.add
+    stream   : NaverAdApiClient.stream_report_lines → RS.aiter_rows → AdDetailRollup.add
+각 경로의 처리량(행/초)과 tracemalloc 피크 메모리를 재고, 두 집계 결과가 같은지 확인한다.
+스트리밍 쪽 피크는 리포트 크기가 아니라 버킷 수(키워드·그룹 수)에 비례해야 한다.
+
+사용:
+  python scripts/bench_report_stream.py
+  python scripts/bench_report_stream.py --rows 500000 --groups 300 --keywords-per-group 100
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+
+from services import naver_report_schema as RS  # noqa: E402
+from services.ad_report_collector import AdDetailRollup  # noqa: E402
+from services.naver_ad_service import NaverAdApiClient  # noqa: E402
+
+DAY = '2026-08-18'
+URL = 'https://api.searchad.naver.com/report-download?authtoken=bench'
+
+
+def synth_lines(n: int, groups: int, per_group: int, seed: int = 7):
+    rng = random.Random(seed)
+    for _ in range(n):
+        g = rng.randrange(groups)
+        kid = '-' if rng.random() < 0.5 else f'nkw-{g}-{rng.randrange(per_group)}'
+        imp = rng.randint(0, 50)
+        clk = rng.randint(0, imp // 10 + 1) if imp else 0
+        yield '\t'.join([
+            '20260818', '1858907', f'cmp-{g % 20}', f'grp-{g}', kid, f'nad-{g}',
+            'bsn-1', '01', '02', '03', rng.choice('MP'), str(imp), str(clk),
+            str(clk * rng.randint(70, 900)), str(imp * rng.randint(1, 8)),
+            str(rng.randint(0, 1) if clk else 0),
+        ]) + '\n'
+
+
+async def synth_body(args, chunk_bytes: int = 65536):
+    buf, size = [], 0
+    for line in synth_lines(args.rows, args.groups, args.keywords_per_group):
+        buf.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            yield ''.join(buf).encode('utf-8')
+            buf, size = [], 0
+    if buf:
+        yield ''.join(buf).encode('utf-8')
+
+
+def make_client(args) -> NaverAdApiClient:
+    def handler(request):
+        return httpx.Response(200, content=synth_body(args),
+                              headers={'content-type': 'text/plain; charset=utf-8'})
+
+    client = NaverAdApiClient()
+    client.api_key, client.secret_key, client.customer_id = 'bench', 'bench', '1858907'
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def buffered(args) -> AdDetailRollup:
+    client = make_client(args)
+    try:
+        resp = await client.client.get(URL)
+        rows = RS.parse_rows(resp.text, RS.AD_DETAIL_COLS)
+        RS.take_skipped(rows)
+        rollup = AdDetailRollup(DAY)
+        for r in rows:
+            rollup.add(r)
+        return rollup
+    finally:
+        await client.close()
+
+
+async def stream(args) -> AdDetailRollup:
+    client = make_client(args)
+    try:
+        rollup = AdDetailRollup(DAY)
+        async for r in RS.aiter_rows(client.stream_report_lines(URL), RS.AD_DETAIL_COLS):
+            rollup.add(r)
+        return rollup
+    finally:
+        await client.close()
+
+
+def run(fn, args, trace: bool):
+    if trace:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    rollup = asyncio.run(fn(args))
+    elapsed = time.perf_counter() - t0
+    peak = 0
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return rollup, elapsed, peak
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--rows', type=int, default=500000)
+    ap.add_argument('--groups', type=int, default=300)
+    ap.add_argument('--keywords-per-group', type=int, default=100)
+    args = ap.parse_args()
+
+    print(f'AD_DETAIL 합성 {args.rows:,}행 (그룹 {args.groups}, 그룹당 키워드 {args.keywords_per_group})')
+    print(f"{'':>9} | {'wall(s)':>8} | {'rows/s':>9} | {'peak MB':>8}")
+    print('-' * 46)
+    results = {}
+    for name, fn in (('buffered', buffered), ('stream', stream)):
+        rollup, elapsed, _ = run(fn, args, trace=False)
+        _, _, peak = run(fn, args, trace=True)
+        results[name] = rollup
+        print(f'{name:>9} | {elapsed:>8.2f} | {args.rows / elapsed:>9,.0f} | {peak / 2**20:>8.1f}')
+
+    a, b = results['buffered'].daily_rows(), results['stream'].daily_rows()
+    same = a == b and dict(results['buffered'].total) == dict(results['stream'].total)
+    print(f'집계 일치: {"예" if same else "아니오"}  '
+          f'(키워드 {len(a["KEYWORD"]):,} / 그룹 {len(a["ADGROUP"]):,})')
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+SERP 파싱 벤치마크 — BeautifulSoup html.parser(예전) vs lxml(services/html_select)
+
+tests/fixtures/serp/blog_tab_list.html 을 실제 블로그탭 크기(~500KB)가 되도록
+목록 바깥 마크업(다른 섹션·인라인 script/style)으로 부풀린 뒤
+    1) 파싱만       — 트리 구축
+    2) 순위 추출    — _parse_serp_html 전체 (컨테이너 셀렉터 + 링크 + 제목)
+를 페이지당 ms 로 잰다. 두 경로의 순위 행이 같은지도 본다.
+
+사용:
+  python scripts/bench_serp_parse.py
+  python scripts/bench_serp_parse.py --kb 500 --repeat 20
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from services import keyword_verdict as KV  # noqa: E402
+from services.html_select import parse_html  # noqa: E402
+
+FIXTURE = Path(__file__).resolve().parent.parent / 'tests' / 'fixtures' / 'serp' / 'blog_tab_list.html'
+
+
+def padded_page(kb: int) -> str:
+    html = FIXTURE.read_text(encoding='utf-8')
+    block = ('<div class="api_subject_bx sc_other"><ul class="lst_type">'
+             + ''.join(f'<li class="bx"><a href="https://search.naver.com/?q={i}" class="link_tit">'
+                       f'<span class="tit">연관 검색어 {i}</span></a><p class="dsc">설명 {i} &amp; 부가 정보</p></li>'
+                       for i in range(40))
+             + '</ul></div><script>window.__x = ' + '"' + 'a' * 2000 + '";</script>')
+    pad = []
+    size = len(html.encode('utf-8'))
+    while size < kb * 1024:
+        pad.append(block)
+        size += len(block.encode('utf-8'))
+    return html.replace('</body>', ''.join(pad) + '</body>')
+
+
+def bs4_parse_serp(html):
+    """lxml 전환 전 _parse_serp_html 의 DOM 경로."""
+    rows, seen = [], set()
+    soup = BeautifulSoup(html, 'html.parser')
+    containers = []
+    for sel in KV._LIST_SELECTORS:
+        containers = soup.select(sel)
+        if containers:
+            break
+    for c in containers:
+        for a in c.select('a[href*="blog.naver.com"]'):
+            m = KV._POST_RE.search(a.get('href', ''))
+            if not m or m.group(1) in seen:
+                continue
+            seen.add(m.group(1))
+            title = KV._TITLE_NOISE.sub('', a.get_text(strip=True) or '').strip()
+            rows.append({
+                'rank': len(rows) + 1, 'blog_id': m.group(1), 'blog_name': m.group(1),
+                'post_title': title or f'포스팅 #{m.group(2)}',
+                'post_url': f'https://blog.naver.com/{m.group(1)}/{m.group(2)}',
+            })
+    return rows, 'list'
+
+
+def timed(fn, html, repeat):
+    out, laps = None, []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn(html)
+        laps.append((time.perf_counter() - t0) * 1000)
+    return out, statistics.median(laps)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--kb', type=int, default=500)
+    ap.add_argument('--repeat', type=int, default=10)
+    args = ap.parse_args()
+
+    html = padded_page(args.kb)
+    print(f'페이지 {len(html.encode("utf-8")) / 1024:,.0f}KB / {args.repeat}회 중앙값')
+    print(f"{'':>10} | {'bs4(ms)':>9} | {'lxml(ms)':>9} | {'배':>5}")
+    print('-' * 44)
+    stages = [
+        ('파싱만', lambda h: BeautifulSoup(h, 'html.parser'), parse_html),
+        ('순위 추출', bs4_parse_serp, KV._parse_serp_html),
+    ]
+    results = {}
+    for label, old_fn, new_fn in stages:
+        old, t_old = timed(old_fn, html, args.repeat)
+        new, t_new = timed(new_fn, html, args.repeat)
+        results[label] = (old, new)
+        print(f'{label:>10} | {t_old:>9.1f} | {t_new:>9.1f} | {t_old / t_new:>5.1f}')
+
+    old, new = results['순위 추출']
+    same = old == new
+    print(f'순위 행 {len(new[0])}개 / 일치: {"예" if same else "아니오"}')
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
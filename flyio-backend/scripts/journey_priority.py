@@ -49,7 +49,7 @@ from pathlib import Path
 from typing import Dict, List
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from services.keyword_relevance import explain as relevance_explain  # noqa: E402
+from services.keyword_relevance import compile_relevance  # noqa: E402
 
 STAGE_NAMES = {1: "인지", 2: "탐색", 3: "비교", 4: "검증", 5: "행동", 0: "미분류"}
 
@@ -110,7 +110,7 @@ def score(item: Dict, business_seeds: List[str] = ()) -> Dict:
     # 우리 회사와의 연관도. 업장이 "뭘 파는지" 적은 말과 대조한다.
     # 도메인 연관도이지 구매 의도가 아니다 — 두 축을 곱해야 "우리 것이면서 살 사람"이 남는다.
     if business_seeds:
-        rel, why = relevance_explain(item["keyword"], business_seeds)
+        rel, why = compile_relevance(business_seeds).explain_one(item["keyword"])
         item["relevance"] = rel
         item["relevance_why"] = ",".join(why)
         rel_factor = rel / 100.0
@@ -22,10 +22,11 @@ import asyncio
 import collections
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from database import ad_snapshot_db as S
 from services import naver_report_schema as RS
+from services.report_rollup import ColumnarRollup, Grouping, rate_columns
 
 logger = logging.getLogger(__name__)
 
@@ -41,9 +42,9 @@ LARGE_ACCOUNT_KEYWORDS = 50_000
 UNATTRIBUTED_PREFIX = "unattributed:"
 
 
-async def _build_and_download(client, kind: str, name: str,
-                              day: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
-    """리포트 작업을 만들고 BUILT 될 때까지 기다린 뒤 본문을 받는다."""
+async def _build_report(client, kind: str, name: str,
+                        day: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+    """리포트 작업을 만들고 BUILT 될 때까지 기다린다. (downloadUrl, meta)."""
     if kind == "stat":
         job = await client.create_stat_report(name, day)
         job_id = job.get("reportJobId")
@@ -64,15 +65,32 @@ async def _build_and_download(client, kind: str, name: str,
 
     if not url:
         raise RuntimeError(f"{kind}/{name} 리포트가 BUILT 되지 않았습니다 (job={job_id})")
+    return url, {"job_id": job_id, "kind": kind, "name": name}
 
-    text = await client.download_report_text(url)
-    if kind == "stat":
-        # 다 쓴 작업은 지운다 — 계정당 보관 개수에 제한이 있다.
-        try:
-            await client.delete_stat_report(job_id)
-        except Exception:
-            pass
-    return text, {"job_id": job_id, "kind": kind, "name": name}
+
+async def _stream_report(client, kind: str, name: str, day: Optional[str],
+                         expected_cols: int,
+                         sink: Callable[[List[str]], None]) -> Tuple[Dict[str, int], Dict[str, Any]]:
+    """리포트를 만들어 받으면서 행마다 sink(row) 를 부른다. (counts, meta).
+
+    본문을 str 로 받아 행 리스트로 쪼개 두면 10만 행 리포트 하나가 몇 벌씩 메모리에
+    뜬다(3GB 머신을 app·verdict_worker 와 나눠 쓴다). 줄이 도착하는 대로 접어 넣으므로
+    피크 메모리는 리포트 크기와 무관하고, 남는 건 sink 가 쌓는 집계뿐이다.
+    counts = {"rows": 열 수가 맞은 행, "skipped": 버린 행}.
+    """
+    url, meta = await _build_report(client, kind, name, day)
+    counts: Dict[str, int] = {"rows": 0, "skipped": 0}
+    try:
+        async for row in RS.aiter_rows(client.stream_report_lines(url), expected_cols, counts):
+            sink(row)
+    finally:
+        if kind == "stat":
+            # 다 쓴 작업은 지운다 — 계정당 보관 개수에 제한이 있다.
+            try:
+                await client.delete_stat_report(meta["job_id"])
+            except Exception:
+                pass
+    return counts, meta
 
 
 # ─────────────────────────────────────────────────────────────
@@ -86,19 +104,15 @@ async def collect_keyword_master(client, customer_id: str) -> Dict[str, Any]:
        키워드의 48.7% 가 그룹 입찰가를 상속하고 있었다 — 관리 화면에 보이는
        숫자가 실제 적용값이 아니라는 뜻이다.
     """
-    text, meta = await _build_and_download(client, "master", "Keyword")
-    rows = RS.parse_rows(text, RS.MASTER_KEYWORD_COLS)
-    skipped = RS.take_skipped(rows)
     spec = RS.MASTER_KEYWORD
-
     ents: List[Dict[str, Any]] = []
-    inherited = 0
-    locked = 0
-    for r in rows:
+    tally = {"inherited": 0, "locked": 0}
+
+    def add(r: List[str]) -> None:
         use_group = r[spec["use_group_bid"]] == "1"
         lock = r[spec["user_lock"]] == "1"
-        inherited += int(use_group)
-        locked += int(lock)
+        tally["inherited"] += int(use_group)
+        tally["locked"] += int(lock)
         try:
             bid = int(float(r[spec["bid_amt"]] or 0))
         except ValueError:
@@ -114,6 +128,11 @@ async def collect_keyword_master(client, customer_id: str) -> Dict[str, Any]:
             "use_group_bid": 1 if use_group else 0,
         })
 
+    counts, meta = await _stream_report(client, "master", "Keyword", None,
+                                        RS.MASTER_KEYWORD_COLS, add)
+    skipped = counts["skipped"]
+    inherited, locked = tally["inherited"], tally["locked"]
+
     if len(ents) > LARGE_ACCOUNT_KEYWORDS:
         logger.info(f"[report/keyword] {customer_id} 키워드 {len(ents):,}개 — 대형 계정")
 
@@ -134,95 +153,129 @@ async def collect_keyword_master(client, customer_id: str) -> Dict[str, Any]:
 # AD_DETAIL → 키워드/그룹 일별 성과 + 귀속 불가 트래픽
 # ─────────────────────────────────────────────────────────────
 
-async def collect_ad_detail(client, customer_id: str, day: str) -> Dict[str, Any]:
-    """하루치 키워드 단위 성과. 등록 키워드로 귀속되지 않는 트래픽을 분리한다."""
-    text, meta = await _build_and_download(client, "stat", "AD_DETAIL", day)
-    rows = RS.parse_rows(text, RS.AD_DETAIL_COLS)
-    skipped = RS.take_skipped(rows)
-    spec = RS.AD_DETAIL
-
-    kw: Dict[str, Dict[str, float]] = collections.defaultdict(
-        lambda: collections.defaultdict(float))
-    grp: Dict[str, Dict[str, float]] = collections.defaultdict(
-        lambda: collections.defaultdict(float))
-    camp: Dict[str, Dict[str, float]] = collections.defaultdict(
-        lambda: collections.defaultdict(float))
-    unattr: Dict[str, Dict[str, float]] = collections.defaultdict(
-        lambda: collections.defaultdict(float))
-    kw_parent: Dict[str, str] = {}
-    grp_parent: Dict[str, str] = {}
-    total = collections.defaultdict(float)
-    anon = collections.defaultdict(float)
-
-    for r in rows:
-        d = RS.row_date(r, spec)
-        if d != day:
-            # 리포트는 하루치지만 방어적으로 확인한다.
-            continue
-        m = RS.metrics(r, spec)
-        cid_ = r[spec["campaign_id"]]
-        gid = r[spec["adgroup_id"]]
-        kid = r[spec["keyword_id"]]
-        grp_parent[gid] = cid_
-
-        for k, v in m.items():
-            grp[gid][k] += v
-            camp[cid_][k] += v
-            total[k] += v
-
-        if kid == RS.UNATTRIBUTED:
-            for k, v in m.items():
-                unattr[gid][k] += v
-                anon[k] += v
-        else:
-            kw_parent[kid] = gid
-            for k, v in m.items():
-                kw[kid][k] += v
-
-    def _rows(bucket, etype, parent_of=None, id_prefix=""):
+class AdDetailRollup:
+    """AD_DETAIL 행을 도착하는 대로 받아 키워드/그룹/캠페인/귀속 불가 단위로 접는다.
+
+    add(row) 를 리포트 행마다 부르고, 끝나면 daily_rows() 로 저장할 행을 만든다.
+    집계는 services/report_rollup 의 열 기반 엔진이 한다 — 원본 행은 남기지 않고,
+    days 에 여러 날을 주면 날짜별 행이 나온다(백필).
+    """
+
+    VALUES = ("impressions", "clicks", "cost", "conversions", "rank_sum")
+
+    def __init__(self, day: str, days: Optional[List[str]] = None):
+        self.day = day
+        unattr = {"keyword_id": RS.UNATTRIBUTED}
+        self.engine = ColumnarRollup(
+            RS.AD_DETAIL, {
+                "CAMPAIGN": Grouping(("campaign_id",)),
+                "ADGROUP": Grouping(("adgroup_id",), parents=("campaign_id",)),
+                "KEYWORD": Grouping(("keyword_id",), exclude=unattr, parents=("adgroup_id",)),
+                "UNATTRIBUTED": Grouping(("adgroup_id",), only=unattr),
+                "TOTAL": Grouping((), dated=False),
+                "ANON": Grouping((), only=unattr, dated=False),
+            },
+            values=self.VALUES, days=days or [day],
+            # RS.metrics 와 같이 노출·클릭은 행마다 int() 로 자른 뒤 더한다.
+            truncate=("impressions", "clicks"))
+        # 행마다 도는 경로라 래퍼 호출 한 단을 줄인다.
+        self.add = self.engine.add
+
+    @property
+    def total(self) -> Dict[str, float]:
+        return self.engine.total("TOTAL")
+
+    @property
+    def anon(self) -> Dict[str, float]:
+        return self.engine.total("ANON")
+
+    def count(self, name: str) -> int:
+        """트래픽이 있었던 엔티티 수 (날짜 무관)."""
+        return len({k[1] for k in self.engine.result(name).keys})
+
+    def _rows(self, name: str, parent: Optional[str] = None, id_prefix: str = ""):
+        g = self.engine.result(name)
+        sums = {k: v.tolist() for k, v in g.sums.items()}
+        rates = {k: v.tolist() for k, v in rate_columns(g.sums).items()}
         out = []
-        for eid, m in bucket.items():
-            imp = m["impressions"]
+        for i, (day, eid) in enumerate(g.keys):
             out.append({
-                "entity_type": etype,
+                "entity_type": name,
                 "entity_id": f"{id_prefix}{eid}",
                 "stat_date": day,
-                "impressions": int(imp),
-                "clicks": int(m["clicks"]),
-                "cost": m["cost"],
-                "conversions": m["conversions"],
-                "ctr": (m["clicks"] / imp * 100) if imp else 0,
-                "cpc": (m["cost"] / m["clicks"]) if m["clicks"] else 0,
-                "avg_rank": (m["rank_sum"] / imp) if imp else 0,
-                "parent_id": parent_of(eid) if parent_of else eid,
+                "impressions": int(sums["impressions"][i]),
+                "clicks": int(sums["clicks"][i]),
+                "cost": sums["cost"][i],
+                "conversions": sums["conversions"][i],
+                "ctr": rates["ctr"][i],
+                "cpc": rates["cpc"][i],
+                "avg_rank": rates["avg_rank"][i],
+                "parent_id": g.parents[parent][i] if parent else eid,
             })
         return out
 
+    def daily_rows(self) -> Dict[str, List[Dict[str, Any]]]:
+        """엔티티 유형별 save_daily_stats 입력."""
+        return {
+            "CAMPAIGN": self._rows("CAMPAIGN"),
+            "ADGROUP": self._rows("ADGROUP", parent="campaign_id"),
+            "KEYWORD": self._rows("KEYWORD", parent="adgroup_id"),
+            "UNATTRIBUTED": [dict(r, label="키워드 귀속 불가(확장검색 등)")
+                             for r in self._rows("UNATTRIBUTED",
+                                                 id_prefix=UNATTRIBUTED_PREFIX)],
+        }
+
+
+def _days_ending(day: str, days: int) -> List[str]:
+    """day 를 마지막으로 하는 days 일(오래된 날부터)."""
+    end = datetime.strptime(day, "%Y-%m-%d")
+    return [(end - timedelta(days=n)).strftime("%Y-%m-%d") for n in range(days - 1, -1, -1)]
+
+
+async def _stream_days(client, name: str, dates: List[str], expected_cols: int,
+                       sink: Callable[[List[str]], None]) -> Tuple[Dict[str, int], Dict[str, Any]]:
+    """하루치 StatReport 를 날짜마다 만들어 같은 sink 에 흘려 넣는다(백필)."""
+    counts = {"rows": 0, "skipped": 0}
+    metas = []
+    for d in dates:
+        c, meta = await _stream_report(client, "stat", name, d, expected_cols, sink)
+        counts["rows"] += c["rows"]
+        counts["skipped"] += c["skipped"]
+        metas.append(meta)
+    return counts, metas[0] if len(metas) == 1 else {"reports": metas}
+
+
+async def collect_ad_detail(client, customer_id: str, day: str,
+                            days: int = 1) -> Dict[str, Any]:
+    """하루치 키워드 단위 성과. 등록 키워드로 귀속되지 않는 트래픽을 분리한다.
+
+    days > 1 이면 day 까지 거슬러 올라간 days 일치를 날짜마다 받아 한 번에 접는다.
+    """
+    dates = _days_ending(day, max(1, days))
+    rollup = AdDetailRollup(day, days=dates)
+    counts, meta = await _stream_days(client, "AD_DETAIL", dates, RS.AD_DETAIL_COLS, rollup.add)
+    rows = rollup.daily_rows()
+
     written = 0
     # ⚠️ 캠페인 일별은 여기서만 나온다. /stats 는 timeIncrement=allDays 를 무시하고
     #    날짜 없는 합계 1행만 돌려주기 때문에 일별 분해가 불가능하다(라이브 확인).
     #    사고 감시의 '어제 대비' 기준선이 이 행들에 의존한다.
-    written += S.save_daily_stats(customer_id, _rows(camp, "CAMPAIGN"))
-    written += S.save_daily_stats(
-        customer_id, _rows(grp, "ADGROUP", parent_of=lambda g: grp_parent.get(g)))
-    written += S.save_daily_stats(
-        customer_id, _rows(kw, "KEYWORD", parent_of=lambda k: kw_parent.get(k)))
+    written += S.save_daily_stats(customer_id, rows["CAMPAIGN"])
+    written += S.save_daily_stats(customer_id, rows["ADGROUP"])
+    written += S.save_daily_stats(customer_id, rows["KEYWORD"])
     # 귀속 불가 트래픽을 그룹별 가상 엔티티로 남긴다. 이걸 따로 두지 않으면
     # 키워드 합계와 그룹 합계가 안 맞는 이유를 아무도 설명하지 못한다.
-    written += S.save_daily_stats(
-        customer_id,
-        [dict(r, label="키워드 귀속 불가(확장검색 등)")
-         for r in _rows(unattr, "UNATTRIBUTED", parent_of=lambda g: g,
-                        id_prefix=UNATTRIBUTED_PREFIX)])
+    written += S.save_daily_stats(customer_id, rows["UNATTRIBUTED"])
 
+    total, anon = rollup.total, rollup.anon
     ti, tc, tm = total["impressions"], total["clicks"], total["cost"]
-    return {
+    result = {
         "date": day,
-        "source_rows": len(rows),
-        "rows_skipped": skipped,
-        "keywords_with_traffic": len(kw),
-        "ad_groups_with_traffic": len(grp),
-        "campaigns_with_traffic": len(camp),
+        "source_rows": counts["rows"],
+        "rows_skipped": counts["skipped"],
+        "keywords_with_traffic": rollup.count("KEYWORD"),
+        "ad_groups_with_traffic": rollup.count("ADGROUP"),
+        "campaigns_with_traffic": rollup.count("CAMPAIGN"),
         "rows_written": written,
         "totals": {"impressions": int(ti), "clicks": int(tc), "cost": round(tm)},
         # 이 계정에서 등록 키워드로 설명되지 않는 몫.
@@ -236,74 +289,88 @@ async def collect_ad_detail(client, customer_id: str, day: str) -> Dict[str, Any
         },
         "meta": meta,
     }
+    if len(dates) > 1:
+        result["dates"] = dates
+    return result
 
 
 # ─────────────────────────────────────────────────────────────
 # EXPKEYWORD → 실제 검색어
 # ─────────────────────────────────────────────────────────────
 
+class SearchTermRollup:
+    """EXPKEYWORD 행 → (날짜, 그룹, 검색어) 합계. 열 기반 엔진은 AdDetailRollup 과 같다."""
+
+    VALUES = ("impressions", "clicks", "cost", "conversions")
+
+    def __init__(self, day: str, days: Optional[List[str]] = None):
+        self.engine = ColumnarRollup(
+            RS.EXPKEYWORD,
+            {"TERM": Grouping(("adgroup_id", "search_term"), exclude={"search_term": ""})},
+            values=self.VALUES, days=days or [day], strip=("search_term",))
+        self.add = self.engine.add
+
+    def daily_rows(self, top_n: int) -> Tuple[List[Dict[str, Any]], int, int]:
+        """날짜별 비용 상위 top_n 행, 서로 다른 검색어 수, 잘린 수."""
+        g = self.engine.result("TERM")
+        sums = {k: v.tolist() for k, v in g.sums.items()}
+        rates = {k: v.tolist() for k, v in rate_columns(g.sums, rank=False).items()}
+        by_day: Dict[str, List[int]] = collections.defaultdict(list)
+        for i, (day, _, _) in enumerate(g.keys):
+            by_day[day].append(i)
+
+        out: List[Dict[str, Any]] = []
+        dropped = 0
+        for day, idx in by_day.items():
+            ranked = sorted(idx, key=lambda i: (-sums["cost"][i], -sums["clicks"][i]))
+            dropped += max(0, len(ranked) - top_n)
+            for i in ranked[:top_n]:
+                _, gid, term = g.keys[i]
+                out.append({
+                    "entity_type": "SEARCHTERM",
+                    "entity_id": f"{gid}|{term}",
+                    "stat_date": day,
+                    "impressions": int(sums["impressions"][i]),
+                    "clicks": int(sums["clicks"][i]),
+                    "cost": sums["cost"][i],
+                    "conversions": sums["conversions"][i],
+                    "ctr": rates["ctr"][i],
+                    "cpc": rates["cpc"][i],
+                    "parent_id": gid,
+                    "label": term,
+                })
+        return out, len(g), dropped
+
+
 async def collect_expkeyword(client, customer_id: str, day: str,
-                             top_n: int = 3000) -> Dict[str, Any]:
+                             top_n: int = 3000, days: int = 1) -> Dict[str, Any]:
     """실제 검색어 단위 성과.
 
     검색어는 하루 1.5만 종이 넘게 나온다. 전부 저장하면 금세 수천만 행이 되므로
     **비용 상위 top_n 만** 남기고, 자른 수를 결과에 실어 보고한다.
     조용히 자르면 "우리 계정 검색어는 3,000종" 이라는 오해를 만든다.
+    days > 1 이면 날짜마다 top_n 을 따로 남긴다.
     """
-    text, meta = await _build_and_download(client, "stat", "EXPKEYWORD", day)
-    rows = RS.parse_rows(text, RS.EXPKEYWORD_COLS)
-    skipped = RS.take_skipped(rows)
-    spec = RS.EXPKEYWORD
-
-    agg: Dict[str, Dict[str, float]] = collections.defaultdict(
-        lambda: collections.defaultdict(float))
-    parent: Dict[str, str] = {}
-    for r in rows:
-        if RS.row_date(r, spec) != day:
-            continue
-        term = (r[spec["search_term"]] or "").strip()
-        if not term:
-            continue
-        gid = r[spec["adgroup_id"]]
-        key = f"{gid}|{term}"
-        parent[key] = gid
-        agg[key]["impressions"] += RS._f(r[spec["impressions"]])
-        agg[key]["clicks"] += RS._f(r[spec["clicks"]])
-        agg[key]["cost"] += RS._f(r[spec["cost"]])
-        agg[key]["conversions"] += RS._f(r[spec["conversions"]])
-
-    ranked = sorted(agg.items(), key=lambda kv: (-kv[1]["cost"], -kv[1]["clicks"]))
-    kept = ranked[:top_n]
-    dropped = len(ranked) - len(kept)
-
-    out = []
-    for key, m in kept:
-        imp = m["impressions"]
-        out.append({
-            "entity_type": "SEARCHTERM",
-            "entity_id": key,
-            "stat_date": day,
-            "impressions": int(imp),
-            "clicks": int(m["clicks"]),
-            "cost": m["cost"],
-            "conversions": m["conversions"],
-            "ctr": (m["clicks"] / imp * 100) if imp else 0,
-            "cpc": (m["cost"] / m["clicks"]) if m["clicks"] else 0,
-            "parent_id": parent[key],
-            "label": key.split("|", 1)[1],
-        })
+    dates = _days_ending(day, max(1, days))
+    rollup = SearchTermRollup(day, days=dates)
+    counts, meta = await _stream_days(client, "EXPKEYWORD", dates, RS.EXPKEYWORD_COLS,
+                                      rollup.add)
+    out, distinct, dropped = rollup.daily_rows(top_n)
     written = S.save_daily_stats(customer_id, out)
 
-    return {
+    result = {
         "date": day,
-        "source_rows": len(rows),
-        "rows_skipped": skipped,
-        "distinct_search_terms": len(agg),
+        "source_rows": counts["rows"],
+        "rows_skipped": counts["skipped"],
+        "distinct_search_terms": distinct,
         "stored": written,
         "dropped_beyond_top_n": dropped,
         "top_n": top_n,
         "meta": meta,
     }
+    if len(dates) > 1:
+        result["dates"] = dates
+    return result
 
 
 # ─────────────────────────────────────────────────────────────
@@ -315,10 +382,12 @@ async def collect_reports(client, customer_id: str,
                           include_keyword_master: bool = True,
                           include_ad_detail: bool = True,
                           include_expkeyword: bool = True,
-                          search_term_top_n: int = 3000) -> Dict[str, Any]:
+                          search_term_top_n: int = 3000,
+                          days: int = 1) -> Dict[str, Any]:
     """대량 리포트 수집 한 판.
 
     기본 대상일은 어제다 — 당일 통계는 미확정이라 오늘을 넣으면 언제나 작게 나온다.
+    days > 1 이면 성과 리포트(AD_DETAIL·EXPKEYWORD)를 day 까지 days 일치 백필한다.
     """
     day = day or (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
     run_id = S.start_run(customer_id, "report-collect")
@@ -329,10 +398,10 @@ async def collect_reports(client, customer_id: str,
     if include_keyword_master:
         steps.append(("keyword_master", collect_keyword_master(client, customer_id)))
     if include_ad_detail:
-        steps.append(("ad_detail", collect_ad_detail(client, customer_id, day)))
+        steps.append(("ad_detail", collect_ad_detail(client, customer_id, day, days)))
     if include_expkeyword:
         steps.append(("expkeyword",
-                      collect_expkeyword(client, customer_id, day, search_term_top_n)))
+                      collect_expkeyword(client, customer_id, day, search_term_top_n, days)))
 
     for name, coro in steps:
         try:
@@ -346,6 +415,7 @@ async def collect_reports(client, customer_id: str,
     result["ok"] = not result["errors"]
     result["rows_written"] = written
     S.finish_run(run_id, "ok" if result["ok"] else "partial",
-                 rows_written=written, covered_from=day, covered_to=day,
+                 rows_written=written, covered_from=_days_ending(day, max(1, days))[0],
+                 covered_to=day,
                  error="; ".join(result["errors"])[:900] or None)
     return result
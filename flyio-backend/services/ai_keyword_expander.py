@@ -5,7 +5,6 @@ AI 키워드 자동 확장 서비스 (관리자 전용)
 기존 volume_filter_jobs / volume_filter_results 테이블을 재사용해서
 필터링 UI 및 광고 등록 플로우에서 그대로 쓸 수 있게 한다.
 """
-import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -17,10 +16,10 @@ from database.naver_ad_db import (
     update_volume_filter_job,
 )
 from services.naver_ad_service import NaverAdApiClient
+from services.naver_rate_governor import background_job
 
 logger = logging.getLogger(__name__)
 
-API_DELAY = 0.35  # 네이버 /keywordstool rate limit
 DB_FLUSH_BATCH = 200
 CONTROL_CHECK_EVERY = 10  # API 호출 10회마다 취소 체크
 # 실시간 캠페인 등록 관련
@@ -28,7 +27,6 @@ MAX_CAMPAIGNS_PER_ACCOUNT = 200     # 네이버 계정당 파워링크 캠페인
 MAX_AD_GROUPS_PER_CAMPAIGN = 1000   # 네이버 제한
 MAX_KEYWORDS_PER_AD_GROUP = 1000    # 네이버 제한
 MAX_KEYWORDS_PER_POST = 100         # /ncc/keywords 한 번 호출 최대
-REGISTER_API_DELAY = 0.5            # 광고 등록 API rate limit
 
 
 @dataclass
@@ -181,7 +179,6 @@ class AiKeywordExpander:
                         logger.warning(
                             f"[AiExpand {config.job_id}] 캠페인 이름 중복 → '{cname}'으로 재시도"
                         )
-                        await asyncio.sleep(REGISTER_API_DELAY)
                         continue
                     else:
                         break
@@ -190,7 +187,6 @@ class AiKeywordExpander:
                 state["current_campaign_id"] = cid
                 state["ad_groups_in_current_campaign"] = 0
                 state["campaigns_used"] += 1  # 성공 확정 후 증가
-                await asyncio.sleep(REGISTER_API_DELAY)
             else:
                 err = str(last_err)[:500] if last_err else "unknown"
                 state["last_error"] = f"캠페인 생성 실패: {err}"
@@ -216,7 +212,6 @@ class AiKeywordExpander:
             state["ad_groups_in_current_campaign"] += 1
             state["ad_groups_used"] += 1  # 성공 확정 후 증가
             logger.info(f"[AiExpand {config.job_id}] 광고그룹 생성 ✓: {gname} ({gid})")
-            await asyncio.sleep(REGISTER_API_DELAY)
             return True
         except Exception as e:
             err = str(e)[:500]
@@ -281,9 +276,12 @@ class AiKeywordExpander:
             else:
                 state["consecutive_failures"] = 0
 
-            await asyncio.sleep(REGISTER_API_DELAY)
-
     async def run(self, config: AiExpandConfig) -> dict:
+        # 호출 간격은 _request 의 keywordstool·ncc_write 버킷이 잡는다.
+        with background_job():
+            return await self._run(config)
+
+    async def _run(self, config: AiExpandConfig) -> dict:
         job_id = config.job_id
         seeds = [s.strip() for s in config.seeds if s and s.strip()]
         if not seeds:
@@ -487,7 +485,6 @@ class AiKeywordExpander:
                 except Exception as e:
                     logger.warning(f"[AiExpand {job_id}] API 실패 '{norm}': {e}")
                     api_calls += 1
-                    await asyncio.sleep(API_DELAY)
                     continue
 
                 api_calls += 1
@@ -557,8 +554,6 @@ class AiKeywordExpander:
                     ),
                 )
 
-                await asyncio.sleep(API_DELAY)
-
             # 마지막 flush
             if pending_results:
                 add_volume_filter_results(job_id, pending_results)
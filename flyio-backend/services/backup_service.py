@@ -1,6 +1,11 @@
 """
 Automatic backup service for learning data persistence
 데이터 영구 보존을 위한 자동 백업 서비스
+
+DB 백업은 services/incremental_backup 의 증분 스냅샷이다 — /data 아래 모든 *.db 를
+페이지 단위로 쉬어 가며 읽고, 바뀐 청크만 압축해 BACKUP_DIR/incremental 에 쌓는다.
+예전 backup_*.db 전체 복사본은 복원·목록에서 계속 읽히고, 증분 스냅샷이
+MIN_BACKUPS_KEEP 개 쌓이면 정리된다.
 """
 import os
 import json
@@ -23,6 +28,12 @@ if sys.platform == "win32":
 else:
     BACKUP_DIR = "/data/backups"
     DATABASE_PATH = "/data/blog_analyzer.db"
+DATA_ROOT = os.path.dirname(DATABASE_PATH)  # 증분 백업 대상 — 이 아래 *.db 전부
+INCREMENTAL_DIR = os.path.join(BACKUP_DIR, "incremental")
+# 증분 스냅샷은 바뀐 청크만 쓰므로 여러 개 둘 수 있다 — 2시간 간격이면 3일치.
+MAX_SNAPSHOTS = int(os.environ.get("BACKUP_MAX_SNAPSHOTS", "36"))
+# fnmatch 패턴(DATA_ROOT 기준 상대 경로), 쉼표 구분 — 다시 만들 수 있는 캐시 DB 등을 뺄 때.
+BACKUP_EXCLUDE = [p.strip() for p in os.environ.get("BACKUP_EXCLUDE", "").split(",") if p.strip()]
 MAX_BACKUPS = 3  # 8 → 3: DB 가 471MB 로 커지며 백업 1개 ≈ 280MB. 8개면 2.2GB 로
                  # 3GB 볼륨을 꽉 채워 backup/WAL 실패 + IO 폭주 → API 멈춤 유발.
 MAX_JSON_BACKUPS = 2  # JSON 백업은 2개만 유지 - 디스크 사용량 감소
@@ -38,29 +49,32 @@ def ensure_backup_dir():
     os.makedirs(BACKUP_DIR, exist_ok=True)
 
 
+_store = None
+
+
+def get_store():
+    """증분 백업 저장소 (BACKUP_DIR/incremental)."""
+    global _store
+    if _store is None or _store.dir != INCREMENTAL_DIR:
+        from services.incremental_backup import BackupStore
+        _store = BackupStore(INCREMENTAL_DIR)
+    return _store
+
+
 def create_backup() -> Optional[str]:
     """
-    데이터베이스 백업 생성
-    Returns: 백업 파일 경로 또는 None
+    데이터베이스 백업 생성 — DATA_ROOT 아래 모든 *.db 의 증분 스냅샷
+    Returns: 스냅샷 id 또는 None (보고는 get_store().last_report)
     """
     try:
         ensure_backup_dir()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = os.path.join(BACKUP_DIR, f"backup_{timestamp}.db")
-
-        # SQLite 안전한 백업 (VACUUM INTO 사용)
-        if os.path.exists(DATABASE_PATH):
-            conn = sqlite3.connect(DATABASE_PATH)
-            backup_conn = sqlite3.connect(backup_path)
-            conn.backup(backup_conn)
-            backup_conn.close()
-            conn.close()
-
-            logger.info(f"Backup created: {backup_path}")
-            return backup_path
-        else:
-            logger.warning(f"Database not found: {DATABASE_PATH}")
+        report = get_store().snapshot(DATA_ROOT, exclude_dirs=[BACKUP_DIR], exclude=BACKUP_EXCLUDE)
+        if not report["databases"]:
+            logger.warning(f"No databases found under: {DATA_ROOT}")
             return None
+        logger.info(f"Backup created: {report['id']} "
+                    f"({report['bytes_written'] / (1024 * 1024):.1f}MB written, io {report['io_s']}s)")
+        return report["id"]
 
     except Exception as e:
         logger.error(f"Backup failed: {e}")
@@ -90,13 +104,21 @@ def cleanup_old_backups():
     try:
         ensure_backup_dir()
 
-        # 1. DB 백업 파일 정리
+        # 0. 증분 스냅샷 정리 — 개수·용량 예산. 참조 없는 청크도 함께 지운다.
+        store = get_store()
+        store.prune(MAX_SNAPSHOTS, max_bytes=MAX_BACKUP_TOTAL_MB * 1024 * 1024,
+                    min_keep=MIN_BACKUPS_KEEP)
+        snapshots = len(store.list_snapshots())
+
+        # 1. DB 백업 파일 정리 — 예전 전체 복사본. 증분 스냅샷이 MIN_BACKUPS_KEEP 개
+        # 쌓였으면 복구 지점은 충분하므로 전부 지운다(하나 ≈280MB).
         db_backups = sorted([
             f for f in os.listdir(BACKUP_DIR)
             if f.startswith("backup_") and f.endswith(".db")
         ])
+        max_full = 0 if snapshots >= MIN_BACKUPS_KEEP else MAX_BACKUPS
 
-        while len(db_backups) > MAX_BACKUPS:
+        while len(db_backups) > max_full:
             old_backup = db_backups.pop(0)
             old_path = os.path.join(BACKUP_DIR, old_backup)
             try:
@@ -114,7 +136,7 @@ def cleanup_old_backups():
                 return 0.0
 
         total_mb = sum(_size_mb(f) for f in db_backups)
-        while total_mb > MAX_BACKUP_TOTAL_MB and len(db_backups) > MIN_BACKUPS_KEEP:
+        while total_mb > MAX_BACKUP_TOTAL_MB and len(db_backups) > max(0, MIN_BACKUPS_KEEP - snapshots):
             old_backup = db_backups.pop(0)
             freed = _size_mb(old_backup)
             try:
@@ -184,9 +206,14 @@ def emergency_cleanup():
             if f.startswith("backup_") and f.endswith(".db")
         ])
 
+        # 증분 스냅샷은 복구 지점 MIN_BACKUPS_KEEP 개까지 줄이고 청크를 정리한다.
+        store = get_store()
+        store.prune(MIN_BACKUPS_KEEP, min_keep=MIN_BACKUPS_KEEP)
+        snapshots = len(store.list_snapshots())
+
         # 6 → MIN_BACKUPS_KEEP(2): 백업이 280MB+ 라 6개 floor 면 1.7GB 가 안 빠져
         # 디스크가 영구히 막혔다 (실제 사고). 긴급 시엔 복구 지점 2개까지 줄인다.
-        target_count = max(MIN_BACKUPS_KEEP, len(db_backups) // 2)
+        target_count = 0 if snapshots >= MIN_BACKUPS_KEEP else max(MIN_BACKUPS_KEEP, len(db_backups) // 2)
         while len(db_backups) > target_count:
             old_backup = db_backups.pop(0)
             try:
@@ -332,11 +359,24 @@ def import_from_json(json_path: str) -> bool:
 
 
 def get_backup_list() -> List[Dict]:
-    """사용 가능한 백업 목록 조회"""
+    """사용 가능한 백업 목록 조회 — 증분 스냅샷 + 예전 전체 복사본, 최신 먼저"""
     try:
         ensure_backup_dir()
         backups = []
 
+        # 증분 스냅샷: size_mb 는 그 스냅샷이 실제로 쓴 양(새 청크), 논리 크기는 logical_mb
+        for snap in get_store().list_snapshots():
+            rep = snap.get("report", {})
+            backups.append({
+                "filename": snap["id"],
+                "path": os.path.join(INCREMENTAL_DIR, "snapshots", f"{snap['id']}.json"),
+                "size_mb": round(rep.get("bytes_written", 0) / (1024 * 1024), 2),
+                "created_at": snap["created_at"],
+                "kind": "incremental",
+                "databases": snap["databases"],
+                "logical_mb": round(rep.get("logical_bytes", 0) / (1024 * 1024), 2),
+            })
+
         for f in sorted(os.listdir(BACKUP_DIR), reverse=True):
             if f.startswith("backup_") and f.endswith(".db"):
                 path = os.path.join(BACKUP_DIR, f)
@@ -345,9 +385,11 @@ def get_backup_list() -> List[Dict]:
                     "filename": f,
                     "path": path,
                     "size_mb": round(stat.st_size / (1024 * 1024), 2),
-                    "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat()
+                    "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                    "kind": "full",
                 })
 
+        backups.sort(key=lambda b: b["created_at"], reverse=True)
         return backups
 
     except Exception as e:
@@ -355,11 +397,30 @@ def get_backup_list() -> List[Dict]:
         return []
 
 
-def restore_from_backup(backup_filename: str) -> bool:
+def restore_from_backup(backup_filename: str, databases: Optional[List[str]] = None) -> bool:
     """
     백업에서 데이터베이스 복원
+    - 증분 스냅샷 id 면 그 시점의 DB 들(databases 로 좁힐 수 있음)을 살아 있는 DB 위에
+      sqlite backup API 로 덮어쓴다. 덮어쓰기 전 현재 상태도 스냅샷으로 남긴다.
+    - backup_*.db 면 예전처럼 DATABASE_PATH 로 복사
     """
     try:
+        if not backup_filename.endswith(".db"):
+            store = get_store()
+            if backup_filename not in {s["id"] for s in store.list_snapshots()}:
+                logger.error(f"Backup not found: {backup_filename}")
+                return False
+            pre = store.snapshot(DATA_ROOT, databases=databases,
+                                 exclude_dirs=[BACKUP_DIR], exclude=BACKUP_EXCLUDE)
+            logger.info(f"Pre-restore snapshot: {pre['id']}")
+            result = store.restore(backup_filename, databases=databases, in_place=True)
+            failed = [rel for rel, r in result["dbs"].items() if not r["ok"]]
+            if failed:
+                logger.error(f"Restore failed for: {failed}")
+                return False
+            logger.info(f"Restored from: {backup_filename} ({len(result['dbs'])} databases)")
+            return True
+
         backup_path = os.path.join(BACKUP_DIR, backup_filename)
 
         if not os.path.exists(backup_path):
@@ -381,19 +442,33 @@ def restore_from_backup(backup_filename: str) -> bool:
         return False
 
 
+def restore_point_in_time(at: datetime, target_dir: str,
+                          databases: Optional[List[str]] = None) -> Dict:
+    """at 시각 이전의 가장 최근 증분 스냅샷으로 target_dir 에 DB 들을 다시 만든다 (살아 있는 DB 는 그대로)."""
+    return get_store().restore(at=at, databases=databases, target_dir=target_dir)
+
+
 def get_backup_status() -> Dict:
     """백업 상태 조회"""
     try:
         backups = get_backup_list()
         latest = backups[0] if backups else None
+        store = get_store()
 
         return {
             "enabled": True,
             "backup_count": len(backups),
             "latest_backup": latest,
             "backup_dir": BACKUP_DIR,
-            "max_backups": MAX_BACKUPS,
-            "interval_hours": BACKUP_INTERVAL_SECONDS / 3600
+            "max_backups": MAX_SNAPSHOTS,
+            "interval_hours": BACKUP_INTERVAL_SECONDS / 3600,
+            "incremental": {
+                "store_mb": round(store.size_bytes() / (1024 * 1024), 2),
+                # 이 프로세스가 돌린 게 없으면(백업은 워커에서 돈다) 최신 스냅샷에 남은 보고
+                "last_run": ({k: v for k, v in store.last_report.items() if k != "per_db"}
+                             if store.last_report else
+                             next((b.get("report") for b in store.list_snapshots()), None)),
+            },
         }
 
     except Exception as e:
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+입찰 일괄 적용 — BidOptimizationEngine.optimize_all_keywords 의 실행부
+
+예전 흐름은 키워드 하나씩이었다: 광고그룹마다 키워드 조회(순차) → /stats 를 ID 당 1콜
+(다중 ID 는 11001) → 바꿀 키워드마다 GET(nccAdgroupId 확인) + PUT → 감사 행 INSERT 1건.
+키워드 2만 개 계정이면 ncc_write 버킷(초당 5)에서 PUT 만 한 시간 가깝다.
+
+여기서는 세 단계로 나눈다.
+  1. 수집   광고그룹별 키워드는 FETCH_CONCURRENCY 로 병렬. 성과는 리포트 수집기가 쌓은
+            ad_daily_stats 에서 쿼리 한 번(get_entity_totals). 리포트가 STATS_MAX_LAG_DAYS
+            넘게 밀렸으면 /stats 로 폴백하되 묶음을 병렬로 돌린다(속도는 stats 버킷이 잡는다).
+  2. 결정   메모리에서 전부 계산(engine._calculate_optimal_bid). 10원 단위로 맞춘 뒤에도
+            그대로인 키워드는 빼서 빈 PUT 을 보내지 않는다.
+  3. 적용   PUT /ncc/keywords?fields=bidAmt 배열(BULK_MAX=100)을 APPLY_CONCURRENCY 개까지
+            동시에. 묶음이 4xx 면 반으로 나눠 다시 보내 **문제 키워드만** 실패로 남긴다
+            (키워드 하나가 삭제됐다고 99개를 버리지 않는다). 서킷 OPEN·네트워크 오류는
+            나누지 않고 묶음째 실패로 보고한다 — 장애 중에 호출을 불리면 안 된다.
+            성공한 묶음마다 감사 행을 executemany 한 번으로 남긴다.
+
+결과는 run_bid_pass 의 보고 dict — applied(BidChange), failed(키워드별 사유), 호출 수, 단계별 시간.
+"""
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from database.async_db import adb
+from services.ad_stat_mapper import conv_amount_of as _conv_amt, conversions_of as _conv
+from services.naver_ad_service import BidChange, NaverApiCircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+BULK_MAX = 100                      # PUT /ncc/keywords 배열 상한
+APPLY_CONCURRENCY = int(os.environ.get("BID_APPLY_CONCURRENCY", "4"))
+FETCH_CONCURRENCY = int(os.environ.get("BID_FETCH_CONCURRENCY", "6"))
+STATS_CHUNK = 50                    # /stats 폴백 — 태스크 하나가 맡는 ID 수
+STATS_MAX_LAG_DAYS = 2              # 리포트 최신일이 이보다 오래됐으면 /stats 로
+STATS_DAYS = 7
+
+
+@dataclass
+class BidDecision:
+    keyword_id: str
+    ad_group_id: Optional[str]
+    keyword: str
+    old_bid: int
+    new_bid: int
+    reason: str
+    stat: Dict[str, Any] = field(default_factory=dict)
+
+    def item(self) -> Dict[str, Any]:
+        body = {"nccKeywordId": self.keyword_id, "bidAmt": self.new_bid, "useGroupBidAmt": False}
+        if self.ad_group_id:
+            body["nccAdgroupId"] = self.ad_group_id
+        return body
+
+
+def _round_bid(bid: int) -> int:
+    """네이버 입찰가는 10원 단위만 유효(3904). update_keyword_bid 와 같은 보정."""
+    return max(70, round(int(bid) / 10) * 10)
+
+
+# ── 1. 수집 ───────────────────────────────────────────────
+
+async def fetch_keywords(api, ad_group_ids: Optional[List[str]] = None) -> List[dict]:
+    if not ad_group_ids:
+        return await api.get_keywords() or []
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async def one(gid: str) -> List[dict]:
+        async with sem:
+            try:
+                return await api.get_keywords(gid) or []
+            except Exception as e:
+                logger.warning(f"[bid-apply] 키워드 조회 실패 adgroup={gid}: {e}")
+                return []
+
+    out: List[dict] = []
+    for kws in await asyncio.gather(*[one(g) for g in ad_group_ids]):
+        out.extend(kws)
+    return out
+
+
+async def fetch_keyword_stats(api, keyword_ids: List[str], since: str,
+                              until: str) -> Tuple[Dict[str, dict], str]:
+    """(키워드 ID → stat, 출처). 출처는 "report"(ad_daily_stats) 또는 "api"(/stats)."""
+    customer_id = str(getattr(api, "customer_id", "") or "")
+    if customer_id:
+        try:
+            from database import ad_snapshot_db, naver_ad_db
+            totals, latest = await adb(ad_snapshot_db, path=naver_ad_db.DB_PATH).read.get_entity_totals(
+                customer_id, "KEYWORD", since, until)
+            fresh_after = (datetime.strptime(until, "%Y-%m-%d")
+                           - timedelta(days=STATS_MAX_LAG_DAYS)).strftime("%Y-%m-%d")
+            if latest and latest >= fresh_after:
+                return totals, "report"
+        except Exception as e:
+            logger.warning(f"[bid-apply] 리포트 성과 조회 실패 — /stats 로: {e}")
+
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async def chunk(ids: List[str]) -> List[dict]:
+        async with sem:
+            return await api.get_stats("KEYWORD", ids, since, until) or []
+
+    out: Dict[str, dict] = {}
+    chunks = [keyword_ids[i:i + STATS_CHUNK] for i in range(0, len(keyword_ids), STATS_CHUNK)]
+    for rows in await asyncio.gather(*[chunk(c) for c in chunks], return_exceptions=True):
+        if isinstance(rows, Exception):
+            logger.warning(f"[bid-apply] /stats 묶음 실패: {rows}")
+            continue
+        for s in rows:
+            if s.get("id"):
+                out[s["id"]] = s
+    return out, "api"
+
+
+# ── 2. 결정 ───────────────────────────────────────────────
+
+def decide_bids(engine, keywords: List[dict], stats_map: Dict[str, dict]) -> Tuple[List[BidDecision], int]:
+    """(바꿀 키워드 결정 목록, 건너뛴 수). API 호출 없음."""
+    decisions: List[BidDecision] = []
+    skipped = 0
+    for kw in keywords:
+        keyword_id = kw.get("nccKeywordId")
+        current_bid = kw.get("bidAmt", 0)
+        if not keyword_id or current_bid == 0 or kw.get("useGroupBidAmt", True):
+            skipped += 1
+            continue
+        stat = stats_map.get(keyword_id, {})
+        new_bid, reason = engine._calculate_optimal_bid(
+            current_bid=current_bid,
+            impressions=stat.get("impCnt", 0),
+            clicks=stat.get("clkCnt", 0),
+            cost=stat.get("salesAmt", 0),
+            conversions=_conv(stat),
+            revenue=_conv_amt(stat),
+            avg_position=stat.get("avgRnk", 0),
+        )
+        new_bid = _round_bid(new_bid)
+        if new_bid == current_bid:
+            skipped += 1
+            continue
+        decisions.append(BidDecision(
+            keyword_id=keyword_id, ad_group_id=kw.get("nccAdgroupId"),
+            keyword=kw.get("keyword", ""), old_bid=current_bid, new_bid=new_bid,
+            reason=reason, stat=stat,
+        ))
+    return decisions, skipped
+
+
+# ── 3. 적용 ───────────────────────────────────────────────
+
+def _error_text(e: Exception) -> str:
+    return f"{type(e).__name__}: {str(e)[:160]}"
+
+
+async def _put_batch(api, batch: List[BidDecision], calls: List[int]) -> Tuple[List[BidDecision], List[Dict[str, Any]]]:
+    """묶음 하나 PUT. 4xx 면 반으로 나눠 문제 키워드를 좁힌다. (성공, 실패)."""
+    calls[0] += 1
+    try:
+        resp = await api.update_keywords_bid_bulk([d.item() for d in batch])
+    except NaverApiCircuitOpenError:
+        return [], [_failure(d, "circuit_open") for d in batch]
+    except httpx.HTTPStatusError as e:
+        status = e.response.status_code if e.response is not None else 0
+        if 400 <= status < 500 and status != 429 and len(batch) > 1:
+            mid = len(batch) // 2
+            ok_a, bad_a = await _put_batch(api, batch[:mid], calls)
+            ok_b, bad_b = await _put_batch(api, batch[mid:], calls)
+            return ok_a + ok_b, bad_a + bad_b
+        return [], [_failure(d, _error_text(e)) for d in batch]
+    except Exception as e:
+        return [], [_failure(d, _error_text(e)) for d in batch]
+
+    # 응답이 키워드 목록이면 빠진 키워드는 적용 안 된 것이다.
+    if isinstance(resp, list) and resp and isinstance(resp[0], dict) and "nccKeywordId" in resp[0]:
+        got = {r.get("nccKeywordId") for r in resp}
+        ok = [d for d in batch if d.keyword_id in got]
+        return ok, [_failure(d, "missing_in_response") for d in batch if d.keyword_id not in got]
+    return list(batch), []
+
+
+def _failure(d: BidDecision, error: str) -> Dict[str, Any]:
+    return {"keyword_id": d.keyword_id, "keyword": d.keyword, "old_bid": d.old_bid,
+            "new_bid": d.new_bid, "error": error}
+
+
+async def _audit(engine, applied: List[BidDecision]) -> None:
+    """감사 행 기록 — executemany 는 DB 쓰기 스레드에서(묶음 적용 중에 루프를 막지 않게)."""
+    from database import optimization_db
+    user_id = getattr(engine, "user_id", 1)
+    session_id = getattr(engine, "session_id", None)
+    await adb(optimization_db).write.log_optimization_actions([{
+        "user_id": user_id, "platform": "naver_searchad", "action_type": "bid_change",
+        "target_type": "keyword", "target_id": d.keyword_id, "target_name": d.keyword,
+        "old_value": d.old_bid, "new_value": d.new_bid, "reason": d.reason,
+        "impact_estimate": {
+            "impressions": d.stat.get("impCnt", 0),
+            "clicks": d.stat.get("clkCnt", 0),
+            "cost": d.stat.get("salesAmt", 0),
+            "conversions": _conv(d.stat),
+        },
+        "session_id": session_id,
+    } for d in applied])
+
+
+async def apply_bids(engine, decisions: List[BidDecision], *, batch_size: int = BULK_MAX,
+                     concurrency: int = APPLY_CONCURRENCY) -> Dict[str, Any]:
+    """결정들을 bulk PUT 으로 적용. {"applied": [BidDecision], "failed": [...], "calls": int}"""
+    batch_size = max(1, min(BULK_MAX, batch_size))
+    batches = [decisions[i:i + batch_size] for i in range(0, len(decisions), batch_size)]
+    sem = asyncio.Semaphore(max(1, concurrency))
+    calls = [0]
+    applied: List[BidDecision] = []
+    failed: List[Dict[str, Any]] = []
+
+    async def one(batch: List[BidDecision]) -> None:
+        async with sem:
+            ok, bad = await _put_batch(engine.api, batch, calls)
+        applied.extend(ok)
+        failed.extend(bad)
+        if ok:
+            try:
+                await _audit(engine, ok)
+            except Exception as e:
+                logger.warning(f"[bid-apply] 감사 기록 실패({len(ok)}건): {e}")
+
+    await asyncio.gather(*[one(b) for b in batches])
+    return {"applied": applied, "failed": failed, "calls": calls[0]}
+
+
+async def run_bid_pass(engine, ad_group_ids: Optional[List[str]] = None, *,
+                       dry_run: bool = False) -> Dict[str, Any]:
+    """수집 → 결정 → 적용 한 바퀴. 보고 dict 를 돌려준다."""
+    t0 = time.perf_counter()
+    report: Dict[str, Any] = {"keywords": 0, "decisions": 0, "skipped": 0, "applied": [],
+                              "failed": [], "put_calls": 0, "stats_source": None,
+                              "dry_run": dry_run, "timings": {}}
+    keywords = await fetch_keywords(engine.api, ad_group_ids)
+    report["keywords"] = len(keywords)
+    keyword_ids = [kw.get("nccKeywordId") for kw in keywords if kw.get("nccKeywordId")]
+    if not keyword_ids:
+        report["timings"]["fetch"] = round(time.perf_counter() - t0, 3)
+        return report
+
+    end_date = datetime.now().strftime("%Y-%m-%d")
+    start_date = (datetime.now() - timedelta(days=STATS_DAYS)).strftime("%Y-%m-%d")
+    stats_map, report["stats_source"] = await fetch_keyword_stats(
+        engine.api, keyword_ids, start_date, end_date)
+    t1 = time.perf_counter()
+    report["timings"]["fetch"] = round(t1 - t0, 3)
+
+    decisions, report["skipped"] = decide_bids(engine, keywords, stats_map)
+    report["decisions"] = len(decisions)
+    t2 = time.perf_counter()
+    report["timings"]["decide"] = round(t2 - t1, 3)
+    if dry_run or not decisions:
+        return report
+
+    res = await apply_bids(engine, decisions)
+    report["timings"]["apply"] = round(time.perf_counter() - t2, 3)
+    report["put_calls"] = res["calls"]
+    report["failed"] = res["failed"]
+    report["applied"] = [BidChange(keyword_id=d.keyword_id, keyword=d.keyword, old_bid=d.old_bid,
+                                   new_bid=d.new_bid, reason=d.reason) for d in res["applied"]]
+    logger.info(f"[bid-apply] {len(report['applied'])}/{len(decisions)} 적용, "
+                f"실패 {len(res['failed'])}, PUT {res['calls']}콜 "
+                f"(성과 출처 {report['stats_source']}, {report['timings']})")
+    return report
@@ -6,72 +6,29 @@ Memory optimized for low-resource servers (2GB RAM)
 import asyncio
 import re
 import logging
+import time
 from typing import Dict, Optional, Tuple
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
 
-logger = logging.getLogger(__name__)
-
-# Global browser instance for reuse
-_browser: Optional[Browser] = None
-_playwright = None
-
-# 동시 Playwright 요청 제한 (메모리 보호)
-_active_contexts = 0
-_MAX_CONTEXTS = 5  # 최대 동시 컨텍스트 수 (2 → 5로 증가)
+from services import rss_feed
+from services.browser_pool import get_pool
+from services.serp_readiness import ReadinessStats, load_results, record
 
+logger = logging.getLogger(__name__)
 
-async def get_browser() -> Browser:
-    """Get or create browser instance"""
-    global _browser, _playwright
+# 브라우저는 services/browser_pool 이 관리한다(N 브라우저 × M 예열 컨텍스트).
+# 예전의 `_active_contexts` 카운터(넘치면 그냥 포기)는 풀 세마포어(넘치면 대기)로 대체.
+_POOL_NAME = "scraper"
+# scrape_blog_stats 는 분석 요청 경로라 슬롯을 오래 기다리지 않는다(넘치면 예전처럼 포기).
+_STATS_ACQUIRE_TIMEOUT = 20.0
+# 대여 옵션은 풀 도입 전 함수별 설정 그대로다: 블로그 통계는 이미지·폰트에 더해
+# 분석·광고 스크립트도 막고, 포스트 본문·목록 API 는 1280×900 뷰포트, SERP 탭은 차단 없음.
+_TRACKER_URL = r"/(analytics|ads)[^/]*$"
+_COMPACT_VIEWPORT = {"width": 1280, "height": 900}
 
-    # Check if we need to create a new browser
-    need_new_browser = False
 
-    if _browser is None:
-        need_new_browser = True
-    else:
-        try:
-            if not _browser.is_connected():
-                need_new_browser = True
-        except Exception:
-            need_new_browser = True
-
-    if need_new_browser:
-        # Close existing playwright instance if any
-        if _playwright:
-            try:
-                await _playwright.stop()
-            except Exception:
-                pass
-            _playwright = None
-
-        _browser = None
-
-        _playwright = await async_playwright().start()
-        _browser = await _playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--single-process',
-                '--disable-extensions',
-                '--disable-background-networking',
-                '--disable-sync',
-                '--disable-translate',
-                '--no-first-run',
-                '--disable-default-apps',
-                '--disable-popup-blocking',
-                '--disable-background-timer-throttling',
-                '--disable-renderer-backgrounding',
-                '--disable-device-discovery-notifications',
-                '--js-flags=--max-old-space-size=256',  # JS 힙 메모리 제한 256MB
-            ]
-        )
-        logger.info("Browser instance created (memory optimized)")
-
-    return _browser
+def _pool():
+    return get_pool(_POOL_NAME)
 
 
 async def scrape_blog_stats(blog_id: str) -> Dict:
@@ -85,8 +42,6 @@ async def scrape_blog_stats(blog_id: str) -> Dict:
     - BLOCKED: 네이버 차단 (captcha)
     - TIMEOUT: 응답 시간 초과
     """
-    global _active_contexts
-
     stats = {
         "success": False,
         "total_posts": None,
@@ -102,30 +57,11 @@ async def scrape_blog_stats(blog_id: str) -> Dict:
         "error_message": None
     }
 
-    # 동시 요청 제한 체크
-    if _active_contexts >= _MAX_CONTEXTS:
-        logger.warning(f"[Playwright] Too many active contexts ({_active_contexts}), skipping {blog_id}")
-        return stats
-
-    _active_contexts += 1
-    browser = None
-    page = None
-    context = None
-
+    lease = None
     try:
-        browser = await get_browser()
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={"width": 1920, "height": 1080},
-            locale="ko-KR"
-        )
-        page = await context.new_page()
-
-        # Block unnecessary resources for faster loading
-        await page.route("**/*.{png,jpg,jpeg,gif,svg,ico,woff,woff2}", lambda route: route.abort())
-        await page.route("**/analytics*", lambda route: route.abort())
-        await page.route("**/ads*", lambda route: route.abort())
-
+        lease = await _pool().acquire(block_resources=True, timeout=_STATS_ACQUIRE_TIMEOUT,
+                                      block_url=_TRACKER_URL)
+        page = lease.page
         # Visit blog main page
         blog_url = f"https://blog.naver.com/{blog_id}"
         logger.info(f"Scraping blog: {blog_url}")
@@ -411,19 +347,9 @@ async def scrape_blog_stats(blog_id: str) -> Dict:
         logger.error(f"Error scraping blog {blog_id}: {e}")
         import traceback
         logger.debug(traceback.format_exc())
-
     finally:
-        if page:
-            try:
-                await page.close()
-            except:
-                pass
-        if context:
-            try:
-                await context.close()
-            except:
-                pass
-        _active_contexts -= 1
+        if lease is not None:
+            await lease.release()
 
     return stats
 
@@ -439,92 +365,39 @@ async def scrape_blog_posts_content(blog_id: str, limit: int = 10) -> Dict:
         "sample_posts": []
     }
 
-    browser = None
-    page = None
-
     try:
-        browser = await get_browser()
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            viewport={"width": 1920, "height": 1080}
-        )
-        page = await context.new_page()
+        # RSS 는 브라우저가 필요 없다 — services/rss_feed 캐시(조건부 GET) 경유
+        feed = await rss_feed.get_feed(blog_id)
+        if not feed:
+            return result
 
-        # Block images for faster loading
-        await page.route("**/*.{png,jpg,jpeg,gif,svg}", lambda route: route.abort())
+        from datetime import datetime, timezone
 
-        # Get RSS feed
-        rss_url = f"https://rss.blog.naver.com/{blog_id}.xml"
-        await page.goto(rss_url, wait_until="domcontentloaded", timeout=10000)
+        total_length = 0
+        count = 0
 
-        content = await page.content()
+        for item in feed["items"][:limit]:
+            if item["text_length"]:
+                total_length += item["text_length"]
+                count += 1
 
-        # Parse post dates and content lengths
-        from datetime import datetime, timezone
-        import xml.etree.ElementTree as ET
+                result["sample_posts"].append({
+                    "title": item["title"],
+                    "length": item["text_length"]
+                })
 
-        try:
-            # Clean up HTML wrapper
-            xml_start = content.find('<?xml')
-            if xml_start == -1:
-                xml_start = content.find('<rss')
-            if xml_start != -1:
-                xml_content = content[xml_start:]
-                # Remove any trailing HTML
-                xml_end = xml_content.rfind('</rss>')
-                if xml_end != -1:
-                    xml_content = xml_content[:xml_end + 6]
-
-                root = ET.fromstring(xml_content)
-                items = root.findall('.//item')
-
-                total_length = 0
-                count = 0
-
-                for item in items[:limit]:
-                    desc = item.find('description')
-                    if desc is not None and desc.text:
-                        text = re.sub(r'<[^>]+>', '', desc.text)
-                        total_length += len(text)
-                        count += 1
-
-                        result["sample_posts"].append({
-                            "title": item.find('title').text if item.find('title') is not None else "",
-                            "length": len(text)
-                        })
-
-                    # Get most recent post date
-                    pub_date = item.find('pubDate')
-                    if pub_date is not None and pub_date.text and result["recent_activity_days"] is None:
-                        try:
-                            from email.utils import parsedate_to_datetime
-                            post_date = parsedate_to_datetime(pub_date.text)
-                            now = datetime.now(timezone.utc)
-                            result["recent_activity_days"] = (now - post_date).days
-                        except:
-                            pass
+            # Get most recent post date
+            if result["recent_activity_days"] is None:
+                post_date = rss_feed.published_at(item)
+                if post_date is not None:
+                    result["recent_activity_days"] = (datetime.now(timezone.utc) - post_date).days
 
-                if count > 0:
-                    result["avg_post_length"] = total_length // count
-
-        except Exception as e:
-            logger.debug(f"RSS parsing failed: {e}")
+        if count > 0:
+            result["avg_post_length"] = total_length // count
 
     except Exception as e:
         logger.error(f"Error scraping posts for {blog_id}: {e}")
 
-    finally:
-        if page:
-            try:
-                await page.close()
-            except:
-                pass
-        if context:
-            try:
-                await context.close()
-            except:
-                pass
-
     return result
 
 
@@ -549,22 +422,8 @@ async def get_full_blog_analysis(blog_id: str) -> Dict:
 
 
 async def close_browser():
-    """Close browser instance"""
-    global _browser, _playwright
-
-    if _browser:
-        try:
-            await _browser.close()
-        except:
-            pass
-        _browser = None
-
-    if _playwright:
-        try:
-            await _playwright.stop()
-        except:
-            pass
-        _playwright = None
+    """Close the scraper browser pool"""
+    await _pool().close()
 
 
 async def scrape_view_tab_results(keyword: str, limit: int = 20) -> list:
@@ -580,76 +439,22 @@ async def scrape_view_tab_results(keyword: str, limit: int = 20) -> list:
         List of blog results with blog_id, post_url, post_title, etc.
     """
     from urllib.parse import quote
-    global _browser, _playwright
     results = []
-    context = None
-
-    # Retry logic for browser errors
-    max_retries = 2
-    for attempt in range(max_retries):
-        try:
-            browser = await get_browser()
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
-            break  # Success, exit retry loop
-        except Exception as e:
-            logger.warning(f"[Playwright] Browser context error (attempt {attempt + 1}/{max_retries}): {e}")
-            # Reset browser for next attempt
-            _browser = None
-            if _playwright:
-                try:
-                    await _playwright.stop()
-                except:
-                    pass
-                _playwright = None
-            if attempt == max_retries - 1:
-                logger.error(f"[Playwright] Failed to create browser context after {max_retries} attempts")
-                return []
-            await asyncio.sleep(1)
 
+    lease = None
     try:
-
+        lease = await _pool().acquire(block_resources=False)
+        page = lease.page
         encoded_keyword = quote(keyword)
         search_url = f"https://search.naver.com/search.naver?where=view&query={encoded_keyword}"
 
         logger.info(f"[Playwright] Navigating to VIEW tab: {search_url}")
 
-        await page.goto(search_url, wait_until='networkidle', timeout=30000)
-
-        # Wait for search results to load - try multiple selectors
-        try:
-            await page.wait_for_selector('.view_wrap, .api_subject_bx, #main_pack, .lst_view', timeout=10000)
-        except:
-            logger.warning(f"[Playwright] Initial selector not found, continuing anyway")
-
-        await asyncio.sleep(2)  # Additional wait for dynamic content
-
-        # Scroll down multiple times to load more results (lazy loading)
-        # 스크롤 횟수 대폭 증가 (15 → 30) - 더 많은 결과 로드
-        for i in range(30):
-            await page.evaluate(f'window.scrollTo(0, document.body.scrollHeight * {(i+1)/30})')
-            await asyncio.sleep(0.3)
-
-        # Final scroll to absolute bottom
-        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-        await asyncio.sleep(2)
-
-        # "더보기" 버튼이 있으면 클릭하여 더 많은 결과 로드
-        try:
-            more_button = await page.query_selector('a.btn_more, button.btn_more, .api_more_wrap a')
-            if more_button:
-                await more_button.click()
-                await asyncio.sleep(2)
-                # 추가 스크롤 (더 많이)
-                for i in range(10):
-                    await page.evaluate(f'window.scrollTo(0, document.body.scrollHeight * {(i+1)/10})')
-                    await asyncio.sleep(0.3)
-        except:
-            pass
+        # 고정 sleep·30단 스크롤 대신 결과 수가 limit 에 닿거나 더 안 늘 때까지만 기다린다.
+        stats = ReadinessStats(keyword=keyword, tab='VIEW', limit=limit)
+        await load_results(page, search_url, stats)
 
+        t_extract = time.perf_counter()
         # Extract blog post links from VIEW tab using improved JavaScript
         blog_links = await page.evaluate('''() => {
             const results = [];
@@ -763,8 +568,8 @@ async def scrape_view_tab_results(keyword: str, limit: int = 20) -> list:
 
             return results;
         }''')
-
-        await context.close()
+        stats.extract_s = time.perf_counter() - t_extract
+        record(stats)
 
         # Deduplicate and limit results
         seen_urls = set()
@@ -782,22 +587,15 @@ async def scrape_view_tab_results(keyword: str, limit: int = 20) -> list:
 
     except PlaywrightTimeout:
         logger.warning(f"[Playwright] Timeout scraping VIEW tab for: {keyword}")
-        if context:
-            try:
-                await context.close()
-            except:
-                pass
         return []
     except Exception as e:
         logger.error(f"[Playwright] Error scraping VIEW tab: {e}")
         import traceback
         logger.error(traceback.format_exc())
-        if context:
-            try:
-                await context.close()
-            except:
-                pass
         return []
+    finally:
+        if lease is not None:
+            await lease.release()
 
 
 async def scrape_blog_tab_results(keyword: str, limit: int = 20,
@@ -809,86 +607,35 @@ async def scrape_blog_tab_results(keyword: str, limit: int = 20,
     Args:
         keyword: Search keyword
         limit: Maximum number of results to return
-        max_scrolls: 지연로딩 스크롤 횟수(기본 30 = 기존 동작). 상위 10위만 필요한 호출자는
-            낮추면 크게 싸진다 — 스크롤 sleep 만 30×0.3s + 더보기 후 10×0.3s + 4s 라서
-            포화된 CPU 에서는 이 상수가 키워드당 수분을 만든다(2026-07-27 백테스트 420s
-            타임아웃 실측). None/30 이면 기존 호출자 동작 무변경.
+        max_scrolls: 지연로딩 스크롤 라운드 상한(기본 30). 라운드는 결과 수가 늘어나는
+            즉시 끝나고, limit 에 닿거나 더 안 늘면 그 전에 멈춘다(services/serp_readiness).
+            30 미만이면 '더보기' 클릭을 생략한다 — 상위 소수만 필요한 호출자용
+            (2026-07-27 백테스트 420s 타임아웃 실측 당시의 고정 sleep 비용은 사라졌다).
 
     Returns:
         List of blog results with blog_id, post_url, post_title, etc.
     """
     n_scrolls = 30 if max_scrolls is None else max(1, int(max_scrolls))
     from urllib.parse import quote
-    global _browser, _playwright
     results = []
-    context = None
-
-    # Retry logic for browser errors
-    max_retries = 2
-    for attempt in range(max_retries):
-        try:
-            browser = await get_browser()
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
-            break
-        except Exception as e:
-            logger.warning(f"[Playwright] Browser context error (attempt {attempt + 1}/{max_retries}): {e}")
-            _browser = None
-            if _playwright:
-                try:
-                    await _playwright.stop()
-                except:
-                    pass
-                _playwright = None
-            if attempt == max_retries - 1:
-                logger.error(f"[Playwright] Failed to create browser context after {max_retries} attempts")
-                return []
-            await asyncio.sleep(1)
 
+    lease = None
     try:
+        lease = await _pool().acquire(block_resources=False)
+        page = lease.page
         encoded_keyword = quote(keyword)
         search_url = f"https://search.naver.com/search.naver?where=blog&query={encoded_keyword}"
 
         logger.info(f"[Playwright] Navigating to BLOG tab: {search_url}")
 
-        await page.goto(search_url, wait_until='networkidle', timeout=30000)
-
-        # Wait for search results to load
-        try:
-            await page.wait_for_selector('.api_subject_bx, .sp_blog, #main_pack', timeout=10000)
-        except:
-            logger.warning(f"[Playwright] Initial selector not found for BLOG tab, continuing anyway")
-
-        await asyncio.sleep(2)
-
-        # Scroll down multiple times to load more results (lazy loading)
-        # 스크롤 횟수 대폭 증가 (15 → 30) - 더 많은 결과 로드
-        for i in range(n_scrolls):
-            await page.evaluate(f'window.scrollTo(0, document.body.scrollHeight * {(i+1)/n_scrolls})')
-            await asyncio.sleep(0.3)
-
-        # Final scroll to absolute bottom
-        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-        await asyncio.sleep(2)
-
-        # "더보기" 버튼이 있으면 클릭하여 더 많은 결과 로드.
-        # 스크롤을 줄인 호출자(= 상위 소수만 필요)에게는 순수 낭비라 생략한다.
-        if max_scrolls is None or n_scrolls >= 30:
-            try:
-                more_button = await page.query_selector('a.btn_more, button.btn_more, .api_more_wrap a')
-                if more_button:
-                    await more_button.click()
-                    await asyncio.sleep(2)
-                    # 추가 스크롤 (더 많이)
-                    for i in range(10):
-                        await page.evaluate(f'window.scrollTo(0, document.body.scrollHeight * {(i+1)/10})')
-                        await asyncio.sleep(0.3)
-            except:
-                pass
+        # 고정 sleep·스크롤 대신 결과 수가 limit 에 닿거나 더 안 늘 때까지만 기다린다.
+        # max_scrolls 는 이제 라운드 상한이다. 줄인 호출자(= 상위 소수만 필요)에겐
+        # 더보기 클릭도 순수 낭비라 예전처럼 생략한다.
+        stats = ReadinessStats(keyword=keyword, tab='BLOG', limit=limit)
+        await load_results(page, search_url, stats, max_rounds=n_scrolls,
+                           allow_more=max_scrolls is None or n_scrolls >= 30)
 
+        t_extract = time.perf_counter()
         # Extract blog post links using JavaScript - 실제 검색 결과 순서대로 추출
         blog_links = await page.evaluate('''() => {
             const results = [];
@@ -1030,8 +777,8 @@ async def scrape_blog_tab_results(keyword: str, limit: int = 20,
             console.log(`[Scraper] Total extracted: ${results.length} blog posts`);
             return results;
         }''')
-
-        await context.close()
+        stats.extract_s = time.perf_counter() - t_extract
+        record(stats)
 
         # Deduplicate and limit results
         seen_urls = set()
@@ -1052,22 +799,15 @@ async def scrape_blog_tab_results(keyword: str, limit: int = 20,
 
     except PlaywrightTimeout:
         logger.warning(f"[Playwright] Timeout scraping BLOG tab for: {keyword}")
-        if context:
-            try:
-                await context.close()
-            except:
-                pass
         return []
     except Exception as e:
         logger.error(f"[Playwright] Error scraping BLOG tab: {e}")
         import traceback
         logger.error(traceback.format_exc())
-        if context:
-            try:
-                await context.close()
-            except:
-                pass
         return []
+    finally:
+        if lease is not None:
+            await lease.release()
 
 
 async def scrape_post_content_playwright(blog_id: str, post_no: str, keyword: str = "") -> Dict:
@@ -1106,18 +846,10 @@ async def scrape_post_content_playwright(blog_id: str, post_no: str, keyword: st
         "fetch_method": "playwright"
     }
 
-    global _browser, _playwright
-    context = None
-    page = None
-
+    lease = None
     try:
-        browser = await get_browser()
-        context = await browser.new_context(
-            viewport={'width': 1280, 'height': 900},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-        page = await context.new_page()
-
+        lease = await _pool().acquire(block_resources=False, viewport=_COMPACT_VIEWPORT)
+        page = lease.page
         # Navigate to post
         post_url = f"https://blog.naver.com/{blog_id}/{post_no}"
         logger.info(f"[Playwright] Analyzing post: {post_url}")
@@ -1283,16 +1015,8 @@ async def scrape_post_content_playwright(blog_id: str, post_no: str, keyword: st
         import traceback
         logger.debug(traceback.format_exc())
     finally:
-        if page:
-            try:
-                await page.close()
-            except:
-                pass
-        if context:
-            try:
-                await context.close()
-            except:
-                pass
+        if lease is not None:
+            await lease.release()
 
     return post_analysis
 
@@ -1313,21 +1037,10 @@ async def extract_blog_info_from_post(blog_id: str, post_no: str) -> Dict:
         "data_sources": []
     }
 
-    global _browser, _playwright
-    context = None
-    page = None
-
+    lease = None
     try:
-        browser = await get_browser()
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-        page = await context.new_page()
-
-        # Block unnecessary resources
-        await page.route("**/*.{png,jpg,jpeg,gif,svg,ico}", lambda route: route.abort())
-
+        lease = await _pool().acquire(block_resources=True)
+        page = lease.page
         post_url = f"https://blog.naver.com/{blog_id}/{post_no}"
         logger.info(f"[PostPage] Extracting blog info from: {post_url}")
 
@@ -1449,16 +1162,8 @@ async def extract_blog_info_from_post(blog_id: str, post_no: str) -> Dict:
         import traceback
         logger.debug(traceback.format_exc())
     finally:
-        if page:
-            try:
-                await page.close()
-            except:
-                pass
-        if context:
-            try:
-                await context.close()
-            except:
-                pass
+        if lease is not None:
+            await lease.release()
 
     return result
 
@@ -1478,18 +1183,10 @@ async def fetch_post_list_api(blog_id: str) -> Dict:
         "data_sources": []
     }
 
-    global _browser, _playwright
-    context = None
-    page = None
-
+    lease = None
     try:
-        browser = await get_browser()
-        context = await browser.new_context(
-            viewport={'width': 1280, 'height': 900},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        )
-        page = await context.new_page()
-
+        lease = await _pool().acquire(block_resources=False, viewport=_COMPACT_VIEWPORT)
+        page = lease.page
         # Try PostListAsync API
         api_url = f"https://blog.naver.com/PostListAsync.naver?blogId={blog_id}&currentPage=1&countPerPage=10"
         logger.info(f"[PostListAPI] Fetching: {api_url}")
@@ -1514,15 +1211,7 @@ async def fetch_post_list_api(blog_id: str) -> Dict:
     except Exception as e:
         logger.debug(f"[PostListAPI] Error for {blog_id}: {e}")
     finally:
-        if page:
-            try:
-                await page.close()
-            except:
-                pass
-        if context:
-            try:
-                await context.close()
-            except:
-                pass
+        if lease is not None:
+            await lease.release()
 
     return result
@@ -0,0 +1,748 @@
+"""
+Playwright 브라우저 풀 — N 브라우저 × M 예열 컨텍스트
+
+예전 구조의 문제 (blog_scraper.get_browser):
+  - `--single-process` chromium 하나를 모든 스크래핑이 공유했고, 키워드마다
+    new_context → 닫기를 반복했다(컨텍스트 콜드 생성이 매 호출 비용).
+  - 컨텍스트 생성 오류 한 번에 Playwright 전체를 내려서, 같이 돌던 판정·백테스트·
+    지수 스냅샷 조회가 한꺼번에 죽었다.
+  - 동시성 제한은 `_active_contexts` 카운터 하나라 넘치면 대기 없이 그냥 포기했다.
+
+이 모듈:
+  - 풀 하나 = 브라우저 N 개 × 브라우저당 컨텍스트(+페이지) M 개. 동시 사용은
+    asyncio.Semaphore(N×M)로 막고, 넘치면 **기다린다**(acquire_timeout 까지).
+  - `async with pool.page() as page:` 또는 `lease = await pool.acquire()` →
+    `await lease.release()` 로 빌리고 돌려준다. 반납 시 헬스체크(evaluate 왕복 +
+    about:blank + 쿠키 삭제)를 통과한 슬롯만 재사용한다. 실패한 슬롯은 그 컨텍스트만
+    버린다 — 브라우저·다른 슬롯은 건드리지 않는다.
+  - 브라우저 기동·컨텍스트 생성(수 초)은 풀 락 **밖에서** 한다. 락 안에서는 자리만
+    예약하므로, 기동이 도는 동안에도 다른 대여·반납은 막히지 않는다. 동시에 여러
+    대여가 새 브라우저를 원하면 기동은 한 번만 하고 나머지는 그것을 기다린다.
+  - 브라우저는 K 페이지를 처리했거나 프로세스 RSS(브라우저 + 렌더러·GPU 자식 합계)가
+    임계치를 넘으면 **drain** 한다: 새 대여는 새 브라우저로 가고, 빌려 간 페이지가 다
+    돌아오면 그때 닫는다. RSS 는 /proc 에서 읽는다(기동 인자에 넣은 표식으로 브라우저
+    프로세스를 찾는다). /proc 이 없는 환경에서는 슬롯들의 JS 힙 합계로 대신한다.
+  - 이미지·폰트·미디어 차단, 추가 URL 차단 패턴, 뷰포트는 대여 단위 옵션이다
+    (컨텍스트 route 가 슬롯 값을 본다).
+  - 오래 안 쓰인 풀은 브라우저를 닫아 RAM 을 돌려준다(idle_close).
+  - 관리 태스크가 PUBLISH_EVERY 초마다 풀 통계를 공유 캐시에 올린다 — app 이 받은
+    관리자 요청(/api/admin/browser-pools)에서 worker·verdict 의 풀도 보이도록.
+
+격리가 필요한 경로(키워드 판정)는 이름이 다른 풀을 쓴다 — 같은 모듈, 다른 chromium.
+
+사용:
+    from services.browser_pool import get_pool
+    async with get_pool().page(block_resources=True) as page:
+        await page.goto(url)
+"""
+import asyncio
+import logging
+import os
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+POOL_BROWSERS = int(os.environ.get("SCRAPER_POOL_BROWSERS", "1"))
+POOL_CONTEXTS = int(os.environ.get("SCRAPER_POOL_CONTEXTS", "4"))
+# 브라우저 1개가 이만큼 페이지를 처리하면 교체한다(chromium 누적 누수 대비).
+POOL_RECYCLE_PAGES = int(os.environ.get("SCRAPER_POOL_RECYCLE_PAGES", "200"))
+# 브라우저 프로세스 트리(메인 + 렌더러·GPU·유틸리티 자식)의 RSS 합계 임계치(MB). 넘으면 교체.
+POOL_MAX_RSS_MB = float(os.environ.get("SCRAPER_POOL_MAX_RSS_MB", "1024"))
+# /proc 을 못 읽을 때만 쓰는 대체 기준 — 슬롯들의 usedJSHeapSize 합계(MB).
+POOL_MAX_HEAP_MB = float(os.environ.get("SCRAPER_POOL_MAX_HEAP_MB", "384"))
+POOL_IDLE_CLOSE = float(os.environ.get("SCRAPER_POOL_IDLE_CLOSE", "600"))
+POOL_ACQUIRE_TIMEOUT = float(os.environ.get("SCRAPER_POOL_ACQUIRE_TIMEOUT", "90"))
+HEALTH_TIMEOUT = 3.0
+# RSS 측정(/proc 훑기) 최소 간격(초). 반납마다 훑지 않는다.
+RSS_CHECK_EVERY = 10.0
+PUBLISH_EVERY = 30.0
+
+SHARED_NS = "browser_pool"
+KNOWN_POOLS = ("scraper", "verdict")
+
+DEFAULT_USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                      "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
+
+# `--single-process` 는 뺐다 — 렌더러 하나가 죽으면 브라우저 전체가 같이 죽어서
+# 컨텍스트 단위 격리가 의미가 없어진다. 힙 상한은 유지.
+DEFAULT_LAUNCH_ARGS = (
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-translate',
+    '--no-first-run',
+    '--disable-default-apps',
+    '--disable-popup-blocking',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-device-discovery-notifications',
+    '--mute-audio',
+    '--js-flags=--max-old-space-size=256',
+)
+DEFAULT_BLOCK_TYPES = ("image", "font", "media")
+# chromium 은 모르는 스위치를 무시한다. RSS 측정용으로 브라우저 프로세스를 찾는 표식.
+MARKER_SWITCH = "--blrank-pool="
+
+_HEAP_JS = "() => (performance.memory && performance.memory.usedJSHeapSize) || 0"
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class PoolTimeout(Exception):
+    """acquire_timeout 안에 빈 슬롯을 얻지 못함."""
+
+
+# ── 브라우저 프로세스 RSS (/proc) ────────────────────────────────────────────
+
+def _proc_table() -> Dict[int, Tuple[int, bytes]]:
+    """pid → (ppid, cmdline). /proc 이 없으면 빈 dict."""
+    table = {}
+    try:
+        pids = [int(p) for p in os.listdir("/proc") if p.isdigit()]
+    except OSError:
+        return table
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                stat = f.read()
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmdline = f.read()
+        except OSError:
+            continue
+        # comm 에 공백·괄호가 들어갈 수 있어 마지막 ')' 뒤부터 센다: state ppid ...
+        ppid = int(stat[stat.rfind(b")") + 2:].split()[1])
+        table[pid] = (ppid, cmdline)
+    return table
+
+
+def _rss_bytes(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def _browser_rss(marker: str, pid: Optional[int] = None) -> Tuple[Optional[int], Optional[int]]:
+    """표식이 cmdline 에 있는 브라우저 메인 프로세스와 그 자손의 RSS 합계. (pid, bytes)
+
+    찾지 못하면(/proc 없음·이미 종료) (None, None). pid 를 알면 메인 프로세스 탐색을 건너뛴다.
+    """
+    table = _proc_table()
+    if not table:
+        return None, None
+    if pid not in table:
+        needle = marker.encode()
+        pid = None
+        for p, (_, cmdline) in table.items():
+            args = cmdline.split(b"\0")
+            # 렌더러·GPU 자식에게도 스위치가 전달될 수 있다 — --type= 이 없는 것이 메인.
+            if needle in args and not any(a.startswith(b"--type=") for a in args):
+                pid = p
+                break
+        if pid is None:
+            return None, None
+    children: Dict[int, List[int]] = {}
+    for p, (ppid, _) in table.items():
+        children.setdefault(ppid, []).append(p)
+    total, stack = 0, [pid]
+    while stack:
+        p = stack.pop()
+        total += _rss_bytes(p)
+        stack.extend(children.get(p, ()))
+    return pid, total
+
+
+class _Slot:
+    __slots__ = ("context", "page", "owner", "block", "block_url", "viewport",
+                 "uses", "heap", "leased")
+
+    def __init__(self, context, page, owner: "_BrowserEntry"):
+        self.context = context
+        self.page = page
+        self.owner = owner
+        self.block = False
+        self.block_url: Optional[Pattern] = None
+        self.viewport: Optional[Dict] = None
+        self.uses = 0
+        self.heap = 0
+        self.leased = False
+
+
+class _BrowserEntry:
+    __slots__ = ("browser", "seq", "marker", "free", "contexts", "leased", "pages",
+                 "draining", "started", "pid", "rss", "rss_at")
+
+    def __init__(self, browser, seq: int, marker: str):
+        self.browser = browser
+        self.seq = seq
+        self.marker = marker
+        self.free: List[_Slot] = []
+        self.contexts = 0       # 살아 있거나 여는 중인 슬롯 수(대여 중 포함)
+        self.leased = 0         # 대여 중 + 여는 중(예약) — 0 이 돼야 drain 된 브라우저를 닫는다
+        self.pages = 0
+        self.draining = False
+        self.started = time.time()
+        self.pid: Optional[int] = None
+        self.rss: Optional[int] = None
+        self.rss_at = 0.0
+
+    def connected(self) -> bool:
+        try:
+            return self.browser.is_connected()
+        except Exception:
+            return False
+
+    def heap_bytes(self, extra: Sequence[_Slot] = ()) -> int:
+        return sum(s.heap for s in self.free) + sum(s.heap for s in extra)
+
+
+class PageLease:
+    """acquire() 가 돌려주는 대여. `page` 를 쓰고 release() 로 반납한다(두 번 불러도 된다)."""
+
+    __slots__ = ("_pool", "_slot", "page", "_done")
+
+    def __init__(self, pool: "BrowserPool", slot: _Slot):
+        self._pool = pool
+        self._slot = slot
+        self.page = slot.page
+        self._done = False
+
+    async def release(self) -> None:
+        """헬스체크 후 반납. 취소 중인 태스크에서 부르면 헬스체크 없이 떼어 낸다
+        (하드 타임아웃된 호출자를 반납 왕복으로 붙잡지 않는다)."""
+        if self._done:
+            return
+        self._done = True
+        pool, slot = self._pool, self._slot
+        try:
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                pool._detach(slot)
+                return
+            try:
+                await pool._checkin(slot)
+            except asyncio.CancelledError:
+                pool._detach(slot)
+                raise
+        finally:
+            pool._sem.release()
+
+
+class BrowserPool:
+    """N 브라우저 × M 컨텍스트. 인스턴스는 get_pool(name) 으로 얻는다."""
+
+    def __init__(self, name: str, browsers: int = POOL_BROWSERS,
+                 contexts: int = POOL_CONTEXTS,
+                 recycle_pages: int = POOL_RECYCLE_PAGES,
+                 max_rss_mb: float = POOL_MAX_RSS_MB,
+                 max_heap_mb: float = POOL_MAX_HEAP_MB,
+                 idle_close: float = POOL_IDLE_CLOSE,
+                 acquire_timeout: float = POOL_ACQUIRE_TIMEOUT,
+                 launch_args: Sequence[str] = DEFAULT_LAUNCH_ARGS,
+                 block_types: Sequence[str] = DEFAULT_BLOCK_TYPES,
+                 block_default: bool = False,
+                 context_options: Optional[Dict] = None):
+        self.name = name
+        self.browsers = max(1, int(browsers))
+        self.contexts = max(1, int(contexts))
+        self.recycle_pages = max(1, int(recycle_pages))
+        self.max_rss = float(max_rss_mb) * 1024 * 1024
+        self.max_heap = float(max_heap_mb) * 1024 * 1024
+        self.idle_close = float(idle_close)
+        self.acquire_timeout = float(acquire_timeout)
+        self.launch_args = list(launch_args)
+        self.block_types = frozenset(block_types)
+        self.block_default = bool(block_default)
+        self.context_options = dict(context_options or {
+            "viewport": {"width": 1920, "height": 1080},
+            "user_agent": DEFAULT_USER_AGENT,
+            "locale": "ko-KR",
+        })
+        # 루프 바인딩 객체는 첫 사용 때 만든다(모듈 임포트 시점엔 루프가 없을 수 있음).
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._launching: Optional[asyncio.Future] = None
+        self._pw = None
+        self._entries: List[_BrowserEntry] = []
+        self._seq = 0
+        self._last_use = 0.0
+        self._reaper: Optional[asyncio.Task] = None
+        self._counters = {
+            "checkouts": 0, "waited": 0, "wait_seconds": 0.0, "timeouts": 0,
+            "launches": 0, "launch_waits": 0, "recycles": 0, "contexts_opened": 0,
+            "contexts_discarded": 0, "health_failures": 0,
+        }
+
+    # ── 대여 / 반납 ──────────────────────────────────────────────────────────
+
+    def _primitives(self):
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.browsers * self.contexts)
+            self._lock = asyncio.Lock()
+        return self._sem, self._lock
+
+    async def acquire(self, block_resources: Optional[bool] = None,
+                      timeout: Optional[float] = None,
+                      block_url: Union[str, Pattern, None] = None,
+                      viewport: Optional[Dict] = None) -> PageLease:
+        """페이지 하나를 빌린다. 반드시 `await lease.release()` 로 돌려준다.
+
+        block_resources: None 이면 풀 기본값. True 면 block_types(이미지·폰트·미디어)를 abort.
+        timeout: 빈 슬롯 대기 상한(초). 넘기면 PoolTimeout.
+        block_url: 이 정규식에 걸리는 요청 URL 은 리소스 종류와 무관하게 abort.
+        viewport: 이번 대여의 뷰포트. None 이면 풀 기본값(context_options).
+        """
+        sem, _ = self._primitives()
+        t0 = time.monotonic()
+        try:
+            await asyncio.wait_for(sem.acquire(), timeout or self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self._counters["timeouts"] += 1
+            raise PoolTimeout(f"browser pool {self.name!r}: no free slot in "
+                              f"{timeout or self.acquire_timeout}s")
+        waited = time.monotonic() - t0
+        if waited > 0.01:
+            self._counters["waited"] += 1
+            self._counters["wait_seconds"] += waited
+        try:
+            slot = await self._checkout()
+        except BaseException:
+            sem.release()
+            raise
+        lease = PageLease(self, slot)
+        slot.block = self.block_default if block_resources is None else bool(block_resources)
+        slot.block_url = re.compile(block_url) if isinstance(block_url, str) else block_url
+        try:
+            want = viewport or self.context_options.get("viewport")
+            if want and want != slot.viewport:
+                await slot.page.set_viewport_size(want)
+                slot.viewport = dict(want)
+        except BaseException:
+            await lease.release()
+            raise
+        return lease
+
+    @asynccontextmanager
+    async def page(self, block_resources: Optional[bool] = None,
+                   timeout: Optional[float] = None,
+                   block_url: Union[str, Pattern, None] = None,
+                   viewport: Optional[Dict] = None):
+        """acquire() 의 async with 형태. 블록을 빠져나오면 헬스체크 후 반납된다."""
+        lease = await self.acquire(block_resources, timeout, block_url, viewport)
+        try:
+            yield lease.page
+        finally:
+            await lease.release()
+
+    async def _checkout(self) -> _Slot:
+        """빈 슬롯을 고르거나, 자리를 예약하고 락 밖에서 컨텍스트(필요하면 브라우저)를 연다."""
+        _, lock = self._primitives()
+        while True:
+            launching = None
+            async with lock:
+                self._last_use = time.monotonic()
+                self._ensure_reaper()
+                for entry in self._entries:
+                    if not entry.draining and not entry.connected():
+                        self._begin_drain(entry, "disconnected")
+                live = [e for e in self._entries if not e.draining]
+                # 1) 예열된 빈 슬롯
+                for entry in live:
+                    if entry.free:
+                        slot = entry.free.pop()
+                        entry.leased += 1
+                        slot.leased = True
+                        self._counters["checkouts"] += 1
+                        return slot
+                # 2) 자리가 남은 브라우저에 컨텍스트 추가 — 자리만 예약하고 여는 건 락 밖에서
+                entry = min((e for e in live if e.contexts < self.contexts),
+                            key=lambda e: e.contexts, default=None)
+                if entry is not None:
+                    entry.contexts += 1
+                    entry.leased += 1
+                else:
+                    launching = self._launch_future()
+            if launching is not None:
+                # 3) 브라우저 기동(누가 이미 띄우는 중이면 그것을 기다린다) 후 다시 고른다
+                await asyncio.shield(launching)
+                continue
+            slot = await self._open_reserved(entry)
+            slot.leased = True
+            self._counters["checkouts"] += 1
+            return slot
+
+    async def _open_reserved(self, entry: _BrowserEntry) -> _Slot:
+        """예약해 둔 자리(contexts·leased +1)에 슬롯을 연다. 실패하면 예약을 되돌린다."""
+        try:
+            return await self._open_slot(entry)
+        except BaseException:
+            entry.contexts -= 1
+            entry.leased -= 1
+            if entry.draining and entry.leased == 0:
+                asyncio.ensure_future(self._close_entry(entry))
+            raise
+
+    def _launch_future(self) -> asyncio.Future:
+        """진행 중인 브라우저 기동. 없으면 시작한다(락 안에서 부른다 — 기동 자체는 락 밖)."""
+        if self._launching is None or self._launching.done():
+            self._launching = asyncio.ensure_future(self._launch())
+            self._launching.add_done_callback(self._launch_done)
+        else:
+            self._counters["launch_waits"] += 1
+        return self._launching
+
+    def _launch_done(self, fut: asyncio.Future) -> None:
+        if self._launching is fut:
+            self._launching = None
+        if not fut.cancelled():
+            fut.exception()     # 기다리던 호출자가 모두 취소됐어도 "never retrieved" 경고를 막는다
+
+    async def _checkin(self, slot: _Slot) -> None:
+        entry = slot.owner
+        slot.uses += 1
+        entry.pages += 1
+        healthy = await self._health_check(slot)
+        if not healthy:
+            self._counters["health_failures"] += 1
+        await self._measure_rss(entry)
+        _, lock = self._primitives()
+        async with lock:
+            if not slot.leased:
+                return
+            slot.leased = False
+            entry.leased -= 1
+            if not entry.draining:
+                if entry.pages >= self.recycle_pages:
+                    self._begin_drain(entry, f"{entry.pages} pages", close_idle=False)
+                elif entry.rss is not None:
+                    if entry.rss > self.max_rss:
+                        self._begin_drain(entry, f"rss {entry.rss / 1048576:.0f}MB",
+                                          close_idle=False)
+                elif entry.heap_bytes((slot,)) > self.max_heap:
+                    self._begin_drain(
+                        entry, f"heap {entry.heap_bytes((slot,)) / 1048576:.0f}MB",
+                        close_idle=False)
+            if healthy and not entry.draining:
+                entry.free.append(slot)
+                return
+            entry.contexts -= 1
+            close_browser = entry.draining and entry.leased == 0
+        await self._close_slot(slot, "unhealthy" if not healthy else "drain")
+        if close_browser:
+            await self._close_entry(entry)
+
+    async def _health_check(self, slot: _Slot) -> bool:
+        """반납된 슬롯이 다음 대여에 쓸 만한지. 힙 측정도 겸한다."""
+        page = slot.page
+        try:
+            if page.is_closed():
+                return False
+            slot.heap = int(await asyncio.wait_for(page.evaluate(_HEAP_JS), HEALTH_TIMEOUT) or 0)
+            await asyncio.wait_for(page.goto("about:blank"), HEALTH_TIMEOUT)
+            await asyncio.wait_for(slot.context.clear_cookies(), HEALTH_TIMEOUT)
+            return True
+        except Exception as e:
+            logger.debug(f"[pool:{self.name}] health check failed: {e}")
+            return False
+
+    async def _measure_rss(self, entry: _BrowserEntry) -> None:
+        """브라우저 프로세스 트리 RSS 를 갱신한다(RSS_CHECK_EVERY 초에 한 번, 스레드에서)."""
+        now = time.monotonic()
+        if now - entry.rss_at < RSS_CHECK_EVERY:
+            return
+        entry.rss_at = now
+        try:
+            entry.pid, entry.rss = await asyncio.to_thread(_browser_rss, entry.marker, entry.pid)
+        except Exception as e:
+            logger.debug(f"[pool:{self.name}] rss read failed: {e}")
+            entry.rss = None
+
+    def _detach(self, slot: _Slot) -> None:
+        """취소 경로: 락 없이 슬롯을 장부에서 빼고 정리는 백그라운드로 넘긴다
+        (이벤트 루프 단일 스레드라 장부 갱신은 안전하다). 이미 반납된 슬롯이면 무시."""
+        if not slot.leased:
+            return
+        slot.leased = False
+        entry = slot.owner
+        entry.leased -= 1
+        entry.contexts -= 1
+        asyncio.ensure_future(self._close_slot(slot, "cancelled"))
+        if entry.draining and entry.leased == 0:
+            asyncio.ensure_future(self._close_entry(entry))
+
+    # ── 기동 / 정리 ──────────────────────────────────────────────────────────
+
+    async def _launch(self) -> _BrowserEntry:
+        t0 = time.time()
+        self._seq += 1
+        seq = self._seq
+        marker = f"{MARKER_SWITCH}{self.name}-{os.getpid()}-{seq}"
+        browser = await self._start_browser(self.launch_args + [marker])
+        entry = _BrowserEntry(browser, seq, marker)
+        self._entries.append(entry)
+        self._counters["launches"] += 1
+        logger.info(f"[pool:{self.name}] browser #{entry.seq} launched "
+                    f"{round(time.time() - t0, 1)}s")
+        return entry
+
+    async def _start_browser(self, args: List[str]):
+        """chromium 하나를 띄운다. 드라이버(playwright)는 풀이 처음 쓸 때 올린다."""
+        from playwright.async_api import async_playwright
+
+        if self._pw is None:
+            self._pw = await async_playwright().start()
+        try:
+            return await self._pw.chromium.launch(headless=True, args=args)
+        except BaseException:
+            # 드라이버 자체가 죽은 경우 다음 기동에서 새로 띄우도록 버린다.
+            pw, self._pw = self._pw, None
+            try:
+                await pw.stop()
+            except Exception:
+                pass
+            raise
+
+    async def _open_slot(self, entry: _BrowserEntry) -> _Slot:
+        context = await entry.browser.new_context(**self.context_options)
+        try:
+            slot = _Slot(context, None, entry)
+            slot.viewport = self.context_options.get("viewport")
+
+            async def _route(route, request):
+                if slot.block and request.resource_type in self.block_types:
+                    await route.abort()
+                elif slot.block_url is not None and slot.block_url.search(request.url):
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await context.route("**/*", _route)
+            slot.page = await context.new_page()
+        except BaseException:
+            try:
+                await context.close()
+            except Exception:
+                pass
+            raise
+        self._counters["contexts_opened"] += 1
+        return slot
+
+    async def _close_slot(self, slot: _Slot, reason: str) -> None:
+        self._counters["contexts_discarded"] += 1
+        logger.debug(f"[pool:{self.name}] context closed ({reason})")
+        try:
+            await slot.context.close()
+        except Exception:
+            pass
+
+    def _begin_drain(self, entry: _BrowserEntry, reason: str, close_idle: bool = True) -> None:
+        """새 대여를 막고 빈 슬롯을 정리한다. 대여 중인 슬롯은 반납 때 닫힌다.
+
+        close_idle=False 는 호출자(_checkin)가 브라우저 종료를 직접 맡는 경우.
+        """
+        entry.draining = True
+        self._counters["recycles"] += 1
+        logger.info(f"[pool:{self.name}] recycling browser #{entry.seq} ({reason})")
+        free, entry.free = entry.free, []
+        entry.contexts -= len(free)
+        for slot in free:
+            asyncio.ensure_future(self._close_slot(slot, "drain"))
+        if close_idle and entry.leased == 0:
+            asyncio.ensure_future(self._close_entry(entry))
+
+    async def _close_entry(self, entry: _BrowserEntry) -> None:
+        # Playwright 드라이버는 여기서 내리지 않는다 — 교체용 브라우저가 같은 드라이버로
+        # 기동 중일 수 있다. 드라이버는 idle 정리·close() 에서만 내린다.
+        if entry in self._entries:
+            self._entries.remove(entry)
+        try:
+            await entry.browser.close()
+        except Exception:
+            pass
+
+    async def start(self, contexts: Optional[int] = None) -> None:
+        """브라우저 N 개와 브라우저당 컨텍스트를 미리 띄워 둔다(첫 요청 콜드 기동 제거).
+
+        대여와 같은 규칙으로 락 안에서는 자리만 잡고 기동·컨텍스트 생성은 락 밖에서 한다.
+        """
+        per_browser = self.contexts if contexts is None else max(0, min(contexts, self.contexts))
+        _, lock = self._primitives()
+        while True:
+            async with lock:
+                self._last_use = time.monotonic()
+                self._ensure_reaper()
+                live = [e for e in self._entries if not e.draining]
+                launching = self._launch_future() if len(live) < self.browsers else None
+                if launching is None:
+                    entry = next((e for e in live if e.contexts < per_browser), None)
+                    if entry is None:
+                        return
+                    entry.contexts += 1
+                    entry.leased += 1
+            if launching is not None:
+                await asyncio.shield(launching)
+                continue
+            slot = await self._open_reserved(entry)
+            async with lock:
+                entry.leased -= 1
+                if entry.draining:
+                    entry.contexts -= 1
+                    close_browser = entry.leased == 0
+                else:
+                    entry.free.append(slot)
+                    continue
+            await self._close_slot(slot, "drain")
+            if close_browser:
+                await self._close_entry(entry)
+
+    async def recycle(self, reason: str = "manual") -> None:
+        """모든 브라우저를 drain 한다. 매달린 페이지가 있어도 호출자를 막지 않는다."""
+        _, lock = self._primitives()
+        async with lock:
+            for entry in list(self._entries):
+                if not entry.draining:
+                    self._begin_drain(entry, reason)
+
+    async def close(self) -> None:
+        """대여 여부와 무관하게 즉시 전부 닫는다(프로세스 종료용)."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        if self._launching is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(self._launching), HEALTH_TIMEOUT)
+            except BaseException:
+                pass
+        entries, self._entries = self._entries, []
+        for entry in entries:
+            try:
+                await entry.browser.close()
+            except Exception:
+                pass
+        if self._pw is not None:
+            pw, self._pw = self._pw, None
+            try:
+                await pw.stop()
+            except Exception:
+                pass
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.ensure_future(self._reaper_loop())
+
+    async def _reaper_loop(self) -> None:
+        """통계를 공유 캐시에 올리고, 오래 안 쓰인 브라우저를 닫아 RAM 을 돌려준다."""
+        tick = min(PUBLISH_EVERY, self.idle_close) if self.idle_close > 0 else PUBLISH_EVERY
+        while True:
+            await asyncio.sleep(tick)
+            await asyncio.to_thread(_publish, self.name, self.stats())
+            if self.idle_close <= 0:
+                continue
+            if not self._entries or time.monotonic() - self._last_use < self.idle_close:
+                continue
+            if any(e.leased for e in self._entries) or self._launching is not None:
+                continue
+            logger.info(f"[pool:{self.name}] idle {self.idle_close:.0f}s — closing browsers")
+            await self.recycle("idle")
+            await asyncio.sleep(HEALTH_TIMEOUT)
+            _, lock = self._primitives()
+            async with lock:
+                if not self._entries and self._launching is None and self._pw is not None:
+                    pw, self._pw = self._pw, None
+                    try:
+                        await pw.stop()
+                    except Exception:
+                        pass
+
+    # ── 진단 ─────────────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict:
+        return {
+            "name": self.name,
+            "pid": os.getpid(),
+            "browsers": self.browsers,
+            "contexts_per_browser": self.contexts,
+            "max_rss_mb": round(self.max_rss / 1048576),
+            "launching": self._launching is not None,
+            "live_browsers": [
+                {"seq": e.seq, "pid": e.pid, "draining": e.draining, "contexts": e.contexts,
+                 "leased": e.leased, "free": len(e.free), "pages": e.pages,
+                 "rss_mb": None if e.rss is None else round(e.rss / 1048576, 1),
+                 "heap_mb": round(e.heap_bytes() / 1048576, 1),
+                 "age_s": round(time.time() - e.started)}
+                for e in self._entries
+            ],
+            **{k: (round(v, 3) if isinstance(v, float) else v)
+               for k, v in self._counters.items()},
+        }
+
+
+_POOLS: Dict[str, BrowserPool] = {}
+
+
+def get_pool(name: str = "scraper", **options) -> BrowserPool:
+    """이름별 풀 싱글턴. options 는 처음 만들 때만 적용된다."""
+    pool = _POOLS.get(name)
+    if pool is None:
+        pool = _POOLS[name] = BrowserPool(name, **options)
+    return pool
+
+
+async def prewarm(name: str = "scraper", contexts: Optional[int] = 1) -> None:
+    """풀을 미리 띄운다(lifespan 에서 백그라운드로). 실패해도 첫 대여 때 다시 시도한다."""
+    try:
+        await get_pool(name).start(contexts)
+        logger.info(f"[pool:{name}] prewarmed")
+    except Exception as e:
+        logger.warning(f"[pool:{name}] prewarm failed (요청 시 다시 시도): {e}")
+
+
+def pool_stats() -> List[Dict]:
+    return [p.stats() for p in _POOLS.values()]
+
+
+def _publish(name: str, stats: Dict) -> None:
+    try:
+        from services.loop_monitor import process_name
+        from services.shared_cache import get_backend
+        backend = get_backend()
+        if backend is None:
+            return
+        stats["process"] = process_name()
+        stats["published_at"] = round(time.time(), 1)
+        backend.set(SHARED_NS, f"{stats['process']}:{name}", stats, ttl=PUBLISH_EVERY * 4)
+    except Exception as e:
+        logger.debug(f"[pool:{name}] publish failed: {e}")
+
+
+def published_pool_stats() -> List[Dict]:
+    """각 프로세스가 공유 캐시에 올린 풀 통계. 최근 PUBLISH_EVERY×4 초 안의 것만."""
+    try:
+        from services.loop_monitor import PROCESS_NAMES
+        from services.shared_cache import get_backend
+        backend = get_backend()
+    except Exception:
+        backend = None
+    if backend is None:
+        return []
+    out = []
+    for proc in PROCESS_NAMES:
+        for name in KNOWN_POOLS:
+            found = backend.get(SHARED_NS, f"{proc}:{name}")
+            if found is not None:
+                snap = found[0]
+                snap["age_s"] = round(time.time() - snap.get("published_at", 0), 1)
+                out.append(snap)
+    return out
+
+
+async def close_all_pools() -> None:
+    for pool in list(_POOLS.values()):
+        await pool.close()
@@ -17,6 +17,7 @@ from database.naver_ad_db import (
 )
 from database.registered_keywords_db import get_registered_keywords_db
 from services.naver_ad_service import NaverAdApiClient, KeywordSuggestion
+from services.naver_rate_governor import background_job
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +28,6 @@ DEFAULT_KEYWORDS_PER_AD_GROUP = 1000   # 10만 한도 효율 위해 1000 default
 MAX_AD_GROUPS_PER_CAMPAIGN = 1000      # 캠페인당 광고그룹 한도
 MAX_KEYWORDS_PER_ACCOUNT = 100_000     # 계정당 키워드 총합 하드 리밋
 KEYWORD_BATCH_SIZE = 100               # API 한 번에 보낼 키워드 수
-API_RATE_LIMIT_DELAY = 0.5             # 호출 간 최소 대기(초)
 
 
 NAVER_ADGROUP_NAME_MAX = 30
@@ -171,10 +171,10 @@ class BulkUploadOrchestrator:
             if not already_has_img:
                 # 다른 그룹에서 imagePath 1콜만 탐색 (전 캠페인 스캔 X — 무거움). 계정의 최근 그룹 ~5개만.
                 from database.registered_keywords_db import get_registered_keywords_db
-                import sqlite3 as _sq
+                from database.connection_pool import pooled
                 reg = get_registered_keywords_db()
                 img_path = None
-                with _sq.connect(reg.db_path, timeout=10.0) as conn:
+                with pooled(reg.db_path, timeout=10.0) as conn:
                     rows = conn.execute(
                         "SELECT DISTINCT ad_group_id FROM registered_keywords "
                         "WHERE account_customer_id=? AND ad_group_id IS NOT NULL AND ad_group_id != ? "
@@ -208,6 +208,11 @@ class BulkUploadOrchestrator:
 
     async def run(self, config: BulkJobConfig, keywords: List[str]) -> Dict[str, Any]:
         """메인 실행 - 키워드 리스트를 받아 캠페인/광고그룹/키워드 자동 생성"""
+        # 호출 간격은 _request 의 ncc_write 버킷이 잡는다 — 사용자 화면 호출보다 뒤에 선다.
+        with background_job():
+            return await self._run(config, keywords)
+
+    async def _run(self, config: BulkJobConfig, keywords: List[str]) -> Dict[str, Any]:
         job_id = config.job_id
         original_total = len(keywords)
         logger.info(f"[Job {job_id}] 대량 등록 시작: {original_total}개 키워드")
@@ -427,7 +432,6 @@ class BulkUploadOrchestrator:
                             logger.warning(
                                 f"[Job {job_id}] 캠페인 이름 중복 → '{campaign_name}'으로 재시도"
                             )
-                            await asyncio.sleep(API_RATE_LIMIT_DELAY)
                             continue
                         else:
                             break  # 다른 에러는 즉시 중단
@@ -445,8 +449,6 @@ class BulkUploadOrchestrator:
                     )
                     return {"success": False, "error": err_str}
 
-                await asyncio.sleep(API_RATE_LIMIT_DELAY)
-
             update_bulk_upload_job(
                 job_id,
                 campaigns_created=len(created_campaigns),
@@ -518,7 +520,6 @@ class BulkUploadOrchestrator:
                         except Exception as _le:
                             logger.warning(f"[Job {job_id}] 기존 그룹 조회 실패: {_le}")
                         ad_group_name = _fit_group_name(ad_group_name, f"_r{_attempt + 1}")
-                        await asyncio.sleep(API_RATE_LIMIT_DELAY)
 
                 if ad_group_id:
                     created_ad_groups.append(ad_group_id)
@@ -547,11 +548,8 @@ class BulkUploadOrchestrator:
                         failed_count=failed,
                         current_step=f"광고그룹 생성 실패: {ad_group_name} - 스킵",
                     )
-                    await asyncio.sleep(API_RATE_LIMIT_DELAY)
                     continue
 
-                await asyncio.sleep(API_RATE_LIMIT_DELAY)
-
                 # P4: 소재 자동 등록 비활성화 (2026-05-22) — 자동 T&D 소재가 의료광고 심의
                 # (심의필 번호 미기재)로 네이버에 거부됨. 소재/확장소재는 사용자가 직접 등록.
                 # 키워드만 등록하고 소재 자동 부착은 하지 않음.
@@ -626,8 +624,6 @@ class BulkUploadOrchestrator:
                             )
                             ag_failed += 1
 
-                    await asyncio.sleep(API_RATE_LIMIT_DELAY)
-
                 # 그룹 결과 누적
                 succeeded += ag_succeeded
                 failed += ag_failed
@@ -46,6 +46,7 @@ from services.exposure_ceiling import (
     RANK_CUTOFF_PAGE1,
     RANK_CUTOFF_INDEXED,
 )
+from services.job_queue import JobQueue
 
 logger = logging.getLogger(__name__)
 
@@ -559,63 +560,51 @@ def start_backtest_task(seeds: List[str], target: int, force: bool = False) -> b
     return True
 
 
-def _req_path() -> str:
-    return os.path.join(_DATA_DIR, "_ceiling_backtest_request.json")
+# 실행요청 큐 — services/job_queue. 실행 자체(수시간)는 원장 문서·하트비트가 추적하고,
+# 큐 job 은 "worker 가 요청을 받아 run 을 시작했다"까지만 나타낸다(claim → 시작 → done).
+REQUESTS = JobQueue("ceiling_backtest", concurrency=None, lease=WATCHDOG_EVERY * 5,
+                    max_attempts=3, keep_done=7 * 86400, poll=WATCHDOG_EVERY)
 
 
 def request_backtest(seeds: List[str], target: int, force: bool) -> Dict:
-    """실행요청을 **디스크에 남긴다**(스크래핑은 worker 가 집어가 실행).
+    """실행요청을 **큐에 남긴다**(스크래핑은 worker 가 집어가 실행).
 
     왜 HTTP 로 worker 를 직접 못 부르나 (2026-07-27 실측): app→worker 오프로드 프록시는
     8s ReadTimeout 후 httpx 클라이언트를 닫는데, 그러면 worker 의 요청이 끊겨 **핸들러가
     아예 실행되지 않는다**(202 만 받고 무실행). 그래서 제어는 공유 볼륨(/data)으로 넘긴다:
-    app 은 작은 요청파일만 쓰고(즉시·안전), worker 워치독이 claim 해서 실행한다.
+    app 은 요청 한 행만 쓰고(즉시·안전), worker 워치독이 claim 해서 실행한다.
+    예전 요청파일처럼 마지막 요청이 이긴다 — 아직 안 집힌 이전 요청은 취소한다.
     """
-    doc = {"seeds": seeds, "target": target, "force": bool(force),
-           "requested_at": time.time(),
-           "requested_at_str": time.strftime("%Y-%m-%d %H:%M:%S"),
-           "claimed_at": None}
-    try:
-        os.makedirs(_DATA_DIR, exist_ok=True)
-        tmp = _req_path() + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(doc, f, ensure_ascii=False)
-        os.replace(tmp, _req_path())
-    except Exception as e:
-        logger.warning(f"[backtest] 요청파일 기록 실패: {e}")
-        return {"queued": False, "error": str(e)[:200]}
+    REQUESTS.cancel_queued("superseded")
+    q = REQUESTS.enqueue({"seeds": seeds, "target": target, "force": bool(force),
+                          "requested_at_str": time.strftime("%Y-%m-%d %H:%M:%S")})
+    if not q["queued"]:
+        logger.warning(f"[backtest] 요청 적재 실패: {q.get('reason')}")
+        return {"queued": False, "error": q.get("error") or q.get("reason")}
     return {"queued": True, "seeds": len(seeds), "target": target, "force": bool(force)}
 
 
 def _claim_request() -> Optional[Dict]:
-    """미처리 요청을 원자적으로 claim(중복 실행 방지). 없으면 None."""
-    try:
-        with open(_req_path(), "r", encoding="utf-8") as f:
-            doc = json.load(f)
-    except Exception:
-        return None
-    if doc.get("claimed_at"):
-        return None
-    doc["claimed_at"] = time.time()
-    try:
-        tmp = _req_path() + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(doc, f, ensure_ascii=False)
-        os.replace(tmp, _req_path())
-    except Exception as e:
-        logger.warning(f"[backtest] claim 기록 실패: {e}")
+    """미처리 요청을 원자적으로 claim(중복 실행 방지). 없으면 None.
+
+    요청 job 은 claim 즉시 done 으로 닫는다 — 그 뒤는 run 문서가 맡는다.
+    """
+    job = REQUESTS.claim()
+    if job is None:
         return None
-    return doc
+    REQUESTS.complete(job["id"])
+    return {**job["payload"], "requested_at": job["enqueued_at"], "claimed_at": job["claimed_at"]}
 
 
 def pending_request() -> Optional[Dict]:
     """아직 실행되지 않은 요청(있으면 status 에 노출)."""
     try:
-        with open(_req_path(), "r", encoding="utf-8") as f:
-            doc = json.load(f)
+        jobs = REQUESTS.jobs(statuses=("queued",), limit=1, newest_first=True)
     except Exception:
         return None
-    return None if doc.get("claimed_at") else doc
+    if not jobs:
+        return None
+    return {**jobs[0]["payload"], "requested_at": jobs[0]["enqueued_at"], "claimed_at": None}
 
 
 def resume_if_interrupted(ignore_stale: bool = False) -> Optional[Dict]:
@@ -652,17 +641,20 @@ async def backtest_watchdog_loop():
     """워커 상주 루프: (1) 새 실행요청 claim, (2) 중단된 run 이어받기.
 
     이게 worker 쪽 유일한 실행 트리거다(HTTP 는 app 에서 끊기므로 신뢰 불가).
-    요청파일은 작아서 60s 주기로 읽어도 공짜. 무거운 원장 재개 판정은 5주기(=5분)에 한 번만.
+    요청은 큐에서 기다린다(같은 프로세스의 적재는 바로, app 의 적재는 WATCHDOG_EVERY 안에).
+    무거운 원장 재개 판정은 5주기(=5분)에 한 번만.
     """
     tick = 0
     while True:
         try:
-            await asyncio.sleep(WATCHDOG_EVERY)
-            tick += 1
             if _run_alive():
+                await asyncio.sleep(WATCHDOG_EVERY)
                 continue
-            req = _claim_request()
-            if req:
+            job = await REQUESTS.next_job(timeout=WATCHDOG_EVERY)
+            tick += 1
+            if job:
+                await REQUESTS.acomplete(job["id"])
+                req = job["payload"]
                 seeds, target = req.get("seeds") or [], int(req.get("target") or 0)
                 if seeds and target and start_backtest_task(seeds, target, bool(req.get("force"))):
                     logger.warning(f"[backtest] 요청 claim→실행: target={target} "
@@ -8,7 +8,8 @@ import asyncio
 import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone
-from bs4 import BeautifulSoup
+
+from services import rss_feed
 
 logger = logging.getLogger(__name__)
 
@@ -23,37 +24,26 @@ DIMENSION_WEIGHTS = {
 }
 
 
-async def fetch_blog_rss_posts(blog_id: str, http_client) -> List[Dict]:
-    """RSS 피드에서 최근 글 목록 가져오기"""
+async def fetch_blog_rss_posts(blog_id: str, http_client=None) -> List[Dict]:
+    """RSS 피드에서 최근 글 목록 가져오기 (services/rss_feed 캐시 경유)
+
+    description 은 태그를 뺀 요약, description_length 는 원문 description 길이.
+    """
     try:
-        rss_url = f"https://rss.blog.naver.com/{blog_id}.xml"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "application/xml, text/xml, */*",
-        }
-        resp = await http_client.get(rss_url, headers=headers, timeout=8.0)
-        if resp.status_code != 200:
+        feed = await rss_feed.get_feed(blog_id, http_client)
+        if not feed:
             return []
-
-        soup = BeautifulSoup(resp.text, "xml")
-        items = soup.find_all("item")
-        posts = []
-        for item in items[:50]:
-            title = item.find("title")
-            description = item.find("description")
-            pub_date = item.find("pubDate")
-            link = item.find("link")
-            category = item.find("category")
-
-            post = {
-                "title": title.get_text(strip=True) if title else "",
-                "description": description.get_text(strip=True) if description else "",
-                "pub_date": pub_date.get_text(strip=True) if pub_date else "",
-                "link": link.get_text(strip=True) if link else "",
-                "category": category.get_text(strip=True) if category else "",
+        return [
+            {
+                "title": item["title"],
+                "description": item["text"],
+                "description_length": item["raw_length"],
+                "pub_date": item["pub_date"],
+                "link": item["link"],
+                "category": item["category"],
             }
-            posts.append(post)
-        return posts
+            for item in feed["items"][:50]
+        ]
     except Exception as e:
         logger.warning(f"RSS fetch failed for {blog_id}: {e}")
         return []
@@ -1015,9 +1005,9 @@ async def run_competitive_analysis(
     if my_posts:
         related_lengths = []
         for post in my_posts[:10]:
-            desc = post.get("description", "")
-            if desc:
-                related_lengths.append(len(desc))
+            desc_len = post.get("description_length") or len(post.get("description", ""))
+            if desc_len:
+                related_lengths.append(desc_len)
         if related_lengths:
             my_avg_length = sum(related_lengths) / len(related_lengths)
 
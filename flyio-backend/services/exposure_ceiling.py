@@ -34,19 +34,14 @@
 """
 
 import asyncio
-import base64
-import hashlib
-import hmac
 import logging
 import statistics
-import time
 from collections import Counter
 from typing import Dict, List, Optional
 
-import httpx
-
-from config import settings
+from services import keyword_volume
 from services.blog_index_verifier import _extract_keywords
+from services.memory_cache import get_cache
 from services.rank_checker import RankChecker
 from routers.content_lifespan import fetch_blog_posts_via_rss
 
@@ -64,7 +59,9 @@ RANK_CONCURRENCY = 5       # openapi 프리필터 동시성
 SCRAPE_CONCURRENCY = 2     # 스크래핑은 무거워 동시성 낮춤(봇탐지·비용)
 _CACHE_TTL = 86400         # 24시간
 
-_CACHE: Dict[str, Dict] = {}
+# 천장 결과는 app / worker 어느 쪽에서 계산했든 양쪽이 같이 쓴다(shared).
+_CACHE = get_cache("exposure_ceiling", max_entries=300, max_bytes=16 * 1024 * 1024,
+                   ttl=_CACHE_TTL, shared="exposure_ceiling")
 
 _DISCLAIMER = (
     "노출 천장은 이 블로그가 최근 글 제목의 키워드로 네이버 블로그 검색에서 "
@@ -73,82 +70,27 @@ _DISCLAIMER = (
 )
 
 
-def _cache_get(blog_id: str) -> Optional[Dict]:
-    c = _CACHE.get(blog_id)
-    if c and time.time() - c["ts"] < _CACHE_TTL:
-        return c["data"]
-    if c:
-        del _CACHE[blog_id]
-    return None
+async def _cache_get(blog_id: str) -> Optional[Dict]:
+    return await _CACHE.aget(blog_id)
 
 
-def _cache_set(blog_id: str, data: Dict):
-    if len(_CACHE) > 300:
-        for k in sorted(_CACHE, key=lambda k: _CACHE[k]["ts"])[:150]:
-            del _CACHE[k]
-    _CACHE[blog_id] = {"data": data, "ts": time.time()}
+async def _cache_set(blog_id: str, data: Dict):
+    await _CACHE.aset(blog_id, data)
 
 
 async def _fetch_volumes(keywords: List[str]) -> Dict[str, int]:
-    """검색광고 /keywordstool 로 키워드별 월 검색량(PC+모바일) 조회.
+    """키워드별 월 검색량(PC+모바일) + 응답에 딸려 온 연관 키워드 검색량.
 
+    services/keyword_volume.related 로 조회한다(서버 설정 계정, 영속 캐시 공유).
     응답의 relKeyword 는 공백이 제거된 형태로 오므로 호출부도 공백 제거로 매칭한다.
     반환에 없는 키워드는 검색량 0 또는 매우 낮음.
     """
-    if not (settings.NAVER_AD_API_KEY and settings.NAVER_AD_SECRET_KEY and settings.NAVER_AD_CUSTOMER_ID):
-        logger.warning("[ceiling] 검색광고 API 미설정 — 검색량 조회 불가")
-        return {}
-
-    def _to_int(v) -> int:
-        if v is None:
-            return 0
-        if isinstance(v, (int, float)):
-            return int(v)
-        s = str(v).replace(",", "").strip()
-        if s in ("< 10", "<10"):
-            return 5
-        try:
-            return int(float(s))
-        except (ValueError, TypeError):
-            return 0
-
+    rows = await keyword_volume.related(keywords)
     out: Dict[str, int] = {}
-    # hintKeywords 는 최대 5개, 공백 불가
-    for i in range(0, len(keywords), 5):
-        batch = [k.replace(" ", "") for k in keywords[i:i + 5] if k.replace(" ", "")]
-        if not batch:
-            continue
-        ts = str(int(time.time() * 1000))
-        uri = "/keywordstool"
-        sig = base64.b64encode(
-            hmac.new(settings.NAVER_AD_SECRET_KEY.encode(),
-                     f"{ts}.GET.{uri}".encode(), hashlib.sha256).digest()
-        ).decode()
-        headers = {
-            "X-Timestamp": ts,
-            "X-API-KEY": settings.NAVER_AD_API_KEY,
-            "X-Customer": settings.NAVER_AD_CUSTOMER_ID,
-            "X-Signature": sig,
-        }
-        try:
-            async with httpx.AsyncClient(follow_redirects=True) as client:
-                resp = await client.get(
-                    "https://api.searchad.naver.com/keywordstool",
-                    headers=headers,
-                    params={"hintKeywords": ",".join(batch), "showDetail": "1"},
-                    timeout=10.0,
-                )
-            if resp.status_code != 200:
-                logger.warning(f"[ceiling] volume batch {resp.status_code} for {batch}")
-                continue
-            for it in resp.json().get("keywordList", []):
-                rel = (it.get("relKeyword") or "").strip().replace(" ", "")
-                if rel and rel not in out:
-                    out[rel] = _to_int(it.get("monthlyPcQcCnt")) + _to_int(it.get("monthlyMobileQcCnt"))
-        except Exception as e:
-            logger.warning(f"[ceiling] volume batch error for {batch}: {e}")
-        # 검색광고 API 레이트리밋 완화
-        await asyncio.sleep(0.2)
+    for rel, vals in rows.items():
+        key = rel.replace(" ", "")
+        if key and key not in out:
+            out[key] = int(vals.get("monthly_total") or 0)
     return out
 
 
@@ -297,7 +239,7 @@ async def measure_exposure_ceiling(
         }
     """
     if use_cache:
-        cached = _cache_get(blog_id)
+        cached = await _cache_get(blog_id)
         if cached:
             return {**cached, "cached": True}
 
@@ -402,7 +344,7 @@ async def measure_exposure_ceiling(
             "candidates": len(candidates),
         },
     )
-    _cache_set(blog_id, data)
+    await _cache_set(blog_id, data)
     return data
 
 
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 그룹별 순위 지표 — Spearman / Kendall / 정확 일치율을 전 그룹 한 번에.
+
+순위 예측은 **같은 키워드 안에서만** 의미가 있다(키워드A 의 1위와 키워드B 의
+1위는 비교 대상이 아니다). 그래서 학습 손실도, 대시보드 정확도도 키워드 그룹마다
+따로 매긴다. 그룹 구성 규칙은 calculate_exact_match_rate_by_keyword 와 같다:
+    - (keyword, blog_id) 중복은 최신 수집분만 남긴다
+    - content_parsed == 0 (본문 읽기 실패) 샘플은 뺀다
+    - 2건 미만 그룹은 지표에서 뺀다
+
+그룹별로 dict 를 만들고 rankdata 를 부르던 것을 정렬 몇 번으로 바꿨다:
+    build_group_index  — (keyword, blog_id, collected_at DESC) 로 한 번 lexsort 해
+                         중복 제거 마스크를 벡터로 만들고, 그룹 안 (i<j) 쌍을 미리 편다.
+                         그룹 순서는 키워드가 처음 나온 순서(예전 dict 와 같음)
+    grouped_metrics    — 점수 한 벌로 전 그룹의 예측 순위·편차·상관계수를 한 번에
+                         (예측 순위는 (그룹, -점수) lexsort 한 번 — 쌍 비교 없이)
+    grouped_rank_loss  — 점수 행렬 (k, n) 을 받아 k 벌의 손실을 한 번에
+                         (기울기 계산의 섭동 k 벌을 그대로 넣는 용도)
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+# 쌍(pair) 행렬이 커지지 않도록 점수 행을 이만큼씩 끊어 처리한다
+_ROW_CHUNK = 8
+
+
+@dataclass
+class GroupIndex:
+    """키워드 그룹 구조. 가중치가 바뀌어도 그대로다."""
+    rows: np.ndarray         # (m,) 지표에 들어가는 샘플 인덱스, 그룹 순으로 정렬
+    group: np.ndarray        # (m,) rows 각각의 그룹 번호 0..G-1
+    starts: np.ndarray       # (G,) 그룹 시작 위치 (rows 기준)
+    sizes: np.ndarray        # (G,) 그룹 크기 (전부 2 이상)
+    keywords: List[str]      # (G,) 그룹 키워드
+    actual: np.ndarray       # (m,) actual_rank
+    actual_avg: np.ndarray   # (m,) 그룹 안 actual_rank 의 평균 순위 (spearman 용)
+    pair_i: np.ndarray       # 그룹 안 모든 (i<j) 쌍 — rows 기준 위치
+    pair_j: np.ndarray
+    pair_starts: np.ndarray  # (G,) 그룹별 쌍 시작 위치
+    pair_sign: np.ndarray    # sign(actual_i - actual_j)
+    n0: np.ndarray           # (G,) 그룹 쌍 수 m(m-1)/2
+    n1: np.ndarray           # (G,) actual 동률 쌍 수
+
+    @property
+    def n_groups(self) -> int:
+        return len(self.sizes)
+
+
+def _codes(values: List) -> np.ndarray:
+    """값 목록 → 정렬 순서를 보존하는 정수 코드. None 은 가장 작은 값."""
+    arr = np.array(['' if v is None else '\x01' + str(v) for v in values], dtype=object)
+    return np.unique(arr, return_inverse=True)[1].astype(np.int64) if len(arr) else np.zeros(0, np.int64)
+
+
+def build_group_index(
+    samples: Sequence[Dict],
+    eligible: Optional[np.ndarray] = None,
+    drop_unparsed: bool = True,
+    min_size: int = 2,
+) -> GroupIndex:
+    """
+    samples → GroupIndex
+
+    eligible      : 중복 제거 **전에** 적용할 bool 마스크 (None 이면 전부)
+    drop_unparsed : 중복 제거 **후** content_parsed == 0 샘플을 뺀다
+    min_size      : 이보다 작은 그룹은 지표에서 뺀다
+
+    같은 (keyword, blog_id) 중 collected_at 이 가장 최근인 행을 남기고, 같으면
+    목록에서 먼저 나온 행을 남긴다 — collected_at DESC 로 온 목록이면
+    "먼저 만난 것" 규칙과 같다.
+    """
+    n = len(samples)
+    pos = np.arange(n, dtype=np.int64)
+    if eligible is not None:
+        pos = pos[np.asarray(eligible, dtype=bool)]
+    sub = [samples[i] for i in pos]
+
+    kw_raw = [s.get('keyword', 'unknown') for s in sub]
+    kw_code = _codes(kw_raw)
+    blog_code = _codes([s.get('blog_id') for s in sub])
+    when_code = _codes([s.get('collected_at') for s in sub])
+
+    # (keyword, blog_id, collected_at DESC, 위치) 로 한 번 정렬 → 각 (keyword, blog_id) 의 첫 행만
+    order = np.lexsort((pos, -when_code, blog_code, kw_code))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = (kw_code[order][1:] != kw_code[order][:-1]) | (blog_code[order][1:] != blog_code[order][:-1])
+    kept = order[first]
+    if drop_unparsed:
+        parsed = np.fromiter((s.get('content_parsed') != 0 for s in sub), dtype=bool, count=len(sub))
+        kept = kept[parsed[kept]]
+
+    # 그룹 크기 필터 후 (그룹, 원래 위치) 순으로 — 그룹 안 동점 처리가 원래 순서를 따르도록.
+    # 그룹 순서는 키워드가 처음 나온 위치 순이다(예전 dict 그룹핑의 삽입 순서와 같다).
+    n_codes = int(kw_code.max()) + 1 if len(kw_code) else 0
+    counts = np.bincount(kw_code[kept], minlength=n_codes)
+    kept = kept[counts[kw_code[kept]] >= max(min_size, 2)]
+    first_seen = np.full(n_codes, n, dtype=np.int64)
+    np.minimum.at(first_seen, kw_code[kept], pos[kept])
+    kept = kept[np.lexsort((pos[kept], first_seen[kw_code[kept]]))]
+
+    uniq, group = np.unique(first_seen[kw_code[kept]], return_inverse=True)
+    group = group.astype(np.int64)
+    sizes = np.bincount(group, minlength=len(uniq)).astype(np.int64)
+    starts = (np.cumsum(sizes) - sizes).astype(np.int64)
+    keywords = [kw_raw[kept[s]] for s in starts]
+    rows = pos[kept]
+    actual = np.array([samples[i].get('actual_rank', 0) or 0 for i in rows], dtype=np.float64)
+    return _index_from_groups(rows, group, starts, sizes, keywords, actual)
+
+
+def _index_from_groups(rows, group, starts, sizes, keywords, actual) -> GroupIndex:
+    # 그룹 안 (i<j) 쌍 — 그룹 크기 종류는 몇 개뿐이라 크기별로 한 번에 만든다
+    n0 = sizes * (sizes - 1) // 2
+    pair_starts = (np.cumsum(n0) - n0).astype(np.int64)
+    pair_i = np.zeros(int(n0.sum()), dtype=np.int64)
+    pair_j = np.zeros_like(pair_i)
+    for size in np.unique(sizes):
+        ii, jj = np.triu_indices(int(size), k=1)
+        sel = np.flatnonzero(sizes == size)
+        dst = (pair_starts[sel][:, None] + np.arange(len(ii))[None, :]).ravel()
+        pair_i[dst] = (starts[sel][:, None] + ii[None, :]).ravel()
+        pair_j[dst] = (starts[sel][:, None] + jj[None, :]).ravel()
+    pair_sign = np.sign(actual[pair_i] - actual[pair_j])
+    n1 = (np.add.reduceat(pair_sign == 0, pair_starts) if len(n0) else np.zeros(0)).astype(np.int64)
+
+    # 그룹 안 actual_rank 의 평균 순위 = 1 + (더 작은 수) + (동률 수)/2
+    m = len(rows)
+    less = np.bincount(pair_i, weights=pair_sign > 0, minlength=m) + np.bincount(pair_j, weights=pair_sign < 0, minlength=m)
+    ties = np.bincount(pair_i, weights=pair_sign == 0, minlength=m) + np.bincount(pair_j, weights=pair_sign == 0, minlength=m)
+    actual_avg = 1.0 + less + ties / 2.0
+
+    return GroupIndex(
+        rows=rows, group=group, starts=starts, sizes=sizes, keywords=keywords,
+        actual=actual, actual_avg=actual_avg,
+        pair_i=pair_i, pair_j=pair_j, pair_starts=pair_starts, pair_sign=pair_sign,
+        n0=n0, n1=n1,
+    )
+
+
+def _ordinal_ranks(index: GroupIndex, S: np.ndarray):
+    """
+    S: rows 기준 점수 (k, m). → (예측 순위 (k, m), 쌍별 sign(p_i - p_j) (k, pairs))
+
+    rankdata(-scores, method='ordinal') 와 같다: 점수가 높을수록 1위, 동점이면
+    먼저 나온 샘플이 앞. rows 는 (그룹, 원래 위치) 순이라 (그룹, -점수) 로 한 번
+    안정 정렬하면 그룹 안 순서가 곧 순위다 — 정렬 위치 - 그룹 시작 + 1.
+    """
+    k, m = S.shape
+    group = np.broadcast_to(index.group, (k, m))
+    order = np.lexsort((-S, group), axis=-1)
+    ranks = np.empty((k, m))
+    np.put_along_axis(ranks, order, (np.arange(m) - index.starts[index.group] + 1.0)[None, :], axis=-1)
+    return ranks, np.where(ranks[:, index.pair_i] < ranks[:, index.pair_j], -1.0, 1.0)
+
+
+def predicted_ranks(index: GroupIndex, scores: np.ndarray) -> np.ndarray:
+    """
+    그룹 안 예측 순위 (높은 점수 = 1위). scores 는 (n,) 또는 (k, n), 결과는 rows 기준 (k, m).
+
+    동점은 rankdata(method='ordinal') 처럼 먼저 나온 샘플이 앞 순위다.
+    """
+    return _ordinal_ranks(index, np.atleast_2d(scores)[:, index.rows])[0]
+
+
+def _grouped_stats(index: GroupIndex, S_all: np.ndarray):
+    """rows 기준 점수 (k, m) → (spearman (k, G), kendall (k, G), 예측 순위 (k, m))"""
+    k, m_rows = S_all.shape
+    G = index.n_groups
+    m = index.sizes.astype(np.float64)
+    if G == 0:
+        return np.zeros((k, 0)), np.zeros((k, 0)), np.zeros((k, 0))
+
+    # Spearman = 순위의 피어슨 상관. 예측 순위는 1..m 순열이라 평균·분산이 닫힌 꼴이다.
+    a = index.actual_avg
+    a_mean = np.add.reduceat(a, index.starts) / m
+    a_var = np.add.reduceat(a * a, index.starts) - m * a_mean ** 2
+    p_mean = (m + 1) / 2
+    p_var = m * (m * m - 1) / 12
+    # Kendall tau-b. 예측 쪽엔 동률이 없으므로 분모는 sqrt((n0 - n1) * n0).
+    k_den = np.sqrt((index.n0 - index.n1) * index.n0.astype(np.float64))
+
+    ranks = np.empty((k, m_rows))
+    cov = np.zeros((k, G))
+    concord = np.zeros((k, G))
+    for lo in range(0, k, _ROW_CHUNK):
+        P, p_sign = _ordinal_ranks(index, S_all[lo:lo + _ROW_CHUNK])
+        ranks[lo:lo + _ROW_CHUNK] = P
+        cov[lo:lo + _ROW_CHUNK] = np.add.reduceat(P * a[None, :], index.starts, axis=1)
+        concord[lo:lo + _ROW_CHUNK] = np.add.reduceat(p_sign * index.pair_sign[None, :], index.pair_starts, axis=1)
+    cov -= (m * a_mean * p_mean)[None, :]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        spearman = cov / np.sqrt(a_var * p_var)[None, :]
+        kendall = concord / k_den[None, :]
+    spearman = np.where(np.isfinite(spearman), spearman, 0.0)
+    kendall = np.where(np.isfinite(kendall), kendall, 0.0)
+    return spearman, kendall, ranks
+
+
+def grouped_correlations(index: GroupIndex, scores: np.ndarray):
+    """그룹별 (spearman, kendall_tau_b). 각각 (k, G), 정의 불가(상수 순위)는 0."""
+    spearman, kendall, _ = _grouped_stats(index, np.atleast_2d(scores)[:, index.rows])
+    return spearman, kendall
+
+
+def summarize_deviations(differences: np.ndarray) -> Dict[str, float]:
+    """순위 편차 배열 → calculate_exact_match_rate 형식의 요약"""
+    if len(differences) == 0:
+        return {
+            'exact_match': 0.0, 'within_1': 0.0, 'within_2': 0.0,
+            'within_3': 0.0, 'avg_deviation': 13.0, 'max_deviation': 13.0
+        }
+    n = len(differences)
+    return {
+        'exact_match': float((differences == 0).sum() / n * 100),
+        'within_1': float((differences <= 1).sum() / n * 100),
+        'within_2': float((differences <= 2).sum() / n * 100),
+        'within_3': float((differences <= 3).sum() / n * 100),
+        'avg_deviation': float(np.mean(differences)),
+        'max_deviation': float(np.max(differences)),
+    }
+
+
+@dataclass
+class GroupMetrics:
+    """점수 한 벌에 대한 전 그룹 지표. 행 단위 배열은 index.rows 순서다."""
+    predicted_rank: np.ndarray  # (m,)
+    deviation: np.ndarray       # (m,) |예측 순위 - actual_rank|
+    spearman: np.ndarray        # (G,)
+    kendall: np.ndarray         # (G,)
+    exact_match: np.ndarray     # (G,) %
+    within_1: np.ndarray        # (G,) %
+    within_3: np.ndarray        # (G,) %
+    avg_deviation: np.ndarray   # (G,)
+    summary: Dict[str, float]   # 전 그룹을 합친 편차 요약 (calculate_exact_match_rate_by_keyword 형식)
+
+
+def grouped_metrics(index: GroupIndex, scores: np.ndarray) -> GroupMetrics:
+    """scores (n,) → 전 그룹 예측 순위 · 편차 · 상관계수 · 적중률 (정렬 한 번)"""
+    spearman, kendall, ranks = _grouped_stats(index, np.asarray(scores, dtype=np.float64)[None, index.rows])
+    P = ranks[0]
+    dev = np.abs(P - index.actual)
+    if index.n_groups:
+        sizes = index.sizes.astype(np.float64)
+        per = lambda x: np.add.reduceat(x.astype(np.float64), index.starts) / sizes * 100  # noqa: E731
+        exact, w1, w3 = per(dev == 0), per(dev <= 1), per(dev <= 3)
+        avg = np.add.reduceat(dev, index.starts) / sizes
+    else:
+        exact = w1 = w3 = avg = np.zeros(0)
+    return GroupMetrics(
+        predicted_rank=P, deviation=dev,
+        spearman=spearman[0], kendall=kendall[0],
+        exact_match=exact, within_1=w1, within_3=w3, avg_deviation=avg,
+        summary=summarize_deviations(dev),
+    )
+
+
+def grouped_rank_loss(index: GroupIndex, scores: np.ndarray) -> np.ndarray:
+    """
+    키워드 그룹별 calculate_rank_loss 의 평균. scores (n,) → 스칼라 배열, (k, n) → (k,).
+
+    그룹 손실 = 1 - (spearman * 0.6 + kendall * 0.4) — calculate_rank_loss 와 같은 배합.
+    지표에 들어갈 그룹이 없으면 1.0(무상관).
+    """
+    k = np.atleast_2d(scores).shape[0]
+    if index.n_groups == 0:
+        out = np.ones(k)
+    else:
+        spearman, kendall = grouped_correlations(index, scores)
+        out = (1.0 - (spearman * 0.6 + kendall * 0.4)).mean(axis=1)
+    return out[0] if np.ndim(scores) == 1 else out
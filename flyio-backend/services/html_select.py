@@ -0,0 +1,220 @@
+"""
+HTML 파싱·CSS 선택 공용 계층 — lxml 백엔드 (BeautifulSoup html.parser 대체)
+
+SERP(~500KB)·블로그 글 페이지를 BeautifulSoup(html, "html.parser") 로 파싱하면
+페이지당 수백 ms 가 순수 파이썬 트리 구축에 든다. 그게 사용자 요청을 받는 같은
+이벤트 루프에서 돌았다. lxml(libxml2) 은 같은 페이지를 수십 배 빨리 만든다.
+
+CSS 선택은 soupsieve 가 bs4 트리 전용이라 못 쓰고, lxml.cssselect 는 별도 패키지
+(cssselect)가 필요하다. 여기서 쓰는 셀렉터는 단순해서(태그·.클래스·#id·속성 비교·
+:not, 자손·자식 결합자, 쉼표 묶음) XPath 로 직접 번역한다. 번역은 셀렉터 문자열당
+한 번(lru_cache) 하고 컴파일된 XPath 를 재사용한다.
+
+    from services.html_select import parse_html, select, select_one, text_of
+    doc = parse_html(html)
+    for c in select(doc, 'div[class*="fds-ugc-single-intention-item-list"]'):
+        for a in select(c, 'a[href*="blog.naver.com"]'):
+            a.get("href", ""), text_of(a)
+
+bs4 와 맞춘 동작:
+  - select(node, css) 는 node 의 **자손** 중 일치하는 것을 문서 순서로 (node 자신 제외).
+    "A B" 의 A 는 node 바깥 조상이어도 된다 (soupsieve 와 같다).
+  - text_of(el) 는 get_text(strip=True) 와 같다 — 텍스트 조각마다 strip, 빈 조각 버림,
+    구분자 없이 이어 붙임. script/style/template 안 글자와 주석은 뺀다.
+:not(단순 셀렉터) 까지는 받는다. 그 밖의 의사 클래스(:nth-child 등)와 ~ + 결합자는 ValueError.
+"""
+import re
+from functools import lru_cache
+from typing import List, Optional
+
+import lxml.html
+from lxml import etree
+
+__all__ = ["parse_html", "select", "select_one", "text_of", "css_to_xpath"]
+
+_EMPTY_DOC = "<html><body></body></html>"
+
+
+def parse_html(html) -> "lxml.html.HtmlElement":
+    """문서 전체를 파싱한다. 빈 문서·인코딩 선언이 붙은 str 도 받는다."""
+    data = html or ""
+    if not data.strip():
+        return lxml.html.document_fromstring(_EMPTY_DOC)
+    try:
+        return lxml.html.document_fromstring(data)
+    except ValueError:
+        # "Unicode strings with encoding declaration are not supported"
+        return lxml.html.document_fromstring(data.encode("utf-8"))
+    except etree.ParserError:
+        return lxml.html.document_fromstring(_EMPTY_DOC)
+
+
+# ── CSS → XPath ──────────────────────────────────────────────
+
+_TOKEN = re.compile(r"""
+    \s*(?P<comb>[>,])\s*
+  | (?P<ws>\s+)
+  | (?P<tag>\*|[A-Za-z][A-Za-z0-9-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | :not\((?P<neg>[^()]*)\)
+  | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[*^$~|]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\]
+""", re.X)
+
+
+def _lit(value: str) -> str:
+    """XPath 문자열 리터럴."""
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    return "concat(" + ", '\"', ".join(f'"{p}"' for p in value.split('"')) + ")"
+
+
+def _word(attr: str, value: str) -> str:
+    return f"contains(concat(' ', normalize-space(@{attr}), ' '), {_lit(' ' + value + ' ')})"
+
+
+def _attr_pred(name: str, op: Optional[str], value: str) -> str:
+    a = f"@{name}"
+    if op is None:
+        return a
+    if op == "=":
+        return f"{a}={_lit(value)}"
+    if not value and op in ("*=", "^=", "$=", "~="):
+        return "false()"       # CSS: 빈 값 부분일치는 아무것도 안 맞는다
+    if op == "*=":
+        return f"contains({a}, {_lit(value)})"
+    if op == "^=":
+        return f"starts-with({a}, {_lit(value)})"
+    if op == "$=":
+        return f"substring({a}, string-length({a}) - {len(value) - 1}) = {_lit(value)}"
+    if op == "~=":
+        return _word(name, value)
+    if op == "|=":
+        return f"({a}={_lit(value)} or starts-with({a}, {_lit(value + '-')}))"
+    raise ValueError(f"지원하지 않는 속성 연산자: {op}")
+
+
+def _parse_group(css: str) -> List[List]:
+    """'A B > C, D' → [[(comp), ' ', (comp), '>', (comp)], [(comp)]]
+    comp = (tag, [predicates])"""
+    groups: List[List] = [[]]
+    cur_tag, cur_preds, have = "*", [], False
+    pending = None
+    css = css.strip()
+    pos, n = 0, len(css)
+
+    def flush():
+        nonlocal cur_tag, cur_preds, have, pending
+        if not have:
+            return
+        if pending:
+            groups[-1].append(pending)
+            pending = None
+        groups[-1].append((cur_tag, cur_preds))
+        cur_tag, cur_preds, have = "*", [], False
+
+    while pos < n:
+        m = _TOKEN.match(css, pos)
+        if not m or m.end() == pos:
+            raise ValueError(f"지원하지 않는 CSS 셀렉터: {css!r} (위치 {pos})")
+        pos = m.end()
+        if m.group("comb"):
+            flush()
+            if m.group("comb") == ",":
+                if not groups[-1]:
+                    raise ValueError(f"빈 셀렉터: {css!r}")
+                groups.append([])
+                pending = None
+            else:
+                pending = ">"
+        elif m.group("ws") is not None:
+            flush()
+            pending = pending or " "
+        elif m.group("tag"):
+            if have:
+                raise ValueError(f"태그 위치 오류: {css!r}")
+            cur_tag, have = m.group("tag").lower(), True
+        elif m.group("id"):
+            cur_preds.append(f"@id={_lit(m.group('id'))}")
+            have = True
+        elif m.group("cls"):
+            cur_preds.append(_word("class", m.group("cls")))
+            have = True
+        elif m.group("neg") is not None:
+            cur_preds.append(_negation(m.group("neg"), css))
+            have = True
+        else:
+            value = next((v for v in (m.group("dq"), m.group("sq"), m.group("bare")) if v is not None), "")
+            cur_preds.append(_attr_pred(m.group("attr").lower(), m.group("op"), value))
+            have = True
+    flush()
+    if not groups[-1]:
+        raise ValueError(f"빈 셀렉터: {css!r}")
+    return groups
+
+
+def _negation(inner: str, css: str) -> str:
+    """:not(단순 셀렉터) — 결합자 없는 한 덩어리만."""
+    groups = _parse_group(inner)
+    if len(groups) != 1 or len(groups[0]) != 1:
+        raise ValueError(f":not() 안에는 단순 셀렉터만: {css!r}")
+    tag, preds = groups[0][0]
+    conds = ([f"self::{tag}"] if tag != "*" else []) + list(preds)
+    return f"not({' and '.join(conds) or 'true()'})"
+
+
+def _step(axis: str, comp) -> str:
+    tag, preds = comp
+    return f"{axis}::{tag}" + "".join(f"[{p}]" for p in preds)
+
+
+def css_to_xpath(css: str) -> str:
+    """CSS 셀렉터 → 컨텍스트 노드 기준 XPath (자손만, 문서 순서)."""
+    parts = []
+    for chain in _parse_group(css):
+        comps = chain[0::2]
+        combs = chain[1::2]
+        # 오른쪽 끝이 선택 대상. 왼쪽 것부터 조상/부모 조건으로 겹겹이 감싼다:
+        # "A > B C" → descendant::C[ancestor::B[parent::A]]
+        cond = ""
+        for i in range(len(comps) - 1):
+            axis = "parent" if combs[i] == ">" else "ancestor"
+            cond = f"[{_step(axis, comps[i])}{cond}]"
+        parts.append(_step("descendant", comps[-1]) + cond)
+    return " | ".join(parts)
+
+
+@lru_cache(maxsize=512)
+def _compiled(css: str) -> etree.XPath:
+    return etree.XPath(css_to_xpath(css))
+
+
+def select(node, css: str) -> list:
+    """bs4 Tag.select 대응 — 자손 중 일치하는 요소, 문서 순서."""
+    if node is None:
+        return []
+    return _compiled(css)(node)
+
+
+def select_one(node, css: str):
+    """bs4 Tag.select_one 대응 — 첫 요소 또는 None."""
+    found = select(node, css)
+    return found[0] if found else None
+
+
+_TEXT = etree.XPath(
+    "descendant-or-self::text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+
+
+def text_of(el, strip: bool = True, separator: str = "") -> str:
+    """bs4 get_text(separator, strip) 대응."""
+    if el is None:
+        return ""
+    chunks = _TEXT(el)
+    if strip:
+        chunks = [c.strip() for c in chunks]
+        chunks = [c for c in chunks if c]
+    return separator.join(chunks)
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+업스트림별 장수 HTTP 클라이언트 레지스트리 (연결 풀 재사용 + 재사용 통계)
+
+analyze_post 는 글 한 건마다 httpx.AsyncClient 를 새로 열었다 — 글마다 blog.naver.com
+TCP+TLS 핸드셰이크. 판정 stage2(블로그 11개 × 글 N개)·배치 학습이 그 지연을 글 수만큼
+냈다. RankChecker 는 따로 aiohttp 세션을, NaverAdApiClient 는 인스턴스마다 클라이언트를
+들고 있었다.
+
+    from services.http_clients import get_client
+    client = get_client("blog")        # 같은 루프 안에서는 늘 같은 클라이언트
+    resp = await client.get(url, headers=..., timeout=...)
+
+업스트림(이름) → 호스트:
+  blog      blog.naver.com, m.blog.naver.com, rss.blog.naver.com
+  search    search.naver.com, m.search.naver.com (SERP HTML)
+  openapi   openapi.naver.com (검색 API)
+  searchad  api.searchad.naver.com (검색광고 API)
+  ac        ac.search.naver.com, ac.shopping.naver.com (자동완성)
+  default   그 밖 (routers/blogs.get_http_client)
+
+- 연결 상한·keep-alive 는 업스트림마다(_PROFILES). 상한은 클라이언트(=업스트림) 단위다.
+- HTTP/2 는 h2 패키지가 있을 때만 켠다(없으면 HTTP/1.1 keep-alive).
+- 닫지 말 것 — 레지스트리가 주인이다. 누가 닫았으면 다음 get_client 가 새로 연다.
+  프로세스 종료 때 close_all().
+- 클라이언트는 이벤트 루프에 묶인다 — 살아 있는 루프마다 하나씩 둔다. 스레드에서 따로 도는
+  루프(auto_learning_service, batch_learning)와 메인 루프가 번갈아 불러도 서로 밀어내지 않는다.
+  루프가 닫히면(스크립트의 asyncio.run 반복) 그 루프의 클라이언트는 버리고 새로 연다.
+  레지스트리는 여러 스레드가 만지므로 threading.Lock 으로 감싼다.
+- 요청 수·새 TCP 연결·TLS 핸드셰이크를 세어 재사용률을 낸다(httpcore trace) →
+  client_stats(), /api/admin/http-clients.
+"""
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+_UA = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+       "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+_PROFILES: Dict[str, Dict[str, Any]] = {
+    "blog": {
+        "timeout": httpx.Timeout(10.0, connect=3.0),
+        "limits": httpx.Limits(max_connections=40, max_keepalive_connections=20, keepalive_expiry=60),
+        "http2": True,
+    },
+    "search": {
+        "timeout": httpx.Timeout(15.0, connect=5.0),
+        "limits": httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+        "http2": True,
+    },
+    "openapi": {
+        "timeout": httpx.Timeout(30.0, connect=5.0),
+        "limits": httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60),
+        "http2": False,
+    },
+    # connect=3s, read=8s — 검색광고 ConnectTimeout 폭주 때 빨리 실패(예전 인스턴스별 설정 유지).
+    # 연결 상한은 예전엔 인스턴스당 5 였다. 이제 계정 전체가 한 풀을 나눠 쓰고,
+    # 속도는 services/naver_rate_governor 가 잡는다.
+    "searchad": {
+        "timeout": httpx.Timeout(connect=3.0, read=8.0, write=8.0, pool=3.0),
+        "limits": httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30),
+        "http2": False,
+    },
+    "ac": {
+        "timeout": httpx.Timeout(8.0, connect=3.0),
+        "limits": httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60),
+        "http2": True,
+    },
+    "default": {
+        "timeout": httpx.Timeout(15.0, connect=5.0),
+        "limits": httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        "http2": True,
+    },
+}
+
+# 루프 → {업스트림 이름 → 클라이언트}. 루프가 GC 되면 항목도 사라진다.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = \
+    weakref.WeakKeyDictionary()
+# 루프 밖(동기 생성자 등)에서 만든 클라이언트 — 첫 요청 때 그 루프에 붙는다
+_loopless: Dict[str, httpx.AsyncClient] = {}
+_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {
+    name: {"clients_opened": 0, "requests": 0, "new_connections": 0, "tls_handshakes": 0,
+           "errors": 0}
+    for name in _PROFILES
+}
+
+
+def _tracer(name: str):
+    st = _stats[name]
+
+    async def trace(event: str, info: Dict[str, Any]) -> None:
+        if event == "connection.connect_tcp.complete":
+            st["new_connections"] += 1
+        elif event == "connection.start_tls.complete":
+            st["tls_handshakes"] += 1
+    return trace
+
+
+def _make(name: str) -> httpx.AsyncClient:
+    profile = _PROFILES[name]
+    trace = _tracer(name)
+    st = _stats[name]
+
+    async def on_request(request: httpx.Request) -> None:
+        st["requests"] += 1
+        request.extensions.setdefault("trace", trace)
+
+    async def on_response(response: httpx.Response) -> None:
+        if response.status_code >= 500:
+            st["errors"] += 1
+
+    st["clients_opened"] += 1
+    return httpx.AsyncClient(
+        timeout=profile["timeout"],
+        limits=profile["limits"],
+        http2=profile["http2"] and _HTTP2,
+        follow_redirects=True,
+        headers={"User-Agent": _UA},
+        event_hooks={"request": [on_request], "response": [on_response]},
+    )
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _evict_closed_loops() -> None:
+    """닫힌 루프의 클라이언트를 버린다. _lock 안에서 부른다.
+
+    닫힌 루프 위의 연결은 다시 쓸 수도, 그 루프에서 aclose() 할 수도 없다 — 소켓은 GC 가 거둔다."""
+    for loop in [lp for lp in _clients.keys() if lp.is_closed()]:
+        _clients.pop(loop, None)
+
+
+def get_client(name: str = "default") -> httpx.AsyncClient:
+    """업스트림 이름별 공용 클라이언트 (살아 있는 루프마다 하나). 모르는 이름은 KeyError."""
+    if name not in _PROFILES:
+        raise KeyError(f"unknown upstream {name!r} (known: {', '.join(_PROFILES)})")
+    loop = _running_loop()
+    with _lock:
+        if loop is None:
+            per_loop = _loopless
+        else:
+            _evict_closed_loops()
+            per_loop = _clients.get(loop)
+            if per_loop is None:
+                per_loop = _clients[loop] = {}
+        client = per_loop.get(name)
+        if client is None or client.is_closed:
+            client = per_loop[name] = _make(name)
+    return client
+
+
+def _entries() -> List[Tuple[Optional[asyncio.AbstractEventLoop], str, httpx.AsyncClient]]:
+    """(루프, 이름, 클라이언트) 목록. _lock 안에서 부른다."""
+    out = [(None, n, c) for n, c in _loopless.items()]
+    for loop, per_loop in list(_clients.items()):
+        out.extend((loop, n, c) for n, c in per_loop.items())
+    return out
+
+
+def client_stats() -> Dict[str, Dict[str, Any]]:
+    with _lock:
+        clients = _entries()
+    out = {}
+    for name, st in _stats.items():
+        reqs = st["requests"]
+        out[name] = {
+            **st,
+            "http2": _PROFILES[name]["http2"] and _HTTP2,
+            "max_connections": _PROFILES[name]["limits"].max_connections,
+            "open": any(n == name and not c.is_closed for _, n, c in clients),
+            # 요청 중 기존 연결을 재사용한 비율 (새 연결 = TCP 연결 완료 횟수)
+            "reuse_ratio": round(1 - min(st["new_connections"], reqs) / reqs, 4) if reqs else None,
+        }
+    return out
+
+
+async def close_all() -> None:
+    """lifespan 종료·스크립트 끝에서 호출. 클라이언트는 각자 자기 루프에서 닫는다."""
+    with _lock:
+        entries = _entries()
+        _clients.clear()
+        _loopless.clear()
+    here = _running_loop()
+    waits = []
+    for loop, _, c in entries:
+        if c.is_closed:
+            continue
+        if loop is None or loop is here:
+            try:
+                await c.aclose()
+            except Exception as e:
+                logger.debug(f"[http] close failed: {e}")
+        elif not loop.is_closed() and loop.is_running():
+            # 다른 스레드에서 도는 루프 — 그 루프에 닫기를 맡기고 잠깐만 기다린다
+            waits.append(asyncio.wrap_future(asyncio.run_coroutine_threadsafe(c.aclose(), loop)))
+    if waits:
+        done, pending = await asyncio.wait(waits, timeout=2.0)
+        for f in done:
+            if f.exception():
+                logger.debug(f"[http] close failed: {f.exception()}")
+        if pending:
+            logger.debug(f"[http] {len(pending)} client(s) on other loops did not close in time")
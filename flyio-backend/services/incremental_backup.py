@@ -0,0 +1,563 @@
+# -*- coding: utf-8 -*-
+"""
+증분 백업 — SQLite 페이지를 조금씩 읽어 바뀐 청크만 압축해 쌓는다
+
+예전 create_backup 은 2시간마다 blog_analyzer.db 하나를 Connection.backup 으로 통째로
+복사했다(≈280MB 읽기 + 280MB 쓰기). 공유 CPU 머신에서 살아 있는 WAL 쓰기와 I/O 를 다퉜고,
+MAX_BACKUPS=3 개가 볼륨을 채워 emergency_cleanup 이 돌았다. /data 의 나머지 DB 는 아예
+백업되지 않았다.
+
+여기서는 /data 아래 모든 *.db 를
+  1. 일관된 시점으로 잡고 (아래 "일관성")
+  2. STEP_PAGES 페이지씩 읽으며 단계마다 쉰다 — 읽은 시간 대비 DUTY 비율만 I/O 를 쓴다
+  3. CHUNK_PAGES 페이지 묶음(청크)마다 blake2b 해시 → 저장소에 이미 있으면 건너뛰고,
+     없으면 zstd(zstandard 가 있으면) 또는 gzip 으로 압축해 chunks/<해시>.{zst,gz} 로 쓴다
+  4. 스냅샷 목록(snapshots/<id>.json)에 DB 별 청크 해시 순서를 남긴다 — 이 파일이
+     마지막에 원자적으로 생겨야 스냅샷이 "있는" 것이다
+청크는 내용 주소라 스냅샷끼리·DB 끼리 공유된다. 바뀌지 않은 페이지는 다시 쓰지 않으므로
+스냅샷을 수십 개 두어도 용량은 "첫 전체 + 변경분" 이다. restore 는 아무 스냅샷이나
+(또는 시각 at 이전의 가장 최근 것) 청크를 이어 붙여 DB 파일을 다시 만든다.
+
+일관성
+  WAL DB   읽기 트랜잭션을 열고 다른 연결로 PASSIVE 체크포인트를 건다. WAL 프레임이 모두
+           DB 파일로 옮겨졌으면(log == checkpointed) 그 순간 파일 = 스냅샷이고, 읽기
+           트랜잭션이 열려 있는 동안 체크포인트는 그 지점을 넘어 파일을 고치지 못한다.
+           쓰기는 막지 않는다(WAL 에 계속 붙는다). 바로 그 사이에 쓰기가 끼면 잠깐 쉬고
+           다시 잡고, SNAPSHOT_ATTEMPTS 번 다 실패하면 sqlite backup API 로 임시 파일에
+           단계 복사한 뒤 그걸 읽는다(method=backup_api).
+  그 외    읽기 잠금(SHARED)은 쓰기 커밋을 막으므로 단계마다 잠그고 풀며, 헤더의 file change
+           counter 가 바뀌었으면 처음부터 다시 읽는다. 마지막 시도는 잠금을 쥔 채 읽는다.
+
+보고(report)는 DB 별·합계로 읽은 바이트, 쓴 바이트(압축 후), 새 청크/재사용 청크,
+읽기·쓰기 I/O 시간, 쉰 시간을 담는다.
+"""
+import fnmatch
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import zstandard
+    _ZSTD = True
+except ImportError:
+    _ZSTD = False
+
+logger = logging.getLogger(__name__)
+
+STEP_PAGES = int(os.environ.get("BACKUP_STEP_PAGES", "256"))       # 한 번에 읽는 페이지 수
+STEP_SLEEP = float(os.environ.get("BACKUP_STEP_SLEEP", "0.01"))    # 단계 사이 최소 휴식(s)
+IO_DUTY = float(os.environ.get("BACKUP_IO_DUTY", "0.5"))           # 읽기에 쓰는 시간 비율 상한
+CHUNK_PAGES = int(os.environ.get("BACKUP_CHUNK_PAGES", "16"))      # 해시·저장 단위 (4KB 페이지면 64KB)
+CODEC = os.environ.get("BACKUP_CODEC", "zstd" if _ZSTD else "gzip")
+SNAPSHOT_ATTEMPTS = 5
+GC_GRACE_SECONDS = 3600   # 이보다 새 청크는 참조가 없어도 안 지운다(다른 프로세스가 쓰는 중일 수 있다)
+
+SQLITE_MAGIC = b"SQLite format 3\x00"
+_EXT = {"zstd": ".zst", "gzip": ".gz"}
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def _decompress(data: bytes, ext: str) -> bytes:
+    if ext == ".zst":
+        if not _ZSTD:
+            raise RuntimeError("zstd 청크인데 zstandard 패키지가 없다")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def _chunk_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def is_sqlite_file(path: str) -> bool:
+    try:
+        with open(path, "rb") as f:
+            return f.read(16) == SQLITE_MAGIC
+    except OSError:
+        return False
+
+
+def find_databases(root: str, exclude_dirs: Iterable[str] = (),
+                   exclude: Iterable[str] = ()) -> List[str]:
+    """root 아래 *.db 중 SQLite 파일만 (root 기준 상대 경로, 정렬)."""
+    skip = [os.path.abspath(d) for d in exclude_dirs]
+    out = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        ab = os.path.abspath(dirpath)
+        dirnames[:] = [d for d in dirnames
+                       if not any(os.path.join(ab, d) == s or os.path.join(ab, d).startswith(s + os.sep)
+                                  for s in skip)]
+        for name in filenames:
+            if not name.endswith(".db"):
+                continue
+            rel = os.path.relpath(os.path.join(dirpath, name), root)
+            if any(fnmatch.fnmatch(rel, pat) for pat in exclude):
+                continue
+            if is_sqlite_file(os.path.join(root, rel)):
+                out.append(rel)
+    return sorted(out)
+
+
+class _Throttle:
+    """단계마다 쉰다 — 방금 I/O 에 쓴 시간이 DUTY 비율을 넘지 않게."""
+
+    def __init__(self, step_sleep: float, duty: float):
+        self.step_sleep = step_sleep
+        self.duty = min(1.0, max(0.05, duty))
+        self.slept = 0.0
+
+    def pause(self, io_seconds: float) -> None:
+        wait = max(self.step_sleep, io_seconds * (1.0 / self.duty - 1.0))
+        if wait > 0:
+            time.sleep(wait)
+            self.slept += wait
+
+
+class BackupStore:
+    """청크 저장소 + 스냅샷 목록. 한 프로세스 안에서는 snapshot/prune/gc 가 서로 기다린다."""
+
+    def __init__(self, store_dir: str):
+        self.dir = store_dir
+        self.chunk_dir = os.path.join(store_dir, "chunks")
+        self.snap_dir = os.path.join(store_dir, "snapshots")
+        self._lock = threading.Lock()
+        self.last_report: Optional[Dict[str, Any]] = None
+
+    def _ensure(self) -> None:
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        os.makedirs(self.snap_dir, exist_ok=True)
+
+    # ── 청크 ─────────────────────────────────────────────
+
+    def _chunk_path(self, h: str, ext: str) -> str:
+        return os.path.join(self.chunk_dir, h[:2], h + ext)
+
+    def _known_chunks(self) -> Dict[str, str]:
+        """해시 → 확장자. 스냅샷마다 한 번 디렉터리를 훑는다."""
+        out: Dict[str, str] = {}
+        if not os.path.isdir(self.chunk_dir):
+            return out
+        for sub in os.listdir(self.chunk_dir):
+            d = os.path.join(self.chunk_dir, sub)
+            if not os.path.isdir(d):
+                continue
+            for name in os.listdir(d):
+                h, ext = os.path.splitext(name)
+                if ext in (".zst", ".gz"):
+                    out[h] = ext
+        return out
+
+    def _write_chunk(self, h: str, data: bytes, codec: str) -> int:
+        ext = _EXT[codec]
+        path = self._chunk_path(h, ext)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        blob = _compress(data, codec)
+        tmp = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+        return len(blob)
+
+    def read_chunk(self, h: str, known: Optional[Dict[str, str]] = None) -> bytes:
+        exts = [known[h]] if known and h in known else [".zst", ".gz"]
+        for ext in exts:
+            path = self._chunk_path(h, ext)
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    return _decompress(f.read(), ext)
+        raise FileNotFoundError(f"청크 없음: {h}")
+
+    # ── 스냅샷 ───────────────────────────────────────────
+
+    def snapshot(self, root: str, databases: Optional[List[str]] = None, *,
+                 exclude_dirs: Iterable[str] = (), exclude: Iterable[str] = (),
+                 step_pages: int = STEP_PAGES, step_sleep: float = STEP_SLEEP,
+                 duty: float = IO_DUTY, chunk_pages: int = CHUNK_PAGES,
+                 codec: str = CODEC) -> Dict[str, Any]:
+        """root 아래 DB 들의 스냅샷 한 벌. 보고 dict(스냅샷 id 포함)를 돌려준다."""
+        if codec == "zstd" and not _ZSTD:
+            codec = "gzip"
+        with self._lock:
+            self._ensure()
+            t0 = time.perf_counter()
+            created = datetime.now()
+            snap_id = created.strftime("%Y%m%d_%H%M%S")
+            n = 1
+            while os.path.exists(os.path.join(self.snap_dir, f"{snap_id}.json")):
+                n += 1
+                snap_id = f"{created.strftime('%Y%m%d_%H%M%S')}_{n}"
+            if databases is None:
+                databases = find_databases(root, exclude_dirs=list(exclude_dirs) + [self.dir],
+                                           exclude=exclude)
+            known = self._known_chunks()
+            throttle = _Throttle(step_sleep, duty)
+            manifest: Dict[str, Any] = {"id": snap_id, "created_at": created.isoformat(),
+                                        "root": os.path.abspath(root), "codec": codec, "dbs": {}}
+            per_db: Dict[str, Dict[str, Any]] = {}
+            for rel in databases:
+                try:
+                    entry, rep = self._snapshot_db(os.path.join(root, rel), known, throttle,
+                                                   step_pages, chunk_pages, codec)
+                except Exception as e:
+                    logger.error(f"[backup] {rel} 스냅샷 실패: {e}")
+                    per_db[rel] = {"error": str(e)}
+                    continue
+                manifest["dbs"][rel] = entry
+                per_db[rel] = rep
+
+            ok = [r for r in per_db.values() if "error" not in r]
+            totals = {k: sum(r[k] for r in ok) for k in
+                      ("bytes_read", "bytes_written", "chunks_new", "chunks_reused")}
+            totals.update({k: round(sum(r[k] for r in ok), 3) for k in ("read_s", "write_s")})
+            totals["io_s"] = round(totals["read_s"] + totals["write_s"], 3)
+            totals["sleep_s"] = round(throttle.slept, 3)
+            totals["wall_s"] = round(time.perf_counter() - t0, 3)
+            totals["logical_bytes"] = sum(e["size"] for e in manifest["dbs"].values())
+            report = {"id": snap_id, "created_at": manifest["created_at"], "codec": codec,
+                      "databases": len(manifest["dbs"]), "failed": len(per_db) - len(ok),
+                      **totals, "per_db": per_db}
+            manifest["report"] = {k: v for k, v in report.items() if k != "per_db"}
+
+            body = json.dumps(manifest, ensure_ascii=False).encode()
+            path = os.path.join(self.snap_dir, f"{snap_id}.json")
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(body)
+            os.replace(tmp, path)
+            report["bytes_written"] += len(body)
+            self.last_report = report
+            logger.info(f"[backup] 스냅샷 {snap_id}: DB {report['databases']}개, "
+                        f"논리 {totals['logical_bytes'] / 1e6:.1f}MB, 씀 {report['bytes_written'] / 1e6:.2f}MB "
+                        f"(새 청크 {totals['chunks_new']}, 재사용 {totals['chunks_reused']}), "
+                        f"I/O {totals['io_s']}s, 쉼 {totals['sleep_s']}s, 전체 {totals['wall_s']}s")
+            return report
+
+    def _snapshot_db(self, path: str, known: Dict[str, str], throttle: _Throttle,
+                     step_pages: int, chunk_pages: int, codec: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0].lower()
+            if mode == "wal":
+                return self._snapshot_wal(conn, path, known, throttle, step_pages, chunk_pages, codec)
+            return self._snapshot_locked(conn, path, known, throttle, step_pages, chunk_pages, codec, mode)
+        finally:
+            conn.close()
+
+    def _begin_wal_snapshot(self, conn: sqlite3.Connection, path: str) -> bool:
+        ck = sqlite3.connect(path, timeout=5, isolation_level=None)
+        try:
+            for attempt in range(SNAPSHOT_ATTEMPTS):
+                ck.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+                conn.execute("BEGIN")
+                conn.execute("SELECT count(*) FROM sqlite_master").fetchone()
+                _busy, log, done = ck.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+                if log == done:
+                    return True
+                conn.execute("ROLLBACK")
+                time.sleep(0.05 * (attempt + 1))
+            return False
+        finally:
+            ck.close()
+
+    def _snapshot_wal(self, conn, path, known, throttle, step_pages, chunk_pages, codec):
+        if self._begin_wal_snapshot(conn, path):
+            try:
+                page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+                page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+                with open(path, "rb") as f:
+                    entry, rep = self._copy_pages(f, page_size, page_count, known, throttle,
+                                                  step_pages, chunk_pages, codec)
+            finally:
+                conn.execute("ROLLBACK")
+            rep["method"] = "wal_snapshot"
+            return entry, rep
+
+        # 쓰기가 끊이지 않아 시점을 못 잡았다 — backup API 로 임시 파일에 단계 복사.
+        tmp = os.path.join(self.dir, f".staging_{uuid.uuid4().hex[:8]}.db")
+        t0 = time.perf_counter()
+        dst = sqlite3.connect(tmp)
+        try:
+            conn.backup(dst, pages=step_pages, sleep=throttle.step_sleep)
+        finally:
+            dst.close()
+        staged_s = time.perf_counter() - t0
+        try:
+            with open(tmp, "rb") as f:
+                hdr = f.read(100)
+                page_size = int.from_bytes(hdr[16:18], "big") or 65536
+                page_count = os.path.getsize(tmp) // page_size
+                f.seek(0)
+                entry, rep = self._copy_pages(f, page_size, page_count, known, throttle,
+                                              step_pages, chunk_pages, codec)
+        finally:
+            os.remove(tmp)
+        rep["method"] = "backup_api"
+        rep["read_s"] = round(rep["read_s"] + staged_s, 4)
+        rep["bytes_staged"] = page_size * page_count
+        return entry, rep
+
+    def _snapshot_locked(self, conn, path, known, throttle, step_pages, chunk_pages, codec, mode):
+        """롤백 저널 DB — 단계마다 SHARED 잠금을 잡았다 놓고, 헤더 change counter 로 변경을 잡는다."""
+        for attempt in range(SNAPSHOT_ATTEMPTS):
+            hold = attempt == SNAPSHOT_ATTEMPTS - 1
+            conn.execute("BEGIN")
+            conn.execute("SELECT count(*) FROM sqlite_master").fetchone()
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            with open(path, "rb") as f:
+                counter = f.read(28)[24:28]
+                state = {"locked": True, "changed": False}
+
+                def relock() -> bool:
+                    if state["locked"]:
+                        return True
+                    conn.execute("BEGIN")
+                    conn.execute("SELECT count(*) FROM sqlite_master").fetchone()
+                    state["locked"] = True
+                    f.seek(24)
+                    if f.read(4) != counter:
+                        state["changed"] = True
+                        return False
+                    return True
+
+                def unlock() -> None:
+                    if not hold and state["locked"]:
+                        conn.execute("ROLLBACK")
+                        state["locked"] = False
+
+                try:
+                    entry, rep = self._copy_pages(f, page_size, page_count, known, throttle,
+                                                  step_pages, chunk_pages, codec,
+                                                  before_step=relock, after_step=unlock)
+                finally:
+                    if state["locked"]:
+                        conn.execute("ROLLBACK")
+            if not state["changed"]:
+                rep["method"] = f"{mode}_stepped" if not hold else f"{mode}_locked"
+                rep["attempts"] = attempt + 1
+                return entry, rep
+        raise RuntimeError("스냅샷 중 DB 가 계속 바뀜")
+
+    def _copy_pages(self, f, page_size: int, page_count: int, known: Dict[str, str],
+                    throttle: _Throttle, step_pages: int, chunk_pages: int, codec: str,
+                    before_step=None, after_step=None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """파일 f 의 1..page_count 페이지를 단계로 읽어 청크로. 단계 경계는 청크 경계에 맞춘다."""
+        step = max(chunk_pages, (step_pages // chunk_pages) * chunk_pages)
+        chunks: List[str] = []
+        rep = {"page_size": page_size, "pages": page_count, "bytes_read": 0, "bytes_written": 0,
+               "chunks_new": 0, "chunks_reused": 0, "read_s": 0.0, "write_s": 0.0}
+        seen_here: Set[str] = set()
+        pg = 0
+        while pg < page_count:
+            if before_step is not None and not before_step():
+                break
+            n = min(step, page_count - pg)
+            t = time.perf_counter()
+            f.seek(pg * page_size)
+            buf = f.read(n * page_size)
+            step_io = time.perf_counter() - t
+            if after_step is not None:
+                after_step()
+            rep["read_s"] += step_io
+            rep["bytes_read"] += len(buf)
+            if len(buf) < n * page_size:
+                buf = buf + b"\x00" * (n * page_size - len(buf))
+            cs = chunk_pages * page_size
+            for off in range(0, len(buf), cs):
+                data = buf[off:off + cs]
+                h = _chunk_hash(data)
+                chunks.append(h)
+                if h in known or h in seen_here:
+                    rep["chunks_reused"] += 1
+                    continue
+                t = time.perf_counter()
+                rep["bytes_written"] += self._write_chunk(h, data, codec)
+                dt = time.perf_counter() - t
+                rep["write_s"] += dt
+                step_io += dt
+                known[h] = _EXT[codec]
+                seen_here.add(h)
+                rep["chunks_new"] += 1
+            pg += n
+            if pg < page_count:
+                throttle.pause(step_io)
+        rep["read_s"] = round(rep["read_s"], 4)
+        rep["write_s"] = round(rep["write_s"], 4)
+        entry = {"page_size": page_size, "page_count": page_count, "size": page_size * page_count,
+                 "chunk_pages": chunk_pages, "chunks": chunks}
+        return entry, rep
+
+    # ── 목록·보존 ────────────────────────────────────────
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """최신 먼저. 청크 목록은 빼고 요약만."""
+        if not os.path.isdir(self.snap_dir):
+            return []
+        out = []
+        for name in sorted(os.listdir(self.snap_dir), reverse=True):
+            if not name.endswith(".json"):
+                continue
+            try:
+                m = self.load(name[:-5])
+            except Exception as e:
+                logger.warning(f"[backup] 스냅샷 목록 읽기 실패 {name}: {e}")
+                continue
+            out.append({"id": m["id"], "created_at": m["created_at"],
+                        "databases": sorted(m["dbs"]), "report": m.get("report", {})})
+        return out
+
+    def load(self, snap_id: str) -> Dict[str, Any]:
+        with open(os.path.join(self.snap_dir, f"{snap_id}.json"), encoding="utf-8") as f:
+            return json.load(f)
+
+    def find(self, at: datetime) -> Optional[str]:
+        """시각 at 이전(같거나)의 가장 최근 스냅샷 id."""
+        for s in self.list_snapshots():
+            if datetime.fromisoformat(s["created_at"]) <= at:
+                return s["id"]
+        return None
+
+    def prune(self, keep: int, max_bytes: Optional[int] = None, min_keep: int = 1) -> Dict[str, Any]:
+        """오래된 스냅샷부터 지워 keep 개 이하로, 저장소가 max_bytes 를 넘으면 min_keep 까지 더.
+        지운 뒤 참조 없는 청크를 정리(gc)한다."""
+        with self._lock:
+            snaps = [s["id"] for s in self.list_snapshots()]
+            removed = []
+            while len(snaps) > max(keep, min_keep):
+                sid = snaps.pop()
+                os.remove(os.path.join(self.snap_dir, f"{sid}.json"))
+                removed.append(sid)
+            freed = self._gc()
+            while max_bytes is not None and len(snaps) > min_keep and self.size_bytes() > max_bytes:
+                sid = snaps.pop()
+                os.remove(os.path.join(self.snap_dir, f"{sid}.json"))
+                removed.append(sid)
+                freed += self._gc()
+            if removed:
+                logger.info(f"[backup] 스냅샷 {len(removed)}개 정리, 청크 {freed / 1e6:.1f}MB 확보")
+            return {"removed": removed, "freed_bytes": freed}
+
+    def gc(self) -> int:
+        with self._lock:
+            return self._gc()
+
+    def _gc(self) -> int:
+        if not os.path.isdir(self.chunk_dir):
+            return 0
+        live: Set[str] = set()
+        for name in os.listdir(self.snap_dir):
+            if name.endswith(".json"):
+                for entry in self.load(name[:-5])["dbs"].values():
+                    live.update(entry["chunks"])
+        freed = 0
+        cutoff = time.time() - GC_GRACE_SECONDS
+        for sub in os.listdir(self.chunk_dir):
+            d = os.path.join(self.chunk_dir, sub)
+            if not os.path.isdir(d):
+                continue
+            for name in os.listdir(d):
+                p = os.path.join(d, name)
+                if name.endswith(".tmp"):
+                    if os.path.getmtime(p) < cutoff:
+                        os.remove(p)
+                    continue
+                if os.path.splitext(name)[0] in live:
+                    continue
+                try:
+                    st = os.stat(p)
+                    if st.st_mtime >= cutoff:
+                        continue
+                    os.remove(p)
+                    freed += st.st_size
+                except OSError:
+                    pass
+        return freed
+
+    def size_bytes(self) -> int:
+        total = 0
+        for dirpath, _dirs, files in os.walk(self.dir):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(dirpath, name))
+                except OSError:
+                    pass
+        return total
+
+    # ── 복원 ────────────────────────────────────────────
+
+    def restore(self, snap_id: Optional[str] = None, *, at: Optional[datetime] = None,
+                databases: Optional[List[str]] = None, target_dir: Optional[str] = None,
+                in_place: bool = False) -> Dict[str, Any]:
+        """스냅샷(또는 at 이전의 가장 최근 것)에서 DB 파일을 다시 만든다.
+
+        target_dir 에 상대 경로 그대로 쓰거나, in_place=True 면 스냅샷의 root 에 있는 살아 있는
+        DB 로 sqlite backup API 를 통해 덮어쓴다(열린 연결·WAL 이 있어도 안전하다).
+        """
+        if snap_id is None:
+            if at is None:
+                snaps = self.list_snapshots()
+                snap_id = snaps[0]["id"] if snaps else None
+            else:
+                snap_id = self.find(at)
+        if snap_id is None:
+            raise FileNotFoundError("복원할 스냅샷이 없다")
+        if not in_place and not target_dir:
+            raise ValueError("target_dir 또는 in_place 가 필요하다")
+        m = self.load(snap_id)
+        known = self._known_chunks()
+        t0 = time.perf_counter()
+        out: Dict[str, Any] = {"id": snap_id, "created_at": m["created_at"], "dbs": {}}
+        for rel, entry in m["dbs"].items():
+            if databases is not None and rel not in databases:
+                continue
+            dest = os.path.join(m["root"] if in_place else target_dir, rel)
+            os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+            tmp = f"{dest}.restore_{uuid.uuid4().hex[:8]}"
+            try:
+                self._rebuild(entry, tmp, known)
+                chk = sqlite3.connect(tmp)
+                try:
+                    ok = chk.execute("PRAGMA quick_check").fetchone()[0] == "ok"
+                    if ok and in_place:
+                        live = sqlite3.connect(dest, timeout=30)
+                        try:
+                            chk.backup(live)
+                        finally:
+                            live.close()
+                finally:
+                    chk.close()
+                if not ok:
+                    raise RuntimeError("quick_check 실패")
+                if not in_place:
+                    for suffix in ("-wal", "-shm"):
+                        if os.path.exists(dest + suffix):
+                            os.remove(dest + suffix)
+                    os.replace(tmp, dest)
+                out["dbs"][rel] = {"path": dest, "bytes": entry["size"], "ok": True}
+            except Exception as e:
+                logger.error(f"[backup] {rel} 복원 실패: {e}")
+                out["dbs"][rel] = {"path": dest, "ok": False, "error": str(e)}
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+        out["seconds"] = round(time.perf_counter() - t0, 3)
+        return out
+
+    def _rebuild(self, entry: Dict[str, Any], dest: str, known: Dict[str, str]) -> None:
+        with open(dest, "wb") as f:
+            for h in entry["chunks"]:
+                f.write(self.read_chunk(h, known))
+            f.truncate(entry["size"])
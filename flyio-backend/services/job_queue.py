@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+작업 큐 엔진 — SQLite 테이블 하나(database/job_queue_db) 위의 이름 붙은 큐들
+
+판정 STAGE 2(keyword_verdict_queue), seed-explode(seed_explode_queue), 천장 백테스트
+실행요청(ceiling_backtest)이 각자 JSON 파일 큐와 워치독·좀비 회수·stale sweep 을 따로
+갖고 있었다. 셋 다 같은 문제(app 이 적재 → worker 가 집어 실행, 죽은 worker 의 job 회수)를
+풀던 것이라 여기로 모았다.
+
+    from services.job_queue import JobQueue, JobFailed
+    Q = JobQueue("kwverdict", concurrency=1, lease=540, max_attempts=2)
+
+    Q.enqueue({"blog_id": ..., "keyword": ...}, dedupe_key="blog/kw", dedupe_window=90)
+    job = Q.claim()                      # 원자적(BEGIN IMMEDIATE) — 프로세스가 여럿이어도 한 번만
+    Q.heartbeat(job["id"], phase="serp") # 리스 연장 + 실행 중 상태 기록
+    Q.complete(job["id"], result)        # 또는 Q.fail(job["id"], err) → 백오프 재시도 / dead
+
+    await Q.run_worker(handler)          # 워커 루프: 기다렸다 claim → handler → complete/fail
+
+  - 이벤트 루프 위에서는 aclaim / aheartbeat / acomplete / afail / abeat 를 쓴다. 같은 일을
+    database/async_db 의 쓰기 스레드에서 한다 — BEGIN IMMEDIATE 가 다른 프로세스의 쓰기 락을
+    busy_timeout 만큼 기다려도 워커 루프는 멈추지 않는다. 동기 메서드는 스크립트·스레드용.
+
+  - 리스: claim 한 job 은 lease 초 동안 그 워커 것. heartbeat 가 늘린다. 워커가 죽어 리스가
+    지나면 다음 claim 이 queued 로 되돌린다(재시도 여력이 있으면). 다 썼으면 dead.
+  - 우선순위: priority 가 큰 것 먼저, 같으면 먼저 들어온 것.
+  - 동시 실행 상한: 큐마다 concurrency. 프로세스가 여럿이어도 테이블 기준으로 센다.
+  - 재시도: fail(retry=True) 는 backoff × 2^(시도-1) (backoff_max 상한) 뒤에 다시 집힌다.
+    JobFailed(retry=False) 나 시도 소진이면 error / dead 로 확정.
+  - 대기: 워커는 asyncio.Condition 에서 잔다. 같은 프로세스의 enqueue·complete 가 바로
+    깨운다(DB 호출은 Condition 밖에서 — 알림은 세대 번호로 놓치지 않는다). 다른 프로세스(app)가 넣은 job 은 poll 초마다 인덱스 조회 한 번으로 확인한다
+    (예전: 2초마다 job 파일 전부 읽기).
+  - 지표: 상태별 개수·깊이·가장 오래 기다린 job·적재→시작 지연 p50/p95 → stats(),
+    /api/admin/job-queues.
+"""
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from database import job_queue_db as db
+from database.async_db import run_db
+
+logger = logging.getLogger(__name__)
+
+STATS_WINDOW = float(os.environ.get("JOB_QUEUE_STATS_WINDOW", "3600"))
+
+_WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+_QUEUES: Dict[str, "JobQueue"] = {}
+
+
+class JobFailed(Exception):
+    """handler 가 실패를 알릴 때. retry=False 면 재시도 없이 error 로 확정한다."""
+
+    def __init__(self, message: str, retry: bool = True):
+        super().__init__(message)
+        self.retry = retry
+
+
+class _State:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.conds: Dict[str, asyncio.Condition] = {}
+        # 큐별 알림 세대 — claim(잠금 밖) 과 wait 사이에 온 알림을 알아챈다
+        self.gens: Dict[str, int] = {}
+
+
+_state: Optional[_State] = None
+
+
+def _get_state() -> _State:
+    """Condition 은 이벤트 루프에 묶인다. 루프가 바뀌면 새로."""
+    global _state
+    loop = asyncio.get_running_loop()
+    if _state is None or _state.loop is not loop:
+        _state = _State(loop)
+    return _state
+
+
+class JobQueue:
+    def __init__(self, name: str, *, concurrency: Optional[int] = 1, lease: float = 300.0,
+                 max_attempts: int = 3, backoff: float = 10.0, backoff_max: float = 600.0,
+                 keep_done: float = 3600.0, max_live: Optional[int] = None, poll: float = 2.0):
+        self.name = name
+        self.concurrency = concurrency
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.keep_done = keep_done
+        self.max_live = max_live
+        self.poll = poll
+        self._purged_at = 0.0
+        self._pending: set = set()   # heartbeat_nowait 로 띄운 기록 — 끝날 때까지 참조를 쥔다
+        _QUEUES[name] = self
+
+    # ── 적재·조회 ──────────────────────────────────────────
+
+    def enqueue(self, payload: Dict[str, Any], *, priority: int = 0,
+                dedupe_key: Optional[str] = None, dedupe_window: float = 0.0,
+                job_id: Optional[str] = None) -> Dict[str, Any]:
+        """{"queued": bool, "job": {...}, "reused": bool, "reason"?: str, "queue_len"?: int}"""
+        job_id = job_id or f"{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}"
+        try:
+            r = db.insert(job_id, self.name, payload, priority=priority, dedupe_key=dedupe_key,
+                          dedupe_window=dedupe_window, max_live=self.max_live,
+                          max_attempts=self.max_attempts)
+        except Exception as e:
+            logger.warning(f"[job-q:{self.name}] enqueue failed: {e}")
+            return {"queued": False, "reason": "write_failed", "error": str(e)[:200]}
+        if r["full"]:
+            return {"queued": False, "reason": "queue_full", "queue_len": r["live"]}
+        if not r["reused"]:
+            self._notify()
+        return {"queued": True, "job": r["job"], "reused": r["reused"],
+                "queue_len": r.get("live")}
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = db.get(job_id)
+        return job if job and job["queue"] == self.name else None
+
+    def jobs(self, statuses=db.LIVE + db.FINISHED, limit: int = 100,
+             newest_first: bool = False) -> List[Dict[str, Any]]:
+        return db.list_jobs(self.name, statuses, limit=limit, newest_first=newest_first)
+
+    def live_count(self, fresh_within: Optional[float] = None) -> int:
+        """queued + running. fresh_within 초 안에 적재·claim 된 것만 셀 수도 있다."""
+        return db.count_live(self.name, None if fresh_within is None else time.time() - fresh_within)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"queue": self.name, "concurrency": self.concurrency, "lease": self.lease,
+                "max_attempts": self.max_attempts, "max_live": self.max_live,
+                **db.stats(self.name, STATS_WINDOW), "worker": db.last_beat(self.name)}
+
+    # ── 워커 쪽 ───────────────────────────────────────────
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """다음 job 을 running 으로(리스 lease 초). 없거나 동시 실행 상한이면 None."""
+        now = time.time()
+        if now - self._purged_at > 60:
+            self._purged_at = now
+            try:
+                db.purge(self.name, older_than=self.keep_done)
+            except Exception as e:
+                logger.debug(f"[job-q:{self.name}] purge failed: {e}")
+        return db.claim(self.name, _WORKER_ID, self.lease, self.concurrency)
+
+    async def _offload(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        return await run_db(db.DB_PATH, func, *args, write=True,
+                            label=f"job_queue.{func.__name__}", **kwargs)
+
+    async def aclaim(self) -> Optional[Dict[str, Any]]:
+        return await self._offload(self.claim)
+
+    async def aheartbeat(self, job_id: str, **state: Any) -> bool:
+        return await self._offload(self.heartbeat, job_id, **state)
+
+    def heartbeat_nowait(self, job_id: str, **state: Any) -> None:
+        """동기 콜백(진척 보고 등)에서 — 기록을 띄워 두고 바로 돌아온다."""
+        task = asyncio.get_running_loop().create_task(self.aheartbeat(job_id, **state))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def acomplete(self, job_id: str, result: Any = None, **state: Any) -> bool:
+        return await self._offload(self.complete, job_id, result, **state)
+
+    async def afail(self, job_id: str, error: str, *, retry: bool = True, **state: Any) -> str:
+        return await self._offload(self.fail, job_id, error, retry=retry, **state)
+
+    async def abeat(self, state: str) -> None:
+        await self._offload(self.beat, state)
+
+    def heartbeat(self, job_id: str, **state: Any) -> bool:
+        """리스 연장. state 를 주면 job 의 실행 상태에 병합한다. 리스를 잃었으면 False."""
+        return db.heartbeat(job_id, self.lease, state or None)
+
+    def complete(self, job_id: str, result: Any = None, **state: Any) -> bool:
+        ok = db.finish(job_id, "done", result=result, state=state or None)
+        self._notify()
+        return ok
+
+    def fail(self, job_id: str, error: str, *, retry: bool = True, **state: Any) -> str:
+        """실패 처리. 새 상태(queued=재시도 예약 / error / dead)를 돌려준다."""
+        job = db.get(job_id)
+        if job is None:
+            return "missing"
+        if retry and job["attempts"] < job["max_attempts"]:
+            delay = min(self.backoff_max, self.backoff * 2 ** max(0, job["attempts"] - 1))
+            if state:
+                db.heartbeat(job_id, self.lease, state)
+            db.retry(job_id, delay, error)
+            status = "queued"
+        else:
+            status = "dead" if retry else "error"
+            db.finish(job_id, status, error=error, state=state or None)
+        self._notify()
+        return status
+
+    def reap(self) -> int:
+        """리스가 지난 running 을 지금 정리(claim 도 매번 한다). 정리한 수."""
+        n = db.reap_expired(self.name)
+        if n:
+            self._notify()
+        return n
+
+    def cancel_queued(self, reason: str = "superseded") -> int:
+        return db.cancel_queued(self.name, reason)
+
+    def purge(self, older_than: Optional[float] = None) -> int:
+        """끝난 job 청소. older_than=None 이면 큐를 통째로 비운다(최후 수단)."""
+        return db.purge(self.name, older_than)
+
+    def beat(self, state: str) -> None:
+        """워커 루프 생존 신호. 실패해도 루프는 계속."""
+        try:
+            db.beat(self.name, _WORKER_ID, state)
+        except Exception:
+            pass
+
+    def last_beat(self) -> Optional[Dict[str, Any]]:
+        return db.last_beat(self.name)
+
+    # ── 대기 ──────────────────────────────────────────────
+
+    def _cond(self) -> asyncio.Condition:
+        st = _get_state()
+        cond = st.conds.get(self.name)
+        if cond is None:
+            cond = st.conds[self.name] = asyncio.Condition()
+        return cond
+
+    def _notify(self) -> None:
+        """같은 프로세스에서 기다리는 워커를 깨운다(루프 밖·다른 스레드에서 불려도 된다)."""
+        st = _state
+        if st is None or st.loop.is_closed():
+            return
+        cond = st.conds.get(self.name)
+        if cond is None:
+            return
+
+        async def _wake():
+            async with cond:
+                st.gens[self.name] = st.gens.get(self.name, 0) + 1
+                cond.notify_all()
+
+        try:
+            st.loop.call_soon_threadsafe(lambda: st.loop.create_task(_wake()))
+        except RuntimeError:
+            pass
+
+    async def _idle_wait(self) -> float:
+        wait = self.poll
+        try:
+            ready = await run_db(db.DB_PATH, db.next_ready_at, self.name,
+                                 label="job_queue.next_ready_at")
+        except Exception:
+            ready = None
+        if ready is not None:
+            wait = min(wait, max(0.05, ready - time.time()))
+        return wait
+
+    async def next_job(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """claim 할 수 있을 때까지 기다린다. timeout 이 지나면 None.
+
+        claim 은 Condition 잠금 밖(DB 스레드)에서 한다. claim 전에 본 알림 세대가 잠들기 직전에
+        바뀌어 있으면 그 사이에 알림이 온 것이므로 자지 않고 다시 claim 한다.
+        """
+        cond = self._cond()
+        st = _get_state()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            seen = st.gens.get(self.name, 0)
+            job = await self.aclaim()
+            if job is not None:
+                return job
+            wait = await self._idle_wait()
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return None
+                wait = min(wait, left)
+            async with cond:
+                if st.gens.get(self.name, 0) != seen:
+                    continue
+                try:
+                    await asyncio.wait_for(cond.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _keepalive(self, job_id: str) -> None:
+        while True:
+            await asyncio.sleep(max(1.0, self.lease / 3))
+            if not await self.aheartbeat(job_id):
+                return
+
+    async def run_job(self, job: Dict[str, Any],
+                      handler: Callable[[Dict[str, Any]], Awaitable[Any]]) -> str:
+        """claim 한 job 하나를 handler 로 실행. 도는 동안 리스를 lease/3 마다 연장한다.
+
+        handler 가 값을 돌려주면 done(이미 스스로 확정했으면 그대로), JobFailed 면 그 retry
+        대로, 다른 예외면 재시도(시도 소진 시 dead). 최종 상태를 돌려준다.
+        """
+        keep = asyncio.create_task(self._keepalive(job["id"]))
+        try:
+            result = await handler(job)
+        except asyncio.CancelledError:
+            raise
+        except JobFailed as e:
+            return await self.afail(job["id"], str(e), retry=e.retry)
+        except Exception as e:
+            logger.warning(f"[job-q:{self.name}] job {job['id']} failed: {e}", exc_info=True)
+            return await self.afail(job["id"], f"{type(e).__name__}: {e}")
+        finally:
+            keep.cancel()
+        await self.acomplete(job["id"], result)
+        cur = await run_db(db.DB_PATH, db.get, job["id"], label="job_queue.get")
+        return cur["status"] if cur else "missing"
+
+    async def run_worker(self, handler: Callable[[Dict[str, Any]], Awaitable[Any]]) -> None:
+        """워커 상주 루프 — 한 번에 하나씩(이 루프 기준). 취소되면 빠져나간다."""
+        logger.warning(f"[job-q:{self.name}] worker started {_WORKER_ID} "
+                       f"(concurrency={self.concurrency}, lease={self.lease}s, poll={self.poll}s)")
+        await self.abeat("started")
+        while True:
+            try:
+                job = await self.next_job(timeout=self.poll * 5)
+                if job is None:
+                    await self.abeat("idle")
+                    continue
+                await self.abeat(f"running:{job['id']}")
+                await self.run_job(job, handler)
+                await self.abeat("idle")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[job-q:{self.name}] worker tick failed: {e}")
+                await asyncio.sleep(self.poll)
+
+
+def queue_stats() -> List[Dict[str, Any]]:
+    """이 프로세스가 아는(import 된) 큐들의 지표."""
+    out = []
+    for q in list(_QUEUES.values()):
+        try:
+            out.append(q.stats())
+        except Exception as e:
+            out.append({"queue": q.name, "error": str(e)[:200]})
+    return out
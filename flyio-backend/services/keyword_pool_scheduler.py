@@ -234,6 +234,12 @@ class KeywordPoolScheduler:
             )
         self.scheduler.start()
         self._running = True
+        # 루프 정체 스택에 이 job 들이 보이면 job 별로 쌓는다(/api/admin/loop-health).
+        try:
+            from services.loop_monitor import track_scheduler
+            track_scheduler(self.scheduler)
+        except Exception as e:
+            logger.debug(f"[pool/scheduler] loop monitor 연결 실패: {e}")
         _ai_cleanup_status = (
             "ai_cleanup 600s"
             if _os.environ.get("KEYWORD_POOL_AI_CLEANUP_ENABLED") == "1"
@@ -268,7 +274,7 @@ class KeywordPoolScheduler:
             from database.naver_ad_db import list_connected_ad_accounts, get_ad_account_by_customer
             from database.registered_keywords_db import get_registered_keywords_db
             from services.naver_ad_service import NaverAdApiClient
-            import sqlite3
+            from database.connection_pool import pooled
             accts = list_connected_ad_accounts() or []
             for a in accts:
                 uid = a.get("user_id")
@@ -280,7 +286,7 @@ class KeywordPoolScheduler:
                     continue
                 customer_id = int(account.get("customer_id"))
                 reg = get_registered_keywords_db()
-                with sqlite3.connect(reg.db_path) as conn:
+                with pooled(reg.db_path) as conn:
                     ag_ids = [r[0] for r in conn.execute(
                         "SELECT DISTINCT ad_group_id FROM registered_keywords WHERE account_customer_id=? AND ad_group_id IS NOT NULL",
                         (customer_id,),
@@ -312,8 +318,8 @@ class KeywordPoolScheduler:
         """collect — 모든 활성 광고주를 계정 병렬(최대 3)로 처리해 처리량↑. register/inspect 는 별도 cron.
 
         계정 병렬 안전성: 계정별 독립 네이버 자격증명 + collect 내부는 순차 keywordstool 호출이라
-        계정당 전역 Semaphore(8) 슬롯 1개만 점유(나머지 유휴) → 병렬화가 그 유휴 슬롯을 채운다.
-        API 폭주는 services.naver_ad_service.NAVER_API_GLOBAL_SEMAPHORE(8) 하드캡이 원천 차단.
+        계정마다 자기 keywordstool 버킷만 쓴다 → 병렬화가 놀던 계정 예산을 채운다.
+        API 폭주는 services.naver_rate_governor 의 계정×묶음 토큰 버킷이 원천 차단.
         SQLite 는 WAL + busy_timeout 30s 로 동시 write 직렬화. breaker OPEN(15s)는 자동 회복.
         동시성 3: pass 시간 ~40분 → ~13분(계정당 collect 빈도 3배 → floor 하강·채우기 3배).
         """
@@ -514,6 +520,7 @@ class KeywordPoolScheduler:
             from routers.naver_ad import _run_pool_ai_classify
             from database.naver_ad_db import list_connected_ad_accounts
             from database.keyword_pool_db import get_keyword_pool_db
+            from database.async_db import adb
             pool = get_keyword_pool_db()
             accts = list_connected_ad_accounts() or []
             if not accts:
@@ -523,8 +530,8 @@ class KeywordPoolScheduler:
             for uid, cid in pairs:
                 try:
                     # 트리거 조건 — deadlock 또는 reject 1000+ 누적
-                    deadlock = pool.detect_collect_deadlock(cid, n_recent=5, min_rejected=500)
-                    rs = pool.reject_stats(cid)
+                    deadlock = await adb(pool).detect_collect_deadlock(cid, n_recent=5, min_rejected=500)
+                    rs = await adb(pool).reject_stats(cid)
                     pending_rejects = int(rs.get("pending", 0))
                     should_run = (
                         bool(deadlock.get("is_deadlock"))
@@ -561,6 +568,7 @@ class KeywordPoolScheduler:
             from routers.naver_ad import _run_pool_register
             from database.naver_ad_db import list_connected_ad_accounts
             from database.registered_keywords_db import get_registered_keywords_db
+            from database.async_db import adb
             accts = list_connected_ad_accounts() or []
             if not accts:
                 return
@@ -571,7 +579,7 @@ class KeywordPoolScheduler:
                 try:
                     # Cap-backoff: 한도 ≥99% 면 skip (cleanup 슬롯 회수까지 무의미 시도 차단)
                     try:
-                        rs = reg.stats(cid) or {}
+                        rs = await adb(reg).stats(cid) or {}
                         if int(rs.get("active") or 0) >= 99000:
                             n_skipped += 1
                             continue
@@ -717,6 +725,7 @@ class KeywordPoolScheduler:
             )
             from database.registered_keywords_db import get_registered_keywords_db
             from database.keyword_pool_db import get_keyword_pool_db
+            from database.async_db import adb
             rows = list_automation_enabled_accounts() or []
             if not rows:
                 return
@@ -731,14 +740,14 @@ class KeywordPoolScheduler:
                     target = int(prof.get("target_count") or 100000)
                     # 가드 1: 목표 도달
                     try:
-                        active = int((reg.stats(cid) or {}).get("active") or 0)
+                        active = int((await adb(reg).stats(cid) or {}).get("active") or 0)
                     except Exception:
                         active = 0
                     if active >= target:
                         continue
                     # 가드 2: pending 적체 — register 가 따라잡을 때까지 발사 보류
                     try:
-                        pst = pool.stats(cid) or {}
+                        pst = await adb(pool).stats(cid) or {}
                         pending = int((pst.get("by_status") or {}).get("pending") or 0)
                     except Exception:
                         pending = 0
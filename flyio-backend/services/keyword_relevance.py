@@ -11,9 +11,21 @@
 여정 맵 파이프라인이 그 함수를 쓰려면 12,000줄짜리 라우터를 import 해야 해서
 순수 로직만 여기로 뽑았다.
 
-⚠ 지금은 두 곳에 같은 코드가 있다. 배포 여유가 생기면
-   `routers/naver_ad.py` 가 이 모듈을 import 하도록 바꿔 중복을 없앨 것.
-   (naver_ad.py 는 현재 워킹트리에 미커밋 변경이 있어 지금 건드리지 않는다)
+`routers/naver_ad.py::_compute_relevance_score` 는 이제 아래 컴파일된 매처
+(`compile_relevance`)에 위임한다. `relevance_score` / `explain` 은 기준 구현으로 남겨
+둔다 — 매처가 같은 값을 내는지 tests/test_keyword_relevance.py 가 대조한다.
+
+배치 채점 — 시드 원자를 한 번만
+-------------------------------
+`relevance_score` 는 부를 때마다 시드 전부의 2·3-gram 을 다시 만들고 원자마다 `in`
+으로 훑는다. 풀 5만 개 × 시드 30개면 같은 원자 집합을 5만 번 만든다.
+
+    m = compile_relevance(user_seeds, pool_tokens)   # (시드, 풀 토큰) 별 캐시
+    m.score_many(keywords)      → [int, ...]          # relevance_score 와 같은 값
+    m.explain_many(keywords)    → [(int, [원자]), ...] # explain 과 같은 값 (pool_tokens=() 일 때)
+
+매처는 시드 전체·원자·풀 토큰을 한 Aho-Corasick 오토마톤으로 묶어 키워드를 한 번만
+훑는다. "키워드가 시드 안에 있나(95)" 는 시드 부분문자열 → 첫 시드 번호 사전으로 본다.
 
 점수가 뜻하는 것 — 그리고 뜻하지 않는 것
 ----------------------------------------
@@ -31,7 +43,8 @@
    그래서 **하드 게이트는 anchor 로, 이 점수는 정렬·표시용으로** 쓰는 게 맞다.
 """
 
-from typing import List, Sequence, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 
 MAX_3PLUS = 80      # 3글자 이상 원자 매칭 상한
 MAX_2GRAM = 30      # 2글자 원자 매칭 상한 (약한 신호)
@@ -104,3 +117,188 @@ def explain(kw: str, user_seeds: Sequence[str]) -> Tuple[int, List[str]]:
                 seen.add(a)
                 hits.append(a)
     return sc, hits[:4]
+
+
+# ─────────────────────────────────────────────────────────────
+# 컴파일된 매처 — 배치 채점용
+# ─────────────────────────────────────────────────────────────
+
+class _Automaton:
+    """Aho-Corasick. 패턴 번호 집합을 돌려준다(겹침 포함, 키워드당 한 번 훑기)."""
+
+    __slots__ = ("goto", "fail", "out")
+
+    def __init__(self, patterns: Sequence[str]):
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for pid, pat in enumerate(patterns):
+            state = 0
+            for ch in pat:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = goto[state][ch] = len(goto)
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(pid)
+
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:                      # BFS — 얕은 상태의 fail 이 먼저 정해진다
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0) if goto[f].get(ch, 0) != nxt else 0
+                out[nxt] = out[nxt] + out[fail[nxt]]
+                queue.append(nxt)
+
+        self.goto = goto
+        self.fail = fail
+        self.out = [tuple(o) for o in out]
+
+    def find(self, text: str) -> set:
+        goto, fail, out = self.goto, self.fail, self.out
+        hits: set = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                hits.update(out[state])
+        return hits
+
+
+class RelevanceMatcher:
+    """(시드, 풀 토큰) 한 벌에 대해 미리 컴파일한 연관도 채점기.
+
+    직접 만들지 말고 `compile_relevance` 로 받는다(캐시).
+    """
+
+    def __init__(self, user_seeds: Sequence[str], pool_tokens: Sequence[str] = ()):
+        seeds = [s for s in user_seeds if s and len(s) >= 2]
+
+        # 패턴 → 번호. 같은 문자열이 시드·원자·풀 토큰을 겸할 수 있어 속성을 따로 든다.
+        index: Dict[str, int] = {}
+        seed_rank: List[Optional[int]] = []    # 이 패턴이 시드 전체일 때 가장 앞 시드 순번
+        is_3: List[bool] = []
+        is_2: List[bool] = []
+        pool_n: List[int] = []                 # pool_tokens 안 등장 횟수 (중복은 중복대로 센다)
+
+        def pid(pat: str) -> int:
+            i = index.get(pat)
+            if i is None:
+                i = index[pat] = len(index)
+                seed_rank.append(None)
+                is_3.append(False)
+                is_2.append(False)
+                pool_n.append(0)
+            return i
+
+        within: Dict[str, int] = {}            # 시드 부분문자열 → 그걸 품은 첫 시드 순번
+        for rank, s in enumerate(seeds):
+            i = pid(s)
+            if seed_rank[i] is None:
+                seed_rank[i] = rank
+            for a in range(len(s)):
+                for b in range(a + 1, len(s) + 1):
+                    within.setdefault(s[a:b], rank)
+            if len(s) >= 4:
+                is_3[i] = True
+            for n in (2, 3):
+                for k in range(len(s) - n + 1):
+                    j = pid(s[k:k + n])
+                    if n == 2:
+                        is_2[j] = True
+                    else:
+                        is_3[j] = True
+
+        self._always_pool = 0                  # 빈 토큰은 `"" in kw` 라 늘 맞는다
+        for t in pool_tokens:
+            if t:
+                pool_n[pid(t)] += 1
+            else:
+                self._always_pool += 1
+
+        # explain 의 근거 순서: 시드 순 → (4글자 이상이면) 시드 자신 → 3-gram 앞에서부터
+        order: Dict[int, int] = {}
+        for s in seeds:
+            cands = ([s] if len(s) >= 4 else []) + [s[k:k + 3] for k in range(len(s) - 2)]
+            for a in cands:
+                order.setdefault(index[a], len(order))
+
+        self.seeds = tuple(seeds)
+        self._patterns = list(index)
+        self._seed_rank = seed_rank
+        self._is_3 = is_3
+        self._is_2 = is_2
+        self._pool_n = pool_n
+        self._within = within
+        self._order = order
+        self._ac = _Automaton(self._patterns)
+
+    def _seed_hit(self, kw: str, hits: set) -> Tuple[Optional[int], Optional[int]]:
+        """(100/95 점수, 그 시드 순번). 앞 시드가 먼저 — relevance_score 의 루프 순서 그대로."""
+        best, best_rank = None, None
+        for i in hits:
+            r = self._seed_rank[i]
+            if r is not None and (best_rank is None or r < best_rank):
+                best, best_rank = 100, r
+        r = self._within.get(kw)
+        if r is not None and (best_rank is None or r < best_rank):
+            best, best_rank = 95, r
+        return best, best_rank
+
+    def _atom_score(self, hits: set) -> int:
+        n_3 = n_2 = 0
+        n_pool = self._always_pool
+        is_3, is_2, pool_n = self._is_3, self._is_2, self._pool_n
+        for i in hits:
+            if is_3[i]:
+                n_3 += 1
+            if is_2[i]:
+                n_2 += 1
+            n_pool += pool_n[i]
+        score = min(MAX_3PLUS, n_3 * 20) + min(MAX_2GRAM, n_2 * 5) + min(MAX_POOL, n_pool * 3)
+        return min(CAP, score)
+
+    def score(self, kw: str) -> int:
+        """relevance_score(kw, user_seeds, pool_tokens) 와 같은 값."""
+        if not kw:
+            return 0
+        hits = self._ac.find(kw)
+        sc, _ = self._seed_hit(kw, hits)
+        return sc if sc is not None else self._atom_score(hits)
+
+    def score_many(self, keywords: Sequence[str]) -> List[int]:
+        score = self.score
+        return [score(kw) for kw in keywords]
+
+    def explain_one(self, kw: str) -> Tuple[int, List[str]]:
+        """explain(kw, user_seeds) 와 같은 값 (매처의 pool_tokens 가 비었을 때)."""
+        if not kw:
+            # 기준 구현은 `"" in s` 가 참이라 첫 시드를 근거로 돌려준다 — 그대로 맞춘다
+            return 0, list(self.seeds[:1])
+        hits = self._ac.find(kw)
+        sc, rank = self._seed_hit(kw, hits)
+        if sc is not None:
+            return sc, [self.seeds[rank]]
+        order = self._order
+        shown = sorted((i for i in hits if i in order), key=order.__getitem__)[:4]
+        return self._atom_score(hits), [self._patterns[i] for i in shown]
+
+    def explain_many(self, keywords: Sequence[str]) -> List[Tuple[int, List[str]]]:
+        explain_one = self.explain_one
+        return [explain_one(kw) for kw in keywords]
+
+
+@lru_cache(maxsize=128)
+def _compiled(seeds: Tuple[str, ...], pool_tokens: Tuple[str, ...]) -> RelevanceMatcher:
+    return RelevanceMatcher(seeds, pool_tokens)
+
+
+def compile_relevance(user_seeds: Sequence[str],
+                      pool_tokens: Sequence[str] = ()) -> RelevanceMatcher:
+    """시드·풀 토큰 한 벌의 매처. 같은 (시드 순서 포함) 조합이면 캐시된 것을 준다."""
+    return _compiled(tuple(user_seeds), tuple(pool_tokens))
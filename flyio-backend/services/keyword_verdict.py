@@ -51,6 +51,9 @@ import statistics
 import time
 from typing import Callable, Dict, List, Optional, Tuple
 
+from services.html_select import parse_html, select, text_of
+from services.parse_pool import run_parse
+
 logger = logging.getLogger(__name__)
 
 # ── 상수 ──────────────────────────────────────────────────────────
@@ -73,7 +76,7 @@ PLAYWRIGHT_TIMEOUT = float(os.environ.get("KWV_PLAYWRIGHT_TIMEOUT", "150"))
 # 태우고 남은 예산으로 브라우저를 켜다 죽었다. Fly 에서는 처음부터 브라우저로 간다.
 SKIP_HTTP_SERP = (os.environ.get("KWV_SKIP_HTTP_SERP")
                   or ("1" if os.environ.get("FLY_APP_NAME") else "0")) == "1"
-# 판정 전용 브라우저를 살려 두는 시간. 콜드 기동이 이 경로의 지배적 비용이라 상주시키고,
+# 판정 전용 브라우저 풀을 살려 두는 시간. 콜드 기동이 이 경로의 지배적 비용이라 상주시키고,
 # 오래 안 쓰이면 닫아 worker RAM 을 돌려준다.
 BROWSER_IDLE_CLOSE = float(os.environ.get("KWV_BROWSER_IDLE_CLOSE", "600"))
 
@@ -165,20 +168,21 @@ def _parse_serp_html(html: str) -> Tuple[List[Dict], str]:
     """검색 HTML → 순위 보존 파싱. (rows, parse_mode) 반환.
 
     parse_mode: "list"(본문 목록 컨테이너 = 신뢰) | "regex"(폴백 = 순위 신뢰 낮음)
-    """
-    from bs4 import BeautifulSoup
 
+    lxml 백엔드(services/html_select). html.parser 로는 ~500KB 페이지 하나에
+    수백 ms 가 이벤트 루프에서 들었다. 결과는 tests/test_html_select.py 가 bs4 와 대조한다.
+    """
     rows: List[Dict] = []
     seen: set = set()
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        doc = parse_html(html)
         containers = []
         for sel in _LIST_SELECTORS:
-            containers = soup.select(sel)
+            containers = select(doc, sel)
             if containers:
                 break
         for c in containers:
-            for a in c.select('a[href*="blog.naver.com"]'):
+            for a in select(c, 'a[href*="blog.naver.com"]'):
                 m = _POST_RE.search(a.get("href", ""))
                 if not m:
                     continue
@@ -186,7 +190,7 @@ def _parse_serp_html(html: str) -> Tuple[List[Dict], str]:
                 if blog_id in seen:
                     continue
                 seen.add(blog_id)
-                title = _TITLE_NOISE.sub("", a.get_text(strip=True) or "").strip()
+                title = _TITLE_NOISE.sub("", text_of(a) or "").strip()
                 rows.append({
                     "rank": len(rows) + 1,
                     "blog_id": blog_id,
@@ -228,94 +232,38 @@ async def _fetch_serp_playwright(keyword: str, limit: int) -> List[Dict]:
     return await _playwright_serp_guarded(keyword, limit)
 
 
-_BROWSER_LOCK: Optional[asyncio.Lock] = None
-_PW = None
-_BROWSER = None
-_BROWSER_LAST_USE = 0.0
-_REAPER_TASK = None
-
-
-def _browser_lock() -> asyncio.Lock:
-    # 모듈 임포트 시점엔 이벤트 루프가 없을 수 있어 지연 생성한다.
-    global _BROWSER_LOCK
-    if _BROWSER_LOCK is None:
-        _BROWSER_LOCK = asyncio.Lock()
-    return _BROWSER_LOCK
-
-
-async def _close_browser(reason: str) -> None:
-    """상주 브라우저 정리. **호출자를 막지 않는 곳에서만** 부른다(아래 하드타임아웃 참고)."""
-    global _PW, _BROWSER
-    browser, pw = _BROWSER, _PW
-    _BROWSER = _PW = None
-    if browser or pw:
-        logger.warning(f"[kwv] verdict browser 정리 ({reason})")
-    for closer in (browser, pw):
-        if closer is None:
-            continue
-        try:
-            await (closer.close() if closer is browser else closer.stop())
-        except Exception:
-            pass
+# 판정 동시 SERP 조회 수(= 전용 브라우저의 예열 컨텍스트 수).
+VERDICT_POOL_CONTEXTS = int(os.environ.get("KWV_POOL_CONTEXTS", "2"))
 
 
-async def _reaper_loop() -> None:
-    """오래 안 쓰인 상주 브라우저를 닫아 worker RAM 을 돌려준다."""
-    while True:
-        await asyncio.sleep(60)
-        if _BROWSER is not None and time.time() - _BROWSER_LAST_USE > BROWSER_IDLE_CLOSE:
-            async with _browser_lock():
-                if _BROWSER is not None and time.time() - _BROWSER_LAST_USE > BROWSER_IDLE_CLOSE:
-                    await _close_browser("idle")
-
-
-async def _get_browser():
-    """판정 전용 chromium 을 **상주**시킨다.
+def _verdict_pool():
+    """판정 전용 브라우저 풀(services/browser_pool, 이름 "verdict").
 
     이전에는 요청마다 띄우고 즉시 닫았는데, worker(nice 19 + 공유 2vCPU + 크론 경합)에서는
     그 콜드 기동이 이 경로 비용의 대부분이라 75초 상한 안에 페이지를 못 열었다
-    (2026-08-13 실측 3회 전부 hard-timeout). 격리 원칙은 그대로다 — `blog_scraper` 의
-    공용 브라우저(`--single-process`, 힙 256MB, 다른 크론과 공유)는 여전히 쓰지 않는다.
-    죽었거나(is_connected 실패) 타임아웃을 낸 브라우저는 버리고 새로 띄운다.
+    (2026-08-13 실측 3회 전부 hard-timeout). 그래서 상주시키고, 이제는 컨텍스트까지
+    예열해 재사용한다. 격리 원칙은 그대로다 — `blog_scraper` 의 "scraper" 풀(다른
+    크론과 공유)과는 **다른 chromium** 이다. 오래 안 쓰이면 풀이 알아서 닫는다.
     """
-    global _PW, _BROWSER, _BROWSER_LAST_USE, _REAPER_TASK
-    from playwright.async_api import async_playwright
-
-    async with _browser_lock():
-        if _BROWSER is not None:
-            try:
-                if _BROWSER.is_connected():
-                    _BROWSER_LAST_USE = time.time()
-                    return _BROWSER
-            except Exception:
-                pass
-            await _close_browser("disconnected")
-
-        t0 = time.time()
-        pw = browser = None
-        try:
-            pw = await async_playwright().start()
-            browser = await pw.chromium.launch(
-                headless=True,
-                args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu",
-                      "--disable-extensions", "--mute-audio"],
-            )
-        except BaseException:
-            # 기동 도중 하드타임아웃으로 취소되면 여기서 정리하지 않는 한 chromium 이
-            # 고아로 남는다(worker RAM 누수). 전역에는 완성된 것만 싣는다.
-            for c, m in ((browser, "close"), (pw, "stop")):
-                if c is not None:
-                    try:
-                        await getattr(c, m)()
-                    except Exception:
-                        pass
-            raise
-        _PW, _BROWSER = pw, browser
-        _BROWSER_LAST_USE = time.time()
-        logger.warning(f"[kwv] verdict browser 기동 {round(time.time() - t0, 1)}s")
-        if _REAPER_TASK is None or _REAPER_TASK.done():
-            _REAPER_TASK = asyncio.create_task(_reaper_loop())
-        return _BROWSER
+    from services.browser_pool import DEFAULT_USER_AGENT, get_pool
+    return get_pool(
+        "verdict",
+        browsers=1,
+        contexts=VERDICT_POOL_CONTEXTS,
+        idle_close=BROWSER_IDLE_CLOSE,
+        launch_args=("--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu",
+                     "--disable-extensions", "--mute-audio"),
+        # 이미지·폰트·미디어·스타일시트 차단. 우리가 필요한 건 링크 목록 DOM 뿐인데, SERP 는
+        # 썸네일이 수십 개라 worker(nice 19, 공유 2vCPU)에서는 이게 시간을 지배한다
+        # (2026-08-13 실측: 차단 없이 stage1 이 90초 타임아웃).
+        block_types=("image", "font", "media", "stylesheet"),
+        block_default=True,
+        context_options={
+            "viewport": {"width": 1280, "height": 900},
+            "user_agent": DEFAULT_USER_AGENT,
+            "locale": "ko-KR",
+        },
+    )
 
 
 async def _playwright_serp_guarded(keyword: str, limit: int) -> List[Dict]:
@@ -333,8 +281,9 @@ async def _playwright_serp_guarded(keyword: str, limit: int) -> List[Dict]:
         logger.warning(f"[kwv] playwright serp hard-timeout {keyword!r} "
                        f"({PLAYWRIGHT_TIMEOUT}s) — 브라우저 폐기")
         task.cancel()
-        # 매달린 브라우저는 다음 요청에 재사용하면 안 된다. 정리를 기다리지는 않는다.
-        asyncio.create_task(_close_browser("hard-timeout"))
+        # 매달린 브라우저는 다음 요청에 재사용하면 안 된다. 정리를 기다리지는 않는다
+        # (풀이 drain 시키고, 새 요청은 새 브라우저로 간다).
+        asyncio.create_task(_verdict_pool().recycle("hard-timeout"))
         return []
     except Exception as e:
         logger.warning(f"[kwv] playwright serp error {keyword!r}: {e}")
@@ -345,34 +294,19 @@ async def _playwright_serp_inner(keyword: str, limit: int) -> List[Dict]:
     from urllib.parse import quote
 
     url = f"https://search.naver.com/search.naver?ssc=tab.blog.all&query={quote(keyword)}&start=1"
-    context = None
     t0 = time.time()
     try:
-        browser = await _get_browser()
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 900},
-            user_agent=("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                        "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"),
-            locale="ko-KR",
-        )
-        # 이미지·폰트·미디어 차단. 우리가 필요한 건 링크 목록 DOM 뿐인데, SERP 는 썸네일이
-        # 수십 개라 worker(nice 19, 공유 2vCPU)에서는 이게 시간을 지배한다
-        # (2026-08-13 실측: 차단 없이 stage1 이 90초 타임아웃).
-        async def _block(route, request):
-            if request.resource_type in ("image", "font", "media", "stylesheet"):
-                await route.abort()
-            else:
-                await route.continue_()
-        await context.route("**/*", _block)
-
-        page = await context.new_page()
-        await page.goto(url, wait_until="domcontentloaded", timeout=25000)
-        try:
-            await page.wait_for_selector(
-                'div[class*="fds-ugc-single-intention-item-list"]', timeout=12000)
-        except Exception:
-            logger.warning(f"[kwv] playwright: list container not found {keyword!r}")
-        rows, mode = _parse_serp_html(await page.content())
+        # 브라우저·컨텍스트는 풀에 상주시키고 빌려 쓴다. 반납 시 쿠키를 지우므로
+        # 요청 간 쿠키 격리는 유지된다.
+        async with _verdict_pool().page() as page:
+            await page.goto(url, wait_until="domcontentloaded", timeout=25000)
+            try:
+                await page.wait_for_selector(
+                    'div[class*="fds-ugc-single-intention-item-list"]', timeout=12000)
+            except Exception:
+                logger.warning(f"[kwv] playwright: list container not found {keyword!r}")
+            html = await page.content()
+        rows, mode = await run_parse(_parse_serp_html, html)
         logger.warning(f"[kwv] playwright serp {keyword!r}: {len(rows)} rows mode={mode} "
                        f"in {round(time.time() - t0, 1)}s")
         if mode != "list":
@@ -382,13 +316,6 @@ async def _playwright_serp_inner(keyword: str, limit: int) -> List[Dict]:
         logger.warning(f"[kwv] playwright serp failed {keyword!r} "
                        f"after {round(time.time() - t0, 1)}s: {e}")
         return []
-    finally:
-        # 브라우저는 상주시키고 컨텍스트만 닫는다(요청 간 쿠키·캐시 격리는 유지).
-        if context:
-            try:
-                await context.close()
-            except Exception:
-                pass
 
 
 async def _fetch_serp_pages(keyword: str, limit: int) -> Tuple[List[Dict], Optional[str], str]:
@@ -400,9 +327,10 @@ async def _fetch_serp_pages(keyword: str, limit: int) -> Tuple[List[Dict], Optio
     한 번에 오므로 페이지네이션도 필요 없다.
     """
     from urllib.parse import quote
-    from routers.blogs import get_http_client, get_random_headers
+    from routers.blogs import get_random_headers
+    from services.http_clients import get_client
 
-    client = await get_http_client()
+    client = get_client("search")
     encoded = quote(keyword)
 
     attempts = [] if SKIP_HTTP_SERP else [
@@ -422,7 +350,7 @@ async def _fetch_serp_pages(keyword: str, limit: int) -> Tuple[List[Dict], Optio
         if resp.status_code != 200:
             logger.warning(f"[kwv] serp {source} HTTP {resp.status_code} {keyword!r}")
             continue
-        rows, mode = _parse_serp_html(resp.text)
+        rows, mode = await run_parse(_parse_serp_html, resp.text)
         if rows:
             return rows[:limit], source, mode
 
@@ -481,7 +409,7 @@ async def stage1_facts(blog_id: str, keyword: str, use_cache: bool = True,
     cache_only=True 면 SERP 를 새로 조회하지 않는다. public API 프로세스에서 호출할 때
     쓴다 — 프로덕션에서 SERP 조회는 브라우저 경로라 API 이벤트루프에서 돌리면 안 된다.
     """
-    from services.exposure_ceiling import _fetch_volumes
+    from services import keyword_volume
 
     blog_id = (blog_id or "").strip()
     keyword = (keyword or "").strip()
@@ -496,10 +424,11 @@ async def stage1_facts(blog_id: str, keyword: str, use_cache: bool = True,
                     "serp_measured_at": None, "serp_size": 0}
 
     serp_task = serp_snapshot(keyword, use_cache=use_cache)
-    vol_task = _fetch_volumes([keyword])
+    vol_task = keyword_volume.lookup([keyword])
     serp, vols = await asyncio.gather(serp_task, vol_task)
 
-    volume = vols.get(keyword.replace(" ", ""), 0)
+    hit = vols.get(keyword)
+    volume = hit["monthly_total"] if hit else 0
     rows = serp.get("rows") or []
     my_rank = next((r["rank"] for r in rows if r["blog_id"] == blog_id), None)
 
@@ -508,7 +437,7 @@ async def stage1_facts(blog_id: str, keyword: str, use_cache: bool = True,
         "blog_id": blog_id,
         "keyword": keyword,
         "volume": volume,
-        "volume_measured": bool(vols),
+        "volume_measured": keyword in vols,
         "my_rank": my_rank,
         "already_page1": my_rank is not None and my_rank <= PAGE1_CUTOFF,
         "serp_source": serp.get("source"),
@@ -597,29 +526,29 @@ async def _score_blog(blog_id: str, use_cache: bool = True) -> Optional[Dict]:
 
 
 async def _measure_idle_days(blog_ids: List[str]) -> Dict[str, Optional[int]]:
-    """경쟁자별 '마지막 글 경과일'을 RSS 로 측정 (블로그당 1콜).
+    """경쟁자별 '마지막 글 경과일'을 RSS 로 측정 (블로그당 1콜, services/rss_feed 캐시).
 
     analyze_blog 응답에는 활동성 필드가 없어(실측 확인) 따로 잰다. serp_difficulty 가
     쓰는 것과 **같은 함수**를 써서 '휴면' 기준이 두 기능에서 갈라지지 않게 한다.
+    stage1 의 analyze_blog 가 방금 같은 피드를 받았으면 여기서는 네트워크를 안 탄다.
     """
-    import httpx
     from services.serp_difficulty import _measure_blog_vitality
 
     out: Dict[str, Optional[int]] = {b: None for b in blog_ids}
     if not blog_ids:
         return out
     sem = asyncio.Semaphore(6)
+
+    async def _one(bid: str):
+        async with sem:
+            try:
+                return bid, await _measure_blog_vitality(None, bid)
+            except Exception:
+                return bid, None
     try:
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            async def _one(bid: str):
-                async with sem:
-                    try:
-                        return bid, await _measure_blog_vitality(client, bid)
-                    except Exception:
-                        return bid, None
-            for bid, v in await asyncio.gather(*[_one(b) for b in blog_ids]):
-                if v:
-                    out[bid] = v.get("days_idle")
+        for bid, v in await asyncio.gather(*[_one(b) for b in blog_ids]):
+            if v:
+                out[bid] = v.get("days_idle")
     except Exception as e:
         logger.warning(f"[kwv] idle measure failed: {e}")
     return out
@@ -637,10 +566,8 @@ async def _topical_fit(blog_id: str, keyword: str) -> Optional[int]:
     None = RSS 조회 실패(측정 불가). 0 = 진짜로 없음. 둘을 섞지 않는다.
     """
     from services.competitive_analysis_v2 import fetch_blog_rss_posts, count_keyword_related_posts
-    import httpx
     try:
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            posts = await fetch_blog_rss_posts(blog_id, client)
+        posts = await fetch_blog_rss_posts(blog_id)
     except Exception as e:
         logger.warning(f"[kwv] topical fit failed {blog_id}: {e}")
         return None
@@ -946,6 +873,6 @@ async def _cached_ceiling(blog_id: str) -> Optional[Dict]:
     """
     try:
         from services.exposure_ceiling import _cache_get
-        return _cache_get(blog_id)
+        return await _cache_get(blog_id)
     except Exception:
         return None
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 월 검색량 — 모든 호출부가 쓰는 단일 창구 (영속 캐시 + 요청 합치기)
+
+예전에는 /keywordstool 을 부르는 곳마다 배치·서명·결과 처리를 따로 했다
+(NaverAdApiClient.get_keywords_volume_batch 직접 호출, exposure_ceiling._fetch_volumes
+의 자체 HMAC, post_exposure_analyzer 의 키워드당 1콜, VolumeFilterService,
+seo_page_builder, routers/naver_ad 의 풀 검증 루프들). 결과를 서로 나누지 않아서
+같은 키워드를 하루에도 여러 번 물었고, 단일 키워드 호출은 힌트 5칸 중 1칸만 썼다.
+
+    from services import keyword_volume as KV
+    vols = await KV.lookup(["제주 맛집", "서울 카페"], client=client)
+    vols["제주 맛집"]   → {"monthly_pc", "monthly_mobile", "monthly_total", "comp_idx"}
+                          None 이면 네이버 기준 검색량 없음, 키가 없으면 조회 실패(모름)
+    rows = await KV.related(seeds)   # 시드 + 응답에 딸려 온 연관 키워드 전부
+
+lookup:
+  1) SQLite 캐시(database/keyword_volume_db) — TTL 안이면 API 를 안 부른다.
+     힌트로 물었는데 응답에 없던 키워드도 음수 캐시로 남긴다.
+  2) 남은 키워드는 계정(자격증명)별 레인에 줄 세운다. 레인 워커가 줄에서 5개씩
+     꺼내 한 번에 묻는다 — 동시에 들어온 다른 호출자의 단일 키워드도 같은 배치에
+     탄다(5개가 안 차면 COALESCE_WINDOW 만큼 더 기다린다).
+     이미 누가 묻고 있는 키워드는 다시 줄 세우지 않고 그 결과를 같이 기다린다.
+  3) 응답에 공짜로 딸려 오는 relKeyword 행(힌트 5개당 최대 100개)도 전부 저장한다.
+     다음에 그 키워드를 묻는 호출은 API 없이 끝난다.
+레인 하나는 한 번에 한 콜만 보낸다(그래야 뒤에 온 호출자가 다음 배치에 모인다).
+콜 속도는 _request 의 keywordstool 버킷(services/naver_rate_governor)이 잡는다.
+
+related: 연관 키워드 확장이 목적이라 호출자의 시드끼리만 배치를 짠다(다른 호출자의
+시드를 섞으면 엉뚱한 연관어가 딸려 온다). 배치 응답 전체를 메모리 캐시에 두고,
+행은 lookup 과 같은 SQLite 캐시에도 저장한다.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from database import keyword_volume_db as KVDB
+from database.async_db import adb
+from services.memory_cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+# /keywordstool hintKeywords 최대 개수
+HINTS_PER_CALL = 5
+# 검색량은 월 단위(최근 30일) 지표라 며칠은 그대로 쓴다.
+TTL = float(os.environ.get("KEYWORD_VOLUME_TTL_HOURS", "72")) * 3600
+# "검색량 없음" 은 신규 키워드가 뜨면 바뀔 수 있어 짧게.
+NEGATIVE_TTL = float(os.environ.get("KEYWORD_VOLUME_NEGATIVE_TTL_HOURS", "24")) * 3600
+# 배치가 5개로 안 찼을 때 다른 호출자를 기다리는 시간.
+COALESCE_WINDOW = float(os.environ.get("KEYWORD_VOLUME_COALESCE_MS", "25")) / 1000
+
+# related() 의 배치 단위 응답 캐시 (app / worker 공유).
+_BATCH_CACHE = get_cache("keyword_volume_batch", max_entries=2000,
+                         max_bytes=32 * 1024 * 1024, ttl=86400,
+                         shared="keyword_volume_batch")
+
+_kvdb = adb(KVDB)
+
+
+def norm_keyword(keyword: str) -> str:
+    """캐시 키 — 네이버는 relKeyword 를 공백 없이, 영문은 대문자로 돌려준다."""
+    return "".join((keyword or "").split()).upper()
+
+
+def _public(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not row.get("found"):
+        return None
+    return {
+        "monthly_pc": int(row.get("monthly_pc") or 0),
+        "monthly_mobile": int(row.get("monthly_mobile") or 0),
+        "monthly_total": int(row.get("monthly_total") or 0),
+        "comp_idx": row.get("comp_idx") or "",
+    }
+
+
+# ─────────────────────────────────────────────────────────────
+# 레인 — 계정별 직렬 호출 + 합치기
+# ─────────────────────────────────────────────────────────────
+
+@dataclass
+class _Lane:
+    queue: Deque[Tuple[str, str, Any]] = field(default_factory=deque)  # (norm, hint, client)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    worker: Optional[asyncio.Task] = None
+
+
+class _State:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.lanes: Dict[Tuple, _Lane] = {}
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.default_client = None
+
+
+_state: Optional[_State] = None
+_stats = {"lookups": 0, "cache_hits": 0, "negative_hits": 0, "joined_inflight": 0,
+          "queued": 0, "calls": 0, "call_errors": 0, "hints_sent": 0, "rows_stored": 0,
+          "related_batch_hits": 0}
+
+
+def _get_state() -> _State:
+    """레인·in-flight 는 이벤트 루프에 묶인다. 루프가 바뀌면(스크립트의 asyncio.run 반복) 새로."""
+    global _state
+    loop = asyncio.get_running_loop()
+    if _state is None or _state.loop is not loop:
+        _state = _State(loop)
+    return _state
+
+
+def _lane_key(client) -> Tuple:
+    return (getattr(client, "customer_id", None), getattr(client, "api_key", None))
+
+
+def _default_client(st: _State):
+    """호출자가 client 를 안 주면 서버 설정(settings.NAVER_AD_*) 계정. 없으면 None."""
+    from config import settings
+    if not (settings.NAVER_AD_API_KEY and settings.NAVER_AD_SECRET_KEY
+            and settings.NAVER_AD_CUSTOMER_ID):
+        return None
+    if st.default_client is None:
+        from services.naver_ad_service import NaverAdApiClient
+        st.default_client = NaverAdApiClient()
+    return st.default_client
+
+
+async def _call(lane: _Lane, client, hints: List[str]) -> Dict[str, dict]:
+    """레인에서 한 콜. 응답 행과 음수 캐시를 저장한다."""
+    async with lane.lock:
+        asked_at = time.time()
+        _stats["calls"] += 1
+        _stats["hints_sent"] += len(hints)
+        try:
+            resp = await client.get_keywords_volume_batch(hints)
+        except Exception:
+            _stats["call_errors"] += 1
+            raise
+
+    resp = resp or {}
+    rows = [{"norm": norm_keyword(rel), "keyword": rel, **vals} for rel, vals in resp.items()
+            if norm_keyword(rel)]
+    returned = {r["norm"] for r in rows}
+    missing = [n for n in map(norm_keyword, hints) if n and n not in returned]
+    try:
+        _stats["rows_stored"] += await _kvdb.save_rows(rows, missing, asked_at=asked_at)
+    except Exception as e:  # 캐시 저장 실패가 조회 결과를 버리게 하진 않는다
+        logger.warning(f"[keyword_volume] 캐시 저장 실패: {e}")
+    return resp
+
+
+async def _drain(st: _State, key: Tuple, lane: _Lane) -> None:
+    """레인 워커 — 줄이 빌 때까지 5개씩 묶어 묻는다."""
+    try:
+        while lane.queue:
+            if len(lane.queue) < HINTS_PER_CALL and COALESCE_WINDOW > 0:
+                await asyncio.sleep(COALESCE_WINDOW)
+            batch = [lane.queue.popleft() for _ in range(min(HINTS_PER_CALL, len(lane.queue)))]
+            # 배치 첫 항목의 client 로 보낸다 — 그 주인이 이 결과를 기다리고 있으니 살아 있다.
+            client = batch[0][2]
+            futs = [(n, st.inflight.get(n)) for n, _, _ in batch]
+            try:
+                resp = await _call(lane, client, [h for _, h, _ in batch])
+                by_norm = {norm_keyword(rel): vals for rel, vals in resp.items()}
+                for n, fut in futs:
+                    if fut is not None and not fut.done():
+                        vals = by_norm.get(n)
+                        fut.set_result(dict(vals, found=1) if vals else {"found": 0})
+            except Exception as e:
+                for n, fut in futs:
+                    if fut is not None and not fut.done():
+                        fut.set_exception(e)
+            finally:
+                for n, fut in futs:
+                    if st.inflight.get(n) is fut:
+                        del st.inflight[n]
+    finally:
+        lane.worker = None
+        if lane.queue:  # 취소 등으로 빠져나왔는데 남은 게 있으면 다시 띄운다
+            lane.worker = asyncio.ensure_future(_drain(st, key, lane))
+
+
+async def lookup(keywords: Iterable[str], client=None, *,
+                 raise_errors: bool = False) -> Dict[str, Optional[Dict[str, Any]]]:
+    """키워드별 월 검색량.
+
+    반환: {입력 키워드: {monthly_pc, monthly_mobile, monthly_total, comp_idx} | None}
+      None     — 네이버 기준 검색량 없음(응답에 없었다)
+      키 없음  — 조회 실패. raise_errors=True 면 실패한 배치의 예외를 그대로 올린다.
+    client 를 안 주면 서버 설정 계정으로 묻는다(미설정이면 캐시에 있는 것만).
+    """
+    originals: Dict[str, str] = {}
+    for kw in keywords:
+        n = norm_keyword(kw)
+        if n and kw not in originals:
+            originals[kw] = n
+    if not originals:
+        return {}
+    _stats["lookups"] += 1
+    norms = list(dict.fromkeys(originals.values()))
+
+    known: Dict[str, Dict[str, Any]] = {}
+    try:
+        known = await _kvdb.get_many(norms, TTL, NEGATIVE_TTL)
+    except Exception as e:
+        logger.warning(f"[keyword_volume] 캐시 조회 실패 — API 로 진행: {e}")
+    for row in known.values():
+        _stats["cache_hits" if row.get("found") else "negative_hits"] += 1
+
+    todo = [n for n in norms if n not in known]
+    if todo:
+        st = _get_state()
+        client = client if client is not None else _default_client(st)
+        waits: Dict[str, asyncio.Future] = {}
+        if client is None:
+            logger.warning("[keyword_volume] 검색광고 API 미설정 — 캐시에 없는 검색량은 조회 불가")
+        else:
+            key = _lane_key(client)
+            lane = st.lanes.get(key)
+            if lane is None:
+                lane = st.lanes[key] = _Lane()
+            hint_of = {}
+            for kw, n in originals.items():
+                hint_of.setdefault(n, "".join(kw.split()))
+            for n in todo:
+                fut = st.inflight.get(n)
+                if fut is None:
+                    fut = st.inflight[n] = st.loop.create_future()
+                    lane.queue.append((n, hint_of[n], client))
+                    _stats["queued"] += 1
+                else:
+                    _stats["joined_inflight"] += 1
+                waits[n] = fut
+            if lane.queue and lane.worker is None:
+                lane.worker = asyncio.ensure_future(_drain(st, key, lane))
+
+        # shield — 이 호출자가 취소돼도 같은 키워드를 기다리는 다른 호출자의 결과는 살린다.
+        results = await asyncio.gather(*(asyncio.shield(f) for f in waits.values()),
+                                       return_exceptions=True)
+        first_error: Optional[BaseException] = None
+        for n, res in zip(waits, results):
+            if isinstance(res, BaseException):
+                first_error = first_error or res
+                continue
+            known[n] = res
+        if first_error is not None and raise_errors:
+            raise first_error
+        if first_error is not None:
+            logger.warning(f"[keyword_volume] 일부 배치 실패 ({len(todo)}개 중): {first_error}")
+
+    return {kw: _public(known[n]) for kw, n in originals.items() if n in known}
+
+
+async def related(seeds: Iterable[str], client=None, *,
+                  raise_errors: bool = False) -> Dict[str, Dict[str, Any]]:
+    """시드를 5개씩 힌트로 묻고 응답의 모든 행(시드 + 연관 키워드)을 돌려준다.
+
+    반환: {relKeyword(네이버 표기, 공백 없음): {monthly_pc, monthly_mobile, monthly_total, comp_idx}}
+    실패한 배치는 건너뛴다(로그만). raise_errors=True 면 예외를 올린다.
+    """
+    hints = list(dict.fromkeys(h for h in ("".join((s or "").split()) for s in seeds) if h))
+    if not hints:
+        return {}
+    st = _get_state()
+    client = client if client is not None else _default_client(st)
+    out: Dict[str, Dict[str, Any]] = {}
+    for i in range(0, len(hints), HINTS_PER_CALL):
+        batch = hints[i:i + HINTS_PER_CALL]
+        batch_key = ",".join(batch)
+        resp = await _BATCH_CACHE.aget(batch_key)
+        if resp is not None:
+            _stats["related_batch_hits"] += 1
+        elif client is None:
+            logger.warning("[keyword_volume] 검색광고 API 미설정 — 연관 키워드 조회 불가")
+            break
+        else:
+            key = _lane_key(client)
+            lane = st.lanes.get(key)
+            if lane is None:
+                lane = st.lanes[key] = _Lane()
+            try:
+                resp = await _call(lane, client, batch)
+            except Exception as e:
+                if raise_errors:
+                    raise
+                logger.warning(f"[keyword_volume] related batch 실패 {batch}: {e}")
+                continue
+            await _BATCH_CACHE.aset(batch_key, resp)
+        for rel, vals in resp.items():
+            out.setdefault(rel, vals)
+    return out
+
+
+def volume_stats() -> Dict[str, Any]:
+    """이 프로세스의 조회·캐시·콜 카운터 + 레인 대기열."""
+    st = _state
+    lanes = [{"customer_id": k[0], "queued": len(l.queue), "running": l.worker is not None}
+             for k, l in (st.lanes.items() if st else [])]
+    return {**_stats, "inflight": len(st.inflight) if st else 0, "lanes": lanes}
+
+
+async def clear_cache() -> None:
+    """영속 캐시·배치 캐시를 비운다 (테스트·강제 재조회용)."""
+    await _kvdb.clear_volumes()
+    _BATCH_CACHE.clear()
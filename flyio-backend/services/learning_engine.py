@@ -17,6 +17,20 @@ from datetime import datetime
 import uuid
 import json
 
+from services.learning_matrix import (
+    WEIGHT_KEYS,
+    FeatureMatrix,
+    build_feature_matrix,
+    flatten_weights,
+    score_matrix,
+)
+from services.grouped_ranking import (
+    GroupIndex,
+    build_group_index,
+    grouped_metrics,
+    grouped_rank_loss,
+)
+
 # 2025 네이버 AI 신뢰도 평가 서비스
 try:
     from services.trust_score_service import (
@@ -290,9 +304,26 @@ def calculate_combined_score(blog_features: Dict, post_features: Dict, weights:
 # ==============================================
 # PREDICTION & LOSS CALCULATION
 # ==============================================
-def calculate_predicted_scores(samples: List[Dict], weights: Dict) -> np.ndarray:
+def calculate_predicted_scores(
+    samples: List[Dict],
+    weights: Dict,
+    matrix: Optional[FeatureMatrix] = None
+) -> np.ndarray:
     """Calculate predicted scores for all samples
 
+    열 단위 스코어러(services/learning_matrix.py)로 한 번에 계산한다.
+    학습 루프처럼 같은 샘플을 여러 번 채점할 땐 build_feature_matrix(samples)
+    결과를 matrix 로 넘겨 재사용할 것 — 샘플 파싱은 그때 한 번뿐이다.
+    결과는 calculate_predicted_scores_scalar 와 같다(tests/test_learning_matrix.py).
+    """
+    if matrix is None:
+        matrix = build_feature_matrix(samples)
+    return score_matrix(matrix, flatten_weights(weights))
+
+
+def calculate_predicted_scores_scalar(samples: List[Dict], weights: Dict) -> np.ndarray:
+    """샘플별 calculate_blog_score 루프 — 벡터 스코어러의 기준(reference) 구현
+
     핵심 수정: 모든 피처를 calculate_blog_score에 전달
     - 블로그 지수: c_rank_score, dia_score
     - 글 콘텐츠: heading_count, paragraph_count, content_length, image_count, etc.
@@ -363,6 +394,28 @@ def calculate_rank_loss(actual_ranks: np.ndarray, predicted_scores: np.ndarray)
     return loss, spearman_corr, kendall_corr
 
 
+def calculate_rank_loss_by_keyword(
+    samples: List[Dict],
+    predicted_scores: np.ndarray,
+    groups: Optional[GroupIndex] = None
+) -> Tuple[float, float, float]:
+    """
+    calculate_rank_loss 의 키워드 그룹 버전 — 그룹별 (loss, spearman, kendall) 의 평균
+
+    전체 풀로 상관계수를 내면 키워드A 1위와 키워드B 1위를 같은 축에 놓게 된다.
+    그룹 규칙은 calculate_exact_match_rate_by_keyword 와 같다.
+    """
+    if groups is None:
+        groups = build_group_index(samples)
+    if groups.n_groups == 0:
+        return 1.0, 0.0, 0.0
+    gm = grouped_metrics(groups, predicted_scores)
+    spearman_corr = float(np.mean(gm.spearman))
+    kendall_corr = float(np.mean(gm.kendall))
+    loss = float(np.mean(1.0 - (gm.spearman * 0.6 + gm.kendall * 0.4)))
+    return loss, spearman_corr, kendall_corr
+
+
 def calculate_exact_match_rate(actual_ranks: np.ndarray, predicted_scores: np.ndarray) -> Dict[str, float]:
     """
     Calculate exact match rates for different thresholds
@@ -384,98 +437,61 @@ def calculate_exact_match_rate(actual_ranks: np.ndarray, predicted_scores: np.nd
     }
 
 
-def calculate_exact_match_rate_by_keyword(samples: List[Dict], predicted_scores: np.ndarray) -> Dict[str, float]:
+def calculate_exact_match_rate_by_keyword(
+    samples: List[Dict],
+    predicted_scores: np.ndarray,
+    groups: Optional[GroupIndex] = None
+) -> Dict[str, float]:
     """
     키워드별로 그룹화해서 정확도 계산 (핵심 수정!)
 
     같은 키워드 내에서만 순위를 예측해야 정확함
     예: 키워드A의 1-13위, 키워드B의 1-13위 각각 따로 계산
-    """
-    from collections import defaultdict
-
-    # 키워드별로 그룹화.
-    #
-    # ⚠️ 같은 키워드를 여러 번 수집하면 한 그룹에 같은 블로그가 여러 번 들어온다.
-    # 그대로 rankdata 를 돌리면 예측 순위는 1..60 으로 매겨지는데 actual_rank 는
-    # 1..10 뿐이라, 모델이 완벽해도 편차가 폭발한다. 실제로 '대출' 그룹이
-    # 6회 수집 × 10블로그 = 60개였고 그래서 정확도가 무작위(1/N)보다 낮은
-    # 4.7% 로 표시되고 있었다(spearman 0.022 = 무상관).
-    # → 키워드 안에서 blog_id 로 중복을 제거하고 **최신 수집분만** 남긴다.
-    # samples 는 collected_at DESC 로 오므로 먼저 만난 것이 최신이다.
-    keyword_groups = defaultdict(list)
-    seen = set()
-    for i, sample in enumerate(samples):
-        keyword = sample.get('keyword', 'unknown')
-        dedup_key = (keyword, sample.get('blog_id'))
-        if dedup_key in seen:
-            continue
-        seen.add(dedup_key)
-        # ⚠️ 본문을 못 읽은 샘플은 콘텐츠 피처가 전부 0 이다. '짧은 글'과
-        # 구분되지 않아 학습을 오염시키므로 지표 계산에서 뺀다.
-        # 0 = 이번에 읽기 실패 / NULL(None) = 플래그 도입 전 데이터라 판단 보류
-        # (그것까지 빼면 기존 6,470건이 통째로 사라져 지표가 비어버린다).
-        if sample.get('content_parsed') == 0:
-            continue
-        keyword_groups[keyword].append({
-            'index': i,
-            'actual_rank': sample.get('actual_rank', 0),
-            'predicted_score': predicted_scores[i]
-        })
-
-    all_differences = []
-
-    for keyword, group in keyword_groups.items():
-        if len(group) < 2:
-            continue
 
-        # 이 키워드 내에서만 순위 예측
-        scores = np.array([g['predicted_score'] for g in group])
-        actual_ranks = np.array([g['actual_rank'] for g in group])
+    ⚠️ 같은 키워드를 여러 번 수집하면 한 그룹에 같은 블로그가 여러 번 들어온다.
+    그대로 rankdata 를 돌리면 예측 순위는 1..60 으로 매겨지는데 actual_rank 는
+    1..10 뿐이라, 모델이 완벽해도 편차가 폭발한다. 실제로 '대출' 그룹이
+    6회 수집 × 10블로그 = 60개였고 그래서 정확도가 무작위(1/N)보다 낮은
+    4.7% 로 표시되고 있었다(spearman 0.022 = 무상관).
+    → 키워드 안에서 blog_id 로 중복을 제거하고 **최신 수집분만** 남긴다.
 
-        # 점수 기반 예측 순위 (높은 점수 = 낮은 순위 번호)
-        predicted_ranks = rankdata(-scores, method='ordinal')
-
-        # 차이 계산
-        differences = np.abs(predicted_ranks - actual_ranks)
-        all_differences.extend(differences.tolist())
+    ⚠️ 본문을 못 읽은 샘플(content_parsed = 0)은 콘텐츠 피처가 전부 0 이라
+    '짧은 글'과 구분되지 않으므로 뺀다. NULL 은 플래그 도입 전 데이터라 남긴다
+    (그것까지 빼면 기존 6,470건이 통째로 사라져 지표가 비어버린다).
 
-    if not all_differences:
-        return {
-            'exact_match': 0.0, 'within_1': 0.0, 'within_2': 0.0,
-            'within_3': 0.0, 'avg_deviation': 13.0, 'max_deviation': 13.0
-        }
-
-    differences = np.array(all_differences)
-    n = len(differences)
-
-    return {
-        'exact_match': float((differences == 0).sum() / n * 100),
-        'within_1': float((differences <= 1).sum() / n * 100),
-        'within_2': float((differences <= 2).sum() / n * 100),
-        'within_3': float((differences <= 3).sum() / n * 100),
-        'avg_deviation': float(np.mean(differences)),
-        'max_deviation': float(np.max(differences)),
-    }
+    그룹 구성·순위 계산은 services/grouped_ranking.py 가 정렬 몇 번으로 한다.
+    같은 샘플로 여러 번 부를 땐 build_group_index(samples) 를 groups 로 넘길 것.
+    """
+    if groups is None:
+        groups = build_group_index(samples)
+    return grouped_metrics(groups, predicted_scores).summary
 
 
 # ==============================================
 # GRADIENT CALCULATION (Numerical Differentiation)
 # ==============================================
-def calculate_all_gradients(samples: List[Dict], weights: Dict, epsilon: float = 0.0001) -> Dict:
+def calculate_all_gradients(
+    samples: List[Dict],
+    weights: Dict,
+    epsilon: float = 0.0001,
+    matrix: Optional[FeatureMatrix] = None
+) -> Dict:
     """
     Calculate gradients for ALL weight parameters using numerical differentiation
 
     More aggressive gradient calculation for faster convergence
     """
+    if matrix is None:
+        matrix = build_feature_matrix(samples)
     actual_ranks = np.array([s['actual_rank'] for s in samples])
-    base_scores = calculate_predicted_scores(samples, weights)
+    base_scores = calculate_predicted_scores(samples, weights, matrix)
     base_loss, _, _ = calculate_rank_loss(actual_ranks, base_scores)
 
     gradients = {}
 
     # Helper function to perturb and calculate gradient
     def calc_gradient(weights_copy, path, epsilon):
-        perturbed_scores = calculate_predicted_scores(samples, weights_copy)
+        perturbed_scores = calculate_predicted_scores(samples, weights_copy, matrix)
         perturbed_loss, _, _ = calculate_rank_loss(actual_ranks, perturbed_scores)
         return (perturbed_loss - base_loss) / epsilon
 
@@ -545,6 +561,37 @@ def calculate_all_gradients(samples: List[Dict], weights: Dict, epsilon: float =
     return gradients
 
 
+def calculate_batched_gradients(
+    samples: List[Dict],
+    weights: Dict,
+    epsilon: float = 0.0001,
+    matrix: Optional[FeatureMatrix] = None,
+    groups: Optional[GroupIndex] = None
+) -> Dict:
+    """
+    calculate_all_gradients 의 배치 버전 — 모든 파라미터를 한 번에 섭동한다.
+
+    가중치 벡터 w 에 epsilon·I 를 더한 (p × p) 섭동 행렬을 score_matrix 한 번으로
+    채점하고, 손실도 (p × n) 점수 행렬 전체를 한 번에 매긴다. 파라미터마다
+    JSON 딥카피 + 전 샘플 재채점을 하던 것을 행렬곱 한 번으로 바꾼 것이다.
+
+    손실은 키워드 그룹별 rank loss 의 평균이다(grouped_rank_loss) — 정확도 지표
+    (calculate_exact_match_rate_by_keyword)와 같은 그룹 기준으로 기울기를 잡는다.
+    반환 키는 calculate_all_gradients 와 같다.
+    """
+    if matrix is None:
+        matrix = build_feature_matrix(samples)
+    if groups is None:
+        groups = build_group_index(samples)
+
+    w = flatten_weights(weights)
+    perturbed = w[None, :] + epsilon * np.eye(len(w))
+    scores = score_matrix(matrix, np.vstack([w[None, :], perturbed]))
+    losses = grouped_rank_loss(groups, scores)
+    grads = (losses[1:] - losses[0]) / epsilon
+    return {key: float(g) for key, g in zip(WEIGHT_KEYS, grads)}
+
+
 # ==============================================
 # INSTANT ADJUSTMENT (Real-time learning)
 # ==============================================
@@ -554,7 +601,8 @@ def instant_adjust_weights(
     target_accuracy: float = 99.0,
     max_iterations: int = 100,
     learning_rate: float = 0.05,
-    momentum: float = 0.9
+    momentum: float = 0.9,
+    gradient_engine: str = 'batched'
 ) -> Tuple[Dict, Dict]:
     """
     INSTANT weight adjustment to match Naver's actual ranking
@@ -564,6 +612,10 @@ def instant_adjust_weights(
     Uses momentum-based gradient descent for faster convergence
 
     핵심 수정: 키워드별로 그룹화해서 순위 예측 및 정확도 계산
+
+    gradient_engine:
+        'batched' — calculate_batched_gradients (섭동 행렬 한 번, 키워드 그룹별 손실)
+        'numeric' — calculate_all_gradients (파라미터별 재채점, 전체 풀 손실)
     """
     start_time = time.time()
 
@@ -593,11 +645,13 @@ def instant_adjust_weights(
             weights['content_factors'] = {}
         weights['content_factors']['sub_weights'] = json.loads(json.dumps(DEFAULT_WEIGHTS['content_factors']['sub_weights']))
 
-    actual_ranks = np.array([s['actual_rank'] for s in samples])
+    # 샘플은 반복 내내 그대로다 — 피처 행렬·키워드 그룹은 한 번만 만든다
+    matrix = build_feature_matrix(samples)
+    groups = build_group_index(samples)
 
     # Initial metrics - 키워드별 정확도 계산 (핵심 수정!)
-    initial_scores = calculate_predicted_scores(samples, weights)
-    initial_metrics = calculate_exact_match_rate_by_keyword(samples, initial_scores)
+    initial_scores = calculate_predicted_scores(samples, weights, matrix)
+    initial_metrics = calculate_exact_match_rate_by_keyword(samples, initial_scores, groups)
     initial_accuracy = initial_metrics['within_3']  # ±3 accuracy as main metric (더 현실적)
 
     # Momentum storage
@@ -610,8 +664,8 @@ def instant_adjust_weights(
 
     for iteration in range(max_iterations):
         # Calculate current metrics - 키워드별 정확도 계산 (핵심 수정!)
-        predicted_scores = calculate_predicted_scores(samples, weights)
-        metrics = calculate_exact_match_rate_by_keyword(samples, predicted_scores)
+        predicted_scores = calculate_predicted_scores(samples, weights, matrix)
+        metrics = calculate_exact_match_rate_by_keyword(samples, predicted_scores, groups)
         current_accuracy = metrics['within_3']
 
         # Check if target reached
@@ -625,7 +679,10 @@ def instant_adjust_weights(
             best_weights = json.loads(json.dumps(weights))
 
         # Calculate gradients
-        gradients = calculate_all_gradients(samples, weights)
+        if gradient_engine == 'batched':
+            gradients = calculate_batched_gradients(samples, weights, matrix=matrix, groups=groups)
+        else:
+            gradients = calculate_all_gradients(samples, weights, matrix=matrix)
 
         # Update weights with momentum
         for key, grad in gradients.items():
@@ -662,7 +719,7 @@ def instant_adjust_weights(
         weights = constrain_weights(weights)
 
         # Record history
-        loss, spearman, kendall = calculate_rank_loss(actual_ranks, predicted_scores)
+        loss, spearman, kendall = calculate_rank_loss_by_keyword(samples, predicted_scores, groups)
         history.append({
             'iteration': iteration,
             'accuracy': float(current_accuracy),
@@ -680,9 +737,9 @@ def instant_adjust_weights(
     weights = best_weights
 
     # Final metrics - 키워드별 정확도 계산 (핵심 수정!)
-    final_scores = calculate_predicted_scores(samples, weights)
-    final_metrics = calculate_exact_match_rate_by_keyword(samples, final_scores)
-    _, final_spearman, final_kendall = calculate_rank_loss(actual_ranks, final_scores)
+    final_scores = calculate_predicted_scores(samples, weights, matrix)
+    final_metrics = calculate_exact_match_rate_by_keyword(samples, final_scores, groups)
+    _, final_spearman, final_kendall = calculate_rank_loss_by_keyword(samples, final_scores, groups)
 
     duration = time.time() - start_time
 
@@ -701,6 +758,7 @@ def instant_adjust_weights(
         'spearman_correlation': float(final_spearman),
         'kendall_tau': float(final_kendall),
         'target_reached': final_metrics['within_3'] >= target_accuracy,
+        'gradient_engine': gradient_engine,
         'weight_changes': calculate_weight_changes(current_weights, weights)
     }
 
@@ -920,7 +978,8 @@ def train_model(
     initial_weights: Dict,
     learning_rate: float = 0.01,
     epochs: int = 50,
-    min_samples: int = 1
+    min_samples: int = 1,
+    gradient_engine: str = 'batched'
 ) -> Tuple[Dict, Dict]:
     """
     Train the model - now uses instant_adjust_weights for better results
@@ -935,7 +994,8 @@ def train_model(
         target_accuracy=95.0,
         max_iterations=epochs * 2,
         learning_rate=learning_rate * 5,  # More aggressive
-        momentum=0.9
+        momentum=0.9,
+        gradient_engine=gradient_engine
     )
 
     # Convert to legacy format
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+학습 엔진 열(column) 단위 스코어러 — calculate_blog_score 의 벡터화 버전.
+
+왜 필요한가
+    calculate_predicted_scores 는 샘플마다 피처 dict 를 새로 만들고
+    calculate_blog_score 를 파이썬 루프로 돌린다. instant_adjust_weights 는
+    반복 1회마다 그걸 (기울기 파라미터 수 + 1)번 다시 돌리므로,
+    learning_samples 수만 건이면 학습 한 번에 몇 분이 걸렸다.
+
+구조
+    1) build_feature_matrix(samples) — 샘플을 **한 번만** 읽어 NumPy 행렬로 만든다.
+       원시 열(raw) + NULL 마스크(null)를 같이 보관하고, 가중치와 무관한
+       0~100 점 변환(길이 3000자 기준, 최신성 구간 등)도 여기서 끝낸다.
+    2) flatten_weights(weights) — 가중치 dict 를 WEIGHT_KEYS 순서의 벡터로.
+       누락 키의 기본값은 calculate_blog_score 의 .get(..., 기본값) 과 같다.
+    3) score_matrix(fm, w) — 행렬곱 몇 번으로 전 샘플 점수를 낸다.
+
+점수는 가중치에 대해 "메인 가중치 × (블록 피처 · 하위 가중치)" 꼴이라
+    score = c_w·(c_base + C·w_c) + d_w·(d_base + D·w_d) + cf_w·(F·w_f) + B·w_b
+로 정확히 분해된다. c_base 는 하위 점수가 없을 때 쓰는 c_rank_score
+(하위 점수가 있으면 0), C 는 그 반대다 — 스칼라 경로의 if/else 와 동일.
+
+⚠️ 스칼라 경로와 점수가 같아야 한다. `x or 50` 은 0 도 50 으로 바꾸는 등
+   파이썬 truthiness 규칙을 그대로 재현했다. 고치면 tests/test_learning_matrix.py 를 돌릴 것.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+# 가중치 벡터의 순서. 키 이름은 calculate_all_gradients 의 기울기 키와 같다.
+C_RANK_SUBS = ('context', 'content', 'chain')
+DIA_SUBS = ('depth', 'information', 'accuracy')
+CONTENT_SUBS = (
+    'content_length', 'heading_count', 'paragraph_count', 'image_count',
+    'keyword_count', 'keyword_density', 'freshness', 'title_keyword',
+)
+EXTRA_FACTORS = ('post_count', 'neighbor_count', 'visitor_count')
+BONUS_FACTORS = ('has_map', 'has_link', 'video_count', 'engagement')
+
+WEIGHT_KEYS: List[str] = (
+    ['c_rank.weight', 'dia.weight']
+    + [f'c_rank.{s}' for s in C_RANK_SUBS]
+    + [f'dia.{s}' for s in DIA_SUBS]
+    + [f'extra.{f}' for f in EXTRA_FACTORS]
+    + [f'content.{f}' for f in CONTENT_SUBS]
+    + ['content_factors.weight']
+    + [f'bonus.{f}' for f in BONUS_FACTORS]
+)
+WEIGHT_INDEX: Dict[str, int] = {k: i for i, k in enumerate(WEIGHT_KEYS)}
+
+# calculate_blog_score 의 .get(..., 기본값) 과 같은 값
+_DEFAULT_MAIN = {'c_rank': 0.25, 'dia': 0.25, 'content_factors': 0.50}
+_DEFAULT_C_SUB = {'context': 0.35, 'content': 0.40, 'chain': 0.25}
+_DEFAULT_D_SUB = {'depth': 0.33, 'information': 0.34, 'accuracy': 0.33}
+_DEFAULT_CONTENT_SUB = {
+    'content_length': 0.15, 'heading_count': 0.12, 'paragraph_count': 0.10,
+    'image_count': 0.12, 'keyword_count': 0.15, 'keyword_density': 0.08,
+    'freshness': 0.15, 'title_keyword': 0.13,
+}
+_DEFAULT_BONUS = {'has_map': 0.03, 'has_link': 0.02, 'video_count': 0.05, 'engagement': 0.05}
+
+# 스코어러가 읽는 원시 열. calculate_predicted_scores 가 피처 dict 에 담던 것과 같다.
+RAW_COLUMNS = (
+    'c_rank_score', 'dia_score', 'post_count', 'neighbor_count', 'visitor_count',
+    'context_score', 'content_score', 'chain_score',
+    'depth_score', 'information_score', 'accuracy_score',
+    'content_length', 'heading_count', 'paragraph_count', 'image_count',
+    'keyword_count', 'keyword_density', 'post_age_days', 'title_has_keyword',
+    'has_map', 'has_link', 'video_count', 'like_count', 'comment_count',
+)
+
+
+@dataclass
+class FeatureMatrix:
+    """샘플 n 건을 열 단위로 편 것. 가중치가 바뀌어도 다시 만들 필요가 없다."""
+    n: int
+    raw: Dict[str, np.ndarray] = field(default_factory=dict)   # 열 → float64 (NULL 은 NaN)
+    null: Dict[str, np.ndarray] = field(default_factory=dict)  # 열 → bool (값이 None)
+    c_base: np.ndarray = None   # (n,)   하위 점수가 없는 샘플의 c_rank_score
+    c_sub: np.ndarray = None    # (n, 3) context/content/chain (없으면 0 행)
+    d_base: np.ndarray = None   # (n,)
+    d_sub: np.ndarray = None    # (n, 3) depth/information/accuracy
+    content: np.ndarray = None  # (n, 8) CONTENT_SUBS 순서의 0~100 점
+    bonus: np.ndarray = None    # (n, 4) BONUS_FACTORS 순서의 0~100 점
+
+
+def _column(samples: Sequence[Dict], key: str):
+    """열 하나를 (값, NULL 마스크) 로. bool 은 0/1 로 바뀐다."""
+    vals = [s.get(key) for s in samples]
+    null = np.fromiter((v is None for v in vals), dtype=bool, count=len(vals))
+    arr = np.fromiter((np.nan if v is None else float(v) for v in vals),
+                      dtype=np.float64, count=len(vals))
+    return arr, null
+
+
+def _or(arr: np.ndarray, null: np.ndarray, default: float) -> np.ndarray:
+    """파이썬 `x or default` — None 과 0 을 모두 default 로."""
+    return np.where(null | (arr == 0), default, arr)
+
+
+def _capped(arr: np.ndarray, cap: float) -> np.ndarray:
+    """min(x / cap, 1.0) * 100"""
+    return np.minimum(arr / cap, 1.0) * 100
+
+
+def build_feature_matrix(samples: Sequence[Dict]) -> FeatureMatrix:
+    """learning_samples 행 목록을 FeatureMatrix 로. O(n) 한 번."""
+    n = len(samples)
+    fm = FeatureMatrix(n=n)
+    for key in RAW_COLUMNS:
+        fm.raw[key], fm.null[key] = _column(samples, key)
+    raw, null = fm.raw, fm.null
+
+    def val(key, default=0.0):
+        return _or(raw[key], null[key], default)
+
+    # ----- C-Rank / D.I.A. : 하위 점수가 있으면 하위 가중합, 없으면 총점 -----
+    has_ctx = ~null['context_score']
+    c_sub = np.column_stack([val('context_score', 50), val('content_score', 50), val('chain_score', 50)])
+    fm.c_sub = np.where(has_ctx[:, None], c_sub, 0.0)
+    fm.c_base = np.where(has_ctx, 0.0, val('c_rank_score'))
+
+    has_depth = ~null['depth_score']
+    d_sub = np.column_stack([val('depth_score', 50), val('information_score', 50), val('accuracy_score', 50)])
+    fm.d_sub = np.where(has_depth[:, None], d_sub, 0.0)
+    fm.d_base = np.where(has_depth, 0.0, val('dia_score'))
+
+    # ----- 글 콘텐츠 (CONTENT_SUBS 순서) -----
+    density = val('keyword_density')
+    density_score = np.where(
+        density <= 1.5,
+        np.minimum(density / 1.0, 1.0) * 100,
+        np.maximum(0, 100 - (density - 1.5) * 30),
+    )
+    age = raw['post_age_days']
+    freshness = np.select(
+        [age <= 1, age <= 7, age <= 30, age <= 90, age <= 180],
+        [100, 90, 70, 50, 30],
+        default=10,
+    ).astype(np.float64)
+    freshness[null['post_age_days']] = 50  # 알 수 없으면 중간값
+    title = np.where(null['title_has_keyword'] | (raw['title_has_keyword'] == 0), 0.0, 100.0)
+    fm.content = np.column_stack([
+        _capped(val('content_length'), 3000),
+        _capped(val('heading_count'), 10),
+        _capped(val('paragraph_count'), 20),
+        _capped(val('image_count'), 15),
+        _capped(val('keyword_count'), 10),
+        density_score,
+        freshness,
+        title,
+    ])
+
+    # ----- 보너스 (BONUS_FACTORS 순서) -----
+    engagement = val('like_count') + val('comment_count') * 2
+    fm.bonus = np.column_stack([
+        np.where(val('has_map') != 0, 100.0, 0.0),
+        np.where(val('has_link') != 0, 100.0, 0.0),
+        _capped(val('video_count'), 3),
+        _capped(engagement, 50),
+    ])
+    return fm
+
+
+def flatten_weights(weights: Dict) -> np.ndarray:
+    """가중치 dict → WEIGHT_KEYS 순서 벡터."""
+    c = weights.get('c_rank', {})
+    d = weights.get('dia', {})
+    cf = weights.get('content_factors', {})
+    extra = weights.get('extra_factors', {})
+    bonus = weights.get('bonus_factors', {})
+    c_sub = c.get('sub_weights', {})
+    d_sub = d.get('sub_weights', {})
+    cf_sub = cf.get('sub_weights', {})
+
+    vec = np.zeros(len(WEIGHT_KEYS), dtype=np.float64)
+    vec[WEIGHT_INDEX['c_rank.weight']] = c.get('weight', _DEFAULT_MAIN['c_rank'])
+    vec[WEIGHT_INDEX['dia.weight']] = d.get('weight', _DEFAULT_MAIN['dia'])
+    vec[WEIGHT_INDEX['content_factors.weight']] = cf.get('weight', _DEFAULT_MAIN['content_factors'])
+    for s in C_RANK_SUBS:
+        vec[WEIGHT_INDEX[f'c_rank.{s}']] = c_sub.get(s, _DEFAULT_C_SUB[s])
+    for s in DIA_SUBS:
+        vec[WEIGHT_INDEX[f'dia.{s}']] = d_sub.get(s, _DEFAULT_D_SUB[s])
+    for f in CONTENT_SUBS:
+        vec[WEIGHT_INDEX[f'content.{f}']] = cf_sub.get(f, _DEFAULT_CONTENT_SUB[f])
+    for f in EXTRA_FACTORS:
+        vec[WEIGHT_INDEX[f'extra.{f}']] = extra.get(f, 0.0)
+    for f in BONUS_FACTORS:
+        vec[WEIGHT_INDEX[f'bonus.{f}']] = bonus.get(f, _DEFAULT_BONUS[f])
+    return vec
+
+
+_C_SUB_IDX = [WEIGHT_INDEX[f'c_rank.{s}'] for s in C_RANK_SUBS]
+_D_SUB_IDX = [WEIGHT_INDEX[f'dia.{s}'] for s in DIA_SUBS]
+_CONTENT_IDX = [WEIGHT_INDEX[f'content.{f}'] for f in CONTENT_SUBS]
+_BONUS_IDX = [WEIGHT_INDEX[f'bonus.{f}'] for f in BONUS_FACTORS]
+
+
+def score_matrix(fm: FeatureMatrix, w: np.ndarray) -> np.ndarray:
+    """
+    전 샘플 점수. w 가 (p,) 면 (n,), (k, p) 면 가중치 k 벌을 한 번에 (k, n).
+
+    extra_factors 는 calculate_blog_score 가 쓰지 않으므로 점수에 영향이 없다.
+    """
+    w = np.asarray(w, dtype=np.float64)
+    W = np.atleast_2d(w)
+    c_final = fm.c_base[None, :] + W[:, _C_SUB_IDX] @ fm.c_sub.T
+    d_final = fm.d_base[None, :] + W[:, _D_SUB_IDX] @ fm.d_sub.T
+    content = W[:, _CONTENT_IDX] @ fm.content.T
+    bonus = W[:, _BONUS_IDX] @ fm.bonus.T
+    scores = (
+        W[:, [WEIGHT_INDEX['c_rank.weight']]] * c_final
+        + W[:, [WEIGHT_INDEX['dia.weight']]] * d_final
+        + W[:, [WEIGHT_INDEX['content_factors.weight']]] * content
+        + bonus
+    )
+    return scores[0] if w.ndim == 1 else scores
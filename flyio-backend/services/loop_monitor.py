@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+"""
+이벤트 루프 건강 감시 — 루프 지연 표본 + 막힌 동안의 스택 샘플링
+
+app·worker·verdict_worker 는 전부 asyncio 루프 하나 위에서 돈다. KeywordPoolScheduler
+의 APScheduler job, 동기 sqlite 호출, BeautifulSoup 파싱, to_thread 없이 부르는
+OpenAI·pandas 작업이 전부 같은 루프다. 루프가 막혔다는 사실은 지금까지
+WorkerOffloadMiddleware 의 8s ReadTimeout 이나 APScheduler 의 'was missed by' 로그로만
+알았고, **누가** 막았는지는 추측해야 했다.
+
+    from services.loop_monitor import start_loop_monitor, loop_stats
+    start_loop_monitor("worker")     # lifespan 에서 한 번 (루프 안에서)
+    loop_stats()                     # /api/admin/loop-health
+
+두 조각으로 돈다.
+  - 표본 코루틴: INTERVAL 초마다 sleep 하고, 예정보다 늦게 깬 만큼을 지연(lag)으로 적는다.
+    최근 WINDOW 개로 p50/p90/p99/max 를 낸다.
+  - 감시 스레드: 표본 코루틴이 예정 시각보다 THRESHOLD 이상 안 깨면 루프가 막힌 것이다.
+    그동안 SAMPLE_EVERY 초마다 루프 스레드의 스택(sys._current_frames)을 떠서, 앱 코드 중
+    가장 안쪽 프레임(호출 지점)별로 "막힌 시간"을 쌓는다. 스택에 APScheduler job 함수가
+    있으면 그 job 에도 쌓는다(track_scheduler).
+
+비용: 평소엔 INTERVAL 마다 sleep 한 번 + 감시 스레드가 float 하나 읽기. 스택은 막혔을
+때만 뜬다. 그래서 프로덕션에서 켜 둔다(끄려면 LOOP_MONITOR=0).
+
+한계: GIL 을 놓지 않는 C 코드(일부 파서·정규식)가 막고 있으면 감시 스레드도 그 호출이
+끝날 때까지 스택을 못 뜬다. 그런 정체는 지연만 잡히고 호출 지점은 '(unsampled)' 로 남는다.
+
+프로세스마다 따로 돌고, 감시 스레드가 PUBLISH_EVERY 초마다 요약을 공유 캐시
+(services/shared_cache)에 올린다 — app 이 받은 관리자 요청에서 worker 상태도 보이도록.
+루프가 막혀 있어도 스레드가 올리므로 막힌 프로세스의 요약이 제일 먼저 보인다.
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.environ.get("LOOP_MONITOR", "1") != "0"
+INTERVAL = float(os.environ.get("LOOP_MONITOR_INTERVAL", "0.25"))
+THRESHOLD = float(os.environ.get("LOOP_MONITOR_THRESHOLD", "0.5"))      # 이보다 늦으면 정체
+SAMPLE_EVERY = float(os.environ.get("LOOP_MONITOR_SAMPLE_EVERY", "0.25"))
+LOG_OVER = float(os.environ.get("LOOP_MONITOR_LOG_OVER", "5"))          # 이보다 길면 경고 로그
+WINDOW = int(os.environ.get("LOOP_MONITOR_WINDOW", "2400"))             # 지연 표본 (~10분)
+PUBLISH_EVERY = float(os.environ.get("LOOP_MONITOR_PUBLISH_EVERY", "15"))
+MAX_SITES = 200
+MAX_STACK = 20
+RECENT = 50
+
+SHARED_NS = "loop_health"
+PROCESS_NAMES = ("app", "worker", "verdict", "all")
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_THIS = os.path.abspath(__file__)
+_UNSAMPLED = "(unsampled)"
+
+
+def _rel(path: str) -> str:
+    return os.path.relpath(path, _ROOT) if path.startswith(_ROOT) else path
+
+
+def _is_app(path: str) -> bool:
+    return path.startswith(_ROOT) and "site-packages" not in path and path != _THIS
+
+
+class _Site:
+    __slots__ = ("samples", "stalls", "blocked_s", "max_stall", "last_ts", "leaf", "stack", "jobs")
+
+    def __init__(self):
+        self.samples = 0
+        self.stalls = 0
+        self.blocked_s = 0.0
+        self.max_stall = 0.0
+        self.last_ts = 0.0
+        self.leaf = ""
+        self.stack: List[str] = []
+        self.jobs: Counter = Counter()
+
+
+class _Stall:
+    """지금 진행 중인 정체 하나 — 감시 스레드가 채우고, 루프가 깨면 표본 코루틴이 닫는다."""
+
+    __slots__ = ("started", "sites", "job")
+
+    def __init__(self, started: float):
+        self.started = started
+        self.sites: Counter = Counter()
+        self.job: Optional[str] = None
+
+
+class _Monitor:
+    """프로세스에 하나. 루프가 바뀌어도(테스트) 집계는 이어진다."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.name = "all"
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[int] = None
+        self.task: Optional[asyncio.Task] = None
+        self.thread: Optional[threading.Thread] = None
+        self.stop = threading.Event()
+        self.started_at = 0.0
+        # 표본 코루틴이 sleep 에 들어간 시각(monotonic). 감시 스레드는 이것만 읽는다.
+        self.tick = 0.0
+        self.lags: deque = deque(maxlen=WINDOW)
+        self.total_samples = 0
+        self.stall_count = 0
+        self.stall_total = 0.0
+        self.max_lag = 0.0
+        self.current: Optional[_Stall] = None
+        self.sites: Dict[str, _Site] = {}
+        self.jobs: Dict[str, Dict[str, float]] = {}
+        self.job_codes: Dict[Any, str] = {}
+        self.recent: deque = deque(maxlen=RECENT)
+        self.published_at = 0.0
+
+
+_mon = _Monitor()
+
+
+# ── 스택 → 호출 지점 ─────────────────────────────────────
+
+def _capture(m: _Monitor) -> Optional[tuple]:
+    """루프 스레드의 스택을 떠서 (호출 지점, 가장 안쪽 프레임, 스택 요약, job) 을 돌려준다."""
+    frame = sys._current_frames().get(m.loop_thread)
+    if frame is None:
+        return None
+    frames = []
+    job = None
+    codes = m.job_codes
+    f = frame
+    while f is not None:
+        code = f.f_code
+        if job is None and code in codes:
+            job = codes[code]
+        frames.append((code.co_filename, f.f_lineno, code.co_name))
+        f = f.f_back
+    del frame, f
+    site = leaf = None
+    for filename, lineno, func in frames:
+        if leaf is None and filename != _THIS:
+            leaf = f"{_rel(filename)}:{lineno} {func}"
+        if _is_app(filename):
+            site = f"{_rel(filename)}:{lineno} {func}"
+            break
+    if leaf is None:
+        return None
+    stack = [f"{_rel(fn)}:{ln} {fu}" for fn, ln, fu in frames[:MAX_STACK]]
+    return site or leaf, leaf, stack, job
+
+
+def _sample(m: _Monitor, now: float) -> None:
+    cap = _capture(m)
+    with m.lock:
+        stall = m.current
+        if stall is None:
+            stall = m.current = _Stall(now)
+        if cap is None:
+            return
+        site_key, leaf, stack, job = cap
+        site = m.sites.get(site_key)
+        if site is None:
+            if len(m.sites) >= MAX_SITES:
+                # 가장 덜 막은 지점을 밀어낸다
+                drop = min(m.sites, key=lambda k: m.sites[k].blocked_s)
+                del m.sites[drop]
+            site = m.sites[site_key] = _Site()
+        if site_key not in stall.sites:
+            site.stalls += 1
+        stall.sites[site_key] += 1
+        if job and stall.job is None:
+            stall.job = job
+        site.samples += 1
+        site.blocked_s += SAMPLE_EVERY
+        site.last_ts = time.time()
+        site.leaf = leaf
+        site.stack = stack
+        if job:
+            site.jobs[job] += 1
+
+
+def _watch(m: _Monitor) -> None:
+    """감시 스레드 — 루프가 THRESHOLD 넘게 안 깨면 SAMPLE_EVERY 마다 스택을 뜬다."""
+    check = min(SAMPLE_EVERY, THRESHOLD / 2)
+    next_sample = 0.0
+    while not m.stop.wait(check):
+        now = time.monotonic()
+        overdue = now - m.tick - INTERVAL
+        if m.tick and overdue >= THRESHOLD and now >= next_sample:
+            try:
+                _sample(m, now)
+            except Exception as e:
+                logger.debug(f"[loop-mon] sample failed: {e}")
+            next_sample = now + SAMPLE_EVERY
+        if now - m.published_at >= PUBLISH_EVERY:
+            m.published_at = now
+            _publish(m)
+
+
+def _finish_stall(m: _Monitor, lag: float) -> None:
+    """루프가 깬 뒤 — 방금 끝난 정체를 닫고 지점·job 별 최대 정체를 갱신한다."""
+    with m.lock:
+        stall, m.current = m.current, None
+        m.stall_count += 1
+        m.stall_total += lag
+        if stall is None or not stall.sites:
+            site_key, job = _UNSAMPLED, None
+            site = m.sites.get(_UNSAMPLED)
+            if site is None:
+                site = m.sites[_UNSAMPLED] = _Site()
+            site.stalls += 1
+            site.blocked_s += lag
+            site.max_stall = max(site.max_stall, lag)
+            site.last_ts = time.time()
+        else:
+            site_key = stall.sites.most_common(1)[0][0]
+            job = stall.job
+            for key in stall.sites:
+                s = m.sites.get(key)
+                if s is not None:
+                    s.max_stall = max(s.max_stall, lag)
+        if job:
+            j = m.jobs.setdefault(job, {"stalls": 0, "blocked_s": 0.0, "max_stall": 0.0})
+            j["stalls"] += 1
+            j["blocked_s"] += lag
+            j["max_stall"] = max(j["max_stall"], lag)
+        m.recent.append({"ts": round(time.time(), 1), "lag": round(lag, 3),
+                         "site": site_key, "job": job})
+    if lag >= LOG_OVER:
+        logger.warning(f"[loop-mon:{m.name}] 루프 {lag:.1f}s 정체 — {site_key}"
+                       + (f" (job {job})" if job else ""))
+
+
+async def _sampler(m: _Monitor) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        t0 = loop.time()
+        m.tick = time.monotonic()
+        await asyncio.sleep(INTERVAL)
+        lag = max(0.0, loop.time() - t0 - INTERVAL)
+        m.tick = time.monotonic()
+        with m.lock:   # 감시 스레드의 _publish 가 같이 읽는다
+            m.lags.append(lag)
+            m.total_samples += 1
+            if lag > m.max_lag:
+                m.max_lag = lag
+        if lag >= THRESHOLD:
+            _finish_stall(m, lag)
+        elif m.current is not None:
+            # 감시 스레드가 막 표본을 뜬 직후 루프가 깼다 — 정체 문턱 아래라 버린다.
+            with m.lock:
+                m.current = None
+
+
+# ── 켜고 끄기 ─────────────────────────────────────────────
+
+def start_loop_monitor(name: Optional[str] = None) -> bool:
+    """지금 돌고 있는 루프에 감시를 붙인다. 같은 루프에 두 번 불러도 한 번만 붙는다."""
+    if not ENABLED:
+        return False
+    m = _mon
+    loop = asyncio.get_running_loop()
+    if name:
+        m.name = name
+    if m.loop is loop and m.task is not None and not m.task.done():
+        return True
+    m.loop = loop
+    m.loop_thread = threading.get_ident()
+    m.tick = 0.0
+    m.task = loop.create_task(_sampler(m))
+    if not m.started_at:
+        m.started_at = time.time()
+    if m.thread is None or not m.thread.is_alive():
+        m.stop.clear()
+        m.thread = threading.Thread(target=_watch, args=(m,), name="loop-monitor", daemon=True)
+        m.thread.start()
+    logger.info(f"[loop-mon:{m.name}] started (interval={INTERVAL}s, threshold={THRESHOLD}s)")
+    return True
+
+
+def process_name() -> str:
+    """start_loop_monitor 에 준 프로세스 이름(app·worker·verdict). 안 붙였으면 'all'."""
+    return _mon.name
+
+
+def stop_loop_monitor() -> None:
+    m = _mon
+    m.stop.set()
+    if m.task is not None:
+        m.task.cancel()
+        m.task = None
+    m.tick = 0.0
+    if m.thread is not None and m.thread is not threading.current_thread():
+        m.thread.join(timeout=1.0)
+        m.thread = None
+
+
+def track_scheduler(scheduler) -> None:
+    """APScheduler 의 job 함수를 알아 둔다 — 정체 스택에 그 함수가 있으면 job 에 쌓는다.
+
+    job 이 나중에 추가·교체돼도 따라가도록 리스너를 건다. 지운 job 도 잊지 않는다 —
+    date 트리거 job 은 실행 직전에 스케줄러에서 빠지기 때문이다.
+    """
+    from apscheduler.events import EVENT_JOB_ADDED, EVENT_JOB_MODIFIED
+
+    def _refresh(_event=None):
+        codes = {}
+        for job in scheduler.get_jobs():
+            fn = getattr(job.func, "__func__", job.func)
+            code = getattr(fn, "__code__", None)
+            if code is not None:
+                codes[code] = job.id
+        _mon.job_codes = {**_mon.job_codes, **codes}
+
+    _refresh()
+    scheduler.add_listener(_refresh, EVENT_JOB_ADDED | EVENT_JOB_MODIFIED)
+
+
+# ── 지표 ─────────────────────────────────────────────────
+
+def _pct(values: List[float], p: float) -> Optional[float]:
+    return round(values[min(len(values) - 1, int(p * len(values)))], 4) if values else None
+
+
+def loop_stats(top: int = 20) -> Dict[str, Any]:
+    """이 프로세스의 루프 지연 분포·막은 지점 상위·job 별 정체·최근 정체."""
+    m = _mon
+    with m.lock:
+        lags = sorted(m.lags)
+        sites = sorted(m.sites.items(), key=lambda kv: kv[1].blocked_s, reverse=True)[:top]
+        blockers = [{
+            "site": k, "blocked_s": round(s.blocked_s, 2), "stalls": s.stalls,
+            "samples": s.samples, "max_stall": round(s.max_stall, 3),
+            "last_seen": round(s.last_ts, 1), "leaf": s.leaf,
+            "jobs": dict(s.jobs.most_common(5)), "stack": s.stack,
+        } for k, s in sites]
+        jobs = sorted(({"job": j, "stalls": v["stalls"], "blocked_s": round(v["blocked_s"], 2),
+                        "max_stall": round(v["max_stall"], 3)} for j, v in m.jobs.items()),
+                      key=lambda d: d["blocked_s"], reverse=True)
+        recent = list(m.recent)[::-1]
+        stalled_now = round(time.monotonic() - m.tick - INTERVAL, 3) if m.current and m.tick else 0.0
+    return {
+        "process": m.name, "pid": os.getpid(), "enabled": ENABLED and m.task is not None,
+        "interval": INTERVAL, "threshold": THRESHOLD,
+        "uptime_s": round(time.time() - m.started_at, 1) if m.started_at else 0.0,
+        "lag": {
+            "samples": len(lags), "total": m.total_samples, "p50": _pct(lags, 0.5), "p90": _pct(lags, 0.9),
+            "p99": _pct(lags, 0.99), "max_window": round(lags[-1], 4) if lags else None,
+            "max": round(m.max_lag, 4),
+        },
+        "stalls": {"count": m.stall_count, "total_s": round(m.stall_total, 2),
+                   "stalled_now_s": max(0.0, stalled_now)},
+        "top_blockers": blockers,
+        "jobs": jobs,
+        "recent": recent,
+    }
+
+
+def _publish(m: _Monitor) -> None:
+    try:
+        from services.shared_cache import get_backend
+        backend = get_backend()
+        if backend is None:
+            return
+        st = loop_stats(top=10)
+        for b in st["top_blockers"]:
+            b.pop("stack", None)
+        st["published_at"] = round(time.time(), 1)
+        backend.set(SHARED_NS, m.name, st, ttl=PUBLISH_EVERY * 8)
+    except Exception as e:
+        logger.debug(f"[loop-mon] publish failed: {e}")
+
+
+def process_snapshots() -> List[Dict[str, Any]]:
+    """공유 캐시에 올라온 프로세스별 요약(app·worker·verdict). 최근 PUBLISH_EVERY×8 초 안의 것만."""
+    try:
+        from services.shared_cache import get_backend
+        backend = get_backend()
+    except Exception:
+        backend = None
+    if backend is None:
+        return []
+    out = []
+    for name in PROCESS_NAMES:
+        found = backend.get(SHARED_NS, name)
+        if found is not None:
+            snap = found[0]
+            snap["age_s"] = round(time.time() - snap.get("published_at", 0), 1)
+            out.append(snap)
+    return out
@@ -0,0 +1,292 @@
+"""
+프로세스 내 LRU + TTL 캐시 (single-flight 지원)
+
+routers/blogs.py 의 dict 캐시 4개(검색 결과·블로그 분석·색인 검증·확장 결과)는
+100/200개를 넘으면 전 키를 timestamp 로 정렬해 절반을 지웠다. 요청 경로에서
+O(n log n) 이고, 버스트 때 한 번에 절반이 날아가 적중률이 무너졌다.
+
+MemoryCache:
+  - OrderedDict 기반 O(1) LRU. 조회 시 끝으로 옮기고, 넘치면 앞(가장 오래 안 쓴 것)부터 뺀다.
+  - 항목별 TTL(기본값은 캐시 단위). 만료 항목은 조회 시점에 지운다.
+  - 개수 상한 + 바이트 상한(JSON 직렬화 길이로 근사). 둘 중 먼저 닿는 쪽으로 축출.
+  - get_or_load: 같은 키를 동시에 20번 요청해도 로더는 한 번만 돈다(single-flight).
+  - hits / misses / evictions / expirations / coalesced 카운터 → cache_stats().
+  - shared="네임스페이스" 를 주면 services/shared_cache 백엔드를 2단으로 둔다
+    (로컬 미스 → 공유 조회, set 은 양쪽에 기록). app·worker 프로세스가 결과를 나눠 쓴다.
+    공유 백엔드는 막히는 I/O(SQLite busy_timeout, Redis 왕복)라 이벤트 루프 위에서는
+    aget / aset / adelete 를 쓴다 — 로컬 적중은 그대로 즉시, 백엔드 조회·기록만 스레드로.
+
+이름으로 등록해 두고(get_cache) 관리자 엔드포인트(/api/admin/caches)에서 본다.
+"""
+import asyncio
+import json
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+_MISSING = object()
+
+
+def approx_size(value: Any) -> int:
+    """값의 대략적인 바이트 크기. 캐시 값은 대부분 JSON 직렬화 가능한 dict 다."""
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+class MemoryCache:
+    """O(1) LRU + 항목별 TTL + 개수/바이트 상한."""
+
+    def __init__(self, name: str, max_entries: int = 1000,
+                 max_bytes: Optional[int] = None, ttl: float = 300.0,
+                 sizeof: Callable[[Any], int] = approx_size,
+                 shared: Optional[str] = None):
+        self.name = name
+        self.shared = shared
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = int(max_bytes) if max_bytes else None
+        self.ttl = float(ttl)
+        self._sizeof = sizeof
+        # key -> (value, expires_at, size)
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.coalesced = 0
+        self.loads = 0
+        self.load_errors = 0
+        self.shared_hits = 0
+
+    # ── 기본 연산 ─────────────────────────────────────────────────────────────
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """동기 조회 — 루프 밖(스크립트·동기 코드)용. 이벤트 루프 위에서는 aget."""
+        value = self._local_get(key)
+        if value is not _MISSING:
+            return value
+        backend = self._backend()
+        if backend is not None:
+            value = self._load_shared(key, backend.get(self.shared, str(key)))
+            if value is not _MISSING:
+                return value
+        self.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """동기 기록 — 루프 밖용. 이벤트 루프 위에서는 aset."""
+        ttl = self.ttl if ttl is None else float(ttl)
+        self._store(key, value, time.time() + ttl)
+        backend = self._backend()
+        if backend is not None:
+            backend.set(self.shared, str(key), value, ttl)
+
+    async def aget(self, key: Hashable, default: Any = None) -> Any:
+        """get 과 같되 공유 백엔드 조회(SQLite busy_timeout·Redis 왕복)는 스레드에서 한다."""
+        value = self._local_get(key)
+        if value is not _MISSING:
+            return value
+        backend = self._backend()
+        if backend is not None:
+            found = await self._offload(backend, backend.get, self.shared, str(key))
+            value = self._load_shared(key, found)
+            if value is not _MISSING:
+                return value
+        self.misses += 1
+        return default
+
+    async def aset(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """set 과 같되 공유 백엔드 기록은 스레드에서 한다. 로컬에는 바로 담긴다."""
+        ttl = self.ttl if ttl is None else float(ttl)
+        self._store(key, value, time.time() + ttl)
+        backend = self._backend()
+        if backend is not None:
+            await self._offload(backend, backend.set, self.shared, str(key), value, ttl)
+
+    async def adelete(self, key: Hashable) -> bool:
+        backend = self._backend()
+        if backend is not None:
+            await self._offload(backend, backend.delete, self.shared, str(key))
+        return self._remove(key)
+
+    def _local_get(self, key: Hashable) -> Any:
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            return _MISSING
+        value, expires_at, _ = item
+        if expires_at > time.time():
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+        self._remove(key)
+        self.expirations += 1
+        return _MISSING
+
+    def _load_shared(self, key: Hashable, found) -> Any:
+        if found is None:
+            return _MISSING
+        value, expires_at = found
+        self._store(key, value, expires_at)
+        self.hits += 1
+        self.shared_hits += 1
+        return value
+
+    @staticmethod
+    async def _offload(backend, fn, *args):
+        # 프로세스 내 대역(memory)은 막힐 일이 없어 스레드를 거치지 않는다.
+        if not getattr(backend, "blocking", True):
+            return fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
+    def _backend(self):
+        if not self.shared:
+            return None
+        from services.shared_cache import get_backend
+        return get_backend()
+
+    def _store(self, key: Hashable, value: Any, expires_at: float) -> None:
+        size = self._sizeof(value) if self.max_bytes else 0
+        if self.max_bytes and size > self.max_bytes:
+            # 상한보다 큰 단일 항목은 다른 항목을 전부 밀어내느니 담지 않는다.
+            self._remove(key)
+            return
+        if key in self._data:
+            self._remove(key)
+        self._data[key] = (value, expires_at, size)
+        self._bytes += size
+        self._evict()
+
+    def delete(self, key: Hashable) -> bool:
+        backend = self._backend()
+        if backend is not None:
+            backend.delete(self.shared, str(key))
+        return self._remove(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._bytes = 0
+
+    def expires_at(self, key: Hashable) -> Optional[float]:
+        item = self._data.get(key)
+        return item[1] if item else None
+
+    def __contains__(self, key: Hashable) -> bool:
+        item = self._data.get(key)
+        return item is not None and item[1] > time.time()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _remove(self, key: Hashable) -> bool:
+        item = self._data.pop(key, None)
+        if item is None:
+            return False
+        self._bytes -= item[2]
+        return True
+
+    def _evict(self) -> None:
+        while len(self._data) > self.max_entries or (
+                self.max_bytes and self._bytes > self.max_bytes and self._data):
+            _, (_, _, size) = self._data.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    # ── single-flight ────────────────────────────────────────────────────────
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]],
+                          ttl: Optional[float] = None, store: bool = True,
+                          flight_key: Optional[Hashable] = None) -> Any:
+        """캐시에 있으면 반환, 없으면 loader() 를 **한 번만** 돌려 모든 대기자에게 나눠 준다.
+
+        store=False 는 loader 가 스스로 캐시에 넣는 경우(조건부 저장 등).
+        flight_key 는 같은 캐시 키라도 로더 인자가 달라 합치면 안 되는 호출을 가른다.
+        None 결과는 저장하지 않는다(실패를 캐시하지 않는 기존 동작).
+        """
+        fk = key if flight_key is None else flight_key
+        while True:
+            value = await self.aget(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            fut = self._inflight.get(fk)
+            if fut is None:
+                break
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(fut)
+            except asyncio.CancelledError:
+                # 로더를 돌리던 요청이 취소됐으면(클라이언트 끊김 등) 대기자가 이어받는다.
+                if fut.cancelled():
+                    continue
+                raise
+
+        fut = asyncio.get_running_loop().create_future()
+        # 대기자가 없을 때 예외가 '회수 안 됨' 경고로 남지 않게 한다.
+        fut.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[fk] = fut
+        self.loads += 1
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as e:
+            self.load_errors += 1
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(value)
+            if store and value is not None:
+                await self.aset(key, value, ttl)
+            return value
+        finally:
+            if self._inflight.get(fk) is fut:
+                del self._inflight[fk]
+
+    # ── 진단 ─────────────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes if self.max_bytes else None,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "loads": self.loads,
+            "load_errors": self.load_errors,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+            "shared": self.shared,
+            "shared_hits": self.shared_hits,
+        }
+
+
+_CACHES: Dict[str, MemoryCache] = {}
+
+
+def get_cache(name: str, **options) -> MemoryCache:
+    """이름별 캐시 싱글턴. options 는 처음 만들 때만 적용된다."""
+    cache = _CACHES.get(name)
+    if cache is None:
+        cache = _CACHES[name] = MemoryCache(name, **options)
+    return cache
+
+
+def cache_stats() -> List[Dict]:
+    return [c.stats() for c in _CACHES.values()]
+
+
+def shared_backend_stats() -> Optional[Dict]:
+    from services.shared_cache import get_backend
+    backend = get_backend()
+    return backend.stats() if backend is not None else None
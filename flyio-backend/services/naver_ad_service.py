@@ -8,7 +8,7 @@ import base64
 import time
 import json
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
@@ -16,10 +16,9 @@ import httpx
 
 from config import settings
 
-from services.ad_stat_mapper import (
-    conversions_of as _conv,
-    conv_amount_of as _conv_amt,
-)
+from services.ad_stat_mapper import conversions_of as _conv
+from services.http_clients import get_client
+from services.naver_rate_governor import get_bucket, rate_family
 
 logger = logging.getLogger(__name__)
 
@@ -97,20 +96,19 @@ def _breaker_for(endpoint: str) -> _NaverApiCircuitBreaker:
 _naver_api_breaker = _default_breaker
 
 
+def _retry_after(response) -> Optional[float]:
+    """429 응답의 Retry-After(초). 없거나 날짜 형식이면 None."""
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
 class NaverApiCircuitOpenError(Exception):
     """Circuit breaker OPEN 상태 — 네이버 API 호출 일시 차단."""
     pass
 
 
-# ============================================================
-# 글로벌 동시성 Semaphore — 모든 라우터의 네이버 stats/PUT 호출이 공유
-# ============================================================
-# 라우터마다 Sem(3) 새로 만들면 사용자가 페이지 새로고침 여러 번 시 sem 인스턴스
-# 여러 개 동시 존재 → 실제 동시 호출 = 3 × N. 모듈 레벨 단일 Semaphore 로 통합해
-# 워커 전체가 공유하는 진짜 hard cap.
-NAVER_API_GLOBAL_SEMAPHORE = asyncio.Semaphore(8)
-
-
 class BidStrategy(Enum):
     """입찰 전략"""
     MAXIMIZE_CLICKS = "maximize_clicks"      # 클릭수 최대화
@@ -183,12 +181,21 @@ class NaverAdApiClient:
         # connect=3s, read=8s — Naver ConnectTimeout/ReadTimeout 폭주 시 빠르게 fail.
         # 이전 15s read 는 (15s read × 2 retry + 1s sleep) = 31s/req 로 event loop 점유 폭증.
         # 8s 로 단축 → 17s/req → cron tick 시간 절반 → HTTP 응답 막힘 시간 축소.
-        # max_connections=5: NaverAd ConnectTimeout 폭주 시 동시 in-flight 제한 → OOM 방지
+        # 연결 상한: NaverAd ConnectTimeout 폭주 시 동시 in-flight 제한 → OOM 방지
         # Why: 1GB VM 에서 동시 50+ ConnectTimeout 누적 → SIGKILL 137 사례 다수 (2026-05-07)
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(connect=3.0, read=8.0, write=8.0, pool=3.0),
-            limits=httpx.Limits(max_connections=5, max_keepalive_connections=2),
-        )
+        # 예전엔 인스턴스마다 클라이언트(상한 5)를 열어 계정 수만큼 풀·핸드셰이크가 늘었다.
+        # 이제 모든 인스턴스가 services/http_clients 의 "searchad" 풀(같은 타임아웃, 상한 10)을 쓴다.
+        # 풀은 이벤트 루프에 묶이므로 생성 시점이 아니라 쓸 때 꺼낸다(client 프로퍼티).
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client if self._client is not None else get_client("searchad")
+
+    @client.setter
+    def client(self, value: httpx.AsyncClient) -> None:
+        """테스트 등에서 전용 클라이언트(MockTransport 등)를 끼울 때."""
+        self._client = value
 
     def _generate_signature(self, timestamp: str, method: str, uri: str) -> str:
         """API 서명 생성"""
@@ -222,8 +229,9 @@ class NaverAdApiClient:
         endpoint에 ?nccAdgroupId=... 같은 query를 직접 넣으면 서명 계산 시
         query까지 포함되어 mismatch. 서명에는 path만, URL에는 query 포함.
 
-        retry 정책: 5xx 또는 429 응답 시 1s → 2s → 4s 백오프 후 최대 3회 재시도.
-        4xx (400/401/403) 는 클라이언트 버그라 즉시 raise.
+        retry 정책: 5xx 는 1s 후, 429 는 속도 조절기(services/naver_rate_governor)가
+        그 버킷을 늦추고 멈춘 만큼 기다렸다가 재시도. 4xx (400/401/403) 는 즉시 raise.
+        모든 시도는 보내기 전에 (계정, 엔드포인트 묶음) 버킷에서 토큰을 받는다.
         """
         # 서명용 URI는 path만 (query string 제거)
         uri_for_sign = endpoint.split("?", 1)[0]
@@ -251,12 +259,14 @@ class NaverAdApiClient:
                 f"{breaker.OPEN_DURATION_S}초 후 자동 복구"
             )
 
+        bucket = get_bucket(self.customer_id, rate_family(method, endpoint))
         last_exc: Optional[Exception] = None
         # ConnectTimeout 폭주 시 워커 점유 최소화 — retry 2회 (총 attempts=2).
         # 5xx/429 는 일시 장애로 간주하여 동일하게 retry.
         max_attempts = 2
         for attempt in range(max_attempts):
             # 시그니처는 매 시도 새로 — timestamp 갱신 필요 (Naver TTL 짧음).
+            await bucket.acquire()
             headers = self._get_headers(method, uri_for_sign)
             try:
                 if method == "GET":
@@ -274,20 +284,25 @@ class NaverAdApiClient:
                 if response.status_code in (429, 500, 502, 503, 504):
                     # 429 도 breaker 실패로 카운트 — 5회 누적 시 OPEN 으로 폭주 차단
                     breaker.record_failure()
+                    if response.status_code == 429:
+                        # 버킷 속도를 줄이고 Retry-After 동안 멈춘다 — 같은 버킷의 다른
+                        # 호출도 같이 늦춰져 429 가 연쇄하지 않는다. 재시도는 acquire 가 기다린다.
+                        bucket.penalize(_retry_after(response))
                     if attempt < max_attempts - 1:
-                        # 429 는 rate limit 이라 backoff 더 길게 (5s), 5xx 는 1s
-                        backoff = 5 if response.status_code == 429 else 1
+                        backoff = 0 if response.status_code == 429 else 1
                         logger.warning(
                             f"[NaverAd._request] {response.status_code} {method} {endpoint} "
-                            f"— attempt {attempt+1}/{max_attempts}, {backoff}s 후 재시도"
+                            f"— attempt {attempt+1}/{max_attempts}, 재시도"
                         )
-                        await asyncio.sleep(backoff)
+                        if backoff:
+                            await asyncio.sleep(backoff)
                         continue
                     # 마지막 시도 — break 해서 아래에서 4xx 본문 raise
                     break
 
                 # 정상 응답 또는 비429 4xx — breaker CLOSED 로 복구
                 breaker.record_success()
+                bucket.reward()
                 break  # 성공 또는 4xx — 루프 탈출
             except (httpx.TimeoutException, httpx.NetworkError, httpx.ConnectError) as e:
                 # 네트워크 일시 장애 — breaker 에 실패 기록
@@ -678,6 +693,7 @@ class NaverAdApiClient:
         import mimetypes
         mime = mimetypes.guess_type(filename)[0] or "image/jpeg"
         url = f"{self.BASE_URL}/ncc/uploads"
+        await get_bucket(self.customer_id, "ncc_write").acquire()
         headers = self._get_headers("POST", "/ncc/uploads")
         # Content-Type은 httpx가 multipart로 자동 설정
         headers.pop("Content-Type", None)
@@ -821,10 +837,14 @@ class NaverAdApiClient:
         return await self._request("GET", "/keywordstool", params)
 
     async def get_keywords_volume_batch(self, keywords: List[str]) -> Dict[str, dict]:
-        """여러 키워드의 월 검색량을 배치로 조회.
+        """/keywordstool 한 콜 — services/keyword_volume 의 전송 계층.
         네이버 /keywordstool은 hintKeywords 최대 5개까지 받음.
-        반환: { normalized_keyword: { monthly_pc, monthly_mobile, monthly_total, comp_idx } }
-        응답에 없는 키워드는 결과에 포함 안 됨 (= 검색량 0 또는 매우 낮음).
+        반환: { relKeyword: { monthly_pc, monthly_mobile, monthly_total, comp_idx } }
+        — 힌트 + 딸려 온 연관 키워드 전부. 응답에 없는 힌트는 검색량 0 또는 매우 낮음.
+
+        ⚠️ 검색량이 필요하면 이걸 직접 부르지 말고 keyword_volume.lookup 을 쓴다
+        (영속 캐시·배치 합치기·콜 간격이 거기 있다). 실패는 예외로 올린다 — 예전처럼
+        {} 로 삼키면 캐시가 "검색량 없음" 으로 기록해 버린다.
         """
         if not keywords:
             return {}
@@ -841,11 +861,7 @@ class NaverAdApiClient:
             "hintKeywords": ",".join(cleaned),
             "showDetail": "1",
         }
-        try:
-            resp = await self._request("GET", "/keywordstool", params)
-        except Exception as e:
-            logger.warning(f"volume batch failed for {batch}: {e}")
-            return {}
+        resp = await self._request("GET", "/keywordstool", params)
 
         # 응답 형식: {"keywordList": [{relKeyword, monthlyPcQcCnt, monthlyMobileQcCnt, compIdx, ...}]}
         items = resp.get("keywordList", []) if isinstance(resp, dict) else (resp if isinstance(resp, list) else [])
@@ -970,40 +986,39 @@ class NaverAdApiClient:
                 "fields": _json.dumps(fields),
                 "timeRange": _json.dumps({"since": start_date, "until": end_date}),
             }
-            # 글로벌 sem — 워커 전체에서 동시 호출 hard cap
-            async with NAVER_API_GLOBAL_SEMAPHORE:
-                try:
-                    resp = await self._request("GET", "/stats", params)
-                    data = resp.get("data") if isinstance(resp, dict) else resp
-                    if isinstance(data, list):
-                        merged.extend(data)
-                    elif isinstance(data, dict):
-                        merged.append(data)
-                except NaverApiCircuitOpenError:
-                    # circuit OPEN — 남은 ID 도 skip
-                    break
-                except Exception as e:
-                    # 전환 필드 미지원(11001)이면 이 ID 를 BASE 로 한 번 재시도하고,
-                    # 이후 ID 는 처음부터 BASE 로 간다. 전환을 못 얻는 것보다
-                    # 클릭·비용까지 통째로 잃는 쪽이 훨씬 나쁘다.
-                    if (not explicit_fields and not conv_downgraded
-                            and is_unsupported_field_error(e)):
-                        conv_downgraded = True
-                        fields = list(STAT_FIELDS_BASE)
-                        logger.info(
-                            f"[NaverAd/stats] 전환 필드 미지원 — BASE 로 강등 ({kid})")
-                        try:
-                            params["fields"] = _json.dumps(fields)
-                            resp = await self._request("GET", "/stats", params)
-                            data = resp.get("data") if isinstance(resp, dict) else resp
-                            if isinstance(data, list):
-                                merged.extend(data)
-                            elif isinstance(data, dict):
-                                merged.append(data)
-                            continue
-                        except Exception as e2:
-                            e = e2
-                    logger.warning(f"[NaverAd/stats] {kid} 실패: {str(e)[:120]}")
+            # 속도는 _request 의 stats 버킷이 잡는다 (예전 전역 Semaphore(8) 대체).
+            try:
+                resp = await self._request("GET", "/stats", params)
+                data = resp.get("data") if isinstance(resp, dict) else resp
+                if isinstance(data, list):
+                    merged.extend(data)
+                elif isinstance(data, dict):
+                    merged.append(data)
+            except NaverApiCircuitOpenError:
+                # circuit OPEN — 남은 ID 도 skip
+                break
+            except Exception as e:
+                # 전환 필드 미지원(11001)이면 이 ID 를 BASE 로 한 번 재시도하고,
+                # 이후 ID 는 처음부터 BASE 로 간다. 전환을 못 얻는 것보다
+                # 클릭·비용까지 통째로 잃는 쪽이 훨씬 나쁘다.
+                if (not explicit_fields and not conv_downgraded
+                        and is_unsupported_field_error(e)):
+                    conv_downgraded = True
+                    fields = list(STAT_FIELDS_BASE)
+                    logger.info(
+                        f"[NaverAd/stats] 전환 필드 미지원 — BASE 로 강등 ({kid})")
+                    try:
+                        params["fields"] = _json.dumps(fields)
+                        resp = await self._request("GET", "/stats", params)
+                        data = resp.get("data") if isinstance(resp, dict) else resp
+                        if isinstance(data, list):
+                            merged.extend(data)
+                        elif isinstance(data, dict):
+                            merged.append(data)
+                        continue
+                    except Exception as e2:
+                        e = e2
+                logger.warning(f"[NaverAd/stats] {kid} 실패: {str(e)[:120]}")
         return merged
 
     # ============ 대량 리포트 ============
@@ -1063,7 +1078,30 @@ class NaverAdApiClient:
 
     async def download_report_text(self, download_url: str,
                                    max_bytes: Optional[int] = None) -> str:
-        """리포트 파일을 텍스트로 받는다.
+        """리포트 파일을 텍스트로 받는다(미리보기용 — 수집은 stream_report_lines).
+
+        max_bytes 를 주면 그만큼 읽은 뒤 연결을 끊는다(본문 전체를 받지 않는다).
+        """
+        parts: List[str] = []
+        size = 0
+        lines = self.stream_report_lines(download_url)
+        try:
+            async for line in lines:
+                parts.append(line)
+                size += len(line) + 1
+                if max_bytes and size >= max_bytes:
+                    break
+        finally:
+            await lines.aclose()
+        text = "\n".join(parts)
+        return text[:max_bytes] if max_bytes else text
+
+    async def stream_report_lines(self, download_url: str) -> AsyncIterator[str]:
+        """리포트 파일을 줄 단위로 흘려 받는다 — 본문 전체를 메모리에 올리지 않는다.
+
+        MasterReport Keyword 는 계정당 ~10만 행이라 resp.text 로 받으면 본문 str,
+        splitlines 리스트, 행 리스트가 한꺼번에 떠 있게 된다. 청크가 오는 대로
+        UTF-8 을 점진 디코딩해 줄로 잘라 넘긴다.
 
         ⚠️ _request 를 못 쓴다 — 응답이 TSV 라 JSON 파싱에서 죽는다.
         ⚠️ URL 에 authtoken 이 붙어 있지만 그것만으로는 400 이다. 서명 헤더가
@@ -1072,21 +1110,24 @@ class NaverAdApiClient:
         from urllib.parse import urlparse
 
         path = urlparse(download_url).path or "/report-download"
+        await get_bucket(self.customer_id, rate_family("GET", path)).acquire()
         headers = self._get_headers("GET", path)
         # TSV 라 JSON Content-Type 을 지우고 받는다.
         headers.pop("Content-Type", None)
 
-        resp = await self.client.get(download_url, headers=headers,
-                                     follow_redirects=True, timeout=180.0)
-        if resp.status_code >= 400:
-            raise RuntimeError(
-                f"report-download {resp.status_code}: {(resp.text or '')[:300]}")
-        text = resp.text
-        return text[:max_bytes] if max_bytes else text
+        async with self.client.stream("GET", download_url, headers=headers,
+                                      follow_redirects=True, timeout=180.0) as resp:
+            if resp.status_code >= 400:
+                body = (await resp.aread()).decode("utf-8", "replace")
+                raise RuntimeError(f"report-download {resp.status_code}: {body[:300]}")
+            async for line in resp.aiter_lines():
+                yield line
 
     async def close(self):
-        """클라이언트 종료"""
-        await self.client.aclose()
+        """클라이언트 종료 — 공용 풀("searchad")은 레지스트리 것이라 닫지 않는다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 
 class KeywordDiscoveryEngine:
@@ -1169,9 +1210,6 @@ class KeywordDiscoveryEngine:
                 logger.error(f"Error discovering keywords for '{seed}': {e}")
                 continue
 
-            # Rate limiting
-            await asyncio.sleep(0.3)
-
         # 잠재력 점수로 정렬
         all_suggestions.sort(key=lambda x: x.potential_score, reverse=True)
 
@@ -1328,8 +1366,6 @@ class KeywordDiscoveryEngine:
             except Exception as e:
                 logger.error(f"Error discovering conversion keywords for '{seed}': {e}")
 
-            await asyncio.sleep(0.3)
-
         # 잠재력 점수로 정렬 (전환 의도 높은 키워드 우선)
         all_suggestions.sort(key=lambda x: x.potential_score, reverse=True)
 
@@ -1350,6 +1386,7 @@ class BidOptimizationEngine:
         self.min_bid = 70                   # 네이버 최소 입찰가
         self.max_bid = 100000               # 최대 입찰가
         self.bid_changes: List[BidChange] = []
+        self.last_report: Optional[dict] = None   # 마지막 optimize_all_keywords 보고(bid_apply)
 
     def set_strategy(
         self,
@@ -1373,104 +1410,26 @@ class BidOptimizationEngine:
         self.max_bid = max_bid
 
     async def optimize_all_keywords(self, ad_group_ids: List[str] = None) -> List[BidChange]:
-        """모든 키워드 입찰가 최적화"""
-        changes = []
+        """모든 키워드 입찰가 최적화 — 수집·결정·적용은 services/bid_apply 가 한다.
 
-        try:
-            # 키워드 목록 조회
-            if ad_group_ids:
-                keywords = []
-                for ag_id in ad_group_ids:
-                    kws = await self.api.get_keywords(ag_id)
-                    keywords.extend(kws)
-            else:
-                keywords = await self.api.get_keywords()
-
-            # 성과 통계 조회 (최근 7일)
-            keyword_ids = [kw.get("nccKeywordId") for kw in keywords if kw.get("nccKeywordId")]
-
-            if not keyword_ids:
-                return changes
-
-            end_date = datetime.now().strftime("%Y-%m-%d")
-            start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-
-            stats = await self.api.get_stats("KEYWORD", keyword_ids, start_date, end_date)
-            stats_map = {s.get("id"): s for s in stats}
-
-            # 각 키워드 최적화
-            for kw in keywords:
-                keyword_id = kw.get("nccKeywordId")
-                if not keyword_id:
-                    continue
-
-                current_bid = kw.get("bidAmt", 0)
-                if current_bid == 0 or kw.get("useGroupBidAmt", True):
-                    continue
-
-                stat = stats_map.get(keyword_id, {})
-
-                # 최적 입찰가 계산
-                new_bid, reason = self._calculate_optimal_bid(
-                    current_bid=current_bid,
-                    impressions=stat.get("impCnt", 0),
-                    clicks=stat.get("clkCnt", 0),
-                    cost=stat.get("salesAmt", 0),
-                    conversions=_conv(stat),
-                    revenue=_conv_amt(stat),
-                    avg_position=stat.get("avgRnk", 0)
-                )
-
-                # 입찰가 변경이 필요한 경우
-                if new_bid != current_bid:
-                    try:
-                        await self.api.update_keyword_bid(keyword_id, new_bid)
-
-                        change = BidChange(
-                            keyword_id=keyword_id,
-                            keyword=kw.get("keyword", ""),
-                            old_bid=current_bid,
-                            new_bid=new_bid,
-                            reason=reason
-                        )
-                        changes.append(change)
-                        self.bid_changes.append(change)
-
-                        # DB에 액션 로깅
-                        try:
-                            from database.optimization_db import log_optimization_action
-                            log_optimization_action(
-                                user_id=self.user_id if hasattr(self, 'user_id') else 1,
-                                platform="naver_searchad",
-                                action_type="bid_change",
-                                target_type="keyword",
-                                target_id=keyword_id,
-                                target_name=kw.get("keyword", ""),
-                                old_value=current_bid,
-                                new_value=new_bid,
-                                reason=reason,
-                                impact_estimate={
-                                    "impressions": stat.get("impCnt", 0),
-                                    "clicks": stat.get("clkCnt", 0),
-                                    "cost": stat.get("salesAmt", 0),
-                                    "conversions": _conv(stat)
-                                },
-                                session_id=self.session_id if hasattr(self, 'session_id') else None
-                            )
-                        except Exception as log_error:
-                            logger.warning(f"Failed to log optimization action: {log_error}")
-
-                        logger.info(f"Bid changed: {kw.get('keyword')} {current_bid} -> {new_bid} ({reason})")
-
-                    except Exception as e:
-                        logger.error(f"Failed to update bid for {keyword_id}: {e}")
-
-                # Rate limiting
-                await asyncio.sleep(0.1)
+        성과는 한 번에 모으고, 결정은 메모리에서, 적용은 bulk PUT(100개) 묶음으로.
+        키워드별 실패 사유까지 담긴 보고는 self.last_report 에 남긴다.
+        """
+        from services.bid_apply import run_bid_pass
 
+        try:
+            report = await run_bid_pass(self, ad_group_ids)
         except Exception as e:
             logger.error(f"Error optimizing bids: {e}")
-
+            return []
+
+        self.last_report = report
+        changes = report["applied"]
+        self.bid_changes.extend(changes)
+        failed = report["failed"]
+        if failed:
+            logger.error(f"Failed to update bid for {len(failed)} keywords "
+                         f"(first: {failed[0]['keyword_id']}: {failed[0]['error']})")
         return changes
 
     def _calculate_optimal_bid(
@@ -1727,8 +1686,6 @@ class KeywordExclusionEngine:
                     except Exception as e:
                         logger.error(f"Failed to exclude keyword {keyword_id}: {e}")
 
-                await asyncio.sleep(0.1)
-
         except Exception as e:
             logger.error(f"Error evaluating keywords: {e}")
 
@@ -1805,9 +1762,6 @@ class BulkKeywordManager:
             except Exception as e:
                 logger.error(f"Failed to add keywords batch: {e}")
 
-            # Rate limiting
-            await asyncio.sleep(0.5)
-
         return results
 
     async def create_structured_campaign(
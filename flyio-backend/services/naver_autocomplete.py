@@ -16,6 +16,8 @@ import logging
 from typing import Dict, List, Optional, Set
 import httpx
 
+from services.http_clients import get_client
+
 logger = logging.getLogger(__name__)
 
 # 비공식 endpoint (네이버 검색 자동완성). 무료, 인증 불요, rate limit 존재.
@@ -46,7 +48,7 @@ _HEADERS = {
 
 
 async def _fetch_one(
-    client: httpx.AsyncClient, seed: str, *, limit: int,
+    client: httpx.AsyncClient, seed: str, *, limit: int, timeout: Optional[float] = None,
 ) -> List[str]:
     """단일 시드 자동완성 호출. 실패 시 빈 리스트."""
     seed_clean = (seed or "").strip()
@@ -54,7 +56,8 @@ async def _fetch_one(
         return []
     params = {"q": seed_clean, **_DEFAULT_PARAMS}
     try:
-        resp = await client.get(NAVER_AC_URL, params=params, headers=_HEADERS)
+        resp = await client.get(NAVER_AC_URL, params=params, headers=_HEADERS,
+                                **({"timeout": timeout} if timeout is not None else {}))
         if resp.status_code != 200:
             return []
         data = resp.json()
@@ -327,28 +330,28 @@ async def collect_autocomplete(
     )
     skipped = 0
 
-    async with httpx.AsyncClient(timeout=timeout, http2=False) as client:
-        async def _one(seed: str):
-            nonlocal skipped
+    client = get_client("ac")
+    async def _one(seed: str):
+        nonlocal skipped
+        if deadline is not None and asyncio.get_event_loop().time() >= deadline:
+            skipped += 1
+            return seed, []
+        async with sem:
             if deadline is not None and asyncio.get_event_loop().time() >= deadline:
                 skipped += 1
                 return seed, []
-            async with sem:
-                if deadline is not None and asyncio.get_event_loop().time() >= deadline:
-                    skipped += 1
-                    return seed, []
-                kws = await _fetch_one(client, seed, limit=per_seed)
-                # rate limit 회피 — 시드당 최소 0.15s 간격
-                await asyncio.sleep(0.15)
-                return seed, kws
-
-        tasks = [_one(s) for s in seeds if s and isinstance(s, str)]
-        for fut in asyncio.as_completed(tasks):
-            try:
-                seed, kws = await fut
-                result[seed] = kws
-            except Exception as e:
-                logger.warning(f"[autocomplete] task 실패: {type(e).__name__}: {e}")
+            kws = await _fetch_one(client, seed, limit=per_seed, timeout=timeout)
+            # rate limit 회피 — 시드당 최소 0.15s 간격
+            await asyncio.sleep(0.15)
+            return seed, kws
+
+    tasks = [_one(s) for s in seeds if s and isinstance(s, str)]
+    for fut in asyncio.as_completed(tasks):
+        try:
+            seed, kws = await fut
+            result[seed] = kws
+        except Exception as e:
+            logger.warning(f"[autocomplete] task 실패: {type(e).__name__}: {e}")
     if skipped:
         logger.warning(
             f"[autocomplete] 시간예산({budget_seconds}s) 초과 — 질의 {skipped}/{len(tasks)} 건너뜀"
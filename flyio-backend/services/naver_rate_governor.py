@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+네이버 검색광고 API 호출 속도 조절 — 계정 × 엔드포인트 묶음별 토큰 버킷 + 우선순위
+
+왜 필요한가:
+호출 속도 조절이 호출부마다 흩어져 있었다. get_stats 의 Semaphore(8),
+VolumeFilterService 의 sleep 0.4, bulk_upload_orchestrator 의 sleep 0.5,
+ai_keyword_expander 의 0.35/0.5, BidOptimizationEngine 의 0.1~0.5 … 서로를 모르니
+cron 두 개가 겹치면 합산 속도가 한도를 넘어 429 가 났고(→ breaker OPEN → 사용자
+화면까지 막힘), 혼자 돌 때는 반대로 예산을 놀렸다.
+
+이제 NaverAdApiClient._request 가 보내기 직전에 여기서 토큰을 받는다.
+  - 버킷 = (customer_id, 묶음). 쿼터는 계정(라이선스) 단위로 매겨진다.
+  - 묶음: keywordstool / stats / report / ncc_write / ncc_read / estimate / default
+  - 우선순위: INTERACTIVE(사용자 요청) > NORMAL(사용자가 띄운 작업) > BULK(cron).
+    기다리는 줄은 (우선순위, 도착 순) 으로 서고 맨 앞만 토큰을 가져간다.
+    cron 이 예산을 다 쓰고 있어도 사용자 호출은 다음 토큰(1/rate 초 안)을 받는다.
+  - 429 를 받으면 그 버킷 속도를 절반으로 줄이고(Retry-After 가 있으면 그동안 멈춤),
+    성공할 때마다 조금씩 원래 속도로 되돌린다 (AIMD).
+
+우선순위는 contextvar 라 asyncio 태스크로 자연스럽게 상속된다.
+    with api_priority(BULK):
+        await run_cron_job()
+기본값은 INTERACTIVE. main.py lifespan 이 스케줄러·워치독을 띄우기 전에 BULK 로
+바꿔 두므로 거기서 파생된 태스크는 전부 BULK 다 (HTTP 요청 태스크는 영향 없음).
+
+버킷은 프로세스 안에서 공유된다(스레드·이벤트 루프 무관). app / worker 를 따로
+띄우면 프로세스마다 버킷이 하나씩이니 NAVER_RATE_<묶음> 으로 나눠 잡는다.
+
+네이버는 묶음별 정확한 쿼터를 공개하지 않는다. 기본값은 예전 sleep 값이 429 없이
+버티던 속도와 운영 중 관찰한 429 시작점 사이로 잡았다. env 로 바꾼다:
+    NAVER_RATE_KEYWORDSTOOL="3,3"   # 초당 토큰, 버스트
+"""
+import asyncio
+import bisect
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE, NORMAL, BULK = 0, 1, 2
+PRIORITY_NAMES = {INTERACTIVE: "interactive", NORMAL: "normal", BULK: "bulk"}
+
+_priority: ContextVar[int] = ContextVar("naver_api_priority", default=INTERACTIVE)
+
+# 묶음 → (초당 토큰, 버스트)
+_DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    "keywordstool": (3.0, 3.0),   # 예전 0.3~0.4s 간격. 제일 먼저 429 가 나는 곳
+    "stats": (10.0, 10.0),        # 예전 Semaphore(8) × 응답 ~0.8s
+    "report": (2.0, 4.0),         # 리포트 생성·조회·다운로드 — 호출 수 자체가 적다
+    "ncc_write": (5.0, 5.0),      # POST/PUT/DELETE /ncc/* — 예전 호출부별 0.1~0.5s
+    "ncc_read": (10.0, 10.0),
+    "estimate": (5.0, 5.0),
+    "default": (10.0, 10.0),
+}
+
+# 429 후 최저 속도 (원래 속도 대비)
+MIN_RATE_FRACTION = 0.1
+# 성공 한 번에 되돌리는 속도 (원래 속도 대비). 0.02 → 바닥에서 ~45콜이면 복구.
+RECOVER_STEP = 0.02
+# Retry-After 가 없을 때 429 후 멈추는 시간(초)
+DEFAULT_COOLDOWN = 1.0
+# 사용률 계산 창(초)
+UTIL_WINDOW = 60.0
+
+
+def _limits(family: str) -> Tuple[float, float]:
+    rate, burst = _DEFAULT_LIMITS.get(family, _DEFAULT_LIMITS["default"])
+    raw = os.environ.get(f"NAVER_RATE_{family.upper()}")
+    if raw:
+        try:
+            parts = [float(x) for x in raw.split(",")]
+            rate = parts[0]
+            burst = parts[1] if len(parts) > 1 else max(1.0, rate)
+        except ValueError:
+            logger.warning(f"[naver_rate] NAVER_RATE_{family.upper()}={raw!r} 무시 (형식: 'rate,burst')")
+    return max(rate, 0.01), max(burst, 1.0)
+
+
+def rate_family(method: str, endpoint: str) -> str:
+    """요청 → 버킷 묶음."""
+    path = (endpoint or "").split("?", 1)[0]
+    if path.startswith("/keywordstool"):
+        return "keywordstool"
+    if path == "/stats" or path.startswith("/stats/"):
+        return "stats"
+    if path.startswith(("/stat-reports", "/master-reports", "/report-download")):
+        return "report"
+    if path.startswith("/estimate"):
+        return "estimate"
+    if path.startswith("/ncc"):
+        return "ncc_read" if method == "GET" else "ncc_write"
+    return "default"
+
+
+@contextmanager
+def api_priority(level: int):
+    """이 블록(과 여기서 띄운 태스크)의 네이버 API 호출 우선순위."""
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def background_job():
+    """사용자가 띄운 긴 작업(대량 등록·검색량 필터 등) — INTERACTIVE 에서 불렸으면
+    NORMAL 로 낮춘다. cron 안에서 불렸으면(BULK) 그대로 둔다."""
+    return api_priority(max(current_priority(), NORMAL))
+
+
+def set_default_priority(level: int) -> None:
+    """현재 컨텍스트의 우선순위를 되돌리지 않고 바꾼다 (lifespan 처럼 블록으로 못 감쌀 때)."""
+    _priority.set(level)
+
+
+def current_priority() -> int:
+    return _priority.get()
+
+
+class TokenBucket:
+    """토큰 버킷 하나. 상태는 threading.Lock 으로 지키고, 기다림은 각자 asyncio.sleep.
+
+    대기자는 (우선순위, 순번) 표를 정렬된 줄에 세운다. 맨 앞만 토큰을 가져가고,
+    나머지는 자기 앞 사람 수만큼의 토큰이 찰 시간을 자고 일어나 다시 본다.
+    이벤트 루프에 묶인 객체(Future·Condition)를 쓰지 않으니 어느 루프에서 불러도 된다.
+    """
+
+    def __init__(self, customer_id: str, family: str, rate: float, burst: float):
+        self.customer_id = customer_id
+        self.family = family
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self._updated = time.monotonic()
+        self._cooldown_until = 0.0
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._recent: Deque[float] = deque()
+        self.granted = {p: 0 for p in PRIORITY_NAMES}
+        self.waited_s = 0.0
+        self.max_wait_s = 0.0
+        self.throttled = 0
+        self.last_throttled_at: Optional[float] = None
+
+    def _refill(self, now: float) -> None:
+        if now < self._cooldown_until:
+            self._updated = now
+            return
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _take(self, now: float, priority: int, waited: float) -> None:
+        self.tokens -= 1.0
+        self.granted[priority] = self.granted.get(priority, 0) + 1
+        self.waited_s += waited
+        self.max_wait_s = max(self.max_wait_s, waited)
+        self._recent.append(now)
+        while self._recent and self._recent[0] < now - UTIL_WINDOW:
+            self._recent.popleft()
+
+    async def acquire(self, priority: Optional[int] = None) -> float:
+        """토큰 하나를 받을 때까지 기다린다. 기다린 초를 돌려준다."""
+        priority = current_priority() if priority is None else priority
+        t0 = time.monotonic()
+        ticket = (priority, next(self._seq))
+        with self._lock:
+            self._refill(t0)
+            if not self._queue and self.tokens >= 1.0:
+                self._take(t0, priority, 0.0)
+                return 0.0
+            bisect.insort(self._queue, ticket)
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    self._refill(now)
+                    rank = bisect.bisect_left(self._queue, ticket)
+                    if rank == 0 and self.tokens >= 1.0:
+                        self._queue.pop(0)
+                        waited = now - t0
+                        self._take(now, priority, waited)
+                        return waited
+                    delay = max((rank + 1.0 - self.tokens) / self.rate,
+                                self._cooldown_until - now, 0.001)
+                # 앞 사람이 취소하거나 더 높은 우선순위가 끼어들 수 있어 너무 길게 자지 않는다.
+                await asyncio.sleep(min(delay, 0.5))
+        except BaseException:
+            with self._lock:
+                i = bisect.bisect_left(self._queue, ticket)
+                if i < len(self._queue) and self._queue[i] == ticket:
+                    self._queue.pop(i)
+            raise
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """429 — 속도 절반, 버킷 비움, 잠시 멈춤."""
+        with self._lock:
+            now = time.monotonic()
+            self.rate = max(self.base_rate * MIN_RATE_FRACTION, self.rate * 0.5)
+            self.tokens = 0.0
+            self._updated = now
+            pause = retry_after if retry_after and retry_after > 0 else DEFAULT_COOLDOWN
+            self._cooldown_until = max(self._cooldown_until, now + pause)
+            self.throttled += 1
+            self.last_throttled_at = time.time()
+        logger.warning(
+            f"[naver_rate] 429 {self.customer_id}/{self.family} → {self.rate:.2f}/s, {pause:.1f}s 정지"
+        )
+
+    def reward(self) -> None:
+        """성공 — 줄였던 속도를 조금 되돌린다."""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * RECOVER_STEP)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            while self._recent and self._recent[0] < now - UTIL_WINDOW:
+                self._recent.popleft()
+            waiting = {name: 0 for name in PRIORITY_NAMES.values()}
+            for p, _ in self._queue:
+                waiting[PRIORITY_NAMES.get(p, str(p))] += 1
+            total = sum(self.granted.values())
+            return {
+                "customer_id": self.customer_id,
+                "family": self.family,
+                "base_rate": self.base_rate,
+                "rate": round(self.rate, 3),
+                "burst": self.burst,
+                "tokens": round(self.tokens, 2),
+                # 최근 UTIL_WINDOW 초 동안 가져간 토큰 / 원래 속도로 낼 수 있던 토큰
+                "utilization": round(len(self._recent) / (self.base_rate * UTIL_WINDOW), 3),
+                "granted": {PRIORITY_NAMES.get(p, str(p)): n for p, n in self.granted.items()},
+                "waiting": waiting,
+                "avg_wait_ms": round(self.waited_s / total * 1000, 1) if total else 0.0,
+                "max_wait_ms": round(self.max_wait_s * 1000, 1),
+                "throttled": self.throttled,
+                "cooling_s": round(max(0.0, self._cooldown_until - now), 2),
+                "last_throttled_at": self.last_throttled_at,
+            }
+
+
+_buckets: Dict[Tuple[str, str], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(customer_id: Any, family: str) -> TokenBucket:
+    key = (str(customer_id or ""), family)
+    b = _buckets.get(key)
+    if b is None:
+        with _buckets_lock:
+            b = _buckets.get(key)
+            if b is None:
+                rate, burst = _limits(family)
+                b = _buckets[key] = TokenBucket(key[0], family, rate, burst)
+    return b
+
+
+def governor_stats() -> List[Dict[str, Any]]:
+    """버킷별 현재 속도·사용률·대기열 (관리자 진단용)."""
+    with _buckets_lock:
+        buckets = list(_buckets.values())
+    return sorted((b.stats() for b in buckets), key=lambda s: (s["customer_id"], s["family"]))
+
+
+def reset_governor() -> None:
+    """버킷 전부 버림 (테스트용)."""
+    with _buckets_lock:
+        _buckets.clear()
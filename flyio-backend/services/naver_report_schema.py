@@ -22,7 +22,8 @@
   · **MasterReport Ad 에는 검수상태(inspectStatus)가 없다.** 전 행이 같은 값이라
     소재 반려 감지에 쓸 수 없다. 검수상태는 /ncc/ads?nccAdgroupId= 로만 온다.
 """
-from typing import Any, Dict, List, Optional
+from typing import (Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator,
+                    List, Optional)
 
 # ── StatReport ───────────────────────────────────────────────
 # 지원 reportTp (그 밖에는 11001 로 거부된다):
@@ -128,24 +129,58 @@ def _f(v: Any) -> float:
         return 0.0
 
 
+def iter_rows(lines: Iterable[str], expected_cols: int,
+              counts: Optional[Dict[str, int]] = None) -> Iterator[List[str]]:
+    """TSV 줄을 행으로 하나씩. 열 수가 안 맞는 행은 버리되 counts["skipped"] 에 센다.
+
+    counts["rows"] 에는 넘긴 행 수가 쌓인다. 리포트 전체를 리스트로 들고 있지 않아도
+    되도록 parse_rows 대신 이걸 쓴다.
+    """
+    if counts is None:
+        counts = {}
+    counts.setdefault("rows", 0)
+    counts.setdefault("skipped", 0)
+    for line in lines:
+        parts = _split(line, expected_cols, counts)
+        if parts is not None:
+            yield parts
+
+
+async def aiter_rows(lines: AsyncIterable[str], expected_cols: int,
+                     counts: Optional[Dict[str, int]] = None) -> AsyncIterator[List[str]]:
+    """iter_rows 의 비동기판 — NaverAdApiClient.stream_report_lines 에 바로 물린다."""
+    if counts is None:
+        counts = {}
+    counts.setdefault("rows", 0)
+    counts.setdefault("skipped", 0)
+    async for line in lines:
+        parts = _split(line, expected_cols, counts)
+        if parts is not None:
+            yield parts
+
+
+def _split(line: str, expected_cols: int, counts: Dict[str, int]) -> Optional[List[str]]:
+    line = line.rstrip("\r\n")
+    if not line.strip():
+        return None
+    parts = line.split("\t")
+    if len(parts) < expected_cols:
+        counts["skipped"] += 1
+        return None
+    counts["rows"] += 1
+    return parts
+
+
 def parse_rows(text: str, expected_cols: int) -> List[List[str]]:
     """TSV 를 행 리스트로. 열 수가 안 맞는 행은 버리되 몇 개인지 세어 둔다.
 
     조용히 버리면 파서가 어긋나도 눈치채지 못한다 — 호출자가 확인할 수 있게
     버려진 수를 리스트에 실어 보낸다.
     """
-    rows: List[List[str]] = []
-    skipped = 0
-    for line in text.splitlines():
-        if not line.strip():
-            continue
-        parts = line.split("\t")
-        if len(parts) < expected_cols:
-            skipped += 1
-            continue
-        rows.append(parts)
-    if skipped:
-        rows.append(["__SKIPPED__", str(skipped)])
+    counts: Dict[str, int] = {}
+    rows = list(iter_rows(text.splitlines(), expected_cols, counts))
+    if counts["skipped"]:
+        rows.append(["__SKIPPED__", str(counts["skipped"])])
     return rows
 
 
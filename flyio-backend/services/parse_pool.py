@@ -0,0 +1,94 @@
+"""
+HTML 파싱 워커 풀 — CPU 일을 이벤트 루프 밖(별도 프로세스)으로
+
+analyze_post 한 건은 PostView JSON·모바일 HTML 위에서 정규식 수십 개와 트리 구축을
+돈다. 판정(stage2_deep) 하나가 블로그 11개 × 최근 글 N개를 읽으므로 이게 같은
+이벤트 루프에서 돌면 그동안 다른 요청·워치독 틱이 통째로 멈췄다(수 초). 스레드로는
+GIL 때문에 안 풀린다 — 그래서 ProcessPoolExecutor 다.
+
+    from services.parse_pool import run_parse
+    from services import post_features as PF
+    state = await run_parse(PF.parse_postview, resp.content, resp.encoding, kw, base)
+
+- 넘기는 함수는 모듈 최상위의 순수 함수여야 한다(피클). 인자·반환은 bytes/dict 정도.
+- 워커 수: PARSE_WORKERS (기본 = min(2, 코어 수)). 0 이면 풀 없이 호출한 자리에서
+  돈다(테스트·디버깅용).
+  기본을 코어 수로 두지 않는 이유는 메모리다. 풀은 **프로세스마다** 따로 뜬다 —
+  app·worker·verdict_worker 가 각자 하나씩. 워커 하나는 run_parse 로 넘긴 함수의
+  모듈(services.keyword_verdict·post_features 와 그 임포트)을 올린 파이썬 프로세스라
+  수십 MB(로컬 실측 ~30MB, 파서 라이브러리가 올라가면 더)이고, forkserver 까지 더해진다.
+  3GB 머신에서 chromium 풀(services/browser_pool)·SQLite 캐시와 같이 살아야 하므로
+  프로세스당 2개면 충분하다 — 파싱은 건당 수십~수백 ms 라 루프만 안 막으면 된다.
+- 프로세스는 처음 쓸 때 띄운다. 시작 방식은 forkserver — 스레드가 도는 uvicorn
+  프로세스를 fork 하면 잡혀 있던 락(로깅 등)째로 복제돼 워커가 멈출 수 있다.
+- 워커가 죽으면(OOM 등) 풀을 다시 만들고 그 한 건은 그 자리에서 돈다.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", str(min(2, os.cpu_count() or 1))))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_stats = {"submitted": 0, "inline": 0, "broken": 0}
+
+
+def _mp_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    if PARSE_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=_mp_context())
+            logger.info(f"[parse-pool] {PARSE_WORKERS} workers")
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_parse(fn: Callable, *args):
+    """fn(*args) 를 파싱 워커에서 실행하고 결과를 돌려준다. fn 의 예외는 그대로 올라온다."""
+    pool = _get_pool()
+    if pool is None:
+        _stats["inline"] += 1
+        return fn(*args)
+    try:
+        _stats["submitted"] += 1
+        return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        _stats["broken"] += 1
+        logger.warning("[parse-pool] worker died — pool recreated, running inline once")
+        _discard_pool(pool)
+        return fn(*args)
+
+
+def parse_pool_stats() -> Dict:
+    return {"workers": PARSE_WORKERS, "started": _pool is not None, **_stats}
+
+
+def shutdown_parse_pool() -> None:
+    """lifespan 종료·워커 프로세스 종료 때 호출."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
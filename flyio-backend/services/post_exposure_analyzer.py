@@ -8,16 +8,16 @@
 기존 부품을 조립만 한다 (신규 크롤러 없음):
   - RSS 글목록:      routers.content_lifespan.fetch_blog_posts_via_rss
   - SERP 순위/색인:  services.rank_checker.RankChecker (네이버 OpenAPI blog.json)
-  - 월검색량:        routers.blogs.get_related_keywords_from_searchad (searchad keywordstool, 24h 캐시)
+  - 월검색량:        services.keyword_volume.lookup (searchad keywordstool, 영속 캐시·배치 합치기)
   - 키워드/불용어:   services.blog_index_verifier._extract_keywords
 
 크레덴셜이 없으면 해당 신호만 None 으로 우아하게 저하한다 (조작값 만들지 않음).
 """
 import asyncio
 import logging
-import re
 from typing import Dict, List, Optional
 
+from services import keyword_volume
 from services.rank_checker import RankChecker
 from services.blog_index_verifier import _extract_keywords, _quoted, SEARCH_TOP_K
 
@@ -28,36 +28,6 @@ MAX_POSTS_DEFAULT = 10           # 블덱스도 최근 10개 노출
 MAX_KEYWORDS_PER_POST = 3        # 칩 개수
 MAX_VOLUME_LOOKUPS_PER_POST = 5  # 검색량 조회 후보 상한 (rate-limit 보호)
 POST_CONCURRENCY = 3
-VOLUME_CONCURRENCY = 2           # searchad 검색량 조회 동시성 (429 방지)
-
-
-def _normalize_kw(s: str) -> str:
-    """검색량 매칭용 정규화 — 공백 제거 + 소문자."""
-    return re.sub(r"\s+", "", s or "").lower()
-
-
-async def _get_keyword_volume(keyword: str) -> Optional[int]:
-    """
-    단일 키워드의 월 총검색량(PC+모바일)을 searchad keywordstool 에서 조회.
-    반환 리스트에서 질의어와 정확히 일치하는 항목의 volume 만 사용 (연관어 아님).
-    실패/미설정 시 None.
-    """
-    try:
-        # 지연 임포트로 순환 방지
-        from routers.blogs import get_related_keywords_from_searchad
-
-        resp = await get_related_keywords_from_searchad(keyword)
-        if not resp or not getattr(resp, "success", False):
-            return None
-
-        target = _normalize_kw(keyword)
-        for kw in resp.keywords:
-            if _normalize_kw(kw.keyword) == target:
-                return kw.monthly_total_search
-        return None
-    except Exception as e:
-        logger.debug(f"volume lookup failed for {keyword!r}: {e}")
-        return None
 
 
 def _title_keyword_pool(title: str) -> List[str]:
@@ -180,14 +150,12 @@ async def analyze_post_exposure(
     for p in sample:
         unique_keywords.update(_title_keyword_pool((p.get("title") or "").strip()))
 
-    vol_sem = asyncio.Semaphore(VOLUME_CONCURRENCY)
-
-    async def _bounded_volume(kw: str):
-        async with vol_sem:
-            return kw, await _get_keyword_volume(kw)
-
-    volume_pairs = await asyncio.gather(*[_bounded_volume(k) for k in unique_keywords])
-    volume_map: Dict[str, Optional[int]] = {k: v for k, v in volume_pairs}
+    # 5개씩 한 콜로 묶이고(keyword_volume), 캐시에 있는 건 API 를 안 부른다.
+    # 질의어와 정확히 일치하는 항목의 검색량만 쓴다(연관어 아님). 없거나 실패면 None.
+    found = await keyword_volume.lookup(unique_keywords)
+    volume_map: Dict[str, Optional[int]] = {
+        k: (found[k]["monthly_total"] if found.get(k) else None) for k in unique_keywords
+    }
 
     # ===== 글별 카드 생성 (누락 + 순위) =====
     sem = asyncio.Semaphore(POST_CONCURRENCY)
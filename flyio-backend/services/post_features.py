@@ -0,0 +1,300 @@
+"""
+블로그 글 HTML → 피처 (순수 함수, parse 워커 프로세스에서 돈다)
+
+routers/blogs.analyze_post 가 하던 CPU 일(정규식 수십 개, __PRELOADED_STATE__ JSON,
+HTML 트리 구축·셀렉터)을 떼어 왔다. 입력은 응답 원본 bytes, 출력은 피처 dict 뿐이고
+네트워크·DB·로거 설정에 손대지 않는다 — services/parse_pool 이 별도 프로세스로 넘긴다.
+
+두 단계인 이유: 모바일 페이지를 또 받을지는 PostView JSON 에서 본문을 얼마나 얻었는지에
+달렸다. 그 사이의 I/O 는 호출부(이벤트 루프)가 한다.
+
+    state = parse_postview(raw, encoding, keyword, base)        # 방법 1
+    if need_page(state): raw = (await client.get(mobile_url)).content
+    state = parse_post_page(raw, encoding, keyword, state)      # 방법 2 + 날짜 1~4
+
+state = {"analysis": {...}, "content_text": str, "title_text": str}
+"""
+import json
+import re
+from datetime import datetime
+from typing import Dict, Optional
+
+from services.html_select import parse_html, select, select_one, text_of
+
+_PRELOADED = re.compile(r'__PRELOADED_STATE__\s*=\s*(\{.+?\});?\s*</script>', re.DOTALL)
+
+
+def _decode(raw: bytes, encoding: Optional[str]) -> str:
+    if isinstance(raw, str):
+        return raw
+    return (raw or b"").decode(encoding or "utf-8", errors="replace")
+
+
+def _age_days(y: int, m: int, d: int) -> int:
+    return (datetime.now() - datetime(y, m, d)).days
+
+
+def need_page(state: Dict) -> bool:
+    """PostView JSON 만으로 본문이 모자라면 모바일 페이지를 받아야 한다."""
+    content_text = state.get("content_text") or ""
+    return not content_text or len(content_text) < 100
+
+
+def parse_postview(raw: bytes, encoding: Optional[str], keyword: str, analysis: Dict) -> Dict:
+    """방법 1 — PostView 응답의 __PRELOADED_STATE__ JSON 에서 피처 추출."""
+    analysis = dict(analysis)
+    state = {"analysis": analysis, "content_text": "", "title_text": ""}
+    html = _decode(raw, encoding)
+
+    json_match = _PRELOADED.search(html)
+    if not json_match:
+        return state
+    try:
+        json_data = json.loads(json_match.group(1))
+        post_data = json_data.get('post', {}).get('post', {})
+        if not post_data:
+            return state
+
+        state["title_text"] = post_data.get('title', '')
+        raw_content = post_data.get('content', '') or post_data.get('text', '')
+
+        # 콘텐츠에서 피처 추출 (태그 제거 전)
+        if raw_content:
+            # 소제목 개수 (h2, h3, h4 태그 또는 se-section-title)
+            heading_matches = re.findall(r'<(h[2-4]|strong|b)[^>]*class="[^"]*se-[^"]*"[^>]*>', raw_content, re.IGNORECASE)
+            heading_matches += re.findall(r'<(h[2-4])[^>]*>', raw_content, re.IGNORECASE)
+            analysis["heading_count"] = len(heading_matches)
+
+            # 문단 개수 (<p> 또는 <div class="se-text-paragraph">)
+            paragraph_matches = re.findall(r'<(p|div)[^>]*class="[^"]*se-text-paragraph[^"]*"[^>]*>', raw_content, re.IGNORECASE)
+            paragraph_matches += re.findall(r'<p[^>]*>', raw_content, re.IGNORECASE)
+            analysis["paragraph_count"] = len(paragraph_matches)
+
+            # 지도 포함 여부
+            analysis["has_map"] = bool(re.search(r'se-map|class="map|map\.naver|place_thumb', raw_content, re.IGNORECASE))
+
+            # 외부 링크 포함 여부
+            links = re.findall(r'href="(https?://[^"]+)"', raw_content)
+            external_links = [l for l in links if 'naver.com' not in l and 'naver.net' not in l]
+            analysis["has_link"] = len(external_links) > 0
+
+            # 이미지 개수 (태그에서 직접 추출)
+            img_count = len(re.findall(r'<img[^>]+>', raw_content))
+            if img_count > 0:
+                analysis["image_count"] = img_count
+
+            # HTML 태그 제거
+            content_text = re.sub(r'<[^>]+>', ' ', raw_content)
+            state["content_text"] = re.sub(r'\s+', ' ', content_text).strip()
+
+        # 이미지/동영상 카운트 (JSON 필드 우선)
+        if post_data.get('imageCount', 0) > 0:
+            analysis["image_count"] = post_data.get('imageCount', 0)
+        analysis["video_count"] = post_data.get('videoCount', 0)
+        analysis["like_count"] = post_data.get('sympathyCount', 0)
+        analysis["comment_count"] = post_data.get('commentCount', 0)
+
+        # 작성일에서 post_age_days 계산
+        add_date = post_data.get('addDate', '') or post_data.get('logDate', '')
+        if add_date:
+            try:
+                # 다양한 날짜 형식 처리
+                date_match = re.search(r'(\d{4})[.\-/]?(\d{2})[.\-/]?(\d{2})', str(add_date))
+                if date_match:
+                    analysis["post_age_days"] = _age_days(*map(int, date_match.groups()))
+            except Exception:
+                pass
+
+        analysis["fetch_method"] = "json_preload"
+    except Exception:
+        pass   # JSON 이 깨졌으면 모바일 페이지로 넘어간다
+    return state
+
+
+def parse_post_page(raw: bytes, encoding: Optional[str], keyword: str, state: Dict) -> Dict:
+    """방법 2 — 글 페이지 HTML(모바일 또는 PostView) 셀렉터 + 날짜 추출 1~4."""
+    analysis = dict(state["analysis"])
+    content_text = state.get("content_text") or ""
+    title_text = state.get("title_text") or ""
+    html = _decode(raw, encoding)
+    doc = parse_html(html)
+
+    # 모바일 버전 셀렉터들
+    # 제목 (JSON에서 이미 추출한 경우 스킵)
+    if not title_text:
+        title_elem = select_one(doc, '.se-title-text, .tit_h3, ._postTitleText, .post_tit, h3.se_textarea, .tit_view')
+        if title_elem is not None:
+            title_text = text_of(title_elem)
+        else:
+            # og:title에서 추출
+            og_title = select_one(doc, 'meta[property="og:title"]')
+            if og_title is not None:
+                title_text = og_title.get('content', '')
+
+    if title_text:
+        keyword_lower = keyword.lower().replace(" ", "")
+        title_lower = title_text.lower().replace(" ", "")
+
+        if keyword_lower in title_lower:
+            analysis["title_has_keyword"] = True
+            pos = title_lower.find(keyword_lower)
+            title_len = len(title_lower)
+            if pos == 0:
+                analysis["title_keyword_position"] = 0
+            elif pos > title_len * 0.7:
+                analysis["title_keyword_position"] = 2
+            else:
+                analysis["title_keyword_position"] = 1
+
+    # 본문 - 모바일 버전 셀렉터들 (JSON에서 이미 추출한 경우 스킵)
+    if not content_text or len(content_text) < 100:
+        content_elem = select_one(doc, '.se-main-container, ._postView, .post_ct, #postViewArea, .se_component_wrap, .__viewer_container')
+        if content_elem is None:
+            # 전체 article 영역에서 시도
+            content_elem = select_one(doc, 'article, .post_article, .blog_view_content')
+
+        if content_elem is not None:
+            content_text = text_of(content_elem)
+            if not analysis["fetch_method"]:
+                analysis["fetch_method"] = "mobile_html"
+        else:
+            # 본문을 못 찾았으면 og:description에서 길이 추정
+            og_desc = select_one(doc, 'meta[property="og:description"]')
+            if og_desc is not None:
+                desc = og_desc.get('content', '')
+                if len(desc) > len(content_text):
+                    # 보통 설명은 200자 정도, 실제 본문은 5~10배 추정
+                    content_text = desc
+                    analysis["content_length"] = len(desc) * 8
+                    analysis["fetch_method"] = "og_fallback"
+                    analysis["data_fetched"] = True
+
+    # 콘텐츠 분석 (content_text가 있으면)
+    if content_text:
+        if analysis["content_length"] == 0:
+            analysis["content_length"] = len(content_text)
+        analysis["data_fetched"] = True
+
+        # 키워드 등장 횟수
+        keyword_lower = keyword.lower().replace(" ", "")
+        content_lower = content_text.lower().replace(" ", "")
+        analysis["keyword_count"] = content_lower.count(keyword_lower)
+
+        # 키워드 밀도 (1000자당 등장 횟수)
+        if analysis["content_length"] > 0:
+            analysis["keyword_density"] = round(
+                (analysis["keyword_count"] * 1000) / analysis["content_length"], 2
+            )
+
+    # 이미지 개수 - 다양한 셀렉터 (JSON에서 이미 추출된 경우 스킵)
+    if analysis["image_count"] == 0:
+        images = select(doc, '.se-image-resource, img.se_mediaImage, ._postView img, .post_ct img, img[src*="blogfiles"], img[src*="postfiles"]')
+        analysis["image_count"] = len(images)
+
+        # og:image 카운트 폴백
+        if analysis["image_count"] == 0:
+            og_images = select(doc, 'meta[property="og:image"]')
+            if og_images:
+                analysis["image_count"] = len(og_images)
+
+    # 동영상 개수 (JSON에서 이미 추출된 경우 스킵)
+    if analysis["video_count"] == 0:
+        videos = select(doc, '.se-video, iframe[src*="video"], iframe[src*="youtube"], iframe[src*="tv.naver"], .video_player')
+        analysis["video_count"] = len(videos)
+
+    # 소제목 개수 (JSON에서 이미 추출된 경우 스킵)
+    if analysis["heading_count"] == 0:
+        headings = select(doc, '.se-section-title, .se-text-paragraph-align-center, h2, h3, h4, .se-title, strong.se-text-paragraph')
+        analysis["heading_count"] = len(headings)
+
+    # 문단 개수 (JSON에서 이미 추출된 경우 스킵)
+    if analysis["paragraph_count"] == 0:
+        paragraphs = select(doc, '.se-text-paragraph, p, .se-module-text')
+        # 빈 문단 제외
+        valid_paragraphs = [p for p in paragraphs if len(text_of(p)) > 10]
+        analysis["paragraph_count"] = len(valid_paragraphs)
+
+    # 지도 포함 여부 (JSON에서 이미 추출된 경우 스킵)
+    if not analysis["has_map"]:
+        maps = select(doc, '.se-map, iframe[src*="map"], .map_area, .place_thumb, .se-place')
+        analysis["has_map"] = len(maps) > 0
+
+    # 외부 링크 포함 여부 (JSON에서 이미 추출된 경우 스킵)
+    if not analysis["has_link"]:
+        links = select(doc, 'a[href*="http"]:not([href*="naver.com"]):not([href*="naver.net"])')
+        analysis["has_link"] = len(links) > 0
+
+    # 공감 수 (모바일) — 셀렉터 + 인라인 attribute regex
+    if not analysis["like_count"]:
+        like_elem = select_one(doc, '.u_cnt, .sympathy_count, ._sympathyCount, .like_count, .btn_like_count')
+        if like_elem is not None:
+            nums = re.findall(r'\d+', text_of(like_elem))
+            if nums:
+                analysis["like_count"] = int(nums[0])
+        # 인라인 HTML의 sympathyCnt="N" / sympathyCount="N" attribute
+        if not analysis["like_count"]:
+            m = re.search(r'(?:sympathyCnt|sympathyCount|likeCount)\s*=\s*["\']?(\d+)["\']?', html)
+            if m:
+                analysis["like_count"] = int(m.group(1))
+
+    # 댓글 수 — 셀렉터 + 인라인 attribute regex
+    if not analysis["comment_count"]:
+        comment_elem = select_one(doc, '.comment_count, ._commentCount, .cmt_count, .btn_comment_count')
+        if comment_elem is not None:
+            nums = re.findall(r'\d+', text_of(comment_elem))
+            if nums:
+                analysis["comment_count"] = int(nums[0])
+        # 모바일 HTML 인라인 attribute: commentCount="N"
+        if not analysis["comment_count"]:
+            m = re.search(r'commentCount\s*=\s*["\']?(\d+)["\']?', html)
+            if m:
+                analysis["comment_count"] = int(m.group(1))
+
+    # 작성일 추출 (여러 방법 시도) — 방법 5(RSS)는 네트워크라 호출부가 한다
+    # 방법 1: HTML 요소에서 찾기
+    date_elem = select_one(doc, '.se_publishDate, .se-date, ._postAddDate, .post_date, .date, .blog_date, time')
+    if date_elem is not None:
+        try:
+            # YYYY.MM.DD 또는 YYYY-MM-DD 형식
+            date_match = re.search(r'(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})', text_of(date_elem))
+            if date_match:
+                analysis["post_age_days"] = _age_days(*map(int, date_match.groups()))
+        except Exception:
+            pass
+
+    # 방법 2: HTML에서 14자리 타임스탬프 찾기 (YYYYMMDDHHMMSS)
+    if analysis["post_age_days"] is None:
+        try:
+            # addDate 또는 logDate 관련 타임스탬프 (예전처럼 bytes repr 위에서 찾는다)
+            timestamp_match = re.search(r'(?:addDate|logDate|publishDate|date)["\'\s:=]+["\']?(\d{14})',
+                                        str(raw), re.IGNORECASE)
+            if timestamp_match:
+                ts = timestamp_match.group(1)
+                analysis["post_age_days"] = _age_days(int(ts[:4]), int(ts[4:6]), int(ts[6:8]))
+        except Exception:
+            pass
+
+    # 방법 3: 메타 태그에서 찾기
+    if analysis["post_age_days"] is None:
+        try:
+            meta_date = select_one(doc, 'meta[property="article:published_time"], meta[name="date"]')
+            if meta_date is not None and meta_date.get('content'):
+                date_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', meta_date.get('content'))
+                if date_match:
+                    analysis["post_age_days"] = _age_days(*map(int, date_match.groups()))
+        except Exception:
+            pass
+
+    # 방법 4: HTML 전체에서 YYYY.MM.DD 패턴 찾기 (가장 공격적)
+    if analysis["post_age_days"] is None:
+        try:
+            # YYYY.MM.DD, YYYY-MM-DD, YYYY/MM/DD 형식
+            date_match = re.search(r'(20[12][0-9])[\.\-/]([01]?[0-9])[\.\-/]([0-3]?[0-9])', html)
+            if date_match:
+                y, m, d = int(date_match.group(1)), int(date_match.group(2)), int(date_match.group(3))
+                if 1 <= m <= 12 and 1 <= d <= 31:
+                    analysis["post_age_days"] = _age_days(y, m, d)
+        except Exception:
+            pass
+
+    return {"analysis": analysis, "content_text": content_text, "title_text": title_text}
@@ -106,7 +106,7 @@ def extract_topic_terms(titles: List[str], top_n: int = 25) -> List[str]:
 
 async def fetch_posting_history(blog_id: str, max_pages: int = MAX_PAGES) -> Dict:
     """전체 발행 이력을 일자별 건수로 집계해 돌려준다."""
-    import httpx
+    from services.http_clients import get_client
 
     headers = {"User-Agent": _UA, "Referer": f"https://blog.naver.com/{blog_id}"}
     params_base = {
@@ -128,54 +128,54 @@ async def fetch_posting_history(blog_id: str, max_pages: int = MAX_PAGES) -> Dic
         "topic_terms": [],
     }
 
-    async with httpx.AsyncClient(timeout=httpx.Timeout(15.0, connect=5.0),
-                                 follow_redirects=True) as client:
-        async def get_page(page: int) -> Dict:
-            try:
-                r = await client.get(LIST_URL, params={**params_base, "currentPage": page},
-                                     headers=headers)
-                if r.status_code != 200:
-                    return {"dates": [], "total": None}
-                return _extract(r.text)
-            except Exception as e:
-                logger.debug(f"[posting-history] page {page} failed for {blog_id}: {e}")
+    client = get_client("blog")
+
+    async def get_page(page: int) -> Dict:
+        try:
+            r = await client.get(LIST_URL, params={**params_base, "currentPage": page},
+                                 headers=headers)
+            if r.status_code != 200:
                 return {"dates": [], "total": None}
+            return _extract(r.text)
+        except Exception as e:
+            logger.debug(f"[posting-history] page {page} failed for {blog_id}: {e}")
+            return {"dates": [], "total": None}
 
-        first = await get_page(1)
-        if not first["dates"] and not first["total"]:
-            return result
+    first = await get_page(1)
+    if not first["dates"] and not first["total"]:
+        return result
 
-        total = first["total"] or len(first["dates"])
-        result["total_posts"] = total
+    total = first["total"] or len(first["dates"])
+    result["total_posts"] = total
 
-        pages_needed = max(1, -(-total // PER_PAGE))  # ceil
-        if pages_needed > max_pages:
-            pages_needed = max_pages
-            result["truncated"] = True
+    pages_needed = max(1, -(-total // PER_PAGE))  # ceil
+    if pages_needed > max_pages:
+        pages_needed = max_pages
+        result["truncated"] = True
 
-        all_dates: List[str] = list(first["dates"])
-        all_titles: List[str] = list(first.get("titles") or [])
+    all_dates: List[str] = list(first["dates"])
+    all_titles: List[str] = list(first.get("titles") or [])
 
-        # 시간 예산 — Fly → 네이버는 로컬보다 훨씬 느릴 수 있다. 45페이지를 끝까지
-        # 기다리다 요청이 통째로 타임아웃되느니, 모은 만큼만 주고 truncated 를 세운다.
-        deadline = asyncio.get_event_loop().time() + TIME_BUDGET_SECONDS
-        batch = CONCURRENCY * 3
+    # 시간 예산 — Fly → 네이버는 로컬보다 훨씬 느릴 수 있다. 45페이지를 끝까지
+    # 기다리다 요청이 통째로 타임아웃되느니, 모은 만큼만 주고 truncated 를 세운다.
+    deadline = asyncio.get_event_loop().time() + TIME_BUDGET_SECONDS
+    batch = CONCURRENCY * 3
 
-        for start in range(2, pages_needed + 1, batch):
-            if asyncio.get_event_loop().time() > deadline:
-                result["truncated"] = True
-                logger.info(f"[posting-history] time budget hit for {blog_id} at page {start}")
-                break
-            chunk = range(start, min(start + batch, pages_needed + 1))
-            sem = asyncio.Semaphore(CONCURRENCY)
+    for start in range(2, pages_needed + 1, batch):
+        if asyncio.get_event_loop().time() > deadline:
+            result["truncated"] = True
+            logger.info(f"[posting-history] time budget hit for {blog_id} at page {start}")
+            break
+        chunk = range(start, min(start + batch, pages_needed + 1))
+        sem = asyncio.Semaphore(CONCURRENCY)
 
-            async def guarded(page: int):
-                async with sem:
-                    return await get_page(page)
+        async def guarded(page: int):
+            async with sem:
+                return await get_page(page)
 
-            for p in await asyncio.gather(*(guarded(i) for i in chunk)):
-                all_dates.extend(p["dates"])
-                all_titles.extend(p.get("titles") or [])
+        for p in await asyncio.gather(*(guarded(i) for i in chunk)):
+            all_dates.extend(p["dates"])
+            all_titles.extend(p.get("titles") or [])
 
     if not all_dates:
         return result
@@ -198,9 +198,7 @@ async def fetch_posting_history(blog_id: str, max_pages: int = MAX_PAGES) -> Dic
 CACHE_TTL_HOURS = 12
 
 
-def _cache_conn():
-    from database.blog_index_history_db import _connect
-    conn = _connect()
+def _create_cache_table(conn) -> None:
     conn.execute("""
         CREATE TABLE IF NOT EXISTS posting_history_cache (
             blog_id TEXT PRIMARY KEY,
@@ -208,7 +206,13 @@ def _cache_conn():
             fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     """)
-    conn.commit()
+
+
+def _cache_conn():
+    from database.blog_index_history_db import INDEX_HISTORY_DB_PATH, _connect
+    from database.connection_pool import ensure_schema
+    conn = _connect()
+    ensure_schema(INDEX_HISTORY_DB_PATH, "posting_history_cache", _create_cache_table, timeout=10)
     return conn
 
 
@@ -5,11 +5,13 @@
 import os
 import re
 import asyncio
-import aiohttp
+import httpx
 from typing import Optional, List, Dict
 from urllib.parse import quote, urlparse
 import logging
 
+from services.http_clients import get_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,25 +44,18 @@ class RankChecker:
     MAX_SEARCH_RESULTS = 30  # 최대 검색 결과 수
     SEARCH_TIMEOUT = 30  # 타임아웃 (초)
 
+    # 엔드포인트 (벤치마크·테스트에서 로컬 가짜 SERP 로 바꿔 끼운다)
+    BLOG_SEARCH_URL = "https://openapi.naver.com/v1/search/blog.json"
+    VIEW_SEARCH_URL = "https://search.naver.com/search.naver"
+
     # User-Agent
     USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 
     def __init__(self):
-        self.session = None
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """aiohttp 세션 가져오기"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.SEARCH_TIMEOUT),
-                headers={'User-Agent': self.USER_AGENT}
-            )
-        return self.session
+        self.fetches = 0  # 이 인스턴스가 보낸 SERP 요청 수
 
     async def close(self):
-        """세션 종료"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """호환용 — 연결은 services/http_clients 의 공용 풀이 들고 있어 닫을 것이 없다."""
 
     async def check_blog_tab_rank(self, keyword: str, target_blog_id: str,
                                   max_results: int = 10) -> Optional[int]:
@@ -75,14 +70,23 @@ class RankChecker:
         Returns:
             순위 (1-based) 또는 None (미노출)
         """
+        items = await self.fetch_blog_tab_items(keyword, max_results)
+        return self.rank_in_blog_items(items, target_blog_id) if items else None
+
+    async def fetch_blog_tab_items(self, keyword: str,
+                                   max_results: int = 10) -> Optional[List[Dict]]:
+        """블로그탭 검색 결과 items (실패·크레덴셜 없음 → None).
+
+        같은 키워드를 여러 블로그가 추적할 때 한 번만 받아 rank_in_blog_items 로
+        블로그마다 순위를 뽑는다(services/rank_measurement).
+        """
         if not self.NAVER_CLIENT_ID or not self.NAVER_CLIENT_SECRET:
             logger.warning("Naver API credentials not configured")
             return None
 
         try:
-            session = await self._get_session()
+            client = get_client("openapi")
 
-            url = "https://openapi.naver.com/v1/search/blog.json"
             params = {
                 'query': keyword,
                 'display': min(max_results, self.MAX_SEARCH_RESULTS),
@@ -90,41 +94,46 @@ class RankChecker:
                 'sort': 'sim'  # 정확도순
             }
             headers = {
+                'User-Agent': self.USER_AGENT,
                 'X-Naver-Client-Id': self.NAVER_CLIENT_ID,
                 'X-Naver-Client-Secret': self.NAVER_CLIENT_SECRET
             }
 
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status != 200:
-                    logger.error(f"Naver API error: {response.status}")
-                    return None
+            self.fetches += 1
+            response = await client.get(self.BLOG_SEARCH_URL, params=params, headers=headers,
+                                        timeout=self.SEARCH_TIMEOUT)
+            if response.status_code != 200:
+                logger.error(f"Naver API error: {response.status_code}")
+                return None
 
-                data = await response.json()
-                items = data.get('items', [])
+            data = response.json()
+            return data.get('items', [])
 
-                # 블로그 ID로 순위 찾기
-                for i, item in enumerate(items, 1):
-                    blog_link = item.get('bloggerlink', '') or item.get('link', '')
-
-                    # blog.naver.com/{blog_id} 형식에서 블로그 ID 추출
-                    if 'blog.naver.com' in blog_link:
-                        match = re.search(r'blog\.naver\.com/([^/?]+)', blog_link)
-                        if match and match.group(1) == target_blog_id:
-                            return i
-
-                    # postURL에서도 확인
-                    if f'blog.naver.com/{target_blog_id}' in blog_link:
-                        return i
-
-                return None  # 미노출
-
-        except asyncio.TimeoutError:
+        except (asyncio.TimeoutError, httpx.TimeoutException):
             logger.warning(f"Timeout checking blog tab rank for keyword: {keyword}")
             return None
         except Exception as e:
             logger.error(f"Error checking blog tab rank: {e}")
             return None
 
+    @staticmethod
+    def rank_in_blog_items(items: List[Dict], target_blog_id: str) -> Optional[int]:
+        """블로그탭 items 에서 target_blog_id 의 순위 (1-based) 또는 None (미노출)"""
+        for i, item in enumerate(items, 1):
+            blog_link = item.get('bloggerlink', '') or item.get('link', '')
+
+            # blog.naver.com/{blog_id} 형식에서 블로그 ID 추출
+            if 'blog.naver.com' in blog_link:
+                match = re.search(r'blog\.naver\.com/([^/?]+)', blog_link)
+                if match and match.group(1) == target_blog_id:
+                    return i
+
+            # postURL에서도 확인
+            if f'blog.naver.com/{target_blog_id}' in blog_link:
+                return i
+
+        return None  # 미노출
+
     async def check_view_tab_rank(self, keyword: str, target_url: str,
                                   max_results: int = 10) -> Optional[int]:
         """
@@ -138,11 +147,16 @@ class RankChecker:
         Returns:
             순위 (1-based) 또는 None (미노출)
         """
+        links = await self.fetch_view_tab_links(keyword)
+        return self.rank_in_view_links(links, target_url, max_results) if links else None
+
+    async def fetch_view_tab_links(self, keyword: str) -> Optional[List[str]]:
+        """VIEW 탭 HTML 에서 뽑은 블로그 링크 목록 (광고 제외, 실패 → None)"""
         try:
-            session = await self._get_session()
+            client = get_client("search")
 
             # 통합검색 VIEW 탭 URL
-            search_url = f"https://search.naver.com/search.naver?where=view&query={quote(keyword)}"
+            search_url = f"{self.VIEW_SEARCH_URL}?where=view&query={quote(keyword)}"
 
             headers = {
                 'User-Agent': self.USER_AGENT,
@@ -150,39 +164,41 @@ class RankChecker:
                 'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
             }
 
-            async with session.get(search_url, headers=headers) as response:
-                if response.status != 200:
-                    logger.error(f"View tab search error: {response.status}")
-                    return None
-
-                html = await response.text()
-
-                # blog.naver.com 링크 추출 (광고 제외)
-                links = self._extract_blog_links(html)
-
-                # 타겟 URL과 매칭
-                target_post_id = self._extract_post_id(target_url)
-
-                for i, link in enumerate(links[:max_results], 1):
-                    link_post_id = self._extract_post_id(link)
+            self.fetches += 1
+            response = await client.get(search_url, headers=headers, timeout=self.SEARCH_TIMEOUT)
+            if response.status_code != 200:
+                logger.error(f"View tab search error: {response.status_code}")
+                return None
 
-                    # 포스팅 ID로 매칭
-                    if target_post_id and link_post_id and target_post_id == link_post_id:
-                        return i
+            # blog.naver.com 링크 추출 (광고 제외)
+            return self._extract_blog_links(response.text)
 
-                    # URL 일부 매칭
-                    if target_url in link or link in target_url:
-                        return i
-
-                return None  # 미노출
-
-        except asyncio.TimeoutError:
+        except (asyncio.TimeoutError, httpx.TimeoutException):
             logger.warning(f"Timeout checking view tab rank for keyword: {keyword}")
             return None
         except Exception as e:
             logger.error(f"Error checking view tab rank: {e}")
             return None
 
+    def rank_in_view_links(self, links: List[str], target_url: str,
+                           max_results: int = 10) -> Optional[int]:
+        """VIEW 탭 링크 목록에서 target_url 의 순위 (1-based) 또는 None (미노출)"""
+        # 타겟 URL과 매칭
+        target_post_id = self._extract_post_id(target_url)
+
+        for i, link in enumerate(links[:max_results], 1):
+            link_post_id = self._extract_post_id(link)
+
+            # 포스팅 ID로 매칭
+            if target_post_id and link_post_id and target_post_id == link_post_id:
+                return i
+
+            # URL 일부 매칭
+            if target_url in link or link in target_url:
+                return i
+
+        return None  # 미노출
+
     def _extract_blog_links(self, html: str) -> List[str]:
         """HTML에서 블로그 링크 추출 (광고 제외)"""
         links = []
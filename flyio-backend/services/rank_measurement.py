@@ -0,0 +1,93 @@
+"""
+키워드 중심 순위 측정 엔진 — 추적 블로그 전체를 SERP 한 번씩으로 잰다
+
+예전 run_rank_check 는 블로그 하나의 키워드를 하나씩 돌며 블로그탭 → VIEW탭을
+차례로 조회하고 0.5초씩 쉬었다. admin_measure_all 은 블로그마다 그런 작업을 따로
+큐에 넣었으므로, 여러 블로그가 같은 키워드를 추적하면 같은 SERP 를 블로그 수만큼 받았다.
+
+    targets = [{"keyword_id": 12, "keyword": "제주 맛집", "blog_id": "abc",
+                "post_url": "https://blog.naver.com/abc/223…"}, …]
+    rows = await measure_keywords(targets, on_keyword=progress)
+    db.add_rank_history_bulk(rows)
+
+  - targets 를 키워드로 묶는다(keyword → [추적 포스팅]).
+  - 키워드마다 블로그탭 items 와 VIEW탭 링크를 **한 번씩** 받고(예전처럼 블로그탭 → VIEW탭),
+    그 한 페이지에서 묶인 모든 포스팅의 순위를 뽑는다(RankChecker.rank_in_*).
+  - 기본 속도는 예전 루프와 같다: 키워드 하나씩, 키워드 사이 RANK_FETCH_DELAY(0.5초).
+    줄어드는 건 SERP 요청 **수**(겹치는 키워드를 한 번만)라 네이버 쪽 요청 속도는 그대로다.
+    RANK_FETCH_CONCURRENCY 를 올리면 키워드 단위로 병렬이 되지만 요청 속도도 그만큼
+    올라간다 — 차단 위험을 감수할 때만 올린다.
+  - 결과는 rank_history 행 (post_keyword_id, rank_blog_tab, rank_view_tab) 목록 — 호출부가 한 번에 넣는다.
+
+조회 실패는 예전과 같이 순위 None 으로 기록된다(RankChecker 가 예외를 삼킨다).
+"""
+import asyncio
+import logging
+import os
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from services.rank_checker import RankChecker
+
+logger = logging.getLogger(__name__)
+
+# 동시에 조회하는 키워드 수. 1 = 예전 순차 루프와 같은 SERP 요청 속도.
+RANK_FETCH_CONCURRENCY = int(os.environ.get("RANK_FETCH_CONCURRENCY", "1"))
+# 워커별 키워드 사이 간격(초). 예전 순차 루프의 0.5초 rate limit 을 워커 단위로 유지.
+RANK_FETCH_DELAY = float(os.environ.get("RANK_FETCH_DELAY", "0.5"))
+
+
+def group_by_keyword(targets: List[Dict]) -> Dict[str, List[Dict]]:
+    """keyword → [target]. 앞뒤 공백만 정리하고 대소문자 등은 그대로 둔다(검색어가 달라진다)."""
+    groups: Dict[str, List[Dict]] = {}
+    for t in targets:
+        kw = (t.get("keyword") or "").strip()
+        if kw:
+            groups.setdefault(kw, []).append(t)
+    return groups
+
+
+async def measure_keywords(
+    targets: List[Dict],
+    checker: Optional[RankChecker] = None,
+    concurrency: int = RANK_FETCH_CONCURRENCY,
+    delay: float = RANK_FETCH_DELAY,
+    on_keyword: Optional[Callable[[str, List[Dict]], Awaitable[None]]] = None,
+) -> List[tuple]:
+    """targets 를 키워드별 SERP 한 번씩으로 측정해 rank_history 행 목록을 돌려준다.
+
+    checker 를 넘기지 않으면 여기서 만들고 끝에 닫는다.
+    on_keyword(keyword, targets) 는 키워드 하나가 끝날 때마다 불린다(진행률 갱신용).
+    """
+    groups = group_by_keyword(targets)
+    own = checker is None
+    checker = checker or RankChecker()
+    sem = asyncio.Semaphore(max(1, concurrency))
+    rows: List[tuple] = []
+
+    async def one(keyword: str, group: List[Dict]):
+        async with sem:
+            # 두 탭을 동시에 받지 않는다 — 워커 하나의 요청 속도를 예전 루프와 같게 둔다.
+            items = await checker.fetch_blog_tab_items(keyword)
+            links = await checker.fetch_view_tab_links(keyword)
+            for t in group:
+                blog_rank = checker.rank_in_blog_items(items, t["blog_id"]) if items else None
+                view_rank = checker.rank_in_view_links(links, t["post_url"]) if links else None
+                rows.append((t["keyword_id"], blog_rank, view_rank))
+                logger.debug(f"Keyword '{keyword}' [{t['blog_id']}]: blog={blog_rank}, view={view_rank}")
+            if on_keyword is not None:
+                try:
+                    await on_keyword(keyword, group)
+                except Exception as e:
+                    logger.warning(f"[rank-measure] progress callback failed: {e}")
+            if delay:
+                await asyncio.sleep(delay)
+
+    try:
+        await asyncio.gather(*(one(kw, group) for kw, group in groups.items()))
+    finally:
+        if own:
+            await checker.close()
+
+    logger.info(f"[rank-measure] {len(targets)} targets / {len(groups)} keywords → "
+                f"{checker.fetches} SERP fetches")
+    return rows
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+대량 리포트 열 기반 집계 — AD_DETAIL / EXPKEYWORD 행을 NumPy 배열로 접는다.
+
+예전 집계는 행마다 RS.metrics 로 dict 를 만들고 숫자 다섯 개를 파싱한 뒤
+defaultdict(lambda: defaultdict(float)) 네 벌에 나눠 더했다. 큰 계정 하루치가
+행당 수십 번의 dict 연산이다.
+
+ColumnarRollup:
+  - 묶는 방법(Grouping)을 처음에 선언한다 — 예) 키워드별("-" 제외), 그룹별, 전체 합.
+  - add(row) 는 행을 버퍼에 넣기만 한다. CHUNK_ROWS 가 차면 한 번에
+      날짜 열 → 검증·필터 (RS.row_date 와 같은 규칙, days 밖이면 버린다)
+      키 열   → 정수 코드 (처음 본 순서대로 번호를 매긴다 — 예전 dict 삽입 순서와 같다.
+                고유값만 파이썬에서 보고 행별 조회는 map/np.fromiter 로 돈다)
+      값 열   → float64 배열 (파싱 실패 값은 RS._f 처럼 0.0)
+    으로 바꾸고, Grouping 마다 그룹 번호를 매겨 누적 합계에 np.add.at 으로 더한다.
+    청크가 끝나면 원본 행은 버린다 — 메모리는 버퍼 한 청크 + 그룹 수에만 비례한다
+    (스트리밍 수신 services/ad_report_collector._stream_report 와 같이 쓴다).
+  - np.add.at 은 버퍼링 없이 인덱스 순서대로 더하므로, 그룹별 합이 예전 파이썬
+    누적(행 순서대로 +=)과 비트 단위로 같다. np.sum·청크별 부분합은 덧셈 순서가
+    바뀌어 소수 비용의 마지막 자리가 달라질 수 있어 쓰지 않는다.
+  - 여러 날의 리포트를 한 rollup 에 흘려 넣으면 날짜별로 나뉘어 나온다(백필).
+
+    r = ColumnarRollup(RS.AD_DETAIL, {
+            "KEYWORD": Grouping(("keyword_id",), exclude={"keyword_id": "-"},
+                                parents=("adgroup_id",)),
+            "TOTAL": Grouping((), dated=False)},
+        values=("impressions", "clicks", "cost", "conversions", "rank_sum"),
+        days={"2026-08-18"}, truncate=("impressions", "clicks"))
+    for row in rows: r.add(row)
+    g = r.result("KEYWORD")
+    g.keys[i] == ("2026-08-18", "nkw-…"), g.sums["cost"][i], g.parents["adgroup_id"][i]
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from services import naver_report_schema as RS
+
+# 버퍼를 열 배열로 바꾸는 단위(행). 행 리스트 한 청크가 수 MB 안에 들게 잡는다.
+CHUNK_ROWS = 8192
+
+_DATE = "date"
+
+
+@dataclass
+class Grouping:
+    """묶는 방법 하나. by 열(과 dated 면 날짜) 조합별로 합계를 낸다."""
+    by: Tuple[str, ...]
+    only: Optional[Dict[str, str]] = None       # {열: 값} 인 행만
+    exclude: Optional[Dict[str, str]] = None    # {열: 값} 인 행은 빼고
+    parents: Tuple[str, ...] = ()               # 그룹마다 마지막으로 본 값을 남길 열
+    dated: bool = True                          # False 면 날짜 구분 없이 합친다
+
+
+@dataclass
+class RollupGroups:
+    """result() 결과. 모든 배열·리스트는 그룹이 처음 나타난 순서다."""
+    keys: List[Tuple[str, ...]]          # ([날짜 YYYY-MM-DD,] by 값…)
+    sums: Dict[str, np.ndarray]          # 값 이름 → (G,) float64 합계
+    parents: Dict[str, List[str]]        # 열 이름 → 그룹마다 마지막으로 본 값
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+@dataclass
+class _GroupState:
+    spec: Grouping
+    cols: Tuple[str, ...]
+    index: Dict[tuple, int] = field(default_factory=dict)
+    keys: List[tuple] = field(default_factory=list)
+    sums: Dict[str, np.ndarray] = field(default_factory=dict)
+    parents: Dict[str, np.ndarray] = field(default_factory=dict)
+
+
+def _to_float(col: List[str]) -> np.ndarray:
+    """문자열 열 → float64. 한 값이라도 못 읽으면 그 청크만 RS._f 로 한 값씩."""
+    try:
+        return np.fromiter(map(float, col), dtype=np.float64, count=len(col))
+    except (TypeError, ValueError):
+        return np.fromiter(map(RS._f, col), dtype=np.float64, count=len(col))
+
+
+def _grow(arr: np.ndarray, n: int) -> np.ndarray:
+    if len(arr) >= n:
+        return arr
+    out = np.zeros(max(n, len(arr) * 2, 64), dtype=arr.dtype)
+    out[:len(arr)] = arr
+    return out
+
+
+class ColumnarRollup:
+    """리포트 행 → Grouping 별 누적 합계. 위 모듈 설명 참고."""
+
+    def __init__(self, spec: Dict[str, int], groupings: Dict[str, Grouping],
+                 values: Sequence[str], days: Optional[Iterable[str]] = None,
+                 truncate: Sequence[str] = (), strip: Sequence[str] = (),
+                 chunk_rows: int = CHUNK_ROWS):
+        self.spec = spec
+        self.value_names = tuple(values)
+        self.days = set(days) if days is not None else None
+        self.truncate = set(truncate)   # int(_f(v)) 처럼 행 단위로 소수점을 버릴 값
+        self.strip = set(strip)         # 앞뒤 공백을 지우고 묶을 키
+        self.chunk_rows = max(1, int(chunk_rows))
+
+        key_names: List[str] = []
+        self._groups: Dict[str, _GroupState] = {}
+        for name, g in groupings.items():
+            cols = ((_DATE,) if g.dated else ()) + tuple(g.by)
+            for c in (*g.by, *(g.only or {}), *(g.exclude or {}), *g.parents):
+                if c not in key_names:
+                    key_names.append(c)
+            st = _GroupState(spec=g, cols=cols)
+            st.sums = {v: np.zeros(0, dtype=np.float64) for v in self.value_names}
+            st.parents = {p: np.zeros(0, dtype=np.int32) for p in g.parents}
+            self._groups[name] = st
+        self.key_names = tuple(key_names)
+        self._labels: Dict[str, List[str]] = {k: [] for k in (_DATE, *self.key_names)}
+        self._tables: Dict[str, Dict[str, int]] = {k: {} for k in self._labels}
+        self._buf: List[List[str]] = []
+        self.rows = 0        # 날짜 필터를 통과해 집계에 들어간 행
+        self.filtered = 0    # 날짜가 없거나 days 밖이라 버린 행
+
+    # ── 적재 ─────────────────────────────────────────────────────────────────
+
+    def add(self, row: List[str]) -> None:
+        self._buf.append(row)
+        if len(self._buf) >= self.chunk_rows:
+            self._flush()
+
+    def extend(self, rows: Iterable[List[str]]) -> None:
+        for row in rows:
+            self.add(row)
+
+    def _factorize(self, name: str, col: List[str]) -> np.ndarray:
+        """값 목록 → 영속 코드(처음 본 순서). 새 값만 파이썬에서 번호를 매기고
+        행별 조회는 map(dict.__getitem__) 으로 C 루프에서 끝낸다."""
+        table, labels = self._tables[name], self._labels[name]
+        for key in dict.fromkeys(col):      # 청크 안 고유값을 처음 나온 순서로
+            if key not in table:
+                table[key] = len(labels)
+                labels.append(key)
+        return np.fromiter(map(table.__getitem__, col), dtype=np.int32, count=len(col))
+
+    def _flush(self) -> None:
+        buf, self._buf = self._buf, []
+        if not buf:
+            return
+        spec = self.spec
+        raw = [r[spec[_DATE]] for r in buf]
+        day_of = {}
+        for v in dict.fromkeys(raw):
+            d = RS.row_date([v], {_DATE: 0})
+            day_of[v] = d if d is not None and (self.days is None or d in self.days) else None
+        if any(d is None for d in day_of.values()):
+            kept = [i for i, v in enumerate(raw) if day_of[v] is not None]
+            self.filtered += len(buf) - len(kept)
+            if not kept:
+                return
+            buf = [buf[i] for i in kept]
+            raw = [raw[i] for i in kept]
+        self.rows += len(buf)
+
+        codes = {_DATE: self._factorize(_DATE, [day_of[v] for v in raw])}
+        for name in self.key_names:
+            i = spec[name]
+            col = [r[i].strip() for r in buf] if name in self.strip else [r[i] for r in buf]
+            codes[name] = self._factorize(name, col)
+        values = {}
+        for name in self.value_names:
+            i = spec[name]
+            arr = _to_float([r[i] for r in buf])
+            values[name] = np.trunc(arr) if name in self.truncate else arr
+
+        for st in self._groups.values():
+            self._fold(st, codes, values, len(buf))
+
+    def _mask(self, g: Grouping, codes: Dict[str, np.ndarray], n: int) -> Optional[np.ndarray]:
+        mask = None
+        for name, value in (g.only or {}).items():
+            code = self._tables[name].get(value)
+            m = (codes[name] == code) if code is not None else np.zeros(n, dtype=bool)
+            mask = m if mask is None else mask & m
+        for name, value in (g.exclude or {}).items():
+            code = self._tables[name].get(value)
+            if code is not None:
+                m = codes[name] != code
+                mask = m if mask is None else mask & m
+        return mask
+
+    def _fold(self, st: _GroupState, codes: Dict[str, np.ndarray],
+              values: Dict[str, np.ndarray], n: int) -> None:
+        mask = self._mask(st.spec, codes, n)
+        sel = np.flatnonzero(mask) if mask is not None else None
+        pick = (lambda a: a[sel]) if sel is not None else (lambda a: a)
+        m = len(sel) if sel is not None else n
+        if not m:
+            return
+
+        if st.cols:
+            keys = list(zip(*(pick(codes[c]).tolist() for c in st.cols)))
+        else:
+            keys = [()] * m
+        index = st.index
+        for k in dict.fromkeys(keys):
+            if k not in index:
+                index[k] = len(st.keys)
+                st.keys.append(k)
+        gid = np.fromiter(map(index.__getitem__, keys), dtype=np.int64, count=m)
+
+        size = len(st.keys)
+        for v in self.value_names:
+            st.sums[v] = acc = _grow(st.sums[v], size)
+            np.add.at(acc, gid, pick(values[v]))
+        if st.parents:
+            # 같은 그룹이 청크 안에 여러 번 나오면 마지막 행의 값을 남긴다.
+            _, rev_first = np.unique(gid[::-1], return_index=True)
+            last = m - 1 - rev_first
+            for p in st.parents:
+                st.parents[p] = arr = _grow(st.parents[p], size)
+                arr[gid[last]] = pick(codes[p])[last]
+
+    # ── 결과 ─────────────────────────────────────────────────────────────────
+
+    def result(self, name: str) -> RollupGroups:
+        """Grouping name 의 그룹별 합계(처음 나타난 순서)."""
+        self._flush()
+        st = self._groups[name]
+        size = len(st.keys)
+        labels = [self._labels[c] for c in st.cols]
+        keys = [tuple(lab[c] for lab, c in zip(labels, k)) for k in st.keys]
+        parents = {p: [self._labels[p][c] for c in arr[:size].tolist()]
+                   for p, arr in st.parents.items()}
+        return RollupGroups(keys=keys, sums={v: a[:size] for v, a in st.sums.items()},
+                            parents=parents)
+
+    def total(self, name: str) -> Dict[str, float]:
+        """날짜 구분 없는(dated=False, by=()) Grouping 의 합계. 행이 없으면 0.0."""
+        g = self.result(name)
+        return {v: float(a[0]) if len(a) else 0.0 for v, a in g.sums.items()}
+
+
+def rate_columns(sums: Dict[str, np.ndarray], rank: bool = True) -> Dict[str, np.ndarray]:
+    """합계 → ctr(%)·cpc·평균순위. 분모가 0 이면 0 (예전 조건식과 같다)."""
+    imp, clk, cost = sums["impressions"], sums["clicks"], sums["cost"]
+    out = {
+        "ctr": np.divide(clk, imp, out=np.zeros_like(imp), where=imp != 0) * 100,
+        "cpc": np.divide(cost, clk, out=np.zeros_like(cost), where=clk != 0),
+    }
+    if rank:
+        out["avg_rank"] = np.divide(sums["rank_sum"], imp, out=np.zeros_like(imp),
+                                    where=imp != 0)
+    return out
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+블로그 RSS 피드 — 모든 호출부가 쓰는 단일 창구 (파싱 결과 캐시 + 조건부 GET + 요청 합치기)
+
+https://rss.blog.naver.com/{blog_id}.xml 을 analyze_blog(routers/blogs), analyze_post 의
+작성일 폴백, competitive_analysis_v2.fetch_blog_rss_posts, serp_difficulty 의 활동성,
+blog_scraper.scrape_blog_posts_content, content_lifespan 이 제각각 받아 제각각 파싱했다.
+키워드 판정 하나가 경쟁 블로그 ~11개의 피드를 세 모듈에서 따로 읽었다.
+
+    from services import rss_feed
+    feed = await rss_feed.get_feed(blog_id)
+    feed["items"][0]  → {"title", "link", "pub_date", "published_ts", "category",
+                         "text", "raw_length", "text_length", "image_count", "word_count"}
+    feed["channel_title"]
+    rss_feed.published_at(item)   → aware datetime | None
+
+  - 파싱 결과(피드당 수 KB)를 blog_id 로 캐시한다(services/memory_cache, app·worker 공유).
+    FRESH 안이면 네트워크를 안 탄다.
+  - FRESH 가 지나면 저장해 둔 ETag / Last-Modified 로 조건부 GET. 304 면 본문 없이
+    기존 항목을 그대로 쓴다.
+  - 같은 블로그를 동시에 물으면 요청은 한 번만 나간다(나머지는 그 결과를 기다린다).
+  - 네트워크 오류·5xx 면 오래된 항목이라도 있으면 돌려준다. 404 등은 짧게 음수 캐시.
+  - 파싱(lxml, recover)은 services/parse_pool 워커에서 돈다.
+
+description 은 원문 HTML 대신 요약만 둔다: 태그를 뺀 text(DIGEST_CHARS 자 상한)와
+호출부들이 쓰던 길이·이미지 수·어절 수.
+"""
+import asyncio
+import logging
+import os
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from services.http_clients import get_client
+from services.memory_cache import get_cache
+from services.parse_pool import run_parse
+
+logger = logging.getLogger(__name__)
+
+RSS_URL = "https://rss.blog.naver.com/{blog_id}.xml"
+# 이 안에서는 재검증도 하지 않는다. 판정 하나·분석 하나 동안 같은 피드를 여러 번 본다.
+FRESH = float(os.environ.get("RSS_FEED_FRESH_SECONDS", "600"))
+# 검증자(ETag 등)를 들고 있는 기간. 지나면 처음부터 다시 받는다.
+STORE_TTL = float(os.environ.get("RSS_FEED_STORE_HOURS", "24")) * 3600
+# 없는 블로그·비공개(404 등)는 짧게.
+NEGATIVE_TTL = 600.0
+DIGEST_CHARS = 2000
+TIMEOUT = httpx.Timeout(8.0, connect=4.0)
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "application/rss+xml, application/xml, text/xml, */*",
+}
+
+_FEEDS = get_cache("rss_feed", max_entries=3000, max_bytes=48 * 1024 * 1024,
+                   ttl=STORE_TTL, shared="rss_feed")
+
+_TAG = re.compile(r'<[^>]+>')
+
+_stats = {"requests": 0, "fresh_hits": 0, "joined_inflight": 0, "fetched": 0,
+          "not_modified": 0, "negative": 0, "errors": 0, "stale_served": 0}
+
+
+# ─────────────────────────────────────────────────────────────
+# 파싱 (parse 워커에서 돈다 — 순수 함수)
+# ─────────────────────────────────────────────────────────────
+
+def _child_text(el, tag: str) -> str:
+    child = el.find(tag)
+    if child is None:
+        return ""
+    return "".join(child.itertext()).strip()
+
+
+def _pub_ts(pub_date: str) -> Optional[float]:
+    if not pub_date:
+        return None
+    try:
+        return parsedate_to_datetime(pub_date).timestamp()
+    except Exception:
+        return None
+
+
+def parse_feed(raw: bytes) -> Dict[str, Any]:
+    """RSS 본문 → {"channel_title", "items": [...]}. 깨진 XML 도 읽을 수 있는 만큼 읽는다."""
+    import lxml.etree as etree
+
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+    # 앞뒤에 HTML 이 붙어 오는 경우(브라우저로 받은 응답 등) RSS 부분만
+    start = raw.find(b"<?xml")
+    if start == -1:
+        start = raw.find(b"<rss")
+    end = raw.rfind(b"</rss>")
+    if start == -1:
+        return {"channel_title": "", "items": []}
+    raw = raw[start:end + 6] if end != -1 else raw[start:]
+
+    parser = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+    root = etree.fromstring(raw, parser)
+    if root is None:
+        return {"channel_title": "", "items": []}
+
+    channel = root.find("channel")
+    items: List[Dict[str, Any]] = []
+    for it in root.iter("item"):
+        raw_desc = _child_text(it, "description")
+        text = _TAG.sub("", raw_desc).strip()
+        pub_date = _child_text(it, "pubDate")
+        items.append({
+            "title": _child_text(it, "title"),
+            "link": _child_text(it, "link"),
+            "pub_date": pub_date,
+            "published_ts": _pub_ts(pub_date),
+            "category": _child_text(it, "category"),
+            "text": text[:DIGEST_CHARS],
+            "raw_length": len(raw_desc),
+            "text_length": len(text),
+            "image_count": raw_desc.lower().count("<img"),
+            "word_count": len([w for w in _TAG.sub(" ", raw_desc).split() if len(w) >= 2]),
+        })
+    return {
+        "channel_title": _child_text(channel, "title") if channel is not None else "",
+        "items": items,
+    }
+
+
+def published_at(item: Dict[str, Any]) -> Optional[datetime]:
+    """항목의 pubDate → aware datetime (피드에 적힌 시간대 그대로). 없거나 못 읽었으면 None."""
+    if item.get("published_ts") is None:
+        return None
+    try:
+        return parsedate_to_datetime(item["pub_date"])
+    except Exception:
+        return datetime.fromtimestamp(item["published_ts"], timezone.utc)
+
+
+# ─────────────────────────────────────────────────────────────
+# 조회
+# ─────────────────────────────────────────────────────────────
+
+class _State:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.inflight: Dict[str, asyncio.Future] = {}
+
+
+_state: Optional[_State] = None
+
+
+def _get_state() -> _State:
+    """in-flight 는 이벤트 루프에 묶인다. 루프가 바뀌면 새로."""
+    global _state
+    loop = asyncio.get_running_loop()
+    if _state is None or _state.loop is not loop:
+        _state = _State(loop)
+    return _state
+
+
+async def _fetch(st: _State, blog_id: str, client: Optional[httpx.AsyncClient]) -> Optional[Dict[str, Any]]:
+    entry = await _FEEDS.aget(blog_id)
+    headers = dict(HEADERS)
+    if entry and entry.get("status") == 200:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        resp = await (client or get_client("blog")).get(
+            RSS_URL.format(blog_id=blog_id), headers=headers, timeout=TIMEOUT)
+    except Exception as e:
+        _stats["errors"] += 1
+        if entry and entry.get("status") == 200:
+            _stats["stale_served"] += 1
+            logger.debug(f"[rss] {blog_id} fetch failed, serving stale: {e}")
+            return entry
+        logger.debug(f"[rss] {blog_id} fetch failed: {e}")
+        return None
+
+    now = time.time()
+    if resp.status_code == 304 and entry and entry.get("status") == 200:
+        _stats["not_modified"] += 1
+        entry = {**entry, "fetched_at": now}
+        await _FEEDS.aset(blog_id, entry)
+        return entry
+    if resp.status_code >= 500 and entry and entry.get("status") == 200:
+        _stats["stale_served"] += 1
+        return entry
+    if resp.status_code != 200:
+        _stats["negative"] += 1
+        entry = {"blog_id": blog_id, "status": resp.status_code, "fetched_at": now,
+                 "channel_title": "", "items": []}
+        await _FEEDS.aset(blog_id, entry, ttl=NEGATIVE_TTL)
+        return entry
+
+    _stats["fetched"] += 1
+    parsed = await run_parse(parse_feed, resp.content)
+    entry = {
+        "blog_id": blog_id,
+        "status": 200,
+        "fetched_at": now,
+        "etag": resp.headers.get("etag"),
+        "last_modified": resp.headers.get("last-modified"),
+        **parsed,
+    }
+    await _FEEDS.aset(blog_id, entry)
+    return entry
+
+
+async def _single_flight(blog_id: str, client: Optional[httpx.AsyncClient]) -> Optional[Dict[str, Any]]:
+    st = _get_state()
+    while True:
+        fut = st.inflight.get(blog_id)
+        if fut is None:
+            break
+        _stats["joined_inflight"] += 1
+        try:
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            # 받던 요청이 취소됐으면(클라이언트 끊김 등) 대기자가 이어받는다.
+            if fut.cancelled():
+                continue
+            raise
+
+    fut = st.inflight[blog_id] = st.loop.create_future()
+    fut.add_done_callback(lambda f: f.cancelled() or f.exception())
+    try:
+        entry = await _fetch(st, blog_id, client)
+    except asyncio.CancelledError:
+        fut.cancel()
+        raise
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    else:
+        fut.set_result(entry)
+        return entry
+    finally:
+        if st.inflight.get(blog_id) is fut:
+            del st.inflight[blog_id]
+
+
+async def get_feed(blog_id: str, client: Optional[httpx.AsyncClient] = None,
+                   max_age: float = FRESH) -> Optional[Dict[str, Any]]:
+    """블로그 피드. 받지 못했거나 200 이 아니면 None.
+
+    client 를 주면 그 클라이언트로 받는다. 없으면 services/http_clients 의 "blog" 풀.
+    max_age=0 은 캐시가 있어도 조건부 GET 으로 재검증한다.
+    """
+    if not blog_id:
+        return None
+    _stats["requests"] += 1
+    entry = await _FEEDS.aget(blog_id)
+    if entry is not None and time.time() - entry.get("fetched_at", 0) < max_age:
+        _stats["fresh_hits"] += 1
+    else:
+        entry = await _single_flight(blog_id, client)
+    if not entry or entry.get("status") != 200:
+        return None
+    return entry
+
+
+def feed_stats() -> Dict[str, Any]:
+    st = _state
+    return {**_stats, "inflight": len(st.inflight) if st else 0}
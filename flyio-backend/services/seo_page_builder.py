@@ -145,6 +145,7 @@ async def enrich_volumes(limit: int = 200) -> Dict[str, Any]:
     없는 것은 0 으로 기록해야 한다 — 안 그러면 volume_checked_at 이 NULL 로 남아
     매번 같은 키워드를 다시 조회하고 큐가 영원히 줄지 않는다.
     """
+    from services import keyword_volume
     from services.naver_ad_service import NaverAdApiClient
 
     seo_db.init_seo_pages_db()
@@ -168,14 +169,16 @@ async def enrich_volumes(limit: int = 200) -> Dict[str, Any]:
     errors: List[str] = []
 
     # hintKeywords 는 5개까지. 네이버는 공백을 제거한 형태(relKeyword)로 돌려주므로
-    # 매칭도 공백 제거 기준으로 한다.
+    # 매칭도 공백 제거 기준으로 한다. 콜 간격·영속 캐시 저장은 keyword_volume 이 한다.
     for i in range(0, len(todo), 5):
         chunk = todo[i : i + 5]
         try:
-            vol_map = await client.get_keywords_volume_batch(chunk)
+            vol_map = await keyword_volume.related(chunk, client=client, raise_errors=True)
         except Exception as e:
+            # 실패한 배치를 0 으로 기록하면 수요 있는 키워드가 skipped 로 빠진다.
+            # volume_checked_at 이 NULL 로 남아 다음 회차에 다시 묻는다.
             errors.append(f"{chunk[:2]}...: {str(e)[:100]}")
-            vol_map = {}
+            continue
 
         norm = {k.replace(" ", ""): v.get("monthly_total", 0) for k, v in (vol_map or {}).items()}
         batch_result = {kw: int(norm.get(kw.replace(" ", ""), 0)) for kw in chunk}
@@ -198,9 +201,7 @@ async def enrich_volumes(limit: int = 200) -> Dict[str, Any]:
         if harvest:
             discovered += seo_db.enqueue_with_volume(harvest, source="keywordstool", depth=1)
 
-        # 네이버 rate limit 여유 + 이벤트루프 양보
-        await asyncio.sleep(0.35)
-
+    await client.close()
     return {
         "checked": checked,
         "kept": kept,
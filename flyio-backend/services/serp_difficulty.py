@@ -26,17 +26,16 @@ import asyncio
 import logging
 import statistics
 from datetime import datetime, timezone
-from email.utils import parsedate_to_datetime
 from typing import Dict, List, Optional
 
 import httpx
-from bs4 import BeautifulSoup
+
+from services import rss_feed
 
 logger = logging.getLogger(__name__)
 
 TOP_N = 10                 # 상위 몇 개 블로그를 볼지
 RSS_CONCURRENCY = 6
-_RSS_TIMEOUT = 6.0
 
 
 def _vitality_from_gap(days_idle: Optional[int]) -> float:
@@ -58,27 +57,18 @@ def _vitality_from_gap(days_idle: Optional[int]) -> float:
     return 0.15
 
 
-async def _measure_blog_vitality(client: httpx.AsyncClient, blog_id: str) -> Dict:
-    """경쟁 블로그 하나의 활동성을 RSS로 가볍게 측정."""
+async def _measure_blog_vitality(client: Optional[httpx.AsyncClient], blog_id: str) -> Dict:
+    """경쟁 블로그 하나의 활동성을 RSS로 가볍게 측정 (services/rss_feed 캐시 경유).
+
+    client 가 None 이면 rss_feed 의 공용 클라이언트로 받는다.
+    """
     out = {"blog_id": blog_id, "days_idle": None, "posts_90d": None, "vitality": 0.6}
     try:
-        resp = await client.get(
-            f"https://rss.blog.naver.com/{blog_id}.xml",
-            headers={"User-Agent": "Mozilla/5.0"},
-            timeout=_RSS_TIMEOUT,
-        )
-        if resp.status_code != 200 or "<item>" not in resp.text:
+        feed = await rss_feed.get_feed(blog_id, client)
+        if not feed or not feed["items"]:
             return out
-        soup = BeautifulSoup(resp.text, "xml")
         now = datetime.now(timezone.utc)
-        dates = []
-        for it in soup.find_all("item"):
-            p = it.find("pubDate")
-            if p:
-                try:
-                    dates.append(parsedate_to_datetime(p.get_text()))
-                except Exception:
-                    pass
+        dates = [d for d in map(rss_feed.published_at, feed["items"]) if d is not None]
         if not dates:
             return out
         dates.sort(reverse=True)
@@ -149,13 +139,13 @@ async def measure_serp_difficulty(keyword: str, top_n: int = TOP_N) -> Dict:
         return {**base, "error": "no_blog_results"}
 
     sem = asyncio.Semaphore(RSS_CONCURRENCY)
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        async def _one(b):
-            async with sem:
-                v = await _measure_blog_vitality(client, b["blog_id"])
-                v["rank"] = b["rank"]
-                return v
-        measured = await asyncio.gather(*[_one(b) for b in blogs])
+
+    async def _one(b):
+        async with sem:
+            v = await _measure_blog_vitality(None, b["blog_id"])
+            v["rank"] = b["rank"]
+            return v
+    measured = await asyncio.gather(*[_one(b) for b in blogs])
 
     n = len(measured)
     vitalities = [m["vitality"] for m in measured]
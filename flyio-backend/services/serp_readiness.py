@@ -0,0 +1,211 @@
+"""
+SERP 페이지 준비 판정 — 고정 sleep / 30단 스크롤 대신 DOM 신호로 기다린다
+
+예전 blog_scraper 의 VIEW/BLOG 탭 스크래핑은 페이지가 얼마나 빨리 떴든
+`networkidle` + sleep(2) + 30×(scroll + sleep 0.3) + sleep(2) (+ 더보기 후 10×0.3s)
+를 무조건 기다렸다. 키워드당 최소 ~13초가 순수 대기였고, 백테스트·승자 키워드
+사전계산처럼 수천 키워드를 도는 작업에서는 이게 벽시계 시간의 대부분이었다.
+
+여기서는:
+  1. 첫 결과 링크가 DOM 에 나타날 때까지만 기다린다(MutationObserver).
+  2. 바닥까지 스크롤 → 결과 수가 **늘어나는 순간** 다음 라운드로 넘어간다.
+     DOM 이 quiet_ms 동안 조용하면 '더 안 늘어남'으로 보고 멈춘다.
+  3. 요청한 limit 개(+여유)를 이미 모았으면 스크롤 자체를 안 한다.
+  4. 멈췄는데 limit 미달이면 '더보기' 버튼을 한 번 눌러 보고 같은 규칙으로 계속.
+
+결과 수 = #main_pack 안의 고유 블로그 포스트 링크(blog.naver.com/{id}/{no}) 수.
+두 탭의 추출 JS 가 세는 대상과 같다.
+
+키워드별 대기/추출 시간은 ReadinessStats 로 남기고 최근 것을 recent_stats() 로 본다
+(/api/admin/serp-readiness — 탭별 평균은 summary()).
+"""
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MORE_BUTTON_SELECTOR = 'a.btn_more, button.btn_more, .api_more_wrap a'
+FIRST_RESULT_TIMEOUT_MS = 10000
+QUIET_MS = 1200          # 이 시간 동안 DOM 변화가 없으면 더 안 늘어난다고 본다
+ROUND_TIMEOUT_MS = 4000  # 한 스크롤 라운드 상한(지속적으로 광고가 바뀌는 페이지 대비)
+# 링크 수는 추출 JS 가 고르는 아이템 수보다 약간 많을 수 있다(한 아이템 안의 관련글 링크).
+# limit 에 이만큼 여유를 두고 멈춰 추출 결과가 limit 에 못 미치는 일을 막는다.
+LIMIT_MARGIN = 5
+
+_COUNT_JS = r'''
+() => {
+    const root = document.querySelector('#main_pack') || document.body;
+    if (!root) return 0;
+    const seen = new Set();
+    for (const a of root.querySelectorAll('a[href*="blog.naver.com"]')) {
+        const m = (a.href || '').match(/blog\.naver\.com\/([\w-]+)\/(\d+)/);
+        if (m) seen.add(m[1] + '/' + m[2]);
+    }
+    return seen.size;
+}
+'''
+
+# 결과 수가 prev 보다 커지거나, DOM 이 quietMs 동안 조용하거나, maxMs 가 지나면 끝난다.
+# 반환값은 그 시점의 결과 수. 폴링 대신 MutationObserver 로 변화 시점에 바로 깬다.
+_WAIT_GROWTH_JS = '''
+([prev, quietMs, maxMs]) => new Promise(resolve => {
+    const count = %s;
+    const first = count();
+    if (first > prev) { resolve(first); return; }
+    let done = false, quiet = null, hard = null, obs = null;
+    const finish = () => {
+        if (done) return;
+        done = true;
+        if (obs) obs.disconnect();
+        clearTimeout(quiet);
+        clearTimeout(hard);
+        resolve(count());
+    };
+    obs = new MutationObserver(() => {
+        if (count() > prev) { finish(); return; }
+        clearTimeout(quiet);
+        quiet = setTimeout(finish, quietMs);
+    });
+    obs.observe(document.documentElement, {childList: true, subtree: true});
+    quiet = setTimeout(finish, quietMs);
+    hard = setTimeout(finish, maxMs);
+})
+''' % _COUNT_JS.strip()
+
+
+@dataclass
+class ReadinessStats:
+    """키워드 1회 스크래핑의 대기/추출 시간 분해."""
+    keyword: str
+    tab: str
+    limit: int
+    navigate_s: float = 0.0
+    first_result_s: float = 0.0
+    scroll_wait_s: float = 0.0
+    extract_s: float = 0.0
+    rounds: int = 0
+    more_clicked: bool = False
+    result_count: int = 0
+    stop_reason: str = ""
+    started: float = field(default_factory=time.time)
+
+    @property
+    def wait_s(self) -> float:
+        return self.first_result_s + self.scroll_wait_s
+
+    def as_dict(self) -> Dict:
+        d = asdict(self)
+        d["wait_s"] = round(self.wait_s, 3)
+        for k in ("navigate_s", "first_result_s", "scroll_wait_s", "extract_s"):
+            d[k] = round(d[k], 3)
+        return d
+
+
+_RECENT: Deque[ReadinessStats] = deque(maxlen=500)
+
+
+async def result_count(page) -> int:
+    try:
+        return int(await page.evaluate(_COUNT_JS) or 0)
+    except Exception:
+        return 0
+
+
+async def _wait_growth(page, prev: int, quiet_ms: int, max_ms: int) -> int:
+    try:
+        return int(await page.evaluate(_WAIT_GROWTH_JS, [prev, quiet_ms, max_ms]) or 0)
+    except Exception as e:
+        logger.debug(f"[SERP] growth wait failed: {e}")
+        return await result_count(page)
+
+
+async def _click_more(page) -> bool:
+    try:
+        button = await page.query_selector(MORE_BUTTON_SELECTOR)
+        if button:
+            await button.click()
+            return True
+    except Exception:
+        pass
+    return False
+
+
+async def load_results(page, url: str, stats: ReadinessStats,
+                       max_rounds: int = 30, allow_more: bool = True,
+                       quiet_ms: int = QUIET_MS,
+                       round_timeout_ms: int = ROUND_TIMEOUT_MS) -> int:
+    """url 로 이동해 stats.limit 개가 모이거나 더 안 늘어날 때까지 지연로딩을 돌린다.
+
+    반환값은 마지막으로 센 결과 수. 추출은 호출자가 하고, 시간은 stats.extract_s 에 적는다.
+    """
+    t0 = time.perf_counter()
+    await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+    stats.navigate_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    count = await _wait_growth(page, 0, FIRST_RESULT_TIMEOUT_MS, FIRST_RESULT_TIMEOUT_MS)
+    stats.first_result_s = time.perf_counter() - t0
+    if count == 0:
+        logger.warning(f"[SERP] no results rendered for {stats.keyword!r} ({stats.tab})")
+        stats.stop_reason = "empty"
+        return 0
+
+    t0 = time.perf_counter()
+    more_left = allow_more
+    stats.stop_reason = "max_rounds"
+    while stats.rounds < max_rounds:
+        if count >= stats.limit + LIMIT_MARGIN:
+            stats.stop_reason = "limit"
+            break
+        stats.rounds += 1
+        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+        grown = await _wait_growth(page, count, quiet_ms, round_timeout_ms)
+        if grown > count:
+            count = grown
+            continue
+        if more_left and await _click_more(page):
+            more_left = False
+            stats.more_clicked = True
+            count = max(count, await _wait_growth(page, count, quiet_ms, round_timeout_ms))
+            continue
+        stats.stop_reason = "stalled"
+        break
+    stats.scroll_wait_s = time.perf_counter() - t0
+    stats.result_count = count
+    return count
+
+
+def record(stats: ReadinessStats) -> None:
+    _RECENT.append(stats)
+    logger.info(
+        f"[SERP] {stats.tab} {stats.keyword!r}: {stats.result_count} results, "
+        f"nav={stats.navigate_s:.1f}s wait={stats.wait_s:.1f}s extract={stats.extract_s:.2f}s "
+        f"rounds={stats.rounds} stop={stats.stop_reason}")
+
+
+def recent_stats(limit: Optional[int] = None) -> List[Dict]:
+    items = list(_RECENT)
+    if limit:
+        items = items[-limit:]
+    return [s.as_dict() for s in items]
+
+
+def summary() -> Dict:
+    """최근 기록의 평균 대기/추출 시간(탭별)."""
+    out: Dict[str, Dict] = {}
+    for s in _RECENT:
+        agg = out.setdefault(s.tab, {"n": 0, "navigate_s": 0.0, "wait_s": 0.0,
+                                     "extract_s": 0.0, "rounds": 0})
+        agg["n"] += 1
+        agg["navigate_s"] += s.navigate_s
+        agg["wait_s"] += s.wait_s
+        agg["extract_s"] += s.extract_s
+        agg["rounds"] += s.rounds
+    for agg in out.values():
+        n = agg["n"]
+        for k in ("navigate_s", "wait_s", "extract_s", "rounds"):
+            agg[f"avg_{k}"] = round(agg.pop(k) / n, 3)
+    return out
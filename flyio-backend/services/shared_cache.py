@@ -0,0 +1,273 @@
+"""
+프로세스 간 공유 캐시 백엔드 — app / worker / verdict_worker 가 같은 결과를 본다
+
+main.py 는 app 프로세스와 worker 프로세스(+ 전용 verdict_worker.py)를 따로 띄운다.
+셋은 /data 만 공유하고 메모리는 공유하지 않아서, worker 가 계산한 SERP·블로그 분석·
+색인 검증 결과를 app 이 빈 메모리 캐시로 **다시 계산**했다.
+
+MemoryCache(services/memory_cache)에 `shared="네임스페이스"` 를 주면 2단이 된다:
+  로컬 LRU 미스 → 공유 백엔드 조회 → 있으면 남은 TTL 로 로컬에 싣고 반환.
+  set 은 로컬 + 공유 백엔드에 함께 쓴다(write-through).
+
+백엔드 (SHARED_CACHE_BACKEND):
+  auto   (기본) REDIS_URL 이 설정돼 있고 redis 패키지가 있으면 redis, 아니면 sqlite
+  sqlite /data/shared_cache.db (WAL — 여러 프로세스 동시 읽기 + 단일 쓰기)
+  redis  settings.REDIS_URL
+  memory 프로세스 내 dict (테스트·로컬용 대역. 프로세스 간 공유는 안 됨)
+  off    공유 안 함 (로컬 LRU 만)
+
+공유 캐시 장애는 요청을 깨뜨리지 않는다 — 오류는 세고 로그만 남기고 미스로 취급한다.
+JSON 으로 직렬화되지 않는 값은 공유하지 않는다(로컬에만 남는다).
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SHARED_CACHE_BACKEND = os.environ.get("SHARED_CACHE_BACKEND", "auto").lower()
+_DATA_DIR = os.environ.get("DATA_DIR", "/data")
+SHARED_CACHE_PATH = os.environ.get(
+    "SHARED_CACHE_PATH",
+    os.path.join(_DATA_DIR if os.path.isdir(_DATA_DIR)
+                 else os.path.join(os.path.dirname(__file__), "..", "data"), "shared_cache.db"))
+# 만료 행 청소 주기(쓰기 횟수 기준).
+PURGE_EVERY = 500
+REDIS_PREFIX = os.environ.get("SHARED_CACHE_REDIS_PREFIX", "blrank")
+
+
+class SharedBackend:
+    """공유 백엔드 공통 인터페이스. 값은 JSON 문자열로 오간다."""
+
+    name = "base"
+    # 호출이 막힐 수 있는가(디스크·네트워크). MemoryCache.aget/aset 이 스레드로 넘길지 정한다.
+    blocking = True
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+    def get(self, ns: str, key: str) -> Optional[Tuple[Any, float]]:
+        """(value, expires_at) 또는 None."""
+        try:
+            found = self._get(ns, key)
+        except Exception as e:
+            self.errors += 1
+            logger.debug(f"[shared-cache:{self.name}] get {ns}/{key} failed: {e}")
+            return None
+        if found is None:
+            self.misses += 1
+            return None
+        raw, expires_at = found
+        if expires_at <= time.time():
+            self.misses += 1
+            return None
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            self.errors += 1
+            return None
+        self.hits += 1
+        return value, expires_at
+
+    def set(self, ns: str, key: str, value: Any, ttl: float) -> bool:
+        try:
+            raw = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return False
+        try:
+            self._set(ns, key, raw, time.time() + ttl, ttl)
+            self.writes += 1
+            return True
+        except Exception as e:
+            self.errors += 1
+            logger.debug(f"[shared-cache:{self.name}] set {ns}/{key} failed: {e}")
+            return False
+
+    def delete(self, ns: str, key: str) -> None:
+        try:
+            self._delete(ns, key)
+        except Exception as e:
+            self.errors += 1
+            logger.debug(f"[shared-cache:{self.name}] delete {ns}/{key} failed: {e}")
+
+    def stats(self) -> Dict:
+        return {"backend": self.name, "hits": self.hits, "misses": self.misses,
+                "writes": self.writes, "errors": self.errors}
+
+    # 구현체가 채운다
+    def _get(self, ns: str, key: str) -> Optional[Tuple[str, float]]:
+        raise NotImplementedError
+
+    def _set(self, ns: str, key: str, raw: str, expires_at: float, ttl: float) -> None:
+        raise NotImplementedError
+
+    def _delete(self, ns: str, key: str) -> None:
+        raise NotImplementedError
+
+
+class InMemoryBackend(SharedBackend):
+    """테스트·로컬 대역. 같은 인스턴스를 쥔 캐시끼리만 공유된다."""
+
+    name = "memory"
+    blocking = False
+
+    def __init__(self):
+        super().__init__()
+        self._data: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, ns, key):
+        with self._lock:
+            return self._data.get((ns, key))
+
+    def _set(self, ns, key, raw, expires_at, ttl):
+        with self._lock:
+            self._data[(ns, key)] = (raw, expires_at)
+
+    def _delete(self, ns, key):
+        with self._lock:
+            self._data.pop((ns, key), None)
+
+
+class SQLiteBackend(SharedBackend):
+    """/data 의 SQLite(WAL) 파일. 스레드별 연결을 열어 두고 재사용한다."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str = SHARED_CACHE_PATH):
+        super().__init__()
+        self.path = path
+        self._local = threading.local()
+        self._writes_since_purge = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS shared_cache (
+                ns TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (ns, key)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_shared_cache_exp ON shared_cache(expires_at)")
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=2.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=2000")
+            self._local.conn = conn
+        return conn
+
+    def _get(self, ns, key):
+        row = self._conn().execute(
+            "SELECT value, expires_at FROM shared_cache WHERE ns = ? AND key = ?",
+            (ns, key)).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def _set(self, ns, key, raw, expires_at, ttl):
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO shared_cache (ns, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (ns, key, raw, expires_at))
+        self._writes_since_purge += 1
+        if self._writes_since_purge >= PURGE_EVERY:
+            self._writes_since_purge = 0
+            conn.execute("DELETE FROM shared_cache WHERE expires_at < ?", (time.time(),))
+        conn.commit()
+
+    def _delete(self, ns, key):
+        conn = self._conn()
+        conn.execute("DELETE FROM shared_cache WHERE ns = ? AND key = ?", (ns, key))
+        conn.commit()
+
+
+class RedisBackend(SharedBackend):
+    """settings.REDIS_URL. 만료는 redis TTL 에 맡기고 남은 시간은 PTTL 로 읽는다."""
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        super().__init__()
+        import redis  # 선택 의존성 — 없으면 호출부가 sqlite 로 내려간다
+        self._client = redis.Redis.from_url(url, socket_timeout=0.5,
+                                            socket_connect_timeout=0.5)
+
+    def _k(self, ns, key):
+        return f"{REDIS_PREFIX}:{ns}:{key}"
+
+    def _get(self, ns, key):
+        pipe = self._client.pipeline()
+        pipe.get(self._k(ns, key))
+        pipe.pttl(self._k(ns, key))
+        raw, pttl = pipe.execute()
+        if raw is None:
+            return None
+        remaining = pttl / 1000.0 if pttl and pttl > 0 else 0.0
+        return raw.decode("utf-8") if isinstance(raw, bytes) else raw, time.time() + remaining
+
+    def _set(self, ns, key, raw, expires_at, ttl):
+        self._client.set(self._k(ns, key), raw, px=max(1, int(ttl * 1000)))
+
+    def _delete(self, ns, key):
+        self._client.delete(self._k(ns, key))
+
+
+_BACKEND: Optional[SharedBackend] = None
+_BACKEND_READY = False
+_BACKEND_LOCK = threading.Lock()
+
+
+def _create_backend(kind: str) -> Optional[SharedBackend]:
+    if kind == "off":
+        return None
+    if kind == "memory":
+        return InMemoryBackend()
+    if kind in ("auto", "redis"):
+        try:
+            from config import settings
+            url = settings.REDIS_URL
+        except Exception:
+            url = None
+        if url:
+            try:
+                return RedisBackend(url)
+            except Exception as e:
+                logger.warning(f"[shared-cache] redis 사용 불가({e}) — sqlite 로 대체")
+        elif kind == "redis":
+            logger.warning("[shared-cache] SHARED_CACHE_BACKEND=redis 인데 REDIS_URL 미설정 — sqlite 로 대체")
+    try:
+        return SQLiteBackend()
+    except Exception as e:
+        logger.warning(f"[shared-cache] sqlite 백엔드 초기화 실패({e}) — 공유 캐시 끔")
+        return None
+
+
+def get_backend() -> Optional[SharedBackend]:
+    """프로세스 공통 백엔드(지연 생성). None 이면 공유하지 않는다."""
+    global _BACKEND, _BACKEND_READY
+    if not _BACKEND_READY:
+        with _BACKEND_LOCK:
+            if not _BACKEND_READY:
+                _BACKEND = _create_backend(SHARED_CACHE_BACKEND)
+                _BACKEND_READY = True
+    return _BACKEND
+
+
+def set_backend(backend: Optional[SharedBackend]) -> None:
+    """백엔드 교체(테스트에서 InMemoryBackend 를 끼울 때)."""
+    global _BACKEND, _BACKEND_READY
+    with _BACKEND_LOCK:
+        _BACKEND = backend
+        _BACKEND_READY = True
@@ -1,7 +1,7 @@
 """
 키워드 검색량 필터링 서비스
 - 네이버 검색광고 /keywordstool API로 월 검색량 조회
-- hintKeywords 최대 5개 배치, rate limit 준수
+- hintKeywords 최대 5개 배치, rate limit 준수 (services/keyword_volume 경유 — 영속 캐시 공유)
 - 임계치(기본 10) 이상 키워드만 수집
 - 캐너리 테스트: 첫 N개 결과로 통과율 판단 후 자동 계속 or 중단
 - 취소/일시정지/재개 지원
@@ -18,13 +18,15 @@ from database.naver_ad_db import (
     get_volume_filter_job,
     update_volume_filter_job,
 )
+from services import keyword_volume
 from services.naver_ad_service import NaverAdApiClient
+from services.naver_rate_governor import background_job
 
 logger = logging.getLogger(__name__)
 
 # 네이버 /keywordstool: hintKeywords 최대 5개
 HINT_BATCH_SIZE = 5
-# Rate limit: 초당 2~3건 → 0.4초 간격 (안전)
+# 남은 시간 추정용 배치당 시간. 실제 속도는 naver_rate_governor 의 keywordstool 버킷.
 API_DELAY = 0.4
 # DB 저장 배치
 DB_FLUSH_BATCH = 200
@@ -73,6 +75,11 @@ class VolumeFilterService:
         """키워드 리스트를 배치로 검색량 조회 → 임계치 이상만 수집.
         start_index > 0이면 해당 인덱스부터 재개.
         """
+        with background_job():
+            return await self._run(config, keywords, start_index)
+
+    async def _run(self, config: VolumeFilterConfig, keywords: List[str],
+                   start_index: int) -> dict:
         job_id = config.job_id
         total = len(keywords)
         logger.info(
@@ -165,8 +172,10 @@ class VolumeFilterService:
                     batch_idx * HINT_BATCH_SIZE : (batch_idx + 1) * HINT_BATCH_SIZE
                 ]
 
+                # 캐시에 있는 키워드는 API 를 안 부른다(공백·대소문자 무관 매칭도 거기서).
                 try:
-                    volumes = await self.api.get_keywords_volume_batch(batch)
+                    volumes = await keyword_volume.lookup(batch, client=self.api,
+                                                          raise_errors=True)
                 except Exception as e:
                     logger.warning(f"[Filter {job_id}] batch API 실패: {e}")
                     volumes = {}
@@ -174,12 +183,6 @@ class VolumeFilterService:
 
                 for kw in batch:
                     hit = volumes.get(kw)
-                    if not hit:
-                        norm = kw.replace(" ", "").lower()
-                        for rel_kw, data in volumes.items():
-                            if rel_kw.replace(" ", "").lower() == norm:
-                                hit = data
-                                break
                     if hit and hit["monthly_total"] >= config.min_volume:
                         pending_results.append({
                             "keyword": kw,
@@ -266,7 +269,8 @@ class VolumeFilterService:
                         ),
                     )
 
-                await asyncio.sleep(API_DELAY)
+                # 콜 간격은 _request 의 keywordstool 버킷이 지킨다 — 캐시 적중 배치는 쉬지 않는다.
+                await asyncio.sleep(0)
 
             # 마지막 flush
             if pending_results:
@@ -9,7 +9,7 @@ import asyncio
 import os
 import sys
 import tempfile
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 # 테스트용 임시 DB 경로
 os.environ["DATA_DIR"] = tempfile.mkdtemp()
@@ -72,8 +72,7 @@ async def test_small_scale_500():
     )
     cfg = BulkJobConfig(job_id=job_id, user_id=1, campaign_prefix="test", bid=100)
 
-    with patch("services.bulk_upload_orchestrator.API_RATE_LIMIT_DELAY", 0):
-        result = await orch.run(cfg, keywords)
+    result = await orch.run(cfg, keywords)
 
     assert result["success"]
     assert result["campaigns"] == 1, f"expected 1 campaign, got {result['campaigns']}"
@@ -99,8 +98,7 @@ async def test_medium_scale_2500():
     )
     cfg = BulkJobConfig(job_id=job_id, user_id=1, campaign_prefix="test2", bid=100)
 
-    with patch("services.bulk_upload_orchestrator.API_RATE_LIMIT_DELAY", 0):
-        result = await orch.run(cfg, keywords)
+    result = await orch.run(cfg, keywords)
 
     assert result["campaigns"] == 1
     assert result["ad_groups"] == 5
@@ -124,8 +122,7 @@ async def test_large_scale_100k():
     )
     cfg = BulkJobConfig(job_id=job_id, user_id=1, campaign_prefix="mass", bid=100)
 
-    with patch("services.bulk_upload_orchestrator.API_RATE_LIMIT_DELAY", 0):
-        result = await orch.run(cfg, keywords)
+    result = await orch.run(cfg, keywords)
 
     assert result["campaigns"] == 1, f"expected 1 campaign, got {result['campaigns']}"
     assert result["ad_groups"] == 200, f"expected 200 ad groups, got {result['ad_groups']}"
@@ -147,8 +144,7 @@ async def test_campaign_overflow():
     )
     cfg = BulkJobConfig(job_id=job_id, user_id=1, campaign_prefix="big", bid=100)
 
-    with patch("services.bulk_upload_orchestrator.API_RATE_LIMIT_DELAY", 0):
-        result = await orch.run(cfg, keywords)
+    result = await orch.run(cfg, keywords)
 
     assert result["campaigns"] == 2, f"expected 2 campaigns, got {result['campaigns']}"
     assert result["ad_groups"] == 1200
@@ -179,8 +175,7 @@ async def test_ad_group_creation_failure():
     )
     cfg = BulkJobConfig(job_id=job_id, user_id=1, campaign_prefix="err", bid=100)
 
-    with patch("services.bulk_upload_orchestrator.API_RATE_LIMIT_DELAY", 0):
-        result = await orch.run(cfg, keywords)
+    result = await orch.run(cfg, keywords)
 
     # 2그룹 성공(1000개) + 1그룹 실패(500개)
     assert result["succeeded"] == 1000, f"expected 1000, got {result['succeeded']}"
@@ -211,8 +206,7 @@ async def test_keyword_api_partial_failure():
     )
     cfg = BulkJobConfig(job_id=job_id, user_id=1, campaign_prefix="partial", bid=100)
 
-    with patch("services.bulk_upload_orchestrator.API_RATE_LIMIT_DELAY", 0):
-        result = await orch.run(cfg, keywords)
+    result = await orch.run(cfg, keywords)
 
     assert result["succeeded"] == 80
     assert result["failed"] == 20
@@ -236,8 +230,7 @@ async def test_keyword_batch_exception():
     )
     cfg = BulkJobConfig(job_id=job_id, user_id=1, campaign_prefix="fail", bid=100)
 
-    with patch("services.bulk_upload_orchestrator.API_RATE_LIMIT_DELAY", 0):
-        result = await orch.run(cfg, keywords)
+    result = await orch.run(cfg, keywords)
 
     assert result["succeeded"] == 0
     assert result["failed"] == 250
@@ -262,8 +255,7 @@ async def test_custom_per_group():
         bid=100, keywords_per_group=100,
     )
 
-    with patch("services.bulk_upload_orchestrator.API_RATE_LIMIT_DELAY", 0):
-        result = await orch.run(cfg, keywords)
+    result = await orch.run(cfg, keywords)
 
     assert result["ad_groups"] == 10
     assert result["succeeded"] == 1000
@@ -290,8 +282,7 @@ async def test_bid_applied_to_all():
     )
     cfg = BulkJobConfig(job_id=job_id, user_id=1, campaign_prefix="bid", bid=777)
 
-    with patch("services.bulk_upload_orchestrator.API_RATE_LIMIT_DELAY", 0):
-        await orch.run(cfg, keywords)
+    await orch.run(cfg, keywords)
 
     # 모든 페이로드 bidAmt 검증
     all_items = [item for batch in captured_payloads for item in batch]
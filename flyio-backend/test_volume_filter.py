@@ -16,6 +16,7 @@ from database.naver_ad_db import (
     get_volume_filter_results,
     count_volume_filter_results,
 )
+from services import keyword_volume
 from services.volume_filter import VolumeFilterService, VolumeFilterConfig
 
 init_naver_ad_tables()
@@ -230,6 +231,28 @@ async def test_empty_input():
     print(f"[PASS] 빈 입력 처리")
 
 
+async def test_cache_shared_across_jobs():
+    """두 번째 job 은 캐시(검색량 있음·없음 둘 다)로 끝나고 API 를 안 부른다"""
+    volumes = {"캐시A": 300, "캐시B": 5}
+    keywords = ["캐시A", "캐시B", "캐시없음"]
+    first = make_mock_api(volumes)
+    job1 = create_volume_filter_job(user_id=1, filename="t.xlsx", min_volume=10, total_keywords=3)
+    with patch("services.volume_filter.API_DELAY", 0):
+        r1 = await VolumeFilterService(first).run(
+            VolumeFilterConfig(job_id=job1, user_id=1, min_volume=10), keywords)
+
+    second = make_mock_api(volumes)
+    job2 = create_volume_filter_job(user_id=1, filename="t.xlsx", min_volume=10, total_keywords=3)
+    with patch("services.volume_filter.API_DELAY", 0):
+        r2 = await VolumeFilterService(second).run(
+            VolumeFilterConfig(job_id=job2, user_id=1, min_volume=10), ["캐시 a", *keywords[1:]])
+
+    assert first.get_keywords_volume_batch.call_count == 1
+    assert second.get_keywords_volume_batch.call_count == 0, "캐시 적중인데 API 호출됨"
+    assert r1["passed"] == r2["passed"] == 1, f"{r1} / {r2}"
+    print(f"[PASS] 캐시 공유 → 두 번째 job API 0콜, 통과 {r2['passed']}개 동일")
+
+
 async def main():
     tests = [
         test_basic_threshold_10,
@@ -241,10 +264,13 @@ async def main():
         test_large_scale_5000,
         test_job_status_completed,
         test_empty_input,
+        test_cache_shared_across_jobs,
     ]
     passed = 0
     failed = 0
     for t in tests:
+        # 검색량 캐시는 job 끼리 공유된다 — 테스트마다 같은 키워드를 다른 값으로 쓰므로 비운다.
+        await keyword_volume.clear_cache()
         try:
             await t()
             passed += 1
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+비동기 DB 파사드 테스트 — database/async_db.py
+
+느린 쓰기가 도는 동안 이벤트 루프가 계속 도는지, 같은 파일 쓰기가 한 줄로
+직렬화되는지, 이름 규칙(읽기/쓰기) 분류와 히스토그램이 맞는지 본다. 임시 파일 DB.
+
+실행: python flyio-backend/tests/test_async_db.py
+"""
+import asyncio
+import gc
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from database.async_db import adb, async_db_stats, is_write_method, run_db  # noqa: E402
+from database.connection_pool import pooled  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+class FakeDB:
+    """KeywordPoolDB 처럼 db_path 를 가진 동기 DB 객체."""
+
+    def __init__(self, path):
+        self.db_path = path
+        self.active = 0
+        self.max_active = 0
+        self.threads = set()
+        self._lock = threading.Lock()
+        with pooled(path) as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS kw (k TEXT)')
+
+    def add_candidates(self, items, hold=0.0):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.threads.add(threading.current_thread().name)
+        try:
+            with pooled(self.db_path) as conn:
+                conn.executemany('INSERT INTO kw VALUES (?)', [(k,) for k in items])
+                time.sleep(hold)          # 큰 배치 쓰기 흉내
+            return len(items)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def stats(self):
+        with pooled(self.db_path) as conn:
+            return conn.execute('SELECT COUNT(*) FROM kw').fetchone()[0]
+
+
+print('=' * 72)
+print('1. 이름 규칙')
+print('=' * 72)
+check('add_/mark_/record_ 는 쓰기', all(is_write_method(n) for n in
+                                      ('add_candidates', 'mark_status', 'record_run')))
+check('get_/list_/…stats 는 읽기', not any(is_write_method(n) for n in
+                                        ('get_escalation', 'list_user_seeds', 'reject_stats', 'stats')))
+check('규칙 밖 이름은 쓰기(직렬화)', all(is_write_method(n) for n in
+                                    ('filter_new', 'execute_query', 'recent_runs')))
+
+
+async def main():
+    path = os.path.join(tempfile.mkdtemp(), 'a.db')
+    db = FakeDB(path)
+
+    print()
+    print('=' * 72)
+    print('2. 느린 쓰기 중 루프 응답성 · 쓰기 직렬화')
+    print('=' * 72)
+    ticks = []
+
+    async def ticker():
+        end = time.perf_counter() + 0.5
+        while time.perf_counter() < end:
+            t0 = time.perf_counter()
+            await asyncio.sleep(0.01)
+            ticks.append(time.perf_counter() - t0)
+
+    writes = [adb(db).add_candidates([f'k{i}-{j}' for j in range(100)], hold=0.1) for i in range(4)]
+    res = await asyncio.gather(ticker(), *writes)
+    check('쓰기 결과', res[1:] == [100] * 4, str(res[1:]))
+    worst = max(ticks) * 1000
+    check('쓰기 0.4s 동안 루프 지연 < 50ms', worst < 50, f'최대 {worst:.1f}ms')
+    check('같은 파일 쓰기는 한 번에 하나', db.max_active == 1, f'동시 {db.max_active}')
+    check('쓰기는 전용 스레드에서', all(t.startswith('db-w-') for t in db.threads), str(db.threads))
+
+    n = await adb(db).stats()
+    check('읽기 결과', n == 400, str(n))
+    reads = await asyncio.gather(*[run_db(path, db.stats) for _ in range(8)])
+    check('동시 읽기', reads == [400] * 8)
+    forced = await adb(db).write.stats()
+    check('write 뷰로 종류 강제', forced == 400)
+
+    st = [s for s in async_db_stats() if s['path'] == os.path.abspath(path)][0]
+    call = st['calls']['FakeDB.add_candidates']
+    check('메서드별 히스토그램', call['kind'] == 'write' and call['run']['n'] == 4
+          and call['run']['p50_ms'] >= 100, str(call['run']))
+    check('큐 대기 집계(직렬화된 쓰기는 줄을 섬)', call['queue']['max_ms'] >= 200,
+          str(call['queue']))
+    check('대기 중 호출 0', st['pending_reads'] == 0 and st['pending_writes'] == 0)
+
+    from database import async_db
+    n = await adb(FakeDB(path)).stats()          # 임시 객체도 호출 동안 살아 있다
+    check('임시 객체 파사드', n == 400)
+    before = len(async_db._RESOLVED)
+    for _ in range(50):
+        adb(FakeDB(path))
+    gc.collect()
+    check('파사드 캐시가 쌓이지 않음(약한 키)', len(async_db._RESOLVED) <= before, f'{before} → {len(async_db._RESOLVED)}')
+
+
+asyncio.run(main())
+
+print()
+if failures:
+    print(f'FAILED {len(failures)}건: {failures}')
+    sys.exit(1)
+print('전부 통과 — async db')
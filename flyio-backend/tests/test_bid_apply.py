@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+입찰 일괄 적용 테스트 — services/bid_apply.py (+ BidOptimizationEngine.optimize_all_keywords)
+
+httpx.MockTransport 로 검색광고 API 를 흉내 내고 임시 디렉터리 SQLite 로 다음을 본다.
+  - 결정: 10원 단위 보정, 그룹 입찰·0원·보정 후 그대로인 키워드는 제외
+  - 적용: PUT 한 콜 ≤ 100개, 동시 in-flight ≤ APPLY_CONCURRENCY
+  - 4xx 묶음은 반으로 나눠 문제 키워드만 실패, 나머지는 적용
+  - 네트워크 장애는 나누지 않고 묶음째 실패(사유 포함)
+  - 감사 행: 적용된 수만큼, 묶음마다 한 번
+  - 성과: 리포트(ad_daily_stats)가 최신이면 /stats 0콜, 밀렸으면 /stats 폴백
+
+실행: python flyio-backend/tests/test_bid_apply.py
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_TMP = tempfile.mkdtemp(prefix='bidapply_')
+os.environ['DATA_DIR'] = _TMP
+os.environ['SHARED_CACHE_BACKEND'] = 'memory'
+os.environ['NAVER_AD_CUSTOMER_ID'] = '1001'
+os.environ['NAVER_AD_API_KEY'] = 'k'
+os.environ['NAVER_AD_SECRET_KEY'] = 's'
+for fam in ('NCC_WRITE', 'NCC_READ', 'STATS'):
+    os.environ[f'NAVER_RATE_{fam}'] = '10000,10000'
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import httpx  # noqa: E402
+
+from database import optimization_db  # noqa: E402
+optimization_db.DB_PATH = Path(_TMP) / 'optimization_history.db'
+from database.ad_snapshot_db import init_ad_snapshot_tables, save_daily_stats  # noqa: E402
+from database.naver_ad_db import init_naver_ad_tables  # noqa: E402
+from services import bid_apply  # noqa: E402
+from services.naver_ad_service import BidOptimizationEngine, NaverAdApiClient  # noqa: E402
+
+optimization_db.init_optimization_tables()
+init_naver_ad_tables()
+init_ad_snapshot_tables()
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+class FakeSearchAd:
+    """키워드 목록·/stats·bulk PUT 만 아는 가짜 서버. bad 에 든 키워드가 섞인 PUT 은 400."""
+
+    def __init__(self, keywords, stats=None):
+        self.keywords = keywords
+        self.stats = stats or {}
+        self.bad = set()
+        self.down = False
+        self.calls = {'keywords': 0, 'stats': 0, 'put': 0}
+        self.put_sizes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == 'GET' and path == '/ncc/keywords':
+            self.calls['keywords'] += 1
+            gid = request.url.params.get('nccAdgroupId')
+            return httpx.Response(200, json=[k for k in self.keywords
+                                             if gid is None or k['nccAdgroupId'] == gid])
+        if request.method == 'GET' and path == '/stats':
+            self.calls['stats'] += 1
+            kid = request.url.params.get('ids')
+            return httpx.Response(200, json={'data': [self.stats[kid]] if kid in self.stats else []})
+        if request.method == 'PUT' and path == '/ncc/keywords':
+            self.calls['put'] += 1
+            if self.down:
+                raise httpx.ConnectError('down', request=request)
+            items = json.loads(request.content)
+            self.put_sizes.append(len(items))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(0.01)
+            finally:
+                self.in_flight -= 1
+            if any(i['nccKeywordId'] in self.bad for i in items):
+                return httpx.Response(400, json={'code': 1018, 'title': 'not found'})
+            return httpx.Response(200, json=items)
+        return httpx.Response(404)
+
+
+def _keywords(n, groups=3):
+    kws = []
+    for i in range(n):
+        kws.append({'nccKeywordId': f'nkw-{i}', 'nccAdgroupId': f'grp-{i % groups}',
+                    'keyword': f'키워드{i}', 'bidAmt': 1000, 'useGroupBidAmt': False})
+    return kws
+
+
+def _stat(i):
+    # 전환 있고 ROAS 높음 → 올림 / 클릭만 많고 전환 없음 → 내림
+    if i % 2 == 0:
+        return {'id': f'nkw-{i}', 'impCnt': 1000, 'clkCnt': 50, 'salesAmt': 50000,
+                'ccnt': 5, 'convAmt': 500000, 'avgRnk': 5.0}
+    return {'id': f'nkw-{i}', 'impCnt': 1000, 'clkCnt': 40, 'salesAmt': 40000,
+            'ccnt': 0, 'convAmt': 0, 'avgRnk': 2.0}
+
+
+def _engine(fake):
+    api = NaverAdApiClient()
+    api.client = httpx.AsyncClient(transport=httpx.MockTransport(fake),
+                                   base_url=NaverAdApiClient.BASE_URL)
+    engine = BidOptimizationEngine(api)
+    engine.user_id = 7
+    return engine
+
+
+def _audit_rows():
+    conn = optimization_db.get_db_connection()
+    n = conn.execute("SELECT COUNT(*) FROM optimization_actions WHERE user_id = 7").fetchone()[0]
+    conn.close()
+    return n
+
+
+def test_decide():
+    print('=' * 72)
+    print('1. 결정')
+    print('=' * 72)
+    engine = _engine(FakeSearchAd([]))
+    kws = _keywords(4) + [
+        {'nccKeywordId': 'nkw-group', 'bidAmt': 1000, 'useGroupBidAmt': True},
+        {'nccKeywordId': 'nkw-zero', 'bidAmt': 0, 'useGroupBidAmt': False},
+        {'nccKeywordId': 'nkw-min', 'bidAmt': 70, 'useGroupBidAmt': False},
+    ]
+    stats = {f'nkw-{i}': _stat(i) for i in range(4)}
+    stats['nkw-min'] = _stat(1) | {'id': 'nkw-min'}
+    decisions, skipped = bid_apply.decide_bids(engine, kws, stats)
+    check('그룹 입찰·0원·최저가 그대로는 제외', skipped == 3 and len(decisions) == 4,
+          f'skipped={skipped} decisions={len(decisions)}')
+    check('10원 단위', all(d.new_bid % 10 == 0 for d in decisions), str([d.new_bid for d in decisions]))
+    check('오른 것·내린 것', any(d.new_bid > d.old_bid for d in decisions)
+          and any(d.new_bid < d.old_bid for d in decisions))
+    check('bulk 항목 모양', decisions[0].item() == {'nccKeywordId': 'nkw-0', 'bidAmt': decisions[0].new_bid,
+                                                'useGroupBidAmt': False, 'nccAdgroupId': 'grp-0'})
+
+
+async def test_apply_batches():
+    print('=' * 72)
+    print('2. 묶음·동시성·부분 실패')
+    print('=' * 72)
+    n = 450
+    fake = FakeSearchAd(_keywords(n), {f'nkw-{i}': _stat(i) for i in range(n)})
+    fake.bad = {'nkw-123'}
+    engine = _engine(fake)
+    before = _audit_rows()
+    changes = await engine.optimize_all_keywords(['grp-0', 'grp-1', 'grp-2'])
+    rep = engine.last_report
+    check('광고그룹별 키워드 조회', fake.calls['keywords'] == 3)
+    check('리포트 없으면 /stats 폴백', rep['stats_source'] == 'api' and fake.calls['stats'] == n,
+          f"{rep['stats_source']} stats={fake.calls['stats']}")
+    check('PUT 한 콜 ≤ 100', max(fake.put_sizes) == 100, str(sorted(set(fake.put_sizes))))
+    check('동시 in-flight ≤ APPLY_CONCURRENCY', 1 < fake.max_in_flight <= bid_apply.APPLY_CONCURRENCY,
+          str(fake.max_in_flight))
+    check('문제 키워드만 실패', [f['keyword_id'] for f in rep['failed']] == ['nkw-123'], str(rep['failed'][:2]))
+    check('실패 사유', 'HTTPStatusError' in rep['failed'][0]['error'], rep['failed'][0]['error'])
+    check('나머지는 적용', len(changes) == n - 1 and len(engine.bid_changes) == n - 1, str(len(changes)))
+    # 5 묶음 + 문제 묶음 이분(100 → 50·50 → 25·25 → ... → 1·1) 7단 × 2
+    check('이분 호출 수', rep['put_calls'] == 5 + 2 * 7, str(rep['put_calls']))
+    check('감사 행 = 적용 수', _audit_rows() - before == n - 1, str(_audit_rows() - before))
+
+
+async def test_network_failure():
+    print('=' * 72)
+    print('3. 네트워크 장애')
+    print('=' * 72)
+    fake = FakeSearchAd(_keywords(150), {f'nkw-{i}': _stat(i) for i in range(150)})
+    fake.down = True
+    engine = _engine(fake)
+    before = _audit_rows()
+    changes = await engine.optimize_all_keywords()
+    rep = engine.last_report
+    check('적용 0', changes == [])
+    check('묶음째 실패(나누지 않음)', len(rep['failed']) == rep['decisions'] and rep['put_calls'] == 2,
+          f"failed={len(rep['failed'])} calls={rep['put_calls']}")
+    check('사유에 ConnectError', all('ConnectError' in f['error'] for f in rep['failed']))
+    check('감사 행 없음', _audit_rows() == before)
+
+
+async def test_report_stats():
+    print('=' * 72)
+    print('4. 성과 출처')
+    print('=' * 72)
+    n = 40
+    today = datetime.now()
+    rows = []
+    for i in range(n):
+        s = _stat(i)
+        for d in (1, 2):
+            rows.append({'entity_type': 'KEYWORD', 'entity_id': s['id'],
+                         'stat_date': (today - timedelta(days=d)).strftime('%Y-%m-%d'),
+                         'impressions': s['impCnt'] // 2, 'clicks': s['clkCnt'] // 2,
+                         'cost': s['salesAmt'] / 2, 'avg_rank': s['avgRnk'],
+                         'conversions': s['ccnt'] / 2, 'conv_amount': s['convAmt'] / 2})
+    save_daily_stats('1001', rows)
+
+    fake = FakeSearchAd(_keywords(n), {f'nkw-{i}': _stat(i) for i in range(n)})
+    engine = _engine(fake)
+    report_changes = await engine.optimize_all_keywords()
+    check('리포트 최신 → /stats 0콜', engine.last_report['stats_source'] == 'report'
+          and fake.calls['stats'] == 0, str(fake.calls))
+
+    since = (today - timedelta(days=7)).strftime('%Y-%m-%d')
+    until = today.strftime('%Y-%m-%d')
+    stats_map, src = await bid_apply.fetch_keyword_stats(engine.api, [f'nkw-{i}' for i in range(n)],
+                                                         since, until)
+    check('합계가 /stats 필드로', src == 'report' and stats_map['nkw-0']['impCnt'] == 1000
+          and stats_map['nkw-0']['ccnt'] == 5 and stats_map['nkw-0']['avgRnk'] == 5.0, str(stats_map['nkw-0']))
+    api_map = {f'nkw-{i}': _stat(i) for i in range(n)}
+    via_api, _ = bid_apply.decide_bids(engine, _keywords(n), api_map)
+    check('리포트와 /stats 의 결정이 같음',
+          [(c.keyword_id, c.new_bid) for c in report_changes] == [(d.keyword_id, d.new_bid) for d in via_api])
+
+    later = (today + timedelta(days=10)).strftime('%Y-%m-%d')
+    _, src = await bid_apply.fetch_keyword_stats(engine.api, ['nkw-0'], since, later)
+    check(f'{bid_apply.STATS_MAX_LAG_DAYS}일 넘게 밀린 리포트 → /stats', src == 'api')
+
+
+if __name__ == '__main__':
+    test_decide()
+    asyncio.run(test_apply_batches())
+    asyncio.run(test_network_failure())
+    asyncio.run(test_report_stats())
+    print()
+    if failures:
+        print(f'FAILED {len(failures)}건: {failures}')
+        sys.exit(1)
+    print('전부 통과 — bid apply')
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+"""
+브라우저 풀 테스트 — services/browser_pool.py
+
+  - 반납한 슬롯을 재사용하는지(컨텍스트 1개로 여러 번), 헬스체크 실패 슬롯만 버리는지
+  - 슬롯이 다 차면 기다리고, acquire_timeout 을 넘기면 PoolTimeout
+  - K 페이지 / RSS 임계치를 넘긴 브라우저를 drain 하고 새 브라우저로 넘어가는지
+  - 브라우저 기동이 풀 락 밖에서 도는지(느린 기동 중에도 반납이 막히지 않음),
+    동시에 여러 대여가 새 브라우저를 원해도 기동은 한 번인지
+  - 취소된 호출자는 헬스체크 없이 떼어 내는지
+  - 대여 단위 리소스 차단·URL 차단·뷰포트
+  - /proc 에서 표식으로 프로세스 트리 RSS 를 읽는지, 통계가 공유 캐시로 올라가는지
+playwright 없이 돈다(_start_browser 를 가짜 브라우저로 바꿔 끼운 풀).
+
+실행: python flyio-backend/tests/test_browser_pool.py
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from services import browser_pool as BP  # noqa: E402
+from services.shared_cache import InMemoryBackend, set_backend  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+class FakePage:
+    def __init__(self, viewport):
+        self.viewport = viewport
+        self.closed = False
+        self.broken = False
+        self.visits = []
+
+    def is_closed(self):
+        return self.closed
+
+    async def evaluate(self, js):
+        return 10 * 1048576
+
+    async def goto(self, url, **kw):
+        if self.broken:
+            raise RuntimeError('page crashed')
+        self.visits.append(url)
+
+    async def set_viewport_size(self, size):
+        self.viewport = dict(size)
+
+
+class FakeContext:
+    def __init__(self, options):
+        self.options = options
+        self.handler = None
+        self.page = None
+        self.closed = False
+
+    async def route(self, pattern, handler):
+        self.handler = handler
+
+    async def new_page(self):
+        self.page = FakePage(self.options.get('viewport'))
+        return self.page
+
+    async def clear_cookies(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, args):
+        self.args = args
+        self.contexts = []
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **options):
+        await asyncio.sleep(0.01)
+        ctx = FakeContext(options)
+        self.contexts.append(ctx)
+        return ctx
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePool(BP.BrowserPool):
+    def __init__(self, name='t', launch_delay=0.0, **options):
+        options.setdefault('idle_close', 0)
+        super().__init__(name, **options)
+        self.launch_delay = launch_delay
+        self.launched = []
+
+    async def _start_browser(self, args):
+        await asyncio.sleep(self.launch_delay)
+        browser = FakeBrowser(args)
+        self.launched.append(browser)
+        return browser
+
+
+class FakeRoute:
+    def __init__(self):
+        self.result = None
+
+    async def abort(self):
+        self.result = 'abort'
+
+    async def continue_(self):
+        self.result = 'continue'
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+async def routed(page_ctx, url, resource_type):
+    route = FakeRoute()
+    await page_ctx.handler(route, FakeRequest(url, resource_type))
+    return route.result
+
+
+async def main():
+    print('=' * 72)
+    print('1. 재사용 · 대여 옵션')
+    print('=' * 72)
+    pool = FakePool(browsers=1, contexts=2)
+    pages = []
+    for _ in range(3):
+        async with pool.page() as page:
+            pages.append(page)
+    st = pool.stats()
+    check('반납한 슬롯 재사용 — 컨텍스트 1개', st['contexts_opened'] == 1 and len(set(map(id, pages))) == 1, st)
+    check('브라우저 기동 1회', st['launches'] == 1 and st['checkouts'] == 3)
+    check('반납 때 about:blank', pages[0].visits[-1] == 'about:blank')
+    marker = [a for a in pool.launched[0].args if a.startswith(BP.MARKER_SWITCH)]
+    check('기동 인자에 RSS 표식', len(marker) == 1 and marker[0] == pool._entries[0].marker, marker)
+
+    lease = await pool.acquire(block_resources=True, block_url=r'/(analytics|ads)[^/]*$',
+                               viewport={'width': 1280, 'height': 900})
+    ctx = lease._slot.context
+    check('block_resources → 이미지 차단', await routed(ctx, 'https://x/a.png', 'image') == 'abort')
+    check('block_url → 광고 스크립트 차단', await routed(ctx, 'https://x/ads.js', 'script') == 'abort')
+    check('문서는 통과', await routed(ctx, 'https://x/post', 'document') == 'continue')
+    check('대여 뷰포트 적용', lease.page.viewport == {'width': 1280, 'height': 900})
+    await lease.release()
+    await lease.release()   # 두 번 불러도 된다
+    lease = await pool.acquire()
+    ctx = lease._slot.context
+    check('다음 대여는 풀 기본값(차단 없음)', await routed(ctx, 'https://x/a.png', 'image') == 'continue'
+          and await routed(ctx, 'https://x/ads.js', 'script') == 'continue')
+    check('뷰포트 기본값으로 복귀', lease.page.viewport == {'width': 1920, 'height': 1080})
+    await lease.release()
+    await pool.close()
+
+    print()
+    print('=' * 72)
+    print('2. 대기 · 타임아웃')
+    print('=' * 72)
+    pool = FakePool(browsers=1, contexts=1)
+    held = await pool.acquire()
+    try:
+        await pool.acquire(timeout=0.1)
+        check('슬롯이 없으면 PoolTimeout', False)
+    except BP.PoolTimeout:
+        check('슬롯이 없으면 PoolTimeout', pool.stats()['timeouts'] == 1)
+    waiter = asyncio.create_task(pool.acquire(timeout=2))
+    await asyncio.sleep(0.1)
+    check('기다리는 중', not waiter.done())
+    await held.release()
+    got = await asyncio.wait_for(waiter, 1)
+    check('반납되면 기다리던 대여가 받는다', got.page is held.page and pool.stats()['waited'] == 1)
+    await got.release()
+    await pool.close()
+
+    print()
+    print('=' * 72)
+    print('3. 헬스체크 실패 · K 페이지 교체 · RSS 교체')
+    print('=' * 72)
+    pool = FakePool(browsers=1, contexts=2, recycle_pages=3)
+    a = await pool.acquire()
+    b = await pool.acquire()
+    a.page.broken = True
+    await a.release()
+    await b.release()
+    st = pool.stats()
+    check('실패한 슬롯만 버림', st['health_failures'] == 1 and st['contexts_discarded'] == 1
+          and a._slot.context.closed and not b._slot.context.closed, st)
+    check('브라우저는 그대로', st['launches'] == 1 and not pool.launched[0].closed)
+    async with pool.page():
+        pass
+    first = pool.launched[0]
+    check('K=3 페이지 후 브라우저 종료', first.closed and not pool._entries, pool.stats())
+    async with pool.page():
+        pass
+    check('다음 대여는 새 브라우저', pool.stats()['launches'] == 2 and not pool.launched[1].closed)
+
+    real_rss = BP._browser_rss
+    BP._browser_rss = lambda marker, pid=None: (4242, 2048 * 1048576)
+    try:
+        pool._entries[0].rss_at = 0.0
+        async with pool.page():
+            pass
+    finally:
+        BP._browser_rss = real_rss
+    check('RSS 임계치 초과 → 교체', pool.launched[1].closed and pool.stats()['recycles'] == 2,
+          pool.stats())
+    await pool.close()
+
+    print()
+    print('=' * 72)
+    print('4. 기동은 락 밖에서, 한 번만')
+    print('=' * 72)
+    pool = FakePool(browsers=2, contexts=1, launch_delay=0.3)
+    held = await pool.acquire()
+    second = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0.05)
+    t0 = time.perf_counter()
+    await held.release()
+    took = time.perf_counter() - t0
+    check('느린 기동 중에도 반납이 바로 끝남', took < 0.1, f'{took:.3f}s')
+    lease = await second
+    await lease.release()
+    await pool.close()
+
+    pool = FakePool(browsers=1, contexts=3, launch_delay=0.2)
+    leases = await asyncio.gather(*(pool.acquire() for _ in range(3)))
+    st = pool.stats()
+    check('동시 대여 3건 → 기동 1회', st['launches'] == 1 and st['contexts_opened'] == 3, st)
+    check('기동을 기다린 대여 집계', st['launch_waits'] == 2)
+    for lease in leases:
+        await lease.release()
+
+    pool2 = FakePool(browsers=2, contexts=2, launch_delay=0.05)
+    await pool2.start()
+    st = pool2.stats()
+    check('start() 가 N×M 슬롯을 예열', st['launches'] == 2 and st['contexts_opened'] == 4
+          and all(e['free'] == 2 and e['leased'] == 0 for e in st['live_browsers']), st)
+    await pool2.close()
+
+    print()
+    print('=' * 72)
+    print('5. 취소')
+    print('=' * 72)
+    entered = asyncio.Event()
+    captured = {}
+
+    async def hung():
+        async with pool.page() as page:
+            captured['page'] = page
+            captured['visits'] = len(page.visits)
+            entered.set()
+            await asyncio.sleep(10)
+
+    task = asyncio.create_task(hung())
+    await entered.wait()
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    await asyncio.sleep(0.01)
+    page = captured['page']
+    check('취소 → 헬스체크 없이 뗌', len(page.visits) == captured['visits'], page.visits)
+    entry = pool._entries[0]
+    check('장부에서 빠지고 컨텍스트 닫힘', entry.leased == 0 and entry.contexts == 2
+          and any(c.closed for c in pool.launched[0].contexts))
+    check('세마포어 반환', pool._sem._value == 3)
+    await pool.close()
+
+    print()
+    print('=' * 72)
+    print('6. RSS (/proc) · 통계 공개')
+    print('=' * 72)
+    marker = f'{BP.MARKER_SWITCH}test-{os.getpid()}'
+    child = ("import subprocess, sys, time; "
+             "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)', '--type=renderer']); "
+             "time.sleep(30)")
+    proc = subprocess.Popen([sys.executable, '-c', child, marker])
+    try:
+        await asyncio.sleep(0.5)
+        pid, total = BP._browser_rss(marker)
+        own = BP._rss_bytes(proc.pid)
+        if os.path.isdir('/proc'):
+            check('표식으로 메인 프로세스를 찾음', pid == proc.pid, f'{pid} vs {proc.pid}')
+            check('자식 RSS 까지 합산', total is not None and total > own > 0, f'{total} / {own}')
+        else:
+            check('/proc 없으면 (None, None)', (pid, total) == (None, None))
+        check('없는 표식 → (None, None)', BP._browser_rss(marker + 'x') == (None, None))
+    finally:
+        for p in subprocess.run(['pgrep', '-P', str(proc.pid)], capture_output=True,
+                                text=True).stdout.split():
+            os.kill(int(p), 9)
+        proc.kill()
+        proc.wait()
+
+    backend = InMemoryBackend()
+    set_backend(backend)
+    pool = BP._POOLS['scraper'] = FakePool('scraper')
+    async with pool.page():
+        pass
+    check('pool_stats 에 로컬 풀', any(s['name'] == 'scraper' for s in BP.pool_stats()))
+    BP._publish('scraper', pool.stats())
+    snaps = BP.published_pool_stats()
+    check('공유 캐시로 올라간 통계', len(snaps) == 1 and snaps[0]['name'] == 'scraper'
+          and snaps[0]['process'] == 'all' and snaps[0]['checkouts'] == 1, snaps)
+    await BP.close_all_pools()
+    check('close_all_pools 가 브라우저를 닫음', pool.launched[0].closed and not pool._entries)
+    BP._POOLS.pop('scraper', None)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
+    print()
+    if failures:
+        print(f'FAILED {len(failures)}건: {failures}')
+        sys.exit(1)
+    print('전부 통과 — browser pool')
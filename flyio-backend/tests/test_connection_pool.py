@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 연결 풀 테스트 — database/connection_pool.py
+
+close() 가 진짜로 닫지 않고 반납되는지, 반납 시 예전 close 와 같은 상태(미커밋 rollback,
+row_factory 초기화)가 되는지, 중첩 체크아웃·스레드가 연결을 나눠 쓰지 않는지,
+ensure_schema 가 한 번만 도는지 본다. 임시 파일 DB 로 돈다.
+
+실행: python flyio-backend/tests/test_connection_pool.py
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from database.connection_pool import (  # noqa: E402
+    close_idle, ensure_schema, pool_stats, pooled, pooled_connect,
+)
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+tmp = tempfile.mkdtemp()
+path = os.path.join(tmp, 'pool.db')
+
+print('=' * 72)
+print('1. 반납·재사용')
+print('=' * 72)
+conn = pooled_connect(path)
+conn.row_factory = sqlite3.Row
+conn.execute('CREATE TABLE t (v INTEGER)')
+conn.execute('INSERT INTO t VALUES (1)')
+conn.commit()
+conn.execute('INSERT INTO t VALUES (2)')      # 커밋 안 함 → 반납 시 rollback
+conn.close()
+again = pooled_connect(path)
+check('같은 스레드에서 같은 연결 재사용', again is conn)
+check('미커밋 쓰기는 반납 때 rollback', again.execute('SELECT COUNT(*) FROM t').fetchone()[0] == 1)
+check('row_factory 는 기본값으로', again.row_factory is None)
+check('WAL 은 연결 생성 때 적용',
+      again.execute('PRAGMA journal_mode').fetchone()[0] == 'wal')
+check('temp_store=MEMORY', again.execute('PRAGMA temp_store').fetchone()[0] == 2)
+nested = pooled_connect(path)
+check('중첩 체크아웃은 다른 연결', nested is not again)
+nested.close()
+again.close()
+again.close()                                  # 두 번 닫아도 무해
+
+with pooled(path) as c:
+    c.execute('INSERT INTO t VALUES (3)')
+try:
+    with pooled(path) as c:
+        c.execute('INSERT INTO t VALUES (4)')
+        raise RuntimeError('boom')
+except RuntimeError:
+    pass
+with pooled(path) as c:
+    vals = [r[0] for r in c.execute('SELECT v FROM t ORDER BY v')]
+check('pooled(): 성공 commit / 예외 rollback', vals == [1, 3], str(vals))
+
+print()
+print('=' * 72)
+print('2. 스레드 분리 · 스키마 1회 · 통계')
+print('=' * 72)
+seen = {}
+
+
+def worker(n):
+    c = pooled_connect(path)
+    seen[n] = id(c)
+    c.execute('SELECT 1').fetchone()
+    c.close()
+
+
+threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+check('스레드마다 자기 연결', len(set(seen.values())) == 4)
+
+calls = []
+for _ in range(3):
+    ensure_schema(path, 'extra', lambda c: (calls.append(1), c.execute('CREATE TABLE IF NOT EXISTS e (x)')))
+check('ensure_schema 는 프로세스당 1회', len(calls) == 1)
+
+st = [s for s in pool_stats() if s['path'] == os.path.abspath(path)][0]
+check('연결은 (메인 2 + 스레드 4) 개만 열림', st['connects'] == 6 and st['checkouts'] == 11,
+      f"connects={st['connects']} checkouts={st['checkouts']}")
+check('쿼리 지연 표본', st['queries'] > 5 and st['p95_query_ms'] is not None, str(st))
+check('유휴 연결 정리', close_idle() >= 1)
+
+print()
+if failures:
+    print(f'FAILED {len(failures)}건: {failures}')
+    sys.exit(1)
+print('전부 통과 — connection pool')
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 그룹 순위 지표 회귀 테스트 — services/grouped_ranking.py
+
+그룹별 dict + rankdata + scipy 로 하던 계산과 같은 값이 나와야 한다.
+동점(같은 예측 점수)·중복 수집·본문 읽기 실패 샘플이 섞인 데이터로 확인한다.
+
+실행: python flyio-backend/tests/test_grouped_ranking.py
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np  # noqa: E402
+from scipy.stats import kendalltau, rankdata, spearmanr  # noqa: E402
+
+from services.grouped_ranking import (  # noqa: E402
+    build_group_index,
+    grouped_metrics,
+    grouped_rank_loss,
+)
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+def reference_groups(samples):
+    """예전 calculate_exact_match_rate_by_keyword 의 그룹 구성 그대로"""
+    groups, seen = {}, set()
+    for i, s in enumerate(samples):
+        kw = s.get('keyword', 'unknown')
+        key = (kw, s.get('blog_id'))
+        if key in seen:
+            continue
+        seen.add(key)
+        if s.get('content_parsed') == 0:
+            continue
+        groups.setdefault(kw, []).append(i)
+    return {k: v for k, v in groups.items() if len(v) >= 2}
+
+
+rng = random.Random(42)
+samples = []
+for i in range(3000):
+    samples.append({
+        'keyword': rng.choice([f'kw{j}' for j in range(40)] + ['unknown']),
+        'blog_id': rng.choice([f'b{j}' for j in range(14)] + [None]),
+        'actual_rank': rng.randint(1, 13),
+        'content_parsed': rng.choice([None, 1, 1, 0]),
+        'collected_at': f'2024-03-{28 - i // 120:02d} 10:00:00',  # collected_at DESC
+    })
+scores = np.array([rng.choice([10.0, 20.0, rng.uniform(0, 100)]) for _ in samples])
+
+print('=' * 72)
+print('1. 그룹 구성 = 예전 dict 구성')
+print('=' * 72)
+ref = reference_groups(samples)
+idx = build_group_index(samples)
+got = {kw: idx.rows[s:s + m].tolist() for kw, s, m in zip(idx.keywords, idx.starts, idx.sizes)}
+check('키워드 집합 일치', set(got) == set(ref), f'{len(got)} vs {len(ref)}')
+check('그룹 구성원·순서 일치', all(got[k] == ref[k] for k in ref))
+check('그룹 순서 = 키워드가 처음 나온 순서', idx.keywords == list(ref), idx.keywords[:5])
+
+print()
+print('=' * 72)
+print('2. 그룹별 순위·상관계수 = rankdata / spearmanr / kendalltau')
+print('=' * 72)
+gm = grouped_metrics(idx, scores)
+rank_ok = sp_ok = kt_ok = True
+for g, kw in enumerate(idx.keywords):
+    s, m = idx.starts[g], idx.sizes[g]
+    rows = idx.rows[s:s + m]
+    actual = np.array([samples[i]['actual_rank'] for i in rows])
+    pred = rankdata(-scores[rows], method='ordinal')
+    rank_ok &= bool((gm.predicted_rank[s:s + m] == pred).all())
+    sp, kt = spearmanr(actual, pred)[0], kendalltau(actual, pred)[0]
+    sp_ok &= abs((0.0 if np.isnan(sp) else sp) - gm.spearman[g]) < 1e-9
+    kt_ok &= abs((0.0 if np.isnan(kt) else kt) - gm.kendall[g]) < 1e-9
+check('예측 순위 (동점 = 먼저 나온 샘플 우선)', rank_ok)
+check('Spearman', sp_ok)
+check('Kendall tau-b', kt_ok)
+
+diffs = np.concatenate([
+    np.abs(rankdata(-scores[v], method='ordinal') - np.array([samples[i]['actual_rank'] for i in v]))
+    for v in ref.values()
+])
+check('전체 exact_match', abs(gm.summary['exact_match'] - (diffs == 0).mean() * 100) < 1e-9)
+check('전체 avg_deviation', abs(gm.summary['avg_deviation'] - diffs.mean()) < 1e-9)
+
+print()
+print('=' * 72)
+print('3. 배치 손실 · 경계 조건')
+print('=' * 72)
+batch = grouped_rank_loss(idx, np.stack([scores, -scores, scores]))
+check('(k, n) → (k,)', batch.shape == (3,))
+check('같은 점수 행 = 같은 손실', batch[0] == batch[2] == grouped_rank_loss(idx, scores))
+empty = build_group_index([])
+check('빈 샘플 → 그룹 0', empty.n_groups == 0)
+check('빈 샘플 요약은 기본값', grouped_metrics(empty, np.zeros(0)).summary['avg_deviation'] == 13.0)
+shuffled = list(reversed(samples))
+check('입력 순서가 바뀌어도 최신 수집분을 남긴다',
+      sorted(build_group_index(shuffled).keywords) == sorted(idx.keywords))
+
+print()
+if failures:
+    print(f'FAILED {len(failures)}건: {failures}')
+    sys.exit(1)
+print('전부 통과 — 그룹 순위 지표 = 그룹별 scipy 계산')
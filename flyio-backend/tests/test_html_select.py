@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+HTML 파싱 계층 대조 테스트 — services/html_select.py (lxml) vs BeautifulSoup html.parser
+
+tests/fixtures/serp/*.html (네이버 블로그탭·통합검색·모바일 글 페이지 마크업을 본뜬 것)으로
+  - keyword_verdict._parse_serp_html 이 예전 bs4 구현과 같은 순위 행·parse_mode 를 내는지
+  - routers/blogs 가 쓰는 셀렉터들이 soupsieve 와 같은 요소(태그·텍스트·순서)를 고르는지
+  - 지원하지 않는 셀렉터는 조용히 틀리지 않고 ValueError 인지
+를 본다.
+
+실행: python flyio-backend/tests/test_html_select.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from services import keyword_verdict as KV  # noqa: E402
+from services.html_select import css_to_xpath, parse_html, select, select_one, text_of  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'serp')
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+def load(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def bs4_parse_serp(html):
+    """lxml 전환 전 _parse_serp_html 그대로 (대조 기준)."""
+    rows, seen = [], set()
+    soup = BeautifulSoup(html, 'html.parser')
+    containers = []
+    for sel in KV._LIST_SELECTORS:
+        containers = soup.select(sel)
+        if containers:
+            break
+    for c in containers:
+        for a in c.select('a[href*="blog.naver.com"]'):
+            m = KV._POST_RE.search(a.get('href', ''))
+            if not m or m.group(1) in seen:
+                continue
+            seen.add(m.group(1))
+            title = KV._TITLE_NOISE.sub('', a.get_text(strip=True) or '').strip()
+            rows.append({
+                'rank': len(rows) + 1, 'blog_id': m.group(1), 'blog_name': m.group(1),
+                'post_title': title or f'포스팅 #{m.group(2)}',
+                'post_url': f'https://blog.naver.com/{m.group(1)}/{m.group(2)}',
+            })
+    if rows:
+        return rows, 'list'
+    for blog_id, post_id in KV._POST_RE.findall(html):
+        if blog_id in seen:
+            continue
+        seen.add(blog_id)
+        rows.append({
+            'rank': len(rows) + 1, 'blog_id': blog_id, 'blog_name': blog_id,
+            'post_title': f'포스팅 #{post_id}',
+            'post_url': f'https://blog.naver.com/{blog_id}/{post_id}',
+        })
+    return rows, 'regex'
+
+
+def picks_bs4(soup, css):
+    return [(t.name, t.get_text(strip=True), t.get('href') or t.get('src') or t.get('content'))
+            for t in soup.select(css)]
+
+
+def picks_lxml(doc, css):
+    return [(t.tag, text_of(t), t.get('href') or t.get('src') or t.get('content'))
+            for t in select(doc, css)]
+
+
+print('=' * 72)
+print('1. _parse_serp_html — bs4 구현과 같은 순위 행')
+print('=' * 72)
+expect_mode = {'blog_tab_list.html': 'list', 'blog_tab_intent_variant.html': 'list',
+               'blog_tab_blocked.html': 'regex', 'search_total.html': 'regex'}
+for name, mode in expect_mode.items():
+    html = load(name)
+    old = bs4_parse_serp(html)
+    new = KV._parse_serp_html(html)
+    check(f'{name}: 행·모드 일치', new == old, f'{len(new[0])}행 {new[1]} / bs4 {len(old[0])}행 {old[1]}')
+    check(f'{name}: parse_mode={mode}', new[1] == mode)
+
+rows, _ = KV._parse_serp_html(load('blog_tab_list.html'))
+ids = [r['blog_id'] for r in rows]
+check('캐러셀(li.info_item)·컨테이너 밖 링크·script 속 링크 제외',
+      not {'official_hosp', 'health_gov', 'footer_link', 'script_only'} & set(ids), f'{ids}')
+check('같은 블로그는 첫 글만', len(ids) == len(set(ids)) and ids[:2] == ['sunny_day', 'mom-diary'], f'{ids[:3]}')
+check('제목 — "새 창 열림" 제거·엔티티 해석', rows[1]['post_title'] == '편두통 – 약 없이 줄이는 법',
+      rows[1]['post_title'])
+check('빈 문서 → 빈 regex 결과', KV._parse_serp_html('') == ([], 'regex'))
+
+print()
+print('=' * 72)
+print('2. routers/blogs 셀렉터 — soupsieve 와 같은 요소')
+print('=' * 72)
+BLOGS_SELECTORS = {
+    'search_total.html': [
+        '#main_pack .api_subject_bx, #main_pack .sp_blog .bx, .total_wrap .total_area',
+        '.api_txt_lines.total_tit, .title_link, .title, strong.tit',
+        '.sub_txt.sub_name, .name, .blog_name',
+        'a[href*="blog.naver.com"]',
+    ],
+    'blog_post_mobile.html': [
+        'meta[property="og:title"]', 'meta[property="og:description"]', 'meta[property="og:image"]',
+        'meta[property="article:published_time"], meta[name="date"]',
+        '.se-main-container, ._postView, .post_ct, #postViewArea, .se_component_wrap, .__viewer_container',
+        'article, .post_article, .blog_view_content',
+        '.se-title-text, .tit_h3, ._postTitleText, .post_tit, h3.se_textarea, .tit_view',
+        '.se-section-title, .se-text-paragraph-align-center, h2, h3, h4, .se-title, strong.se-text-paragraph',
+        '.se-text-paragraph, p, .se-module-text',
+        '.se-image-resource, img.se_mediaImage, ._postView img, .post_ct img, img[src*="blogfiles"], '
+        'img[src*="postfiles"]',
+        '.se-video, iframe[src*="video"], iframe[src*="youtube"], iframe[src*="tv.naver"], .video_player',
+        '.se-map, iframe[src*="map"], .map_area, .place_thumb, .se-place',
+        'a[href*="http"]:not([href*="naver.com"]):not([href*="naver.net"])',
+        '.u_cnt, .sympathy_count, ._sympathyCount, .like_count, .btn_like_count',
+        '.comment_count, ._commentCount, .cmt_count, .btn_comment_count',
+        '.se_publishDate, .se-date, ._postAddDate, .post_date, .date, .blog_date, time',
+    ],
+    'blog_tab_list.html': list(KV._LIST_SELECTORS) + [
+        'div.fds-info-inner-box > a.fds-info-profile',
+        'a[class$="title"] span:not(.blind)',
+        '[target=_blank] > .fds-comps-text',
+        'li.info_item a, div[class^="Z0g"] > div > a[href^="https://blog"]',
+        '*:not(div):not(span):not(a)[class~="fds-thumb"], a[class|="fds"]',
+    ],
+    'blog_tab_intent_variant.html': list(KV._LIST_SELECTORS) + ['p'],
+}
+for name, sels in BLOGS_SELECTORS.items():
+    html = load(name)
+    soup, doc = BeautifulSoup(html, 'html.parser'), parse_html(html)
+    for css in sels:
+        a, b = picks_bs4(soup, css), picks_lxml(doc, css)
+        check(f'{name}: {css[:60]}', a == b, f'{len(b)}개' if a == b else f'bs4 {a[:2]} / lxml {b[:2]}')
+
+# 알려진 차이: 닫히지 않은 <li> 를 html.parser 는 안에 중첩시키고 lxml 은 브라우저처럼 닫는다.
+doc = parse_html(load('blog_tab_intent_variant.html'))
+check('닫히지 않은 li 는 브라우저처럼 형제 (html.parser 와 다름)',
+      [text_of(li) for li in select(doc, 'li.info_item')] == ['캐러셀', '캐러셀2'])
+
+doc = parse_html(load('search_total.html'))
+box = select(doc, '.total_wrap .total_area')[2]
+title = select_one(box, '.api_txt_lines.total_tit, .title_link, .title, strong.tit')
+check('컨테이너 기준 select_one', title is not None and title.get('href', '').endswith('/223700000002'))
+check('없으면 None·빈 문자열', select_one(box, '.nope') is None and text_of(None) == '' and select(None, 'a') == [])
+
+print()
+print('=' * 72)
+print('3. 번역기 경계')
+print('=' * 72)
+for bad in ('li:nth-child(2)', 'a + b', 'a ~ b', 'a:not(b c)', ', a', 'a,'):
+    try:
+        css_to_xpath(bad)
+        ok = False
+    except ValueError:
+        ok = True
+    check(f'ValueError: {bad!r}', ok)
+check('"A > B C" 는 B 가 A 의 자식인 C', css_to_xpath('A > B C') == 'descendant::c[ancestor::b[parent::a]]',
+      css_to_xpath('A > B C'))
+odd = parse_html('<p>엔티티 &amp; <b>굵게</b><!-- 주석 --><script>x=1</script></p>')
+check('text_of 는 주석·script 제외', text_of(select_one(odd, 'p')) == '엔티티 &굵게'
+      and text_of(select_one(odd, 'p'), separator=' ') == '엔티티 & 굵게')
+check('인코딩 선언 붙은 str', select_one(parse_html('<?xml version="1.0" encoding="utf-8"?><p>가</p>'), 'p')
+      is not None)
+
+print()
+if failures:
+    print(f'FAILED {len(failures)}건: {failures}')
+    sys.exit(1)
+print('전부 통과 — html select')
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 클라이언트 레지스트리 테스트 — services/http_clients.py
+
+  - 같은 루프 안에서 같은 이름이면 같은 클라이언트, 이름이 다르면 다른 클라이언트
+  - 누가 닫았으면 다음 get_client 가 새로 여는지, 루프가 바뀌면 새로 여는지
+  - 살아 있는 루프 둘(메인 + 스레드)이 번갈아 불러도 루프마다 하나씩만 여는지,
+    close_all 이 다른 스레드 루프의 클라이언트를 그 루프에서 닫는지
+  - 업스트림 프로필(타임아웃·연결 상한)이 적용되는지, 모르는 이름은 KeyError
+  - 요청 수·5xx 집계, close_all
+  - NaverAdApiClient 가 공용 "searchad" 풀을 쓰고 close() 가 그것을 닫지 않는지
+네트워크 없이 돈다(요청은 MockTransport 를 끼운 클라이언트로).
+
+실행: python flyio-backend/tests/test_http_clients.py
+"""
+import asyncio
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import httpx  # noqa: E402
+
+from services import http_clients as HC  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+holder = {}
+
+
+async def first_loop():
+    print('=' * 72)
+    print('1. 레지스트리')
+    print('=' * 72)
+    blog = HC.get_client('blog')
+    check('같은 이름 → 같은 클라이언트', HC.get_client('blog') is blog)
+    check('다른 이름 → 다른 클라이언트', HC.get_client('search') is not blog)
+    check('이름 생략 → default', HC.get_client() is HC.get_client('default'))
+    try:
+        HC.get_client('nope')
+        check('모르는 이름 → KeyError', False)
+    except KeyError:
+        check('모르는 이름 → KeyError', True)
+
+    ad = HC.get_client('searchad')
+    check('searchad 타임아웃(connect 3s / read 8s)', ad.timeout.connect == 3.0 and ad.timeout.read == 8.0)
+    check('searchad 연결 상한 10', HC.client_stats()['searchad']['max_connections'] == 10)
+
+    await blog.aclose()
+    reopened = HC.get_client('blog')
+    check('닫혔으면 새로 연다', reopened is not blog and not reopened.is_closed)
+    check('clients_opened 집계', HC.client_stats()['blog']['clients_opened'] == 2)
+    holder['blog'] = reopened
+
+    print()
+    print('=' * 72)
+    print('2. 요청 집계')
+    print('=' * 72)
+
+    async def handler(request):
+        return httpx.Response(503 if request.url.path == '/down' else 200)
+
+    # 프로필·이벤트 훅은 그대로 두고 전송 계층만 바꿔 끼운다
+    mocked = HC._make('openapi')
+    mocked._transport = httpx.MockTransport(handler)
+    before = HC.client_stats()['openapi']
+    await mocked.get('https://openapi.naver.com/ok')
+    await mocked.get('https://openapi.naver.com/down')
+    after = HC.client_stats()['openapi']
+    check('요청 수', after['requests'] == before['requests'] + 2, after)
+    check('5xx 집계', after['errors'] == before['errors'] + 1)
+    check('재사용률 계산', after['reuse_ratio'] is not None and 0 <= after['reuse_ratio'] <= 1)
+    await mocked.aclose()
+
+    print()
+    print('=' * 72)
+    print('3. NaverAdApiClient')
+    print('=' * 72)
+    from services.naver_ad_service import NaverAdApiClient
+    api = NaverAdApiClient()
+    check('공용 searchad 풀', api.client is HC.get_client('searchad'))
+    await api.close()
+    check('close() 는 공용 풀을 닫지 않는다', not HC.get_client('searchad').is_closed)
+    own = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    api.client = own
+    check('전용 클라이언트 끼우기', api.client is own)
+    await api.close()
+    check('전용 클라이언트는 close() 가 닫는다', own.is_closed and api.client is HC.get_client('searchad'))
+
+
+async def second_loop():
+    print()
+    print('=' * 72)
+    print('4. 루프가 바뀌면')
+    print('=' * 72)
+    blog = HC.get_client('blog')
+    check('새 루프 → 새 클라이언트', blog is not holder['blog'])
+
+    print()
+    print('=' * 72)
+    print('5. 살아 있는 루프 둘')
+    print('=' * 72)
+    other = asyncio.new_event_loop()
+    th = threading.Thread(target=other.run_forever, daemon=True)
+    th.start()
+
+    async def on_other():
+        return HC.get_client('blog')
+
+    opened = HC.client_stats()['blog']['clients_opened']
+    mine, theirs = set(), set()
+    for _ in range(10):
+        mine.add(id(HC.get_client('blog')))
+        theirs.add(id(asyncio.run_coroutine_threadsafe(on_other(), other).result()))
+    check('20번 번갈아 불러도 루프마다 하나', len(mine) == 1 and len(theirs) == 1 and mine != theirs,
+          f'mine={len(mine)} theirs={len(theirs)}')
+    check('새로 연 클라이언트 1개', HC.client_stats()['blog']['clients_opened'] == opened + 1)
+    other_client = asyncio.run_coroutine_threadsafe(on_other(), other).result()
+    check('메인 루프 클라이언트는 그대로', HC.get_client('blog') is blog)
+
+    await HC.close_all()
+    check('close_all 후 모두 닫힘', blog.is_closed and other_client.is_closed and not any(
+        s['open'] for s in HC.client_stats().values()))
+    other.call_soon_threadsafe(other.stop)
+    th.join()
+    other.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(first_loop())
+    asyncio.run(second_loop())
+    print()
+    if failures:
+        print(f'FAILED {len(failures)}건: {failures}')
+        sys.exit(1)
+    print('전부 통과 — http clients')
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+증분 백업 테스트 — services/incremental_backup.py (+ backup_service 연결)
+
+임시 디렉터리에 WAL DB 둘과 롤백 저널 DB 하나를 만들고 다음을 본다.
+  - 하위 디렉터리까지 *.db 전부, SQLite 아닌 .db·백업 디렉터리는 제외
+  - 두 번째 스냅샷은 바뀐 청크만 쓴다(재사용 대부분, 쓴 바이트 작음)
+  - 아무 스냅샷이나 / 시각 at 기준으로 복원한 내용이 그때 커밋된 상태와 같다
+  - 스냅샷 도중 다른 스레드가 계속 써도 복원본이 어느 커밋 시점과 정확히 같다
+  - 단계 사이에 쉰다(sleep_s), 보고에 바이트·I/O 시간
+  - prune → 참조 없는 청크 gc, 살아 있는 DB 위로 in-place 복원
+  - backup_service: create_backup → 스냅샷 id, 목록·상태·복원, 예전 전체 복사본 정리
+
+실행: python flyio-backend/tests/test_incremental_backup.py
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from services import incremental_backup as ib  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+def make_db(path, rows, wal=True):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path)
+    if wal:
+        conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('CREATE TABLE IF NOT EXISTS t (id INTEGER PRIMARY KEY, v TEXT)')
+    conn.executemany('INSERT INTO t (v) VALUES (?)', [(os.urandom(60).hex(),) for _ in range(rows)])
+    conn.commit()
+    return conn
+
+
+def dump(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute('SELECT id, v FROM t ORDER BY id').fetchall()
+    finally:
+        conn.close()
+
+
+def test_snapshot_restore(root, store):
+    print('=' * 72)
+    print('1. 스냅샷·증분·복원')
+    print('=' * 72)
+    a = make_db(os.path.join(root, 'a.db'), 12000)
+    b = make_db(os.path.join(root, 'sub', 'b.db'), 500)
+    j = make_db(os.path.join(root, 'journal.db'), 300, wal=False)
+    with open(os.path.join(root, 'notes.db'), 'wb') as f:
+        f.write(b'not sqlite')
+    make_db(os.path.join(store.dir, 'inside.db'), 10).close()
+
+    found = ib.find_databases(root, exclude_dirs=[store.dir])
+    check('*.db 전부(하위 포함), SQLite 아님·백업 디렉터리 제외',
+          found == ['a.db', 'journal.db', os.path.join('sub', 'b.db')], str(found))
+
+    r1 = store.snapshot(root, step_pages=64, step_sleep=0.001, chunk_pages=4)
+    state1 = {rel: dump(os.path.join(root, rel)) for rel in found}
+    check('첫 스냅샷은 전부 새 청크', r1['chunks_new'] > 0 and r1['chunks_reused'] < r1['chunks_new'],
+          f"new={r1['chunks_new']} reused={r1['chunks_reused']}")
+    check('압축해서 씀', r1['bytes_written'] < r1['logical_bytes'] * 0.7,
+          f"written={r1['bytes_written']} logical={r1['logical_bytes']}")
+    check('WAL 은 시점 고정, 저널 DB 는 단계 잠금',
+          r1['per_db']['a.db']['method'] == 'wal_snapshot'
+          and r1['per_db']['journal.db']['method'] == 'delete_stepped', str(
+              {k: v['method'] for k, v in r1['per_db'].items()}))
+    check('단계 사이에 쉼', r1['sleep_s'] > 0 and r1['io_s'] >= 0, f"sleep={r1['sleep_s']} io={r1['io_s']}")
+
+    a.execute("UPDATE t SET v = 'changed' WHERE id IN (5, 9000)")
+    a.commit()
+    j.execute("INSERT INTO t (v) VALUES ('new')")
+    j.commit()
+    time.sleep(1.1)  # 스냅샷 id 는 초 단위
+    r2 = store.snapshot(root, step_pages=64, step_sleep=0.001, chunk_pages=4)
+    state2 = {rel: dump(os.path.join(root, rel)) for rel in found}
+    check('두 번째는 바뀐 청크만', r2['chunks_new'] <= 6 and r2['chunks_reused'] > 10 * r2['chunks_new'],
+          f"new={r2['chunks_new']} reused={r2['chunks_reused']}")
+    check('쓴 바이트가 첫 번째의 10% 미만', r2['bytes_written'] < r1['bytes_written'] / 10,
+          f"{r2['bytes_written']} vs {r1['bytes_written']}")
+
+    out1 = os.path.join(root, '..', 'restore1')
+    res = store.restore(r1['id'], target_dir=out1)
+    check('복원 성공', all(r['ok'] for r in res['dbs'].values()), str(res['dbs']))
+    check('첫 스냅샷 내용 그대로', all(dump(os.path.join(out1, rel)) == state1[rel] for rel in found))
+    out_at = os.path.join(root, '..', 'restore_at')
+    res = store.restore(at=datetime.fromisoformat(r2['created_at']), target_dir=out_at)
+    check('시각 at → 그 시점 스냅샷', res['id'] == r2['id']
+          and all(dump(os.path.join(out_at, rel)) == state2[rel] for rel in found))
+    check('첫 스냅샷 이전 시각이면 없음', store.find(datetime(2000, 1, 1)) is None)
+    for c in (a, b, j):
+        c.close()
+    return r1, r2
+
+
+def test_concurrent_writer(root, store):
+    print('=' * 72)
+    print('2. 쓰는 중에 스냅샷')
+    print('=' * 72)
+    path = os.path.join(root, 'busy.db')
+    make_db(path, 20000).close()
+    stop = threading.Event()
+    committed = []
+
+    def writer():
+        conn = sqlite3.connect(path, timeout=10)
+        n = 0
+        while not stop.is_set():
+            n += 1
+            conn.execute('INSERT INTO t (v) VALUES (?)', (f'live{n}|' + os.urandom(40).hex(),))
+            conn.execute('UPDATE t SET v = ? WHERE id = ?', (f'upd{n}', n % 20000 + 1))
+            conn.commit()
+            committed.append(n)
+            time.sleep(0.002)
+        conn.close()
+
+    th = threading.Thread(target=writer)
+    th.start()
+    time.sleep(0.1)
+    t0 = time.perf_counter()
+    rep = store.snapshot(root, databases=['busy.db'], step_pages=32, step_sleep=0.01)
+    held = time.perf_counter() - t0
+    n_during = len(committed)
+    time.sleep(0.1)
+    stop.set()
+    th.join()
+    check('스냅샷 동안 쓰기가 멈추지 않음', n_during > 20 and held > 0.05, f'commits={n_during} held={held:.2f}s')
+
+    out = os.path.join(root, '..', 'restore_busy')
+    res = store.restore(rep['id'], target_dir=out)
+    rows = dump(os.path.join(out, 'busy.db'))
+    lives = sorted(int(v[4:].split('|')[0]) for _, v in rows if v.startswith('live'))
+    k = lives[-1] if lives else 0
+    ok_inserts = lives == list(range(1, k + 1))
+    check('복원본 quick_check ok', res['dbs']['busy.db']['ok'], str(res['dbs']['busy.db']))
+    check('복원본이 어느 한 커밋 시점(insert 1..k 연속)', ok_inserts and k > 0, f'k={k}')
+    upd = {n % 20000 + 1: f'upd{n}' for n in range(1, k + 1)}
+    check('그 시점의 update 까지 정확히', all(v == upd[i] for i, v in rows if i in upd),
+          str(sum(v != upd[i] for i, v in rows if i in upd)))
+
+
+def test_prune_gc_inplace(root, store, r1, r2):
+    print('=' * 72)
+    print('3. 정리·in-place 복원')
+    print('=' * 72)
+    before = store.size_bytes()
+    saved = ib.GC_GRACE_SECONDS
+    ib.GC_GRACE_SECONDS = -1
+    try:
+        res = store.prune(2, min_keep=1)
+    finally:
+        ib.GC_GRACE_SECONDS = saved
+    check('오래된 스냅샷부터 지움', r1['id'] in res['removed'] and r2['id'] not in res['removed'], str(res))
+    check('참조 없는 청크 gc', res['freed_bytes'] > 0 and store.size_bytes() < before,
+          f"freed={res['freed_bytes']}")
+    out = os.path.join(root, '..', 'restore_after_gc')
+    res = store.restore(r2['id'], target_dir=out)
+    check('남은 스냅샷은 그대로 복원됨', all(r['ok'] for r in res['dbs'].values()))
+
+    path = os.path.join(root, 'a.db')
+    live = sqlite3.connect(path)
+    live.execute("DELETE FROM t WHERE id > 100")
+    live.commit()
+    res = store.restore(r2['id'], databases=['a.db'], in_place=True)
+    check('살아 있는 DB 위로 in-place 복원', res['dbs']['a.db']['ok']
+          and live.execute('SELECT count(*) FROM t').fetchone()[0] == 12000)
+    live.close()
+
+
+def test_backup_service(tmp):
+    print('=' * 72)
+    print('4. backup_service')
+    print('=' * 72)
+    from services import backup_service as bs
+    root = os.path.join(tmp, 'svc')
+    bs.DATA_ROOT = root
+    bs.DATABASE_PATH = os.path.join(root, 'blog_analyzer.db')
+    bs.BACKUP_DIR = os.path.join(root, 'backups')
+    bs.INCREMENTAL_DIR = os.path.join(bs.BACKUP_DIR, 'incremental')
+    make_db(bs.DATABASE_PATH, 1000).close()
+    make_db(os.path.join(root, 'naver_ad.db'), 200).close()
+    bs.ensure_backup_dir()
+    for i in range(3):
+        with open(os.path.join(bs.BACKUP_DIR, f'backup_2026010{i}_000000.db'), 'wb') as f:
+            f.write(b'\0' * 1024)
+
+    sid = bs.create_backup()
+    check('create_backup → 스냅샷 id', sid and bs.get_store().last_report['databases'] == 2, str(sid))
+    time.sleep(1.1)
+    conn = sqlite3.connect(bs.DATABASE_PATH)
+    conn.execute("DELETE FROM t")
+    conn.commit()
+    sid2 = bs.create_backup()
+    lst = bs.get_backup_list()
+    check('목록: 증분 먼저, 예전 전체도', [b['kind'] for b in lst][:2] == ['incremental', 'incremental']
+          and sum(b['kind'] == 'full' for b in lst) == 3, str([b['filename'] for b in lst]))
+    st = bs.get_backup_status()
+    check('상태에 증분 보고', st['incremental']['last_run']['id'] == sid2
+          and 'bytes_written' in st['incremental']['last_run'] and 'io_s' in st['incremental']['last_run'])
+
+    check('스냅샷 id 로 복원', bs.restore_from_backup(sid)
+          and conn.execute('SELECT count(*) FROM t').fetchone()[0] == 1000)
+    conn.close()
+    check('복원 전 상태도 스냅샷으로', len(bs.get_store().list_snapshots()) == 3)
+    check('없는 id 는 False', not bs.restore_from_backup('19990101_000000'))
+
+    bs.cleanup_old_backups()
+    left = [f for f in os.listdir(bs.BACKUP_DIR) if f.startswith('backup_')]
+    check('증분이 충분하면 예전 전체 복사본 정리', left == [], str(left))
+    out = os.path.join(tmp, 'pitr')
+    res = bs.restore_point_in_time(datetime.now(), out, databases=['naver_ad.db'])
+    check('point-in-time 복원(대상 디렉터리)', list(res['dbs']) == ['naver_ad.db']
+          and len(dump(os.path.join(out, 'naver_ad.db'))) == 200)
+
+
+if __name__ == '__main__':
+    tmp = tempfile.mkdtemp(prefix='incbackup_')
+    root = os.path.join(tmp, 'data')
+    store = ib.BackupStore(os.path.join(root, 'backups', 'incremental'))
+    print(f'codec={ib.CODEC}')
+    r1, r2 = test_snapshot_restore(root, store)
+    test_concurrent_writer(root, store)
+    test_prune_gc_inplace(root, store, r1, r2)
+    test_backup_service(tmp)
+    print()
+    if failures:
+        print(f'FAILED {len(failures)}건: {failures}')
+        sys.exit(1)
+    print('전부 통과 — incremental backup')
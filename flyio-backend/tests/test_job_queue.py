@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+작업 큐 테스트 — services/job_queue.py + database/job_queue_db.py
+
+임시 디렉터리의 SQLite 로 다음을 본다.
+  - 우선순위 → 적재 순서, dedupe 재사용, max_live 포화
+  - 동시 실행 상한(concurrency), 리스 만료 → 재적재 → 시도 소진 시 dead
+  - fail 백오프(run_after 전에는 안 집힘), JobFailed(retry=False) → error
+  - 같은 프로세스 enqueue 가 기다리는 워커를 poll 을 기다리지 않고 깨우는지
+  - 다른 연결이 쓰기 락을 쥔 동안 next_job 이 이벤트 루프를 막지 않는지
+  - stats 의 적재→시작 지연 지표, kwverdict 어댑터(_view·has_pending·dedupe)
+
+실행: python flyio-backend/tests/test_job_queue.py
+"""
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+_TMP = tempfile.mkdtemp(prefix='jobq_')
+os.environ['DATA_DIR'] = _TMP
+os.environ['JOB_QUEUE_DB_PATH'] = os.path.join(_TMP, 'job_queue.db')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from database import job_queue_db as db  # noqa: E402
+from services.job_queue import JobFailed, JobQueue  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+def test_order_dedupe_full():
+    print('=' * 72)
+    print('1. 우선순위·dedupe·포화')
+    print('=' * 72)
+    q = JobQueue('t_order', concurrency=None, max_live=4)
+    a = q.enqueue({'n': 'a'})['job']['id']
+    time.sleep(0.002)
+    b = q.enqueue({'n': 'b'})['job']['id']
+    c = q.enqueue({'n': 'c'}, priority=5)['job']['id']
+    order = [q.claim()['id'] for _ in range(3)]
+    check('priority 큰 것 먼저, 같으면 먼저 들어온 것', order == [c, a, b], str(order))
+    check('더 없으면 None', q.claim() is None)
+
+    d1 = q.enqueue({'n': 'd'}, dedupe_key='k', dedupe_window=60)
+    d2 = q.enqueue({'n': 'd'}, dedupe_key='k', dedupe_window=60)
+    check('dedupe 재사용', d2['reused'] and d2['job']['id'] == d1['job']['id'])
+    full = q.enqueue({'n': 'e'})
+    check('live 가 max_live 면 queue_full', not full['queued'] and full['reason'] == 'queue_full',
+          str(full))
+    for j in q.jobs(statuses=('running',)):
+        q.complete(j['id'], {'ok': True})
+    check('끝난 뒤엔 다시 적재됨', q.enqueue({'n': 'e'})['queued'])
+    q.complete(d1['job']['id'])
+    check('끝난 job 은 dedupe 대상 아님',
+          not q.enqueue({'n': 'd'}, dedupe_key='k', dedupe_window=60)['reused'])
+
+
+def test_concurrency_lease():
+    print('=' * 72)
+    print('2. 동시 실행 상한·리스 만료')
+    print('=' * 72)
+    q = JobQueue('t_lease', concurrency=1, lease=0.2, max_attempts=2)
+    q.enqueue({'n': 1})
+    q.enqueue({'n': 2})
+    first = q.claim()
+    check('concurrency=1 이면 두 번째 claim 은 None', first is not None and q.claim() is None)
+    check('heartbeat 는 running 에만', q.heartbeat(first['id'], phase='x'))
+    check('state 병합', q.get(first['id'])['state'] == {'phase': 'x'})
+
+    time.sleep(0.3)
+    again = q.claim()
+    check('리스 만료 → 재적재 후 다시 집힘(우선 적재순)', again is not None and again['id'] == first['id'],
+          str(again and again['id']))
+    check('attempts 증가', again['attempts'] == 2)
+    time.sleep(0.3)
+    nxt = q.claim()
+    dead = q.get(first['id'])
+    check('시도 소진 후 리스 만료 → dead', dead['status'] == 'dead' and dead['error'] == 'lease_expired')
+    check('자리가 비어 다음 job 이 집힘', nxt is not None and nxt['payload'] == {'n': 2})
+    check('리스 잃은 job 의 heartbeat 는 False', not q.heartbeat(first['id']))
+
+
+def test_fail_backoff():
+    print('=' * 72)
+    print('3. 실패·백오프')
+    print('=' * 72)
+    q = JobQueue('t_fail', concurrency=None, max_attempts=3, backoff=0.2)
+    jid = q.enqueue({})['job']['id']
+    q.claim()
+    check('fail(retry) → queued', q.fail(jid, 'boom') == 'queued')
+    check('run_after 전에는 안 집힘', q.claim() is None)
+    time.sleep(0.25)
+    j = q.claim()
+    check('백오프 뒤 다시 집힘', j is not None and j['id'] == jid)
+    check('fail(retry=False) → error', q.fail(jid, 'nope', retry=False) == 'error')
+    check('error 메시지 보존', q.get(jid)['error'] == 'nope')
+    check('끝난 job 에 complete 는 no-op', not q.complete(jid, {'x': 1}))
+
+    jid = q.enqueue({})['job']['id']
+    for _ in range(3):
+        j = None
+        for _ in range(50):
+            j = q.claim()
+            if j:
+                break
+            time.sleep(0.05)
+        status = q.fail(j['id'], 'again')
+    check('시도 소진 → dead', status == 'dead' and q.get(jid)['status'] == 'dead')
+
+
+async def test_worker_wake():
+    print('=' * 72)
+    print('4. 워커 대기·깨우기')
+    print('=' * 72)
+    q = JobQueue('t_wake', concurrency=1, poll=5.0)
+    seen = []
+
+    async def handler(job):
+        seen.append(job['payload']['n'])
+        if job['payload']['n'] == 'bad':
+            raise JobFailed('bad input', retry=False)
+        return {'echo': job['payload']['n']}
+
+    task = asyncio.create_task(q.run_worker(handler))
+    await asyncio.sleep(0.1)
+    t0 = time.monotonic()
+    jid = q.enqueue({'n': 'hi'})['job']['id']
+    while not seen and time.monotonic() - t0 < 3:
+        await asyncio.sleep(0.01)
+    waited = time.monotonic() - t0
+    check('enqueue 가 poll(5s)을 기다리지 않고 깨움', seen == ['hi'] and waited < 1.0, f'{waited:.3f}s')
+    await asyncio.sleep(0.05)
+    check('handler 반환값이 result', q.get(jid)['result'] == {'echo': 'hi'})
+    bad = q.enqueue({'n': 'bad'})['job']['id']
+    for _ in range(100):
+        if q.get(bad)['status'] != 'queued' and q.get(bad)['status'] != 'running':
+            break
+        await asyncio.sleep(0.01)
+    check('JobFailed(retry=False) → error', q.get(bad)['status'] == 'error')
+    check('워커 틱 기록', (q.last_beat() or {}).get('state') in ('idle', f'running:{bad}'))
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+    check('next_job timeout → None', await q.next_job(timeout=0.1) is None)
+
+    st = q.stats()
+    check('stats: 상태별 개수', st['counts']['done'] == 1 and st['counts']['error'] == 1, str(st['counts']))
+    check('stats: 지연 표본·p50/p95', st['wait_samples'] == 2 and st['wait_p50'] is not None
+          and st['wait_p95'] >= st['wait_p50'], f"p50={st['wait_p50']} p95={st['wait_p95']}")
+
+
+async def test_lock_contention():
+    print('=' * 72)
+    print('4-1. 다른 프로세스가 쓰기 락을 쥐었을 때')
+    print('=' * 72)
+    q = JobQueue('t_lock', concurrency=1, poll=0.2)
+    jid = q.enqueue({'n': 'x'})['job']['id']
+    other = sqlite3.connect(db.DB_PATH, isolation_level=None)
+    other.execute('BEGIN IMMEDIATE')          # 다른 프로세스의 긴 쓰기 트랜잭션 흉내
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.5, other.execute, 'COMMIT')
+    gaps = []
+
+    async def ticker():
+        end = time.perf_counter() + 0.7
+        while time.perf_counter() < end:
+            t0 = time.perf_counter()
+            await asyncio.sleep(0.01)
+            gaps.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    job, _ = await asyncio.gather(q.next_job(timeout=3), ticker())
+    waited = time.perf_counter() - t0
+    other.close()
+    check('락이 풀린 뒤 claim', job is not None and job['id'] == jid and waited >= 0.45, f'{waited:.2f}s')
+    worst = max(gaps) * 1000
+    check('락 대기 동안 루프 지연 < 50ms', worst < 50, f'최대 {worst:.1f}ms')
+    await q.acomplete(job['id'], {'ok': True})
+    check('acomplete', q.get(jid)['status'] == 'done')
+
+
+def test_kwverdict_adapter():
+    print('=' * 72)
+    print('5. kwverdict 어댑터')
+    print('=' * 72)
+    from services import keyword_verdict_queue as kvq
+
+    check('빈 큐면 has_pending False', not kvq.has_pending())
+    r1 = kvq.enqueue('blog1', '강남 맛집', user_id=7)
+    r2 = kvq.enqueue('blog1', '강남 맛집', user_id=7)
+    check('같은 요청 재사용', r2['reused'] and r2['job_id'] == r1['job_id'])
+    check('has_pending True', kvq.has_pending())
+    job = kvq.claim()
+    check('예전 job 모양', job['job_id'] == r1['job_id'] and job['blog_id'] == 'blog1'
+          and job['status'] == 'running' and job['phase'] is None, str(job))
+    kvq.QUEUE.heartbeat(job['job_id'], phase='serp', progress={'done': 3})
+    check('phase·progress 노출', kvq.get_job(job['job_id'])['phase'] == 'serp'
+          and kvq.get_job(job['job_id'])['progress'] == {'done': 3})
+    db.finish(job['job_id'], 'dead', error='lease_expired')
+    check('dead 는 화면에 error 로', kvq.get_job(job['job_id'])['status'] == 'error')
+    check('has_pending False', not kvq.has_pending())
+
+
+if __name__ == '__main__':
+    test_order_dedupe_full()
+    test_concurrency_lease()
+    test_fail_backoff()
+    asyncio.run(test_worker_wake())
+    asyncio.run(test_lock_contention())
+    test_kwverdict_adapter()
+    print()
+    if failures:
+        print(f'FAILED {len(failures)}건: {failures}')
+        sys.exit(1)
+    print('전부 통과 — job queue')
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+연관도 매처 테스트 — services/keyword_relevance.py
+
+compile_relevance(...).score_many / explain_many 가 기준 구현(relevance_score / explain)과
+키워드 하나하나 같은 값을 내는지 본다.
+  - 손으로 고른 경계 사례(시드 포함 100, 시드에 포함 95, 앞 시드 우선, 짧은 시드 무시,
+    중복·빈 풀 토큰)
+  - 시드·키워드를 무작위로 만든 대조 수천 건
+  - 같은 (시드, 풀 토큰) 이면 같은 매처(캐시)
+
+실행: python flyio-backend/tests/test_keyword_relevance.py
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from services.keyword_relevance import compile_relevance, explain, relevance_score  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+def parity(seeds, pool, keywords):
+    """(점수 불일치, 설명 불일치) 첫 사례. 없으면 None."""
+    m = compile_relevance(seeds, pool)
+    for kw, got in zip(keywords, m.score_many(keywords)):
+        want = relevance_score(kw, seeds, pool)
+        if got != want:
+            return f'score {kw!r} seeds={seeds} pool={pool}: {got} != {want}'
+    e = compile_relevance(seeds)
+    for kw, got in zip(keywords, e.explain_many(keywords)):
+        want = explain(kw, seeds)
+        if got != want:
+            return f'explain {kw!r} seeds={seeds}: {got} != {want}'
+    return None
+
+
+SEEDS = ['오피스텔매매', '강남부동산', '전세', '월세대출', '원룸']
+KEYWORDS = [
+    '강남오피스텔매매', '오피스텔', '오피스텔분양', '강남 전세 시세', '전세', '세',
+    '부동산중개', '원룸월세', '포켓몬카드', '도박중독', '', '오', '대출이자',
+    '강남부동산매매추천', '월세', '매매가', '오피스텔매매강남부동산',
+]
+
+
+def cases():
+    print('=' * 72)
+    print('1. 경계 사례')
+    print('=' * 72)
+    m = compile_relevance(SEEDS)
+    check('시드 포함 → 100', m.score('강남오피스텔매매') == 100)
+    check('시드가 품음 → 95', m.score('오피스텔') == 95)
+    check('무관 → 0', m.score('도박중독') == 0)
+    check('빈 키워드 → 0', m.score('') == 0 and m.explain_one('')[0] == 0)
+    check('경계 사례 대조', parity(SEEDS, (), KEYWORDS) is None, parity(SEEDS, (), KEYWORDS) or '')
+
+    # 앞 시드가 95 를 주면 뒤 시드의 100 보다 먼저다 — 기준 구현의 루프 순서
+    order = ['오피스텔매매', '오피']
+    check('앞 시드 우선', compile_relevance(order).score('오피') == relevance_score('오피', order) == 95)
+    check('시드 순서가 바뀌면 결과도', compile_relevance(order[::-1]).score('오피') == 100)
+
+    short = ['강', '', None, '강남']
+    check('1글자·빈 시드 무시', parity(short, (), ['강', '강북', '강남역']) is None,
+          parity(short, (), ['강', '강북', '강남역']) or '')
+
+    pool = ('카드', '카드', '', '드')
+    check('중복·빈 풀 토큰도 기준과 같게', parity(['오피스텔'], pool, ['포켓몬카드', '카', '']) is None,
+          parity(['오피스텔'], pool, ['포켓몬카드', '카', '']) or '')
+
+    check('설명 — 3글자 이상 원자, 시드 순', m.explain_one('오피스텔분양') == explain('오피스텔분양', SEEDS),
+          m.explain_one('오피스텔분양'))
+
+    print()
+    print('=' * 72)
+    print('2. 캐시')
+    print('=' * 72)
+    check('같은 조합 → 같은 매처', compile_relevance(list(SEEDS)) is compile_relevance(tuple(SEEDS)))
+    check('풀 토큰이 다르면 다른 매처', compile_relevance(SEEDS, ('카드',)) is not compile_relevance(SEEDS))
+
+
+def fuzz():
+    print()
+    print('=' * 72)
+    print('3. 무작위 대조')
+    print('=' * 72)
+    rng = random.Random(20261016)
+    alphabet = '가나다라마바사아자차'           # 작은 글자 집합 — 겹침·부분 매칭이 자주 나도록
+    word = lambda lo, hi: ''.join(rng.choice(alphabet) for _ in range(rng.randint(lo, hi)))  # noqa: E731
+    bad = None
+    n = 0
+    for _ in range(300):
+        seeds = [word(0, 7) for _ in range(rng.randint(0, 8))]
+        pool = tuple(word(0, 3) for _ in range(rng.randint(0, 4)))
+        keywords = [word(0, 10) for _ in range(20)]
+        n += len(keywords)
+        bad = parity(seeds, pool, keywords)
+        if bad:
+            break
+    check(f'무작위 {n}건 점수·설명 일치', bad is None, bad or '')
+
+
+if __name__ == '__main__':
+    cases()
+    fuzz()
+    print()
+    if failures:
+        print(f'FAILED {len(failures)}건: {failures}')
+        sys.exit(1)
+    print('전부 통과 — keyword relevance')
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 검색량 서비스 테스트 — services/keyword_volume.py + database/keyword_volume_db.py
+
+가짜 클라이언트(get_keywords_volume_batch 만 있는)로 다음을 본다.
+  - 동시에 들어온 단일 키워드 조회가 5개씩 한 콜로 묶이는지
+  - 이미 묻고 있는 키워드는 다시 묻지 않는지(in-flight 합치기)
+  - 응답에 딸려 온 relKeyword·없는 힌트(음수)가 캐시돼 다음 조회가 0콜인지
+  - 실패한 배치는 캐시하지 않고 다음에 다시 묻는지
+네트워크 없이 임시 DATA_DIR 에서 돈다.
+
+실행: python flyio-backend/tests/test_keyword_volume.py
+"""
+import asyncio
+import os
+import sys
+import tempfile
+
+os.environ['DATA_DIR'] = tempfile.mkdtemp()
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from services import keyword_volume as KV  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+class FakeClient:
+    """힌트마다 자기 자신 + 연관어 '<힌트>후기' 를 돌려준다. '없는' 이 들어간 힌트는 응답에 없다."""
+
+    def __init__(self, fail_calls=()):
+        self.customer_id, self.api_key = 'test', 'test'
+        self.calls = []
+        self.fail_calls = set(fail_calls)
+
+    async def get_keywords_volume_batch(self, hints):
+        self.calls.append(list(hints))
+        await asyncio.sleep(0.01)
+        if len(self.calls) in self.fail_calls:
+            raise RuntimeError('keywordstool 429')
+        out = {}
+        for h in hints:
+            if '없는' in h:
+                continue
+            out[h] = {'monthly_pc': 10, 'monthly_mobile': 90, 'monthly_total': 100, 'comp_idx': '중간'}
+            out[f'{h}후기'] = {'monthly_pc': 1, 'monthly_mobile': 29, 'monthly_total': 30, 'comp_idx': '낮음'}
+        return out
+
+
+async def main():
+    print('=' * 72)
+    print('1. 동시 단일 키워드 조회 → 5개씩 합쳐진 콜')
+    print('=' * 72)
+    client = FakeClient()
+    kws = [f'키워드 {i}' for i in range(12)]
+    res = await asyncio.gather(*(KV.lookup([k], client=client) for k in kws))
+    sizes = [len(c) for c in client.calls]
+    check('12건 → 3콜 [5, 5, 2]', sizes == [5, 5, 2], f'{sizes}')
+    check('각 호출자가 자기 키워드 검색량을 받음',
+          all(r[k]['monthly_total'] == 100 for r, k in zip(res, kws)))
+    sent = sorted(h for c in client.calls for h in c)
+    check('힌트는 공백 제거 형태로 전송', sent == sorted(k.replace(' ', '') for k in kws), f'{sent[:3]}')
+
+    print()
+    print('=' * 72)
+    print('2. 같은 키워드 동시 조회 → 한 번만')
+    print('=' * 72)
+    client = FakeClient()
+    res = await asyncio.gather(*(KV.lookup(['제주 맛집'], client=client) for _ in range(10)),
+                               KV.lookup(['제주맛집', '제주 맛집'], client=client))
+    check('10+1 호출 → 1콜·힌트 1개', [len(c) for c in client.calls] == [1], f'{client.calls}')
+    check('공백 변형 키도 같은 결과', res[-1]['제주맛집'] == res[-1]['제주 맛집'] == res[0]['제주 맛집'])
+
+    print()
+    print('=' * 72)
+    print('3. 캐시 — relKeyword 행·음수 결과 재사용')
+    print('=' * 72)
+    client = FakeClient()
+    first = await KV.lookup(['서울 카페', '없는 키워드'], client=client)
+    check('없는 키워드는 None(검색량 없음)', first.get('없는 키워드', 'missing') is None, f'{first}')
+    again = await KV.lookup(['서울카페후기', '없는 키워드', '서울 카페'], client=client)
+    check('relKeyword·음수·힌트 모두 캐시 적중 → 추가 콜 0', len(client.calls) == 1, f'{client.calls}')
+    check('딸려 온 연관어 검색량', (again.get('서울카페후기') or {}).get('monthly_total') == 30)
+
+    print()
+    print('=' * 72)
+    print('4. 실패한 배치는 캐시하지 않는다')
+    print('=' * 72)
+    client = FakeClient(fail_calls={1})
+    got = await KV.lookup(['부산 호텔'], client=client)
+    check('실패 → 결과에서 빠짐(모름)', '부산 호텔' not in got, f'{got}')
+    try:
+        await KV.lookup(['대구 숙소'], client=FakeClient(fail_calls={1}), raise_errors=True)
+        raised = False
+    except RuntimeError:
+        raised = True
+    check('raise_errors=True 면 예외', raised)
+    got = await KV.lookup(['부산 호텔'], client=client)
+    check('다음 조회에서 다시 물어 성공', got.get('부산 호텔', {}).get('monthly_total') == 100
+          and len(client.calls) == 2, f'{client.calls}')
+
+    print()
+    print('=' * 72)
+    print('5. related — 시드 + 연관어 전부, 배치 캐시')
+    print('=' * 72)
+    await KV.clear_cache()
+    client = FakeClient()
+    rows = await KV.related(['강릉 여행', '속초 여행'], client=client)
+    check('시드·연관어 4행', set(rows) == {'강릉여행', '강릉여행후기', '속초여행', '속초여행후기'},
+          f'{sorted(rows)}')
+    await KV.related(['강릉 여행', '속초 여행'], client=client)
+    looked = await KV.lookup(['속초여행후기'], client=client)
+    check('같은 배치 재조회·lookup 모두 콜 없음', len(client.calls) == 1
+          and looked['속초여행후기']['monthly_total'] == 30, f'{client.calls}')
+
+    print()
+    print('=' * 72)
+    print('6. volume_stats (/api/admin/keyword-volume)')
+    print('=' * 72)
+    st = KV.volume_stats()
+    check('카운터 집계', st['calls'] >= 1 and st['lookups'] >= 1 and st['related_batch_hits'] >= 1, f'{st}')
+    check('레인 상태', st['inflight'] == 0 and all(not l['queued'] for l in st['lanes']), f"{st['lanes']}")
+
+
+asyncio.run(main())
+print()
+if failures:
+    print(f'FAILED {len(failures)}건: {failures}')
+    sys.exit(1)
+print('전부 통과 — keyword volume')
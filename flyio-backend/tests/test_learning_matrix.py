@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+열 단위 스코어러 패리티 테스트 — services/learning_matrix.py
+
+벡터 경로(calculate_predicted_scores)는 샘플별 calculate_blog_score 루프
+(calculate_predicted_scores_scalar)와 **같은 점수**를 내야 한다.
+학습 결과가 스코어러 구현에 따라 달라지면 안 되기 때문이다.
+
+실행: python flyio-backend/tests/test_learning_matrix.py
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np  # noqa: E402
+
+from services.learning_engine import (  # noqa: E402
+    DEFAULT_WEIGHTS,
+    calculate_blog_score,
+    calculate_predicted_scores,
+    calculate_predicted_scores_scalar,
+)
+from services.learning_matrix import (  # noqa: E402
+    WEIGHT_KEYS,
+    build_feature_matrix,
+    flatten_weights,
+    score_matrix,
+)
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+rng = random.Random(20241016)
+
+
+def maybe(value, p_none=0.2, p_zero=0.1):
+    """스칼라 경로의 `or` 규칙이 걸리는 None / 0 을 섞는다."""
+    r = rng.random()
+    if r < p_none:
+        return None
+    if r < p_none + p_zero:
+        return 0
+    return value
+
+
+def random_sample(i):
+    return {
+        'keyword': f'kw{i % 7}',
+        'blog_id': f'blog{i}',
+        'actual_rank': i % 10 + 1,
+        'c_rank_score': maybe(rng.uniform(0, 100)),
+        'dia_score': maybe(rng.uniform(0, 100)),
+        'post_count': maybe(rng.randint(0, 3000)),
+        'neighbor_count': maybe(rng.randint(0, 5000)),
+        'visitor_count': maybe(rng.randint(0, 10000)),
+        'context_score': maybe(rng.uniform(0, 100), p_none=0.5),
+        'content_score': maybe(rng.uniform(0, 100)),
+        'chain_score': maybe(rng.uniform(0, 100)),
+        'depth_score': maybe(rng.uniform(0, 100), p_none=0.5),
+        'information_score': maybe(rng.uniform(0, 100)),
+        'accuracy_score': maybe(rng.uniform(0, 100)),
+        'content_length': maybe(rng.randint(0, 8000)),
+        'heading_count': maybe(rng.randint(0, 20)),
+        'paragraph_count': maybe(rng.randint(0, 40)),
+        'image_count': maybe(rng.randint(0, 30)),
+        'keyword_count': maybe(rng.randint(0, 25)),
+        'keyword_density': maybe(rng.choice([0.3, 1.0, 1.5, 1.6, 3.0, 6.0, rng.uniform(0, 5)])),
+        'post_age_days': maybe(rng.choice([0, 1, 2, 7, 8, 30, 31, 90, 91, 180, 181, 999])),
+        'title_has_keyword': maybe(rng.choice([True, False, 1, 0])),
+        'has_map': maybe(rng.choice([True, False, 1, 0])),
+        'has_link': maybe(rng.choice([True, False])),
+        'video_count': maybe(rng.randint(0, 6)),
+        'like_count': maybe(rng.randint(0, 80)),
+        'comment_count': maybe(rng.randint(0, 40)),
+    }
+
+
+samples = [random_sample(i) for i in range(2000)]
+# 키가 아예 없는 샘플(.get 기본값 경로)
+samples.append({'keyword': 'kw0', 'blog_id': 'empty', 'actual_rank': 1})
+
+print('=' * 72)
+print('1. 기본 가중치에서 스칼라 경로와 같은 점수')
+print('=' * 72)
+scalar = calculate_predicted_scores_scalar(samples, DEFAULT_WEIGHTS)
+vector = calculate_predicted_scores(samples, DEFAULT_WEIGHTS)
+check('shape 일치', scalar.shape == vector.shape, f'{scalar.shape} vs {vector.shape}')
+diff = float(np.max(np.abs(scalar - vector)))
+check('최대 오차 1e-9 이하', diff <= 1e-9, f'max|Δ|={diff:.3g}')
+
+print()
+print('=' * 72)
+print('2. 임의 가중치 · 키가 빠진 가중치에서도 일치')
+print('=' * 72)
+for trial in range(5):
+    w = {
+        'c_rank': {'weight': rng.uniform(0, 1),
+                   'sub_weights': {k: rng.uniform(0, 1) for k in ['context', 'content', 'chain']}},
+        'dia': {'weight': rng.uniform(0, 1),
+                'sub_weights': {k: rng.uniform(0, 1) for k in ['depth', 'information', 'accuracy']}},
+        'content_factors': {'weight': rng.uniform(0, 1),
+                            'sub_weights': {k: rng.uniform(0, 1)
+                                            for k in DEFAULT_WEIGHTS['content_factors']['sub_weights']}},
+        'bonus_factors': {k: rng.uniform(0, 0.2) for k in DEFAULT_WEIGHTS['bonus_factors']},
+    }
+    d = float(np.max(np.abs(calculate_predicted_scores_scalar(samples, w)
+                            - calculate_predicted_scores(samples, w))))
+    check(f'임의 가중치 #{trial}', d <= 1e-9, f'max|Δ|={d:.3g}')
+
+sparse = {'c_rank': {'weight': 0.4}, 'content_factors': {'sub_weights': {'freshness': 0.5}}}
+d = float(np.max(np.abs(calculate_predicted_scores_scalar(samples, sparse)
+                        - calculate_predicted_scores(samples, sparse))))
+check('누락 키는 스칼라 경로 기본값', d <= 1e-9, f'max|Δ|={d:.3g}')
+d = float(np.max(np.abs(calculate_predicted_scores_scalar(samples, {})
+                        - calculate_predicted_scores(samples, {}))))
+check('빈 가중치 dict', d <= 1e-9, f'max|Δ|={d:.3g}')
+
+print()
+print('=' * 72)
+print('3. 행렬 재사용 · 여러 가중치 동시 채점')
+print('=' * 72)
+fm = build_feature_matrix(samples)
+w0 = flatten_weights(DEFAULT_WEIGHTS)
+check('가중치 벡터 길이 = WEIGHT_KEYS', w0.shape == (len(WEIGHT_KEYS),))
+batch = score_matrix(fm, np.stack([w0, w0 * 2]))
+check('(k, p) 입력 → (k, n) 출력', batch.shape == (2, len(samples)))
+check('0번 행 = 단일 채점', np.allclose(batch[0], score_matrix(fm, w0), rtol=0, atol=1e-9))
+one = calculate_blog_score({'context_score': 0, 'content_score': 80}, DEFAULT_WEIGHTS)
+got = calculate_predicted_scores([{'context_score': 0, 'content_score': 80}], DEFAULT_WEIGHTS)[0]
+check('`0 or 50` 규칙 재현', abs(one - got) <= 1e-9, f'{one} vs {got}')
+
+print()
+if failures:
+    print(f'FAILED {len(failures)}건: {failures}')
+    sys.exit(1)
+print('전부 통과 — 벡터 스코어러 = 스칼라 스코어러')
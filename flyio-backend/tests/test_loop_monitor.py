@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+이벤트 루프 감시 테스트 — services/loop_monitor.py
+
+짧은 간격(표본 50ms, 정체 문턱 150ms)으로 다음을 본다.
+  - 평소 지연은 문턱 아래, 정체 0건
+  - 루프를 막는 동기 호출(time.sleep)이 호출 지점(이 파일의 함수)으로 집계되는지
+  - APScheduler job 안에서 막으면 그 job 으로도 집계되는지(track_scheduler)
+  - 최근 정체·공유 캐시로 올린 프로세스 요약
+  - 감시를 켜 둔 비용(쉬는 루프의 CPU)
+
+실행: python flyio-backend/tests/test_loop_monitor.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+os.environ['LOOP_MONITOR_INTERVAL'] = '0.05'
+os.environ['LOOP_MONITOR_THRESHOLD'] = '0.15'
+os.environ['LOOP_MONITOR_SAMPLE_EVERY'] = '0.05'
+os.environ['LOOP_MONITOR_PUBLISH_EVERY'] = '0.2'
+os.environ['SHARED_CACHE_BACKEND'] = 'memory'
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from services import loop_monitor as lm  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+def _parse_blocking(sec):
+    time.sleep(sec)
+
+
+def _sqlite_blocking(sec):
+    time.sleep(sec)
+
+
+async def _job_tick():
+    _sqlite_blocking(0.5)
+
+
+async def main():
+    print('=' * 72)
+    print('1. 평소 지연')
+    print('=' * 72)
+    check('시작', lm.start_loop_monitor('app'))
+    check('두 번 불러도 한 번', lm.start_loop_monitor('app') and lm._mon.thread is not None)
+    await asyncio.sleep(0.6)
+    st = lm.loop_stats()
+    check('지연 표본 쌓임', st['lag']['samples'] >= 8, str(st['lag']))
+    check('정체 없음', st['stalls']['count'] == 0 and st['lag']['p99'] < lm.THRESHOLD, str(st['lag']))
+
+    print('=' * 72)
+    print('2. 막은 호출 지점')
+    print('=' * 72)
+    _parse_blocking(0.6)
+    await asyncio.sleep(0.1)
+    _parse_blocking(0.4)
+    await asyncio.sleep(0.1)
+    _sqlite_blocking(0.3)
+    await asyncio.sleep(0.1)
+    st = lm.loop_stats()
+    sites = [b['site'] for b in st['top_blockers']]
+    check('정체 3건', st['stalls']['count'] == 3, str(st['stalls']))
+    check('가장 오래 막은 지점이 맨 위', sites and '_parse_blocking' in sites[0]
+          and sites[0].startswith(os.path.join('tests', 'test_loop_monitor.py')), str(sites))
+    top = st['top_blockers'][0]
+    check('지점별 정체 횟수·최대', top['stalls'] == 2 and 0.55 < top['max_stall'] < 1.0,
+          f"stalls={top['stalls']} max={top['max_stall']}")
+    check('예시 스택에 호출자(main)', any(' main' in f for f in top['stack']), str(top['stack'][:4]))
+    check('p99 가 정체를 반영', st['lag']['max'] > 0.5, str(st['lag']))
+    check('최근 정체(최신 먼저)', st['recent'][0]['site'].endswith('_sqlite_blocking')
+          and len(st['recent']) == 3, str(st['recent'][:1]))
+
+    print('=' * 72)
+    print('3. APScheduler job 별')
+    print('=' * 72)
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    sched = AsyncIOScheduler()
+    sched.start()
+    lm.track_scheduler(sched)
+    sched.add_job(_job_tick, id='keyword_pool_collect')
+    await asyncio.sleep(0.9)
+    st = lm.loop_stats()
+    jobs = {j['job']: j for j in st['jobs']}
+    check('job 으로 집계', 'keyword_pool_collect' in jobs and jobs['keyword_pool_collect']['stalls'] == 1,
+          str(st['jobs']))
+    site = next(b for b in st['top_blockers'] if b['site'].endswith('_sqlite_blocking'))
+    check('지점에도 job 표시', 'keyword_pool_collect' in site['jobs'], str(site['jobs']))
+    sched.shutdown(wait=False)
+
+    print('=' * 72)
+    print('4. 프로세스 요약 공유')
+    print('=' * 72)
+    await asyncio.sleep(0.5)
+    snaps = lm.process_snapshots()
+    check('app 요약이 공유 캐시에', [s['process'] for s in snaps] == ['app'], str([s.get('process') for s in snaps]))
+    check('요약엔 스택 빼고 올림', snaps and all('stack' not in b for b in snaps[0]['top_blockers']))
+
+    print('=' * 72)
+    print('5. 비용')
+    print('=' * 72)
+
+    # 쉬는 루프에서 감시만 돌 때의 CPU — 이 테스트는 표본 간격이 프로덕션(0.25s)의 1/5 이다.
+    lm.start_loop_monitor()
+    await asyncio.sleep(0.1)
+    c0, t0 = time.process_time(), time.perf_counter()
+    await asyncio.sleep(1.0)
+    cpu = (time.process_time() - c0) / (time.perf_counter() - t0)
+    lm.stop_loop_monitor()
+    check('감시 CPU < 2%', cpu < 0.02, f'{cpu * 100:.2f}%')
+    check('stop 후 감시 스레드 종료', lm._mon.thread is None)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
+    print()
+    if failures:
+        print(f'FAILED {len(failures)}건: {failures}')
+        sys.exit(1)
+    print('전부 통과 — loop monitor')
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 내 캐시 테스트 — services/memory_cache.py
+
+LRU 순서·TTL·바이트 상한·single-flight 가 routers/blogs.py 의 예전 dict 캐시를
+대체할 만큼 정확한지 본다. 네트워크·DB 없이 돈다.
+
+실행: python flyio-backend/tests/test_memory_cache.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from services.memory_cache import MemoryCache  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+print('=' * 72)
+print('1. LRU 축출 · TTL')
+print('=' * 72)
+c = MemoryCache('t', max_entries=3, ttl=60)
+for k in 'abc':
+    c.set(k, k.upper())
+c.get('a')                      # a 를 최근으로
+c.set('d', 'D')                 # 가장 오래 안 쓴 b 가 빠져야 한다
+check('가장 오래 안 쓴 항목만 축출', 'b' not in c and all(k in c for k in 'acd'))
+check('축출 카운터', c.evictions == 1, str(c.evictions))
+c.set('e', 'E', ttl=0.01)
+time.sleep(0.02)
+check('항목별 TTL 만료', c.get('e') is None and c.expirations == 1)
+check('없는 키는 default', c.get('zz', 'dflt') == 'dflt')
+
+print()
+print('=' * 72)
+print('2. 바이트 상한')
+print('=' * 72)
+b = MemoryCache('b', max_entries=100, max_bytes=100, ttl=60)
+b.set('x', 'a' * 40)
+b.set('y', 'b' * 40)
+b.set('z', 'c' * 40)            # 합계 > 100 → x 축출
+check('바이트 초과 시 오래된 것부터 축출', 'x' not in b and 'y' in b and 'z' in b)
+check('바이트 합계 유지', b.stats()['bytes'] <= 100, str(b.stats()['bytes']))
+b.set('huge', 'h' * 500)
+check('상한보다 큰 단일 항목은 담지 않음', 'huge' not in b and 'y' in b)
+
+print()
+print('=' * 72)
+print('3. single-flight')
+print('=' * 72)
+
+
+async def flight():
+    sf = MemoryCache('sf', max_entries=10, ttl=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {'v': len(calls)}
+
+    got = await asyncio.gather(*[sf.get_or_load('blog', loader) for _ in range(20)])
+    check('동시 20건 → 로더 1회', len(calls) == 1, f'{len(calls)}회')
+    check('모두 같은 결과', all(g == {'v': 1} for g in got))
+    check('coalesced 카운터', sf.coalesced == 19, str(sf.coalesced))
+    again = await sf.get_or_load('blog', loader)
+    check('이후 호출은 캐시 적중', again == {'v': 1} and len(calls) == 1)
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise RuntimeError('x')
+
+    res = await asyncio.gather(*[sf.get_or_load('err', boom) for _ in range(5)],
+                               return_exceptions=True)
+    check('로더 예외는 대기자 모두에게 전파', all(isinstance(r, RuntimeError) for r in res))
+    check('실패는 캐시하지 않음', 'err' not in sf)
+
+    # 로더를 돌리던 요청이 취소돼도 대기자는 이어받아 값을 얻는다.
+    slow_calls = []
+
+    async def slow():
+        slow_calls.append(1)
+        await asyncio.sleep(0.05)
+        return 'ok'
+
+    leader = asyncio.ensure_future(sf.get_or_load('s', slow))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(sf.get_or_load('s', slow))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    check('리더 취소 후 대기자가 이어받음', await follower == 'ok' and len(slow_calls) == 2)
+
+    fk = await asyncio.gather(sf.get_or_load('k', loader, store=False, flight_key=('k', 1)),
+                              sf.get_or_load('k', loader, store=False, flight_key=('k', 2)))
+    check('flight_key 가 다르면 합치지 않음', len(calls) == 3, f'{len(calls)}회, {fk}')
+
+
+asyncio.run(flight())
+
+print()
+if failures:
+    print(f'FAILED {len(failures)}건: {failures}')
+    sys.exit(1)
+print('전부 통과 — MemoryCache')
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+네이버 API 속도 조절기 테스트 — services/naver_rate_governor.py
+
+  - 버킷 속도대로 토큰이 나가는지 (버스트 뒤에는 1/rate 간격)
+  - 기다리는 줄에서 INTERACTIVE 가 BULK 를 앞지르는지
+  - 429 → 속도 절반·정지, 성공 → 점진 복구
+  - 취소된 대기자가 줄을 막지 않는지
+  - NaverAdApiClient._request 가 429 를 버킷에 알리고 재시도하는지 (httpx MockTransport)
+
+실행: python flyio-backend/tests/test_naver_rate_governor.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import httpx  # noqa: E402
+
+from services import naver_rate_governor as G  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+async def main():
+    print('=' * 72)
+    print('1. 속도 — 버스트 2, 초당 20')
+    print('=' * 72)
+    b = G.TokenBucket('c1', 'keywordstool', rate=20.0, burst=2.0)
+    t0 = time.monotonic()
+    await asyncio.gather(*(b.acquire(G.BULK) for _ in range(12)))
+    took = time.monotonic() - t0
+    check('12개 ≈ (12-2)/20 = 0.5s', 0.42 <= took <= 0.75, f'{took:.3f}s')
+    check('처리 수 집계', b.stats()['granted']['bulk'] == 12)
+
+    print()
+    print('=' * 72)
+    print('2. 우선순위 — 줄 선 BULK 를 INTERACTIVE 가 앞지른다')
+    print('=' * 72)
+    b = G.TokenBucket('c1', 'stats', rate=20.0, burst=1.0)
+    order = []
+
+    async def job(tag, prio, delay=0.0):
+        await asyncio.sleep(delay)
+        await b.acquire(prio)
+        order.append(tag)
+
+    await asyncio.gather(*(job(f'b{i}', G.BULK) for i in range(8)),
+                         job('user', G.INTERACTIVE, delay=0.06))
+    pos = order.index('user')
+    check('사용자 호출이 남은 BULK 보다 먼저', pos <= 3, f'{order}')
+
+    with G.api_priority(G.BULK):
+        inner = G.current_priority()
+        with G.background_job():
+            kept = G.current_priority()
+    with G.background_job():
+        lowered = G.current_priority()
+    check('contextvar 우선순위 · background_job 은 낮추기만',
+          (inner, kept, lowered, G.current_priority()) == (G.BULK, G.BULK, G.NORMAL, G.INTERACTIVE))
+
+    print()
+    print('=' * 72)
+    print('3. 429 적응')
+    print('=' * 72)
+    b = G.TokenBucket('c1', 'ncc_write', rate=10.0, burst=5.0)
+    b.penalize(retry_after=0.2)
+    st = b.stats()
+    check('속도 절반·토큰 비움', st['rate'] == 5.0 and st['tokens'] == 0 and st['throttled'] == 1, f'{st}')
+    t0 = time.monotonic()
+    await b.acquire()
+    check('Retry-After 동안 멈춤', time.monotonic() - t0 >= 0.2, f'{time.monotonic() - t0:.3f}s')
+    for _ in range(100):
+        b.reward()
+    check('성공이 쌓이면 원래 속도', b.stats()['rate'] == 10.0)
+    for _ in range(10):
+        b.penalize(retry_after=0.001)
+    check('바닥 속도 유지', b.rate == 10.0 * G.MIN_RATE_FRACTION, f'{b.rate}')
+
+    print()
+    print('=' * 72)
+    print('4. 취소된 대기자는 줄에서 빠진다')
+    print('=' * 72)
+    b = G.TokenBucket('c1', 'estimate', rate=5.0, burst=1.0)
+    await b.acquire()
+    waiter = asyncio.ensure_future(b.acquire())
+    await asyncio.sleep(0.02)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    check('줄 비었음', not b._queue)
+    t0 = time.monotonic()
+    await b.acquire()
+    check('다음 호출은 토큰 한 개 시간만', time.monotonic() - t0 < 0.3, f'{time.monotonic() - t0:.3f}s')
+
+    print()
+    print('=' * 72)
+    print('5. 묶음 분류·버킷 공유')
+    print('=' * 72)
+    cases = {('GET', '/keywordstool?hintKeywords=a'): 'keywordstool', ('GET', '/stats'): 'stats',
+             ('POST', '/stat-reports'): 'report', ('POST', '/estimate/average-position-bid/keyword'): 'estimate',
+             ('PUT', '/ncc/keywords/nkw-1?fields=bidAmt'): 'ncc_write', ('GET', '/ncc/adgroups'): 'ncc_read',
+             ('GET', '/billing/bizmoney'): 'default'}
+    got = {k: G.rate_family(*k) for k in cases}
+    check('rate_family', got == cases, f'{got}')
+    G.reset_governor()
+    check('계정·묶음당 버킷 하나', G.get_bucket('9', 'stats') is G.get_bucket(9, 'stats')
+          and G.get_bucket('9', 'stats') is not G.get_bucket('8', 'stats'))
+
+    print()
+    print('=' * 72)
+    print('6. _request — 429 를 버킷에 알리고 재시도')
+    print('=' * 72)
+    from services.naver_ad_service import NaverAdApiClient
+    G.reset_governor()
+    hits = []
+
+    def handler(request):
+        hits.append(time.monotonic())
+        if len(hits) == 1:
+            return httpx.Response(429, headers={'Retry-After': '0.3'}, text='rate limited')
+        return httpx.Response(200, json={'keywordList': []})
+
+    api = NaverAdApiClient()
+    api.customer_id, api.api_key, api.secret_key = 'gov-test', 'k', 's'
+    await api.client.aclose()
+    api.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    resp = await api._request('GET', '/keywordstool', {'hintKeywords': 'a'})
+    await api.client.aclose()
+    st = G.get_bucket('gov-test', 'keywordstool').stats()
+    check('재시도 후 성공', resp == {'keywordList': []} and len(hits) == 2, f'{len(hits)}콜')
+    check('Retry-After 만큼 띄운 재시도', hits[1] - hits[0] >= 0.3, f'{hits[1] - hits[0]:.3f}s')
+    check('버킷에 429 기록', st['throttled'] == 1 and st['rate'] < st['base_rate'], f'{st}')
+
+
+asyncio.run(main())
+print()
+if failures:
+    print(f'FAILED {len(failures)}건: {failures}')
+    sys.exit(1)
+print('전부 통과 — naver rate governor')
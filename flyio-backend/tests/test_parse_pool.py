@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+파싱 워커 풀 테스트 — services/parse_pool.py + services/post_features.py
+
+  - post_features 가 PostView JSON·모바일 글 페이지에서 analyze_post 와 같은 피처를 뽑는지
+  - 워커 프로세스(run_parse)에서 돌린 결과가 그 자리에서 돌린 결과와 같은지
+  - PARSE_WORKERS=0 이면 풀 없이 인라인으로 도는지
+  - 파싱 중에도 이벤트 루프가 멈추지 않는지(틱 간격)
+를 본다.
+
+실행: python flyio-backend/tests/test_parse_pool.py
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from services import parse_pool  # noqa: E402
+from services import post_features as PF  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'serp')
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+BASE = {
+    "post_url": "https://blog.naver.com/tester/223700000001", "keyword": "강남 맛집",
+    "title_has_keyword": False, "title_keyword_position": -1, "content_length": 0,
+    "image_count": 0, "video_count": 0, "keyword_count": 0, "keyword_density": 0.0,
+    "like_count": 0, "comment_count": 0, "post_age_days": None, "has_map": False,
+    "has_link": False, "heading_count": 0, "paragraph_count": 0, "data_fetched": False,
+    "fetch_method": None,
+}
+
+CONTENT = (
+    '<h3>강남 맛집 소개</h3><p class="se-text-paragraph">' + '강남맛집 정말 좋아요 ' * 20 + '</p>'
+    '<p>두 번째 문단</p><img src="https://postfiles.pstatic.net/a.jpg">'
+    '<a href="https://example.com/x">외부</a><div class="se-map">지도</div>'
+)
+STATE = {"post": {"post": {
+    "title": "강남 맛집 베스트", "content": CONTENT, "videoCount": 1,
+    "sympathyCount": 7, "commentCount": 3, "addDate": "2026.01.02",
+}}}
+POSTVIEW = (
+    '<html><body><script>window.__PRELOADED_STATE__ = '
+    + json.dumps(STATE, ensure_ascii=False) + ';</script></body></html>'
+).encode('utf-8')
+
+
+mobile = b''
+
+
+def pure():
+    global mobile
+    print('=' * 72)
+    print('1. post_features — 순수 함수')
+    print('=' * 72)
+    state = PF.parse_postview(POSTVIEW, 'utf-8', '강남 맛집', BASE)
+    a = state["analysis"]
+    check('입력 dict 는 건드리지 않는다', BASE["fetch_method"] is None and BASE["heading_count"] == 0)
+    check('json_preload', a["fetch_method"] == "json_preload", a["fetch_method"])
+    check('제목', state["title_text"] == "강남 맛집 베스트")
+    check('소제목·문단', a["heading_count"] == 1 and a["paragraph_count"] == 3,
+          f'{a["heading_count"]}, {a["paragraph_count"]}')
+    check('지도·외부링크·이미지', a["has_map"] and a["has_link"] and a["image_count"] == 1)
+    check('공감·댓글·동영상', (a["like_count"], a["comment_count"], a["video_count"]) == (7, 3, 1))
+    check('작성일', isinstance(a["post_age_days"], int) and a["post_age_days"] > 0)
+    check('본문이 충분하면 모바일 페이지 불필요', not PF.need_page(state), len(state["content_text"]))
+
+    page = PF.parse_post_page(POSTVIEW, 'utf-8', '강남 맛집', state)
+    p = page["analysis"]
+    check('제목 키워드 맨앞', p["title_has_keyword"] and p["title_keyword_position"] == 0)
+    check('content_length·keyword_density', p["content_length"] > 0 and p["keyword_density"] > 0
+          and p["data_fetched"], f'{p["content_length"]}, {p["keyword_density"]}')
+
+    broken = PF.parse_postview(b'<script>__PRELOADED_STATE__ = {broken;</script>', None, 'x', BASE)
+    check('깨진 JSON → 빈 상태', broken["content_text"] == "" and PF.need_page(broken))
+
+    with open(os.path.join(FIXTURES, 'blog_post_mobile.html'), encoding='utf-8') as f:
+        mobile = f.read().encode('utf-8')
+    m = PF.parse_post_page(mobile, 'utf-8', '맛집', {"analysis": BASE, "content_text": "", "title_text": ""})
+    check('모바일 페이지 본문', m["analysis"]["data_fetched"] and m["analysis"]["content_length"] > 0,
+          m["analysis"]["fetch_method"])
+
+
+
+async def scenario():
+    print()
+    print('=' * 72)
+    print('2. run_parse — 워커 프로세스')
+    print('=' * 72)
+    inline = PF.parse_post_page(mobile, 'utf-8', '맛집', {"analysis": BASE, "content_text": "", "title_text": ""})
+    pooled = await parse_pool.run_parse(
+        PF.parse_post_page, mobile, 'utf-8', '맛집', {"analysis": BASE, "content_text": "", "title_text": ""})
+    check('워커 결과 == 인라인 결과', pooled == inline)
+
+    # 파싱 여러 건이 도는 동안 루프 틱 간격 — 워커로 나갔으면 수 ms 안쪽이어야 한다
+    gaps = []
+
+    async def ticker(stop):
+        last = time.perf_counter()
+        while not stop.is_set():
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    stop = asyncio.Event()
+    t = asyncio.create_task(ticker(stop))
+    await asyncio.gather(*[
+        parse_pool.run_parse(PF.parse_postview, POSTVIEW * 50, 'utf-8', '강남 맛집', BASE)
+        for _ in range(16)
+    ])
+    stop.set()
+    await t
+    check('루프가 멈추지 않음', gaps and max(gaps) < 0.5, f'max gap {max(gaps) * 1000:.0f}ms')
+    check('풀로 제출됨', parse_pool.parse_pool_stats()["submitted"] >= 17, parse_pool.parse_pool_stats())
+
+    parse_pool.shutdown_parse_pool()
+    check('shutdown 후 stats', parse_pool.parse_pool_stats()["started"] is False)
+
+    workers = parse_pool.PARSE_WORKERS
+    parse_pool.PARSE_WORKERS = 0
+    try:
+        before = parse_pool.parse_pool_stats()["inline"]
+        r = await parse_pool.run_parse(PF.need_page, {"content_text": ""})
+        check('PARSE_WORKERS=0 → 인라인', r is True and parse_pool.parse_pool_stats()["inline"] == before + 1)
+    finally:
+        parse_pool.PARSE_WORKERS = workers
+
+
+if __name__ == '__main__':
+    pure()
+    asyncio.run(scenario())
+    print()
+    if failures:
+        print(f'FAILED {len(failures)}건: {failures}')
+        sys.exit(1)
+    print('전부 통과 — parse pool')
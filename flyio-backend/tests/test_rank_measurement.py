@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 중심 순위 측정 테스트 — services/rank_measurement.measure_keywords
+
+SERP 조회만 가짜로 바꾼 RankChecker 로 다음을 본다.
+  - 여러 블로그가 같은 키워드를 추적해도 키워드당 블로그탭·VIEW탭을 한 번씩만 받는지
+  - 한 페이지에서 묶인 포스팅마다 순위를 뽑는지(미노출·조회 실패는 None)
+  - 기본값이 예전 속도인지: 키워드 하나씩, 탭도 차례로, 키워드 사이 delay
+  - concurrency 를 올리면 그만큼만 동시에 도는지
+  - on_keyword 가 키워드마다 불리고, 거기서 난 예외는 측정을 깨지 않는지
+네트워크 없이 돈다.
+
+실행: python flyio-backend/tests/test_rank_measurement.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from services import rank_measurement  # noqa: E402
+from services.rank_checker import RankChecker  # noqa: E402
+from services.rank_measurement import measure_keywords  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+SERP = {
+    '제주 맛집': ['alpha', 'beta', 'gamma'],
+    '강남 카페': ['gamma', 'alpha'],
+    '빈 결과': [],
+}
+
+
+class FakeChecker(RankChecker):
+    """fetch_* 만 가짜. rank_in_* 는 진짜를 쓴다."""
+
+    def __init__(self, latency=0.01):
+        super().__init__()
+        self.latency = latency
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def _hit(self, tab, keyword):
+        self.calls.append((tab, keyword))
+        self.fetches += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+    async def fetch_blog_tab_items(self, keyword, display=None):
+        await self._hit('blog', keyword)
+        if keyword == '조회 실패':
+            return None
+        return [{'bloggerlink': f'https://blog.naver.com/{b}'} for b in SERP.get(keyword, [])]
+
+    async def fetch_view_tab_links(self, keyword):
+        await self._hit('view', keyword)
+        if keyword == '조회 실패':
+            return None
+        return [f'https://blog.naver.com/{b}/22300000000{i}' for i, b in enumerate(SERP.get(keyword, []))]
+
+    async def close(self):
+        self.closed = True
+
+
+def target(kid, keyword, blog, post_no):
+    return {'keyword_id': kid, 'keyword': keyword, 'blog_id': blog,
+            'post_url': f'https://blog.naver.com/{blog}/{post_no}'}
+
+
+TARGETS = [
+    target(1, '제주 맛집', 'alpha', 223000000000),
+    target(2, '제주 맛집', 'gamma', 223000000002),
+    target(3, ' 제주 맛집 ', 'beta', 223000000001),   # 앞뒤 공백은 같은 키워드
+    target(4, '강남 카페', 'alpha', 223000000001),
+    target(5, '강남 카페', 'delta', 223000000009),    # 미노출
+    target(6, '조회 실패', 'alpha', 223000000000),
+    target(7, '', 'alpha', 223000000000),             # 키워드 없음 → 제외
+]
+
+
+async def main():
+    print('=' * 72)
+    print('1. 키워드당 SERP 한 번 · 순위 추출')
+    print('=' * 72)
+    checker = FakeChecker()
+    rows = await measure_keywords(TARGETS, checker=checker, delay=0)
+    got = {r[0]: (r[1], r[2]) for r in rows}
+    check('키워드당 두 탭 한 번씩', checker.fetches == 6 and len(set(checker.calls)) == 6, checker.calls)
+    check('빈 키워드는 제외', 7 not in got and len(rows) == 6)
+    check('블로그탭 순위', got[1][0] == 1 and got[2][0] == 3 and got[3][0] == 2 and got[4][0] == 2, got)
+    check('VIEW탭 순위(포스트 번호로 매칭)', got[1][1] == 1 and got[2][1] == 3 and got[3][1] == 2, got)
+    check('미노출 → None', got[5] == (None, None))
+    check('조회 실패 → None', got[6] == (None, None))
+    check('넘겨준 checker 는 닫지 않는다', not checker.closed)
+
+    print()
+    print('=' * 72)
+    print('2. 속도 — 기본값은 예전 루프와 같다')
+    print('=' * 72)
+    check('기본 동시성 1', rank_measurement.RANK_FETCH_CONCURRENCY == 1
+          or 'RANK_FETCH_CONCURRENCY' in os.environ)
+    checker = FakeChecker()
+    t0 = time.perf_counter()
+    await measure_keywords(TARGETS, checker=checker, concurrency=1, delay=0.05)
+    took = time.perf_counter() - t0
+    check('요청은 한 번에 하나(탭도 차례로)', checker.max_in_flight == 1, checker.max_in_flight)
+    check('블로그탭 → VIEW탭 순서', [t for t, _ in checker.calls] == ['blog', 'view'] * 3, checker.calls)
+    check('키워드 사이 delay', took >= 3 * 0.05 + 6 * 0.01, f'{took:.3f}s')
+
+    checker = FakeChecker(latency=0.05)
+    many = [target(i, f'kw{i}', 'alpha', 1) for i in range(8)]
+    await measure_keywords(many, checker=checker, concurrency=3, delay=0)
+    check('concurrency=3 → 동시에 키워드 3개까지', checker.max_in_flight == 3, checker.max_in_flight)
+
+    print()
+    print('=' * 72)
+    print('3. 진행 콜백')
+    print('=' * 72)
+    seen = []
+
+    async def progress(keyword, group):
+        seen.append((keyword, len(group)))
+        if keyword == '강남 카페':
+            raise RuntimeError('progress db locked')
+
+    rows = await measure_keywords(TARGETS, checker=FakeChecker(), delay=0, on_keyword=progress)
+    check('키워드마다 한 번', sorted(seen) == [('강남 카페', 2), ('제주 맛집', 3), ('조회 실패', 1)], seen)
+    check('콜백 예외는 측정을 깨지 않는다', len(rows) == 6)
+
+    own = FakeChecker()
+    original = rank_measurement.RankChecker
+    rank_measurement.RankChecker = lambda: own
+    try:
+        await measure_keywords(TARGETS[:1], delay=0)
+    finally:
+        rank_measurement.RankChecker = original
+    check('직접 만든 checker 는 끝에 닫는다', own.closed)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
+    print()
+    if failures:
+        print(f'FAILED {len(failures)}건: {failures}')
+        sys.exit(1)
+    print('전부 통과 — rank measurement')
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+열 기반 리포트 집계 테스트 — services/report_rollup.py + ad_report_collector 의 Rollup
+
+AdDetailRollup / SearchTermRollup 이 save_daily_stats 에 넘기는 행이 예전
+dict 누적 구현(아래 ref_*)과 값·순서까지 똑같은지 본다. 소수 비용, 못 읽는 숫자,
+다른 날짜 행, 공백 검색어, 청크 경계를 일부러 섞는다. 네트워크·DB 없이 돈다.
+
+실행: python flyio-backend/tests/test_report_rollup.py
+"""
+import collections
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from services import naver_report_schema as RS  # noqa: E402
+from services.ad_report_collector import (  # noqa: E402
+    UNATTRIBUTED_PREFIX, AdDetailRollup, SearchTermRollup)
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+DAY = '2026-08-18'
+
+
+def num(rng):
+    return rng.choice([str(rng.randint(0, 40)), f'{rng.uniform(0, 900):.3f}', '', 'x'])
+
+
+def ad_rows(n, rng):
+    rows = []
+    for _ in range(n):
+        g = rng.randrange(12)
+        rows.append([rng.choice(['20260818'] * 8 + ['20260817', 'bad']), '1', f'c{g % 3}',
+                     f'g{g}', rng.choice(['-', f'k{rng.randrange(30)}']), 'a', 'b',
+                     '', '', '', rng.choice('MP'), num(rng), num(rng), num(rng), num(rng),
+                     num(rng)])
+    return rows
+
+
+def exp_rows(n, rng):
+    rows = []
+    for _ in range(n):
+        term = rng.choice(['제주 맛집', ' 제주 맛집 ', '', '  ', '서울 카페', 'a|b'])
+        rows.append([rng.choice(['20260818'] * 8 + ['20260817']), '1', 'c', f'g{rng.randrange(5)}',
+                     term, 'm', rng.choice('MP'), '', num(rng), num(rng), num(rng), num(rng)])
+    return rows
+
+
+def ref_ad_detail(rows, day):
+    """예전 collect_ad_detail 의 집계부."""
+    spec = RS.AD_DETAIL
+    mk = lambda: collections.defaultdict(lambda: collections.defaultdict(float))  # noqa: E731
+    kw, grp, camp, unattr = mk(), mk(), mk(), mk()
+    kw_parent, grp_parent = {}, {}
+    total, anon = collections.defaultdict(float), collections.defaultdict(float)
+    for r in rows:
+        if RS.row_date(r, spec) != day:
+            continue
+        m = RS.metrics(r, spec)
+        cid_, gid, kid = r[spec['campaign_id']], r[spec['adgroup_id']], r[spec['keyword_id']]
+        grp_parent[gid] = cid_
+        for k, v in m.items():
+            grp[gid][k] += v
+            camp[cid_][k] += v
+            total[k] += v
+        if kid == RS.UNATTRIBUTED:
+            for k, v in m.items():
+                unattr[gid][k] += v
+                anon[k] += v
+        else:
+            kw_parent[kid] = gid
+            for k, v in m.items():
+                kw[kid][k] += v
+
+    def _rows(bucket, etype, parent_of=None, id_prefix=''):
+        out = []
+        for eid, m in bucket.items():
+            imp = m['impressions']
+            out.append({
+                'entity_type': etype, 'entity_id': f'{id_prefix}{eid}', 'stat_date': day,
+                'impressions': int(imp), 'clicks': int(m['clicks']), 'cost': m['cost'],
+                'conversions': m['conversions'],
+                'ctr': (m['clicks'] / imp * 100) if imp else 0,
+                'cpc': (m['cost'] / m['clicks']) if m['clicks'] else 0,
+                'avg_rank': (m['rank_sum'] / imp) if imp else 0,
+                'parent_id': parent_of(eid) if parent_of else eid,
+            })
+        return out
+
+    return {
+        'CAMPAIGN': _rows(camp, 'CAMPAIGN'),
+        'ADGROUP': _rows(grp, 'ADGROUP', parent_of=lambda g: grp_parent.get(g)),
+        'KEYWORD': _rows(kw, 'KEYWORD', parent_of=lambda k: kw_parent.get(k)),
+        'UNATTRIBUTED': [dict(r, label='키워드 귀속 불가(확장검색 등)')
+                         for r in _rows(unattr, 'UNATTRIBUTED', parent_of=lambda g: g,
+                                        id_prefix=UNATTRIBUTED_PREFIX)],
+    }, dict(total), dict(anon)
+
+
+def ref_expkeyword(rows, day, top_n):
+    spec = RS.EXPKEYWORD
+    agg = collections.defaultdict(lambda: collections.defaultdict(float))
+    parent = {}
+    for r in rows:
+        if RS.row_date(r, spec) != day:
+            continue
+        term = (r[spec['search_term']] or '').strip()
+        if not term:
+            continue
+        gid = r[spec['adgroup_id']]
+        key = f'{gid}|{term}'
+        parent[key] = gid
+        for k in ('impressions', 'clicks', 'cost', 'conversions'):
+            agg[key][k] += RS._f(r[spec[k]])
+    ranked = sorted(agg.items(), key=lambda kv: (-kv[1]['cost'], -kv[1]['clicks']))
+    out = []
+    for key, m in ranked[:top_n]:
+        imp = m['impressions']
+        out.append({
+            'entity_type': 'SEARCHTERM', 'entity_id': key, 'stat_date': day,
+            'impressions': int(imp), 'clicks': int(m['clicks']), 'cost': m['cost'],
+            'conversions': m['conversions'],
+            'ctr': (m['clicks'] / imp * 100) if imp else 0,
+            'cpc': (m['cost'] / m['clicks']) if m['clicks'] else 0,
+            'parent_id': parent[key], 'label': key.split('|', 1)[1],
+        })
+    return out, len(agg), len(ranked) - len(out)
+
+
+def same_rows(a, b):
+    """값은 == 로, float 는 repr 까지(비트 단위) 같은지."""
+    return len(a) == len(b) and all(
+        x.keys() == y.keys() and all(
+            (repr(float(x[k])) == repr(float(y[k]))) if isinstance(y[k], float) else x[k] == y[k]
+            for k in y)
+        for x, y in zip(a, b))
+
+
+print('=' * 72)
+print('1. AD_DETAIL — 예전 dict 누적과 동일')
+print('=' * 72)
+rng = random.Random(3)
+rows = ad_rows(3000, rng)
+expected, exp_total, exp_anon = ref_ad_detail(rows, DAY)
+for chunk in (7, 1000, 65536):
+    r = AdDetailRollup(DAY)
+    r.engine.chunk_rows = chunk
+    for row in rows:
+        r.add(row)
+    got = r.daily_rows()
+    check(f'chunk={chunk}: 유형별 행·순서·값 일치',
+          all(same_rows(got[k], expected[k]) for k in expected),
+          ', '.join(f'{k}={len(got[k])}' for k in got))
+    check(f'chunk={chunk}: 총계·귀속 불가 합계 일치',
+          r.total == exp_total and r.anon == exp_anon)
+check('다른 날짜·잘못된 날짜 행은 버림', r.engine.filtered > 0 and r.engine.rows < len(rows),
+      f'filtered={r.engine.filtered}')
+
+print()
+print('=' * 72)
+print('2. EXPKEYWORD — top_n 절단 포함')
+print('=' * 72)
+erows = exp_rows(2000, random.Random(5))
+for top_n in (3, 3000):
+    ref_out, ref_distinct, ref_dropped = ref_expkeyword(erows, DAY, top_n)
+    s = SearchTermRollup(DAY)
+    s.engine.chunk_rows = 50
+    for row in erows:
+        s.add(row)
+    out, distinct, dropped = s.daily_rows(top_n)
+    check(f'top_n={top_n}: 행 일치', same_rows(out, ref_out), f'{len(out)}행')
+    check(f'top_n={top_n}: 검색어 수·잘린 수 일치',
+          (distinct, dropped) == (ref_distinct, ref_dropped), f'{distinct}/{dropped}')
+
+print()
+print('=' * 72)
+print('3. 여러 날 백필 — 날짜별로 나뉨')
+print('=' * 72)
+days = ['2026-08-17', '2026-08-18']
+multi = AdDetailRollup(DAY, days=days)
+for row in rows:
+    multi.add(row)
+got = multi.daily_rows()
+for d in days:
+    ref_d = ref_ad_detail(rows, d)[0]
+    check(f'{d} 행 일치', all(same_rows([x for x in got[k] if x['stat_date'] == d], ref_d[k])
+                             for k in ref_d))
+
+print()
+if failures:
+    print(f'FAILED {len(failures)}건: {failures}')
+    sys.exit(1)
+print('전부 통과 — report rollup')
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+RSS 피드 서비스 테스트 — services/rss_feed.py
+
+httpx.MockTransport 로 rss.blog.naver.com 을 흉내 내 다음을 본다.
+  - 파싱 결과(제목·링크·pubDate·카테고리·description 요약·길이·이미지 수)
+  - FRESH 안의 재조회는 0콜, 지나면 ETag/Last-Modified 조건부 GET → 304 면 기존 항목
+  - 같은 블로그 동시 조회 20건이 1콜로 합쳐지는지
+  - 네트워크 오류·5xx 면 오래된 항목을, 404 는 None(음수 캐시)
+네트워크 없이, 공유 캐시는 memory 백엔드, 파싱은 인라인(PARSE_WORKERS=0)으로 돈다.
+
+실행: python flyio-backend/tests/test_rss_feed.py
+"""
+import asyncio
+import os
+import sys
+
+os.environ['SHARED_CACHE_BACKEND'] = 'memory'
+os.environ['PARSE_WORKERS'] = '0'
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import httpx  # noqa: E402
+
+from services import rss_feed  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+FEED = '''<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>맛집 일기</title>
+<item><title><![CDATA[강남 맛집 후기]]></title>
+<link>https://blog.naver.com/tester/223700000002?fromRss=true&amp;trackingCode=rss</link>
+<category>맛집</category>
+<description><![CDATA[<img src="https://blogthumb.pstatic.net/a.jpg"> 강남 맛집 다녀왔어요 정말 좋았어요]]></description>
+<pubDate>Wed, 31 Dec 2025 16:46:05 +0900</pubDate></item>
+<item><title>두 번째 글</title><link>https://blog.naver.com/tester/223700000001</link>
+<category>일상</category><description>짧은 글</description>
+<pubDate>Mon, 01 Dec 2025 09:00:00 +0900</pubDate></item>
+</channel></rss>'''.encode('utf-8')
+
+
+class Server:
+    def __init__(self):
+        self.calls = []
+        self.mode = 'ok'
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(dict(request.headers))
+        await asyncio.sleep(0.01)
+        blog_id = request.url.path.strip('/').split('.')[0]
+        if blog_id == 'nobody':
+            return httpx.Response(404)
+        if self.mode == 'down':
+            raise httpx.ConnectError('down', request=request)
+        if self.mode == '5xx':
+            return httpx.Response(503)
+        if request.headers.get('if-none-match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=FEED,
+                              headers={'ETag': '"v1"', 'Last-Modified': 'Wed, 31 Dec 2025 08:00:00 GMT'})
+
+
+async def main():
+    server = Server()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+
+    print('=' * 72)
+    print('1. 파싱')
+    print('=' * 72)
+    feed = await rss_feed.get_feed('tester', client)
+    items = feed['items']
+    check('채널 제목', feed['channel_title'] == '맛집 일기')
+    check('항목 2개', len(items) == 2)
+    first = items[0]
+    check('CDATA 제목·카테고리', first['title'] == '강남 맛집 후기' and first['category'] == '맛집')
+    check('링크(엔티티 해제)', first['link'].endswith('?fromRss=true&trackingCode=rss'), first['link'])
+    check('description 요약은 태그 제거', first['text'] == '강남 맛집 다녀왔어요 정말 좋았어요', first['text'])
+    check('이미지 수·원문 길이', first['image_count'] == 1 and first['raw_length'] > first['text_length'])
+    check('어절 수', first['word_count'] == 5, first['word_count'])
+    pub = rss_feed.published_at(first)
+    check('pubDate → 피드 시간대 그대로', pub is not None and pub.utcoffset().total_seconds() == 9 * 3600
+          and pub.day == 31)
+    check('ETag 저장', feed['etag'] == '"v1"')
+
+    print()
+    print('=' * 72)
+    print('2. 캐시·조건부 GET')
+    print('=' * 72)
+    n = len(server.calls)
+    again = await rss_feed.get_feed('tester', client)
+    check('FRESH 안이면 0콜', len(server.calls) == n and again['items'] == items)
+    revalidated = await rss_feed.get_feed('tester', client, max_age=0)
+    check('재검증은 조건부 GET', server.calls[-1].get('if-none-match') == '"v1"'
+          and 'if-modified-since' in server.calls[-1])
+    check('304 → 기존 항목', revalidated['items'] == items and rss_feed.feed_stats()['not_modified'] == 1)
+
+    print()
+    print('=' * 72)
+    print('3. 동시 조회 합치기')
+    print('=' * 72)
+    n = len(server.calls)
+    results = await asyncio.gather(*[rss_feed.get_feed('tester', client, max_age=0) for _ in range(20)])
+    check('20건 → 1콜', len(server.calls) == n + 1, len(server.calls) - n)
+    check('모두 같은 결과', all(r['items'] == items for r in results))
+
+    print()
+    print('=' * 72)
+    print('4. 실패')
+    print('=' * 72)
+    server.mode = 'down'
+    stale = await rss_feed.get_feed('tester', client, max_age=0)
+    check('네트워크 오류 → 오래된 항목', stale is not None and stale['items'] == items)
+    server.mode = '5xx'
+    stale = await rss_feed.get_feed('tester', client, max_age=0)
+    check('5xx → 오래된 항목', stale is not None and stale['items'] == items)
+    server.mode = 'ok'
+    check('404 → None', await rss_feed.get_feed('nobody', client) is None)
+    n = len(server.calls)
+    check('404 는 음수 캐시', await rss_feed.get_feed('nobody', client) is None and len(server.calls) == n)
+    check('HTML 에 감싸인 RSS·깨진 XML', len(rss_feed.parse_feed(b'<html>' + FEED[:-20] + b'</html>')['items']) >= 1)
+    check('빈 본문', rss_feed.parse_feed(b'') == {'channel_title': '', 'items': []})
+
+    await client.aclose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
+    print()
+    if failures:
+        print(f'FAILED {len(failures)}건: {failures}')
+        sys.exit(1)
+    print('전부 통과 — rss feed')
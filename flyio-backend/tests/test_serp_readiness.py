@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+SERP 준비 판정 테스트 — services/serp_readiness.py
+
+결과 수가 시나리오대로 늘어나는 가짜 페이지로 load_results 의 대기 경로를 본다.
+  - 첫 결과가 이미 limit(+여유)이면 스크롤 없이 멈춤(limit)
+  - 늘어나는 동안 라운드를 돌고, 멈추면 '더보기'를 한 번 눌러 본 뒤 stalled
+  - allow_more=False 면 더보기 없이 stalled, max_rounds 에서 멈춤
+  - 결과가 안 뜨면 empty
+  - 대기 JS 가 실패하면 결과 수 세기로, 그것도 실패하면 0 으로 물러나는지
+  - record → recent_stats / summary 집계
+브라우저 없이 돈다.
+
+실행: python flyio-backend/tests/test_serp_readiness.py
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from services import serp_readiness as SR  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+class FakeButton:
+    def __init__(self, page):
+        self.page = page
+
+    async def click(self):
+        self.page.clicks += 1
+
+
+class FakePage:
+    """growth: _wait_growth 가 불릴 때마다 돌려줄 결과 수. 다 쓰면 마지막 값을 반복한다."""
+
+    def __init__(self, growth, more_button=True, growth_fails=False, count_fails=False):
+        self.growth = list(growth)
+        self.count = 0
+        self.more_button = more_button
+        self.growth_fails = growth_fails
+        self.count_fails = count_fails
+        self.clicks = 0
+        self.scrolls = 0
+        self.urls = []
+
+    async def goto(self, url, **kw):
+        self.urls.append(url)
+
+    async def evaluate(self, js, arg=None):
+        if js == SR._WAIT_GROWTH_JS:
+            if self.growth_fails:
+                raise RuntimeError('Execution context was destroyed')
+            if self.growth:
+                self.count = self.growth.pop(0)
+            return self.count
+        if js == SR._COUNT_JS:
+            if self.count_fails:
+                raise RuntimeError('Target closed')
+            return self.count
+        self.scrolls += 1
+        return None
+
+    async def query_selector(self, selector):
+        return FakeButton(self) if self.more_button else None
+
+
+def run(page, limit=20, **kw):
+    stats = SR.ReadinessStats(keyword='강남 맛집', tab='BLOG', limit=limit)
+    count = asyncio.run(SR.load_results(page, 'https://search.naver.com/x', stats, **kw))
+    return count, stats
+
+
+print('=' * 72)
+print('1. 대기 경로')
+print('=' * 72)
+page = FakePage([30])
+count, st = run(page)
+check('첫 결과가 limit+여유 이상 → 스크롤 없이 멈춤', st.stop_reason == 'limit' and st.rounds == 0
+      and page.scrolls == 0 and count == 30, st.as_dict())
+
+page = FakePage([5, 10, 15, 15, 18, 18])
+count, st = run(page)
+check('늘어나는 동안 라운드 진행', st.rounds == 4 and count == 18, st.as_dict())
+check('멈추면 더보기 한 번 누르고 stalled', page.clicks == 1 and st.more_clicked
+      and st.stop_reason == 'stalled', st.as_dict())
+check('result_count 기록', st.result_count == 18)
+
+page = FakePage([5, 10, 10])
+count, st = run(page, allow_more=False)
+check('allow_more=False → 더보기 없이 stalled', page.clicks == 0 and st.stop_reason == 'stalled'
+      and count == 10, st.as_dict())
+
+page = FakePage([5, 10, 10], more_button=False)
+count, st = run(page)
+check('더보기 버튼이 없으면 stalled', page.clicks == 0 and not st.more_clicked
+      and st.stop_reason == 'stalled')
+
+page = FakePage(list(range(1, 50)))
+count, st = run(page, limit=100, max_rounds=3)
+check('max_rounds 에서 멈춤', st.rounds == 3 and st.stop_reason == 'max_rounds' and count == 4,
+      st.as_dict())
+
+page = FakePage([0])
+count, st = run(page)
+check('결과가 안 뜨면 empty', count == 0 and st.stop_reason == 'empty' and page.scrolls == 0)
+
+print()
+print('=' * 72)
+print('2. 대기 JS 실패 시 물러나기')
+print('=' * 72)
+page = FakePage([], growth_fails=True)
+page.count = 12
+count, st = run(page)
+check('대기 JS 실패 → 결과 수 세기로', count == 12 and st.stop_reason == 'stalled', st.as_dict())
+
+page = FakePage([], growth_fails=True, count_fails=True)
+page.count = 12
+count, st = run(page)
+check('세기도 실패 → 0 (empty)', count == 0 and st.stop_reason == 'empty')
+
+print()
+print('=' * 72)
+print('3. 기록 · 집계')
+print('=' * 72)
+SR._RECENT.clear()
+for tab, nav, first, extract in (('VIEW', 1.0, 0.5, 0.1), ('VIEW', 3.0, 1.5, 0.3), ('BLOG', 2.0, 1.0, 0.2)):
+    s = SR.ReadinessStats(keyword='k', tab=tab, limit=20, navigate_s=nav,
+                          first_result_s=first, scroll_wait_s=1.0, extract_s=extract, rounds=2)
+    SR.record(s)
+recent = SR.recent_stats(2)
+check('recent_stats(limit) 는 최근 것부터 limit 개', len(recent) == 2 and recent[-1]['tab'] == 'BLOG')
+check('wait_s = 첫 결과 + 스크롤 대기', recent[0]['wait_s'] == 2.5, recent[0])
+agg = SR.summary()
+check('탭별 평균', agg['VIEW']['n'] == 2 and agg['VIEW']['avg_navigate_s'] == 2.0
+      and agg['VIEW']['avg_wait_s'] == 2.0 and agg['BLOG']['avg_rounds'] == 2.0, agg)
+
+
+if __name__ == '__main__':
+    print()
+    if failures:
+        print(f'FAILED {len(failures)}건: {failures}')
+        sys.exit(1)
+    print('전부 통과 — serp readiness')
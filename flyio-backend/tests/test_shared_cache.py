@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+공유 캐시 테스트 — services/shared_cache.py + MemoryCache(shared=...)
+
+app / worker 프로세스가 같은 결과를 보는지(2단 캐시), TTL 이 공유 백엔드를 거쳐도
+유지되는지, SQLite 백엔드가 실제로 다른 프로세스의 기록을 읽는지,
+aget/aset 이 느린 백엔드를 만나도 이벤트 루프를 막지 않는지 본다.
+네트워크·Redis 없이 돈다(InMemoryBackend 대역 + 임시 SQLite 파일).
+
+실행: python flyio-backend/tests/test_shared_cache.py
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from services.memory_cache import MemoryCache  # noqa: E402
+from services.shared_cache import InMemoryBackend, SQLiteBackend, set_backend  # noqa: E402
+
+failures = []
+
+
+def check(name, cond, detail=''):
+    print(f"  [{'PASS' if cond else 'FAIL'}] {name}" + (f'  — {detail}' if detail else ''))
+    if not cond:
+        failures.append(name)
+
+
+print('=' * 72)
+print('1. 2단 캐시 (InMemoryBackend)')
+print('=' * 72)
+backend = InMemoryBackend()
+set_backend(backend)
+app = MemoryCache('app', max_entries=10, ttl=60, shared='blog_analysis')
+worker = MemoryCache('worker', max_entries=10, ttl=60, shared='blog_analysis')
+worker.set('blog1', {'score': 42})
+check('다른 캐시가 쓴 값을 공유 백엔드에서 읽음', app.get('blog1') == {'score': 42})
+check('shared_hits 카운터', app.shared_hits == 1, str(app.stats()))
+check('읽은 값은 로컬에 적재', 'blog1' in app)
+app.get('blog1')
+check('두 번째 조회는 로컬 적중', app.shared_hits == 1 and app.hits == 2)
+worker.set('short', 'v', ttl=0.05)
+app.get('short')
+check('남은 TTL 을 그대로 가져옴', app.expires_at('short') <= time.time() + 0.05)
+time.sleep(0.06)
+check('만료 후에는 양쪽 모두 미스', app.get('short') is None and worker.get('short') is None)
+worker.delete('blog1')
+app.clear()
+check('delete 는 공유 백엔드에서도 지움', app.get('blog1') is None)
+local_only = MemoryCache('l', max_entries=10, ttl=60, shared='x')
+local_only.set('obj', object())
+check('JSON 불가 값은 로컬에만', 'obj' in local_only and backend.get('x', 'obj') is None)
+plain = MemoryCache('p', max_entries=10, ttl=60)
+plain.set('k', 1)
+check('shared 없는 캐시는 백엔드에 안 씀', backend.get(None, 'k') is None and backend.writes == 2,
+      str(backend.stats()))
+
+print()
+print('=' * 72)
+print('2. SQLite 백엔드 — 프로세스 간')
+print('=' * 72)
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, 'shared.db')
+    set_backend(SQLiteBackend(path))
+    script = (
+        'import sys; sys.path.insert(0, %r)\n'
+        'from services.memory_cache import MemoryCache\n'
+        'from services.shared_cache import SQLiteBackend, set_backend\n'
+        'set_backend(SQLiteBackend(%r))\n'
+        'MemoryCache("w", ttl=60, shared="serp").set("맛집", [{"rank": 1, "blog_id": "a"}])\n'
+    ) % (os.path.abspath(ROOT), path)
+    proc = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True)
+    check('자식 프로세스 기록 성공', proc.returncode == 0, proc.stderr[-300:])
+    parent = MemoryCache('a', ttl=60, shared='serp')
+    check('부모 프로세스가 자식의 값을 읽음',
+          parent.get('맛집') == [{'rank': 1, 'blog_id': 'a'}])
+    check('다른 네임스페이스와 섞이지 않음',
+          MemoryCache('b', ttl=60, shared='other').get('맛집') is None)
+    set_backend(None)
+
+print()
+print('=' * 72)
+print('3. aget / aset — 백엔드 I/O 는 루프 밖에서')
+print('=' * 72)
+
+
+class SlowBackend(InMemoryBackend):
+    """SQLite busy_timeout 에 걸린 것처럼 조회·기록마다 0.2초 막힌다."""
+    name = 'slow'
+    blocking = True
+
+    def _get(self, ns, key):
+        time.sleep(0.2)
+        return super()._get(ns, key)
+
+    def _set(self, ns, key, raw, expires_at, ttl):
+        time.sleep(0.2)
+        super()._set(ns, key, raw, expires_at, ttl)
+
+
+async def offload_case():
+    slow = SlowBackend()
+    set_backend(slow)
+    writer = MemoryCache('w', ttl=60, shared='serp')
+    reader = MemoryCache('r', ttl=60, shared='serp')
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    t = asyncio.ensure_future(ticker())
+    await writer.aset('k', {'v': 1})
+    got = await reader.aget('k')
+    miss = await reader.aget('none', 'dflt')
+    t.cancel()
+    check('aset → 다른 캐시 aget 으로 읽힘', got == {'v': 1} and reader.shared_hits == 1)
+    check('없는 키는 default', miss == 'dflt')
+    # 0.6초 동안 막혔다면 ticker 는 거의 못 돈다
+    check('느린 백엔드 동안에도 루프가 돈다', ticks >= 30, f'ticks={ticks}')
+    before = slow.stats()['hits']
+    check('로컬 적중은 백엔드를 안 거침', await reader.aget('k') == {'v': 1}
+          and slow.stats()['hits'] == before)
+
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return {'loaded': True}
+
+    got = await asyncio.gather(*[reader.get_or_load('fresh', loader) for _ in range(5)])
+    check('get_or_load 도 aget/aset 경로', calls == 1 and all(g == {'loaded': True} for g in got)
+          and slow.get('serp', 'fresh') is not None)
+    set_backend(None)
+
+
+asyncio.run(offload_case())
+
+print()
+if failures:
+    print(f'FAILED {len(failures)}건: {failures}')
+    sys.exit(1)
+print('전부 통과 — shared cache')
@@ -39,8 +39,8 @@ logger = logging.getLogger("verdict_worker")
 async def _prewarm() -> None:
     """첫 사용자가 브라우저 기동을 기다리지 않게 미리 띄운다."""
     try:
-        from services.keyword_verdict import _get_browser
-        await _get_browser()
+        from services.keyword_verdict import _verdict_pool
+        await _verdict_pool().start()
         logger.warning("[kwv-w] 브라우저 prewarm 완료")
     except Exception as e:
         logger.warning(f"[kwv-w] 브라우저 prewarm 실패(요청 시 다시 시도): {e}")
@@ -48,12 +48,19 @@ async def _prewarm() -> None:
 
 async def main() -> None:
     from services.keyword_verdict_queue import watchdog_loop
+    from services.loop_monitor import start_loop_monitor
 
     logger.warning(f"[kwv-w] 판정 전용 워커 시작 pid={os.getpid()} "
                    f"nice={os.nice(0)}")
+    start_loop_monitor("verdict")
     # prewarm 은 워치독을 막지 않게 백그라운드로 — 부팅 직후 들어온 job 이 기다릴 이유가 없다.
     asyncio.create_task(_prewarm())
-    await watchdog_loop()
+    try:
+        await watchdog_loop()
+    finally:
+        # 종료 시 chromium 을 남기지 않는다(고아 브라우저가 RAM 을 붙잡는다).
+        from services.browser_pool import close_all_pools
+        await close_all_pools()
 
 
 if __name__ == "__main__":